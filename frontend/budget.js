@@ -0,0 +1,103 @@
+import { gzipSync } from 'zlib';
+
+// Low-end tablet on a market Wi-Fi/4G link: Lighthouse's "Slow 4G" network, and
+// roughly 1 MB of (uncompressed) JavaScript parsed, compiled and run per second
+const DEFAULT_DEVICE = {
+	downlinkKbps: 1600,
+	rttMs: 150,
+	jsBytesPerMs: 1000,
+};
+
+/**
+ * Vite plugin that fails the build when the JS/CSS loaded for the first
+ * paint, or for any route, outgrows its budget.
+ *
+ * A route costs the initial chunks plus its own lazily loaded ones. Its time
+ * to interactive is estimated from the device profile: download of the
+ * gzipped bytes plus parse/compile/execute of the raw JavaScript. Set
+ * BUNDLE_BUDGET=warn to report violations without failing.
+ */
+export default function bundleBudget({ initialKb, routeKb, interactiveMs, device = DEFAULT_DEVICE }) {
+	return {
+		name: 'bundle-budget',
+		apply: 'build',
+		// After Vite's CSS plugin has emitted the stylesheets
+		enforce: 'post',
+		generateBundle(_options, bundle) {
+			const files = Object.values(bundle);
+			const byName = Object.fromEntries(files.map((file) => [file.fileName, file]));
+			const gzipped = {};
+			const sizeOf = (fileName) => {
+				const file = byName[fileName];
+				const source = file.type === 'chunk' ? file.code : file.source;
+				gzipped[fileName] ??= gzipSync(source).length;
+				return { raw: Buffer.byteLength(source), gzip: gzipped[fileName] };
+			};
+
+			// A chunk with the chunks and stylesheets it imports statically
+			const closure = (fileName, seen = new Set()) => {
+				const file = byName[fileName];
+				if (!file || seen.has(fileName)) return seen;
+				seen.add(fileName);
+				if (file.type === 'chunk') {
+					file.imports.forEach((name) => closure(name, seen));
+					file.viteMetadata?.importedCss?.forEach((name) => seen.add(name));
+				}
+				return seen;
+			};
+			const measure = (fileNames) => {
+				let js = 0;
+				let gzip = 0;
+				for (const fileName of fileNames) {
+					const size = sizeOf(fileName);
+					gzip += size.gzip;
+					if (fileName.endsWith('.js')) js += size.raw;
+				}
+				return { gzip, js };
+			};
+			const interactive = ({ gzip, js }) =>
+				Math.round(device.rttMs + (gzip * 8) / device.downlinkKbps + js / device.jsBytesPerMs);
+
+			const initialFiles = new Set();
+			files.filter((file) => file.type === 'chunk' && file.isEntry).forEach((file) => closure(file.fileName, initialFiles));
+			const initial = measure(initialFiles);
+
+			const violations = [];
+			const rows = [['(initial)', initial.gzip, interactive(initial)]];
+			if (initial.gzip > initialKb * 1024) {
+				violations.push(`initial load is ${kb(initial.gzip)} gzipped (budget ${initialKb} KB)`);
+			}
+
+			for (const file of files) {
+				if (file.type !== 'chunk' || !file.isDynamicEntry || !/\/src\/views\//.test(file.facadeModuleId || '')) continue;
+				const route = file.facadeModuleId.split('/').pop();
+				const own = measure([...closure(file.fileName)].filter((name) => !initialFiles.has(name)));
+				const total = { gzip: initial.gzip + own.gzip, js: initial.js + own.js };
+				rows.push([route, own.gzip, interactive(total)]);
+
+				if (own.gzip > routeKb * 1024) {
+					violations.push(`${route} loads ${kb(own.gzip)} gzipped on top of the initial chunks (budget ${routeKb} KB)`);
+				}
+				if (interactive(total) > interactiveMs) {
+					violations.push(`${route} is interactive after ~${interactive(total)} ms (budget ${interactiveMs} ms)`);
+				}
+			}
+
+			console.log('\nBundle budget (gzipped, estimated time to interactive on a low-end tablet):');
+			rows.forEach(([name, gzip, ms]) => console.log(`  ${name.padEnd(24)} ${kb(gzip).padStart(10)} ${String(ms).padStart(7)} ms`));
+
+			if (violations.length) {
+				const message = `Bundle budget exceeded:\n  ${violations.join('\n  ')}`;
+				if (process.env.BUNDLE_BUDGET === 'warn') {
+					this.warn(message);
+				} else {
+					this.error(message);
+				}
+			}
+		},
+	};
+}
+
+function kb(bytes) {
+	return `${(bytes / 1024).toFixed(1)} KB`;
+}
@@ -0,0 +1,149 @@
+// inputLatency.js
+// Browser benchmark: how long the items table and item dialog take to react to input
+// as the invoice grows from 10 to 500 rows. Open with `yarn benchmark`; results are
+// printed on the page and left in `window.benchmarkResults`.
+import { createApp, h, nextTick, reactive } from 'vue';
+import PrimeVue from 'primevue/config';
+import ToastService from 'primevue/toastservice';
+import ConfirmationService from 'primevue/confirmationservice';
+import i18n, { setLocale } from '../i18n.js';
+import Noir from '../presets/Noir.js';
+import ItemsTable from '../components/ItemsTable.vue';
+import ItemDialog from '../components/ItemDialog.vue';
+import { getSearchIndex } from '../controllers/searchIndex';
+import '../style.css';
+
+const ROW_COUNTS = [10, 50, 100, 250, 500];
+const KEYSTROKES = 40;
+const MASTER_ITEMS = 2000;
+const MASTER_CUSTOMERS = 5000;
+// Latency is "flat" if the largest invoice is at most this much slower than the smallest
+const ALLOWED_GROWTH = { ratio: 2, ms: 4 };
+
+const allItems = Array.from({ length: MASTER_ITEMS }, (_, i) => ({ label: `صنف ${i} Item ${i}`, code: `ITEM-${i}` }));
+const allCustomers = Array.from({ length: MASTER_CUSTOMERS }, (_, i) => ({ label: `عميل ${i} Customer ${i}`, code: `CUST-${i}` }));
+
+function makeRows(count) {
+  return Array.from({ length: count }, (_, i) => ({
+    item: allItems[i % MASTER_ITEMS],
+    qty: (i % 7) + 1,
+    rate: 12.5,
+    amount: ((i % 7) + 1) * 12.5,
+    customer: allCustomers[i % MASTER_CUSTOMERS],
+    remark: '',
+  }));
+}
+
+function percentile(samples, p) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+}
+
+// Time from the DOM event to Vue having patched the DOM
+async function timeInput(input, value) {
+  const start = performance.now();
+  input.value = value;
+  input.dispatchEvent(new Event('input', { bubbles: true }));
+  await nextTick();
+  return performance.now() - start;
+}
+
+async function measure(rowCount) {
+  const state = reactive({ items: makeRows(rowCount) });
+  const host = document.createElement('div');
+  document.getElementById('app').appendChild(host);
+
+  const app = createApp({
+    render: () => [
+      h(ItemsTable, { items: state.items, isDraft: true, canUpdateDraft: true, canDeleteInvoice: true }),
+      h(ItemDialog, {
+        visible: true,
+        itemData: { ...state.items[0], qtyEditing: false, rateEditing: false },
+        editIndex: 0,
+        totalRows: state.items.length,
+        allItems,
+        allCustomers,
+        isDraft: true,
+        canUpdateDraft: true,
+        canUpdateSubmitted: true,
+        canDeleteInvoice: true,
+      }),
+    ],
+  });
+  app.use(PrimeVue, { theme: { preset: Noir } });
+  app.use(i18n);
+  app.use(ToastService);
+  app.use(ConfirmationService);
+  app.provide('$permissions', { hasPermission: () => true });
+  app.mount(host);
+  await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+
+  const [itemInput, qtyInput] = [
+    document.querySelector('.p-dialog #item'),
+    document.querySelector('.p-dialog input[inputmode="decimal"]'),
+  ];
+
+  const typing = [];
+  for (let i = 1; i <= KEYSTROKES; i++) {
+    typing.push(await timeInput(qtyInput, String(i)));
+  }
+
+  // The autocomplete's own work per keystroke, without its debounce delay
+  const search = [];
+  const query = 'item 1234';
+  for (let i = 1; i <= query.length; i++) {
+    await timeInput(itemInput, query.slice(0, i));
+    const start = performance.now();
+    getSearchIndex(allItems).search(query.slice(0, i));
+    getSearchIndex(allCustomers).search(`customer ${i}`);
+    search.push(performance.now() - start);
+  }
+
+  // Saving a row replaces the items array, as InvoiceForm does
+  const saves = [];
+  for (let i = 0; i < 10; i++) {
+    const start = performance.now();
+    state.items = [...state.items, makeRows(1)[0]];
+    await nextTick();
+    saves.push(performance.now() - start);
+  }
+
+  app.unmount();
+  host.remove();
+  return {
+    rows: rowCount,
+    typingP50: percentile(typing, 50),
+    typingP95: percentile(typing, 95),
+    searchP95: percentile(search, 95),
+    saveP95: percentile(saves, 95),
+  };
+}
+
+async function run() {
+  await setLocale('en');
+  const results = [];
+  for (const rowCount of ROW_COUNTS) {
+    results.push(await measure(rowCount));
+  }
+
+  const first = results[0];
+  const last = results[results.length - 1];
+  const flat = ['typingP95', 'saveP95'].every(
+    (key) => last[key] <= Math.max(first[key] * ALLOWED_GROWTH.ratio, first[key] + ALLOWED_GROWTH.ms)
+  );
+
+  window.benchmarkResults = { results, flat };
+  console.table(results);
+  document.getElementById('results').textContent = [
+    'rows   typing p50   typing p95   search p95   save p95   (ms)',
+    ...results.map((r) =>
+      [r.rows, r.typingP50, r.typingP95, r.searchP95, r.saveP95]
+        .map((v, i) => (i ? v.toFixed(2) : String(v)).padStart(i ? 12 : 4))
+        .join(' ')
+    ),
+    '',
+    flat ? 'PASS: input latency is flat' : 'FAIL: input latency grows with the number of rows',
+  ].join('\n');
+}
+
+run();
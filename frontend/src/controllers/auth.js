@@ -40,9 +40,11 @@ async login(email, password) {
 	}
   }
 
-  async logout() {
+  async logout({ reload = true } = {}) {
     await call('logout');
+    // Cached API responses belong to this user
+    if ('caches' in window) await caches.delete('invoice-app-api');
     this.isLoggedIn = false;
-    window.location.reload();
+    if (reload) window.location.reload();
   }
 }
\ No newline at end of file
@@ -0,0 +1,85 @@
+// masterData.js
+import axios from 'axios';
+
+const STORAGE_KEY = 'invoiceFormMasterData';
+const LISTS = ['suppliers', 'customers', 'items'];
+
+function readCache() {
+  try {
+    const cached = JSON.parse(localStorage.getItem(STORAGE_KEY));
+    return cached && cached.version ? cached : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+function writeCache(data) {
+  try {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(data));
+  } catch (e) {
+    // Storage full or disabled, the next load will simply fetch everything again
+    console.warn('[masterData] Failed to cache master data:', e);
+  }
+}
+
+// Apply a { suppliers: { upsert, remove }, ... } delta to the cached lists
+function applyChanges(cached, changes, version) {
+  const data = { version };
+  LISTS.forEach((key) => {
+    const { upsert = [], remove = [] } = changes[key] || {};
+    const dropped = new Set([...remove, ...upsert.map((row) => row.name)]);
+    data[key] = (cached[key] || [])
+      .filter((row) => !dropped.has(row.name))
+      .concat(upsert);
+  });
+  return data;
+}
+
+// Load suppliers, customers and items, only downloading what changed since the cached version.
+// `knownVersion` (from get_bootstrap) skips the request when the cache is already current.
+export async function loadMasterData(knownVersion = null) {
+  const cached = readCache();
+  if (cached && knownVersion && cached.version === knownVersion) {
+    return cached;
+  }
+  const res = await axios.get('/api/method/invoice_form_vue.api.get_suppliers_and_customers', {
+    params: cached ? { since: cached.version } : {},
+    validateStatus: (status) => status === 200 || status === 304,
+  });
+
+  if (res.status === 304 && cached) {
+    return cached;
+  }
+
+  const result = res.data?.message || res.data || {};
+  if (result.not_modified && cached) {
+    return cached;
+  }
+
+  const data = result.changes && cached
+    ? applyChanges(cached, result.changes, result.version)
+    : result;
+  writeCache(data);
+  return data;
+}
+
+// Above this many rows typeahead asks the server's prefix index instead of filtering locally
+export const SERVER_SEARCH_MIN_ROWS = 2000;
+
+// Whether to search `list` on the server: always when it is not loaded, and for a
+// typed query on a large list while online (offline, the local list still works)
+export function prefersServerSearch(list, query = '') {
+  if (!list.length) return true;
+  return list.length >= SERVER_SEARCH_MIN_ROWS && !!query && navigator.onLine;
+}
+
+// Server-side typeahead
+export async function searchMasterData(kind, query, limit = 10) {
+  const res = await axios.get('/api/method/invoice_form_vue.api.search_master_data', {
+    params: { kind, query, limit },
+  });
+  return (res.data.message || []).map((entry) => ({
+    label: entry.customer_name || entry.supplier_name || entry.item_name || entry.name,
+    code: entry.name || '',
+  }));
+}
@@ -28,8 +28,7 @@ export default class Permissions {
       });
 
       if (response && response.data && response.data.message) {
-        this.permissions = response.data.message;
-        this.loaded = true;
+        this.setPermissions(response.data.message);
         console.log("Permissions loaded:", this.permissions);
       }
     } catch (error) {
@@ -37,6 +36,11 @@ export default class Permissions {
     }
   }
 
+  setPermissions(permissions) {
+    this.permissions = permissions;
+    this.loaded = true;
+  }
+
   hasPermission(permission) {
     console.log(`Checking permission ${permission}:`, this.permissions[permission]);
     return this.permissions[permission] === true;
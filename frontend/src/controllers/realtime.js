@@ -0,0 +1,28 @@
+// realtime.js
+import socket from './socket';
+
+// Published by invoice_form_vue/realtime.py
+export const INVOICE_EVENT = 'invoice_form_update';
+export const LOCK_EVENT = 'invoice_form_lock';
+export const BULK_EVENT = 'invoice_form_bulk_progress';
+export const CREDIT_LIMIT_EVENT = 'invoice_form_credit_limit_hold';
+
+// Listen to a realtime event; returns the function that stops listening
+export function subscribe(event, handler) {
+  socket.on(event, handler);
+  return () => socket.off(event, handler);
+}
+
+// Apply an INVOICE_EVENT message to a list of invoices and return the new list.
+// `belongs(invoice)` tells whether the changed invoice should be in the list.
+export function patchInvoiceList(list, { action, invoice }, belongs) {
+  const rest = list.filter(row => row.name !== invoice.name);
+  if (action === 'delete' || !belongs(invoice)) return rest;
+
+  const existing = list.find(row => row.name === invoice.name);
+  if (existing) {
+    return list.map(row => (row.name === invoice.name ? { ...row, ...invoice } : row));
+  }
+  // Lists are ordered by last modified, so a new or revived invoice goes first
+  return [invoice, ...rest];
+}
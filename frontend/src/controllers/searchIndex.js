@@ -0,0 +1,47 @@
+// searchIndex.js
+// In-memory typeahead over the master data lists ({ label, code } entries).
+import { toRaw } from 'vue';
+
+const MAX_RESULTS = 50;
+
+// Case, Arabic letter variants and Arabic-Indic digits should not decide a match
+export function normalize(text) {
+  return String(text || '')
+    .toLowerCase()
+    .replace(/[أإآٱ]/g, 'ا')
+    .replace(/ة/g, 'ه')
+    .replace(/ى/g, 'ي')
+    .replace(/[ً-ٟـ]/g, '') // tashkeel and tatweel
+    .replace(/[٠-٩]/g, (d) => String.fromCharCode(d.charCodeAt(0) - 1632 + 48))
+    .trim();
+}
+
+const indexes = new WeakMap();
+
+// Build (once per list) an index whose search() returns the entries whose label or code
+// contains the query. A query that extends the previous one only rescans the previous matches.
+export function getSearchIndex(entries) {
+  // Scan the plain array, not the reactive proxy around it
+  entries = toRaw(entries);
+  if (indexes.has(entries)) return indexes.get(entries);
+
+  const keys = entries.map((entry) => normalize(`${entry.label} ${entry.code || ''}`));
+  const all = keys.map((_, i) => i);
+  let lastQuery = null;
+  let lastMatches = all;
+
+  const index = {
+    search(query, limit = MAX_RESULTS) {
+      query = normalize(query);
+      if (!query) {
+        return entries.slice(0, limit);
+      }
+      const candidates = lastQuery !== null && query.startsWith(lastQuery) ? lastMatches : all;
+      lastMatches = candidates.filter((i) => keys[i].includes(query));
+      lastQuery = query;
+      return lastMatches.slice(0, limit).map((i) => entries[i]);
+    },
+  };
+  indexes.set(entries, index);
+  return index;
+}
@@ -3,9 +3,11 @@
 import io from 'socket.io-client';
 
 let host = window.location.hostname;
-let port = window.location.port ? ':9000' : '';
+let port = window.location.port ? `:${window.socketio_port || 9000}` : '';
 let protocol = port ? 'http' : 'https';
-let url = `${protocol}://${host}${port}`;
-let socket = io(url);
+// Frappe's socket.io server serves each site on its own namespace
+let siteName = window.site_name || host;
+let url = `${protocol}://${host}${port}/${siteName}`;
+let socket = io(url, { withCredentials: true, reconnectionAttempts: 5 });
 
-export default socket;
\ No newline at end of file
+export default socket;
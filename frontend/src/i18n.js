@@ -1,16 +1,40 @@
 import { createI18n } from 'vue-i18n'
-import en from './locales/en.json'
-import ar from './locales/ar.json'
 
+// Each locale is its own chunk, fetched only when it is used
+const localeLoaders = import.meta.glob('./locales/*.json', { import: 'default' })
+
+export const SUPPORTED_LOCALES = Object.keys(localeLoaders).map((path) => path.match(/([\w-]+)\.json$/)[1])
 
 const i18n = createI18n({
     legacy: false,
 	locale: 'en',
 	fallbackLocale: 'en',
-	messages: {
-	  en,
-	  ar
-	}
+	messages: {}
 })
 
+// Frappe languages can carry a region ("en-US"); fall back to the base language, then English
+export function resolveLocale(lang) {
+	if (!lang) return 'en'
+	if (SUPPORTED_LOCALES.includes(lang)) return lang
+	const base = lang.split('-')[0]
+	return SUPPORTED_LOCALES.includes(base) ? base : 'en'
+}
+
+export async function loadLocale(lang) {
+	const locale = resolveLocale(lang)
+	if (!i18n.global.availableLocales.includes(locale)) {
+		const messages = await localeLoaders[`./locales/${locale}.json`]()
+		i18n.global.setLocaleMessage(locale, messages)
+	}
+	return locale
+}
+
+export async function setLocale(lang) {
+	const locale = await loadLocale(lang)
+	i18n.global.locale.value = locale
+	document.documentElement.lang = locale
+	document.documentElement.dir = locale === 'ar' ? 'rtl' : 'ltr'
+	return locale
+}
+
 export default i18n
@@ -1,7 +1,7 @@
 import { createApp, reactive } from "vue";
 import App from "./App.vue";
 import router from './router';
-import i18n from './i18n.js';
+import i18n, { loadLocale, setLocale } from './i18n.js';
 
 import './style.css';
 import "./flags.css";
@@ -19,52 +19,37 @@ import 'primeicons/primeicons.css';
 
 import axios from 'axios';
 
-// PrimeVue components
-import Button from 'primevue/button';
-import InputText from 'primevue/inputtext';
-import InputNumber from 'primevue/inputnumber';
-import AutoComplete from 'primevue/autocomplete';
-import Checkbox from 'primevue/checkbox';
-import Dialog from 'primevue/dialog';
-import DataTable from 'primevue/datatable';
-import Column from 'primevue/column';
-import DataView from 'primevue/dataview';
-import Toast from 'primevue/toast';
-import ConfirmDialog from 'primevue/confirmdialog';
-import FloatLabel from 'primevue/floatlabel';
-import Menubar from "primevue/menubar";
-import Tag from 'primevue/tag';
-import IftaLabel from 'primevue/iftalabel';
-import Textarea from 'primevue/textarea';
-
-import { useConfirm } from 'primevue/useconfirm';
+// PrimeVue components are imported by the views and components that use them,
+// so each route's chunk only carries its own
 
 // 👇 NEW: preload user language + apply lang/dir
 async function initApp() {
   let userLang = localStorage.getItem('preferredLang') || 'en';
+  // User, permissions, settings and counts for the first paint, in one request
+  const bootstrap = reactive({ loaded: false });
+  // Start fetching the last used locale while bootstrap is in flight; it is usually the same
+  loadLocale(userLang);
 
   try {
-    const res = await axios.get('/api/method/frappe.auth.get_logged_user');
-    const email = res.data.message;
-    const userRes = await axios.get(`/api/resource/User/${email}`);
-    const user = userRes.data.data;
+    const res = await axios.get('/api/method/invoice_form_vue.api.get_bootstrap');
+    Object.assign(bootstrap, res.data.message, { loaded: true });
 
-    userLang = user.language || 'en';
+    userLang = bootstrap.language || 'en';
     localStorage.setItem('preferredLang', userLang);
   } catch (err) {
     console.warn('[i18n] Failed to load user language. Defaulting to "en"');
   }
 
-  // 🧠 Apply locale and dir BEFORE mounting app
-  i18n.global.locale.value = userLang;
-  document.documentElement.lang = userLang;
-  document.documentElement.dir = userLang === 'ar' ? 'rtl' : 'ltr';
+  // 🧠 Fetch only the active locale and apply it with dir BEFORE mounting app
+  const locale = await setLocale(userLang);
 
   // 🔨 Mount app after init
   const app = createApp(App);
   const auth = reactive(new Auth());
   const permissions = new Permissions();
-  if (auth.isLoggedIn) {
+  if (bootstrap.permissions) {
+    permissions.setPermissions(bootstrap.permissions);
+  } else if (auth.isLoggedIn) {
     permissions.loadPermissions(auth.cookie.user_id);
   }
   app.use(router);
@@ -72,6 +57,7 @@ async function initApp() {
 
   app.provide("$auth", auth);
   app.provide('$permissions', permissions);
+  app.provide('$bootstrap', bootstrap);
 
   app.provide("$call", call);
 
@@ -90,23 +76,6 @@ async function initApp() {
   app.use(ToastService);
   app.use(ConfirmationService);
 
-  // Register components
-  app.component('Button', Button);
-  app.component('InputText', InputText);
-  app.component('InputNumber', InputNumber);
-  app.component('AutoComplete', AutoComplete);
-  app.component('Checkbox', Checkbox);
-  app.component('Dialog', Dialog);
-  app.component('DataTable', DataTable);
-  app.component('Column', Column);
-  app.component('DataView', DataView);
-  app.component('Toast', Toast);
-  app.component('ConfirmDialog', ConfirmDialog);
-  app.component('FloatLabel', FloatLabel);
-  app.component('Menubar', Menubar);
-  app.component('Tag', Tag);
-  app.component('IftaLabel', IftaLabel);
-  app.component('Textarea', Textarea);
   // Route guards
   // In main.js - Update the router guard
 // In main.js - Simplify router guard
@@ -132,6 +101,11 @@ router.beforeEach((to, from, next) => {
 });
 
   app.mount("#app");
+
+  // English is the fallback for keys missing from other locales; fetch it once the app is up
+  if (locale !== 'en') {
+    loadLocale('en');
+  }
 }
 
 // 🚀 Fire it up!
@@ -1,11 +1,7 @@
 import { createRouter, createWebHistory } from "vue-router";
-import Home from "../views/Home.vue";
-import InvoiceForm from '../views/InvoiceForm.vue'
-import Drafts from '../views/Drafts.vue'
-import Settings from '../views/Settings.vue'
-import Login from '../views/Login.vue'
 import authRoutes from './auth';
 
+// Every view is its own chunk, fetched on first navigation to it
 const routes = [
   {
     path: "/",
@@ -14,27 +10,27 @@ const routes = [
   {
     path: "/home", // Changed from "/" to "/home"
     name: "Home",
-    component: Home,
+    component: () => import('../views/Home.vue'),
   },
   {
     path: "/invoice",
     name: "InvoiceForm",
-    component: InvoiceForm,
+    component: () => import('../views/InvoiceForm.vue'),
   },
   {
     path: "/drafts",
     name: "Drafts",
-    component: Drafts,
+    component: () => import('../views/Drafts.vue'),
   },
   {
     path: "/settings",
     name: "Settings",
-    component: Settings,
+    component: () => import('../views/Settings.vue'),
   },
   {
     path: "/login",
     name: "Login",
-    component: Login,
+    component: () => import('../views/Login.vue'),
     meta: { 
       isLoginPage: true
     }
@@ -4,11 +4,14 @@ import tailwindcss from '@tailwindcss/vite'
 import { VitePWA } from 'vite-plugin-pwa';
 import vue from '@vitejs/plugin-vue';
 import fs from "fs"
+import bundleBudget from './budget.js';
 
 // https://vitejs.dev/config/
 export default defineConfig({
 	base: '/invoice_form/', // Add base path for proper asset loading
 	plugins: [vue(), tailwindcss(),
+    // Fail the build when first paint or a route gets heavier than a low-end tablet should parse
+    bundleBudget({ initialKb: 170, routeKb: 150, interactiveMs: 5000 }),
     VitePWA({ 
       registerType: 'autoUpdate',
       workbox: {
@@ -34,6 +37,61 @@ export default defineConfig({
               networkTimeoutSeconds: 3,
             },
           },
+          {
+            // Read endpoints answer from the cache at once and refresh it in the background
+            urlPattern: /\/api\/method\/invoice_form_vue\.api\.(get_suppliers_and_customers|get_draft_invoice_form|get_dashboard_data)\b/,
+            handler: 'StaleWhileRevalidate',
+            method: 'GET',
+            options: {
+              cacheName: 'invoice-app-api', // cleared on logout, the responses are per user
+              expiration: {
+                maxEntries: 50,
+                maxAgeSeconds: 7 * 24 * 60 * 60,
+              },
+              cacheableResponse: {
+                statuses: [200],
+              },
+            },
+          },
+          {
+            // Saves made without a connection are kept in IndexedDB and replayed
+            // in order once it returns; create_invoice dedupes them by idempotency_key.
+            // Row operations have no such key, so only whole-invoice saves are queued.
+            urlPattern: ({ url, request }) =>
+              url.pathname === '/api/method/invoice_form_vue.api.create_invoice' &&
+              request.headers.get('X-Invoice-Form-Queueable') === '1',
+            handler: 'NetworkOnly',
+            method: 'POST',
+            options: {
+              backgroundSync: {
+                name: 'invoice-app-writes',
+                options: {
+                  maxRetentionTime: 24 * 60, // minutes
+                  // Replays are marked, so the server holds a save it refuses for the user
+                  // to review; nobody sees the answer to a replay. A save answered 409
+                  // (another save of the invoice in progress) stays queued for the next sync.
+                  onSync: async ({ queue }) => {
+                    let entry;
+                    while ((entry = await queue.shiftRequest())) {
+                      const headers = new Headers(entry.request.headers);
+                      headers.set('X-Invoice-Form-Replayed', '1');
+                      let response;
+                      try {
+                        response = await fetch(new Request(entry.request, { headers }));
+                      } catch (error) {
+                        await queue.unshiftRequest(entry);
+                        throw error;
+                      }
+                      if (response.status === 409) {
+                        await queue.unshiftRequest(entry);
+                        throw new Error('Save in progress, replaying later');
+                      }
+                    }
+                  },
+                },
+              },
+            },
+          },
         ],
       },
       includeAssets: ['favicon.ico', 'apple-touch-icon.png'],
@@ -77,10 +135,15 @@ export default defineConfig({
 		target: 'es2015',
 		rollupOptions: {
 			output: {
-				// Ensure proper chunking for better caching
-				manualChunks: {
-					vendor: ['vue', 'vue-router'],
-					ui: ['primevue']
+				// Keep the framework and PrimeVue's shared core in long-lived chunks;
+				// PrimeVue components follow the routes that import them
+				manualChunks(id) {
+					if (/node_modules\/(@?vue|vue-router|vue-i18n|@intlify)\//.test(id)) {
+						return 'vendor'
+					}
+					if (/node_modules\/(@primevue\/core|@primeuix|primevue\/(config|base|service|usestyle|toastservice|confirmationservice))\//.test(id)) {
+						return 'primevue-core'
+					}
 				}
 			}
 		}
@@ -4,86 +4,86 @@ import json
 from frappe import _
 import frappe.translate
 import datetime
+from frappe.query_builder import Order
+from frappe.query_builder.functions import Count
+from frappe.utils import cint, flt, get_datetime, today
 
+from invoice_form_vue import audit, bulk, coalesce, credit, dashboard, export, loaders, master_data, permissions, profiling, replica, rollup, search
 
+
+# Not routed to the replica: a miss rebuilds the master-data cache shared by every
+# user under the current version, which must not be filled from a lagging copy
 @frappe.whitelist()
-def get_suppliers_and_customers():
-    suppliers = frappe.get_list("Supplier", filters={'is_farmer':1},fields=["name", "supplier_name"])
-    customers = frappe.get_list("Customer", filters={'is_customer':1, 'is_frozen':0},fields=["name", "customer_name"])
-    items = frappe.get_list("Item", filters={'commission_item':0, "is_agriculture_item": 1},fields=["name", "item_name"])
-    return {
-        "suppliers": suppliers,
-        "customers": customers,
-        "items": items,
-    }
+def get_suppliers_and_customers(since=None):
+    """
+    Return the farmer suppliers, customers and agriculture items.
+
+    Clients pass the version they already hold as `since` (or an If-None-Match
+    header). An unchanged version answers 304, a version still covered by the
+    change log answers only the changes, anything else gets the full lists.
+    """
+    version = master_data.get_user_version()
+    etag = f'"{version}"'
+    _set_response_header("ETag", etag)
+
+    if_none_match = frappe.request.headers.get("If-None-Match") if frappe.request else None
+    if since == version or if_none_match == etag:
+        frappe.local.response["http_status_code"] = 304
+        return {"version": version, "not_modified": True}
+
+    if since:
+        changes = master_data.get_user_changes_since(since)
+        if changes is not None:
+            return {"version": version, "changes": changes}
+
+    return master_data.get_user_master_data()
+
+def _set_response_header(key, value):
+    headers = getattr(frappe.local, "response_headers", None)
+    if headers is not None:
+        headers[key] = value
 
 @frappe.whitelist()
-def create_invoice(invoice_data):
-    try:
-        data = json.loads(invoice_data)
-        frappe.logger().info(f"📥 Incoming invoice data: {data}")
-        frappe.log_error(message=f"📥 Incoming invoice data: {str(data)}", title= 'l')
+def search_master_data(kind, query="", limit=10):
+    """
+    Typeahead search over suppliers, customers or items.
 
-        if not data.get("supplier"):
-            frappe.throw(_("Supplier and Customer are required"))
+    Args:
+        kind: "suppliers", "customers" or "items"
+        query: text typed by the user, matched against the code and the name
+        limit: maximum number of rows returned (capped at 50)
 
-        # Create or fetch doc
-        doc = (
-            frappe.new_doc("Invoice Form")
-            if not data.get("invoice_id")
-            else frappe.get_doc("Invoice Form", data["invoice_id"])
-        )
-        
-        pamper = None
-        if not data.get("invoice_id"):
-            pamper_name = frappe.db.sql("select pamper from `tabInvoice Form Permission Details` where user = '"+frappe.session.user+"' ", as_dict=1)
-            if pamper_name:
-                doc.pamper = pamper_name[0].pamper 
-            else:
-                frappe.log_error(title="Invoice Form Creation error", message="No Papmer Found in Papmer For User In Invoice Form Permission Details")
-        
-        doc.customer = data["customer"]["code"] if isinstance(data["customer"], dict) else data["customer"]
-        doc.posting_date = data.get("posting_date")
-        invoice_remark = data.get("invoice_remark")
-        frappe.logger().info(f"📝 Setting invoice_remark to: '{invoice_remark}'")
-        
-        # Add invoice remark if provided
-        if data.get("invoice_remark"):
-            doc.invoice_remark = data["invoice_remark"]
+    Returns:
+        list: rows shaped like get_suppliers_and_customers entries
+    """
+    return search.search(kind, query, min(cint(limit) or 10, 50))
 
-        if "supplier" in data:
-            doc.supplier = data["supplier"]["code"] if isinstance(data["supplier"], dict) else data["supplier"]
+@frappe.whitelist()
+def create_invoice(invoice_data):
+    try:
+        data = json.loads(invoice_data)
 
-        # Clear & append items
-        doc.items = []
+        # A save queued while offline may be replayed, and later saves of an
+        # invoice created offline do not know its name yet
+        idempotency_key = data.get("idempotency_key")
+        if idempotency_key and not data.get("invoice_id"):
+            data["invoice_id"] = frappe.db.get_value("Invoice Form", {"idempotency_key": idempotency_key}, "name")
 
-        for item in data.get("items", []):
-            item_doc = {
-                "item_code": item["item"],
-                "qty": item["qty"],
-                "price": item["rate"],
-                "total": item["rate"] * item["qty"],
-                "customer": item.get("customer", {}).get("code") if isinstance(item.get("customer"), dict) else item.get("customer"),
-                "has_commission": item.get("has_commission", 0),
-                "pamper": pamper
-            }
-            
-            # Add item remark if provided
-            if item.get("remark"):
-                item_doc["remark"] = item["remark"]
-                
-            doc.append("items", item_doc)
-
-        doc.save()
-        frappe.db.commit()
+        # Overlapping saves of the same invoice by this user become one write
+        return coalesce.coalesce_save(data, commit_invoice)
 
-        frappe.logger().info(f"✅ Invoice saved: {doc.name}")
+    except credit.CreditLimitExceeded as e:
+        # Nothing is saved; the client asks the user and resends without the check.
+        # A queued save replayed by the service worker is held instead, nobody sees
+        # this answer.
+        frappe.db.rollback()
+        if frappe.get_request_header("X-Invoice-Form-Replayed") == "1":
+            credit.hold_for_review(data, e.violations)
+        return {"invoice_name": data.get("invoice_id"), "credit_limit_violations": e.violations}
 
-        return {
-            "invoice_name": doc.name,
-            "supplier": doc.supplier,
-            "customer": doc.customer
-        }
+    except coalesce.SaveInProgress:
+        # Nothing written; answered 409 so the client sends it again
+        raise
 
     except Exception as e:
         error_message = frappe.get_traceback()
@@ -91,35 +91,228 @@ def create_invoice(invoice_data):
         frappe.db.rollback()
         frappe.throw(_("Something went wrong while saving the invoice. Please contact support."))
 
+def commit_invoice(data):
+    """Save one create_invoice payload, commit, and return the response for the form."""
+    idempotency_key = data.get("idempotency_key")
+    if idempotency_key and not data.get("invoice_id"):
+        # Created by an earlier write merged with this one
+        data = {**data, "invoice_id": frappe.db.get_value("Invoice Form", {"idempotency_key": idempotency_key}, "name")}
+
+    doc = save_invoice(
+        data, idempotency_key=idempotency_key, check_credit_limit=data.get("check_credit_limit")
+    )
+    audit.record("save", doc, json.dumps(data))
+    frappe.db.commit()
+    credit.clear_hold(idempotency_key)
+
+    frappe.logger().info(f"✅ Invoice saved: {doc.name}")
+
+    return get_saved_invoice_response(doc)
+
 @frappe.whitelist()
-def get_invoice(invoice_name):
-    doc = frappe.get_doc("Invoice Form", invoice_name)
-    doc_data = {
-        "name": doc.name,
-        "supplier": doc.get("supplier"),
-        "supplier_name": frappe.db.get_value("Supplier", doc.get("supplier"), "supplier_name"),
+def get_credit_limit_holds(idempotency_keys):
+    """
+    Saves of these invoices refused by the credit check and not decided on yet.
+
+    Args:
+        idempotency_keys: list of keys of saves the client queued offline
+
+    Returns:
+        list: {"idempotency_key", "data", "violations"}; resend `data` without
+        the check to save it anyway
+    """
+    return credit.get_holds(frappe.parse_json(idempotency_keys) or [])
+
+@frappe.whitelist()
+def dismiss_credit_limit_hold(idempotency_key):
+    """Drop a held save the user decided not to keep."""
+    credit.clear_hold(idempotency_key)
+
+@frappe.whitelist()
+def create_invoices_bulk(invoices, chunk_size=20):
+    """
+    Save many invoices queued by an offline client in one request.
+
+    Args:
+        invoices: list of create_invoice payloads, each with a client generated
+            `idempotency_key`
+        chunk_size: number of invoices committed per transaction
+
+    Returns:
+        dict: {"results": [...]} in the order of `invoices`, each with the
+        idempotency_key and a status of "created", "duplicate" or "error"
+    """
+    invoices = frappe.parse_json(invoices) or []
+    chunk_size = max(cint(chunk_size), 1)
+    results = [None] * len(invoices)
+
+    # Validate every payload before writing anything
+    pending = []
+    for index, data in enumerate(invoices):
+        error = validate_invoice_payload(data)
+        if error:
+            results[index] = {"idempotency_key": data.get("idempotency_key"), "status": "error", "message": error}
+        else:
+            pending.append(index)
+
+    # Replays of invoices saved by an earlier request
+    saved = dict(frappe.get_all(
+        "Invoice Form",
+        filters={"idempotency_key": ["in", [invoices[index]["idempotency_key"] for index in pending] or [""]]},
+        fields=["idempotency_key", "name"],
+        as_list=True,
+    ))
+
+    for start in range(0, len(pending), chunk_size):
+        for index in pending[start:start + chunk_size]:
+            data = invoices[index]
+            key = data["idempotency_key"]
+            if key in saved:
+                results[index] = {"idempotency_key": key, "status": "duplicate", "invoice_name": saved[key]}
+                continue
+
+            frappe.db.savepoint("bulk_invoice")
+            try:
+                doc = save_invoice(data, idempotency_key=key)
+            except Exception:
+                frappe.db.rollback(save_point="bulk_invoice")
+                frappe.clear_messages()
+                frappe.log_error(title="❌ Bulk Invoice Creation Failed", message=frappe.get_traceback())
+                results[index] = {"idempotency_key": key, "status": "error", "message": _("Could not save this invoice")}
+                continue
+
+            audit.record("save", doc)
+            saved[key] = doc.name
+            results[index] = {"idempotency_key": key, "status": "created", **get_saved_invoice_response(doc)}
+
+        frappe.db.commit()
+
+    return {"results": results}
+
+def validate_invoice_payload(data):
+    """Return an error message for a malformed bulk invoice payload, or None."""
+    if not isinstance(data, dict):
+        return _("Invoice payload must be an object")
+    if not data.get("idempotency_key"):
+        return _("Idempotency key is required")
+    if not data.get("supplier") or "customer" not in data:
+        return _("Supplier and Customer are required")
+    for item in data.get("items", []):
+        if not item.get("item") or item.get("qty") is None or item.get("rate") is None:
+            return _("Every item needs an item, qty and rate")
+    return None
+
+def save_invoice(data, idempotency_key=None, check_credit_limit=False):
+    """
+    Create or update an Invoice Form from a Vue form payload, without committing.
+    With `check_credit_limit`, raises credit.CreditLimitExceeded instead of saving
+    when a customer on the invoice would go over their credit limit.
+    """
+    if not data.get("supplier"):
+        frappe.throw(_("Supplier and Customer are required"))
+
+    # Create or fetch doc
+    doc = (
+        frappe.new_doc("Invoice Form")
+        if not data.get("invoice_id")
+        else frappe.get_doc("Invoice Form", data["invoice_id"])
+    )
+    
+    pamper = None
+    if not data.get("invoice_id"):
+        pamper_name = permissions.get_user_permission().pamper
+        if pamper_name:
+            doc.pamper = pamper_name
+        else:
+            frappe.log_error(title="Invoice Form Creation error", message="No Papmer Found in Papmer For User In Invoice Form Permission Details")
+
+        if idempotency_key:
+            doc.idempotency_key = idempotency_key
+    
+    doc.customer = data["customer"]["code"] if isinstance(data["customer"], dict) else data["customer"]
+    doc.posting_date = data.get("posting_date")
+    invoice_remark = data.get("invoice_remark")
+    frappe.logger().info(f"📝 Setting invoice_remark to: '{invoice_remark}'")
+    
+    # Add invoice remark if provided
+    if data.get("invoice_remark"):
+        doc.invoice_remark = data["invoice_remark"]
+
+    if "supplier" in data:
+        doc.supplier = data["supplier"]["code"] if isinstance(data["supplier"], dict) else data["supplier"]
+
+    # Amounts already saved for each customer, so the credit check does not count them twice
+    previous_totals = credit.get_customer_totals(doc.items) if check_credit_limit else None
+
+    if data.get("invoice_id") and "operations" in data:
+        # Incremental save: only the listed rows are added, updated or deleted
+        apply_item_operations(doc, data["operations"], pamper)
+    else:
+        # Clear & append items
+        doc.items = []
+
+        for item in data.get("items", []):
+            doc.append("items", get_item_row(item, pamper))
+
+    if check_credit_limit:
+        credit.check_credit_limits(doc, previous_totals)
+
+    doc.save()
+    return doc
+
+def get_saved_invoice_response(doc):
+    return {
+        "invoice_name": doc.name,
+        "supplier": doc.supplier,
         "customer": doc.customer,
-        "customer_name": frappe.db.get_value("Customer", doc.customer, "customer_name") or '',
-        "is_draft": doc.is_draft,
-        "lock_update": doc.lock_update,
-        "invoice_remark": doc.get("invoice_remark", ""),
-        "items": []
+        "row_names": [row.name for row in doc.items]
     }
 
-    for item in doc.items:
-        item_data = {
-            "item_code": item.item_code,
-            "qty": item.qty,
-            "price": item.price,
-            "total": item.total,
-            "customer": item.get("customer"),
-            "customer_name": frappe.db.get_value("Customer", item.get("customer"), "customer_name") if item.get("customer") else "",
-            "has_commission": item.get("has_commission", 0),
-            "remark": item.get("remark", "")
-        }
-        doc_data["items"].append(item_data)
+def get_item_row(item, pamper=None):
+    """Map an item row sent by the Vue form to Invoice Form Item fields."""
+    return {
+        "item_code": item["item"],
+        "qty": item["qty"],
+        "price": item["rate"],
+        "total": item["rate"] * item["qty"],
+        "customer": item.get("customer", {}).get("code") if isinstance(item.get("customer"), dict) else item.get("customer"),
+        "has_commission": item.get("has_commission", 0),
+        "remark": item.get("remark") or "",
+        "pamper": pamper
+    }
 
-    return doc_data
+def apply_item_operations(doc, operations, pamper=None):
+    """
+    Apply row-level operations to the items of an existing invoice.
+
+    Each operation is {"op": "add" | "update" | "delete", "name": row name, "item": row}.
+    "name" is required for update/delete and "item" for add/update. Rows that are
+    not mentioned keep their name and values, so only the changed rows are written.
+    """
+    rows = {row.name: row for row in doc.items}
+
+    for operation in operations:
+        op = operation.get("op")
+        if op == "add":
+            doc.append("items", get_item_row(operation["item"], pamper))
+            continue
+
+        row = rows.get(operation.get("name"))
+        if not row:
+            frappe.throw(_("Row {0} not found in invoice {1}").format(operation.get("name"), doc.name))
+
+        if op == "update":
+            row.update(get_item_row(operation["item"], pamper))
+        elif op == "delete":
+            doc.remove(row)
+            rows.pop(row.name)
+        else:
+            frappe.throw(_("Unknown row operation: {0}").format(op))
+
+@frappe.whitelist()
+@replica.read_only
+def get_invoice(invoice_name):
+    return loaders.load_invoice(invoice_name)
     
 @frappe.whitelist()
 def delete_invoice(invoice_name):
@@ -134,42 +327,80 @@ def remove_from_invoice(invoice_name):
     if doc.docstatus == 0:
         doc.is_draft = 0
         doc.save(ignore_permissions=False)
+        audit.record("submit", doc)
         frappe.db.commit()
         return {"status": "submitted"}
     else:
         frappe.throw(_("Invoice is already submitted."))
 
 @frappe.whitelist()
-def get_draft_invoice_form():
+def bulk_invoice_action(action, invoice_names=None, all_drafts=False):
+    """
+    Submit, delete or lock many invoices in a background job.
+
+    Args:
+        action: "submit", "delete" or "lock"
+        invoice_names: list of Invoice Form names
+        all_drafts: act on all of the user's drafts posted today instead
+
+    Returns:
+        dict: {"progress_id", "total"}; per-invoice results are pushed over
+        realtime as the job works through them
+    """
+    return bulk.enqueue_bulk_action(action, frappe.parse_json(invoice_names), cint(all_drafts))
+
+@frappe.whitelist()
+def export_invoices(from_date, to_date, pamper=None, supplier=None, customer=None, file_format="csv"):
+    """
+    Export Invoice Forms and their item rows posted between `from_date` and
+    `to_date` as CSV or XLSX, optionally for one pamper, supplier or customer.
+
+    The file is written by a background job; the user gets a link to it
+    when it is ready.
+
+    Returns:
+        dict: {"export_id"}
+    """
+    return export.enqueue_export(from_date, to_date, pamper, supplier, customer, file_format)
+
+@frappe.whitelist()
+def get_daily_rollup(from_date, to_date=None, pamper=None, supplier=None, item_code=None, group_by=None):
+    """
+    Quantity and value sold between `from_date` and `to_date`, read from the
+    daily rollup instead of the item rows.
+
+    Args:
+        group_by: JSON list of fields to group by (posting_date, pamper,
+            supplier, item_code); defaults to ["item_code"]
+
+    Returns:
+        list: rows with the group_by fields, qty, amount and row_count
+    """
+    group_by = frappe.parse_json(group_by) if group_by else ["item_code"]
+    return rollup.get_rollup(from_date, to_date, pamper, supplier, item_code, group_by)
+
+@frappe.whitelist()
+@replica.read_only
+def get_draft_invoice_form(cursor=None, page_length=20):
     """
     Retrieve invoices for the current user based on permission settings.
-    Returns a list of invoice objects with basic information.
+    Returns a page of invoice objects with basic information and their item count.
+
+    Pages are keyed on (modified, name): pass back the returned `next_cursor`
+    to fetch the following page.
     """
     try:
         # Check user permission from Invoice Form Permission Details
-        user_permissions = frappe.get_all(
-            "Invoice Form Permission Details",
-            filters={"user": frappe.session.user},
-            fields=["parent", "show_drafts", "show_submitted", "update_draft_invoice", "view_draft_hour"]
-        )
-        
-        # Default filters
-        filters = {"owner": frappe.session.user, "docstatus":0}
-        
-        # Process permissions
-        show_drafts = False
-        show_submitted = False
-        view_draft_hour = 0
-        
-        if user_permissions:
-            permission = user_permissions[0]
-            show_drafts = permission.get("show_drafts", 0)
-            show_submitted = permission.get("show_submitted", 0)
-            view_draft_hour = permission.get("view_draft_hour", 0)
+        permission = permissions.get_user_permission()
+        show_drafts = permission.show_drafts
+        show_submitted = permission.show_submitted
+        view_draft_hour = cint(permission.view_draft_hour)
         
         # If user has no permissions to see any invoices, return empty list
         if not show_drafts and not show_submitted:
-            return {"invoices": []}
+            return {"invoices": [], "next_cursor": None}
+
+        frappe.has_permission("Invoice Form", "read", throw=True)
         
         # Build docstatus filter based on permissions
         docstatus_filter = []
@@ -177,54 +408,74 @@ def get_draft_invoice_form():
             docstatus_filter.append(1)  # Include drafts
         if show_submitted:
             docstatus_filter.append(0)  # Include submitted
-        
-        filters["is_draft"] = ["in", docstatus_filter]
+
+        page_length = min(cint(page_length) or 20, 100)
+
+        # Invoices and their item counts in one grouped query
+        Invoice = frappe.qb.DocType("Invoice Form")
+        Item = frappe.qb.DocType("Invoice Form Item")
+        query = (
+            frappe.qb.from_(Invoice)
+            .left_join(Item)
+            .on((Item.parent == Invoice.name) & (Item.parenttype == "Invoice Form"))
+            .select(
+                Invoice.name,
+                Invoice.posting_date,
+                Invoice.customer,
+                Invoice.customer_name,
+                Invoice.supplier,
+                Invoice.supplier_name,
+                Invoice.modified,
+                Invoice.docstatus,
+                Invoice.is_draft,
+                Count(Item.name).as_("item_count"),
+            )
+            .where(Invoice.owner == frappe.session.user)
+            .where(Invoice.docstatus == 0)
+            .where(Invoice.is_draft.isin(docstatus_filter))
+            .groupby(Invoice.name)
+            .orderby(Invoice.modified, order=Order.desc)
+            .orderby(Invoice.name, order=Order.desc)
+            .limit(page_length + 1)
+        )
         
         # Add time filter based on view_draft_hour if applicable
         if view_draft_hour > 0:
             hours_ago = datetime.datetime.now() - datetime.timedelta(hours=view_draft_hour)
-            filters["creation"] = [">", hours_ago]
-        
-        # Get invoices based on filters
-        invoices = frappe.get_all(
-            "Invoice Form",
-            filters=filters,
-            fields=[
-                "name", 
-                "posting_date", 
-                "customer", 
-                "customer_name", 
-                "supplier", 
-                "supplier_name",
-                "modified",
-                "docstatus",
-                "is_draft"
-            ],
-            order_by="modified desc",
-            ignore_permissions=False
-        )
+            query = query.where(Invoice.creation > hours_ago)
+
+        # Continue after the last invoice of the previous page
+        if cursor:
+            cursor = frappe.parse_json(cursor)
+            cursor_modified = get_datetime(cursor["modified"])
+            query = query.where(
+                (Invoice.modified < cursor_modified)
+                | ((Invoice.modified == cursor_modified) & (Invoice.name < cursor["name"]))
+            )
+
+        invoices = query.run(as_dict=True)
+
+        next_cursor = None
+        if len(invoices) > page_length:
+            invoices = invoices[:page_length]
+            last = invoices[-1]
+            next_cursor = {"modified": str(last.modified), "name": last.name}
 
-        # For each invoice, get the items to show the count
         for invoice in invoices:
             # Convert date format if needed
             if invoice.get("posting_date"):
                 invoice["posting_date"] = invoice["posting_date"].strftime("%Y-%m-%d")
-            
-            # Get items count
-            items = frappe.get_all(
-                "Invoice Form Item",
-                filters={"parent": invoice.name},
-                fields=["name"]
-            )
-            invoice["items"] = items
         
-        return {"invoices": invoices}
+        return {"invoices": invoices, "next_cursor": next_cursor}
     
     except Exception as e:
-        frappe.log_error(frappe.get_traceback(), _("Failed to fetch invoices"))
-        return {"error": str(e), "invoices": []}
+        # Error Log cannot be written from the replica connection
+        with replica.on_primary():
+            frappe.log_error(frappe.get_traceback(), _("Failed to fetch invoices"))
+        return {"error": str(e), "invoices": [], "next_cursor": None}
 
 @frappe.whitelist()
+@replica.read_only
 def get_dashboard_data():
     """
     Get dashboard data including counts and recent invoices.
@@ -233,17 +484,8 @@ def get_dashboard_data():
         dict: Dashboard statistics and recent invoice list
     """
     try:
-        # Get draft invoice count
-        draft_count = frappe.db.count(
-            "Invoice Form",  # Use your actual doctype name
-            {"docstatus": 0, 'is_draft':1}  # docstatus 0 means draft
-        )
-        
-        # Get submitted invoice count
-        submitted_count = frappe.db.count(
-            "Invoice Form",  # Use your actual doctype name
-            {"docstatus": 1}  # docstatus 1 means submitted
-        )
+        counts = get_dashboard_counts()
+        today_totals = (rollup.get_rollup(today(), group_by=()) or [{}])[0]
         
         # Get recent invoices (both draft and submitted)
         recent_invoices = frappe.get_all(
@@ -272,16 +514,67 @@ def get_dashboard_data():
         
         return {
             "message": {
-                "draft_count": draft_count,
-                "submitted_count": submitted_count,
+                "draft_count": counts["draft_count"],
+                "submitted_count": counts["submitted_count"],
+                "my_draft_count": counts["my_draft_count"],
+                "my_submitted_count": counts["my_submitted_count"],
+                "today_qty": flt(today_totals.get("qty")),
+                "today_amount": flt(today_totals.get("amount")),
                 "recent_invoices": recent_invoices
             }
         }
         
     except Exception as e:
-        frappe.log_error(frappe.get_traceback(), _("Failed to fetch dashboard data"))
+        # Error Log cannot be written from the replica connection
+        with replica.on_primary():
+            frappe.log_error(frappe.get_traceback(), _("Failed to fetch dashboard data"))
         frappe.throw(_("Failed to fetch dashboard data: {0}").format(str(e)))
 
+def get_dashboard_counts():
+    """Draft and submitted Invoice Form counts shown on the Home view, overall and for the session user."""
+    return dashboard.get_counts()
+
+BOOTSTRAP_SECTIONS = ("user", "permissions", "settings", "dashboard", "master_data_version")
+
+@frappe.whitelist(allow_guest=True)
+def get_bootstrap(sections=None):
+    """
+    Everything the SPA needs for its first paint in one request.
+
+    Args:
+        sections: optional list (or comma separated string) of sections to
+            return, so clients can skip the ones they already hold
+
+    Returns:
+        dict: language plus the requested sections. Guests only get the language.
+    """
+    if isinstance(sections, str) and not sections.startswith("["):
+        sections = sections.split(",")
+    sections = set(frappe.parse_json(sections) or BOOTSTRAP_SECTIONS)
+
+    user = frappe.session.user
+    if user == "Guest":
+        return {"user": None, "language": get_app_translations()}
+
+    user_info = frappe.get_cached_value(
+        "User", user, ["name", "email", "full_name", "user_image", "language"], as_dict=True
+    )
+    bootstrap = {"language": user_info.language or get_app_translations()}
+
+    if "user" in sections:
+        bootstrap["user"] = user_info
+    if "permissions" in sections:
+        bootstrap["permissions"] = check_user_permission(user)
+    if "settings" in sections:
+        permission = permissions.get_user_permission(user)
+        bootstrap["settings"] = {field: permission[field] for field in permissions.SETTINGS_FIELDS}
+    if "dashboard" in sections:
+        bootstrap["dashboard"] = get_dashboard_counts()
+    if "master_data_version" in sections:
+        bootstrap["master_data_version"] = master_data.get_user_version()
+
+    return bootstrap
+
 @frappe.whitelist(allow_guest=True)
 def get_app_translations():
 	if frappe.session.user != "Guest":
@@ -306,6 +599,7 @@ def set_user_language(language):
 
 
 @frappe.whitelist()
+@replica.read_only
 def check_user_permission(user):
     """Check user permissions for Invoice Form app"""
     if not user:
@@ -322,25 +616,11 @@ def check_user_permission(user):
             "repeat_item": False
         }
     
-    # Query the Invoice Form Permission Details for this user
-    permission_record = frappe.db.sql("""
-        SELECT 
-            login,
-            delete_invoice,
-            submit_invoice,
-            update_draft_invoice,
-            update_submitted_invoice,
-            show_drafts,
-            show_submitted
-        FROM `tabInvoice Form Permission Details` 
-        WHERE user = %s
-    """, (user,), as_dict=1)
-    
-    # Get remark settings from the single DocType
-    remark_settings = frappe.get_single("Invoice Form Permission")
+    # Permission Details row and form settings, cached per user
+    record = permissions.get_user_permission(user)
     
     # Default permissions if no record found
-    permissions = {
+    user_permissions = {
         "can_login": False,
         "can_delete_invoice": False,
         "can_submit_invoice": False,
@@ -348,15 +628,14 @@ def check_user_permission(user):
         "can_update_submitted": False,
         "can_show_drafts": False,
         "can_show_submitted": False,
-        "show_item_remark": remark_settings.get("show_item_remark", 0) == 1,
-        "show_invoice_remark": remark_settings.get("show_invoice_remark", 0) == 1,
-        "repeat_item": remark_settings.get("repeat_item", 0) == 1
+        "show_item_remark": record.show_item_remark == 1,
+        "show_invoice_remark": record.show_invoice_remark == 1,
+        "repeat_item": record.repeat_item == 1
     }
     
     # Update with actual permissions if record exists
-    if permission_record:
-        record = permission_record[0]
-        permissions.update({
+    if record.has_record:
+        user_permissions.update({
             "can_login": record.login == 1,
             "can_delete_invoice": record.delete_invoice == 1,
             "can_submit_invoice": record.submit_invoice == 1,
@@ -366,4 +645,23 @@ def check_user_permission(user):
             "can_show_submitted": record.show_submitted == 1,
         })
     
-    return permissions
+    return user_permissions
+
+@frappe.whitelist()
+def get_endpoint_stats(endpoint=None):
+    """
+    Latency, query count, SQL time, response size and cache hit ratio per
+    endpoint of this module, from the samples of the opt-in profiler.
+
+    Returns:
+        dict: endpoint -> {"count", "wall_ms", "queries", "sql_ms", "bytes",
+        "cache_hit_ratio"}, each metric with its p50/p95/p99/max
+    """
+    frappe.only_for("System Manager")
+    return profiling.get_stats(endpoint)
+
+@frappe.whitelist()
+def get_slow_traces(endpoint=None):
+    """Sampled slow requests with the SQL they ran, newest first."""
+    frappe.only_for("System Manager")
+    return profiling.get_slow_traces(endpoint)
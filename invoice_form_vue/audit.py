@@ -0,0 +1,102 @@
+"""
+Audit trail of Invoice Form saves, submits and deletes.
+
+Events are pushed to a Redis buffer after the transaction commits and written
+to Invoice Form Audit Log in batches by a scheduled job, so the save path
+does not pay for an insert. Configure in site_config.json:
+
+    "invoice_form_vue_audit_sample_rate": 1,       # share of events kept
+    "invoice_form_vue_audit_payloads": 0,          # also keep the request payload
+    "invoice_form_vue_audit_retention_days": 30
+"""
+
+import hashlib
+import json
+import random
+from functools import partial
+
+import frappe
+from frappe.utils import add_days, cint, flt, now, now_datetime
+
+DOCTYPE = "Invoice Form Audit Log"
+# Redis list of JSON events waiting to be written
+BUFFER_KEY = "invoice_form_vue:audit_buffer"
+
+BATCH_SIZE = 500
+# Events kept in Redis if the flush job stops running
+MAX_BUFFERED = 50000
+DEFAULT_RETENTION_DAYS = 30
+FIELDS = ["event", "invoice", "user", "pamper", "logged_at", "item_count", "total", "payload_bytes", "data"]
+
+
+def record(event, doc, payload=None):
+    """
+    Queue an audit event for `doc`. Nothing is written unless the current
+    transaction commits.
+    """
+    sample_rate = frappe.conf.get("invoice_form_vue_audit_sample_rate", 1)
+    if random.random() >= flt(sample_rate):
+        return
+
+    entry = {
+        "event": event,
+        "invoice": doc.name,
+        "user": frappe.session.user,
+        "pamper": doc.get("pamper"),
+        "logged_at": now(),
+        "item_count": len(doc.items),
+        "total": sum(flt(item.total) for item in doc.items),
+        "payload_bytes": len(payload) if isinstance(payload, str) else 0,
+        "data": payload if payload and frappe.conf.get("invoice_form_vue_audit_payloads") else None,
+    }
+    frappe.db.after_commit.add(partial(_push, json.dumps(entry)))
+
+
+def on_invoice_trash(doc, method=None):
+    """doc_events hook for Invoice Form (on_trash)."""
+    record("delete", doc)
+
+
+def flush_audit_log():
+    """Scheduled job: write the buffered events to Invoice Form Audit Log in batches."""
+    cache = frappe.cache()
+    key = cache.make_key(BUFFER_KEY)
+    while True:
+        (entries,) = cache.pipeline().lrange(key, 0, BATCH_SIZE - 1).execute()
+        if not entries:
+            break
+
+        values = []
+        for raw in entries:
+            entry = json.loads(raw)
+            # Named after the event, so a batch written again after a failed trim is skipped
+            name = hashlib.sha1(raw).hexdigest()[:10]
+            values.append(
+                [name, entry["logged_at"], entry["logged_at"], entry["user"], entry["user"]]
+                + [entry.get(field) for field in FIELDS]
+            )
+        frappe.db.bulk_insert(
+            DOCTYPE, ["name", "creation", "modified", "owner", "modified_by"] + FIELDS, values, ignore_duplicates=True
+        )
+        frappe.db.commit()
+        # Only dropped from the buffer once written; a failure above leaves them for the next run
+        cache.pipeline().ltrim(key, len(entries), -1).execute()
+
+        if len(entries) < BATCH_SIZE:
+            break
+
+
+def delete_old_audit_logs():
+    """Scheduled job: drop audit entries past the retention period."""
+    days = cint(frappe.conf.get("invoice_form_vue_audit_retention_days")) or DEFAULT_RETENTION_DAYS
+    frappe.db.delete(DOCTYPE, {"logged_at": ["<", add_days(now_datetime(), -days)]})
+    frappe.db.commit()
+
+
+def _push(entry):
+    cache = frappe.cache()
+    key = cache.make_key(BUFFER_KEY)
+    pipeline = cache.pipeline()
+    pipeline.rpush(key, entry)
+    pipeline.ltrim(key, -MAX_BUFFERED, -1)
+    pipeline.execute()
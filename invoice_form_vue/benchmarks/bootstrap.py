@@ -0,0 +1,60 @@
+"""
+Cold-start requests of the SPA: the separate calls it used to make versus get_bootstrap.
+
+    bench --site <site> execute invoice_form_vue.benchmarks.bootstrap.run \
+        --kwargs "{'url': 'http://localhost:8000', 'usr': 'user@example.com', 'pwd': '...'}"
+
+Each round uses a fresh session so nothing is reused between rounds apart
+from the server-side caches, as on a tablet opening the app.
+"""
+
+import json
+import statistics
+import time
+
+import requests
+
+LEGACY_CALLS = [
+    ("GET", "/api/method/frappe.auth.get_logged_user", None),
+    ("GET", "/api/resource/User/{usr}", None),
+    ("GET", "/api/method/invoice_form_vue.api.get_app_translations", None),
+    ("GET", "/api/method/invoice_form_vue.api.check_user_permission", {"user": "{usr}"}),
+    ("GET", "/api/method/invoice_form_vue.api.get_suppliers_and_customers", None),
+    ("GET", "/api/method/invoice_form_vue.api.get_dashboard_data", None),
+]
+BOOTSTRAP_CALLS = [
+    ("GET", "/api/method/invoice_form_vue.api.get_bootstrap", None),
+]
+
+
+def run(url="http://localhost:8000", usr="Administrator", pwd="admin", rounds=5):
+    report = {
+        "legacy": measure(url, usr, pwd, LEGACY_CALLS, rounds),
+        "bootstrap": measure(url, usr, pwd, BOOTSTRAP_CALLS, rounds),
+    }
+    print(json.dumps(report, indent=1))
+    return report
+
+
+def measure(url, usr, pwd, calls, rounds):
+    timings = []
+    payload = 0
+    for _ in range(rounds):
+        session = requests.Session()
+        session.post(f"{url}/api/method/login", data={"usr": usr, "pwd": pwd}).raise_for_status()
+
+        start = time.perf_counter()
+        payload = 0
+        for method, path, params in calls:
+            params = {key: value.format(usr=usr) for key, value in (params or {}).items()}
+            response = session.request(method, url + path.format(usr=usr), params=params)
+            response.raise_for_status()
+            payload += len(response.content)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "requests": len(calls),
+        "bytes": payload,
+        "median_ms": round(statistics.median(timings), 1),
+        "max_ms": round(max(timings), 1),
+    }
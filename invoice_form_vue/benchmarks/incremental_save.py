@@ -0,0 +1,72 @@
+"""
+Write amplification of full vs incremental create_invoice saves.
+
+    bench --site <site> execute invoice_form_vue.benchmarks.incremental_save.run --kwargs "{'rows': 100}"
+
+Everything runs inside one transaction that is rolled back at the end.
+"""
+
+import json
+from collections import Counter
+from unittest.mock import patch
+
+import frappe
+
+from invoice_form_vue.api import create_invoice
+
+WRITE_STATEMENTS = ("insert", "update", "delete")
+
+
+def run(rows=100):
+    supplier = frappe.db.get_value("Supplier", {"is_farmer": 1}, "name")
+    customer = frappe.db.get_value("Customer", {"is_customer": 1, "is_frozen": 0}, "name")
+    item_code = frappe.db.get_value("Item", {"is_agriculture_item": 1}, "name")
+    items = [
+        {"item": item_code, "qty": 1, "rate": 10 + i, "customer": customer}
+        for i in range(rows)
+    ]
+    base = {"supplier": supplier, "customer": customer, "posting_date": frappe.utils.today()}
+
+    try:
+        # create_invoice commits; keep everything in one transaction we can roll back
+        with patch.object(frappe.db, "commit"):
+            saved = create_invoice(json.dumps({**base, "items": items}))
+            invoice_id = saved["invoice_name"]
+
+            # Change the rate of one row both ways
+            items[0]["rate"] = 99
+            full = count_writes(create_invoice, json.dumps({**base, "invoice_id": invoice_id, "items": items}))
+
+            row_name = frappe.get_doc("Invoice Form", invoice_id).items[0].name
+            operations = [{"op": "update", "name": row_name, "item": items[0]}]
+            incremental = count_writes(
+                create_invoice,
+                json.dumps({**base, "invoice_id": invoice_id, "operations": operations}),
+            )
+    finally:
+        frappe.db.rollback()
+
+    report = {"rows": rows, "full": dict(full), "incremental": dict(incremental)}
+    print(json.dumps(report, indent=1))
+    return report
+
+
+def count_writes(fn, *args):
+    """Count INSERT / UPDATE / DELETE statements per table issued by `fn`."""
+    writes = Counter()
+    sql = frappe.db.sql
+
+    def counting_sql(query, *sql_args, **kwargs):
+        statement = str(query).lstrip().split(None, 1)[0].lower()
+        if statement in WRITE_STATEMENTS:
+            writes[f"{statement} {table_of(str(query))}"] += 1
+        return sql(query, *sql_args, **kwargs)
+
+    with patch.object(frappe.db, "sql", counting_sql):
+        fn(*args)
+    return writes
+
+
+def table_of(query):
+    start = query.find("`tab")
+    return query[start:query.find("`", start + 1) + 1] if start >= 0 else "?"
@@ -0,0 +1,331 @@
+"""
+Load test of the invoice API with many tablets working at once, as at market
+open. Each virtual tablet logs in as a generated market-day user and replays
+a session: bootstrap, master data, then invoices built up by create_invoice
+autosaves, the draft list and a submit, with think time between the steps.
+
+    bench --site <site> execute invoice_form_vue.benchmarks.market_day.generate
+    bench --site <site> execute invoice_form_vue.benchmarks.load_test.prepare \
+        --kwargs "{'password': '<password>'}"
+    bench --site <site> execute invoice_form_vue.benchmarks.load_test.run \
+        --kwargs "{'password': '<password>', 'url': 'http://localhost:8000', 'concurrency': 50, 'duration': 120}"
+
+The report gives throughput, latency percentiles and error rates per endpoint.
+With `storm`, the daily lock job (tasks.check_lock_update_invoice_form) is run
+`storm_at` seconds in while every tablet saves at once, as when the cutoff
+hits a busy market; the report then also covers that window. The storm locks
+every open invoice on the site, so only run it on a test site.
+
+prepare gives the generated users a login, so it only runs on a site with
+developer_mode or allow_tests set, and the password is always chosen by
+whoever runs it. Needs aiohttp (a dev dependency) and a running bench.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+
+import frappe
+from frappe.utils import now_datetime, today
+from frappe.utils.password import update_password
+
+from invoice_form_vue import tasks
+from invoice_form_vue.benchmarks import market_day
+from invoice_form_vue.profiling import percentile
+
+API = "/api/method/invoice_form_vue.api."
+
+
+def prepare(password):
+    """Give the generated market-day users a password the load test logs in with."""
+    if not (frappe.conf.get("developer_mode") or frappe.conf.get("allow_tests")):
+        frappe.throw("The load test only runs on a site with developer_mode or allow_tests set")
+    if not password:
+        frappe.throw("Pass the password the load test users should get")
+
+    users = _get_users()
+    for user in users:
+        update_password(user, password)
+    frappe.db.commit()
+    return len(users)
+
+
+def run(
+    password,
+    url="http://localhost:8000",
+    concurrency=20,
+    duration=60,
+    think_time=(1, 3),
+    autosaves=5,
+    rows_per_save=3,
+    storm=False,
+    storm_at=30,
+    storm_window=10,
+    seed=42,
+):
+    """
+    Replay tablet sessions for `duration` seconds with `concurrency` tablets,
+    pausing a random `think_time` (min, max seconds) between steps. Each invoice
+    is saved `autosaves` times, adding `rows_per_save` rows each time.
+    """
+    users = _get_users()
+    if not users:
+        frappe.throw("Generate the market-day dataset first: invoice_form_vue.benchmarks.market_day.generate")
+
+    config = {
+        "url": url,
+        "site": frappe.local.site,
+        "concurrency": concurrency,
+        "duration": duration,
+        "think_time": list(think_time),
+        "autosaves": autosaves,
+        "rows_per_save": rows_per_save,
+        "storm": storm,
+        "storm_at": storm_at if storm else None,
+        "posting_date": today(),
+    }
+    report = asyncio.run(_run(config, users, password, storm_window, random.Random(seed)))
+    print(json.dumps(report, indent=1))
+    return report
+
+
+async def _run(config, users, password, storm_window, rng):
+    import aiohttp
+
+    stats = Stats()
+    storm = StormState() if config["storm"] else None
+    deadline = time.monotonic() + config["duration"]
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async def tablet(index):
+        user = users[index % len(users)]
+        async with aiohttp.ClientSession(
+            base_url=config["url"],
+            headers={"Host": config["site"]},
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+            timeout=timeout,
+        ) as session:
+            client = Client(session, stats, storm)
+            await Tablet(client, user, password, config, random.Random(rng.random())).run(deadline)
+
+    started = time.monotonic()
+    tasks_ = [asyncio.create_task(tablet(i)) for i in range(config["concurrency"])]
+    if storm:
+        tasks_.append(asyncio.create_task(_cutoff_storm(storm, config, storm_window)))
+    await asyncio.gather(*tasks_)
+    elapsed = time.monotonic() - started
+
+    report = {"config": config, **stats.summary(elapsed)}
+    if storm:
+        report["storm"] = storm.summary()
+    return report
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def add(self, endpoint, elapsed_ms, ok):
+        self.latencies[endpoint].append(elapsed_ms)
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": self.errors[endpoint],
+                "error_rate": round(self.errors[endpoint] / len(values), 4),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(values[-1], 1),
+            }
+        requests = sum(len(values) for values in self.latencies.values())
+        errors = sum(self.errors.values())
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0,
+            "throughput_rps": round(requests / elapsed, 1) if elapsed else 0,
+            "endpoints": endpoints,
+        }
+
+
+class Client:
+    """Times every request into Stats, and into the storm window while it is open."""
+
+    def __init__(self, session, stats, storm=None):
+        self.session = session
+        self.stats = stats
+        self.storm = storm
+
+    async def call(self, endpoint, method="GET", **kwargs):
+        path = endpoint if endpoint.startswith("/") else API + endpoint
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method, path, **kwargs) as response:
+                body = await response.read()
+                ok = response.status < 400
+        except Exception:
+            body, ok = None, False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self.stats.add(endpoint, elapsed_ms, ok)
+        if self.storm and self.storm.is_open():
+            self.storm.stats.add(endpoint, elapsed_ms, ok)
+        if not ok or not body:
+            return None
+        try:
+            return json.loads(body).get("message")
+        except ValueError:
+            return None
+
+
+class Tablet:
+    """One pamper user's session, replayed until the deadline."""
+
+    def __init__(self, client, user, password, config, rng):
+        self.client = client
+        self.user = user
+        self.password = password
+        self.config = config
+        self.rng = rng
+
+    async def run(self, deadline):
+        login = await self.client.call("/api/method/login", "POST", json={"usr": self.user, "pwd": self.password})
+        if login is None:
+            return
+
+        await self.client.call("get_bootstrap")
+        master = await self.client.call("get_suppliers_and_customers") or {}
+        suppliers = [row["name"] for row in master.get("suppliers") or []]
+        customers = [row["name"] for row in master.get("customers") or []]
+        items = [row["name"] for row in master.get("items") or []]
+        if not (suppliers and customers and items):
+            return
+
+        while time.monotonic() < deadline:
+            await self.invoice(suppliers, customers, items, deadline)
+            await self.client.call("get_draft_invoice_form")
+            await self.think()
+
+    async def invoice(self, suppliers, customers, items, deadline):
+        supplier = self.rng.choice(suppliers)
+        customer = self.rng.choice(customers)
+        payload = {
+            "supplier": supplier,
+            "customer": customer,
+            "posting_date": self.config["posting_date"],
+            "idempotency_key": frappe.generate_hash(length=20),
+            "items": [],
+        }
+        invoice_name = None
+        for _ in range(self.config["autosaves"]):
+            rows = [self.row(customers, items) for _ in range(self.config["rows_per_save"])]
+            if invoice_name:
+                data = {**payload, "invoice_id": invoice_name, "operations": [{"op": "add", "item": row} for row in rows]}
+            else:
+                data = {**payload, "items": rows}
+            response = await self.save(data)
+            invoice_name = (response or {}).get("invoice_name") or invoice_name
+            if time.monotonic() >= deadline:
+                return
+            await self.think()
+
+        if invoice_name:
+            await self.client.call("remove_from_invoice", "POST", json={"invoice_name": invoice_name})
+
+    async def save(self, data):
+        return await self.client.call("create_invoice", "POST", json={"invoice_data": json.dumps(data)})
+
+    def row(self, customers, items):
+        return {
+            "item": self.rng.choice(items),
+            "qty": self.rng.randint(1, 20),
+            "rate": round(self.rng.uniform(5, 60), 2),
+            "customer": self.rng.choice(customers),
+        }
+
+    async def think(self):
+        delay = self.rng.uniform(*self.config["think_time"])
+        storm = self.client.storm
+        if storm and not storm.rush.is_set():
+            # Everyone saves at once when the cutoff hits
+            try:
+                await asyncio.wait_for(storm.rush.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(delay)
+
+
+class StormState:
+    def __init__(self):
+        self.stats = Stats()
+        self.rush = asyncio.Event()
+        self.opened = None
+        self.closed = None
+        self.lock_job_ms = None
+        self.lock_job_error = None
+
+    def is_open(self):
+        return self.opened is not None and self.closed is None
+
+    def summary(self):
+        summary = self.stats.summary((self.closed or time.monotonic()) - (self.opened or time.monotonic()))
+        return {"lock_job_ms": self.lock_job_ms, "lock_job_error": self.lock_job_error, **summary}
+
+
+async def _cutoff_storm(storm, config, window):
+    """Run the daily lock at `storm_at` and record the API for `window` seconds around it."""
+    await asyncio.sleep(config["storm_at"])
+    storm.opened = time.monotonic()
+    storm.rush.set()
+
+    # Past the cutoff on a day that has not been locked yet
+    previous_lock_date = frappe.db.get_global(tasks.LAST_LOCK_DATE_KEY)
+    previous_cutoff = frappe.db.get_single_value("Invoice Form Permission", "can_not_edit_after")
+    frappe.db.set_global(tasks.LAST_LOCK_DATE_KEY, None)
+    frappe.db.set_single_value("Invoice Form Permission", "can_not_edit_after", now_datetime().strftime("%H:%M:%S"))
+    frappe.db.commit()
+
+    # The job runs in its own thread and connection, like a scheduler worker,
+    # while the tablets keep hitting the API
+    thread = threading.Thread(target=_run_lock_job, args=(config["site"], storm), daemon=True)
+    started = time.perf_counter()
+    thread.start()
+    while thread.is_alive():
+        await asyncio.sleep(0.05)
+    storm.lock_job_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    await asyncio.sleep(window)
+    storm.closed = time.monotonic()
+
+    frappe.db.set_global(tasks.LAST_LOCK_DATE_KEY, previous_lock_date)
+    frappe.db.set_single_value("Invoice Form Permission", "can_not_edit_after", previous_cutoff)
+    frappe.db.commit()
+
+
+def _run_lock_job(site, storm):
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        tasks.check_lock_update_invoice_form()
+    except Exception as e:
+        storm.lock_job_error = repr(e)
+    finally:
+        frappe.destroy()
+
+
+def _get_users():
+    return frappe.get_all(
+        "User", filters={"name": ["like", f"%@{market_day.USER_DOMAIN}"], "enabled": 1}, pluck="name", order_by="name asc"
+    )
@@ -0,0 +1,297 @@
+"""
+Synthetic market-day dataset for benchmarks and query-budget tests.
+
+    bench --site <site> execute invoice_form_vue.benchmarks.market_day.generate \
+        --kwargs "{'invoices': 20000}"
+    bench --site <site> execute invoice_form_vue.benchmarks.market_day.clear
+
+Rows are written with bulk inserts (no controllers run), all named with the
+MKT- prefix so `clear` can remove them again. Use a dedicated benchmark site.
+"""
+
+import random
+
+import frappe
+from frappe.utils import add_to_date, get_datetime, now_datetime, today
+
+from invoice_form_vue import dashboard, master_data, permissions, rollup
+
+PREFIX = "MKT-"
+USER_DOMAIN = "market-day.example.com"
+CHUNK_SIZE = 500
+# What a tablet user has: the stock roles that read parties and items and
+# write Invoice Forms. Sites that use a role of their own pass it as `roles`.
+TABLET_ROLES = ("Sales User", "Purchase User")
+
+
+def generate(
+    farmers=3000,
+    customers=3000,
+    items=60,
+    invoices=20000,
+    min_rows=20,
+    max_rows=100,
+    users=60,
+    pampers=10,
+    seed=42,
+    commit=True,
+    roles=TABLET_ROLES,
+):
+    """
+    Build a market day: farmers (suppliers), customers, items, users with
+    `roles` and Invoice Form Permission rows spread over `pampers`, and
+    `invoices` Invoice Forms of `min_rows`-`max_rows` items posted today.
+    The users are tablet users, not System Managers, so the pamper and
+    permission scoping is part of what gets measured.
+
+    Returns:
+        dict: names of the generated records, for the benchmark suite
+    """
+    rng = random.Random(seed)
+    now = now_datetime()
+
+    supplier_names = _insert_parties("Supplier", "supplier_name", farmers, now, {
+        "is_farmer": 1,
+        "supplier_group": frappe.db.get_value("Supplier Group", {"is_group": 0}),
+    })
+    customer_names = _insert_parties("Customer", "customer_name", customers, now, {
+        "is_customer": 1,
+        "is_frozen": 0,
+        "customer_group": frappe.db.get_value("Customer Group", {"is_group": 0}),
+        "territory": frappe.db.get_value("Territory", {"is_group": 0}),
+    })
+    item_codes = _insert_parties("Item", "item_name", items, now, {
+        "is_agriculture_item": 1,
+        "commission_item": 0,
+        "item_group": frappe.db.get_value("Item Group", {"is_group": 0}),
+        "stock_uom": frappe.db.get_value("UOM", {}),
+    }, name_field="item_code")
+
+    pamper_names = customer_names[:pampers]
+    user_pampers = _insert_users(users, pamper_names, roles, now)
+
+    invoice_names = _insert_invoices(
+        rng, 0, invoices, min_rows, max_rows, now, supplier_names, customer_names, item_codes, user_pampers
+    )
+    # Bulk inserts skip the doc_events that keep the rollup current
+    rollup.rebuild_rollup(today(), today(), commit=False)
+
+    if commit:
+        frappe.db.commit()
+    _clear_caches()
+
+    return {
+        "suppliers": supplier_names,
+        "customers": customer_names,
+        "items": item_codes,
+        "users": list(user_pampers),
+        "invoices": invoice_names,
+    }
+
+
+def add_invoices(count, start, min_rows=20, max_rows=100, seed=42, commit=True):
+    """
+    Add `count` more Invoice Forms, numbered from `start`, to a generated
+    dataset, to see how a benchmark scales with the size of the day.
+    """
+    suppliers = _get_generated("Supplier")
+    customers = _get_generated("Customer")
+    items = _get_generated("Item")
+    user_pampers = dict(frappe.get_all(
+        "Invoice Form Permission Details",
+        filters={"user": ["like", f"%@{USER_DOMAIN}"]},
+        fields=["user", "pamper"],
+        order_by="user asc",
+        as_list=True,
+    ))
+
+    names = _insert_invoices(
+        random.Random(seed + start), start, count, min_rows, max_rows, now_datetime(),
+        suppliers, customers, items, user_pampers,
+    )
+    rollup.rebuild_rollup(today(), today(), commit=False)
+    if commit:
+        frappe.db.commit()
+    _clear_caches()
+    return names
+
+
+def clear(commit=True):
+    """Delete everything `generate` created."""
+    for doctype in ("Invoice Form Item", "Invoice Form", "Supplier", "Customer", "Item"):
+        frappe.db.delete(doctype, {"name": ["like", f"{PREFIX}%"]})
+    frappe.db.delete(rollup.DOCTYPE, {"supplier": ["like", f"{PREFIX}%"]})
+    users = frappe.get_all("User", filters={"name": ["like", f"%@{USER_DOMAIN}"]}, pluck="name")
+    if users:
+        frappe.db.delete("Has Role", {"parent": ["in", users]})
+        frappe.db.delete("Invoice Form Permission Details", {"user": ["in", users]})
+        frappe.db.delete("User", {"name": ["in", users]})
+
+    if commit:
+        frappe.db.commit()
+    _clear_caches()
+
+
+def _insert_parties(doctype, label_field, count, now, values, name_field=None):
+    meta = frappe.get_meta(doctype)
+    values = {field: value for field, value in values.items() if meta.has_field(field)}
+    prefix = f"{PREFIX}{doctype[:4].upper()}-"
+
+    names = [f"{prefix}{i:05d}" for i in range(count)]
+    rows = []
+    for i, name in enumerate(names):
+        row = {
+            "name": name,
+            label_field: f"{doctype} {i}",
+            **values,
+        }
+        if name_field:
+            row[name_field] = name
+        rows.append(row)
+
+    _bulk_insert(doctype, rows, now)
+    return names
+
+
+def _get_generated(doctype):
+    return frappe.get_all(doctype, filters={"name": ["like", f"{PREFIX}%"]}, pluck="name", order_by="name asc")
+
+
+def _insert_users(count, pamper_names, role_names, now):
+    role_names = [role for role in role_names if frappe.db.exists("Role", role)]
+    if not role_names:
+        frappe.throw("None of the tablet roles exist on this site; pass the site's own as `roles`")
+
+    user_pampers = {}
+    users, roles, details = [], [], []
+    for i in range(count):
+        user = f"mkt-user-{i:03d}@{USER_DOMAIN}"
+        pamper = pamper_names[i % len(pamper_names)] if pamper_names else None
+        user_pampers[user] = pamper
+        users.append({"name": user, "email": user, "first_name": f"Market {i}", "enabled": 1, "user_type": "System User"})
+        roles.extend({
+            "name": f"{PREFIX}ROLE-{i:03d}-{j}",
+            "parent": user,
+            "parenttype": "User",
+            "parentfield": "roles",
+            "idx": j + 1,
+            "role": role,
+        } for j, role in enumerate(role_names))
+        details.append({
+            "name": f"{PREFIX}PERM-{i:03d}",
+            "parent": "Invoice Form Permission",
+            "parenttype": "Invoice Form Permission",
+            "parentfield": "invoice_form_permission_details",
+            "idx": 1000 + i,
+            "user": user,
+            "login": 1,
+            "delete_invoice": 1,
+            "submit_invoice": 1,
+            "update_draft_invoice": 1,
+            "update_submitted_invoice": i % 2,
+            "show_drafts": 1,
+            "show_submitted": i % 3 == 0,
+            "pamper": pamper,
+        })
+
+    _bulk_insert("User", users, now)
+    _bulk_insert("Has Role", roles, now)
+    _bulk_insert("Invoice Form Permission Details", details, now)
+    return user_pampers
+
+
+def _insert_invoices(rng, start, count, min_rows, max_rows, now, suppliers, customers, item_codes, user_pampers):
+    invoice_meta = frappe.get_meta("Invoice Form")
+    item_meta = frappe.get_meta("Invoice Form Item")
+    users = list(user_pampers)
+    day_start = get_datetime(f"{today()} 05:00:00")
+    seconds = max(int((now - day_start).total_seconds()), count)
+
+    names = []
+    invoices, rows = [], []
+    for i in range(start, start + count):
+        name = f"{PREFIX}INV-{i:06d}"
+        owner = rng.choice(users)
+        supplier = rng.choice(suppliers)
+        customer = rng.choice(customers)
+        modified = add_to_date(day_start, seconds=rng.randrange(seconds))
+
+        # Most of the day's invoices are submitted by closing time
+        state = rng.random()
+        docstatus, is_draft = (1, 0) if state < 0.75 else (0, 1) if state < 0.9 else (0, 0)
+
+        items = []
+        for j in range(rng.randint(min_rows, max_rows)):
+            qty = rng.randint(1, 50)
+            price = rng.randint(5, 400)
+            items.append({
+                "name": f"{name}-{j:03d}",
+                "parent": name,
+                "parenttype": "Invoice Form",
+                "parentfield": "items",
+                "idx": j + 1,
+                "item_code": rng.choice(item_codes),
+                "qty": qty,
+                "price": price,
+                "total": qty * price,
+                "customer": rng.choice(customers),
+                "pamper": user_pampers[owner],
+                "docstatus": docstatus,
+                "owner": owner,
+                "creation": modified,
+                "modified": modified,
+            })
+
+        invoices.append({
+            "name": name,
+            "supplier": supplier,
+            "supplier_name": supplier,
+            "customer": customer,
+            "customer_name": customer,
+            "posting_date": today(),
+            "pamper": user_pampers[owner],
+            "docstatus": docstatus,
+            "is_draft": is_draft,
+            "lock_update": docstatus,
+            "owner": owner,
+            "creation": modified,
+            "modified": modified,
+        })
+        rows.extend(_only_fields(item_meta, item) for item in items)
+        names.append(name)
+
+        if len(invoices) >= CHUNK_SIZE:
+            _bulk_insert("Invoice Form", [_only_fields(invoice_meta, invoice) for invoice in invoices], now)
+            _bulk_insert("Invoice Form Item", rows, now)
+            invoices, rows = [], []
+
+    _bulk_insert("Invoice Form", [_only_fields(invoice_meta, invoice) for invoice in invoices], now)
+    _bulk_insert("Invoice Form Item", rows, now)
+    return names
+
+
+def _only_fields(meta, row):
+    # Custom fields may not be installed on every site
+    return {
+        field: value for field, value in row.items()
+        if field in frappe.model.default_fields or meta.has_field(field)
+    }
+
+
+def _bulk_insert(doctype, rows, now):
+    if not rows:
+        return
+    for row in rows:
+        row.setdefault("owner", "Administrator")
+        row.setdefault("creation", now)
+        row.setdefault("modified", now)
+        row.setdefault("modified_by", row["owner"])
+    fields = list(rows[0])
+    frappe.db.bulk_insert(doctype, fields, [[row.get(field) for field in fields] for row in rows])
+
+
+def _clear_caches():
+    permissions.clear_permission_cache()
+    # A new version makes every client and the search indexes reload
+    frappe.cache().delete_value([master_data.VERSION_KEY, master_data.MASTER_DATA_KEY])
+    dashboard.reconcile_dashboard_counts()
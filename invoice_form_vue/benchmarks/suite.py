@@ -0,0 +1,296 @@
+"""
+Latency and SQL query count of every api.py endpoint and tasks.py job,
+checked against the baselines stored in baselines.json.
+
+    bench --site <site> execute invoice_form_vue.benchmarks.market_day.generate
+    bench --site <site> execute invoice_form_vue.benchmarks.suite.run
+    bench --site <site> execute invoice_form_vue.benchmarks.suite.run --kwargs "{'update_baselines': True}"
+
+Each case runs as a generated market-day user, every round inside a savepoint
+that is rolled back, so writes leave the dataset untouched. The first round
+warms the caches and is not counted. A case regresses when it runs more
+queries than its baseline, or when its p50 latency exceeds the baseline by
+more than LATENCY_TOLERANCE (plus LATENCY_SLACK_MS for very fast cases).
+Cases without a baseline are listed in the report as missing_baselines.
+"""
+
+import json
+import os
+import statistics
+from contextlib import contextmanager
+from time import perf_counter
+from unittest.mock import patch
+
+import frappe
+from frappe.utils import get_datetime, today
+
+from invoice_form_vue import api, master_data, tasks
+from invoice_form_vue.benchmarks import market_day
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+LATENCY_TOLERANCE = 0.5
+LATENCY_SLACK_MS = 5
+
+
+class BenchmarkRegression(Exception):
+    pass
+
+
+def run(rounds=10, update_baselines=False, cases=None):
+    """
+    Run the benchmark cases (all of CASES by default) and compare them with
+    the stored baselines.
+
+    Raises BenchmarkRegression listing the regressed cases, unless
+    `update_baselines` is set, in which case the results become the baselines.
+    """
+    results = measure_all(rounds, cases)
+    baselines = load_baselines()
+    regressions = compare(results, baselines)
+
+    report = {
+        "results": results,
+        "regressions": regressions,
+        "missing_baselines": sorted(set(results) - set(baselines)),
+    }
+    print(json.dumps(report, indent=1))
+
+    if update_baselines:
+        baselines.update(results)
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(baselines, f, indent=1, sort_keys=True)
+            f.write("\n")
+    elif regressions:
+        raise BenchmarkRegression("\n".join(regressions))
+
+    return report
+
+
+def measure_all(rounds=10, cases=None):
+    """Return {case: {"queries", "p50_ms", "p95_ms"}} for the selected cases."""
+    context = get_context()
+    results = {}
+    # Queries are counted on the primary connection, so reads stay off the replica
+    with as_user(context.user), patch.object(frappe.db, "commit"), patch.dict(frappe.conf, {"read_from_replica": 0}):
+        for name in cases or CASES:
+            results[name] = measure(CASES[name], context, rounds)
+    return results
+
+
+def measure(case, context, rounds=10):
+    """Run one case `rounds` times after a warm-up round."""
+    timings, queries = [], []
+    for round_ in range(rounds + 1):
+        frappe.db.savepoint("benchmark")
+        try:
+            call = case(context)
+            with patch.object(frappe.db, "sql", wraps=frappe.db.sql) as sql:
+                start = perf_counter()
+                call()
+                elapsed = perf_counter() - start
+        finally:
+            frappe.db.rollback(save_point="benchmark")
+
+        if round_:
+            timings.append(elapsed * 1000)
+            queries.append(sql.call_count)
+
+    timings.sort()
+    return {
+        "queries": max(queries),
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)], 2),
+    }
+
+
+def compare(results, baselines):
+    """Describe every case that regressed against its baseline."""
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if not baseline:
+            continue
+        if result["queries"] > baseline["queries"]:
+            regressions.append(f"{name}: {result['queries']} queries, baseline {baseline['queries']}")
+        limit = baseline["p50_ms"] * (1 + LATENCY_TOLERANCE) + LATENCY_SLACK_MS
+        if result["p50_ms"] > limit:
+            regressions.append(f"{name}: p50 {result['p50_ms']} ms, baseline {baseline['p50_ms']} ms")
+    return regressions
+
+
+def load_baselines():
+    if not os.path.exists(BASELINES_PATH):
+        return {}
+    with open(BASELINES_PATH) as f:
+        return json.load(f)
+
+
+def get_context():
+    """Records of the generated market day the cases work on."""
+    user = frappe.db.get_value(
+        "User", {"name": ["like", f"%@{market_day.USER_DOMAIN}"]}, "name", order_by="name asc"
+    )
+    if not user:
+        frappe.throw("Generate the market-day dataset first: invoice_form_vue.benchmarks.market_day.generate")
+
+    drafts = frappe.get_all(
+        "Invoice Form",
+        filters={"owner": user, "docstatus": 0, "is_draft": 1},
+        pluck="name",
+        order_by="modified desc",
+        limit=1,
+    )
+    return frappe._dict(
+        user=user,
+        draft=drafts[0] if drafts else None,
+        supplier=frappe.db.get_value("Supplier", {"name": ["like", f"{market_day.PREFIX}%"]}),
+        customers=frappe.get_all(
+            "Customer", filters={"name": ["like", f"{market_day.PREFIX}%"]}, pluck="name", limit=20
+        ),
+        item=frappe.db.get_value("Item", {"name": ["like", f"{market_day.PREFIX}%"]}),
+    )
+
+
+@contextmanager
+def as_user(user):
+    previous = frappe.session.user
+    frappe.set_user(user)
+    try:
+        yield
+    finally:
+        frappe.set_user(previous)
+
+
+def invoice_payload(context, rows, **extra):
+    return {
+        "supplier": context.supplier,
+        "customer": context.customers[0],
+        "posting_date": today(),
+        "items": [
+            {"item": context.item, "qty": 1 + i % 5, "rate": 10 + i, "customer": context.customers[i % len(context.customers)]}
+            for i in range(rows)
+        ],
+        **extra,
+    }
+
+
+# Each case prepares its arguments and returns the call that is measured
+
+def _get_master_data(context):
+    frappe.cache().delete_value(master_data.MASTER_DATA_KEY)
+    return lambda: api.get_suppliers_and_customers()
+
+
+def _get_master_data_unchanged(context):
+    version = master_data.get_user_version()
+    return lambda: api.get_suppliers_and_customers(since=version)
+
+
+def _search_master_data(context):
+    return lambda: api.search_master_data("customers", "cust", 10)
+
+
+def _create_invoice(context):
+    payload = json.dumps(invoice_payload(context, 60))
+    return lambda: api.create_invoice(payload)
+
+
+def _update_invoice_row(context):
+    doc = frappe.get_doc("Invoice Form", context.draft)
+    row = doc.items[0]
+    operation = {"op": "update", "name": row.name, "item": {"item": row.item_code, "qty": row.qty + 1, "rate": row.price, "customer": row.customer}}
+    payload = json.dumps({
+        "supplier": doc.supplier,
+        "customer": doc.customer,
+        "posting_date": today(),
+        "invoice_id": doc.name,
+        "operations": [operation],
+    })
+    return lambda: api.create_invoice(payload)
+
+
+def _create_invoices_bulk(context):
+    invoices = [
+        invoice_payload(context, 20, idempotency_key=frappe.generate_hash(length=20)) for _i in range(20)
+    ]
+    return lambda: api.create_invoices_bulk(json.dumps(invoices))
+
+
+def _get_invoice(context):
+    return lambda: api.get_invoice(context.draft)
+
+
+def _delete_invoice(context):
+    return lambda: api.delete_invoice(context.draft)
+
+
+def _remove_from_invoice(context):
+    return lambda: api.remove_from_invoice(context.draft)
+
+
+def _get_draft_invoice_form(context):
+    return lambda: api.get_draft_invoice_form()
+
+
+def _get_draft_invoice_form_next_page(context):
+    cursor = json.dumps(api.get_draft_invoice_form()["next_cursor"])
+    return lambda: api.get_draft_invoice_form(cursor=cursor)
+
+
+def _get_dashboard_data(context):
+    return lambda: api.get_dashboard_data()
+
+
+def _get_bootstrap(context):
+    return lambda: api.get_bootstrap()
+
+
+def _get_app_translations(context):
+    return lambda: api.get_app_translations()
+
+
+def _set_user_language(context):
+    return lambda: api.set_user_language("en")
+
+
+def _check_user_permission(context):
+    return lambda: api.check_user_permission(context.user)
+
+
+def _get_endpoint_stats(context):
+    return lambda: api.get_endpoint_stats()
+
+
+def _lock_update(context):
+    # Past the cutoff on a day that has not been locked yet
+    frappe.db.set_global(tasks.LAST_LOCK_DATE_KEY, None)
+    frappe.db.set_single_value("Invoice Form Permission", "can_not_edit_after", "00:00:00")
+    now = get_datetime(f"{today()} 23:59:00")
+
+    def call():
+        with patch.object(tasks, "now_datetime", return_value=now):
+            tasks.check_lock_update_invoice_form()
+
+    return call
+
+
+CASES = {
+    "get_suppliers_and_customers": _get_master_data,
+    "get_suppliers_and_customers:unchanged": _get_master_data_unchanged,
+    "search_master_data": _search_master_data,
+    "create_invoice": _create_invoice,
+    "create_invoice:row_update": _update_invoice_row,
+    "create_invoices_bulk": _create_invoices_bulk,
+    "get_invoice": _get_invoice,
+    "delete_invoice": _delete_invoice,
+    "remove_from_invoice": _remove_from_invoice,
+    "get_draft_invoice_form": _get_draft_invoice_form,
+    "get_draft_invoice_form:next_page": _get_draft_invoice_form_next_page,
+    "get_dashboard_data": _get_dashboard_data,
+    "get_bootstrap": _get_bootstrap,
+    "get_app_translations": _get_app_translations,
+    "set_user_language": _set_user_language,
+    "check_user_permission": _check_user_permission,
+    "get_endpoint_stats": _get_endpoint_stats,
+    "check_lock_update_invoice_form": _lock_update,
+}
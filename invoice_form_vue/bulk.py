@@ -0,0 +1,101 @@
+import frappe
+from frappe import _
+from frappe.utils import today
+
+from invoice_form_vue import audit, permissions, realtime, replica
+
+CHUNK_SIZE = 20
+
+# action -> (Invoice Form Permission Details flag, doctype permission type)
+ACTIONS = {
+    "submit": ("submit_invoice", "write"),
+    "delete": ("delete_invoice", "delete"),
+    "lock": ("submit_invoice", "write"),
+}
+
+
+def enqueue_bulk_action(action, invoice_names=None, all_drafts=False):
+    """
+    Check permissions once and queue `action` on the invoices.
+
+    With `all_drafts`, acts on the session user's drafts posted today instead
+    of `invoice_names`.
+
+    Returns:
+        dict: {"progress_id", "total"}; progress is published to the user as
+        realtime.BULK_EVENT messages carrying the same progress_id
+    """
+    if action not in ACTIONS:
+        frappe.throw(_("Unknown bulk action: {0}").format(action))
+
+    flag, ptype = ACTIONS[action]
+    if not permissions.get_user_permission().get(flag):
+        frappe.throw(_("Not permitted"), frappe.PermissionError)
+    frappe.has_permission("Invoice Form", ptype, throw=True)
+
+    filters = {"docstatus": 0}
+    if all_drafts:
+        filters.update({"owner": frappe.session.user, "is_draft": 1, "posting_date": today()})
+    else:
+        filters["name"] = ["in", list(invoice_names or []) or [""]]
+    if action == "lock":
+        filters["lock_update"] = 0
+    names = frappe.get_list("Invoice Form", filters=filters, pluck="name", order_by="modified asc")
+
+    progress_id = frappe.generate_hash(length=12)
+    if names:
+        frappe.enqueue(
+            "invoice_form_vue.bulk.run_bulk_action",
+            queue="long",
+            enqueue_after_commit=True,
+            action=action,
+            invoice_names=names,
+            user=frappe.session.user,
+            progress_id=progress_id,
+        )
+    return {"progress_id": progress_id, "total": len(names)}
+
+
+def run_bulk_action(action, invoice_names, user, progress_id, chunk_size=CHUNK_SIZE):
+    """Background job: apply `action` to the invoices, one transaction per chunk."""
+    frappe.set_user(user)
+    total = len(invoice_names)
+    done = 0
+
+    for start in range(0, total, chunk_size):
+        chunk = invoice_names[start:start + chunk_size]
+        if action == "lock":
+            # A single UPDATE, like the daily lock
+            frappe.db.set_value("Invoice Form", {"name": ["in", chunk]}, "lock_update", 1)
+            replica.mark_recent_write(user)
+            results = [{"name": name, "status": "done"} for name in chunk]
+        else:
+            results = [_apply(action, name) for name in chunk]
+        frappe.db.commit()
+
+        done += len(chunk)
+        realtime.publish_bulk_progress(user, {
+            "progress_id": progress_id,
+            "action": action,
+            "done": done,
+            "total": total,
+            "results": results,
+        })
+
+
+def _apply(action, invoice_name):
+    frappe.db.savepoint("bulk_action")
+    try:
+        if action == "delete":
+            frappe.delete_doc("Invoice Form", invoice_name)
+        else:
+            doc = frappe.get_doc("Invoice Form", invoice_name)
+            doc.is_draft = 0
+            doc.save()
+            audit.record("submit", doc)
+    except Exception:
+        frappe.db.rollback(save_point="bulk_action")
+        frappe.clear_messages()
+        frappe.log_error(title=f"❌ Bulk {action} failed for {invoice_name}", message=frappe.get_traceback())
+        return {"name": invoice_name, "status": "error"}
+    return {"name": invoice_name, "status": "done"}
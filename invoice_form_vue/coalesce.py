@@ -0,0 +1,199 @@
+"""
+Coalescing of concurrent create_invoice calls for the same invoice.
+
+A double tap, or an autosave racing a manual save, sends several saves of one
+invoice within a moment. Saves are scoped to the user and the invoice (its
+name, or the client's idempotency key while it is new):
+
+- a full snapshot identical to the last one answered for the scope, with no
+  save in flight, returns that answer without writing. Row operations are
+  never answered this way: adding the same row twice means two rows;
+- the first save takes a short-lived Redis lock and writes;
+- saves arriving while the lock is held are queued in Redis and wait. When the
+  holder finishes its write, it merges everything queued into one more write
+  and answers all the waiters with the result. A save still queued after
+  WAIT_SECONDS is taken back and answered 409, and the client sends it again,
+  so waiting never ties up a worker for longer than about one save. Waiters
+  whose merged write failed are answered 409 too, so their retries go through
+  the lock one at a time.
+
+Payloads are either full snapshots of the form or row operations. A snapshot
+replaces everything queued before it, and consecutive operation payloads are
+concatenated, so the merged write leaves the invoice as the saves would have
+one after the other.
+"""
+
+import hashlib
+import json
+import time
+
+import frappe
+from frappe import _
+from redis.exceptions import LockError
+
+KEY_PREFIX = "invoice_form_vue:coalesce"
+# Longer than any save; a crashed holder frees the scope after this
+LOCK_SECONDS = 30
+# How long the last answer of a scope can be reused for an identical save
+RESULT_SECONDS = 10
+# How long a queued save waits for the holder to pick it up: about one save
+WAIT_SECONDS = 2
+POLL_INTERVAL = 0.05
+
+
+class SaveInProgress(frappe.ValidationError):
+    http_status_code = 409
+
+
+def coalesce_save(data, save):
+    """
+    Save `data` through `save(data)` (which writes, commits and returns the
+    response), coalesced with concurrent saves of the same invoice.
+    """
+    cache = frappe.cache()
+    scope = get_scope(data)
+    keys = {name: cache.make_key(f"{KEY_PREFIX}:{name}:{scope}") for name in ("lock", "queue", "result", "seq")}
+    payload_hash = get_payload_hash(data)
+    lock = cache.lock(keys["lock"], timeout=LOCK_SECONDS)
+
+    if lock.acquire(blocking=False):
+        result = _get_json(cache, keys["result"])
+        if "operations" not in data and result and result.get("hash") == payload_hash:
+            _release(lock)
+            return result["response"]
+        seq = cache.incr(keys["seq"])
+        cache.expire(keys["seq"], LOCK_SECONDS)
+        return _write_as_holder(cache, keys, lock, [{"seq": seq, "hash": payload_hash, "data": data}], save, seq)
+
+    # A save is in flight: queue this one and wait for the write that includes it
+    seq = cache.incr(keys["seq"])
+    entry = json.dumps({"seq": seq, "hash": payload_hash, "data": data})
+    pipeline = cache.pipeline()
+    pipeline.expire(keys["seq"], LOCK_SECONDS)
+    pipeline.rpush(keys["queue"], entry)
+    pipeline.expire(keys["queue"], LOCK_SECONDS)
+    pipeline.execute()
+
+    deadline = time.monotonic() + WAIT_SECONDS
+    while True:
+        result = _get_result(cache, keys, seq)
+        if result:
+            if result.get("failed") and seq >= result["failed_from"]:
+                # The merged write failed. Retrying here would race the other waiters
+                # outside the lock; the client resends and goes through it instead.
+                raise SaveInProgress(_("Another save of this invoice failed, please try again"))
+            return result["response"]
+        if lock.acquire(blocking=False):
+            # The holder left before reaching this save, or just finished with it
+            response = _write_as_holder(cache, keys, lock, [], save, seq)
+            if response is not None:
+                return response
+            if not _get_result(cache, keys, seq):
+                # Taken from the queue by a holder that died before answering
+                raise SaveInProgress(_("Another save of this invoice is in progress, please try again"))
+            continue
+        if time.monotonic() >= deadline and cache.lrem(keys["queue"], 1, entry):
+            # Not picked up yet: the client retries rather than keep this worker waiting.
+            # Once the holder has taken it, its write is under way and is waited for.
+            raise SaveInProgress(_("Another save of this invoice is in progress, please try again"))
+        time.sleep(POLL_INTERVAL)
+
+
+def get_scope(data):
+    user = frappe.session.user
+    if data.get("invoice_id"):
+        return f"{user}:{data['invoice_id']}"
+    return f"{user}:new:{data.get('idempotency_key') or ''}"
+
+
+def get_payload_hash(data):
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def merge_payloads(entries):
+    """
+    Merge queued saves (in seq order) into as few payloads as keep their
+    combined effect. Returns a list of (first seq, last seq, hash, data), where
+    the seqs bound the saves each payload covers.
+    """
+    writes = []
+    for entry in entries:
+        data = entry["data"]
+        if "operations" not in data:
+            # A full snapshot already holds everything queued before it
+            first_seq = writes[0][0] if writes else entry["seq"]
+            writes = [[first_seq, entry["seq"], data]]
+        elif writes and "operations" in writes[-1][2]:
+            merged = {**data, "operations": writes[-1][2]["operations"] + data["operations"]}
+            writes[-1] = [writes[-1][0], entry["seq"], merged]
+        else:
+            writes.append([entry["seq"], entry["seq"], data])
+    return [(first_seq, seq, get_payload_hash(data), data) for first_seq, seq, data in writes]
+
+
+def _write_as_holder(cache, keys, lock, entries, save, own_seq):
+    """
+    Write `entries` and whatever gets queued meanwhile, then free the scope.
+    Returns the last response, or None when there was nothing to write.
+    """
+    response = None
+    last_hash = None
+    try:
+        while True:
+            pipeline = cache.pipeline()
+            pipeline.lrange(keys["queue"], 0, -1)
+            pipeline.delete(keys["queue"])
+            queued, _deleted = pipeline.execute()
+            entries = entries + [json.loads(entry) for entry in queued]
+            if not entries:
+                break
+
+            entries.sort(key=lambda entry: entry["seq"])
+            for first_seq, seq, payload_hash, data in merge_payloads(entries):
+                # Writing an unchanged snapshot again would change nothing
+                if "operations" in data or payload_hash != last_hash:
+                    try:
+                        response = save(data)
+                    except Exception:
+                        # Only the saves from this write on failed; those before it are committed.
+                        # Their waiters answer 409 and the clients resend them.
+                        _set_json(
+                            cache,
+                            keys["result"],
+                            {"seq": entries[-1]["seq"], "failed": True, "failed_from": first_seq, "response": response},
+                        )
+                        if own_seq >= first_seq:
+                            # This request's own save failed: its caller handles the error
+                            raise
+                        frappe.db.rollback()
+                        frappe.clear_messages()
+                        return response
+                    last_hash = payload_hash
+                _set_json(cache, keys["result"], {"seq": seq, "hash": payload_hash, "response": response})
+            entries = []
+    finally:
+        _release(lock)
+    return response
+
+
+def _get_result(cache, keys, seq):
+    """The last result of the scope, when it covers the save numbered `seq`."""
+    result = _get_json(cache, keys["result"])
+    return result if result and result["seq"] >= seq else None
+
+
+def _get_json(cache, key):
+    value = cache.get(key)
+    return json.loads(value) if value else None
+
+
+def _set_json(cache, key, value):
+    cache.set(key, json.dumps(value, default=str), ex=RESULT_SECONDS)
+
+
+def _release(lock):
+    try:
+        lock.release()
+    except LockError:
+        # Expired while saving; another request may already hold the scope
+        pass
@@ -0,0 +1,22 @@
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("rebuild-invoice-form-rollup")
+@click.option("--from-date", help="First posting date to rebuild (default: all)")
+@click.option("--to-date", help="Last posting date to rebuild (default: all)")
+@pass_context
+def rebuild_invoice_form_rollup(context, from_date=None, to_date=None):
+    """Recompute Invoice Form Daily Rollup from the invoice item rows."""
+    from invoice_form_vue.rollup import rebuild_rollup
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        rebuild_rollup(from_date, to_date)
+    finally:
+        frappe.destroy()
+
+
+commands = [rebuild_invoice_form_rollup]
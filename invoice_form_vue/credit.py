@@ -0,0 +1,213 @@
+import json
+from functools import partial
+
+import frappe
+from frappe import _
+from frappe.query_builder.functions import Sum
+from frappe.utils import cint, flt
+
+from invoice_form_vue import loaders, profiling, realtime
+
+# Redis hash of customer -> {company: exposure}
+CACHE_KEY = "invoice_form_vue:credit_exposure"
+# Saves refused by the credit check, kept for the user to review; one Redis key per user and invoice
+HOLD_KEY = "invoice_form_vue:credit_hold"
+# As long as the service worker keeps a queued save
+HOLD_SECONDS = 24 * 60 * 60
+
+
+class CreditLimitExceeded(frappe.ValidationError):
+    def __init__(self, violations):
+        super().__init__(_("Credit Limit Exceeded"))
+        self.violations = violations
+
+
+def get_default_company():
+    return frappe.defaults.get_user_default("Company") or frappe.db.get_single_value(
+        "Global Defaults", "default_company"
+    )
+
+
+def get_customer_totals(items):
+    """Sum item totals per customer for Invoice Form Item rows."""
+    totals = {}
+    for item in items:
+        if item.customer:
+            totals[item.customer] = totals.get(item.customer, 0) + flt(item.total)
+    return totals
+
+
+def get_exposures(customers, company):
+    """
+    Return {customer: exposure} for `customers` in `company`, where exposure is
+    {"credit_limit", "bypass", "outstanding", "draft_amount"}. Cached per customer
+    until a ledger entry, credit limit or Invoice Form touches that customer.
+    """
+    customers = list({customer for customer in customers if customer})
+    exposures = {}
+    missing = []
+    for customer in customers:
+        cached = frappe.cache().hget(CACHE_KEY, customer) or {}
+        if company in cached:
+            exposures[customer] = cached[company]
+        else:
+            missing.append(customer)
+        profiling.record_cache(company in cached)
+
+    if missing:
+        for customer, exposure in _load_exposures(missing, company).items():
+            cached = frappe.cache().hget(CACHE_KEY, customer) or {}
+            cached[company] = exposure
+            frappe.cache().hset(CACHE_KEY, customer, cached)
+            exposures[customer] = exposure
+
+    return exposures
+
+
+def get_violations(totals, company, previous_totals=None):
+    """
+    Check the per-customer invoice `totals` against the customers' credit limits.
+
+    `previous_totals` are the amounts this invoice already had saved, which are
+    part of the cached draft amounts and must not be counted twice.
+    """
+    previous_totals = previous_totals or {}
+    violations = []
+    for customer, exposure in get_exposures(totals, company).items():
+        if exposure["bypass"] or not exposure["credit_limit"]:
+            continue
+
+        invoice_amount = flt(totals[customer])
+        draft_amount = exposure["draft_amount"] - flt(previous_totals.get(customer))
+        total_exposure = exposure["outstanding"] + draft_amount + invoice_amount
+        if total_exposure > exposure["credit_limit"]:
+            violations.append({
+                "customer": customer,
+                "customer_name": customer,
+                "credit_limit": exposure["credit_limit"],
+                "current_balance": exposure["outstanding"],
+                "draft_invoices": draft_amount,
+                "invoice_amount": invoice_amount,
+                "total_exposure": total_exposure,
+                "excess_amount": total_exposure - exposure["credit_limit"],
+            })
+
+    if violations:
+        customer_names = loaders.get_party_names(customers=totals)["Customer"]
+        for violation in violations:
+            violation["customer_name"] = customer_names.get(violation["customer"]) or violation["customer"]
+    return violations
+
+
+def check_credit_limits(doc, previous_totals=None):
+    """Raise CreditLimitExceeded if the Invoice Form pushes any customer over their limit."""
+    company = doc.get("company") or get_default_company()
+    violations = get_violations(get_customer_totals(doc.items), company, previous_totals)
+    if violations:
+        raise CreditLimitExceeded(violations)
+
+
+def hold_for_review(data, violations):
+    """
+    Keep a save refused by the credit check until the user decides on it.
+
+    A save queued offline is replayed by the service worker, where nobody sees
+    the answer; the SPA finds the hold through get_holds or the realtime event.
+    """
+    key = data.get("idempotency_key")
+    if not key:
+        return
+    hold = {"idempotency_key": key, "data": data, "violations": violations}
+    frappe.cache().set(_get_hold_key(key), json.dumps(hold, default=str), ex=HOLD_SECONDS)
+    realtime.publish_credit_limit_hold(frappe.session.user, hold)
+
+
+def get_holds(keys):
+    """The held saves of the current user for these idempotency keys."""
+    if not keys:
+        return []
+    return [json.loads(hold) for hold in frappe.cache().mget([_get_hold_key(key) for key in keys]) if hold]
+
+
+def clear_hold(key):
+    if key:
+        frappe.cache().delete(_get_hold_key(key))
+
+
+def _get_hold_key(key):
+    return frappe.cache().make_key(f"{HOLD_KEY}:{frappe.session.user}:{key}")
+
+
+def clear_customer_exposure(customers):
+    for customer in set(customers):
+        if customer:
+            frappe.cache().hdel(CACHE_KEY, customer)
+
+
+def on_gl_entry_submit(doc, method=None):
+    """doc_events hook for GL Entry (on_submit), fired for postings and their reversals."""
+    if doc.party_type == "Customer":
+        frappe.db.after_commit.add(partial(clear_customer_exposure, [doc.party]))
+
+
+def on_customer_update(doc, method=None):
+    """doc_events hook for Customer (on_update): the credit limits may have changed."""
+    frappe.db.after_commit.add(partial(clear_customer_exposure, [doc.name]))
+
+
+def on_invoice_change(doc, method=None):
+    """doc_events hook for Invoice Form (on_change / on_trash): draft amounts changed."""
+    before = doc.get_doc_before_save()
+    customers = [item.customer for item in doc.items]
+    if before:
+        customers += [item.customer for item in before.items]
+    frappe.db.after_commit.add(partial(clear_customer_exposure, customers))
+
+
+def _load_exposures(customers, company):
+    exposures = {
+        customer: {"credit_limit": 0.0, "bypass": 0, "outstanding": 0.0, "draft_amount": 0.0}
+        for customer in customers
+    }
+
+    for limit in frappe.get_all(
+        "Customer Credit Limit",
+        filters={"parenttype": "Customer", "parent": ["in", customers], "company": company},
+        fields=["parent", "credit_limit", "bypass_credit_limit_check"],
+    ):
+        exposures[limit.parent]["credit_limit"] = flt(limit.credit_limit)
+        exposures[limit.parent]["bypass"] = cint(limit.bypass_credit_limit_check)
+
+    # Ledger balance of every customer in one aggregate query
+    GLEntry = frappe.qb.DocType("GL Entry")
+    outstanding = (
+        frappe.qb.from_(GLEntry)
+        .select(GLEntry.party, Sum(GLEntry.debit - GLEntry.credit))
+        .where(GLEntry.party_type == "Customer")
+        .where(GLEntry.party.isin(customers))
+        .where(GLEntry.company == company)
+        .where(GLEntry.is_cancelled == 0)
+        .groupby(GLEntry.party)
+        .run()
+    )
+    for customer, balance in outstanding:
+        exposures[customer]["outstanding"] = flt(balance)
+
+    # Invoice Forms not posted to the ledger yet
+    Invoice = frappe.qb.DocType("Invoice Form")
+    Item = frappe.qb.DocType("Invoice Form Item")
+    drafts = (
+        frappe.qb.from_(Item)
+        .join(Invoice)
+        .on(Invoice.name == Item.parent)
+        .select(Item.customer, Sum(Item.total))
+        .where(Item.parenttype == "Invoice Form")
+        .where(Item.customer.isin(customers))
+        .where(Invoice.docstatus == 0)
+        .groupby(Item.customer)
+        .run()
+    )
+    for customer, amount in drafts:
+        exposures[customer]["draft_amount"] = flt(amount)
+
+    return exposures
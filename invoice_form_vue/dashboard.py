@@ -0,0 +1,120 @@
+from functools import partial
+
+import frappe
+from frappe.query_builder.functions import Count
+from frappe.utils import cint
+
+from invoice_form_vue import replica
+
+# Redis hash of counters: "<bucket>" for everyone and "<bucket>:<owner>" per user.
+# Integers are stored raw (not pickled) so they can be HINCRBY'd, which is why
+# it is accessed through a raw pipeline rather than the cache wrapper methods.
+COUNTS_KEY = "invoice_form_vue:dashboard_counts"
+BUCKETS = ("draft", "submitted")
+
+
+def get_counts(user=None):
+    """
+    Return the draft/submitted Invoice Form counts, overall and for `user`
+    (default: session user), from the maintained counters.
+    """
+    user = user or frappe.session.user
+    fields = ["draft", "submitted", f"draft:{user}", f"submitted:{user}"]
+    counts = _read_counters(fields) or reconcile_dashboard_counts()
+    return {
+        "draft_count": counts.get("draft", 0),
+        "submitted_count": counts.get("submitted", 0),
+        "my_draft_count": counts.get(f"draft:{user}", 0),
+        "my_submitted_count": counts.get(f"submitted:{user}", 0),
+    }
+
+
+def get_bucket(doc):
+    """Dashboard bucket an Invoice Form counts towards, or None."""
+    if not doc:
+        return None
+    if doc.docstatus == 1:
+        return "submitted"
+    if doc.docstatus == 0 and cint(doc.get("is_draft")):
+        return "draft"
+    return None
+
+
+def on_invoice_change(doc, method=None):
+    """doc_events hook for Invoice Form (on_change): covers insert, save, submit and cancel."""
+    before = doc.get_doc_before_save()
+    old_bucket, new_bucket = get_bucket(before), get_bucket(doc)
+    owner = (before or doc).owner
+    if old_bucket == new_bucket and owner == doc.owner:
+        return
+
+    deltas = []
+    if old_bucket:
+        deltas.append((old_bucket, owner, -1))
+    if new_bucket:
+        deltas.append((new_bucket, doc.owner, 1))
+    frappe.db.after_commit.add(partial(_apply_deltas, deltas))
+
+
+def on_invoice_trash(doc, method=None):
+    """doc_events hook for Invoice Form (on_trash)."""
+    bucket = get_bucket(doc)
+    if bucket:
+        frappe.db.after_commit.add(partial(_apply_deltas, [(bucket, doc.owner, -1)]))
+
+
+def reconcile_dashboard_counts():
+    """
+    Recount every bucket from the database and replace the counters.
+    Scheduled hourly to correct any drift, and used when the counters are missing.
+    """
+    Invoice = frappe.qb.DocType("Invoice Form")
+    # The counters are shared, so never recounted on a lagging replica
+    with replica.on_primary():
+        rows = (
+            frappe.qb.from_(Invoice)
+            .select(Invoice.owner, Invoice.docstatus, Invoice.is_draft, Count("*"))
+            .where(Invoice.docstatus < 2)
+            .groupby(Invoice.owner, Invoice.docstatus, Invoice.is_draft)
+            .run()
+        )
+
+    counts = {bucket: 0 for bucket in BUCKETS}
+    for owner, docstatus, is_draft, count in rows:
+        bucket = get_bucket(frappe._dict(docstatus=docstatus, is_draft=is_draft))
+        if bucket:
+            counts[bucket] += count
+            counts[f"{bucket}:{owner}"] = counts.get(f"{bucket}:{owner}", 0) + count
+
+    cache = frappe.cache()
+    key = cache.make_key(COUNTS_KEY)
+    pipeline = cache.pipeline()
+    pipeline.delete(key)
+    pipeline.hset(key, mapping=counts)
+    pipeline.execute()
+    return counts
+
+
+def _read_counters(fields):
+    """Read `fields` of the counters, or None when they are missing. The hash has two fields per user."""
+    cache = frappe.cache()
+    (values,) = cache.pipeline().hmget(cache.make_key(COUNTS_KEY), fields).execute()
+    # The overall buckets always exist once the counters have been built
+    if values[0] is None:
+        return None
+    return {field: int(value) for field, value in zip(fields, values) if value is not None}
+
+
+def _apply_deltas(deltas):
+    cache = frappe.cache()
+    key = cache.make_key(COUNTS_KEY)
+    (exists,) = cache.pipeline().exists(key).execute()
+    if not exists:
+        # Counters were flushed; the next read recounts from the database
+        return
+
+    pipeline = cache.pipeline()
+    for bucket, owner, delta in deltas:
+        pipeline.hincrby(key, bucket, delta)
+        pipeline.hincrby(key, f"{bucket}:{owner}", delta)
+    pipeline.execute()
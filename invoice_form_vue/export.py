@@ -0,0 +1,161 @@
+"""
+Streaming export of Invoice Forms and their item rows.
+
+Invoices are read in keyset-paginated chunks (by name) with their rows and
+party names fetched per chunk, and written to the file as they are read, so
+memory use does not depend on the size of the date range.
+"""
+
+import csv
+
+import frappe
+from frappe import _
+from frappe.utils import getdate
+
+from invoice_form_vue import loaders, permissions
+
+CHUNK_SIZE = 500
+FORMATS = ("csv", "xlsx")
+
+INVOICE_COLUMNS = ["name", "posting_date", "pamper", "supplier", "supplier_name", "customer", "customer_name", "docstatus", "is_draft", "lock_update"]
+ITEM_COLUMNS = ["idx", "item_code", "qty", "price", "total", "customer", "has_commission", "remark"]
+HEADER = INVOICE_COLUMNS + [f"item_{column}" for column in ITEM_COLUMNS] + ["item_customer_name"]
+
+
+def enqueue_export(from_date, to_date, pamper=None, supplier=None, customer=None, file_format="csv"):
+    """Check permissions and queue the export; the user is notified with a link when it is ready."""
+    if file_format not in FORMATS:
+        frappe.throw(_("Unsupported export format: {0}").format(file_format))
+    frappe.has_permission("Invoice Form", "export", throw=True)
+
+    # As for the daily rollup, users other than System Managers only export their own pamper
+    if "System Manager" not in frappe.get_roles():
+        own_pamper = permissions.get_user_permission().pamper
+        if not own_pamper or (pamper and pamper != own_pamper):
+            frappe.throw(_("Not permitted"), frappe.PermissionError)
+        pamper = own_pamper
+
+    filters = get_filters(from_date, to_date, pamper, supplier, customer)
+    export_id = frappe.generate_hash(length=10)
+    frappe.enqueue(
+        "invoice_form_vue.export.build_export",
+        queue="long",
+        timeout=3600,
+        filters=filters,
+        file_format=file_format,
+        export_id=export_id,
+        user=frappe.session.user,
+    )
+    return {"export_id": export_id}
+
+
+def get_filters(from_date, to_date, pamper=None, supplier=None, customer=None):
+    filters = {"posting_date": ["between", [getdate(from_date), getdate(to_date)]], "docstatus": ["<", 2]}
+    for field, value in (("pamper", pamper), ("supplier", supplier), ("customer", customer)):
+        if value:
+            filters[field] = value
+    return filters
+
+
+def build_export(filters, file_format, export_id, user):
+    """Background job: write the export file and send the user a link to it."""
+    file_name = f"invoice-forms-{export_id}.{file_format}"
+    path = frappe.get_site_path("private", "files", file_name)
+
+    write = write_xlsx if file_format == "xlsx" else write_csv
+    count = write(path, iter_rows(filters))
+
+    file_doc = frappe.get_doc({
+        "doctype": "File",
+        "file_name": file_name,
+        "file_url": f"/private/files/{file_name}",
+        "is_private": 1,
+    })
+    file_doc.insert(ignore_permissions=True)
+    frappe.db.commit()
+
+    frappe.publish_realtime(
+        "msgprint",
+        _("Invoice export ready ({0} rows): {1}").format(
+            count, f'<a href="{file_doc.file_url}" target="_blank">{file_name}</a>'
+        ),
+        user=user,
+    )
+    return file_doc.file_url
+
+
+def iter_rows(filters, chunk_size=CHUNK_SIZE):
+    """Yield one export row per item row (or per invoice without rows), in invoice name order."""
+    invoice_fields = _existing_fields("Invoice Form", INVOICE_COLUMNS)
+    item_fields = _existing_fields("Invoice Form Item", ITEM_COLUMNS)
+
+    last_name = None
+    while True:
+        chunk_filters = dict(filters)
+        if last_name:
+            chunk_filters["name"] = [">", last_name]
+        # The job runs as the requesting user, so their user permissions apply
+        invoices = frappe.get_list(
+            "Invoice Form",
+            filters=chunk_filters,
+            fields=invoice_fields,
+            order_by="name asc",
+            limit=chunk_size,
+        )
+        if not invoices:
+            return
+        last_name = invoices[-1].name
+
+        items = {}
+        for item in frappe.get_all(
+            "Invoice Form Item",
+            filters={"parent": ["in", [invoice.name for invoice in invoices]], "parenttype": "Invoice Form"},
+            fields=["parent"] + item_fields,
+            order_by="parent asc, idx asc",
+        ):
+            items.setdefault(item.parent, []).append(item)
+        customer_names = loaders.get_party_names(
+            customers=[item.customer for rows in items.values() for item in rows]
+        )["Customer"]
+
+        for invoice in invoices:
+            header = [invoice.get(column) for column in INVOICE_COLUMNS]
+            for item in items.get(invoice.name) or [frappe._dict()]:
+                yield header + [item.get(column) for column in ITEM_COLUMNS] + [customer_names.get(item.customer)]
+
+        if len(invoices) < chunk_size:
+            return
+
+
+def write_csv(path, rows):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_xlsx(path, rows):
+    from openpyxl import Workbook
+
+    # Write-only workbooks stream rows to disk instead of keeping them in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Invoice Forms")
+    sheet.append(HEADER)
+    count = 0
+    for row in rows:
+        sheet.append(row)
+        count += 1
+    workbook.save(path)
+    return count
+
+
+def _existing_fields(doctype, fieldnames):
+    meta = frappe.get_meta(doctype)
+    return [
+        fieldname for fieldname in fieldnames
+        if fieldname in frappe.model.default_fields or meta.has_field(fieldname)
+    ]
@@ -83,7 +83,8 @@ app_license = "mit"
 # ------------
 
 # before_install = "invoice_form_vue.install.before_install"
-# after_install = "invoice_form_vue.install.after_install"
+after_install = "invoice_form_vue.install.after_install"
+after_migrate = "invoice_form_vue.install.after_migrate"
 
 # Uninstallation
 # ------------
@@ -137,27 +138,64 @@ app_license = "mit"
 # ---------------
 # Hook on document methods and events
 
-# doc_events = {
-# 	"*": {
-# 		"on_update": "method",
-# 		"on_cancel": "method",
-# 		"on_trash": "method"
-# 	}
-# }
+doc_events = {
+	"Invoice Form": {
+		"on_change": [
+			"invoice_form_vue.dashboard.on_invoice_change",
+			"invoice_form_vue.credit.on_invoice_change",
+			"invoice_form_vue.realtime.on_invoice_change",
+			"invoice_form_vue.rollup.on_invoice_change",
+			"invoice_form_vue.replica.on_invoice_change",
+		],
+		"on_trash": [
+			"invoice_form_vue.dashboard.on_invoice_trash",
+			"invoice_form_vue.credit.on_invoice_change",
+			"invoice_form_vue.realtime.on_invoice_trash",
+			"invoice_form_vue.audit.on_invoice_trash",
+			"invoice_form_vue.rollup.on_invoice_trash",
+			"invoice_form_vue.replica.on_invoice_change",
+		],
+	},
+	"GL Entry": {
+		"on_submit": "invoice_form_vue.credit.on_gl_entry_submit",
+	},
+	"Invoice Form Permission": {
+		"on_update": "invoice_form_vue.permissions.clear_permission_cache",
+	},
+	"Supplier": {
+		"on_update": "invoice_form_vue.master_data.on_master_data_change",
+		"on_trash": "invoice_form_vue.master_data.on_master_data_change",
+		"after_rename": "invoice_form_vue.master_data.on_master_data_rename",
+	},
+	"Customer": {
+		"on_update": [
+			"invoice_form_vue.master_data.on_master_data_change",
+			"invoice_form_vue.credit.on_customer_update",
+		],
+		"on_trash": "invoice_form_vue.master_data.on_master_data_change",
+		"after_rename": "invoice_form_vue.master_data.on_master_data_rename",
+	},
+	"Item": {
+		"on_update": "invoice_form_vue.master_data.on_master_data_change",
+		"on_trash": "invoice_form_vue.master_data.on_master_data_change",
+		"after_rename": "invoice_form_vue.master_data.on_master_data_rename",
+	},
+}
 
 # Scheduled Tasks
 # ---------------
 
 scheduler_events = {
  	"all": [
- 		"invoice_form_vue.tasks.check_lock_update_invoice_form"
+ 		"invoice_form_vue.tasks.check_lock_update_invoice_form",
+		"invoice_form_vue.audit.flush_audit_log",
  	],
-# 	"daily": [
-# 		"invoice_form_vue.tasks.daily"
-# 	],
-# 	"hourly": [
-# 		"invoice_form_vue.tasks.hourly"
-# 	],
+	"daily": [
+		"invoice_form_vue.audit.delete_old_audit_logs"
+	],
+	"hourly": [
+		"invoice_form_vue.dashboard.reconcile_dashboard_counts"
+	],
 # 	"weekly": [
 # 		"invoice_form_vue.tasks.weekly"
 # 	],
@@ -196,8 +234,9 @@ scheduler_events = {
 
 # Request Events
 # ----------------
-# before_request = ["invoice_form_vue.utils.before_request"]
-# after_request = ["invoice_form_vue.utils.after_request"]
+# Opt-in profiling of invoice_form_vue.api, see invoice_form_vue/profiling.py
+before_request = ["invoice_form_vue.profiling.before_request"]
+after_request = ["invoice_form_vue.profiling.after_request"]
 
 # Job Events
 # ----------
@@ -0,0 +1,35 @@
+from frappe.custom.doctype.custom_field.custom_field import create_custom_fields
+
+from invoice_form_vue.patches.v1_0 import add_invoice_form_indexes
+
+# Fields the app's code relies on, created and kept up to date on install and migrate
+CUSTOM_FIELDS = {
+    "Invoice Form": [
+        {
+            # Client-generated key of create_invoice / create_invoices_bulk saves
+            "fieldname": "idempotency_key",
+            "label": "Idempotency Key",
+            "fieldtype": "Data",
+            "insert_after": "lock_update",
+            "unique": 1,
+            "hidden": 1,
+            "read_only": 1,
+            "no_copy": 1,
+            "print_hide": 1,
+            "report_hide": 1,
+        },
+    ],
+}
+
+
+def after_install():
+    create_custom_fields(CUSTOM_FIELDS)
+    add_invoice_form_indexes.execute()
+
+
+def after_migrate():
+    create_custom_fields(CUSTOM_FIELDS)
+    # A fresh install marks every patch done without running it, and
+    # lock_update only exists once the fixtures are synced after the patches.
+    # add_index skips indexes that already exist.
+    add_invoice_form_indexes.execute()
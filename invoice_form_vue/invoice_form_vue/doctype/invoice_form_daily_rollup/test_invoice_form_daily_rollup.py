@@ -0,0 +1,9 @@
+# Copyright (c) 2026, Amr Basha and Contributors
+# See license.txt
+
+# import frappe
+from frappe.tests.utils import FrappeTestCase
+
+
+class TestInvoiceFormDailyRollup(FrappeTestCase):
+	pass
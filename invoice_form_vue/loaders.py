@@ -0,0 +1,109 @@
+import frappe
+from frappe import _
+
+INVOICE_FIELDS = ["name", "supplier", "customer", "is_draft", "lock_update"]
+INVOICE_OPTIONAL_FIELDS = ["invoice_remark"]
+
+ITEM_FIELDS = ["name", "parent", "idx", "item_code", "qty", "price", "total", "customer"]
+ITEM_OPTIONAL_FIELDS = ["has_commission", "remark"]
+
+
+def get_party_names(suppliers=(), customers=()):
+    """
+    Resolve supplier and customer codes to their display names.
+
+    Runs at most one query per doctype however many codes are passed.
+
+    Returns:
+        dict: {"Supplier": {code: supplier_name}, "Customer": {code: customer_name}}
+    """
+    return {
+        "Supplier": _get_names("Supplier", "supplier_name", suppliers),
+        "Customer": _get_names("Customer", "customer_name", customers),
+    }
+
+
+def load_invoices(invoice_names):
+    """
+    Load Invoice Forms with their item rows and party names in a constant
+    number of queries: headers, item rows, suppliers and customers.
+
+    Returns:
+        dict: invoice name -> payload in the shape returned by api.get_invoice
+    """
+    invoice_names = list(dict.fromkeys(invoice_names))
+    if not invoice_names:
+        return {}
+
+    invoices = frappe.get_all(
+        "Invoice Form",
+        filters={"name": ["in", invoice_names]},
+        fields=INVOICE_FIELDS + _existing_fields("Invoice Form", INVOICE_OPTIONAL_FIELDS),
+    )
+    items = frappe.get_all(
+        "Invoice Form Item",
+        filters={"parent": ["in", invoice_names], "parenttype": "Invoice Form"},
+        fields=ITEM_FIELDS + _existing_fields("Invoice Form Item", ITEM_OPTIONAL_FIELDS),
+        order_by="parent asc, idx asc",
+    )
+
+    names = get_party_names(
+        suppliers=[invoice.supplier for invoice in invoices],
+        customers=[invoice.customer for invoice in invoices] + [item.customer for item in items],
+    )
+    supplier_names, customer_names = names["Supplier"], names["Customer"]
+
+    result = {}
+    for invoice in invoices:
+        result[invoice.name] = {
+            "name": invoice.name,
+            "supplier": invoice.supplier,
+            "supplier_name": supplier_names.get(invoice.supplier),
+            "customer": invoice.customer,
+            "customer_name": customer_names.get(invoice.customer) or "",
+            "is_draft": invoice.is_draft,
+            "lock_update": invoice.lock_update,
+            "invoice_remark": invoice.get("invoice_remark") or "",
+            "items": [],
+        }
+
+    for item in items:
+        result[item.parent]["items"].append({
+            "name": item.name,
+            "item_code": item.item_code,
+            "qty": item.qty,
+            "price": item.price,
+            "total": item.total,
+            "customer": item.customer,
+            "customer_name": customer_names.get(item.customer, "") if item.customer else "",
+            "has_commission": item.get("has_commission") or 0,
+            "remark": item.get("remark") or "",
+        })
+
+    return result
+
+
+def load_invoice(invoice_name):
+    """Load a single Invoice Form, raising DoesNotExistError if it is missing."""
+    invoice = load_invoices([invoice_name]).get(invoice_name)
+    if not invoice:
+        frappe.throw(_("Invoice Form {0} not found").format(invoice_name), frappe.DoesNotExistError)
+    return invoice
+
+
+def _get_names(doctype, field, codes):
+    codes = list({code for code in codes if code})
+    if not codes:
+        return {}
+    return dict(frappe.get_all(
+        doctype,
+        filters={"name": ["in", codes]},
+        fields=["name", field],
+        as_list=True,
+    ))
+
+
+def _existing_fields(doctype, fieldnames):
+    # Custom fields may not be installed on every site
+    meta = frappe.get_meta(doctype)
+    return [fieldname for fieldname in fieldnames if meta.has_field(fieldname)]
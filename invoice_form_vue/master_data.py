@@ -0,0 +1,214 @@
+import hashlib
+import json
+from functools import partial
+
+import frappe
+from frappe.core.doctype.user_permission.user_permission import get_user_permissions
+from frappe.utils import cint
+
+from invoice_form_vue import profiling
+
+# Cache keys (site-scoped by frappe.cache())
+MASTER_DATA_KEY = "invoice_form_vue:master_data"
+VERSION_KEY = "invoice_form_vue:master_data_version"
+CHANGES_KEY = "invoice_form_vue:master_data_changes"
+
+# How many change entries are kept for delta responses
+MAX_CHANGES = 1000
+
+# Payloads of users limited by User Permissions, one per set of permissions
+USER_DATA_SECONDS = 24 * 60 * 60
+
+# doctype -> (payload key, label field, filters a record must match to be listed)
+SOURCES = {
+    "Supplier": ("suppliers", "supplier_name", {"is_farmer": 1}),
+    "Customer": ("customers", "customer_name", {"is_customer": 1, "is_frozen": 0}),
+    "Item": ("items", "item_name", {"commission_item": 0, "is_agriculture_item": 1}),
+}
+
+
+def get_version():
+    """Return the current master-data version stamp, creating one if missing."""
+    version = frappe.cache().get_value(VERSION_KEY)
+    if not version:
+        version = frappe.generate_hash(length=10)
+        frappe.cache().set_value(VERSION_KEY, version)
+        # A fresh version cannot be reached from older change entries
+        frappe.cache().delete_value(CHANGES_KEY)
+    return version
+
+
+def get_master_data():
+    """
+    Return suppliers, customers and items together with the version they belong to.
+    The payload is built once per version and shared by every user; read it
+    through get_user_master_data, which applies the user's permissions.
+    """
+    version = get_version()
+    data = frappe.cache().get_value(MASTER_DATA_KEY)
+    hit = bool(data and data.get("version") == version)
+    profiling.record_cache(hit)
+    if hit:
+        return data
+
+    data = {"version": version}
+    for doctype, (key, label_field, filters) in SOURCES.items():
+        data[key] = frappe.get_all(doctype, filters=filters, fields=["name", label_field])
+
+    frappe.cache().set_value(MASTER_DATA_KEY, data)
+    return data
+
+
+def get_readable_lists():
+    """Payload keys of the lists the session user may read."""
+    return [key for doctype, (key, _label, _filters) in SOURCES.items() if frappe.has_permission(doctype, "read")]
+
+
+def get_user_version():
+    """
+    The version as the session user sees it. A user who may not read every
+    list, or whose User Permissions limit the rows, gets a version of their
+    own, so a client cache filled for another user is never taken as current.
+    """
+    version = get_version()
+    signature = _get_permission_signature()
+    return f"{version}:{signature}" if signature else version
+
+
+def get_user_master_data():
+    """
+    get_master_data as the session user may see it: lists they may not read
+    are empty and their User Permissions limit the rows of the others. Users
+    with the same permissions share one cached payload per version.
+    """
+    signature = _get_permission_signature()
+    if not signature:
+        return get_master_data()
+
+    version = get_user_version()
+    cache_key = f"{MASTER_DATA_KEY}:{signature}"
+    data = frappe.cache().get_value(cache_key)
+    hit = bool(data and data.get("version") == version)
+    profiling.record_cache(hit)
+    if hit:
+        return data
+
+    readable = get_readable_lists()
+    data = {"version": version}
+    for doctype, (key, label_field, filters) in SOURCES.items():
+        data[key] = _get_user_rows(doctype, filters, ["name", label_field]) if key in readable else []
+
+    frappe.cache().set_value(cache_key, data, expires_in_sec=USER_DATA_SECONDS)
+    return data
+
+
+def get_user_names(key):
+    """Names in list `key` the session user may read, or None when nothing limits them."""
+    if not _get_permission_signature():
+        return None
+    return {row["name"] for row in get_user_master_data()[key]}
+
+
+def get_user_changes_since(since):
+    """get_changes_since for a version from get_user_version, limited to the rows the user may read."""
+    version, _sep, signature = since.partition(":")
+    if signature != _get_permission_signature():
+        # Cached for other permissions: reload everything
+        return None
+    changes = get_changes_since(version)
+    if changes is None or not signature:
+        return changes
+
+    readable = get_readable_lists()
+    for doctype, (key, _label, filters) in SOURCES.items():
+        bucket = changes[key]
+        if key not in readable:
+            changes[key] = {"upsert": [], "remove": []}
+        elif bucket["upsert"]:
+            # A row the user may no longer read is removed from their copy
+            names = [row["name"] for row in bucket["upsert"]]
+            allowed = {row.name for row in _get_user_rows(doctype, {**filters, "name": ["in", names]}, ["name"])}
+            bucket["remove"] += [name for name in names if name not in allowed]
+            bucket["upsert"] = [row for row in bucket["upsert"] if row["name"] in allowed]
+    return changes
+
+
+def get_changes_since(since):
+    """
+    Return the merged changes recorded after version `since`, or None when the
+    change log no longer reaches back that far and a full reload is needed.
+    """
+    entries = [json.loads(entry) for entry in frappe.cache().lrange(CHANGES_KEY, 0, -1)]
+    start = next((i for i, entry in enumerate(entries) if entry["prev"] == since), None)
+    if start is None:
+        return None
+
+    latest = {}
+    for entry in entries[start:]:
+        latest[(entry["doctype"], entry["name"])] = entry["row"]
+
+    changes = {key: {"upsert": [], "remove": []} for key, _label, _filters in SOURCES.values()}
+    for (doctype, name), row in latest.items():
+        bucket = changes[SOURCES[doctype][0]]
+        if row:
+            bucket["upsert"].append(row)
+        else:
+            bucket["remove"].append(name)
+    return changes
+
+
+def on_master_data_change(doc, method=None):
+    """doc_events hook for Supplier, Customer and Item (on_update / on_trash)."""
+    row = None if method == "on_trash" else _get_row(doc)
+    frappe.db.after_commit.add(partial(_record_changes, doc.doctype, [(doc.name, row)]))
+
+
+def on_master_data_rename(doc, method=None, old=None, new=None, merge=False):
+    """doc_events hook for Supplier, Customer and Item (after_rename)."""
+    frappe.db.after_commit.add(
+        partial(_record_changes, doc.doctype, [(old, None), (new, _get_row(doc, name=new))])
+    )
+
+
+def _get_row(doc, name=None):
+    """Return the listed row for `doc`, or None if it no longer matches the filters."""
+    _key, label_field, filters = SOURCES[doc.doctype]
+    if any(cint(doc.get(field)) != value for field, value in filters.items()):
+        return None
+    return {"name": name or doc.name, label_field: doc.get(label_field)}
+
+
+def _get_user_rows(doctype, filters, fields):
+    """Rows of `doctype` the session user may pick on an Invoice Form, User Permissions applied."""
+    return frappe.get_list(
+        doctype, filters=filters, fields=fields, reference_doctype="Invoice Form", limit_page_length=0
+    )
+
+
+def _get_permission_signature():
+    """Empty for users who see every row; otherwise a short hash of what limits them."""
+    readable = get_readable_lists()
+    user_permissions = get_user_permissions()
+    if len(readable) == len(SOURCES) and not user_permissions:
+        return ""
+    limits = json.dumps([readable, user_permissions], sort_keys=True, default=str)
+    return hashlib.sha1(limits.encode()).hexdigest()[:10]
+
+
+def _record_changes(doctype, rows):
+    cache = frappe.cache()
+    prev = get_version()
+    for name, row in rows:
+        version = frappe.generate_hash(length=10)
+        cache.rpush(CHANGES_KEY, json.dumps({
+            "prev": prev,
+            "version": version,
+            "doctype": doctype,
+            "name": name,
+            "row": row,
+        }))
+        prev = version
+
+    cache.ltrim(CHANGES_KEY, -MAX_CHANGES, -1)
+    cache.set_value(VERSION_KEY, prev)
+    cache.delete_value(MASTER_DATA_KEY)
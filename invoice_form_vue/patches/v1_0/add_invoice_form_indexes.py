@@ -0,0 +1,33 @@
+import frappe
+
+# doctype -> [(index name, columns)] for the access paths of api.py, dashboard.py,
+# tasks.py, credit.py and permissions.py
+INDEXES = {
+    "Invoice Form": [
+        # get_draft_invoice_form: owner + docstatus + is_draft, newest first
+        ("owner_docstatus_is_draft_modified", ["owner", "docstatus", "is_draft", "modified"]),
+        # get_dashboard_data: the user's recent invoices
+        ("owner_modified", ["owner", "modified"]),
+        # dashboard.reconcile_dashboard_counts groups by these
+        ("docstatus_is_draft_owner", ["docstatus", "is_draft", "owner"]),
+        # tasks.check_lock_update_invoice_form
+        ("lock_update", ["lock_update"]),
+    ],
+    "Invoice Form Item": [
+        # credit: unsubmitted amounts per customer
+        ("customer_parent", ["customer", "parent"]),
+    ],
+    "Invoice Form Permission Details": [
+        ("user", ["user"]),
+        ("pamper", ["pamper"]),
+    ],
+}
+
+
+def execute():
+    for doctype, indexes in INDEXES.items():
+        if not frappe.db.table_exists(doctype):
+            continue
+        for index_name, columns in indexes:
+            if all(frappe.db.has_column(doctype, column) for column in columns):
+                frappe.db.add_index(doctype, columns, index_name=index_name)
@@ -0,0 +1,80 @@
+import frappe
+from frappe.utils import cint
+
+from invoice_form_vue import profiling, replica
+
+# Redis hash of user -> resolved permissions, also memoised per request by frappe.cache().hget
+CACHE_KEY = "invoice_form_vue:user_permissions"
+# Redis hash of pamper -> users working on it
+PAMPER_USERS_KEY = "invoice_form_vue:pamper_users"
+
+DETAIL_FIELDS = [
+    "login",
+    "delete_invoice",
+    "submit_invoice",
+    "update_draft_invoice",
+    "update_submitted_invoice",
+    "show_drafts",
+    "show_submitted",
+    "pamper",
+    "view_draft_hour",
+]
+SETTINGS_FIELDS = ["show_item_remark", "show_invoice_remark", "repeat_item"]
+
+
+def get_user_permission(user=None):
+    """
+    Return the Invoice Form permissions of `user` (default: session user).
+
+    Combines the user's Invoice Form Permission Details row with the form-wide
+    checkboxes of the Invoice Form Permission single. Users without a row get
+    every flag off.
+    """
+    user = user or frappe.session.user
+    permission = frappe.cache().hget(CACHE_KEY, user)
+    profiling.record_cache(permission is not None)
+    if permission is None:
+        # Cached for every request, so never read from a lagging replica
+        with replica.on_primary():
+            permission = _load_user_permission(user)
+        frappe.cache().hset(CACHE_KEY, user, permission)
+    return permission
+
+
+def get_pamper_users(pamper):
+    """Return the users whose Invoice Form Permission Details row is on `pamper`."""
+    if not pamper:
+        return []
+    return frappe.cache().hget(PAMPER_USERS_KEY, pamper, generator=lambda: _load_pamper_users(pamper))
+
+
+def clear_permission_cache(doc=None, method=None):
+    """doc_events hook for Invoice Form Permission (on_update)."""
+    frappe.cache().delete_key([CACHE_KEY, PAMPER_USERS_KEY])
+    # Drop anything cached by requests that read the old values before commit
+    frappe.db.after_commit.add(lambda: frappe.cache().delete_key([CACHE_KEY, PAMPER_USERS_KEY]))
+
+
+def _load_user_permission(user):
+    permission = frappe._dict({field: 0 for field in DETAIL_FIELDS})
+    permission.pamper = None
+
+    details = frappe.db.get_value(
+        "Invoice Form Permission Details", {"user": user}, DETAIL_FIELDS, as_dict=True
+    )
+    if details:
+        permission.update(details)
+
+    # Singles store values as text, cast the checkboxes back to ints
+    settings = frappe.db.get_values_from_single(
+        SETTINGS_FIELDS, None, "Invoice Form Permission", as_dict=True
+    )
+    settings = settings[0] if settings else {}
+    permission.update({field: cint(settings.get(field)) for field in SETTINGS_FIELDS})
+    permission.has_record = bool(details)
+    return permission
+
+
+def _load_pamper_users(pamper):
+    with replica.on_primary():
+        return frappe.get_all("Invoice Form Permission Details", filters={"pamper": pamper}, pluck="user")
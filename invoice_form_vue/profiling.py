@@ -0,0 +1,242 @@
+"""
+Opt-in per-endpoint profiling of invoice_form_vue.api.
+
+Enable it in site_config.json:
+
+    "invoice_form_vue_profiling": 1,
+    "invoice_form_vue_slow_request_ms": 1000,     # optional
+    "invoice_form_vue_trace_sample_rate": 0.2     # optional, share of slow requests traced
+
+Each request to a whitelisted method of invoice_form_vue.api records wall time,
+SQL query count, SQL time, response size and cache hits/misses into a Redis
+ring buffer per endpoint. Slow requests are sampled into a separate buffer
+together with the SQL they ran. Read them with api.get_endpoint_stats and
+api.get_slow_traces.
+"""
+
+import json
+import math
+import random
+from time import perf_counter
+
+import frappe
+
+API_PREFIX = "invoice_form_vue.api."
+# Reading the stats should not show up in them
+IGNORED_ENDPOINTS = {"get_endpoint_stats", "get_slow_traces"}
+
+# Redis keys: set of profiled endpoints, list of samples per endpoint, list of slow traces
+ENDPOINTS_KEY = "invoice_form_vue:profile_endpoints"
+SAMPLES_KEY = "invoice_form_vue:profile_samples:"
+TRACES_KEY = "invoice_form_vue:profile_traces"
+
+MAX_SAMPLES = 1000
+MAX_TRACES = 50
+MAX_TRACE_QUERIES = 200
+DEFAULT_SLOW_MS = 1000
+DEFAULT_TRACE_SAMPLE_RATE = 0.2
+
+
+def is_enabled():
+    return bool(frappe.conf.get("invoice_form_vue_profiling"))
+
+
+def before_request():
+    """before_request hook: start profiling calls to invoice_form_vue.api."""
+    if not is_enabled():
+        return
+
+    endpoint = _get_endpoint()
+    if not endpoint:
+        return
+
+    profile = frappe._dict(
+        endpoint=endpoint,
+        start=perf_counter(),
+        queries=0,
+        sql_time=0.0,
+        sql=[],
+        cache_hits=0,
+        cache_misses=0,
+        on_replica=False,
+    )
+    frappe.local.invoice_form_vue_profile = profile
+    instrument(frappe.local.db)
+
+
+def instrument(db, on_replica=False):
+    """
+    Count the queries of connection `db` towards the request being profiled, if
+    any. The read replica (see replica.py) is connected during the request, so it
+    is instrumented when an endpoint switches to it.
+    """
+    profile = getattr(frappe.local, "invoice_form_vue_profile", None)
+    if not profile or "sql" in db.__dict__:
+        return
+    if on_replica:
+        profile.on_replica = True
+
+    # Shadow the method on this request's connection only
+    sql = db.sql
+
+    def timed_sql(query, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return sql(query, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            profile.queries += 1
+            profile.sql_time += elapsed
+            if len(profile.sql) < MAX_TRACE_QUERIES:
+                profile.sql.append((str(query), round(elapsed * 1000, 2)))
+
+    db.sql = timed_sql
+
+
+def after_request(response=None, request=None):
+    """after_request hook: store the sample started by before_request."""
+    profile = getattr(frappe.local, "invoice_form_vue_profile", None)
+    if not profile:
+        return
+    frappe.local.invoice_form_vue_profile = None
+    for db in (getattr(frappe.local, "db", None), getattr(frappe.local, "replica_db", None)):
+        if db:
+            db.__dict__.pop("sql", None)
+
+    wall_ms = round((perf_counter() - profile.start) * 1000, 2)
+    sample = {
+        "ts": frappe.utils.now(),
+        "wall_ms": wall_ms,
+        "queries": profile.queries,
+        "sql_ms": round(profile.sql_time * 1000, 2),
+        "bytes": _get_size(response),
+        "cache_hits": profile.cache_hits,
+        "cache_misses": profile.cache_misses,
+        "status": getattr(response, "status_code", None),
+        "on_replica": profile.on_replica,
+    }
+
+    cache = frappe.cache()
+    samples_key = cache.make_key(SAMPLES_KEY + profile.endpoint)
+    pipeline = cache.pipeline()
+    pipeline.sadd(cache.make_key(ENDPOINTS_KEY), profile.endpoint)
+    pipeline.rpush(samples_key, json.dumps(sample))
+    pipeline.ltrim(samples_key, -MAX_SAMPLES, -1)
+
+    slow_ms = frappe.conf.get("invoice_form_vue_slow_request_ms") or DEFAULT_SLOW_MS
+    sample_rate = frappe.conf.get("invoice_form_vue_trace_sample_rate", DEFAULT_TRACE_SAMPLE_RATE)
+    if wall_ms >= slow_ms and random.random() < sample_rate:
+        trace = {
+            **sample,
+            "endpoint": profile.endpoint,
+            "user": frappe.session.user if getattr(frappe.local, "session", None) else None,
+            "sql": profile.sql,
+        }
+        traces_key = cache.make_key(TRACES_KEY)
+        pipeline.rpush(traces_key, json.dumps(trace, default=str))
+        pipeline.ltrim(traces_key, -MAX_TRACES, -1)
+
+    pipeline.execute()
+
+
+def record_cache(hit):
+    """Count a cache lookup towards the request being profiled, if any."""
+    profile = getattr(frappe.local, "invoice_form_vue_profile", None)
+    if profile:
+        if hit:
+            profile.cache_hits += 1
+        else:
+            profile.cache_misses += 1
+
+
+def get_stats(endpoint=None):
+    """
+    Summarise the stored samples per endpoint.
+
+    Returns:
+        dict: endpoint -> {"count", "wall_ms": {"p50", "p95", "p99", "max"},
+        "queries": {...}, "sql_ms": {...}, "bytes": {...}, "cache_hit_ratio",
+        "replica_ratio"}
+    """
+    endpoints = [endpoint] if endpoint else sorted(_get_endpoints())
+    stats = {}
+    for name in endpoints:
+        samples = [json.loads(sample) for sample in frappe.cache().lrange(SAMPLES_KEY + name, 0, -1)]
+        if not samples:
+            continue
+
+        hits = sum(sample["cache_hits"] for sample in samples)
+        lookups = hits + sum(sample["cache_misses"] for sample in samples)
+        stats[name] = {
+            "count": len(samples),
+            "wall_ms": _summarise(sample["wall_ms"] for sample in samples),
+            "queries": _summarise(sample["queries"] for sample in samples),
+            "sql_ms": _summarise(sample["sql_ms"] for sample in samples),
+            "bytes": _summarise(sample["bytes"] for sample in samples),
+            "cache_hit_ratio": round(hits / lookups, 3) if lookups else None,
+            "replica_ratio": round(sum(bool(sample.get("on_replica")) for sample in samples) / len(samples), 3),
+        }
+    return stats
+
+
+def get_slow_traces(endpoint=None):
+    """Return the sampled slow-request traces, newest first."""
+    traces = [json.loads(trace) for trace in reversed(frappe.cache().lrange(TRACES_KEY, 0, -1))]
+    if endpoint:
+        traces = [trace for trace in traces if trace["endpoint"] == endpoint]
+    return traces
+
+
+def clear():
+    """Drop every stored sample and trace."""
+    frappe.cache().delete_value(
+        [SAMPLES_KEY + endpoint for endpoint in _get_endpoints()] + [ENDPOINTS_KEY, TRACES_KEY]
+    )
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of sorted `values`."""
+    if not values:
+        return None
+    rank = max(math.ceil(p / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def _summarise(values):
+    values = sorted(values)
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1],
+    }
+
+
+def _get_endpoint():
+    request = getattr(frappe.local, "request", None)
+    if not request:
+        return None
+
+    method = None
+    if request.path.startswith("/api/method/"):
+        method = request.path[len("/api/method/"):]
+    elif frappe.form_dict.get("cmd"):
+        method = frappe.form_dict.cmd
+
+    if method and method.startswith(API_PREFIX):
+        endpoint = method[len(API_PREFIX):]
+        if endpoint not in IGNORED_ENDPOINTS:
+            return endpoint
+    return None
+
+
+def _get_endpoints():
+    cache = frappe.cache()
+    (endpoints,) = cache.pipeline().smembers(cache.make_key(ENDPOINTS_KEY)).execute()
+    return [endpoint.decode() for endpoint in endpoints]
+
+
+def _get_size(response):
+    if response is None or getattr(response, "is_streamed", False):
+        return 0
+    return len(response.get_data())
@@ -1,53 +0,0 @@
-var Ba=Object.defineProperty,Ra=Object.defineProperties;var Ea=Object.getOwnPropertyDescriptors;var ct=Object.getOwnPropertySymbols;var Ia=Object.prototype.hasOwnProperty,Sa=Object.prototype.propertyIsEnumerable;var Re=(o,e)=>(e=Symbol[o])?e:Symbol.for("Symbol."+o),La=o=>{throw TypeError(o)};var lt=(o,e,r)=>e in o?Ba(o,e,{enumerable:!0,configurable:!0,writable:!0,value:r}):o[e]=r,be=(o,e)=>{for(var r in e||(e={}))Ia.call(e,r)&&lt(o,r,e[r]);if(ct)for(var r of ct(e))Sa.call(e,r)&&lt(o,r,e[r]);return o},Je=(o,e)=>Ra(o,Ea(e));var Ta=(o,e)=>()=>(e||o((e={exports:{}}).exports,e),e.exports);var to=(o,e,r)=>new Promise((t,a)=>{var n=l=>{try{c(r.next(l))}catch(s){a(s)}},i=l=>{try{c(r.throw(l))}catch(s){a(s)}},c=l=>l.done?t(l.value):Promise.resolve(l.value).then(n,i);c((r=r.apply(o,e)).next())}),he=function(o,e){this[0]=o,this[1]=e},wr=(o,e,r)=>{var t=(i,c,l,s)=>{try{var u=r[i](c),g=(c=u.value)instanceof he,p=u.done;Promise.resolve(g?c[0]:c).then(k=>g?t(i==="return"?i:"next",c[1]?{done:k.done,value:k.value}:k,l,s):l({value:k,done:p})).catch(k=>t("throw",k,l,s))}catch(k){s(k)}},a=i=>n[i]=c=>new Promise((l,s)=>t(i,c,l,s)),n={};return r=r.apply(o,e),n[Re("asyncIterator")]=()=>n,a("next"),a("throw"),a("return"),n},$r=o=>{var e=o[Re("asyncIterator")],r=!1,t,a={};return e==null?(e=o[Re("iterator")](),t=n=>a[n]=i=>e[n](i)):(e=e.call(o),t=n=>a[n]=i=>{if(r){if(r=!1,n==="throw")throw i;return i}return r=!0,{done:!1,value:new he(new Promise(c=>{var l=e[n](i);l instanceof Object||La("Object expected"),c(l)}),1)}}),a[Re("iterator")]=()=>a,t("next"),"throw"in e?t("throw"):a.throw=n=>{throw n},"return"in e&&t("return"),a},st=(o,e,r)=>(e=o[Re("asyncIterator")])?e.call(o):(o=o[Re("iterator")](),e={},r=(t,a)=>(a=o[t])&&(e[t]=n=>new Promise((i,c,l)=>(n=a.call(o,n),l=n.done,Promise.resolve(n.value).then(s=>i({value:s,done:l}),c)))),r("next"),r("return"),e);import{L as Na,r as lo,M as fn,I as X,w as we,N as Da,O as Vr,P as gn,F as Yr,g as Me,v as Ne,o as De,Q as Oa,R as Aa,y as H,S as Pa,U as mn,V as Xr,c as ao,p as po,d as C,h as Ro,k as Fo,l as go,W as M,b as J,X as Fa,B as za,Y as Ma,t as U,q as $e,f as Oo,j as Wa,i as Ua,J as Se,Z as qa,G as pn,A as Ha,_ as ja,$ as Va,a0 as Ya}from"./vendor-CQUOWwJw.js";import{s as vo,a as Xo,b as We,u as Gr,c as Ve,d as ee,e as bn,f as or,g as hn,h as Kr,i as vn,j as kn,k as Xa,P as Ga,T as Ka,C as Ja,l as Qa,m as Za,n as oi,o as ei,p as ri,q as ti}from"./ui-CxbnjGu9.js";var H8=Ta(Ge=>{(function(){const e=document.createElement("link").relList;if(e&&e.supports&&e.supports("modulepreload"))return;for(const a of document.querySelectorAll('link[rel="modulepreload"]'))t(a);new MutationObserver(a=>{for(const n of a)if(n.type==="childList")for(const i of n.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&t(i)}).observe(document,{childList:!0,subtree:!0});function r(a){const n={};return a.integrity&&(n.integrity=a.integrity),a.referrerPolicy&&(n.referrerPolicy=a.referrerPolicy),a.crossOrigin==="use-credentials"?n.credentials="include":a.crossOrigin==="anonymous"?n.credentials="omit":n.credentials="same-origin",n}function t(a){if(a.ep)return;a.ep=!0;const n=r(a);fetch(a.href,n)}})();/*!
-  * shared v9.14.4
-  * (c) 2025 kazuya kawaguchi
-  * Released under the MIT License.
-  */const ar=typeof window!="undefined",te=(o,e=!1)=>e?Symbol.for(o):Symbol(o),ni=(o,e,r)=>ai({l:o,k:e,s:r}),ai=o=>JSON.stringify(o).replace(/\u2028/g,"\\u2028").replace(/\u2029/g,"\\u2029").replace(/\u0027/g,"\\u0027"),mo=o=>typeof o=="number"&&isFinite(o),ii=o=>Cn(o)==="[object Date]",re=o=>Cn(o)==="[object RegExp]",dr=o=>G(o)&&Object.keys(o).length===0,ko=Object.assign,ci=Object.create,io=(o=null)=>ci(o);let dt;const Go=()=>dt||(dt=typeof globalThis!="undefined"?globalThis:typeof self!="undefined"?self:typeof window!="undefined"?window:typeof global!="undefined"?global:io());function ut(o){return o.replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&apos;")}const li=Object.prototype.hasOwnProperty;function Ao(o,e){return li.call(o,e)}const uo=Array.isArray,so=o=>typeof o=="function",O=o=>typeof o=="string",Q=o=>typeof o=="boolean",ro=o=>o!==null&&typeof o=="object",si=o=>ro(o)&&so(o.then)&&so(o.catch),yn=Object.prototype.toString,Cn=o=>yn.call(o),G=o=>{if(!ro(o))return!1;const e=Object.getPrototypeOf(o);return e===null||e.constructor===Object},di=o=>o==null?"":uo(o)||G(o)&&o.toString===yn?JSON.stringify(o,null,2):String(o);function ui(o,e=""){return o.reduce((r,t,a)=>a===0?r+t:r+e+t,"")}function ur(o){let e=o;return()=>++e}function fi(o,e){typeof console!="undefined"&&(console.warn("[intlify] "+o),e&&console.warn(e.stack))}const Qe=o=>!ro(o)||uo(o);function er(o,e){if(Qe(o)||Qe(e))throw new Error("Invalid value");const r=[{src:o,des:e}];for(;r.length;){const{src:t,des:a}=r.pop();Object.keys(t).forEach(n=>{n!=="__proto__"&&(ro(t[n])&&!ro(a[n])&&(a[n]=Array.isArray(t[n])?[]:io()),Qe(a[n])||Qe(t[n])?a[n]=t[n]:r.push({src:t[n],des:a[n]}))})}}/*!
-  * message-compiler v9.14.4
-  * (c) 2025 kazuya kawaguchi
-  * Released under the MIT License.
-  */function gi(o,e,r){return{line:o,column:e,offset:r}}function ir(o,e,r){return{start:o,end:e}}const mi=/\{([0-9a-zA-Z]+)\}/g;function wn(o,...e){return e.length===1&&pi(e[0])&&(e=e[0]),(!e||!e.hasOwnProperty)&&(e={}),o.replace(mi,(r,t)=>e.hasOwnProperty(t)?e[t]:"")}const $n=Object.assign,ft=o=>typeof o=="string",pi=o=>o!==null&&typeof o=="object";function _n(o,e=""){return o.reduce((r,t,a)=>a===0?r+t:r+e+t,"")}const Jr={USE_MODULO_SYNTAX:1,__EXTEND_POINT__:2},bi={[Jr.USE_MODULO_SYNTAX]:"Use modulo before '{{0}}'."};function hi(o,e,...r){const t=wn(bi[o],...r||[]),a={message:String(t),code:o};return e&&(a.location=e),a}const Y={EXPECTED_TOKEN:1,INVALID_TOKEN_IN_PLACEHOLDER:2,UNTERMINATED_SINGLE_QUOTE_IN_PLACEHOLDER:3,UNKNOWN_ESCAPE_SEQUENCE:4,INVALID_UNICODE_ESCAPE_SEQUENCE:5,UNBALANCED_CLOSING_BRACE:6,UNTERMINATED_CLOSING_BRACE:7,EMPTY_PLACEHOLDER:8,NOT_ALLOW_NEST_PLACEHOLDER:9,INVALID_LINKED_FORMAT:10,MUST_HAVE_MESSAGES_IN_PLURAL:11,UNEXPECTED_EMPTY_LINKED_MODIFIER:12,UNEXPECTED_EMPTY_LINKED_KEY:13,UNEXPECTED_LEXICAL_ANALYSIS:14,UNHANDLED_CODEGEN_NODE_TYPE:15,UNHANDLED_MINIFIER_NODE_TYPE:16,__EXTEND_POINT__:17},vi={[Y.EXPECTED_TOKEN]:"Expected token: '{0}'",[Y.INVALID_TOKEN_IN_PLACEHOLDER]:"Invalid token in placeholder: '{0}'",[Y.UNTERMINATED_SINGLE_QUOTE_IN_PLACEHOLDER]:"Unterminated single quote in placeholder",[Y.UNKNOWN_ESCAPE_SEQUENCE]:"Unknown escape sequence: \\{0}",[Y.INVALID_UNICODE_ESCAPE_SEQUENCE]:"Invalid unicode escape sequence: {0}",[Y.UNBALANCED_CLOSING_BRACE]:"Unbalanced closing brace",[Y.UNTERMINATED_CLOSING_BRACE]:"Unterminated closing brace",[Y.EMPTY_PLACEHOLDER]:"Empty placeholder",[Y.NOT_ALLOW_NEST_PLACEHOLDER]:"Not allowed nest placeholder",[Y.INVALID_LINKED_FORMAT]:"Invalid linked format",[Y.MUST_HAVE_MESSAGES_IN_PLURAL]:"Plural must have messages",[Y.UNEXPECTED_EMPTY_LINKED_MODIFIER]:"Unexpected empty linked modifier",[Y.UNEXPECTED_EMPTY_LINKED_KEY]:"Unexpected empty linked key",[Y.UNEXPECTED_LEXICAL_ANALYSIS]:"Unexpected lexical analysis in token: '{0}'",[Y.UNHANDLED_CODEGEN_NODE_TYPE]:"unhandled codegen node type: '{0}'",[Y.UNHANDLED_MINIFIER_NODE_TYPE]:"unhandled mimifier node type: '{0}'"};function Oe(o,e,r={}){const{domain:t,messages:a,args:n}=r,i=wn((a||vi)[o]||"",...n||[]),c=new SyntaxError(String(i));return c.code=o,e&&(c.location=e),c.domain=t,c}function ki(o){throw o}const Vo=" ",yi="\r",Co=`
-`,Ci="\u2028",wi="\u2029";function $i(o){const e=o;let r=0,t=1,a=1,n=0;const i=I=>e[I]===yi&&e[I+1]===Co,c=I=>e[I]===Co,l=I=>e[I]===wi,s=I=>e[I]===Ci,u=I=>i(I)||c(I)||l(I)||s(I),g=()=>r,p=()=>t,k=()=>a,m=()=>n,v=I=>i(I)||l(I)||s(I)?Co:e[I],h=()=>v(r),B=()=>v(r+n);function A(){return n=0,u(r)&&(t++,a=0),i(r)&&r++,r++,a++,e[r]}function b(){return i(r+n)&&n++,n++,e[r+n]}function y(){r=0,t=1,a=1,n=0}function E(I=0){n=I}function x(){const I=r+n;for(;I!==r;)A();n=0}return{index:g,line:p,column:k,peekOffset:m,charAt:v,currentChar:h,currentPeek:B,next:A,peek:b,reset:y,resetPeek:E,skipToPeek:x}}const oe=void 0,_i=".",gt="'",xi="tokenizer";function Bi(o,e={}){const r=e.location!==!1,t=$i(o),a=()=>t.index(),n=()=>gi(t.line(),t.column(),t.index()),i=n(),c=a(),l={currentType:14,offset:c,startLoc:i,endLoc:i,lastType:14,lastOffset:c,lastStartLoc:i,lastEndLoc:i,braceNest:0,inLinked:!1,text:""},s=()=>l,{onError:u}=e;function g(d,f,R,...q){const co=s();if(f.column+=R,f.offset+=R,u){const V=r?ir(co.startLoc,f):null,$=Oe(d,V,{domain:xi,args:q});u($)}}function p(d,f,R){d.endLoc=n(),d.currentType=f;const q={type:f};return r&&(q.loc=ir(d.startLoc,d.endLoc)),R!=null&&(q.value=R),q}const k=d=>p(d,14);function m(d,f){return d.currentChar()===f?(d.next(),f):(g(Y.EXPECTED_TOKEN,n(),0,f),"")}function v(d){let f="";for(;d.currentPeek()===Vo||d.currentPeek()===Co;)f+=d.currentPeek(),d.peek();return f}function h(d){const f=v(d);return d.skipToPeek(),f}function B(d){if(d===oe)return!1;const f=d.charCodeAt(0);return f>=97&&f<=122||f>=65&&f<=90||f===95}function A(d){if(d===oe)return!1;const f=d.charCodeAt(0);return f>=48&&f<=57}function b(d,f){const{currentType:R}=f;if(R!==2)return!1;v(d);const q=B(d.currentPeek());return d.resetPeek(),q}function y(d,f){const{currentType:R}=f;if(R!==2)return!1;v(d);const q=d.currentPeek()==="-"?d.peek():d.currentPeek(),co=A(q);return d.resetPeek(),co}function E(d,f){const{currentType:R}=f;if(R!==2)return!1;v(d);const q=d.currentPeek()===gt;return d.resetPeek(),q}function x(d,f){const{currentType:R}=f;if(R!==8)return!1;v(d);const q=d.currentPeek()===".";return d.resetPeek(),q}function I(d,f){const{currentType:R}=f;if(R!==9)return!1;v(d);const q=B(d.currentPeek());return d.resetPeek(),q}function D(d,f){const{currentType:R}=f;if(!(R===8||R===12))return!1;v(d);const q=d.currentPeek()===":";return d.resetPeek(),q}function N(d,f){const{currentType:R}=f;if(R!==10)return!1;const q=()=>{const V=d.currentPeek();return V==="{"?B(d.peek()):V==="@"||V==="%"||V==="|"||V===":"||V==="."||V===Vo||!V?!1:V===Co?(d.peek(),q()):P(d,!1)},co=q();return d.resetPeek(),co}function j(d){v(d);const f=d.currentPeek()==="|";return d.resetPeek(),f}function W(d){const f=v(d),R=d.currentPeek()==="%"&&d.peek()==="{";return d.resetPeek(),{isModulo:R,hasSpace:f.length>0}}function P(d,f=!0){const R=(co=!1,V="",$=!1)=>{const _=d.currentPeek();return _==="{"?V==="%"?!1:co:_==="@"||!_?V==="%"?!0:co:_==="%"?(d.peek(),R(co,"%",!0)):_==="|"?V==="%"||$?!0:!(V===Vo||V===Co):_===Vo?(d.peek(),R(!0,Vo,$)):_===Co?(d.peek(),R(!0,Co,$)):!0},q=R();return f&&d.resetPeek(),q}function no(d,f){const R=d.currentChar();return R===oe?oe:f(R)?(d.next(),R):null}function ie(d){const f=d.charCodeAt(0);return f>=97&&f<=122||f>=65&&f<=90||f>=48&&f<=57||f===95||f===36}function xo(d){return no(d,ie)}function wo(d){const f=d.charCodeAt(0);return f>=97&&f<=122||f>=65&&f<=90||f>=48&&f<=57||f===95||f===36||f===45}function ce(d){return no(d,wo)}function le(d){const f=d.charCodeAt(0);return f>=48&&f<=57}function se(d){return no(d,le)}function de(d){const f=d.charCodeAt(0);return f>=48&&f<=57||f>=65&&f<=70||f>=97&&f<=102}function Bo(d){return no(d,de)}function qo(d){let f="",R="";for(;f=se(d);)R+=f;return R}function ue(d){h(d);const f=d.currentChar();return f!=="%"&&g(Y.EXPECTED_TOKEN,n(),0,f),d.next(),"%"}function Io(d){let f="";for(;;){const R=d.currentChar();if(R==="{"||R==="}"||R==="@"||R==="|"||!R)break;if(R==="%")if(P(d))f+=R,d.next();else break;else if(R===Vo||R===Co)if(P(d))f+=R,d.next();else{if(j(d))break;f+=R,d.next()}else f+=R,d.next()}return f}function Jo(d){h(d);let f="",R="";for(;f=ce(d);)R+=f;return d.currentChar()===oe&&g(Y.UNTERMINATED_CLOSING_BRACE,n(),0),R}function Ho(d){h(d);let f="";return d.currentChar()==="-"?(d.next(),f+=`-${qo(d)}`):f+=qo(d),d.currentChar()===oe&&g(Y.UNTERMINATED_CLOSING_BRACE,n(),0),f}function xe(d){return d!==gt&&d!==Co}function To(d){h(d),m(d,"'");let f="",R="";for(;f=no(d,xe);)f==="\\"?R+=fe(d):R+=f;const q=d.currentChar();return q===Co||q===oe?(g(Y.UNTERMINATED_SINGLE_QUOTE_IN_PLACEHOLDER,n(),0),q===Co&&(d.next(),m(d,"'")),R):(m(d,"'"),R)}function fe(d){const f=d.currentChar();switch(f){case"\\":case"'":return d.next(),`\\${f}`;case"u":return Qo(d,f,4);case"U":return Qo(d,f,6);default:return g(Y.UNKNOWN_ESCAPE_SEQUENCE,n(),0,f),""}}function Qo(d,f,R){m(d,f);let q="";for(let co=0;co<R;co++){const V=Bo(d);if(!V){g(Y.INVALID_UNICODE_ESCAPE_SEQUENCE,n(),0,`\\${f}${q}${d.currentChar()}`);break}q+=V}return`\\${f}${q}`}function ge(d){return d!=="{"&&d!=="}"&&d!==Vo&&d!==Co}function me(d){h(d);let f="",R="";for(;f=no(d,ge);)R+=f;return R}function Zo(d){let f="",R="";for(;f=xo(d);)R+=f;return R}function T(d){const f=R=>{const q=d.currentChar();return q==="{"||q==="%"||q==="@"||q==="|"||q==="("||q===")"||!q||q===Vo?R:(R+=q,d.next(),f(R))};return f("")}function oo(d){h(d);const f=m(d,"|");return h(d),f}function S(d,f){let R=null;switch(d.currentChar()){case"{":return f.braceNest>=1&&g(Y.NOT_ALLOW_NEST_PLACEHOLDER,n(),0),d.next(),R=p(f,2,"{"),h(d),f.braceNest++,R;case"}":return f.braceNest>0&&f.currentType===2&&g(Y.EMPTY_PLACEHOLDER,n(),0),d.next(),R=p(f,3,"}"),f.braceNest--,f.braceNest>0&&h(d),f.inLinked&&f.braceNest===0&&(f.inLinked=!1),R;case"@":return f.braceNest>0&&g(Y.UNTERMINATED_CLOSING_BRACE,n(),0),R=L(d,f)||k(f),f.braceNest=0,R;default:{let co=!0,V=!0,$=!0;if(j(d))return f.braceNest>0&&g(Y.UNTERMINATED_CLOSING_BRACE,n(),0),R=p(f,1,oo(d)),f.braceNest=0,f.inLinked=!1,R;if(f.braceNest>0&&(f.currentType===5||f.currentType===6||f.currentType===7))return g(Y.UNTERMINATED_CLOSING_BRACE,n(),0),f.braceNest=0,F(d,f);if(co=b(d,f))return R=p(f,5,Jo(d)),h(d),R;if(V=y(d,f))return R=p(f,6,Ho(d)),h(d),R;if($=E(d,f))return R=p(f,7,To(d)),h(d),R;if(!co&&!V&&!$)return R=p(f,13,me(d)),g(Y.INVALID_TOKEN_IN_PLACEHOLDER,n(),0,R.value),h(d),R;break}}return R}function L(d,f){const{currentType:R}=f;let q=null;const co=d.currentChar();switch((R===8||R===9||R===12||R===10)&&(co===Co||co===Vo)&&g(Y.INVALID_LINKED_FORMAT,n(),0),co){case"@":return d.next(),q=p(f,8,"@"),f.inLinked=!0,q;case".":return h(d),d.next(),p(f,9,".");case":":return h(d),d.next(),p(f,10,":");default:return j(d)?(q=p(f,1,oo(d)),f.braceNest=0,f.inLinked=!1,q):x(d,f)||D(d,f)?(h(d),L(d,f)):I(d,f)?(h(d),p(f,12,Zo(d))):N(d,f)?(h(d),co==="{"?S(d,f)||q:p(f,11,T(d))):(R===8&&g(Y.INVALID_LINKED_FORMAT,n(),0),f.braceNest=0,f.inLinked=!1,F(d,f))}}function F(d,f){let R={type:14};if(f.braceNest>0)return S(d,f)||k(f);if(f.inLinked)return L(d,f)||k(f);switch(d.currentChar()){case"{":return S(d,f)||k(f);case"}":return g(Y.UNBALANCED_CLOSING_BRACE,n(),0),d.next(),p(f,3,"}");case"@":return L(d,f)||k(f);default:{if(j(d))return R=p(f,1,oo(d)),f.braceNest=0,f.inLinked=!1,R;const{isModulo:co,hasSpace:V}=W(d);if(co)return V?p(f,0,Io(d)):p(f,4,ue(d));if(P(d))return p(f,0,Io(d));break}}return R}function z(){const{currentType:d,offset:f,startLoc:R,endLoc:q}=l;return l.lastType=d,l.lastOffset=f,l.lastStartLoc=R,l.lastEndLoc=q,l.offset=a(),l.startLoc=n(),t.currentChar()===oe?p(l,14):F(t,l)}return{nextToken:z,currentOffset:a,currentPosition:n,context:s}}const Ri="parser",Ei=/(?:\\\\|\\'|\\u([0-9a-fA-F]{4})|\\U([0-9a-fA-F]{6}))/g;function Ii(o,e,r){switch(o){case"\\\\":return"\\";case"\\'":return"'";default:{const t=parseInt(e||r,16);return t<=55295||t>=57344?String.fromCodePoint(t):"�"}}}function Si(o={}){const e=o.location!==!1,{onError:r,onWarn:t}=o;function a(b,y,E,x,...I){const D=b.currentPosition();if(D.offset+=x,D.column+=x,r){const N=e?ir(E,D):null,j=Oe(y,N,{domain:Ri,args:I});r(j)}}function n(b,y,E,x,...I){const D=b.currentPosition();if(D.offset+=x,D.column+=x,t){const N=e?ir(E,D):null;t(hi(y,N,I))}}function i(b,y,E){const x={type:b};return e&&(x.start=y,x.end=y,x.loc={start:E,end:E}),x}function c(b,y,E,x){e&&(b.end=y,b.loc&&(b.loc.end=E))}function l(b,y){const E=b.context(),x=i(3,E.offset,E.startLoc);return x.value=y,c(x,b.currentOffset(),b.currentPosition()),x}function s(b,y){const E=b.context(),{lastOffset:x,lastStartLoc:I}=E,D=i(5,x,I);return D.index=parseInt(y,10),b.nextToken(),c(D,b.currentOffset(),b.currentPosition()),D}function u(b,y,E){const x=b.context(),{lastOffset:I,lastStartLoc:D}=x,N=i(4,I,D);return N.key=y,E===!0&&(N.modulo=!0),b.nextToken(),c(N,b.currentOffset(),b.currentPosition()),N}function g(b,y){const E=b.context(),{lastOffset:x,lastStartLoc:I}=E,D=i(9,x,I);return D.value=y.replace(Ei,Ii),b.nextToken(),c(D,b.currentOffset(),b.currentPosition()),D}function p(b){const y=b.nextToken(),E=b.context(),{lastOffset:x,lastStartLoc:I}=E,D=i(8,x,I);return y.type!==12?(a(b,Y.UNEXPECTED_EMPTY_LINKED_MODIFIER,E.lastStartLoc,0),D.value="",c(D,x,I),{nextConsumeToken:y,node:D}):(y.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,E.lastStartLoc,0,Do(y)),D.value=y.value||"",c(D,b.currentOffset(),b.currentPosition()),{node:D})}function k(b,y){const E=b.context(),x=i(7,E.offset,E.startLoc);return x.value=y,c(x,b.currentOffset(),b.currentPosition()),x}function m(b){const y=b.context(),E=i(6,y.offset,y.startLoc);let x=b.nextToken();if(x.type===9){const I=p(b);E.modifier=I.node,x=I.nextConsumeToken||b.nextToken()}switch(x.type!==10&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(x)),x=b.nextToken(),x.type===2&&(x=b.nextToken()),x.type){case 11:x.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(x)),E.key=k(b,x.value||"");break;case 5:x.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(x)),E.key=u(b,x.value||"");break;case 6:x.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(x)),E.key=s(b,x.value||"");break;case 7:x.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(x)),E.key=g(b,x.value||"");break;default:{a(b,Y.UNEXPECTED_EMPTY_LINKED_KEY,y.lastStartLoc,0);const I=b.context(),D=i(7,I.offset,I.startLoc);return D.value="",c(D,I.offset,I.startLoc),E.key=D,c(E,I.offset,I.startLoc),{nextConsumeToken:x,node:E}}}return c(E,b.currentOffset(),b.currentPosition()),{node:E}}function v(b){const y=b.context(),E=y.currentType===1?b.currentOffset():y.offset,x=y.currentType===1?y.endLoc:y.startLoc,I=i(2,E,x);I.items=[];let D=null,N=null;do{const P=D||b.nextToken();switch(D=null,P.type){case 0:P.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(P)),I.items.push(l(b,P.value||""));break;case 6:P.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(P)),I.items.push(s(b,P.value||""));break;case 4:N=!0;break;case 5:P.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(P)),I.items.push(u(b,P.value||"",!!N)),N&&(n(b,Jr.USE_MODULO_SYNTAX,y.lastStartLoc,0,Do(P)),N=null);break;case 7:P.value==null&&a(b,Y.UNEXPECTED_LEXICAL_ANALYSIS,y.lastStartLoc,0,Do(P)),I.items.push(g(b,P.value||""));break;case 8:{const no=m(b);I.items.push(no.node),D=no.nextConsumeToken||null;break}}}while(y.currentType!==14&&y.currentType!==1);const j=y.currentType===1?y.lastOffset:b.currentOffset(),W=y.currentType===1?y.lastEndLoc:b.currentPosition();return c(I,j,W),I}function h(b,y,E,x){const I=b.context();let D=x.items.length===0;const N=i(1,y,E);N.cases=[],N.cases.push(x);do{const j=v(b);D||(D=j.items.length===0),N.cases.push(j)}while(I.currentType!==14);return D&&a(b,Y.MUST_HAVE_MESSAGES_IN_PLURAL,E,0),c(N,b.currentOffset(),b.currentPosition()),N}function B(b){const y=b.context(),{offset:E,startLoc:x}=y,I=v(b);return y.currentType===14?I:h(b,E,x,I)}function A(b){const y=Bi(b,$n({},o)),E=y.context(),x=i(0,E.offset,E.startLoc);return e&&x.loc&&(x.loc.source=b),x.body=B(y),o.onCacheKey&&(x.cacheKey=o.onCacheKey(b)),E.currentType!==14&&a(y,Y.UNEXPECTED_LEXICAL_ANALYSIS,E.lastStartLoc,0,b[E.offset]||""),c(x,y.currentOffset(),y.currentPosition()),x}return{parse:A}}function Do(o){if(o.type===14)return"EOF";const e=(o.value||"").replace(/\r?\n/gu,"\\n");return e.length>10?e.slice(0,9)+"…":e}function Li(o,e={}){const r={ast:o,helpers:new Set};return{context:()=>r,helper:n=>(r.helpers.add(n),n)}}function mt(o,e){for(let r=0;r<o.length;r++)Qr(o[r],e)}function Qr(o,e){switch(o.type){case 1:mt(o.cases,e),e.helper("plural");break;case 2:mt(o.items,e);break;case 6:{Qr(o.key,e),e.helper("linked"),e.helper("type");break}case 5:e.helper("interpolate"),e.helper("list");break;case 4:e.helper("interpolate"),e.helper("named");break}}function Ti(o,e={}){const r=Li(o);r.helper("normalize"),o.body&&Qr(o.body,r);const t=r.context();o.helpers=Array.from(t.helpers)}function Ni(o){const e=o.body;return e.type===2?pt(e):e.cases.forEach(r=>pt(r)),o}function pt(o){if(o.items.length===1){const e=o.items[0];(e.type===3||e.type===9)&&(o.static=e.value,delete e.value)}else{const e=[];for(let r=0;r<o.items.length;r++){const t=o.items[r];if(!(t.type===3||t.type===9)||t.value==null)break;e.push(t.value)}if(e.length===o.items.length){o.static=_n(e);for(let r=0;r<o.items.length;r++){const t=o.items[r];(t.type===3||t.type===9)&&delete t.value}}}}const Di="minifier";function Ee(o){switch(o.t=o.type,o.type){case 0:{const e=o;Ee(e.body),e.b=e.body,delete e.body;break}case 1:{const e=o,r=e.cases;for(let t=0;t<r.length;t++)Ee(r[t]);e.c=r,delete e.cases;break}case 2:{const e=o,r=e.items;for(let t=0;t<r.length;t++)Ee(r[t]);e.i=r,delete e.items,e.static&&(e.s=e.static,delete e.static);break}case 3:case 9:case 8:case 7:{const e=o;e.value&&(e.v=e.value,delete e.value);break}case 6:{const e=o;Ee(e.key),e.k=e.key,delete e.key,e.modifier&&(Ee(e.modifier),e.m=e.modifier,delete e.modifier);break}case 5:{const e=o;e.i=e.index,delete e.index;break}case 4:{const e=o;e.k=e.key,delete e.key;break}default:throw Oe(Y.UNHANDLED_MINIFIER_NODE_TYPE,null,{domain:Di,args:[o.type]})}delete o.type}const Oi="parser";function Ai(o,e){const{filename:r,breakLineCode:t,needIndent:a}=e,n=e.location!==!1,i={filename:r,code:"",column:1,line:1,offset:0,map:void 0,breakLineCode:t,needIndent:a,indentLevel:0};n&&o.loc&&(i.source=o.loc.source);const c=()=>i;function l(v,h){i.code+=v}function s(v,h=!0){const B=h?t:"";l(a?B+"  ".repeat(v):B)}function u(v=!0){const h=++i.indentLevel;v&&s(h)}function g(v=!0){const h=--i.indentLevel;v&&s(h)}function p(){s(i.indentLevel)}return{context:c,push:l,indent:u,deindent:g,newline:p,helper:v=>`_${v}`,needIndent:()=>i.needIndent}}function Pi(o,e){const{helper:r}=o;o.push(`${r("linked")}(`),Le(o,e.key),e.modifier?(o.push(", "),Le(o,e.modifier),o.push(", _type")):o.push(", undefined, _type"),o.push(")")}function Fi(o,e){const{helper:r,needIndent:t}=o;o.push(`${r("normalize")}([`),o.indent(t());const a=e.items.length;for(let n=0;n<a&&(Le(o,e.items[n]),n!==a-1);n++)o.push(", ");o.deindent(t()),o.push("])")}function zi(o,e){const{helper:r,needIndent:t}=o;if(e.cases.length>1){o.push(`${r("plural")}([`),o.indent(t());const a=e.cases.length;for(let n=0;n<a&&(Le(o,e.cases[n]),n!==a-1);n++)o.push(", ");o.deindent(t()),o.push("])")}}function Mi(o,e){e.body?Le(o,e.body):o.push("null")}function Le(o,e){const{helper:r}=o;switch(e.type){case 0:Mi(o,e);break;case 1:zi(o,e);break;case 2:Fi(o,e);break;case 6:Pi(o,e);break;case 8:o.push(JSON.stringify(e.value),e);break;case 7:o.push(JSON.stringify(e.value),e);break;case 5:o.push(`${r("interpolate")}(${r("list")}(${e.index}))`,e);break;case 4:o.push(`${r("interpolate")}(${r("named")}(${JSON.stringify(e.key)}))`,e);break;case 9:o.push(JSON.stringify(e.value),e);break;case 3:o.push(JSON.stringify(e.value),e);break;default:throw Oe(Y.UNHANDLED_CODEGEN_NODE_TYPE,null,{domain:Oi,args:[e.type]})}}const Wi=(o,e={})=>{const r=ft(e.mode)?e.mode:"normal",t=ft(e.filename)?e.filename:"message.intl";e.sourceMap;const a=e.breakLineCode!=null?e.breakLineCode:r==="arrow"?";":`
-`,n=e.needIndent?e.needIndent:r!=="arrow",i=o.helpers||[],c=Ai(o,{filename:t,breakLineCode:a,needIndent:n});c.push(r==="normal"?"function __msg__ (ctx) {":"(ctx) => {"),c.indent(n),i.length>0&&(c.push(`const { ${_n(i.map(u=>`${u}: _${u}`),", ")} } = ctx`),c.newline()),c.push("return "),Le(c,o),c.deindent(n),c.push("}"),delete o.helpers;const{code:l,map:s}=c.context();return{ast:o,code:l,map:s?s.toJSON():void 0}};function Ui(o,e={}){const r=$n({},e),t=!!r.jit,a=!!r.minify,n=r.optimize==null?!0:r.optimize,c=Si(r).parse(o);return t?(n&&Ni(c),a&&Ee(c),{ast:c,code:""}):(Ti(c,r),Wi(c,r))}/*!
-  * core-base v9.14.4
-  * (c) 2025 kazuya kawaguchi
-  * Released under the MIT License.
-  */function qi(){typeof __INTLIFY_PROD_DEVTOOLS__!="boolean"&&(Go().__INTLIFY_PROD_DEVTOOLS__=!1),typeof __INTLIFY_JIT_COMPILATION__!="boolean"&&(Go().__INTLIFY_JIT_COMPILATION__=!1),typeof __INTLIFY_DROP_MESSAGE_COMPILER__!="boolean"&&(Go().__INTLIFY_DROP_MESSAGE_COMPILER__=!1)}function Uo(o){return ro(o)&&Zr(o)===0&&(Ao(o,"b")||Ao(o,"body"))}const xn=["b","body"];function Hi(o){return ne(o,xn)}const Bn=["c","cases"];function ji(o){return ne(o,Bn,[])}const Rn=["s","static"];function Vi(o){return ne(o,Rn)}const En=["i","items"];function Yi(o){return ne(o,En,[])}const In=["t","type"];function Zr(o){return ne(o,In)}const Sn=["v","value"];function Ze(o,e){const r=ne(o,Sn);if(r!=null)return r;throw Ue(e)}const Ln=["m","modifier"];function Xi(o){return ne(o,Ln)}const Tn=["k","key"];function Gi(o){const e=ne(o,Tn);if(e)return e;throw Ue(6)}function ne(o,e,r){for(let t=0;t<e.length;t++){const a=e[t];if(Ao(o,a)&&o[a]!=null)return o[a]}return r}const Nn=[...xn,...Bn,...Rn,...En,...Tn,...Ln,...Sn,...In];function Ue(o){return new Error(`unhandled node type: ${o}`)}const ae=[];ae[0]={w:[0],i:[3,0],"[":[4],o:[7]};ae[1]={w:[1],".":[2],"[":[4],o:[7]};ae[2]={w:[2],i:[3,0],0:[3,0]};ae[3]={i:[3,0],0:[3,0],w:[1,1],".":[2,1],"[":[4,1],o:[7,1]};ae[4]={"'":[5,0],'"':[6,0],"[":[4,2],"]":[1,3],o:8,l:[4,0]};ae[5]={"'":[4,0],o:8,l:[5,0]};ae[6]={'"':[4,0],o:8,l:[6,0]};const Ki=/^\s?(?:true|false|-?[\d.]+|'[^']*'|"[^"]*")\s?$/;function Ji(o){return Ki.test(o)}function Qi(o){const e=o.charCodeAt(0),r=o.charCodeAt(o.length-1);return e===r&&(e===34||e===39)?o.slice(1,-1):o}function Zi(o){if(o==null)return"o";switch(o.charCodeAt(0)){case 91:case 93:case 46:case 34:case 39:return o;case 95:case 36:case 45:return"i";case 9:case 10:case 13:case 160:case 65279:case 8232:case 8233:return"w"}return"i"}function oc(o){const e=o.trim();return o.charAt(0)==="0"&&isNaN(parseInt(o))?!1:Ji(e)?Qi(e):"*"+e}function ec(o){const e=[];let r=-1,t=0,a=0,n,i,c,l,s,u,g;const p=[];p[0]=()=>{i===void 0?i=c:i+=c},p[1]=()=>{i!==void 0&&(e.push(i),i=void 0)},p[2]=()=>{p[0](),a++},p[3]=()=>{if(a>0)a--,t=4,p[0]();else{if(a=0,i===void 0||(i=oc(i),i===!1))return!1;p[1]()}};function k(){const m=o[r+1];if(t===5&&m==="'"||t===6&&m==='"')return r++,c="\\"+m,p[0](),!0}for(;t!==null;)if(r++,n=o[r],!(n==="\\"&&k())){if(l=Zi(n),g=ae[t],s=g[l]||g.l||8,s===8||(t=s[0],s[1]!==void 0&&(u=p[s[1]],u&&(c=n,u()===!1))))return;if(t===7)return e}}const bt=new Map;function rc(o,e){return ro(o)?o[e]:null}function tc(o,e){if(!ro(o))return null;let r=bt.get(e);if(r||(r=ec(e),r&&bt.set(e,r)),!r)return null;const t=r.length;let a=o,n=0;for(;n<t;){const i=r[n];if(Nn.includes(i)&&Uo(a))return null;const c=a[i];if(c===void 0||so(a))return null;a=c,n++}return a}const nc=o=>o,ac=o=>"",ic="text",cc=o=>o.length===0?"":ui(o),lc=di;function ht(o,e){return o=Math.abs(o),e===2?o?o>1?1:0:1:o?Math.min(o,2):0}function sc(o){const e=mo(o.pluralIndex)?o.pluralIndex:-1;return o.named&&(mo(o.named.count)||mo(o.named.n))?mo(o.named.count)?o.named.count:mo(o.named.n)?o.named.n:e:e}function dc(o,e){e.count||(e.count=o),e.n||(e.n=o)}function uc(o={}){const e=o.locale,r=sc(o),t=ro(o.pluralRules)&&O(e)&&so(o.pluralRules[e])?o.pluralRules[e]:ht,a=ro(o.pluralRules)&&O(e)&&so(o.pluralRules[e])?ht:void 0,n=B=>B[t(r,B.length,a)],i=o.list||[],c=B=>i[B],l=o.named||io();mo(o.pluralIndex)&&dc(r,l);const s=B=>l[B];function u(B){const A=so(o.messages)?o.messages(B):ro(o.messages)?o.messages[B]:!1;return A||(o.parent?o.parent.message(B):ac)}const g=B=>o.modifiers?o.modifiers[B]:nc,p=G(o.processor)&&so(o.processor.normalize)?o.processor.normalize:cc,k=G(o.processor)&&so(o.processor.interpolate)?o.processor.interpolate:lc,m=G(o.processor)&&O(o.processor.type)?o.processor.type:ic,h={list:c,named:s,plural:n,linked:(B,...A)=>{const[b,y]=A;let E="text",x="";A.length===1?ro(b)?(x=b.modifier||x,E=b.type||E):O(b)&&(x=b||x):A.length===2&&(O(b)&&(x=b||x),O(y)&&(E=y||E));const I=u(B)(h),D=E==="vnode"&&uo(I)&&x?I[0]:I;return x?g(x)(D,E):D},message:u,type:m,interpolate:k,normalize:p,values:ko(io(),i,l)};return h}let qe=null;function fc(o){qe=o}function gc(o,e,r){qe&&qe.emit("i18n:init",{timestamp:Date.now(),i18n:o,version:e,meta:r})}const mc=pc("function:translate");function pc(o){return e=>qe&&qe.emit(o,e)}const bc=Jr.__EXTEND_POINT__,ve=ur(bc),hc={FALLBACK_TO_TRANSLATE:ve(),CANNOT_FORMAT_NUMBER:ve(),FALLBACK_TO_NUMBER_FORMAT:ve(),CANNOT_FORMAT_DATE:ve(),FALLBACK_TO_DATE_FORMAT:ve(),EXPERIMENTAL_CUSTOM_MESSAGE_COMPILER:ve(),__EXTEND_POINT__:ve()},Dn=Y.__EXTEND_POINT__,ke=ur(Dn),Po={INVALID_ARGUMENT:Dn,INVALID_DATE_ARGUMENT:ke(),INVALID_ISO_DATE_ARGUMENT:ke(),NOT_SUPPORT_NON_STRING_MESSAGE:ke(),NOT_SUPPORT_LOCALE_PROMISE_VALUE:ke(),NOT_SUPPORT_LOCALE_ASYNC_FUNCTION:ke(),NOT_SUPPORT_LOCALE_TYPE:ke(),__EXTEND_POINT__:ke()};function Wo(o){return Oe(o,null,void 0)}function ot(o,e){return e.locale!=null?vt(e.locale):vt(o.locale)}let _r;function vt(o){if(O(o))return o;if(so(o)){if(o.resolvedOnce&&_r!=null)return _r;if(o.constructor.name==="Function"){const e=o();if(si(e))throw Wo(Po.NOT_SUPPORT_LOCALE_PROMISE_VALUE);return _r=e}else throw Wo(Po.NOT_SUPPORT_LOCALE_ASYNC_FUNCTION)}else throw Wo(Po.NOT_SUPPORT_LOCALE_TYPE)}function vc(o,e,r){return[...new Set([r,...uo(e)?e:ro(e)?Object.keys(e):O(e)?[e]:[r]])]}function On(o,e,r){const t=O(r)?r:Te,a=o;a.__localeChainCache||(a.__localeChainCache=new Map);let n=a.__localeChainCache.get(t);if(!n){n=[];let i=[r];for(;uo(i);)i=kt(n,i,e);const c=uo(e)||!G(e)?e:e.default?e.default:null;i=O(c)?[c]:c,uo(i)&&kt(n,i,!1),a.__localeChainCache.set(t,n)}return n}function kt(o,e,r){let t=!0;for(let a=0;a<e.length&&Q(t);a++){const n=e[a];O(n)&&(t=kc(o,e[a],r))}return t}function kc(o,e,r){let t;const a=e.split("-");do{const n=a.join("-");t=yc(o,n,r),a.splice(-1,1)}while(a.length&&t===!0);return t}function yc(o,e,r){let t=!1;if(!o.includes(e)&&(t=!0,e)){t=e[e.length-1]!=="!";const a=e.replace(/!/g,"");o.push(a),(uo(r)||G(r))&&r[a]&&(t=r[a])}return t}const Cc="9.14.4",fr=-1,Te="en-US",yt="",Ct=o=>`${o.charAt(0).toLocaleUpperCase()}${o.substr(1)}`;function wc(){return{upper:(o,e)=>e==="text"&&O(o)?o.toUpperCase():e==="vnode"&&ro(o)&&"__v_isVNode"in o?o.children.toUpperCase():o,lower:(o,e)=>e==="text"&&O(o)?o.toLowerCase():e==="vnode"&&ro(o)&&"__v_isVNode"in o?o.children.toLowerCase():o,capitalize:(o,e)=>e==="text"&&O(o)?Ct(o):e==="vnode"&&ro(o)&&"__v_isVNode"in o?Ct(o.children):o}}let An;function wt(o){An=o}let Pn;function $c(o){Pn=o}let Fn;function _c(o){Fn=o}let zn=null;const xc=o=>{zn=o},Bc=()=>zn;let Mn=null;const $t=o=>{Mn=o},Rc=()=>Mn;let _t=0;function Ec(o={}){const e=so(o.onWarn)?o.onWarn:fi,r=O(o.version)?o.version:Cc,t=O(o.locale)||so(o.locale)?o.locale:Te,a=so(t)?Te:t,n=uo(o.fallbackLocale)||G(o.fallbackLocale)||O(o.fallbackLocale)||o.fallbackLocale===!1?o.fallbackLocale:a,i=G(o.messages)?o.messages:xr(a),c=G(o.datetimeFormats)?o.datetimeFormats:xr(a),l=G(o.numberFormats)?o.numberFormats:xr(a),s=ko(io(),o.modifiers,wc()),u=o.pluralRules||io(),g=so(o.missing)?o.missing:null,p=Q(o.missingWarn)||re(o.missingWarn)?o.missingWarn:!0,k=Q(o.fallbackWarn)||re(o.fallbackWarn)?o.fallbackWarn:!0,m=!!o.fallbackFormat,v=!!o.unresolving,h=so(o.postTranslation)?o.postTranslation:null,B=G(o.processor)?o.processor:null,A=Q(o.warnHtmlMessage)?o.warnHtmlMessage:!0,b=!!o.escapeParameter,y=so(o.messageCompiler)?o.messageCompiler:An,E=so(o.messageResolver)?o.messageResolver:Pn||rc,x=so(o.localeFallbacker)?o.localeFallbacker:Fn||vc,I=ro(o.fallbackContext)?o.fallbackContext:void 0,D=o,N=ro(D.__datetimeFormatters)?D.__datetimeFormatters:new Map,j=ro(D.__numberFormatters)?D.__numberFormatters:new Map,W=ro(D.__meta)?D.__meta:{};_t++;const P={version:r,cid:_t,locale:t,fallbackLocale:n,messages:i,modifiers:s,pluralRules:u,missing:g,missingWarn:p,fallbackWarn:k,fallbackFormat:m,unresolving:v,postTranslation:h,processor:B,warnHtmlMessage:A,escapeParameter:b,messageCompiler:y,messageResolver:E,localeFallbacker:x,fallbackContext:I,onWarn:e,__meta:W};return P.datetimeFormats=c,P.numberFormats=l,P.__datetimeFormatters=N,P.__numberFormatters=j,__INTLIFY_PROD_DEVTOOLS__&&gc(P,r,W),P}const xr=o=>({[o]:io()});function et(o,e,r,t,a){const{missing:n,onWarn:i}=o;if(n!==null){const c=n(o,r,e,a);return O(c)?c:e}else return e}function Fe(o,e,r){const t=o;t.__localeChainCache=new Map,o.localeFallbacker(o,r,e)}function Ic(o,e){return o===e?!1:o.split("-")[0]===e.split("-")[0]}function Sc(o,e){const r=e.indexOf(o);if(r===-1)return!1;for(let t=r+1;t<e.length;t++)if(Ic(o,e[t]))return!0;return!1}function Br(o){return r=>Lc(r,o)}function Lc(o,e){const r=Hi(e);if(r==null)throw Ue(0);if(Zr(r)===1){const n=ji(r);return o.plural(n.reduce((i,c)=>[...i,xt(o,c)],[]))}else return xt(o,r)}function xt(o,e){const r=Vi(e);if(r!=null)return o.type==="text"?r:o.normalize([r]);{const t=Yi(e).reduce((a,n)=>[...a,Sr(o,n)],[]);return o.normalize(t)}}function Sr(o,e){const r=Zr(e);switch(r){case 3:return Ze(e,r);case 9:return Ze(e,r);case 4:{const t=e;if(Ao(t,"k")&&t.k)return o.interpolate(o.named(t.k));if(Ao(t,"key")&&t.key)return o.interpolate(o.named(t.key));throw Ue(r)}case 5:{const t=e;if(Ao(t,"i")&&mo(t.i))return o.interpolate(o.list(t.i));if(Ao(t,"index")&&mo(t.index))return o.interpolate(o.list(t.index));throw Ue(r)}case 6:{const t=e,a=Xi(t),n=Gi(t);return o.linked(Sr(o,n),a?Sr(o,a):void 0,o.type)}case 7:return Ze(e,r);case 8:return Ze(e,r);default:throw new Error(`unhandled node on format message part: ${r}`)}}const Wn=o=>o;let Ie=io();function Un(o,e={}){let r=!1;const t=e.onError||ki;return e.onError=a=>{r=!0,t(a)},Je(be({},Ui(o,e)),{detectError:r})}const Tc=(o,e)=>{if(!O(o))throw Wo(Po.NOT_SUPPORT_NON_STRING_MESSAGE);{Q(e.warnHtmlMessage)&&e.warnHtmlMessage;const t=(e.onCacheKey||Wn)(o),a=Ie[t];if(a)return a;const{code:n,detectError:i}=Un(o,e),c=new Function(`return ${n}`)();return i?c:Ie[t]=c}};function Nc(o,e){if(__INTLIFY_JIT_COMPILATION__&&!__INTLIFY_DROP_MESSAGE_COMPILER__&&O(o)){Q(e.warnHtmlMessage)&&e.warnHtmlMessage;const t=(e.onCacheKey||Wn)(o),a=Ie[t];if(a)return a;const{ast:n,detectError:i}=Un(o,Je(be({},e),{location:!1,jit:!0})),c=Br(n);return i?c:Ie[t]=c}else{const r=o.cacheKey;if(r){const t=Ie[r];return t||(Ie[r]=Br(o))}else return Br(o)}}const Bt=()=>"",So=o=>so(o);function Rt(o,...e){const{fallbackFormat:r,postTranslation:t,unresolving:a,messageCompiler:n,fallbackLocale:i,messages:c}=o,[l,s]=Lr(...e),u=Q(s.missingWarn)?s.missingWarn:o.missingWarn,g=Q(s.fallbackWarn)?s.fallbackWarn:o.fallbackWarn,p=Q(s.escapeParameter)?s.escapeParameter:o.escapeParameter,k=!!s.resolvedMessage,m=O(s.default)||Q(s.default)?Q(s.default)?n?l:()=>l:s.default:r?n?l:()=>l:"",v=r||m!=="",h=ot(o,s);p&&Dc(s);let[B,A,b]=k?[l,h,c[h]||io()]:qn(o,l,h,i,g,u),y=B,E=l;if(!k&&!(O(y)||Uo(y)||So(y))&&v&&(y=m,E=y),!k&&(!(O(y)||Uo(y)||So(y))||!O(A)))return a?fr:l;let x=!1;const I=()=>{x=!0},D=So(y)?y:Hn(o,l,A,y,E,I);if(x)return y;const N=Pc(o,A,b,s),j=uc(N),W=Oc(o,D,j),P=t?t(W,l):W;if(__INTLIFY_PROD_DEVTOOLS__){const no={timestamp:Date.now(),key:O(l)?l:So(y)?y.key:"",locale:A||(So(y)?y.locale:""),format:O(y)?y:So(y)?y.source:"",message:P};no.meta=ko({},o.__meta,Bc()||{}),mc(no)}return P}function Dc(o){uo(o.list)?o.list=o.list.map(e=>O(e)?ut(e):e):ro(o.named)&&Object.keys(o.named).forEach(e=>{O(o.named[e])&&(o.named[e]=ut(o.named[e]))})}function qn(o,e,r,t,a,n){const{messages:i,onWarn:c,messageResolver:l,localeFallbacker:s}=o,u=s(o,t,r);let g=io(),p,k=null;const m="translate";for(let v=0;v<u.length&&(p=u[v],g=i[p]||io(),(k=l(g,e))===null&&(k=g[e]),!(O(k)||Uo(k)||So(k)));v++)if(!Sc(p,u)){const h=et(o,e,p,n,m);h!==e&&(k=h)}return[k,p,g]}function Hn(o,e,r,t,a,n){const{messageCompiler:i,warnHtmlMessage:c}=o;if(So(t)){const s=t;return s.locale=s.locale||r,s.key=s.key||e,s}if(i==null){const s=()=>t;return s.locale=r,s.key=e,s}const l=i(t,Ac(o,r,a,t,c,n));return l.locale=r,l.key=e,l.source=t,l}function Oc(o,e,r){return e(r)}function Lr(...o){const[e,r,t]=o,a=io();if(!O(e)&&!mo(e)&&!So(e)&&!Uo(e))throw Wo(Po.INVALID_ARGUMENT);const n=mo(e)?String(e):(So(e),e);return mo(r)?a.plural=r:O(r)?a.default=r:G(r)&&!dr(r)?a.named=r:uo(r)&&(a.list=r),mo(t)?a.plural=t:O(t)?a.default=t:G(t)&&ko(a,t),[n,a]}function Ac(o,e,r,t,a,n){return{locale:e,key:r,warnHtmlMessage:a,onError:i=>{throw n&&n(i),i},onCacheKey:i=>ni(e,r,i)}}function Pc(o,e,r,t){const{modifiers:a,pluralRules:n,messageResolver:i,fallbackLocale:c,fallbackWarn:l,missingWarn:s,fallbackContext:u}=o,p={locale:e,modifiers:a,pluralRules:n,messages:k=>{let m=i(r,k);if(m==null&&u){const[,,v]=qn(u,k,e,c,l,s);m=i(v,k)}if(O(m)||Uo(m)){let v=!1;const B=Hn(o,k,e,m,k,()=>{v=!0});return v?Bt:B}else return So(m)?m:Bt}};return o.processor&&(p.processor=o.processor),t.list&&(p.list=t.list),t.named&&(p.named=t.named),mo(t.plural)&&(p.pluralIndex=t.plural),p}function Et(o,...e){const{datetimeFormats:r,unresolving:t,fallbackLocale:a,onWarn:n,localeFallbacker:i}=o,{__datetimeFormatters:c}=o,[l,s,u,g]=Tr(...e),p=Q(u.missingWarn)?u.missingWarn:o.missingWarn;Q(u.fallbackWarn)?u.fallbackWarn:o.fallbackWarn;const k=!!u.part,m=ot(o,u),v=i(o,a,m);if(!O(l)||l==="")return new Intl.DateTimeFormat(m,g).format(s);let h={},B,A=null;const b="datetime format";for(let x=0;x<v.length&&(B=v[x],h=r[B]||{},A=h[l],!G(A));x++)et(o,l,B,p,b);if(!G(A)||!O(B))return t?fr:l;let y=`${B}__${l}`;dr(g)||(y=`${y}__${JSON.stringify(g)}`);let E=c.get(y);return E||(E=new Intl.DateTimeFormat(B,ko({},A,g)),c.set(y,E)),k?E.formatToParts(s):E.format(s)}const jn=["localeMatcher","weekday","era","year","month","day","hour","minute","second","timeZoneName","formatMatcher","hour12","timeZone","dateStyle","timeStyle","calendar","dayPeriod","numberingSystem","hourCycle","fractionalSecondDigits"];function Tr(...o){const[e,r,t,a]=o,n=io();let i=io(),c;if(O(e)){const l=e.match(/(\d{4}-\d{2}-\d{2})(T|\s)?(.*)/);if(!l)throw Wo(Po.INVALID_ISO_DATE_ARGUMENT);const s=l[3]?l[3].trim().startsWith("T")?`${l[1].trim()}${l[3].trim()}`:`${l[1].trim()}T${l[3].trim()}`:l[1].trim();c=new Date(s);try{c.toISOString()}catch(u){throw Wo(Po.INVALID_ISO_DATE_ARGUMENT)}}else if(ii(e)){if(isNaN(e.getTime()))throw Wo(Po.INVALID_DATE_ARGUMENT);c=e}else if(mo(e))c=e;else throw Wo(Po.INVALID_ARGUMENT);return O(r)?n.key=r:G(r)&&Object.keys(r).forEach(l=>{jn.includes(l)?i[l]=r[l]:n[l]=r[l]}),O(t)?n.locale=t:G(t)&&(i=t),G(a)&&(i=a),[n.key||"",c,n,i]}function It(o,e,r){const t=o;for(const a in r){const n=`${e}__${a}`;t.__datetimeFormatters.has(n)&&t.__datetimeFormatters.delete(n)}}function St(o,...e){const{numberFormats:r,unresolving:t,fallbackLocale:a,onWarn:n,localeFallbacker:i}=o,{__numberFormatters:c}=o,[l,s,u,g]=Nr(...e),p=Q(u.missingWarn)?u.missingWarn:o.missingWarn;Q(u.fallbackWarn)?u.fallbackWarn:o.fallbackWarn;const k=!!u.part,m=ot(o,u),v=i(o,a,m);if(!O(l)||l==="")return new Intl.NumberFormat(m,g).format(s);let h={},B,A=null;const b="number format";for(let x=0;x<v.length&&(B=v[x],h=r[B]||{},A=h[l],!G(A));x++)et(o,l,B,p,b);if(!G(A)||!O(B))return t?fr:l;let y=`${B}__${l}`;dr(g)||(y=`${y}__${JSON.stringify(g)}`);let E=c.get(y);return E||(E=new Intl.NumberFormat(B,ko({},A,g)),c.set(y,E)),k?E.formatToParts(s):E.format(s)}const Vn=["localeMatcher","style","currency","currencyDisplay","currencySign","useGrouping","minimumIntegerDigits","minimumFractionDigits","maximumFractionDigits","minimumSignificantDigits","maximumSignificantDigits","compactDisplay","notation","signDisplay","unit","unitDisplay","roundingMode","roundingPriority","roundingIncrement","trailingZeroDisplay"];function Nr(...o){const[e,r,t,a]=o,n=io();let i=io();if(!mo(e))throw Wo(Po.INVALID_ARGUMENT);const c=e;return O(r)?n.key=r:G(r)&&Object.keys(r).forEach(l=>{Vn.includes(l)?i[l]=r[l]:n[l]=r[l]}),O(t)?n.locale=t:G(t)&&(i=t),G(a)&&(i=a),[n.key||"",c,n,i]}function Lt(o,e,r){const t=o;for(const a in r){const n=`${e}__${a}`;t.__numberFormatters.has(n)&&t.__numberFormatters.delete(n)}}qi();/*!
-  * vue-i18n v9.14.4
-  * (c) 2025 kazuya kawaguchi
-  * Released under the MIT License.
-  */const Fc="9.14.4";function zc(){typeof __VUE_I18N_FULL_INSTALL__!="boolean"&&(Go().__VUE_I18N_FULL_INSTALL__=!0),typeof __VUE_I18N_LEGACY_API__!="boolean"&&(Go().__VUE_I18N_LEGACY_API__=!0),typeof __INTLIFY_JIT_COMPILATION__!="boolean"&&(Go().__INTLIFY_JIT_COMPILATION__=!1),typeof __INTLIFY_DROP_MESSAGE_COMPILER__!="boolean"&&(Go().__INTLIFY_DROP_MESSAGE_COMPILER__=!1),typeof __INTLIFY_PROD_DEVTOOLS__!="boolean"&&(Go().__INTLIFY_PROD_DEVTOOLS__=!1)}const Mc=hc.__EXTEND_POINT__,Yo=ur(Mc);Yo(),Yo(),Yo(),Yo(),Yo(),Yo(),Yo(),Yo(),Yo();const Yn=Po.__EXTEND_POINT__,$o=ur(Yn),bo={UNEXPECTED_RETURN_TYPE:Yn,INVALID_ARGUMENT:$o(),MUST_BE_CALL_SETUP_TOP:$o(),NOT_INSTALLED:$o(),NOT_AVAILABLE_IN_LEGACY_MODE:$o(),REQUIRED_VALUE:$o(),INVALID_VALUE:$o(),CANNOT_SETUP_VUE_DEVTOOLS_PLUGIN:$o(),NOT_INSTALLED_WITH_PROVIDE:$o(),UNEXPECTED_ERROR:$o(),NOT_COMPATIBLE_LEGACY_VUE_I18N:$o(),BRIDGE_SUPPORT_VUE_2_ONLY:$o(),MUST_DEFINE_I18N_OPTION_IN_ALLOW_COMPOSITION:$o(),NOT_AVAILABLE_COMPOSITION_IN_LEGACY:$o(),__EXTEND_POINT__:$o()};function ho(o,...e){return Oe(o,null,void 0)}const Dr=te("__translateVNode"),Or=te("__datetimeParts"),Ar=te("__numberParts"),Xn=te("__setPluralRules"),Gn=te("__injectWithOption"),Pr=te("__dispose");function He(o){if(!ro(o)||Uo(o))return o;for(const e in o)if(Ao(o,e))if(!e.includes("."))ro(o[e])&&He(o[e]);else{const r=e.split("."),t=r.length-1;let a=o,n=!1;for(let i=0;i<t;i++){if(r[i]==="__proto__")throw new Error(`unsafe key: ${r[i]}`);if(r[i]in a||(a[r[i]]=io()),!ro(a[r[i]])){n=!0;break}a=a[r[i]]}if(n||(Uo(a)?Nn.includes(r[t])||delete o[e]:(a[r[t]]=o[e],delete o[e])),!Uo(a)){const i=a[r[t]];ro(i)&&He(i)}}return o}function gr(o,e){const{messages:r,__i18n:t,messageResolver:a,flatJson:n}=e,i=G(r)?r:uo(t)?io():{[o]:io()};if(uo(t)&&t.forEach(c=>{if("locale"in c&&"resource"in c){const{locale:l,resource:s}=c;l?(i[l]=i[l]||io(),er(s,i[l])):er(s,i)}else O(c)&&er(JSON.parse(c),i)}),a==null&&n)for(const c in i)Ao(i,c)&&He(i[c]);return i}function Kn(o){return o.type}function Jn(o,e,r){let t=ro(e.messages)?e.messages:io();"__i18nGlobal"in r&&(t=gr(o.locale.value,{messages:t,__i18n:r.__i18nGlobal}));const a=Object.keys(t);a.length&&a.forEach(n=>{o.mergeLocaleMessage(n,t[n])});{if(ro(e.datetimeFormats)){const n=Object.keys(e.datetimeFormats);n.length&&n.forEach(i=>{o.mergeDateTimeFormat(i,e.datetimeFormats[i])})}if(ro(e.numberFormats)){const n=Object.keys(e.numberFormats);n.length&&n.forEach(i=>{o.mergeNumberFormat(i,e.numberFormats[i])})}}}function Tt(o){return H(Pa,null,o,0)}const Nt="__INTLIFY_META__",Dt=()=>[],Wc=()=>!1;let Ot=0;function At(o){return(e,r,t,a)=>o(r,t,Me()||void 0,a)}const Uc=()=>{const o=Me();let e=null;return o&&(e=Kn(o)[Nt])?{[Nt]:e}:null};function rt(o={},e){const{__root:r,__injectWithOption:t}=o,a=r===void 0,n=o.flatJson,i=ar?lo:fn,c=!!o.translateExistCompatible;let l=Q(o.inheritLocale)?o.inheritLocale:!0;const s=i(r&&l?r.locale.value:O(o.locale)?o.locale:Te),u=i(r&&l?r.fallbackLocale.value:O(o.fallbackLocale)||uo(o.fallbackLocale)||G(o.fallbackLocale)||o.fallbackLocale===!1?o.fallbackLocale:s.value),g=i(gr(s.value,o)),p=i(G(o.datetimeFormats)?o.datetimeFormats:{[s.value]:{}}),k=i(G(o.numberFormats)?o.numberFormats:{[s.value]:{}});let m=r?r.missingWarn:Q(o.missingWarn)||re(o.missingWarn)?o.missingWarn:!0,v=r?r.fallbackWarn:Q(o.fallbackWarn)||re(o.fallbackWarn)?o.fallbackWarn:!0,h=r?r.fallbackRoot:Q(o.fallbackRoot)?o.fallbackRoot:!0,B=!!o.fallbackFormat,A=so(o.missing)?o.missing:null,b=so(o.missing)?At(o.missing):null,y=so(o.postTranslation)?o.postTranslation:null,E=r?r.warnHtmlMessage:Q(o.warnHtmlMessage)?o.warnHtmlMessage:!0,x=!!o.escapeParameter;const I=r?r.modifiers:G(o.modifiers)?o.modifiers:{};let D=o.pluralRules||r&&r.pluralRules,N;N=(()=>{a&&$t(null);const $={version:Fc,locale:s.value,fallbackLocale:u.value,messages:g.value,modifiers:I,pluralRules:D,missing:b===null?void 0:b,missingWarn:m,fallbackWarn:v,fallbackFormat:B,unresolving:!0,postTranslation:y===null?void 0:y,warnHtmlMessage:E,escapeParameter:x,messageResolver:o.messageResolver,messageCompiler:o.messageCompiler,__meta:{framework:"vue"}};$.datetimeFormats=p.value,$.numberFormats=k.value,$.__datetimeFormatters=G(N)?N.__datetimeFormatters:void 0,$.__numberFormatters=G(N)?N.__numberFormatters:void 0;const _=Ec($);return a&&$t(_),_})(),Fe(N,s.value,u.value);function W(){return[s.value,u.value,g.value,p.value,k.value]}const P=X({get:()=>s.value,set:$=>{s.value=$,N.locale=s.value}}),no=X({get:()=>u.value,set:$=>{u.value=$,N.fallbackLocale=u.value,Fe(N,s.value,$)}}),ie=X(()=>g.value),xo=X(()=>p.value),wo=X(()=>k.value);function ce(){return so(y)?y:null}function le($){y=$,N.postTranslation=$}function se(){return A}function de($){$!==null&&(b=At($)),A=$,N.missing=b}const Bo=($,_,eo,fo,No,pe)=>{W();let jo;try{__INTLIFY_PROD_DEVTOOLS__,a||(N.fallbackContext=r?Rc():void 0),jo=$(N)}finally{__INTLIFY_PROD_DEVTOOLS__,a||(N.fallbackContext=void 0)}if(eo!=="translate exists"&&mo(jo)&&jo===fr||eo==="translate exists"&&!jo){const[Ke,yr]=_();return r&&h?fo(r):No(Ke)}else{if(pe(jo))return jo;throw ho(bo.UNEXPECTED_RETURN_TYPE)}};function qo(...$){return Bo(_=>Reflect.apply(Rt,null,[_,...$]),()=>Lr(...$),"translate",_=>Reflect.apply(_.t,_,[...$]),_=>_,_=>O(_))}function ue(...$){const[_,eo,fo]=$;if(fo&&!ro(fo))throw ho(bo.INVALID_ARGUMENT);return qo(_,eo,ko({resolvedMessage:!0},fo||{}))}function Io(...$){return Bo(_=>Reflect.apply(Et,null,[_,...$]),()=>Tr(...$),"datetime format",_=>Reflect.apply(_.d,_,[...$]),()=>yt,_=>O(_))}function Jo(...$){return Bo(_=>Reflect.apply(St,null,[_,...$]),()=>Nr(...$),"number format",_=>Reflect.apply(_.n,_,[...$]),()=>yt,_=>O(_))}function Ho($){return $.map(_=>O(_)||mo(_)||Q(_)?Tt(String(_)):_)}const To={normalize:Ho,interpolate:$=>$,type:"vnode"};function fe(...$){return Bo(_=>{let eo;const fo=_;try{fo.processor=To,eo=Reflect.apply(Rt,null,[fo,...$])}finally{fo.processor=null}return eo},()=>Lr(...$),"translate",_=>_[Dr](...$),_=>[Tt(_)],_=>uo(_))}function Qo(...$){return Bo(_=>Reflect.apply(St,null,[_,...$]),()=>Nr(...$),"number format",_=>_[Ar](...$),Dt,_=>O(_)||uo(_))}function ge(...$){return Bo(_=>Reflect.apply(Et,null,[_,...$]),()=>Tr(...$),"datetime format",_=>_[Or](...$),Dt,_=>O(_)||uo(_))}function me($){D=$,N.pluralRules=D}function Zo($,_){return Bo(()=>{if(!$)return!1;const eo=O(_)?_:s.value,fo=S(eo),No=N.messageResolver(fo,$);return c?No!=null:Uo(No)||So(No)||O(No)},()=>[$],"translate exists",eo=>Reflect.apply(eo.te,eo,[$,_]),Wc,eo=>Q(eo))}function T($){let _=null;const eo=On(N,u.value,s.value);for(let fo=0;fo<eo.length;fo++){const No=g.value[eo[fo]]||{},pe=N.messageResolver(No,$);if(pe!=null){_=pe;break}}return _}function oo($){const _=T($);return _!=null?_:r?r.tm($)||{}:{}}function S($){return g.value[$]||{}}function L($,_){if(n){const eo={[$]:_};for(const fo in eo)Ao(eo,fo)&&He(eo[fo]);_=eo[$]}g.value[$]=_,N.messages=g.value}function F($,_){g.value[$]=g.value[$]||{};const eo={[$]:_};if(n)for(const fo in eo)Ao(eo,fo)&&He(eo[fo]);_=eo[$],er(_,g.value[$]),N.messages=g.value}function z($){return p.value[$]||{}}function d($,_){p.value[$]=_,N.datetimeFormats=p.value,It(N,$,_)}function f($,_){p.value[$]=ko(p.value[$]||{},_),N.datetimeFormats=p.value,It(N,$,_)}function R($){return k.value[$]||{}}function q($,_){k.value[$]=_,N.numberFormats=k.value,Lt(N,$,_)}function co($,_){k.value[$]=ko(k.value[$]||{},_),N.numberFormats=k.value,Lt(N,$,_)}Ot++,r&&ar&&(we(r.locale,$=>{l&&(s.value=$,N.locale=$,Fe(N,s.value,u.value))}),we(r.fallbackLocale,$=>{l&&(u.value=$,N.fallbackLocale=$,Fe(N,s.value,u.value))}));const V={id:Ot,locale:P,fallbackLocale:no,get inheritLocale(){return l},set inheritLocale($){l=$,$&&r&&(s.value=r.locale.value,u.value=r.fallbackLocale.value,Fe(N,s.value,u.value))},get availableLocales(){return Object.keys(g.value).sort()},messages:ie,get modifiers(){return I},get pluralRules(){return D||{}},get isGlobal(){return a},get missingWarn(){return m},set missingWarn($){m=$,N.missingWarn=m},get fallbackWarn(){return v},set fallbackWarn($){v=$,N.fallbackWarn=v},get fallbackRoot(){return h},set fallbackRoot($){h=$},get fallbackFormat(){return B},set fallbackFormat($){B=$,N.fallbackFormat=B},get warnHtmlMessage(){return E},set warnHtmlMessage($){E=$,N.warnHtmlMessage=$},get escapeParameter(){return x},set escapeParameter($){x=$,N.escapeParameter=$},t:qo,getLocaleMessage:S,setLocaleMessage:L,mergeLocaleMessage:F,getPostTranslationHandler:ce,setPostTranslationHandler:le,getMissingHandler:se,setMissingHandler:de,[Xn]:me};return V.datetimeFormats=xo,V.numberFormats=wo,V.rt=ue,V.te=Zo,V.tm=oo,V.d=Io,V.n=Jo,V.getDateTimeFormat=z,V.setDateTimeFormat=d,V.mergeDateTimeFormat=f,V.getNumberFormat=R,V.setNumberFormat=q,V.mergeNumberFormat=co,V[Gn]=t,V[Dr]=fe,V[Or]=ge,V[Ar]=Qo,V}function qc(o){const e=O(o.locale)?o.locale:Te,r=O(o.fallbackLocale)||uo(o.fallbackLocale)||G(o.fallbackLocale)||o.fallbackLocale===!1?o.fallbackLocale:e,t=so(o.missing)?o.missing:void 0,a=Q(o.silentTranslationWarn)||re(o.silentTranslationWarn)?!o.silentTranslationWarn:!0,n=Q(o.silentFallbackWarn)||re(o.silentFallbackWarn)?!o.silentFallbackWarn:!0,i=Q(o.fallbackRoot)?o.fallbackRoot:!0,c=!!o.formatFallbackMessages,l=G(o.modifiers)?o.modifiers:{},s=o.pluralizationRules,u=so(o.postTranslation)?o.postTranslation:void 0,g=O(o.warnHtmlInMessage)?o.warnHtmlInMessage!=="off":!0,p=!!o.escapeParameterHtml,k=Q(o.sync)?o.sync:!0;let m=o.messages;if(G(o.sharedMessages)){const x=o.sharedMessages;m=Object.keys(x).reduce((D,N)=>{const j=D[N]||(D[N]={});return ko(j,x[N]),D},m||{})}const{__i18n:v,__root:h,__injectWithOption:B}=o,A=o.datetimeFormats,b=o.numberFormats,y=o.flatJson,E=o.translateExistCompatible;return{locale:e,fallbackLocale:r,messages:m,flatJson:y,datetimeFormats:A,numberFormats:b,missing:t,missingWarn:a,fallbackWarn:n,fallbackRoot:i,fallbackFormat:c,modifiers:l,pluralRules:s,postTranslation:u,warnHtmlMessage:g,escapeParameter:p,messageResolver:o.messageResolver,inheritLocale:k,translateExistCompatible:E,__i18n:v,__root:h,__injectWithOption:B}}function Fr(o={},e){{const r=rt(qc(o)),{__extender:t}=o,a={id:r.id,get locale(){return r.locale.value},set locale(n){r.locale.value=n},get fallbackLocale(){return r.fallbackLocale.value},set fallbackLocale(n){r.fallbackLocale.value=n},get messages(){return r.messages.value},get datetimeFormats(){return r.datetimeFormats.value},get numberFormats(){return r.numberFormats.value},get availableLocales(){return r.availableLocales},get formatter(){return{interpolate(){return[]}}},set formatter(n){},get missing(){return r.getMissingHandler()},set missing(n){r.setMissingHandler(n)},get silentTranslationWarn(){return Q(r.missingWarn)?!r.missingWarn:r.missingWarn},set silentTranslationWarn(n){r.missingWarn=Q(n)?!n:n},get silentFallbackWarn(){return Q(r.fallbackWarn)?!r.fallbackWarn:r.fallbackWarn},set silentFallbackWarn(n){r.fallbackWarn=Q(n)?!n:n},get modifiers(){return r.modifiers},get formatFallbackMessages(){return r.fallbackFormat},set formatFallbackMessages(n){r.fallbackFormat=n},get postTranslation(){return r.getPostTranslationHandler()},set postTranslation(n){r.setPostTranslationHandler(n)},get sync(){return r.inheritLocale},set sync(n){r.inheritLocale=n},get warnHtmlInMessage(){return r.warnHtmlMessage?"warn":"off"},set warnHtmlInMessage(n){r.warnHtmlMessage=n!=="off"},get escapeParameterHtml(){return r.escapeParameter},set escapeParameterHtml(n){r.escapeParameter=n},get preserveDirectiveContent(){return!0},set preserveDirectiveContent(n){},get pluralizationRules(){return r.pluralRules||{}},__composer:r,t(...n){const[i,c,l]=n,s={};let u=null,g=null;if(!O(i))throw ho(bo.INVALID_ARGUMENT);const p=i;return O(c)?s.locale=c:uo(c)?u=c:G(c)&&(g=c),uo(l)?u=l:G(l)&&(g=l),Reflect.apply(r.t,r,[p,u||g||{},s])},rt(...n){return Reflect.apply(r.rt,r,[...n])},tc(...n){const[i,c,l]=n,s={plural:1};let u=null,g=null;if(!O(i))throw ho(bo.INVALID_ARGUMENT);const p=i;return O(c)?s.locale=c:mo(c)?s.plural=c:uo(c)?u=c:G(c)&&(g=c),O(l)?s.locale=l:uo(l)?u=l:G(l)&&(g=l),Reflect.apply(r.t,r,[p,u||g||{},s])},te(n,i){return r.te(n,i)},tm(n){return r.tm(n)},getLocaleMessage(n){return r.getLocaleMessage(n)},setLocaleMessage(n,i){r.setLocaleMessage(n,i)},mergeLocaleMessage(n,i){r.mergeLocaleMessage(n,i)},d(...n){return Reflect.apply(r.d,r,[...n])},getDateTimeFormat(n){return r.getDateTimeFormat(n)},setDateTimeFormat(n,i){r.setDateTimeFormat(n,i)},mergeDateTimeFormat(n,i){r.mergeDateTimeFormat(n,i)},n(...n){return Reflect.apply(r.n,r,[...n])},getNumberFormat(n){return r.getNumberFormat(n)},setNumberFormat(n,i){r.setNumberFormat(n,i)},mergeNumberFormat(n,i){r.mergeNumberFormat(n,i)},getChoiceIndex(n,i){return-1}};return a.__extender=t,a}}const tt={tag:{type:[String,Object]},locale:{type:String},scope:{type:String,validator:o=>o==="parent"||o==="global",default:"parent"},i18n:{type:Object}};function Hc({slots:o},e){return e.length===1&&e[0]==="default"?(o.default?o.default():[]).reduce((t,a)=>[...t,...a.type===Yr?a.children:[a]],[]):e.reduce((r,t)=>{const a=o[t];return a&&(r[t]=a()),r},io())}function Qn(o){return Yr}const jc=Vr({name:"i18n-t",props:ko({keypath:{type:String,required:!0},plural:{type:[Number,String],validator:o=>mo(o)||!isNaN(o)}},tt),setup(o,e){const{slots:r,attrs:t}=e,a=o.i18n||Ko({useScope:o.scope,__useComponent:!0});return()=>{const n=Object.keys(r).filter(g=>g!=="_"),i=io();o.locale&&(i.locale=o.locale),o.plural!==void 0&&(i.plural=O(o.plural)?+o.plural:o.plural);const c=Hc(e,n),l=a[Dr](o.keypath,c,i),s=ko(io(),t),u=O(o.tag)||ro(o.tag)?o.tag:Qn();return gn(u,s,l)}}}),Pt=jc;function Vc(o){return uo(o)&&!O(o[0])}function Zn(o,e,r,t){const{slots:a,attrs:n}=e;return()=>{const i={part:!0};let c=io();o.locale&&(i.locale=o.locale),O(o.format)?i.key=o.format:ro(o.format)&&(O(o.format.key)&&(i.key=o.format.key),c=Object.keys(o.format).reduce((p,k)=>r.includes(k)?ko(io(),p,{[k]:o.format[k]}):p,io()));const l=t(o.value,i,c);let s=[i.key];uo(l)?s=l.map((p,k)=>{const m=a[p.type],v=m?m({[p.type]:p.value,index:k,parts:l}):[p.value];return Vc(v)&&(v[0].key=`${p.type}-${k}`),v}):O(l)&&(s=[l]);const u=ko(io(),n),g=O(o.tag)||ro(o.tag)?o.tag:Qn();return gn(g,u,s)}}const Yc=Vr({name:"i18n-n",props:ko({value:{type:Number,required:!0},format:{type:[String,Object]}},tt),setup(o,e){const r=o.i18n||Ko({useScope:o.scope,__useComponent:!0});return Zn(o,e,Vn,(...t)=>r[Ar](...t))}}),Ft=Yc,Xc=Vr({name:"i18n-d",props:ko({value:{type:[Number,Date],required:!0},format:{type:[String,Object]}},tt),setup(o,e){const r=o.i18n||Ko({useScope:o.scope,__useComponent:!0});return Zn(o,e,jn,(...t)=>r[Or](...t))}}),zt=Xc;function Gc(o,e){const r=o;if(o.mode==="composition")return r.__getInstance(e)||o.global;{const t=r.__getInstance(e);return t!=null?t.__composer:o.global.__composer}}function Kc(o){const e=i=>{const{instance:c,modifiers:l,value:s}=i;if(!c||!c.$)throw ho(bo.UNEXPECTED_ERROR);const u=Gc(o,c.$),g=Mt(s);return[Reflect.apply(u.t,u,[...Wt(g)]),u]};return{created:(i,c)=>{const[l,s]=e(c);ar&&o.global===s&&(i.__i18nWatcher=we(s.locale,()=>{c.instance&&c.instance.$forceUpdate()})),i.__composer=s,i.textContent=l},unmounted:i=>{ar&&i.__i18nWatcher&&(i.__i18nWatcher(),i.__i18nWatcher=void 0,delete i.__i18nWatcher),i.__composer&&(i.__composer=void 0,delete i.__composer)},beforeUpdate:(i,{value:c})=>{if(i.__composer){const l=i.__composer,s=Mt(c);i.textContent=Reflect.apply(l.t,l,[...Wt(s)])}},getSSRProps:i=>{const[c]=e(i);return{textContent:c}}}}function Mt(o){if(O(o))return{path:o};if(G(o)){if(!("path"in o))throw ho(bo.REQUIRED_VALUE,"path");return o}else throw ho(bo.INVALID_VALUE)}function Wt(o){const{path:e,locale:r,args:t,choice:a,plural:n}=o,i={},c=t||{};return O(r)&&(i.locale=r),mo(a)&&(i.plural=a),mo(n)&&(i.plural=n),[e,c,i]}function Jc(o,e,...r){const t=G(r[0])?r[0]:{},a=!!t.useI18nComponentName;(Q(t.globalInstall)?t.globalInstall:!0)&&([a?"i18n":Pt.name,"I18nT"].forEach(i=>o.component(i,Pt)),[Ft.name,"I18nN"].forEach(i=>o.component(i,Ft)),[zt.name,"I18nD"].forEach(i=>o.component(i,zt))),o.directive("t",Kc(e))}function Qc(o,e,r){return{beforeCreate(){const t=Me();if(!t)throw ho(bo.UNEXPECTED_ERROR);const a=this.$options;if(a.i18n){const n=a.i18n;if(a.__i18n&&(n.__i18n=a.__i18n),n.__root=e,this===this.$root)this.$i18n=Ut(o,n);else{n.__injectWithOption=!0,n.__extender=r.__vueI18nExtend,this.$i18n=Fr(n);const i=this.$i18n;i.__extender&&(i.__disposer=i.__extender(this.$i18n))}}else if(a.__i18n)if(this===this.$root)this.$i18n=Ut(o,a);else{this.$i18n=Fr({__i18n:a.__i18n,__injectWithOption:!0,__extender:r.__vueI18nExtend,__root:e});const n=this.$i18n;n.__extender&&(n.__disposer=n.__extender(this.$i18n))}else this.$i18n=o;a.__i18nGlobal&&Jn(e,a,a),this.$t=(...n)=>this.$i18n.t(...n),this.$rt=(...n)=>this.$i18n.rt(...n),this.$tc=(...n)=>this.$i18n.tc(...n),this.$te=(n,i)=>this.$i18n.te(n,i),this.$d=(...n)=>this.$i18n.d(...n),this.$n=(...n)=>this.$i18n.n(...n),this.$tm=n=>this.$i18n.tm(n),r.__setInstance(t,this.$i18n)},mounted(){},unmounted(){const t=Me();if(!t)throw ho(bo.UNEXPECTED_ERROR);const a=this.$i18n;delete this.$t,delete this.$rt,delete this.$tc,delete this.$te,delete this.$d,delete this.$n,delete this.$tm,a.__disposer&&(a.__disposer(),delete a.__disposer,delete a.__extender),r.__deleteInstance(t),delete this.$i18n}}}function Ut(o,e){o.locale=e.locale||o.locale,o.fallbackLocale=e.fallbackLocale||o.fallbackLocale,o.missing=e.missing||o.missing,o.silentTranslationWarn=e.silentTranslationWarn||o.silentFallbackWarn,o.silentFallbackWarn=e.silentFallbackWarn||o.silentFallbackWarn,o.formatFallbackMessages=e.formatFallbackMessages||o.formatFallbackMessages,o.postTranslation=e.postTranslation||o.postTranslation,o.warnHtmlInMessage=e.warnHtmlInMessage||o.warnHtmlInMessage,o.escapeParameterHtml=e.escapeParameterHtml||o.escapeParameterHtml,o.sync=e.sync||o.sync,o.__composer[Xn](e.pluralizationRules||o.pluralizationRules);const r=gr(o.locale,{messages:e.messages,__i18n:e.__i18n});return Object.keys(r).forEach(t=>o.mergeLocaleMessage(t,r[t])),e.datetimeFormats&&Object.keys(e.datetimeFormats).forEach(t=>o.mergeDateTimeFormat(t,e.datetimeFormats[t])),e.numberFormats&&Object.keys(e.numberFormats).forEach(t=>o.mergeNumberFormat(t,e.numberFormats[t])),o}const Zc=te("global-vue-i18n");function ol(o={},e){const r=__VUE_I18N_LEGACY_API__&&Q(o.legacy)?o.legacy:__VUE_I18N_LEGACY_API__,t=Q(o.globalInjection)?o.globalInjection:!0,a=__VUE_I18N_LEGACY_API__&&r?!!o.allowComposition:!0,n=new Map,[i,c]=el(o,r),l=te("");function s(p){return n.get(p)||null}function u(p,k){n.set(p,k)}function g(p){n.delete(p)}{let k;const p={get mode(){return __VUE_I18N_LEGACY_API__&&r?"legacy":"composition"},get allowComposition(){return a},install(m,...v){return to(this,null,function*(){if(m.__VUE_I18N_SYMBOL__=l,m.provide(m.__VUE_I18N_SYMBOL__,p),G(v[0])){const A=v[0];p.__composerExtend=A.__composerExtend,p.__vueI18nExtend=A.__vueI18nExtend}let h=null;!r&&t&&(h=dl(m,p.global)),__VUE_I18N_FULL_INSTALL__&&Jc(m,p,...v),__VUE_I18N_LEGACY_API__&&r&&m.mixin(Qc(c,c.__composer,p));const B=m.unmount;m.unmount=()=>{h&&h(),p.dispose(),B()}})},get global(){return c},dispose(){i.stop()},__instances:n,__getInstance:s,__setInstance:u,__deleteInstance:g};return p}}function Ko(o={}){const e=Me();if(e==null)throw ho(bo.MUST_BE_CALL_SETUP_TOP);if(!e.isCE&&e.appContext.app!=null&&!e.appContext.app.__VUE_I18N_SYMBOL__)throw ho(bo.NOT_INSTALLED);const r=rl(e),t=nl(r),a=Kn(e),n=tl(o,a);if(__VUE_I18N_LEGACY_API__&&r.mode==="legacy"&&!o.__useComponent){if(!r.allowComposition)throw ho(bo.NOT_AVAILABLE_IN_LEGACY_MODE);return ll(e,n,t,o)}if(n==="global")return Jn(t,o,a),t;if(n==="parent"){let l=al(r,e,o.__useComponent);return l==null&&(l=t),l}const i=r;let c=i.__getInstance(e);if(c==null){const l=ko({},o);"__i18n"in a&&(l.__i18n=a.__i18n),t&&(l.__root=t),c=rt(l),i.__composerExtend&&(c[Pr]=i.__composerExtend(c)),cl(i,e,c),i.__setInstance(e,c)}return c}function el(o,e,r){const t=Na();{const a=__VUE_I18N_LEGACY_API__&&e?t.run(()=>Fr(o)):t.run(()=>rt(o));if(a==null)throw ho(bo.UNEXPECTED_ERROR);return[t,a]}}function rl(o){{const e=Ne(o.isCE?Zc:o.appContext.app.__VUE_I18N_SYMBOL__);if(!e)throw ho(o.isCE?bo.NOT_INSTALLED_WITH_PROVIDE:bo.UNEXPECTED_ERROR);return e}}function tl(o,e){return dr(o)?"__i18n"in e?"local":"global":o.useScope?o.useScope:"local"}function nl(o){return o.mode==="composition"?o.global:o.global.__composer}function al(o,e,r=!1){let t=null;const a=e.root;let n=il(e,r);for(;n!=null;){const i=o;if(o.mode==="composition")t=i.__getInstance(n);else if(__VUE_I18N_LEGACY_API__){const c=i.__getInstance(n);c!=null&&(t=c.__composer,r&&t&&!t[Gn]&&(t=null))}if(t!=null||a===n)break;n=n.parent}return t}function il(o,e=!1){return o==null?null:e&&o.vnode.ctx||o.parent}function cl(o,e,r){De(()=>{},e),Oa(()=>{const t=r;o.__deleteInstance(e);const a=t[Pr];a&&(a(),delete t[Pr])},e)}function ll(o,e,r,t={}){const a=e==="local",n=fn(null);if(a&&o.proxy&&!(o.proxy.$options.i18n||o.proxy.$options.__i18n))throw ho(bo.MUST_DEFINE_I18N_OPTION_IN_ALLOW_COMPOSITION);const i=Q(t.inheritLocale)?t.inheritLocale:!O(t.locale),c=lo(!a||i?r.locale.value:O(t.locale)?t.locale:Te),l=lo(!a||i?r.fallbackLocale.value:O(t.fallbackLocale)||uo(t.fallbackLocale)||G(t.fallbackLocale)||t.fallbackLocale===!1?t.fallbackLocale:c.value),s=lo(gr(c.value,t)),u=lo(G(t.datetimeFormats)?t.datetimeFormats:{[c.value]:{}}),g=lo(G(t.numberFormats)?t.numberFormats:{[c.value]:{}}),p=a?r.missingWarn:Q(t.missingWarn)||re(t.missingWarn)?t.missingWarn:!0,k=a?r.fallbackWarn:Q(t.fallbackWarn)||re(t.fallbackWarn)?t.fallbackWarn:!0,m=a?r.fallbackRoot:Q(t.fallbackRoot)?t.fallbackRoot:!0,v=!!t.fallbackFormat,h=so(t.missing)?t.missing:null,B=so(t.postTranslation)?t.postTranslation:null,A=a?r.warnHtmlMessage:Q(t.warnHtmlMessage)?t.warnHtmlMessage:!0,b=!!t.escapeParameter,y=a?r.modifiers:G(t.modifiers)?t.modifiers:{},E=t.pluralRules||a&&r.pluralRules;function x(){return[c.value,l.value,s.value,u.value,g.value]}const I=X({get:()=>n.value?n.value.locale.value:c.value,set:T=>{n.value&&(n.value.locale.value=T),c.value=T}}),D=X({get:()=>n.value?n.value.fallbackLocale.value:l.value,set:T=>{n.value&&(n.value.fallbackLocale.value=T),l.value=T}}),N=X(()=>n.value?n.value.messages.value:s.value),j=X(()=>u.value),W=X(()=>g.value);function P(){return n.value?n.value.getPostTranslationHandler():B}function no(T){n.value&&n.value.setPostTranslationHandler(T)}function ie(){return n.value?n.value.getMissingHandler():h}function xo(T){n.value&&n.value.setMissingHandler(T)}function wo(T){return x(),T()}function ce(...T){return n.value?wo(()=>Reflect.apply(n.value.t,null,[...T])):wo(()=>"")}function le(...T){return n.value?Reflect.apply(n.value.rt,null,[...T]):""}function se(...T){return n.value?wo(()=>Reflect.apply(n.value.d,null,[...T])):wo(()=>"")}function de(...T){return n.value?wo(()=>Reflect.apply(n.value.n,null,[...T])):wo(()=>"")}function Bo(T){return n.value?n.value.tm(T):{}}function qo(T,oo){return n.value?n.value.te(T,oo):!1}function ue(T){return n.value?n.value.getLocaleMessage(T):{}}function Io(T,oo){n.value&&(n.value.setLocaleMessage(T,oo),s.value[T]=oo)}function Jo(T,oo){n.value&&n.value.mergeLocaleMessage(T,oo)}function Ho(T){return n.value?n.value.getDateTimeFormat(T):{}}function xe(T,oo){n.value&&(n.value.setDateTimeFormat(T,oo),u.value[T]=oo)}function To(T,oo){n.value&&n.value.mergeDateTimeFormat(T,oo)}function fe(T){return n.value?n.value.getNumberFormat(T):{}}function Qo(T,oo){n.value&&(n.value.setNumberFormat(T,oo),g.value[T]=oo)}function ge(T,oo){n.value&&n.value.mergeNumberFormat(T,oo)}const me={get id(){return n.value?n.value.id:-1},locale:I,fallbackLocale:D,messages:N,datetimeFormats:j,numberFormats:W,get inheritLocale(){return n.value?n.value.inheritLocale:i},set inheritLocale(T){n.value&&(n.value.inheritLocale=T)},get availableLocales(){return n.value?n.value.availableLocales:Object.keys(s.value)},get modifiers(){return n.value?n.value.modifiers:y},get pluralRules(){return n.value?n.value.pluralRules:E},get isGlobal(){return n.value?n.value.isGlobal:!1},get missingWarn(){return n.value?n.value.missingWarn:p},set missingWarn(T){n.value&&(n.value.missingWarn=T)},get fallbackWarn(){return n.value?n.value.fallbackWarn:k},set fallbackWarn(T){n.value&&(n.value.missingWarn=T)},get fallbackRoot(){return n.value?n.value.fallbackRoot:m},set fallbackRoot(T){n.value&&(n.value.fallbackRoot=T)},get fallbackFormat(){return n.value?n.value.fallbackFormat:v},set fallbackFormat(T){n.value&&(n.value.fallbackFormat=T)},get warnHtmlMessage(){return n.value?n.value.warnHtmlMessage:A},set warnHtmlMessage(T){n.value&&(n.value.warnHtmlMessage=T)},get escapeParameter(){return n.value?n.value.escapeParameter:b},set escapeParameter(T){n.value&&(n.value.escapeParameter=T)},t:ce,getPostTranslationHandler:P,setPostTranslationHandler:no,getMissingHandler:ie,setMissingHandler:xo,rt:le,d:se,n:de,tm:Bo,te:qo,getLocaleMessage:ue,setLocaleMessage:Io,mergeLocaleMessage:Jo,getDateTimeFormat:Ho,setDateTimeFormat:xe,mergeDateTimeFormat:To,getNumberFormat:fe,setNumberFormat:Qo,mergeNumberFormat:ge};function Zo(T){T.locale.value=c.value,T.fallbackLocale.value=l.value,Object.keys(s.value).forEach(oo=>{T.mergeLocaleMessage(oo,s.value[oo])}),Object.keys(u.value).forEach(oo=>{T.mergeDateTimeFormat(oo,u.value[oo])}),Object.keys(g.value).forEach(oo=>{T.mergeNumberFormat(oo,g.value[oo])}),T.escapeParameter=b,T.fallbackFormat=v,T.fallbackRoot=m,T.fallbackWarn=k,T.missingWarn=p,T.warnHtmlMessage=A}return Aa(()=>{if(o.proxy==null||o.proxy.$i18n==null)throw ho(bo.NOT_AVAILABLE_COMPOSITION_IN_LEGACY);const T=n.value=o.proxy.$i18n.__composer;e==="global"?(c.value=T.locale.value,l.value=T.fallbackLocale.value,s.value=T.messages.value,u.value=T.datetimeFormats.value,g.value=T.numberFormats.value):a&&Zo(T)}),me}const sl=["locale","fallbackLocale","availableLocales"],qt=["t","rt","d","n","tm","te"];function dl(o,e){const r=Object.create(null);return sl.forEach(a=>{const n=Object.getOwnPropertyDescriptor(e,a);if(!n)throw ho(bo.UNEXPECTED_ERROR);const i=Da(n.value)?{get(){return n.value.value},set(c){n.value.value=c}}:{get(){return n.get&&n.get()}};Object.defineProperty(r,a,i)}),o.config.globalProperties.$i18n=r,qt.forEach(a=>{const n=Object.getOwnPropertyDescriptor(e,a);if(!n||!n.value)throw ho(bo.UNEXPECTED_ERROR);Object.defineProperty(o.config.globalProperties,`$${a}`,n)}),()=>{delete o.config.globalProperties.$i18n,qt.forEach(a=>{delete o.config.globalProperties[`$${a}`]})}}zc();__INTLIFY_JIT_COMPILATION__?wt(Nc):wt(Tc);$c(tc);_c(On);if(__INTLIFY_PROD_DEVTOOLS__){const o=Go();o.__INTLIFY__=!0,fc(o.__INTLIFY_DEVTOOLS_GLOBAL_HOOK__)}const Lo=(o,e)=>{const r=o.__vccOpts||o;for(const[t,a]of e)r[t]=a;return r},ul=["dir"],fl={key:0,class:"bg-white shadow-sm"},gl={class:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8"},ml={class:"py-6"},pl={class:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8"},bl={__name:"App",setup(o){const e=mn(),r=Ne("$auth"),{t,locale:a}=Ko();localStorage.getItem("preferredLang");const n=X(()=>a.value==="ar"?"rtl":"ltr"),i=X(()=>e.name==="Login"),c=X(()=>r.isLoggedIn);we(a,u=>{document.documentElement.lang=u,document.documentElement.dir=u==="ar"?"rtl":"ltr"});const l=Xr(),s=X(()=>[{label:t("menu.home"),icon:"pi pi-home",command:()=>l.push("/"),class:e.path==="/home"?"active-menu-item":""},{label:t("menu.new_invoice"),icon:"pi pi-plus",command:()=>l.push("/invoice"),class:e.path==="/invoice"?"active-menu-item":""},{label:t("menu.drafts"),icon:"pi pi-list",command:()=>l.push("/drafts"),class:e.path==="/drafts"?"active-menu-item":""},{label:"",icon:"pi pi-cog",command:()=>l.push("/settings"),class:e.path==="/settings"?"active-menu-item":""}]);return(u,g)=>{const p=Ro("Toast"),k=Ro("router-link"),m=Ro("Menubar"),v=Ro("router-view"),h=Ro("ConfirmDialog");return J(),ao("div",{dir:n.value,class:"min-h-screen bg-gray-50"},[H(p,{position:"top-right"}),!i.value&&c.value?(J(),ao("header",fl,[C("div",gl,[(J(),Fo(m,{model:s.value,key:M(a),class:"border-0 custom-menubar"},{start:go(()=>[H(k,{to:"/",class:"font-bold text-xl text-blue-600 mr-4"})]),_:1},8,["model"]))])])):po("",!0),C("main",ml,[C("div",pl,[(J(),Fo(v,{key:u.$route.fullPath}))])]),H(h)],8,ul)}}},hl=Lo(bl,[["__scopeId","data-v-29641a9f"]]),vl=["width"],kl={__name:"LogoComponent",props:{width:{type:[String,Number],default:"100%"},height:{type:[String,Number],default:"auto"}},setup(o){return(e,r)=>(J(),ao("svg",{version:"1.2",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 595 842",width:o.width,style:za({height:o.height!=="auto"?o.height:"100%"})},r[0]||(r[0]=[Fa('<defs data-v-6be4db6b><clipPath clipPathUnits="userSpaceOnUse" id="cp1" data-v-6be4db6b><path d="m128.17 340.45h373.81v349.17h-373.81z" data-v-6be4db6b></path></clipPath></defs><g id="Layer 1" data-v-6be4db6b><g id="ClipGroup" clip-path="url(#cp1)" data-v-6be4db6b><g class="logo-text" data-v-6be4db6b><path id="dimensional-path" fill-rule="evenodd" class="s0" d="m131.9 607.1h13.6q4.6 0 7 0.8 3.3 1.1 5.6 3.7 2.3 2.7 3.5 6.6 1.2 3.8 1.2 9.5 0 5-1.1 8.6-1.4 4.4-4 7.1-1.9 2.1-5.2 3.2-2.5 0.9-6.6 0.9h-14zm7.4 6.8v26.8h5.6q3.1 0 4.5-0.4 1.8-0.5 3-1.7 1.2-1.2 1.9-3.9 0.8-2.7 0.8-7.4 0-4.7-0.8-7.2-0.7-2.5-2.1-3.9-1.3-1.4-3.4-1.9-1.6-0.4-6.1-0.4z" data-v-6be4db6b></path><path class="s0" d="m168.9 647.5v-40.4h7.4v40.4z" data-v-6be4db6b></path><path class="s0" d="m183.3 647.5v-40.4h11.1l6.7 27.6 6.6-27.6h11.2v40.4h-6.9v-31.8l-7.3 31.8h-7.2l-7.3-31.8v31.8z" data-v-6be4db6b></path><path class="s0" d="m226.3 647.5v-40.4h27.3v6.9h-19.9v8.9h18.5v6.8h-18.5v11h20.6v6.8z" data-v-6be4db6b></path><path class="s0" d="m260.7 647.5v-40.4h7.3l15 27v-27h7v40.4h-7.5l-14.9-26.3v26.3z" data-v-6be4db6b></path><path class="s0" d="m295.9 634.4l7.3-0.8q0.6 4 2.6 5.9 2 1.8 5.4 1.8 3.6 0 5.4-1.6 1.9-1.7 1.9-3.9 0-1.5-0.8-2.5-0.8-1-2.7-1.7-1.3-0.5-5.9-1.8-6-1.6-8.4-4-3.4-3.3-3.4-8.1 0-3.1 1.6-5.8 1.6-2.6 4.6-4 3-1.4 7.2-1.4 7 0 10.5 3.3 3.5 3.3 3.7 8.9l-7.5 0.3q-0.5-3.1-2-4.4-1.6-1.4-4.7-1.4-3.3 0-5.1 1.5-1.2 0.9-1.2 2.5 0 1.4 1.1 2.4 1.4 1.3 6.8 2.7 5.5 1.4 8.1 2.9 2.6 1.5 4 4.1 1.5 2.6 1.5 6.4 0 3.5-1.7 6.5-1.8 3.1-5 4.5-3.2 1.5-8 1.5-7 0-10.8-3.5-3.7-3.6-4.5-10.3z" data-v-6be4db6b></path><path class="s0" d="m331.9 647.5v-40.4h7.5v40.4z" data-v-6be4db6b></path><path fill-rule="evenodd" class="s0" d="m345 627.6q0-6.2 1.7-10.4 1.2-3.1 3.4-5.5 2.2-2.5 4.8-3.7 3.4-1.5 7.9-1.5 8.1 0 13 5.5 4.9 5.5 4.9 15.4 0 9.7-4.8 15.3-4.9 5.5-13 5.5-8.2 0-13.1-5.5-4.8-5.5-4.8-15.1zm7.6-0.3q0 6.8 2.9 10.4 2.9 3.5 7.4 3.5 4.4 0 7.3-3.5 2.8-3.5 2.8-10.5 0-7-2.8-10.4-2.7-3.4-7.3-3.4-4.6 0-7.4 3.5-2.9 3.4-2.9 10.4z" data-v-6be4db6b></path><path class="s0" d="m386.6 647.5v-40.4h7.2l15.1 27v-27h6.9v40.4h-7.4l-14.9-26.3v26.3z" data-v-6be4db6b></path><path fill-rule="evenodd" class="s0" d="m457 647.5h-8.1l-3.3-9.2h-14.7l-3 9.2h-7.9l14.3-40.4h7.9zm-13.7-15.9l-5.1-15-5 15z" data-v-6be4db6b></path><path class="s0" d="m461.1 647.5v-40h7.4v33.2h18.5v6.8z" data-v-6be4db6b></path></g><g class="logo-text" data-v-6be4db6b><path fill-rule="evenodd" class="s0" d="m198.9 680.1v-20.9h9.3q2.8 0 4.3 0.5 1.5 0.6 2.3 2 0.9 1.5 0.9 3.2 0 2.2-1.4 3.7-1.5 1.6-4.5 2 1.1 0.5 1.7 1 1.2 1.1 2.3 2.8l3.6 5.7h-3.5l-2.7-4.3q-1.3-1.9-2-2.9-0.8-1-1.5-1.4-0.6-0.4-1.2-0.6-0.5-0.1-1.6-0.1h-3.2v9.3zm2.8-11.7h6q1.9 0 2.9-0.4 1.1-0.4 1.7-1.2 0.5-0.9 0.5-1.9 0-1.5-1.1-2.5-1-0.9-3.4-0.9h-6.6z" data-v-6be4db6b></path><path class="s0" d="m225.2 680.1v-20.9h15.2v2.4h-12.4v6.5h11.6v2.4h-11.6v7.2h12.8v2.4z" data-v-6be4db6b></path><path class="s0" d="m250 680.1v-20.9h14.1v2.4h-11.4v6.5h9.9v2.5h-9.9v9.5z" data-v-6be4db6b></path><path class="s0" d="m272.7 680.1v-20.9h2.8v18.5h10.3v2.4z" data-v-6be4db6b></path><path class="s0" d="m294.3 680.1v-20.9h15.2v2.4h-12.4v6.5h11.6v2.4h-11.6v7.2h12.8v2.4z" data-v-6be4db6b></path><path class="s0" d="m333.9 672.8l2.7 0.7q-0.8 3.4-3.1 5.2-2.3 1.8-5.5 1.8-3.4 0-5.5-1.4-2.2-1.4-3.3-4-1.1-2.6-1.1-5.6 0-3.3 1.3-5.7 1.2-2.5 3.5-3.7 2.3-1.3 5.1-1.3 3.1 0 5.3 1.6 2.1 1.6 3 4.5l-2.7 0.7q-0.8-2.3-2.2-3.4-1.4-1-3.5-1-2.4 0-4 1.1-1.6 1.2-2.3 3.2-0.6 1.9-0.6 4 0 2.6 0.8 4.6 0.7 2 2.4 3 1.6 1 3.5 1 2.4 0 4-1.3 1.6-1.4 2.2-4z" data-v-6be4db6b></path><path class="s0" d="m350.5 680.1v-18.5h-6.9v-2.4h16.6v2.4h-6.9v18.5z" data-v-6be4db6b></path><path class="s0" d="m368.7 680.1v-20.9h2.7v20.9z" data-v-6be4db6b></path><path fill-rule="evenodd" class="s0" d="m380.6 669.9q0-5.2 2.8-8.1 2.8-3 7.3-3 2.9 0 5.2 1.4 2.3 1.4 3.5 3.9 1.3 2.4 1.3 5.6 0 3.2-1.3 5.7-1.3 2.5-3.7 3.8-2.3 1.3-5 1.3-3 0-5.3-1.4-2.4-1.5-3.6-4-1.2-2.4-1.2-5.2zm2.9 0.1q0 3.7 2 5.9 2.1 2.2 5.1 2.2 3.2 0 5.2-2.2 2-2.2 2-6.2 0-2.6-0.9-4.5-0.8-1.9-2.5-3-1.6-1-3.7-1-3 0-5.1 2-2.1 2-2.1 6.8z" data-v-6be4db6b></path><path class="s0" d="m409.4 680.1v-20.9h2.8l11 16.4v-16.4h2.7v20.9h-2.9l-11-16.4v16.4z" data-v-6be4db6b></path></g><g class="circle-animation" data-v-6be4db6b><path class="s1" d="m430.6 442.4v-46.3h-2.9v46.3c-9.7 0.8-17.4 8.9-17.4 18.7q0 2.2 0.5 4.2l-10.1 3.1-4.1 1.3-4.2 1.3q-0.2 1.6-0.5 3.2l4.3-1.3 4.2-1.4 11.3-3.4c1.1 2.9 3 5.4 5.3 7.4l-28.7 54.6c-1.6-0.6-3.2-1-4.9-1-3.1 0-5.8 1.1-8.1 2.9l-5.3-5.5-2.7-2.9-2.8-2.9q-1.1 0.9-2.3 1.8l2.8 2.9 2.8 2.9 5.4 5.7c-1.9 2.3-3.1 5.2-3.1 8.4 0 0.5 0.1 1 0.1 1.5l-91.2 20.5c-0.8-2.4-2-4.5-3.7-6.2l14.3-16.1 2.9-3.3 3-3.3q-1.5-0.4-3-0.9l-3 3.3-2.9 3.2-13.5 15.1q-2-1.5-4.5-2.4l4.6-18.9 0.9-4 1-4.1q-1.3-0.8-2.5-1.7l-1 4.2-1 4-4.8 19.9q-1.2-0.2-2.5-0.2c-9.1 0-16.4 7.3-16.4 16.4 0 9.1 7.3 16.5 16.4 16.5 9.1 0 16.5-7.4 16.5-16.5q0-1.1-0.2-2.2l91.3-20.5c1.8 5.2 6.7 9 12.5 9 7.3 0 13.3-5.9 13.3-13.3 0-4.6-2.3-8.6-5.9-11l28.6-54.2c2.8 1.7 6.1 2.7 9.7 2.7 10.4 0 18.8-8.4 18.8-18.8 0-9.8-7.7-17.9-17.3-18.7zm-11.7-83.8c-10.3 0-18.7 8.4-18.7 18.7 0 5.7 2.4 10.7 6.3 14.1l-18.2 24.3-2.6 3.4-2.6 3.5q0.8 1.4 1.5 2.8l2.7-3.6 2.6-3.5 18.9-25.1c2.9 1.8 6.4 2.9 10.1 2.9 10.4 0 18.8-8.4 18.8-18.8 0-10.3-8.4-18.7-18.8-18.7zm-76.4-9l-1.2-0.7-0.5 0.9c-4.1 0.8-7.2 4.4-7.2 8.8 0 0.9 0.2 1.8 0.5 2.6l-8.6 14.5-2.2 3.7-2.3 3.9q1.6 0.1 3.2 0.3l2.2-3.8 2.2-3.7 7-11.9c1.3 1.5 3 2.6 4.9 3l-0.8 11.4-0.2 4-0.3 4.2q1.4 0.4 2.8 0.9l0.3-4.1 0.3-4.1 0.8-12.1c4.5-0.4 8.1-4.2 8.1-8.8 0-5-4-9-9-9z" data-v-6be4db6b></path><path class="s1" d="m307.4 350.9c-3.6-6.4-11.8-8.6-18.2-5-6.4 3.6-8.6 11.7-5 18.1 1.3 2.3 3.2 4.1 5.4 5.2l-5.1 11.7-2.3 5.3-2.4 5.6q1.4-0.7 2.8-1.4l2.3-5.4 2.3-5.1 4.2-9.9c3.5 1.2 7.5 1 11-0.9 6.4-3.7 8.6-11.8 5-18.2zm-54.7 23.9l28.5-16.1-1-1.8-28.5 16.2c-3.9-5.8-11.5-7.7-17.6-4.2-6.4 3.6-8.7 11.7-5 18.1 1.2 2.2 3 3.9 5 5.1l-23.4 36.5c-2.7-1.4-6-1.4-8.8 0.2-4.5 2.6-6.1 8.3-3.6 12.9 2.1 3.5 6.1 5.2 10 4.5l19.2 63.4q-0.7 0.3-1.4 0.7c-5.6 3.1-7.6 10.2-4.4 15.8 3.2 5.6 10.3 7.6 15.9 4.4 5.6-3.1 7.5-10.3 4.4-15.9q-0.5-0.7-1-1.4l4.2-4 2.9-2.7 3-2.8q-0.6-0.9-1.1-1.7l-3 2.8-2.9 2.7-4.5 4.2q-1.4-1.2-3.1-2l3.2-9.5 1.8-5.3 2-5.7q-0.6-1.5-1.2-3l-2 5.9-1.9 5.5-3.8 11.5c-1.7-0.4-3.5-0.5-5.2-0.1l-19.2-63.4c0.3-0.1 0.6-0.2 1-0.4 2-1.1 3.3-2.9 4.1-4.9l16.2 4.2q-0.4 1.4-0.5 3c-0.4 4.8 0.5 9.7 3 14.2q0.1 0.1 0.1 0.2 1.8 3.1 4.2 5.4-0.3-3.3-0.3-6.7c0-12.1 2.8-23.5 7.7-33.7q-1.1 0.5-2.2 1.1-2.1 1.2-3.8 2.7c-3.8 3.1-6.4 7.3-7.7 11.8h-0.1l-16.1-4.2c0.3-2 0-4-1.1-5.9-0.6-1.1-1.4-2-2.3-2.7l23.6-36.8c2.1 0.8 4.3 1 6.5 0.7l3.7 17 1.1 5.3 1.3 5.7q0.7-1.3 1.5-2.6l-1.2-5.4-1.1-5.1-3.3-15.3q1.4-0.4 2.7-1.2c6.1-3.4 8.4-10.9 5.5-17.2z" data-v-6be4db6b></path></g><path fill-rule="evenodd" class="s2" d="m397.1 460.6q0 4.6-0.5 9.1-0.2 1.6-0.4 3.2c-3.1 20.3-13.7 38.2-28.9 50.7q-1.1 0.9-2.3 1.8c-13.7 10.5-30.9 16.7-49.5 16.7-7.9 0-15.7-1.1-23-3.3q-1.5-0.4-3-0.9c-5.4-1.8-10.5-4.2-15.4-7q-1.3-0.8-2.5-1.6c-9.3-6-17.3-13.7-23.5-22.8q-0.5-0.9-1.1-1.7-3.1-4.8-5.5-9.9q-0.6-1.4-1.2-2.8c-3.9-9.4-6.1-19.6-6.3-30.4q0-0.5 0-1.1c0-10.6 2-20.7 5.7-29.9 2-5.2 4.6-10.2 7.6-14.8q0.8-1.2 1.6-2.3c8.4-11.9 19.9-21.4 33.3-27.4q1.4-0.6 2.7-1.2c9.5-3.8 19.8-5.9 30.6-5.9q4 0 7.8 0.3 1.6 0.2 3.1 0.4 6.7 0.9 13.1 2.8 1.4 0.5 2.8 1c18.3 6.3 33.7 19.1 43.4 35.5q0.8 1.3 1.6 2.7c6.2 11.5 9.8 24.8 9.8 38.8zm-4.7 10.4q0.7-5.1 0.7-10.4c0-12.7-3.1-24.6-8.5-35.2q-0.7-1.4-1.5-2.8c-9-16-23.6-28.5-41.1-34.9q-1.4-0.5-2.8-0.9c-4.8-1.6-9.8-2.7-15-3.2q-1.6-0.2-3.2-0.3-2.7-0.2-5.5-0.2c-11.7 0-22.9 2.6-32.9 7.3q-1.4 0.7-2.8 1.4c-12.1 6.4-22.4 15.8-29.7 27.2q-0.8 1.3-1.5 2.6-1.5 2.6-2.9 5.3c-4.9 10.2-7.7 21.6-7.7 33.7q0 3.4 0.3 6.7c0.6 6.6 1.9 12.9 4 18.9q0.6 1.5 1.2 3c1.7 4.5 3.9 8.7 6.5 12.8q0.5 0.8 1.1 1.7c5.7 8.5 13 15.8 21.5 21.4q1.2 0.9 2.5 1.7c5.4 3.3 11.2 5.9 17.3 7.8q1.6 0.5 3.1 0.9c6.4 1.7 13.1 2.6 20 2.6 17.5 0 33.7-5.8 46.7-15.6q1.2-0.9 2.3-1.8c14.1-11.5 24.1-27.9 27.4-46.5q0.3-1.6 0.5-3.2z" data-v-6be4db6b></path><path fill-rule="evenodd" class="s1" d="m401.1 460.6q0 4-0.4 7.8-0.1 1.6-0.3 3.1c-2.8 22.1-14.1 41.5-30.4 55q-1.1 0.9-2.2 1.8c-14.5 11.2-32.6 17.8-52.3 17.8-9 0-17.7-1.4-25.9-4q-1.5-0.4-3-1-7-2.5-13.4-6.2-1.3-0.8-2.6-1.6c-10-6.2-18.7-14.4-25.4-24.1q-0.6-0.8-1.1-1.7-2.4-3.5-4.4-7.3q-0.6-1.3-1.3-2.6c-5.4-11.2-8.4-23.7-8.4-37q0-6.7 1-13.1 0.4-2.5 0.9-5c2.6-11.7 7.5-22.5 14.3-31.9q0.8-1.1 1.6-2.1c9.4-12.3 22.1-21.9 36.7-27.6q1.3-0.5 2.7-1c8.8-3.1 18.4-4.8 28.3-4.8q5.1 0 10 0.6 1.6 0.1 3.1 0.4 5.7 0.8 11.1 2.5 1.5 0.4 2.9 0.9c19.1 6.3 35.2 19.3 45.7 36.2q0.8 1.3 1.6 2.6c7.1 12.5 11.2 26.9 11.2 42.3zm-8 0c0-12.7-3.1-24.6-8.5-35.2q-0.7-1.4-1.5-2.8c-9-16-23.6-28.5-41.1-34.9q-1.4-0.5-2.8-0.9c-4.8-1.6-9.8-2.7-15-3.2q-1.6-0.2-3.2-0.3-2.7-0.2-5.5-0.2c-11.7 0-22.9 2.6-32.9 7.3q-1.4 0.7-2.8 1.4c-12.1 6.4-22.4 15.8-29.7 27.2q-0.8 1.3-1.5 2.6-1.5 2.6-2.9 5.3c-4.9 10.2-7.7 21.6-7.7 33.7q0 3.4 0.3 6.7c0.6 6.6 1.9 12.9 4 18.9q0.6 1.5 1.2 3 2.6 6.7 6.5 12.8 0.5 0.8 1.1 1.7c5.7 8.5 13 15.8 21.5 21.4q1.2 0.9 2.5 1.7c5.4 3.3 11.2 5.9 17.3 7.8q1.6 0.5 3.1 0.9c6.4 1.7 13.1 2.6 20 2.6 17.5 0 33.7-5.8 46.7-15.6q1.2-0.9 2.3-1.8c14.1-11.5 24.1-27.9 27.4-46.5q0.3-1.6 0.5-3.2 0.7-5.1 0.7-10.4z" data-v-6be4db6b></path><path fill-rule="evenodd" class="s0" d="m328.6 501.1q-1.3 0.1-2.6 0.1h-42.9v-9.4h6v3.4h35l1.7 2.2zm36.9-39.5c0 15.3-8.6 28.5-21.2 35.1q-1.4 0.8-2.9 1.4l-3.1-4-0.7-1-5.1-6.5-4-5.2-0.9-1.2-1.8 1.4-5.2 4-2.5 2h0.1-35.1v-65.6h42.9c10.9 0 20.8 4.5 27.9 11.6 7.2 7.2 11.6 17.1 11.6 28zm-6 0c0-18.5-15-33.6-33.5-33.6h-36.9v47.6h36c7.8 0 14.1-6.2 14.1-14 0-7.7-6.3-14-14.1-14h-15.6v8.2h-12v-20.2h27.6c14.4 0 26.1 11.7 26.1 26 0 10.6-6.4 19.8-15.6 23.8l5 6.5c11.2-5.5 18.9-17 18.9-30.3z" data-v-6be4db6b></path><path class="s0" d="m332.9 506.7q-3.4 0.5-6.9 0.5h-48.9v-15.4h12v3.4h35l1.7 2.2 2.8 3.7 1.4 1.9z" data-v-6be4db6b></path><path class="s0" d="m371.6 461.6c0 17.2-9.5 32.2-23.5 39.9q-1.2 0.7-2.5 1.3-0.2 0.1-0.4 0.2l-3.1-4-0.7-0.9-3-4-0.8-1q1.6-0.5 3-1.2c11.2-5.5 19-17 19-30.3 0-18.5-15.1-33.5-33.6-33.5h-36.9v53.6h-12v-65.6h48.9c25.1 0 45.6 20.4 45.6 45.5z" data-v-6be4db6b></path><path class="s0" d="m345.2 461.6c0 8.8-5.6 16.2-13.3 18.9q-1.6 0.6-3.3 0.9-1.3 0.2-2.7 0.2-0.4 0.1-0.7 0.1h-21.7v-6h21.7c7.7 0 14-6.3 14-14.1 0-7.7-6.3-14-14-14h-15.7v8.2h-6v-14.2h21.7c5.5 0 10.5 2.3 14.1 5.9 3.7 3.6 5.9 8.6 5.9 14.1z" data-v-6be4db6b></path><path class="s0" d="m351.2 461.6c0 10.7-6.4 19.8-15.5 23.8q-1.5 0.7-3.1 1.2c-2.4 0.7-4.8 1.1-7.4 1.1h-21.7v-12h21.7c7.7 0 14-6.3 14-14.1 0-7.7-6.3-14-14-14h-15.7v8.2h-12v-20.2h27.7c14.3 0 26 11.7 26 26z" data-v-6be4db6b></path><path class="s0" d="m305 487.7h-27.8v-12h27.8z" data-v-6be4db6b></path><path class="s0" d="m348.1 501.5q-1.2 0.7-2.5 1.3-0.2 0.1-0.4 0.2-4.2 2-8.8 3l-4.1-5.3-4.3-5.5-5.8-7.5-1.5-2-0.3-0.4 4.8-3.6 4.7-3.7 2 2.5 3.8 4.9 4.9 6.5 3.7 4.8z" data-v-6be4db6b></path><path class="s1" d="m211.9 420.1h-21.3l-10.7 18.5 10.7 18.4h21.3l10.6-18.4z" data-v-6be4db6b></path><path class="s1" d="m238.3 507.3h-15.4l-7.6 13.3 7.6 13.3h15.4l7.6-13.3z" data-v-6be4db6b></path><path class="s1" d="m249.3 363.6h-17.8l-9 15.4 9 15.5h17.8l9-15.5z" data-v-6be4db6b></path><path class="s1" d="m347.8 346.4h-12.5l-6.3 10.9 6.3 10.8h12.5l6.3-10.8z" data-v-6be4db6b></path><path class="s1" d="m431.7 356.9h-23l-11.4 19.9 11.4 19.9h23l11.5-19.9z" data-v-6be4db6b></path><path class="s1" d="m441.1 442h-22.7l-11.4 19.6 11.4 19.7h22.7l11.4-19.7z" data-v-6be4db6b></path><path class="s1" d="m391.3 528.3h-18.4l-9.2 16 9.2 15.9h18.4l9.2-15.9z" data-v-6be4db6b></path><path class="s1" d="m273.8 550.5h-20.4l-10.2 17.7 10.2 17.7h20.4l10.2-17.7z" data-v-6be4db6b></path><path class="s1" d="m304.9 341.6l-17-1.2-9.5 14.2 7.5 15.3 17 1.1 9.5-14.1z" data-v-6be4db6b></path></g></g>',2)]),12,vl))}},oa=Lo(kl,[["__scopeId","data-v-6be4db6b"]]),yl={class:"home-container"},Cl={class:"logo-container"},wl={class:"welcome-text"},$l={class:"text-xl font-bold text-gray-900"},_l={class:"text-sm text-gray-600 mt-1"},xl={class:"action-buttons"},Bl={__name:"Home",setup(o){const e=()=>{const r=window.innerHeight*.01;document.documentElement.style.setProperty("--vh",`${r}px`)};return De(()=>{e(),window.addEventListener("resize",e)}),Ma(()=>{window.removeEventListener("resize",e)}),(r,t)=>(J(),ao("div",yl,[C("div",Cl,[H(oa,{class:"logo-animation"})]),C("div",wl,[C("h1",$l,U(r.$t("dashboard")),1),C("p",_l,U(r.$t("dashboardWellcom")),1)]),C("div",xl,[H(M(vo),{label:r.$t("createNewInvoice"),icon:"pi pi-plus",onClick:t[0]||(t[0]=a=>r.$router.push("/invoice")),class:"p-button-md"},null,8,["label"]),H(M(vo),{label:r.$t("viewDraftInvoices"),icon:"pi pi-file-o",onClick:t[1]||(t[1]=a=>r.$router.push("/drafts")),class:"p-button-outlined p-button-md mt-3"},null,8,["label"])])]))}},Rl=Lo(Bl,[["__scopeId","data-v-61940edb"]]);function ea(o,e){return function(){return o.apply(e,arguments)}}const{toString:El}=Object.prototype,{getPrototypeOf:nt}=Object,mr=(o=>e=>{const r=El.call(e);return o[r]||(o[r]=r.slice(8,-1).toLowerCase())})(Object.create(null)),zo=o=>(o=o.toLowerCase(),e=>mr(e)===o),pr=o=>e=>typeof e===o,{isArray:Ae}=Array,je=pr("undefined");function Il(o){return o!==null&&!je(o)&&o.constructor!==null&&!je(o.constructor)&&Eo(o.constructor.isBuffer)&&o.constructor.isBuffer(o)}const ra=zo("ArrayBuffer");function Sl(o){let e;return typeof ArrayBuffer!="undefined"&&ArrayBuffer.isView?e=ArrayBuffer.isView(o):e=o&&o.buffer&&ra(o.buffer),e}const Ll=pr("string"),Eo=pr("function"),ta=pr("number"),br=o=>o!==null&&typeof o=="object",Tl=o=>o===!0||o===!1,rr=o=>{if(mr(o)!=="object")return!1;const e=nt(o);return(e===null||e===Object.prototype||Object.getPrototypeOf(e)===null)&&!(Symbol.toStringTag in o)&&!(Symbol.iterator in o)},Nl=zo("Date"),Dl=zo("File"),Ol=zo("Blob"),Al=zo("FileList"),Pl=o=>br(o)&&Eo(o.pipe),Fl=o=>{let e;return o&&(typeof FormData=="function"&&o instanceof FormData||Eo(o.append)&&((e=mr(o))==="formdata"||e==="object"&&Eo(o.toString)&&o.toString()==="[object FormData]"))},zl=zo("URLSearchParams"),[Ml,Wl,Ul,ql]=["ReadableStream","Request","Response","Headers"].map(zo),Hl=o=>o.trim?o.trim():o.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"");function Ye(o,e,{allOwnKeys:r=!1}={}){if(o===null||typeof o=="undefined")return;let t,a;if(typeof o!="object"&&(o=[o]),Ae(o))for(t=0,a=o.length;t<a;t++)e.call(null,o[t],t,o);else{const n=r?Object.getOwnPropertyNames(o):Object.keys(o),i=n.length;let c;for(t=0;t<i;t++)c=n[t],e.call(null,o[c],c,o)}}function na(o,e){e=e.toLowerCase();const r=Object.keys(o);let t=r.length,a;for(;t-- >0;)if(a=r[t],e===a.toLowerCase())return a;return null}const ye=typeof globalThis!="undefined"?globalThis:typeof self!="undefined"?self:typeof window!="undefined"?window:global,aa=o=>!je(o)&&o!==ye;function zr(){const{caseless:o}=aa(this)&&this||{},e={},r=(t,a)=>{const n=o&&na(e,a)||a;rr(e[n])&&rr(t)?e[n]=zr(e[n],t):rr(t)?e[n]=zr({},t):Ae(t)?e[n]=t.slice():e[n]=t};for(let t=0,a=arguments.length;t<a;t++)arguments[t]&&Ye(arguments[t],r);return e}const jl=(o,e,r,{allOwnKeys:t}={})=>(Ye(e,(a,n)=>{r&&Eo(a)?o[n]=ea(a,r):o[n]=a},{allOwnKeys:t}),o),Vl=o=>(o.charCodeAt(0)===65279&&(o=o.slice(1)),o),Yl=(o,e,r,t)=>{o.prototype=Object.create(e.prototype,t),o.prototype.constructor=o,Object.defineProperty(o,"super",{value:e.prototype}),r&&Object.assign(o.prototype,r)},Xl=(o,e,r,t)=>{let a,n,i;const c={};if(e=e||{},o==null)return e;do{for(a=Object.getOwnPropertyNames(o),n=a.length;n-- >0;)i=a[n],(!t||t(i,o,e))&&!c[i]&&(e[i]=o[i],c[i]=!0);o=r!==!1&&nt(o)}while(o&&(!r||r(o,e))&&o!==Object.prototype);return e},Gl=(o,e,r)=>{o=String(o),(r===void 0||r>o.length)&&(r=o.length),r-=e.length;const t=o.indexOf(e,r);return t!==-1&&t===r},Kl=o=>{if(!o)return null;if(Ae(o))return o;let e=o.length;if(!ta(e))return null;const r=new Array(e);for(;e-- >0;)r[e]=o[e];return r},Jl=(o=>e=>o&&e instanceof o)(typeof Uint8Array!="undefined"&&nt(Uint8Array)),Ql=(o,e)=>{const t=(o&&o[Symbol.iterator]).call(o);let a;for(;(a=t.next())&&!a.done;){const n=a.value;e.call(o,n[0],n[1])}},Zl=(o,e)=>{let r;const t=[];for(;(r=o.exec(e))!==null;)t.push(r);return t},os=zo("HTMLFormElement"),es=o=>o.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,function(r,t,a){return t.toUpperCase()+a}),Ht=(({hasOwnProperty:o})=>(e,r)=>o.call(e,r))(Object.prototype),rs=zo("RegExp"),ia=(o,e)=>{const r=Object.getOwnPropertyDescriptors(o),t={};Ye(r,(a,n)=>{let i;(i=e(a,n,o))!==!1&&(t[n]=i||a)}),Object.defineProperties(o,t)},ts=o=>{ia(o,(e,r)=>{if(Eo(o)&&["arguments","caller","callee"].indexOf(r)!==-1)return!1;const t=o[r];if(Eo(t)){if(e.enumerable=!1,"writable"in e){e.writable=!1;return}e.set||(e.set=()=>{throw Error("Can not rewrite read-only method '"+r+"'")})}})},ns=(o,e)=>{const r={},t=a=>{a.forEach(n=>{r[n]=!0})};return Ae(o)?t(o):t(String(o).split(e)),r},as=()=>{},is=(o,e)=>o!=null&&Number.isFinite(o=+o)?o:e;function cs(o){return!!(o&&Eo(o.append)&&o[Symbol.toStringTag]==="FormData"&&o[Symbol.iterator])}const ls=o=>{const e=new Array(10),r=(t,a)=>{if(br(t)){if(e.indexOf(t)>=0)return;if(!("toJSON"in t)){e[a]=t;const n=Ae(t)?[]:{};return Ye(t,(i,c)=>{const l=r(i,a+1);!je(l)&&(n[c]=l)}),e[a]=void 0,n}}return t};return r(o,0)},ss=zo("AsyncFunction"),ds=o=>o&&(br(o)||Eo(o))&&Eo(o.then)&&Eo(o.catch),ca=((o,e)=>o?setImmediate:e?((r,t)=>(ye.addEventListener("message",({source:a,data:n})=>{a===ye&&n===r&&t.length&&t.shift()()},!1),a=>{t.push(a),ye.postMessage(r,"*")}))(`axios@${Math.random()}`,[]):r=>setTimeout(r))(typeof setImmediate=="function",Eo(ye.postMessage)),us=typeof queueMicrotask!="undefined"?queueMicrotask.bind(ye):typeof process!="undefined"&&process.nextTick||ca,w={isArray:Ae,isArrayBuffer:ra,isBuffer:Il,isFormData:Fl,isArrayBufferView:Sl,isString:Ll,isNumber:ta,isBoolean:Tl,isObject:br,isPlainObject:rr,isReadableStream:Ml,isRequest:Wl,isResponse:Ul,isHeaders:ql,isUndefined:je,isDate:Nl,isFile:Dl,isBlob:Ol,isRegExp:rs,isFunction:Eo,isStream:Pl,isURLSearchParams:zl,isTypedArray:Jl,isFileList:Al,forEach:Ye,merge:zr,extend:jl,trim:Hl,stripBOM:Vl,inherits:Yl,toFlatObject:Xl,kindOf:mr,kindOfTest:zo,endsWith:Gl,toArray:Kl,forEachEntry:Ql,matchAll:Zl,isHTMLForm:os,hasOwnProperty:Ht,hasOwnProp:Ht,reduceDescriptors:ia,freezeMethods:ts,toObjectSet:ns,toCamelCase:es,noop:as,toFiniteNumber:is,findKey:na,global:ye,isContextDefined:aa,isSpecCompliantForm:cs,toJSONObject:ls,isAsyncFn:ss,isThenable:ds,setImmediate:ca,asap:us};function K(o,e,r,t,a){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=new Error().stack,this.message=o,this.name="AxiosError",e&&(this.code=e),r&&(this.config=r),t&&(this.request=t),a&&(this.response=a,this.status=a.status?a.status:null)}w.inherits(K,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:w.toJSONObject(this.config),code:this.code,status:this.status}}});const la=K.prototype,sa={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach(o=>{sa[o]={value:o}});Object.defineProperties(K,sa);Object.defineProperty(la,"isAxiosError",{value:!0});K.from=(o,e,r,t,a,n)=>{const i=Object.create(la);return w.toFlatObject(o,i,function(l){return l!==Error.prototype},c=>c!=="isAxiosError"),K.call(i,o.message,e,r,t,a),i.cause=o,i.name=o.name,n&&Object.assign(i,n),i};const fs=null;function Mr(o){return w.isPlainObject(o)||w.isArray(o)}function da(o){return w.endsWith(o,"[]")?o.slice(0,-2):o}function jt(o,e,r){return o?o.concat(e).map(function(a,n){return a=da(a),!r&&n?"["+a+"]":a}).join(r?".":""):e}function gs(o){return w.isArray(o)&&!o.some(Mr)}const ms=w.toFlatObject(w,{},null,function(e){return/^is[A-Z]/.test(e)});function hr(o,e,r){if(!w.isObject(o))throw new TypeError("target must be an object");e=e||new FormData,r=w.toFlatObject(r,{metaTokens:!0,dots:!1,indexes:!1},!1,function(v,h){return!w.isUndefined(h[v])});const t=r.metaTokens,a=r.visitor||u,n=r.dots,i=r.indexes,l=(r.Blob||typeof Blob!="undefined"&&Blob)&&w.isSpecCompliantForm(e);if(!w.isFunction(a))throw new TypeError("visitor must be a function");function s(m){if(m===null)return"";if(w.isDate(m))return m.toISOString();if(!l&&w.isBlob(m))throw new K("Blob is not supported. Use a Buffer instead.");return w.isArrayBuffer(m)||w.isTypedArray(m)?l&&typeof Blob=="function"?new Blob([m]):Buffer.from(m):m}function u(m,v,h){let B=m;if(m&&!h&&typeof m=="object"){if(w.endsWith(v,"{}"))v=t?v:v.slice(0,-2),m=JSON.stringify(m);else if(w.isArray(m)&&gs(m)||(w.isFileList(m)||w.endsWith(v,"[]"))&&(B=w.toArray(m)))return v=da(v),B.forEach(function(b,y){!(w.isUndefined(b)||b===null)&&e.append(i===!0?jt([v],y,n):i===null?v:v+"[]",s(b))}),!1}return Mr(m)?!0:(e.append(jt(h,v,n),s(m)),!1)}const g=[],p=Object.assign(ms,{defaultVisitor:u,convertValue:s,isVisitable:Mr});function k(m,v){if(!w.isUndefined(m)){if(g.indexOf(m)!==-1)throw Error("Circular reference detected in "+v.join("."));g.push(m),w.forEach(m,function(B,A){(!(w.isUndefined(B)||B===null)&&a.call(e,B,w.isString(A)?A.trim():A,v,p))===!0&&k(B,v?v.concat(A):[A])}),g.pop()}}if(!w.isObject(o))throw new TypeError("data must be an object");return k(o),e}function Vt(o){const e={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(o).replace(/[!'()~]|%20|%00/g,function(t){return e[t]})}function at(o,e){this._pairs=[],o&&hr(o,this,e)}const ua=at.prototype;ua.append=function(e,r){this._pairs.push([e,r])};ua.toString=function(e){const r=e?function(t){return e.call(this,t,Vt)}:Vt;return this._pairs.map(function(a){return r(a[0])+"="+r(a[1])},"").join("&")};function ps(o){return encodeURIComponent(o).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+").replace(/%5B/gi,"[").replace(/%5D/gi,"]")}function fa(o,e,r){if(!e)return o;const t=r&&r.encode||ps;w.isFunction(r)&&(r={serialize:r});const a=r&&r.serialize;let n;if(a?n=a(e,r):n=w.isURLSearchParams(e)?e.toString():new at(e,r).toString(t),n){const i=o.indexOf("#");i!==-1&&(o=o.slice(0,i)),o+=(o.indexOf("?")===-1?"?":"&")+n}return o}class Yt{constructor(){this.handlers=[]}use(e,r,t){return this.handlers.push({fulfilled:e,rejected:r,synchronous:t?t.synchronous:!1,runWhen:t?t.runWhen:null}),this.handlers.length-1}eject(e){this.handlers[e]&&(this.handlers[e]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(e){w.forEach(this.handlers,function(t){t!==null&&e(t)})}}const ga={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},bs=typeof URLSearchParams!="undefined"?URLSearchParams:at,hs=typeof FormData!="undefined"?FormData:null,vs=typeof Blob!="undefined"?Blob:null,ks={isBrowser:!0,classes:{URLSearchParams:bs,FormData:hs,Blob:vs},protocols:["http","https","file","blob","url","data"]},it=typeof window!="undefined"&&typeof document!="undefined",Wr=typeof navigator=="object"&&navigator||void 0,ys=it&&(!Wr||["ReactNative","NativeScript","NS"].indexOf(Wr.product)<0),Cs=typeof WorkerGlobalScope!="undefined"&&self instanceof WorkerGlobalScope&&typeof self.importScripts=="function",ws=it&&window.location.href||"http://localhost",$s=Object.freeze(Object.defineProperty({__proto__:null,hasBrowserEnv:it,hasStandardBrowserEnv:ys,hasStandardBrowserWebWorkerEnv:Cs,navigator:Wr,origin:ws},Symbol.toStringTag,{value:"Module"})),yo=be(be({},$s),ks);function _s(o,e){return hr(o,new yo.classes.URLSearchParams,Object.assign({visitor:function(r,t,a,n){return yo.isNode&&w.isBuffer(r)?(this.append(t,r.toString("base64")),!1):n.defaultVisitor.apply(this,arguments)}},e))}function xs(o){return w.matchAll(/\w+|\[(\w*)]/g,o).map(e=>e[0]==="[]"?"":e[1]||e[0])}function Bs(o){const e={},r=Object.keys(o);let t;const a=r.length;let n;for(t=0;t<a;t++)n=r[t],e[n]=o[n];return e}function ma(o){function e(r,t,a,n){let i=r[n++];if(i==="__proto__")return!0;const c=Number.isFinite(+i),l=n>=r.length;return i=!i&&w.isArray(a)?a.length:i,l?(w.hasOwnProp(a,i)?a[i]=[a[i],t]:a[i]=t,!c):((!a[i]||!w.isObject(a[i]))&&(a[i]=[]),e(r,t,a[i],n)&&w.isArray(a[i])&&(a[i]=Bs(a[i])),!c)}if(w.isFormData(o)&&w.isFunction(o.entries)){const r={};return w.forEachEntry(o,(t,a)=>{e(xs(t),a,r,0)}),r}return null}function Rs(o,e,r){if(w.isString(o))try{return(e||JSON.parse)(o),w.trim(o)}catch(t){if(t.name!=="SyntaxError")throw t}return(r||JSON.stringify)(o)}const Xe={transitional:ga,adapter:["xhr","http","fetch"],transformRequest:[function(e,r){const t=r.getContentType()||"",a=t.indexOf("application/json")>-1,n=w.isObject(e);if(n&&w.isHTMLForm(e)&&(e=new FormData(e)),w.isFormData(e))return a?JSON.stringify(ma(e)):e;if(w.isArrayBuffer(e)||w.isBuffer(e)||w.isStream(e)||w.isFile(e)||w.isBlob(e)||w.isReadableStream(e))return e;if(w.isArrayBufferView(e))return e.buffer;if(w.isURLSearchParams(e))return r.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),e.toString();let c;if(n){if(t.indexOf("application/x-www-form-urlencoded")>-1)return _s(e,this.formSerializer).toString();if((c=w.isFileList(e))||t.indexOf("multipart/form-data")>-1){const l=this.env&&this.env.FormData;return hr(c?{"files[]":e}:e,l&&new l,this.formSerializer)}}return n||a?(r.setContentType("application/json",!1),Rs(e)):e}],transformResponse:[function(e){const r=this.transitional||Xe.transitional,t=r&&r.forcedJSONParsing,a=this.responseType==="json";if(w.isResponse(e)||w.isReadableStream(e))return e;if(e&&w.isString(e)&&(t&&!this.responseType||a)){const i=!(r&&r.silentJSONParsing)&&a;try{return JSON.parse(e)}catch(c){if(i)throw c.name==="SyntaxError"?K.from(c,K.ERR_BAD_RESPONSE,this,null,this.response):c}}return e}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:yo.classes.FormData,Blob:yo.classes.Blob},validateStatus:function(e){return e>=200&&e<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};w.forEach(["delete","get","head","post","put","patch"],o=>{Xe.headers[o]={}});const Es=w.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),Is=o=>{const e={};let r,t,a;return o&&o.split(`
-`).forEach(function(i){a=i.indexOf(":"),r=i.substring(0,a).trim().toLowerCase(),t=i.substring(a+1).trim(),!(!r||e[r]&&Es[r])&&(r==="set-cookie"?e[r]?e[r].push(t):e[r]=[t]:e[r]=e[r]?e[r]+", "+t:t)}),e},Xt=Symbol("internals");function ze(o){return o&&String(o).trim().toLowerCase()}function tr(o){return o===!1||o==null?o:w.isArray(o)?o.map(tr):String(o)}function Ss(o){const e=Object.create(null),r=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let t;for(;t=r.exec(o);)e[t[1]]=t[2];return e}const Ls=o=>/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(o.trim());function Rr(o,e,r,t,a){if(w.isFunction(t))return t.call(this,e,r);if(a&&(e=r),!!w.isString(e)){if(w.isString(t))return e.indexOf(t)!==-1;if(w.isRegExp(t))return t.test(e)}}function Ts(o){return o.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,(e,r,t)=>r.toUpperCase()+t)}function Ns(o,e){const r=w.toCamelCase(" "+e);["get","set","has"].forEach(t=>{Object.defineProperty(o,t+r,{value:function(a,n,i){return this[t].call(this,e,a,n,i)},configurable:!0})})}let _o=class{constructor(e){e&&this.set(e)}set(e,r,t){const a=this;function n(c,l,s){const u=ze(l);if(!u)throw new Error("header name must be a non-empty string");const g=w.findKey(a,u);(!g||a[g]===void 0||s===!0||s===void 0&&a[g]!==!1)&&(a[g||l]=tr(c))}const i=(c,l)=>w.forEach(c,(s,u)=>n(s,u,l));if(w.isPlainObject(e)||e instanceof this.constructor)i(e,r);else if(w.isString(e)&&(e=e.trim())&&!Ls(e))i(Is(e),r);else if(w.isHeaders(e))for(const[c,l]of e.entries())n(l,c,t);else e!=null&&n(r,e,t);return this}get(e,r){if(e=ze(e),e){const t=w.findKey(this,e);if(t){const a=this[t];if(!r)return a;if(r===!0)return Ss(a);if(w.isFunction(r))return r.call(this,a,t);if(w.isRegExp(r))return r.exec(a);throw new TypeError("parser must be boolean|regexp|function")}}}has(e,r){if(e=ze(e),e){const t=w.findKey(this,e);return!!(t&&this[t]!==void 0&&(!r||Rr(this,this[t],t,r)))}return!1}delete(e,r){const t=this;let a=!1;function n(i){if(i=ze(i),i){const c=w.findKey(t,i);c&&(!r||Rr(t,t[c],c,r))&&(delete t[c],a=!0)}}return w.isArray(e)?e.forEach(n):n(e),a}clear(e){const r=Object.keys(this);let t=r.length,a=!1;for(;t--;){const n=r[t];(!e||Rr(this,this[n],n,e,!0))&&(delete this[n],a=!0)}return a}normalize(e){const r=this,t={};return w.forEach(this,(a,n)=>{const i=w.findKey(t,n);if(i){r[i]=tr(a),delete r[n];return}const c=e?Ts(n):String(n).trim();c!==n&&delete r[n],r[c]=tr(a),t[c]=!0}),this}concat(...e){return this.constructor.concat(this,...e)}toJSON(e){const r=Object.create(null);return w.forEach(this,(t,a)=>{t!=null&&t!==!1&&(r[a]=e&&w.isArray(t)?t.join(", "):t)}),r}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map(([e,r])=>e+": "+r).join(`
-`)}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(e){return e instanceof this?e:new this(e)}static concat(e,...r){const t=new this(e);return r.forEach(a=>t.set(a)),t}static accessor(e){const t=(this[Xt]=this[Xt]={accessors:{}}).accessors,a=this.prototype;function n(i){const c=ze(i);t[c]||(Ns(a,i),t[c]=!0)}return w.isArray(e)?e.forEach(n):n(e),this}};_o.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]);w.reduceDescriptors(_o.prototype,({value:o},e)=>{let r=e[0].toUpperCase()+e.slice(1);return{get:()=>o,set(t){this[r]=t}}});w.freezeMethods(_o);function Er(o,e){const r=this||Xe,t=e||r,a=_o.from(t.headers);let n=t.data;return w.forEach(o,function(c){n=c.call(r,n,a.normalize(),e?e.status:void 0)}),a.normalize(),n}function pa(o){return!!(o&&o.__CANCEL__)}function Pe(o,e,r){K.call(this,o==null?"canceled":o,K.ERR_CANCELED,e,r),this.name="CanceledError"}w.inherits(Pe,K,{__CANCEL__:!0});function ba(o,e,r){const t=r.config.validateStatus;!r.status||!t||t(r.status)?o(r):e(new K("Request failed with status code "+r.status,[K.ERR_BAD_REQUEST,K.ERR_BAD_RESPONSE][Math.floor(r.status/100)-4],r.config,r.request,r))}function Ds(o){const e=/^([-+\w]{1,25})(:?\/\/|:)/.exec(o);return e&&e[1]||""}function Os(o,e){o=o||10;const r=new Array(o),t=new Array(o);let a=0,n=0,i;return e=e!==void 0?e:1e3,function(l){const s=Date.now(),u=t[n];i||(i=s),r[a]=l,t[a]=s;let g=n,p=0;for(;g!==a;)p+=r[g++],g=g%o;if(a=(a+1)%o,a===n&&(n=(n+1)%o),s-i<e)return;const k=u&&s-u;return k?Math.round(p*1e3/k):void 0}}function As(o,e){let r=0,t=1e3/e,a,n;const i=(s,u=Date.now())=>{r=u,a=null,n&&(clearTimeout(n),n=null),o.apply(null,s)};return[(...s)=>{const u=Date.now(),g=u-r;g>=t?i(s,u):(a=s,n||(n=setTimeout(()=>{n=null,i(a)},t-g)))},()=>a&&i(a)]}const cr=(o,e,r=3)=>{let t=0;const a=Os(50,250);return As(n=>{const i=n.loaded,c=n.lengthComputable?n.total:void 0,l=i-t,s=a(l),u=i<=c;t=i;const g={loaded:i,total:c,progress:c?i/c:void 0,bytes:l,rate:s||void 0,estimated:s&&c&&u?(c-i)/s:void 0,event:n,lengthComputable:c!=null,[e?"download":"upload"]:!0};o(g)},r)},Gt=(o,e)=>{const r=o!=null;return[t=>e[0]({lengthComputable:r,total:o,loaded:t}),e[1]]},Kt=o=>(...e)=>w.asap(()=>o(...e)),Ps=yo.hasStandardBrowserEnv?((o,e)=>r=>(r=new URL(r,yo.origin),o.protocol===r.protocol&&o.host===r.host&&(e||o.port===r.port)))(new URL(yo.origin),yo.navigator&&/(msie|trident)/i.test(yo.navigator.userAgent)):()=>!0,Fs=yo.hasStandardBrowserEnv?{write(o,e,r,t,a,n){const i=[o+"="+encodeURIComponent(e)];w.isNumber(r)&&i.push("expires="+new Date(r).toGMTString()),w.isString(t)&&i.push("path="+t),w.isString(a)&&i.push("domain="+a),n===!0&&i.push("secure"),document.cookie=i.join("; ")},read(o){const e=document.cookie.match(new RegExp("(^|;\\s*)("+o+")=([^;]*)"));return e?decodeURIComponent(e[3]):null},remove(o){this.write(o,"",Date.now()-864e5)}}:{write(){},read(){return null},remove(){}};function zs(o){return/^([a-z][a-z\d+\-.]*:)?\/\//i.test(o)}function Ms(o,e){return e?o.replace(/\/?\/$/,"")+"/"+e.replace(/^\/+/,""):o}function ha(o,e,r){let t=!zs(e);return o&&(t||r==!1)?Ms(o,e):e}const Jt=o=>o instanceof _o?be({},o):o;function _e(o,e){e=e||{};const r={};function t(s,u,g,p){return w.isPlainObject(s)&&w.isPlainObject(u)?w.merge.call({caseless:p},s,u):w.isPlainObject(u)?w.merge({},u):w.isArray(u)?u.slice():u}function a(s,u,g,p){if(w.isUndefined(u)){if(!w.isUndefined(s))return t(void 0,s,g,p)}else return t(s,u,g,p)}function n(s,u){if(!w.isUndefined(u))return t(void 0,u)}function i(s,u){if(w.isUndefined(u)){if(!w.isUndefined(s))return t(void 0,s)}else return t(void 0,u)}function c(s,u,g){if(g in e)return t(s,u);if(g in o)return t(void 0,s)}const l={url:n,method:n,data:n,baseURL:i,transformRequest:i,transformResponse:i,paramsSerializer:i,timeout:i,timeoutMessage:i,withCredentials:i,withXSRFToken:i,adapter:i,responseType:i,xsrfCookieName:i,xsrfHeaderName:i,onUploadProgress:i,onDownloadProgress:i,decompress:i,maxContentLength:i,maxBodyLength:i,beforeRedirect:i,transport:i,httpAgent:i,httpsAgent:i,cancelToken:i,socketPath:i,responseEncoding:i,validateStatus:c,headers:(s,u,g)=>a(Jt(s),Jt(u),g,!0)};return w.forEach(Object.keys(Object.assign({},o,e)),function(u){const g=l[u]||a,p=g(o[u],e[u],u);w.isUndefined(p)&&g!==c||(r[u]=p)}),r}const va=o=>{const e=_e({},o);let{data:r,withXSRFToken:t,xsrfHeaderName:a,xsrfCookieName:n,headers:i,auth:c}=e;e.headers=i=_o.from(i),e.url=fa(ha(e.baseURL,e.url,e.allowAbsoluteUrls),o.params,o.paramsSerializer),c&&i.set("Authorization","Basic "+btoa((c.username||"")+":"+(c.password?unescape(encodeURIComponent(c.password)):"")));let l;if(w.isFormData(r)){if(yo.hasStandardBrowserEnv||yo.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if((l=i.getContentType())!==!1){const[s,...u]=l?l.split(";").map(g=>g.trim()).filter(Boolean):[];i.setContentType([s||"multipart/form-data",...u].join("; "))}}if(yo.hasStandardBrowserEnv&&(t&&w.isFunction(t)&&(t=t(e)),t||t!==!1&&Ps(e.url))){const s=a&&n&&Fs.read(n);s&&i.set(a,s)}return e},Ws=typeof XMLHttpRequest!="undefined",Us=Ws&&function(o){return new Promise(function(r,t){const a=va(o);let n=a.data;const i=_o.from(a.headers).normalize();let{responseType:c,onUploadProgress:l,onDownloadProgress:s}=a,u,g,p,k,m;function v(){k&&k(),m&&m(),a.cancelToken&&a.cancelToken.unsubscribe(u),a.signal&&a.signal.removeEventListener("abort",u)}let h=new XMLHttpRequest;h.open(a.method.toUpperCase(),a.url,!0),h.timeout=a.timeout;function B(){if(!h)return;const b=_o.from("getAllResponseHeaders"in h&&h.getAllResponseHeaders()),E={data:!c||c==="text"||c==="json"?h.responseText:h.response,status:h.status,statusText:h.statusText,headers:b,config:o,request:h};ba(function(I){r(I),v()},function(I){t(I),v()},E),h=null}"onloadend"in h?h.onloadend=B:h.onreadystatechange=function(){!h||h.readyState!==4||h.status===0&&!(h.responseURL&&h.responseURL.indexOf("file:")===0)||setTimeout(B)},h.onabort=function(){h&&(t(new K("Request aborted",K.ECONNABORTED,o,h)),h=null)},h.onerror=function(){t(new K("Network Error",K.ERR_NETWORK,o,h)),h=null},h.ontimeout=function(){let y=a.timeout?"timeout of "+a.timeout+"ms exceeded":"timeout exceeded";const E=a.transitional||ga;a.timeoutErrorMessage&&(y=a.timeoutErrorMessage),t(new K(y,E.clarifyTimeoutError?K.ETIMEDOUT:K.ECONNABORTED,o,h)),h=null},n===void 0&&i.setContentType(null),"setRequestHeader"in h&&w.forEach(i.toJSON(),function(y,E){h.setRequestHeader(E,y)}),w.isUndefined(a.withCredentials)||(h.withCredentials=!!a.withCredentials),c&&c!=="json"&&(h.responseType=a.responseType),s&&([p,m]=cr(s,!0),h.addEventListener("progress",p)),l&&h.upload&&([g,k]=cr(l),h.upload.addEventListener("progress",g),h.upload.addEventListener("loadend",k)),(a.cancelToken||a.signal)&&(u=b=>{h&&(t(!b||b.type?new Pe(null,o,h):b),h.abort(),h=null)},a.cancelToken&&a.cancelToken.subscribe(u),a.signal&&(a.signal.aborted?u():a.signal.addEventListener("abort",u)));const A=Ds(a.url);if(A&&yo.protocols.indexOf(A)===-1){t(new K("Unsupported protocol "+A+":",K.ERR_BAD_REQUEST,o));return}h.send(n||null)})},qs=(o,e)=>{const{length:r}=o=o?o.filter(Boolean):[];if(e||r){let t=new AbortController,a;const n=function(s){if(!a){a=!0,c();const u=s instanceof Error?s:this.reason;t.abort(u instanceof K?u:new Pe(u instanceof Error?u.message:u))}};let i=e&&setTimeout(()=>{i=null,n(new K(`timeout ${e} of ms exceeded`,K.ETIMEDOUT))},e);const c=()=>{o&&(i&&clearTimeout(i),i=null,o.forEach(s=>{s.unsubscribe?s.unsubscribe(n):s.removeEventListener("abort",n)}),o=null)};o.forEach(s=>s.addEventListener("abort",n));const{signal:l}=t;return l.unsubscribe=()=>w.asap(c),l}},Hs=function*(o,e){let r=o.byteLength;if(r<e){yield o;return}let t=0,a;for(;t<r;)a=t+e,yield o.slice(t,a),t=a},js=function(o,e){return wr(this,null,function*(){try{for(var r=st(Vs(o)),t,a,n;t=!(a=yield new he(r.next())).done;t=!1){const i=a.value;yield*$r(Hs(i,e))}}catch(a){n=[a]}finally{try{t&&(a=r.return)&&(yield new he(a.call(r)))}finally{if(n)throw n[0]}}})},Vs=function(o){return wr(this,null,function*(){if(o[Symbol.asyncIterator]){yield*$r(o);return}const e=o.getReader();try{for(;;){const{done:r,value:t}=yield new he(e.read());if(r)break;yield t}}finally{yield new he(e.cancel())}})},Qt=(o,e,r,t)=>{const a=js(o,e);let n=0,i,c=s=>{i||(i=!0,t&&t(s))};return new ReadableStream({pull(s){return to(this,null,function*(){try{const{done:u,value:g}=yield a.next();if(u){c(),s.close();return}let p=g.byteLength;if(r){let k=n+=p;r(k)}s.enqueue(new Uint8Array(g))}catch(u){throw c(u),u}})},cancel(s){return c(s),a.return()}},{highWaterMark:2})},vr=typeof fetch=="function"&&typeof Request=="function"&&typeof Response=="function",ka=vr&&typeof ReadableStream=="function",Ys=vr&&(typeof TextEncoder=="function"?(o=>e=>o.encode(e))(new TextEncoder):o=>to(Ge,null,function*(){return new Uint8Array(yield new Response(o).arrayBuffer())})),ya=(o,...e)=>{try{return!!o(...e)}catch(r){return!1}},Xs=ka&&ya(()=>{let o=!1;const e=new Request(yo.origin,{body:new ReadableStream,method:"POST",get duplex(){return o=!0,"half"}}).headers.has("Content-Type");return o&&!e}),Zt=64*1024,Ur=ka&&ya(()=>w.isReadableStream(new Response("").body)),lr={stream:Ur&&(o=>o.body)};vr&&(o=>{["text","arrayBuffer","blob","formData","stream"].forEach(e=>{!lr[e]&&(lr[e]=w.isFunction(o[e])?r=>r[e]():(r,t)=>{throw new K(`Response type '${e}' is not supported`,K.ERR_NOT_SUPPORT,t)})})})(new Response);const Gs=o=>to(Ge,null,function*(){if(o==null)return 0;if(w.isBlob(o))return o.size;if(w.isSpecCompliantForm(o))return(yield new Request(yo.origin,{method:"POST",body:o}).arrayBuffer()).byteLength;if(w.isArrayBufferView(o)||w.isArrayBuffer(o))return o.byteLength;if(w.isURLSearchParams(o)&&(o=o+""),w.isString(o))return(yield Ys(o)).byteLength}),Ks=(o,e)=>to(Ge,null,function*(){const r=w.toFiniteNumber(o.getContentLength());return r==null?Gs(e):r}),Js=vr&&(o=>to(Ge,null,function*(){let{url:e,method:r,data:t,signal:a,cancelToken:n,timeout:i,onDownloadProgress:c,onUploadProgress:l,responseType:s,headers:u,withCredentials:g="same-origin",fetchOptions:p}=va(o);s=s?(s+"").toLowerCase():"text";let k=qs([a,n&&n.toAbortSignal()],i),m;const v=k&&k.unsubscribe&&(()=>{k.unsubscribe()});let h;try{if(l&&Xs&&r!=="get"&&r!=="head"&&(h=yield Ks(u,t))!==0){let E=new Request(e,{method:"POST",body:t,duplex:"half"}),x;if(w.isFormData(t)&&(x=E.headers.get("content-type"))&&u.setContentType(x),E.body){const[I,D]=Gt(h,cr(Kt(l)));t=Qt(E.body,Zt,I,D)}}w.isString(g)||(g=g?"include":"omit");const B="credentials"in Request.prototype;m=new Request(e,Je(be({},p),{signal:k,method:r.toUpperCase(),headers:u.normalize().toJSON(),body:t,duplex:"half",credentials:B?g:void 0}));let A=yield fetch(m);const b=Ur&&(s==="stream"||s==="response");if(Ur&&(c||b&&v)){const E={};["status","statusText","headers"].forEach(N=>{E[N]=A[N]});const x=w.toFiniteNumber(A.headers.get("content-length")),[I,D]=c&&Gt(x,cr(Kt(c),!0))||[];A=new Response(Qt(A.body,Zt,I,()=>{D&&D(),v&&v()}),E)}s=s||"text";let y=yield lr[w.findKey(lr,s)||"text"](A,o);return!b&&v&&v(),yield new Promise((E,x)=>{ba(E,x,{data:y,headers:_o.from(A.headers),status:A.status,statusText:A.statusText,config:o,request:m})})}catch(B){throw v&&v(),B&&B.name==="TypeError"&&/fetch/i.test(B.message)?Object.assign(new K("Network Error",K.ERR_NETWORK,o,m),{cause:B.cause||B}):K.from(B,B&&B.code,o,m)}})),qr={http:fs,xhr:Us,fetch:Js};w.forEach(qr,(o,e)=>{if(o){try{Object.defineProperty(o,"name",{value:e})}catch(r){}Object.defineProperty(o,"adapterName",{value:e})}});const on=o=>`- ${o}`,Qs=o=>w.isFunction(o)||o===null||o===!1,Ca={getAdapter:o=>{o=w.isArray(o)?o:[o];const{length:e}=o;let r,t;const a={};for(let n=0;n<e;n++){r=o[n];let i;if(t=r,!Qs(r)&&(t=qr[(i=String(r)).toLowerCase()],t===void 0))throw new K(`Unknown adapter '${i}'`);if(t)break;a[i||"#"+n]=t}if(!t){const n=Object.entries(a).map(([c,l])=>`adapter ${c} `+(l===!1?"is not supported by the environment":"is not available in the build"));let i=e?n.length>1?`since :
-`+n.map(on).join(`
-`):" "+on(n[0]):"as no adapter specified";throw new K("There is no suitable adapter to dispatch the request "+i,"ERR_NOT_SUPPORT")}return t},adapters:qr};function Ir(o){if(o.cancelToken&&o.cancelToken.throwIfRequested(),o.signal&&o.signal.aborted)throw new Pe(null,o)}function en(o){return Ir(o),o.headers=_o.from(o.headers),o.data=Er.call(o,o.transformRequest),["post","put","patch"].indexOf(o.method)!==-1&&o.headers.setContentType("application/x-www-form-urlencoded",!1),Ca.getAdapter(o.adapter||Xe.adapter)(o).then(function(t){return Ir(o),t.data=Er.call(o,o.transformResponse,t),t.headers=_o.from(t.headers),t},function(t){return pa(t)||(Ir(o),t&&t.response&&(t.response.data=Er.call(o,o.transformResponse,t.response),t.response.headers=_o.from(t.response.headers))),Promise.reject(t)})}const wa="1.8.4",kr={};["object","boolean","number","function","string","symbol"].forEach((o,e)=>{kr[o]=function(t){return typeof t===o||"a"+(e<1?"n ":" ")+o}});const rn={};kr.transitional=function(e,r,t){function a(n,i){return"[Axios v"+wa+"] Transitional option '"+n+"'"+i+(t?". "+t:"")}return(n,i,c)=>{if(e===!1)throw new K(a(i," has been removed"+(r?" in "+r:"")),K.ERR_DEPRECATED);return r&&!rn[i]&&(rn[i]=!0,console.warn(a(i," has been deprecated since v"+r+" and will be removed in the near future"))),e?e(n,i,c):!0}};kr.spelling=function(e){return(r,t)=>(console.warn(`${t} is likely a misspelling of ${e}`),!0)};function Zs(o,e,r){if(typeof o!="object")throw new K("options must be an object",K.ERR_BAD_OPTION_VALUE);const t=Object.keys(o);let a=t.length;for(;a-- >0;){const n=t[a],i=e[n];if(i){const c=o[n],l=c===void 0||i(c,n,o);if(l!==!0)throw new K("option "+n+" must be "+l,K.ERR_BAD_OPTION_VALUE);continue}if(r!==!0)throw new K("Unknown option "+n,K.ERR_BAD_OPTION)}}const nr={assertOptions:Zs,validators:kr},Mo=nr.validators;let Ce=class{constructor(e){this.defaults=e,this.interceptors={request:new Yt,response:new Yt}}request(e,r){return to(this,null,function*(){try{return yield this._request(e,r)}catch(t){if(t instanceof Error){let a={};Error.captureStackTrace?Error.captureStackTrace(a):a=new Error;const n=a.stack?a.stack.replace(/^.+\n/,""):"";try{t.stack?n&&!String(t.stack).endsWith(n.replace(/^.+\n.+\n/,""))&&(t.stack+=`
-`+n):t.stack=n}catch(i){}}throw t}})}_request(e,r){typeof e=="string"?(r=r||{},r.url=e):r=e||{},r=_e(this.defaults,r);const{transitional:t,paramsSerializer:a,headers:n}=r;t!==void 0&&nr.assertOptions(t,{silentJSONParsing:Mo.transitional(Mo.boolean),forcedJSONParsing:Mo.transitional(Mo.boolean),clarifyTimeoutError:Mo.transitional(Mo.boolean)},!1),a!=null&&(w.isFunction(a)?r.paramsSerializer={serialize:a}:nr.assertOptions(a,{encode:Mo.function,serialize:Mo.function},!0)),r.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?r.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:r.allowAbsoluteUrls=!0),nr.assertOptions(r,{baseUrl:Mo.spelling("baseURL"),withXsrfToken:Mo.spelling("withXSRFToken")},!0),r.method=(r.method||this.defaults.method||"get").toLowerCase();let i=n&&w.merge(n.common,n[r.method]);n&&w.forEach(["delete","get","head","post","put","patch","common"],m=>{delete n[m]}),r.headers=_o.concat(i,n);const c=[];let l=!0;this.interceptors.request.forEach(function(v){typeof v.runWhen=="function"&&v.runWhen(r)===!1||(l=l&&v.synchronous,c.unshift(v.fulfilled,v.rejected))});const s=[];this.interceptors.response.forEach(function(v){s.push(v.fulfilled,v.rejected)});let u,g=0,p;if(!l){const m=[en.bind(this),void 0];for(m.unshift.apply(m,c),m.push.apply(m,s),p=m.length,u=Promise.resolve(r);g<p;)u=u.then(m[g++],m[g++]);return u}p=c.length;let k=r;for(g=0;g<p;){const m=c[g++],v=c[g++];try{k=m(k)}catch(h){v.call(this,h);break}}try{u=en.call(this,k)}catch(m){return Promise.reject(m)}for(g=0,p=s.length;g<p;)u=u.then(s[g++],s[g++]);return u}getUri(e){e=_e(this.defaults,e);const r=ha(e.baseURL,e.url,e.allowAbsoluteUrls);return fa(r,e.params,e.paramsSerializer)}};w.forEach(["delete","get","head","options"],function(e){Ce.prototype[e]=function(r,t){return this.request(_e(t||{},{method:e,url:r,data:(t||{}).data}))}});w.forEach(["post","put","patch"],function(e){function r(t){return function(n,i,c){return this.request(_e(c||{},{method:e,headers:t?{"Content-Type":"multipart/form-data"}:{},url:n,data:i}))}}Ce.prototype[e]=r(),Ce.prototype[e+"Form"]=r(!0)});let od=class $a{constructor(e){if(typeof e!="function")throw new TypeError("executor must be a function.");let r;this.promise=new Promise(function(n){r=n});const t=this;this.promise.then(a=>{if(!t._listeners)return;let n=t._listeners.length;for(;n-- >0;)t._listeners[n](a);t._listeners=null}),this.promise.then=a=>{let n;const i=new Promise(c=>{t.subscribe(c),n=c}).then(a);return i.cancel=function(){t.unsubscribe(n)},i},e(function(n,i,c){t.reason||(t.reason=new Pe(n,i,c),r(t.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(e){if(this.reason){e(this.reason);return}this._listeners?this._listeners.push(e):this._listeners=[e]}unsubscribe(e){if(!this._listeners)return;const r=this._listeners.indexOf(e);r!==-1&&this._listeners.splice(r,1)}toAbortSignal(){const e=new AbortController,r=t=>{e.abort(t)};return this.subscribe(r),e.signal.unsubscribe=()=>this.unsubscribe(r),e.signal}static source(){let e;return{token:new $a(function(a){e=a}),cancel:e}}};function ed(o){return function(r){return o.apply(null,r)}}function rd(o){return w.isObject(o)&&o.isAxiosError===!0}const Hr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Hr).forEach(([o,e])=>{Hr[e]=o});function _a(o){const e=new Ce(o),r=ea(Ce.prototype.request,e);return w.extend(r,Ce.prototype,e,{allOwnKeys:!0}),w.extend(r,e,null,{allOwnKeys:!0}),r.create=function(a){return _a(_e(o,a))},r}const Z=_a(Xe);Z.Axios=Ce;Z.CanceledError=Pe;Z.CancelToken=od;Z.isCancel=pa;Z.VERSION=wa;Z.toFormData=hr;Z.AxiosError=K;Z.Cancel=Z.CanceledError;Z.all=function(e){return Promise.all(e)};Z.spread=ed;Z.isAxiosError=rd;Z.mergeConfig=_e;Z.AxiosHeaders=_o;Z.formToJSON=o=>ma(w.isHTMLForm(o)?new FormData(o):o);Z.getAdapter=Ca.getAdapter;Z.HttpStatusCode=Hr;Z.default=Z;const{Axios:K8,AxiosError:J8,CanceledError:Q8,isCancel:Z8,CancelToken:oE,VERSION:eE,all:rE,Cancel:tE,isAxiosError:nE,spread:aE,toFormData:iE,AxiosHeaders:cE,HttpStatusCode:lE,formToJSON:sE,getAdapter:dE,mergeConfig:uE}=Z,td={class:"mb-4"},nd={key:0,class:"font-semibold text-lg"},ad={class:"grid grid-cols-1 sm:grid-cols-2 gap-2"},id={class:"w-full"},cd={class:"grid grid-cols-12 gap-1"},ld={class:"col-span-11"},sd={for:"supplier"},dd={class:"col-span-1 flex items-center justify-center"},ud={key:0,class:"text-sm text-red-500 validationErrors"},fd={class:"w-full"},gd={class:"grid grid-cols-12 gap-1"},md={class:"col-span-11"},pd={for:"customer"},bd={class:"col-span-1 flex items-center justify-center"},hd={__name:"InvoiceHeader",props:{supplier:{type:[Object,String],default:""},customer:{type:[Object,String],default:""},invoiceName:{type:String,default:null},allSuppliers:{type:Array,default:()=>[]},allCustomers:{type:Array,default:()=>[]},validationErrors:{type:Object,default:()=>({})},disabled:{type:Boolean,default:!1}},emits:["update:supplier","update:customer","clear-supplier","clear-customer"],setup(o,{emit:e}){const r=o,t=e,a=lo([]),n=lo([]),i=X({get(){return r.supplier},set(p){r.disabled||(t("update:supplier",p),t("clear-supplier"))}}),c=X({get(){return r.customer},set(p){r.disabled||(t("update:customer",p),t("clear-customer"))}}),l=p=>{if(r.disabled)return;const k=p.query.toLowerCase();a.value=r.allSuppliers.filter(m=>m.label.toLowerCase().includes(k))},s=p=>{var m;if(r.disabled)return;const k=((m=p.query)==null?void 0:m.toLowerCase())||"";n.value=k?r.allCustomers.filter(v=>v.label.toLowerCase().includes(k)):r.allCustomers.slice(0,5)},u=()=>{r.disabled||(t("update:supplier",""),t("clear-supplier"))},g=()=>{r.disabled||(t("update:customer",""),t("clear-customer"))};return(p,k)=>(J(),ao("div",null,[C("div",td,[o.invoiceName?(J(),ao("h3",nd,U(p.$t("invoiceName"))+": "+U(o.invoiceName),1)):po("",!0)]),C("div",ad,[C("div",id,[C("div",cd,[C("div",ld,[H(M(Xo),{variant:"on",class:"w-full block"},{default:go(()=>[H(M(We),{modelValue:i.value,"onUpdate:modelValue":k[0]||(k[0]=m=>i.value=m),inputId:"supplier",suggestions:a.value,optionLabel:"label",onComplete:l,forceSelection:!0,completeOnFocus:!0,class:"w-full",disabled:o.disabled},null,8,["modelValue","suggestions","disabled"]),C("label",sd,U(p.$t("supplier")),1)]),_:1})]),C("div",dd,[H(M(vo),{icon:"pi pi-trash",class:$e(["p-button-rounded p-button-text",i.value?"p-button-danger":""]),onClick:u,type:"button","aria-label":"Clear supplier",disabled:o.disabled||!i.value},null,8,["class","disabled"])])]),o.validationErrors.supplier?(J(),ao("span",ud,U(p.$t("supplierIsRequired")),1)):po("",!0)]),C("div",fd,[C("div",gd,[C("div",md,[H(M(Xo),{variant:"on",class:"w-full block"},{default:go(()=>[H(M(We),{modelValue:c.value,"onUpdate:modelValue":k[1]||(k[1]=m=>c.value=m),inputId:"customer",suggestions:n.value,optionLabel:"label",onComplete:s,forceSelection:!0,completeOnFocus:!0,class:"w-full",disabled:o.disabled},null,8,["modelValue","suggestions","disabled"]),C("label",pd,U(p.$t("customer")),1)]),_:1})]),C("div",bd,[H(M(vo),{icon:"pi pi-trash",class:$e(["p-button-rounded p-button-text",c.value?"p-button-danger":""]),onClick:g,type:"button","aria-label":"Clear customer",disabled:o.disabled||!c.value},null,8,["class","disabled"])])])])])]))}},vd=Lo(hd,[["__scopeId","data-v-d202a8e3"]]),kd={class:"mt-4 grid grid-cols-2 items-center",style:{direction:"ltr"}},yd={class:"text-left text-sm font-semibold text-gray-700 whitespace-nowrap"},Cd={class:"text-right"},wd={__name:"ItemsTable",props:{items:{type:Array,required:!0},isDraft:{type:Boolean,default:!0},canUpdateDraft:{type:Boolean,default:!0},canDeleteInvoice:{type:Boolean,default:!1}},emits:["row-click","add-item","delete-item"],setup(o,{emit:e}){const{t:r}=Ko(),t=Gr(),a=Ve(),n=o,i=Ne("$permissions"),c=e,l=X(()=>n.canDeleteInvoice&&n.isDraft&&n.canUpdateDraft),s=h=>{n.canUpdateDraft&&!h.originalEvent.target.closest(".p-button")&&c("row-click",h)},u=X(()=>(i==null?void 0:i.hasPermission("show_item_remark"))||!1),g=(h,B)=>{h.stopPropagation(),t.require({message:r("confirmDeleteItem"),header:r("confirmDelete"),icon:"pi pi-exclamation-triangle",acceptClass:"p-button-danger",acceptLabel:r("yesDelete"),rejectLabel:r("cancel"),accept:()=>{c("delete-item",B)},reject:()=>{a.add({severity:"info",summary:r("cancelled"),life:2e3})}})},p=h=>({"cursor-default":!n.canUpdateDraft,"cursor-pointer":n.canUpdateDraft}),k=X(()=>n.items.reduce((h,B)=>h+(B.amount||0),0)),m=X(()=>k.value.toFixed(2)),v=h=>h==null||isNaN(h)?"0.00":Number(h).toFixed(2);return(h,B)=>{const A=Ua("tooltip");return J(),ao("div",null,[H(M(bn),{value:o.items,class:"w-full mt-4 compact-table",responsiveLayout:"scroll",onRowClick:s,rowHover:o.canUpdateDraft,rowClass:p,scrollable:!0,scrollHeight:"400px"},{default:go(()=>[H(M(ee),{field:"item",header:h.$t("item"),headerClass:"text-center",bodyClass:"text-center"},{body:go(b=>{var y;return[Oo(U(((y=b.data.item)==null?void 0:y.label)||b.data.item),1)]}),_:1},8,["header"]),H(M(ee),{field:"qty",header:h.$t("qty"),headerClass:"text-center",bodyClass:"text-center"},null,8,["header"]),H(M(ee),{field:"rate",header:h.$t("rate"),headerClass:"text-center",bodyClass:"text-center"},null,8,["header"]),H(M(ee),{header:h.$t("amount"),headerClass:"text-center",bodyClass:"text-center"},{body:go(b=>[Oo(U(v(b.data.amount)),1)]),_:1},8,["header"]),H(M(ee),{header:h.$t("customer"),headerClass:"text-center",bodyClass:"text-center"},{body:go(b=>{var y;return[Oo(U(((y=b.data.customer)==null?void 0:y.label)||b.data.customer),1)]}),_:1},8,["header"]),u.value?(J(),Fo(M(ee),{key:0,header:h.$t("remark"),headerClass:"text-center",bodyClass:"text-center"},{body:go(b=>[Oo(U(b.data.remark||""),1)]),_:1},8,["header"])):po("",!0),l.value?(J(),Fo(M(ee),{key:1,header:h.$t("actions"),headerClass:"text-center",bodyClass:"text-center",style:{width:"60px"}},{body:go(b=>[Wa(H(M(vo),{icon:"pi pi-trash",class:"p-button-rounded p-button-text p-button-danger p-button-sm",onClick:y=>g(y,b.index),type:"button","aria-label":h.$t("delete")},null,8,["onClick","aria-label"]),[[A,h.$t("delete"),void 0,{top:!0}]])]),_:1},8,["header"])):po("",!0)]),_:1},8,["value","rowHover"]),C("div",kd,[C("div",yd,U(h.$t("total"))+": "+U(m.value),1),C("div",Cd,[o.isDraft&&o.canUpdateDraft?(J(),Fo(M(vo),{key:0,label:h.$t("addItem"),icon:"pi pi-plus",class:"p-button-sm whitespace-nowrap",onClick:B[0]||(B[0]=b=>h.$emit("add-item"))},null,8,["label"])):po("",!0)])])])}}},$d=Lo(wd,[["__scopeId","data-v-4f26113d"]]),_d={class:"mt-6"},xd={__name:"InvoiceButtons",props:{isInvoiceNew:{type:Boolean,required:!0},canSave:{type:Boolean,default:!0},canDelete:{type:Boolean,default:!0},canSubmit:{type:Boolean,default:!0}},emits:["save","delete","submit"],setup(o){return(e,r)=>(J(),ao("div",_d,[!o.isInvoiceNew&&o.canDelete?(J(),Fo(M(vo),{key:0,label:e.$t("deleteInvoice"),icon:"pi pi-trash",severity:"danger",onClick:r[0]||(r[0]=t=>e.$emit("delete")),class:"w-full mt-2"},null,8,["label"])):po("",!0),!o.isInvoiceNew&&o.canSubmit?(J(),Fo(M(vo),{key:1,label:e.$t("submitInvoice"),icon:"pi pi-check",severity:"success",onClick:r[1]||(r[1]=t=>e.$emit("submit")),class:"w-full mt-2"},null,8,["label"])):po("",!0)]))}},Bd=Lo(xd,[["__scopeId","data-v-1e15998f"]]),Rd={key:0,class:"flex justify-between items-center mb-3"},Ed={class:"text-xs font-semibold"},Id={class:"mt-1"},Sd={class:"w-full"},Ld={class:"grid grid-cols-12 gap-1"},Td={class:"col-span-11"},Nd={for:"item"},Dd={class:"col-span-1 flex items-center justify-center"},Od={key:0,class:"text-sm text-red-500 validationErrors"},Ad={class:"grid grid-cols-3 sm:grid-cols-3 gap-x-6 gap-y-4 mb-4"},Pd={for:"qty"},Fd={key:0,class:"text-sm text-red-500 validationErrors"},zd={for:"rate"},Md={key:0,class:"text-sm text-red-500 validationErrors"},Wd={for:"amount"},Ud={class:"w-full"},qd={class:"grid grid-cols-12 gap-1"},Hd={class:"col-span-11"},jd={for:"Customer"},Vd={class:"col-span-1 flex items-center justify-center"},Yd={key:0,class:"text-sm text-red-500 validationErrors"},Xd={key:0,class:"w-full mt-4"},Gd={for:"remark"},Kd={class:"grid grid-cols-3 gap-2 mt-4"},Jd={class:"col-span-1"},Qd={key:0,class:"col-span-1"},Zd={__name:"ItemDialog",props:{visible:{type:Boolean,required:!0},itemData:{type:Object,default:()=>({item:"",qty:"",rate:"",amount:null,customer:"",qtyEditing:!1,rateEditing:!1})},editIndex:{type:Number,default:null},allItems:{type:Array,default:()=>[]},allCustomers:{type:Array,default:()=>[]},validationErrors:{type:Object,default:()=>({})},totalRows:{type:Number,default:0},isDraft:Boolean,canUpdateDraft:Boolean,canUpdateSubmitted:Boolean,canDeleteInvoice:Boolean},emits:["update:visible","save-item","delete-item","clear-customer","update:itemData","navigate-row","clear-item"],setup(o,{emit:e}){const{t:r}=Ko(),t=Gr(),a=Ve(),n=Ne("$permissions"),i=o,c=e,l=Se({item:"",qty:"",rate:"",amount:null,customer:"",qtyEditing:!1,rateEditing:!1,remark:""}),s=lo([]),u=lo([]),g=()=>{i.editIndex>0&&c("navigate-row",i.editIndex-1)},p=()=>{i.editIndex<i.totalRows-1&&c("navigate-row",i.editIndex+1)},k=X(()=>i.isDraft?i.canUpdateDraft:i.canUpdateSubmitted),m=X(()=>i.canDeleteInvoice&&v.value),v=X(()=>i.isDraft&&i.canUpdateDraft),h=X(()=>(n==null?void 0:n.hasPermission("show_item_remark"))||!1);De(()=>{Object.keys(i.itemData).forEach(j=>{j in l&&(l[j]=i.itemData[j])})}),we(()=>i.itemData,j=>{Object.keys(j).forEach(W=>{W in l&&(l[W]=j[W])})},{deep:!0});const B=X({get(){return l.qty===0&&!l.qtyEditing?"":l.qty.toString()},set(j){if(!k.value)return;if(l.qtyEditing=!0,j===""||j==="."||j==="،"||j==="٫"){l.qty=0,b();return}let W=j.replace(/[٠١٢٣٤٥٦٧٨٩]/g,no=>String.fromCharCode(no.charCodeAt(0)-1632+48));W=W.replace(/[،٫]/g,"."),W=W.replace(/[^\d.]/g,"");const P=W.split(".");if(P.length>2&&(W=P[0]+"."+P.slice(1).join("")),W==="")l.qty=0;else{const no=parseFloat(W);isNaN(no)||(l.qty=no)}b()}}),A=X({get(){return l.rate===0&&!l.rateEditing?"":l.rate.toString()},set(j){if(!k.value)return;if(l.rateEditing=!0,j===""||j==="."||j==="،"||j==="٫"){l.rate=0,b();return}let W=j.replace(/[٠١٢٣٤٥٦٧٨٩]/g,no=>String.fromCharCode(no.charCodeAt(0)-1632+48));W=W.replace(/[،٫]/g,"."),W=W.replace(/[^\d.]/g,"");const P=W.split(".");if(P.length>2&&(W=P[0]+"."+P.slice(1).join("")),W==="")l.rate=0;else{const no=parseFloat(W);isNaN(no)||(l.rate=no)}b()}}),b=()=>{const j=(l.qty||0)*(l.rate||0);l.amount=parseFloat(j.toFixed(2))};we(()=>[l.qty,l.rate],()=>{b()},{deep:!0});const y=j=>{if(!k.value)return;const W=j.query.toLowerCase();s.value=i.allItems.filter(P=>P.label.toLowerCase().includes(W))},E=j=>{var P;if(!k.value)return;const W=((P=j.query)==null?void 0:P.toLowerCase())||"";u.value=W?i.allCustomers.filter(no=>no.label.toLowerCase().includes(W)):i.allCustomers.slice(0,5)},x=()=>{k.value&&(l.customer="",c("clear-customer"))},I=()=>{if(!k.value)return;const j={item:l.item,qty:l.qty,rate:l.rate,amount:l.amount,customer:l.customer,qtyEditing:l.qtyEditing,rateEditing:l.rateEditing,remark:l.remark};c("save-item",j)},D=()=>{m.value&&t.require({message:r("confirmDeleteItem"),header:r("confirmDelete"),icon:"pi pi-exclamation-triangle",acceptClass:"p-button-danger",acceptLabel:r("yesDelete"),rejectLabel:r("cancel"),accept:()=>{c("delete-item",i.editIndex)},reject:()=>{a.add({severity:"info",summary:r("cancelled"),life:2e3})}})},N=()=>{k.value&&(l.item="",l.qty="",l.rate="",l.amount=null,l.remark="",l.qtyEditing=!1,l.rateEditing=!1,c("clear-item"))};return(j,W)=>(J(),Fo(M(Kr),{header:M(r)("addItem"),visible:o.visible,"onUpdate:visible":W[6]||(W[6]=P=>j.$emit("update:visible",P)),modal:"",dismissableMask:!0,style:{width:"100%",maxWidth:"400px",position:"fixed",top:"10%",left:"50%",transform:"translateX(-50%)"},breakpoints:{"960px":"95vw","640px":"100vw"}},{default:go(()=>[o.editIndex!==null?(J(),ao("div",Rd,[H(M(vo),{icon:"pi pi-chevron-up",class:"p-button-rounded p-button-outlined p-button-sm",onClick:g,disabled:o.editIndex===0,type:"button"},null,8,["disabled"]),C("span",Ed,U(M(r)("item"))+" "+U(o.editIndex+1)+" / "+U(o.totalRows),1),H(M(vo),{icon:"pi pi-chevron-down",class:"p-button-rounded p-button-outlined p-button-sm",onClick:p,disabled:o.editIndex===o.totalRows-1,type:"button"},null,8,["disabled"])])):po("",!0),C("div",Id,[C("div",Sd,[C("div",Ld,[C("div",Td,[H(M(Xo),{variant:"on",class:"w-full block"},{default:go(()=>[H(M(We),{modelValue:l.item,"onUpdate:modelValue":W[0]||(W[0]=P=>l.item=P),inputId:"item",suggestions:s.value,optionLabel:"label",onComplete:y,forceSelection:!0,completeOnFocus:!0,class:"w-full",disabled:!k.value},null,8,["modelValue","suggestions","disabled"]),C("label",Nd,U(M(r)("itemCode")),1)]),_:1})]),C("div",Dd,[H(M(vo),{icon:"pi pi-trash",class:$e(["p-button-rounded p-button-text",l.item?"p-button-danger":""]),onClick:N,type:"button","aria-label":"Clear item",disabled:!k.value||!l.item},null,8,["class","disabled"])])]),o.validationErrors.item?(J(),ao("span",Od,U(M(r)("itemCodeIsRequired")),1)):po("",!0)]),C("div",Ad,[C("div",null,[H(M(Xo),{variant:"on"},{default:go(()=>[H(M(or),{modelValue:B.value,"onUpdate:modelValue":W[1]||(W[1]=P=>B.value=P),inputId:"qty",class:"w-full",inputmode:"decimal",type:"text",pattern:"[0-9]*[.,]?[0-9]*",disabled:!k.value},null,8,["modelValue","disabled"]),C("label",Pd,U(M(r)("qty")),1)]),_:1}),o.validationErrors.qty?(J(),ao("span",Fd,U(M(r)("qtyIsRequired")),1)):po("",!0)]),C("div",null,[H(M(Xo),{variant:"on"},{default:go(()=>[H(M(or),{modelValue:A.value,"onUpdate:modelValue":W[2]||(W[2]=P=>A.value=P),inputId:"rate",class:"w-full",inputmode:"decimal",type:"text",pattern:"[0-9]*[.,]?[0-9]*",disabled:!k.value},null,8,["modelValue","disabled"]),C("label",zd,U(M(r)("rate")),1)]),_:1}),o.validationErrors.rate?(J(),ao("span",Md,U(M(r)("rateIsRequired")),1)):po("",!0)]),H(M(Xo),{variant:"on",class:"w-full"},{default:go(()=>[H(M(or),{modelValue:l.amount,"onUpdate:modelValue":W[3]||(W[3]=P=>l.amount=P),inputId:"amount",class:"w-full",disabled:!0,mode:"currency",currency:"SAR"},null,8,["modelValue"]),C("label",Wd,U(M(r)("totalAmount")),1)]),_:1})]),C("div",Ud,[C("div",qd,[C("div",Hd,[H(M(Xo),{variant:"on",class:"w-full block"},{default:go(()=>[H(M(We),{modelValue:l.customer,"onUpdate:modelValue":W[4]||(W[4]=P=>l.customer=P),inputId:"Customer",suggestions:u.value,optionLabel:"label",onComplete:E,forceSelection:!0,completeOnFocus:!0,class:"w-full",disabled:!k.value},null,8,["modelValue","suggestions","disabled"]),C("label",jd,U(M(r)("customer")),1)]),_:1})]),C("div",Vd,[H(M(vo),{icon:"pi pi-trash",class:$e(["p-button-rounded p-button-text",l.customer?"p-button-danger":""]),onClick:x,type:"button","aria-label":"Clear customer",disabled:!k.value||!l.customer},null,8,["class","disabled"])])]),o.validationErrors.customer?(J(),ao("span",Yd,U(M(r)("customerIsRequired")),1)):po("",!0)]),h.value?(J(),ao("div",Xd,[H(M(Xo),{variant:"on",class:"w-full block"},{default:go(()=>[H(M(hn),{modelValue:l.remark,"onUpdate:modelValue":W[5]||(W[5]=P=>l.remark=P),inputId:"remark",rows:"2",class:"w-full",disabled:!k.value},null,8,["modelValue","disabled"]),C("label",Gd,U(M(r)("remark")),1)]),_:1})])):po("",!0),C("div",Kd,[C("div",Jd,[k.value?(J(),Fo(M(vo),{key:0,label:o.editIndex!==null?M(r)("update"):M(r)("add"),onClick:I,class:"w-full"},null,8,["label"])):po("",!0)]),W[7]||(W[7]=C("div",{class:"col-span-1"},null,-1)),o.editIndex!==null&&m.value?(J(),ao("div",Qd,[H(M(vo),{label:M(r)("delete"),icon:"pi pi-trash",severity:"danger",onClick:D,class:"w-full"},null,8,["label"])])):po("",!0)])])]),_:1},8,["header","visible"]))}},ou=Lo(Zd,[["__scopeId","data-v-3791093f"]]),eu={class:"error-content"},ru={class:"customer-info"},tu={class:"customer-name"},nu={key:0,class:"company-name"},au={class:"credit-table"},iu={class:"value"},cu={class:"value"},lu={class:"value"},su={class:"value"},du={class:"highlight-row"},uu={class:"value"},fu={class:"value"},gu={class:"warning-row"},mu={class:"value"},pu={class:"error-row"},bu={class:"value"},hu={class:"warning-message"},vu={__name:"CreditLimitDialog",props:{visible:{type:Boolean,required:!0},title:{type:String,default:"Credit Limit Exceeded"},data:{type:Object,default:()=>({})}},emits:["update:visible","close"],setup(o,{emit:e}){const{t:r}=Ko(),t=o,a=e,n=X(()=>t.data.customer||"Unknown Customer"),i=X(()=>t.data.company||""),c=X(()=>t.data.creditLimit||"0.00"),l=X(()=>t.data.currentBalance||"0.00"),s=X(()=>t.data.draftInvoices||"0.00"),u=X(()=>t.data.draftPayments||"0.00"),g=X(()=>t.data.totalBalance||"0.00"),p=X(()=>t.data.invoiceAmount||"0.00"),k=X(()=>t.data.totalExposure||"0.00"),m=X(()=>t.data.excessAmount||"0.00"),v=()=>{a("update:visible",!1),a("close")};return(h,B)=>(J(),Fo(M(Kr),{visible:o.visible,"onUpdate:visible":B[0]||(B[0]=A=>h.$emit("update:visible",A)),style:{width:"90vw",maxWidth:"550px"},modal:!0,closable:!1,header:o.title,draggable:!1,class:"credit-limit-dialog"},{footer:go(()=>[H(M(vo),{label:h.$t("understand")||"I Understand",onClick:v,autofocus:!0,class:"p-button-primary"},null,8,["label"])]),default:go(()=>[C("div",eu,[C("div",ru,[C("div",tu,U(n.value),1),i.value?(J(),ao("div",nu,U(i.value),1)):po("",!0)]),C("table",au,[C("tbody",null,[C("tr",null,[B[1]||(B[1]=C("td",{class:"label"},"Credit Limit:",-1)),C("td",iu,U(c.value),1)]),C("tr",null,[B[2]||(B[2]=C("td",{class:"label"},"Current Balance:",-1)),C("td",cu,U(l.value),1)]),C("tr",null,[B[3]||(B[3]=C("td",{class:"label"},"Draft Invoices:",-1)),C("td",lu,U(s.value),1)]),C("tr",null,[B[4]||(B[4]=C("td",{class:"label"},"Draft Payments:",-1)),C("td",su,U(u.value),1)]),C("tr",du,[B[5]||(B[5]=C("td",{class:"label"},[C("strong",null,"Total Current Balance:")],-1)),C("td",uu,[C("strong",null,U(g.value),1)])]),C("tr",null,[B[6]||(B[6]=C("td",{class:"label"},"Current Invoice Amount:",-1)),C("td",fu,U(p.value),1)]),C("tr",gu,[B[7]||(B[7]=C("td",{class:"label"},[C("strong",null,"Total Exposure:")],-1)),C("td",mu,[C("strong",null,U(k.value),1)])]),C("tr",pu,[B[8]||(B[8]=C("td",{class:"label"},[C("strong",null,"Excess Amount:")],-1)),C("td",bu,[C("strong",null,U(m.value),1)])])])]),C("div",hu,U(h.$t("pleaseAdjustInvoice")||"Please adjust the invoice amounts to be within the customer's credit limit."),1)])]),_:1},8,["visible","header"]))}},ku=Lo(vu,[["__scopeId","data-v-ad995ee5"]]),yu={class:"invoice-form max-w-2xl mx-auto p-4"},Cu={key:0,class:"mt-4"},wu={for:"invoice_remark"},$u={__name:"InvoiceForm",setup(o){const e=lo(!1),r=lo({}),t=Ne("$permissions"),{t:a}=Ko(),n=mn(),i=Ve(),c=Gr(),l=lo(!1),s=lo(null),u=lo(!0),g=lo(!0),p=lo(null),k=lo(!1),m=Se({supplier:"",customer:"",invoice_remark:"",items:[]}),v=Se({item:"",qty:"",qtyEditing:!1,rate:"",rateEditing:!1,amount:null,customer:"",remark:""}),h=lo(!1),B=["item","qty","rate","customer"],A=["supplier"],b=Se({}),y=lo([]),E=lo([]),x=lo([]),I=X(()=>k.value?!1:g.value?t==null?void 0:t.hasPermission("can_update_draft"):t==null?void 0:t.hasPermission("can_update_submitted")),D=X(()=>k.value?!1:g.value&&(t==null?void 0:t.hasPermission("can_delete_invoice"))),N=X(()=>k.value?!1:g.value&&(t==null?void 0:t.hasPermission("can_submit_invoice"))),j=X(()=>!I.value),W=X(()=>(t==null?void 0:t.hasPermission("show_invoice_remark"))||!1);X(()=>(t==null?void 0:t.hasPermission("show_item_remark"))||!1);const P=X(()=>(t==null?void 0:t.hasPermission("repeat_item"))||!1),no=S=>{var F;if(console.log("Navigation requested to row:",S),S<0||S>=m.items.length){console.error("Invalid row index:",S);return}s.value=S;const L=m.items[S];Object.assign(v,{item:(F=L.item)!=null&&F.label?L.item:{label:L.item,code:L.item},qty:L.qty,rate:L.rate,customer:L.customer,amount:L.amount,remark:L.remark||"",qtyEditing:!0,rateEditing:!0}),console.log("Updated dialog data for row:",S,v)},ie=()=>{let S=!0;return B.forEach(L=>{!v[L]||typeof v[L]=="number"&&v[L]<=0?(b[L]=!0,S=!1):b[L]=!1}),S},xo=(S={})=>{var L,F,z;i.add({group:"compact",life:(L=S.life)!=null?L:2e3,closable:(F=S.closable)!=null?F:!1,severity:(z=S.severity)!=null?z:"info",summary:S.summary})},wo=()=>{let S=!0;return A.forEach(L=>{!m[L]||typeof m[L]=="number"&&m[L]<=0?(b[L]=!0,S=!1):b[L]=!1}),S},ce=()=>{h.value=!1},le=()=>{h.value=!1},se=()=>{I.value&&(Io(),m.customer&&(v.customer=m.customer),l.value=!0)},de=S=>{var F;if(!I.value)return;const L=S.data;s.value=S.index,Object.assign(v,{item:(F=L.item)!=null&&F.label?L.item:{label:L.item,code:L.item},qty:L.qty,rate:L.rate,customer:L.customer,remark:L.remark||"",amount:L.amount,qtyEditing:!0,rateEditing:!0}),l.value=!0},Bo=()=>{i.add({severity:"info",summary:a("actionCancelled")||"Action Cancelled",detail:a("pleaseAdjustInvoice")||"Please adjust the invoice amounts",life:5e3})},qo=S=>to(this,null,function*(){var L;if(D.value)if(S!==null&&S>=0&&S<m.items.length){const F=m.items[S];if(m.items.splice(S,1),(L=F.item)!=null&&L.label||F.item,p.value)try{yield Ho({severity:"success",summary:a("itemDeleted"),life:2e3})}catch(z){console.error("Failed to update invoice after deletion:",z),i.add({severity:"error",summary:a("error"),detail:a("failedToUpdateAfterDeletion"),life:3e3})}else xo({severity:"success",summary:a("deleted")});Io(),h.value=!1,l.value=!1}else console.error("Invalid index for deletion:",S),xo({severity:"error",summary:a("failedToDeleteItem")})}),ue=S=>to(this,null,function*(){if(!I.value||(Object.assign(v,S),!ie()))return;const L={item:v.item.code,qty:v.qty,rate:v.rate,amount:v.qty*v.rate,customer:v.customer,remark:v.remark};v.item.label||v.item.code;const F=s.value!==null;let z=[...m.items];F?z[s.value]=L:z.push(L);const d={supplier:m.supplier,customer:m.customer,invoice_remark:m.invoice_remark,items:z,posting_date:new Date().toISOString().split("T")[0],invoice_id:p.value};try{if(u.value&&!p.value){if(!wo()){xo({severity:"error",summary:a("selectSupplierBeforeAddingItems")});return}const f=yield Z.post("/api/method/invoice_form_vue.api.create_invoice",{invoice_data:JSON.stringify(d)});p.value=f.data.message.invoice_name,u.value=!1,m.items=z,xo({severity:"success",summary:"Done تم",life:500}),F||Io({preserveItem:P.value}),l.value=!0}else if(!u.value&&p.value){const f=yield Z.post("/api/method/invoice_form_vue.api.create_invoice",{invoice_data:JSON.stringify(d)});m.items=z,xo({severity:"success",summary:"Done تم",life:2e3}),F||Io({preserveItem:P.value}),l.value=!0}else m.items=z,xo({severity:F?"success":"info",summary:"Done تم",life:2e3}),F||Io({preserveItem:P.value}),l.value=!0;h.value=!1}catch(f){console.error("Failed to save item:",f),oo(f)||xo({severity:"error",summary:F?"Failed to update invoice":"Failed to save invoice"})}}),Io=({preserveItem:S=!1}={})=>{S||(v.item=""),v.qty="",v.qtyEditing=!1,v.rate="",v.rateEditing=!1,v.amount=null,v.remark="",m.customer?v.customer=m.customer:v.customer="",s.value=null},Jo=()=>{m.supplier="",m.customer="",m.invoice_remark="",m.items=[],p.value=null,u.value=!0},Ho=(S=null)=>to(this,null,function*(){if(!(!I.value||!wo()||!(yield xe())))try{const F={supplier:m.supplier,customer:m.customer,invoice_remark:m.invoice_remark,items:m.items,posting_date:new Date().toISOString().split("T")[0],invoice_id:p.value};console.log("📝 Invoice remark being sent:",F.invoice_remark);let z;try{z=yield Z.post("/api/method/invoice_form_vue.api.create_invoice",{invoice_data:JSON.stringify(F)}),console.log("📤 API Response received successfully")}catch(d){if(console.log("⚠️ Axios error in handleSaveInvoice:",d),d.response&&d.response.status===200)if(console.log("✅ Status 200 but parsing failed - assuming success and verifying..."),p.value)try{yield Zo(p.value),h.value=!1,S?i.add(S):i.add({summary:a("invoiceUpdated"),life:2e3});return}catch(f){console.error("❌ Reload verification failed:",f)}else{u.value=!1,h.value=!1,i.add({summary:a("invoiceCreated"),life:2e3});return}throw d}z&&z.data&&z.data.message&&(p.value=z.data.message.invoice_name),u.value=!1,h.value=!1,S?i.add(S):i.add({summary:u.value?a("invoiceCreated"):a("invoiceUpdated"),life:2e3})}catch(F){console.error("❌ Failed to save invoice:",F),oo(F)||i.add({severity:"error",summary:a("error"),detail:F.message||a("unknownError"),life:3e3})}}),xe=()=>to(this,null,function*(){try{if([...new Set(m.items.map(z=>typeof z.customer=="object"?z.customer.code:z.customer).filter(Boolean))].length===0)return!0;const L=m.items.map(z=>({customer:typeof z.customer=="object"?z.customer.code:z.customer,total:z.amount||z.qty*z.rate})),F=yield Z.post("/api/method/agricultural_marketing.agricultural_marketing.doctype.invoice_form.invoice_form.validate_invoice_multiple_customers",{doc_json:JSON.stringify({company:"Your Company",items:L,name:p.value||null})});if(F.data.message&&!F.data.message.valid){const z=F.data.message.violations||[];if(z.length>0){let d=`<div style="font-family: Arial, sans-serif;">
-          <h4 style="color: #d73527; margin-bottom: 15px;">${a("creditLimitWarning")}</h4>`;return z.forEach((f,R)=>{d+=`
-            <div style="margin-bottom: 10px; border: 1px solid #ffcdd2; padding: 10px; background-color: #fff5f5;">
-              <h5 style="color: #d73527; margin: 0 0 10px 0;">${R+1}. ${f.customer_name}</h5>
-              <div><strong>${a("creditLimit")}:</strong> ${To(f.credit_limit)}</div>
-              <div><strong>${a("excessAmount")}:</strong> ${To(f.excess_amount)}</div>
-            </div>
-          `}),d+=`<p>${a("creditLimitExceededQuestion")}</p></div>`,new Promise(f=>{c.require({message:d,header:a("creditLimitExceeded"),icon:"pi pi-exclamation-triangle",acceptClass:"p-button-danger",acceptLabel:a("proceedAnyway"),rejectLabel:a("cancel"),accept:()=>{i.add({severity:"warn",summary:a("proceedingWithWarnings"),life:3e3}),f(!0)},reject:()=>{i.add({severity:"info",summary:a("actionCancelled"),detail:a("pleaseAdjustInvoice"),life:3e3}),f(!1)}})})}}return!0}catch(S){return console.error("Error checking credit limits:",S),!0}}),To=S=>{if(S==null)return"0.00";if(typeof S=="string"){if(/^[\d,]+\.\d{2}$/.test(S)||/^[\d\.]+$/.test(S))return S;const L=parseFloat(S.replace(/,/g,""));if(isNaN(L))return S;S=L}return new Intl.NumberFormat("en-US",{minimumFractionDigits:2,maximumFractionDigits:2}).format(S)},fe=S=>to(this,null,function*(){try{return wo()?(yield Z.post("/api/method/invoice_form_vue.api.create_invoice",{invoice_data:JSON.stringify(S)})).data:void 0}catch(L){throw console.error("API error:",L),L}}),Qo=()=>to(this,null,function*(){if(D.value)try{c.require({message:a("confirmDeleteInvoice"),header:a("confirmDelete"),icon:"pi pi-exclamation-triangle",acceptClass:"p-button-danger",acceptLabel:a("yesDelete"),rejectLabel:a("cancel"),accept:()=>to(this,null,function*(){const S=yield Z.post("/api/method/invoice_form_vue.api.delete_invoice",{invoice_name:p.value});i.add({severity:"success",summary:a("invoiceDeleted"),life:2e3}),Jo(),h.value=!1})})}catch(S){i.add({severity:"error",summary:a("error"),detail:a("deleteInvoiceFailed")})}}),ge=S=>to(this,null,function*(){var L;if(D.value)if(S!==null&&S>=0&&S<m.items.length){const F=m.items[S];m.items.splice(S,1);const z=((L=F.item)==null?void 0:L.label)||F.item;if(p.value)try{yield Ho({severity:"success",summary:a("itemDeleted"),detail:a("itemDeletedFromInvoice",{itemName:z,invoiceName:p.value}),life:2e3})}catch(d){console.error("Failed to update invoice after deletion:",d),i.add({severity:"error",summary:a("error"),detail:a("failedToUpdateAfterDeletion"),life:3e3}),m.items.splice(S,0,F)}else i.add({severity:"success",summary:a("deleted"),detail:a("itemRemoved",{itemName:z}),life:2e3});h.value=!1}else console.error("Invalid index for deletion:",S),i.add({severity:"error",summary:a("error"),detail:a("failedToDeleteItem"),life:2e3})}),me=()=>to(this,null,function*(){if(N.value)try{const S=yield Z.post("/api/method/invoice_form_vue.api.remove_from_invoice",{invoice_name:p.value});i.add({severity:"success",summary:a("invoiceSubmitted"),life:2e3}),Jo(),h.value=!1}catch(S){i.add({severity:"error",summary:a("error"),detail:a("submitInvoiceFailed")})}}),Zo=S=>to(this,null,function*(){try{const F=(yield Z.get("/api/method/invoice_form_vue.api.get_invoice",{params:{invoice_name:S}})).data.message;k.value=F.lock_update===1,m.supplier={label:F.supplier_name,code:F.supplier},m.customer={label:F.customer_name,code:F.customer},m.invoice_remark=F.invoice_remark,m.items=(F.items||[]).map(z=>({item:z.item_code,qty:z.qty,rate:z.price,amount:z.total,remark:z.remark||"",customer:{label:z.customer_name||z.customer,code:z.customer}})),p.value=F.name,u.value=!1,g.value=F.is_draft===1}catch(L){console.error("Failed to load invoice:",L),i.add({severity:"error",summary:"Error",detail:"Failed to load invoice data."})}});function T(){let S=document.getElementById("autocomplete-dropdown-fix");S||(S=document.createElement("style"),S.id="autocomplete-dropdown-fix",document.head.appendChild(S),S.innerHTML=`
-      /* Override the min-width that's causing the issue */
-      .p-autocomplete-overlay {
-        max-width: 100vw !important;
-      }
-      
-      /* Make sure dropdown items wrap text */
-      .p-autocomplete-option {
-        white-space: normal !important;
-        word-break: break-word !important;
-        line-height: 1.4 !important;
-      }
-      
-      /* For smaller screens, make even tighter */
-      @media screen and (max-width: 640px) {
-        .p-autocomplete-overlay {
-          max-width: 90vw !important;
-          width: auto !important;
-        }
-      }
-    `)}we(()=>[m.supplier,m.customer,m.items],()=>{h.value=!1},{deep:!0}),qa((S,L,F)=>{h.value?window.confirm("You have unsaved changes. Do you really want to leave?")?F():F(!1):F()});const oo=(S,L,F)=>{var R,q,co;if(!((R=S.response)!=null&&R.data))return!1;const z=S.response.data;let d="";if(z._server_messages)try{d=JSON.parse(z._server_messages)[0]||""}catch(V){d=z._server_messages}else z.message?d=z.message:z._error_message&&(d=z._error_message);if(console.log("Credit limit error raw message:",d),typeof d=="string"&&(d.includes("Credit Limit Exceeded")||d.includes("Multiple Credit Limits Exceeded")||d.includes("credit limit")||d.includes("Excess Amount")||d.includes("Total Exposure")))try{const V=typeof m.customer=="object"?m.customer.label:m.customer,$=m.items.reduce((Cr,Be)=>Cr+(Be.amount||Be.qty*Be.rate),0),_=Cr=>{const Be=d.match(Cr);return Be?Be[1].trim():null},eo=_(/Credit Limit:<\/strong><\/td>\s*<td[^>]*>([^<]+)<\/td>/)||_(/Credit Limit:.*?(\d[\d,\.]+)/)||"0.00",fo=_(/Current Balance[^:]*:<\/strong><\/td>\s*<td[^>]*>([^<]+)<\/td>/)||_(/Current Balance[^:]*:.*?(\d[\d,\.]+)/)||"0.00",No=_(/Draft Invoices:<\/strong><\/td>\s*<td[^>]*>([^<]+)<\/td>/)||_(/Draft Invoices:.*?(\d[\d,\.]+)/)||"0.00",pe=_(/Draft Payments\/Receipts:<\/strong><\/td>\s*<td[^>]*>([^<]+)<\/td>/)||_(/Draft Payments\/Receipts:.*?(\d[\d,\.]+)/)||"0.00",jo=_(/Total Current Balance:<\/strong><\/td>\s*<td[^>]*><strong>([^<]+)<\/strong><\/td>/)||_(/Total Current Balance:.*?<strong>([^<]+)<\/strong>/)||_(/Total Current Balance:.*?(\d[\d,\.]+)/)||"0.00",Ke=_(/Total Exposure:<\/strong><\/td>\s*<td[^>]*><strong>([^<]+)<\/strong><\/td>/)||_(/Total Exposure:.*?<strong>([^<]+)<\/strong>/)||_(/Total Exposure:.*?(\d[\d,\.]+)/)||"0.00",yr=_(/Excess Amount:<\/strong><\/td>\s*<td[^>]*><strong>([^<]+)<\/strong><\/td>/)||_(/Excess Amount:.*?<strong>([^<]+)<\/strong>/)||_(/Excess Amount:.*?(\d[\d,\.]+)/)||"0.00";return console.log("Extracted credit limit data:",{customer:V,creditLimit:eo,currentBalance:fo,draftInvoices:No,draftPayments:pe,totalBalance:jo,invoiceAmount:To($),totalExposure:Ke,excessAmount:yr}),r.value={customer:V||"Unknown Customer",company:((q=m.supplier)==null?void 0:q.label)||"",creditLimit:eo,currentBalance:fo,draftInvoices:No,draftPayments:pe,totalBalance:jo,invoiceAmount:To($),totalExposure:Ke,excessAmount:yr},e.value=!0,!0}catch(V){console.error("Error parsing credit limit message:",V);const $=m.items.reduce((_,eo)=>_+(eo.amount||eo.qty*eo.rate),0);return r.value={customer:typeof m.customer=="object"?m.customer.label:m.customer,company:((co=m.supplier)==null?void 0:co.label)||"",creditLimit:"Unknown",currentBalance:"Unknown",draftInvoices:"0.00",draftPayments:"0.00",totalBalance:"Unknown",invoiceAmount:To($),totalExposure:"Unknown",excessAmount:"Unknown"},e.value=!0,!0}return!1};return De(()=>to(this,null,function*(){try{T();const S=yield Z.get("/api/method/invoice_form_vue.api.get_suppliers_and_customers"),L=S.data.message||S.data,F=z=>(z||[]).map(d=>({label:d.customer_name||d.supplier_name||d.name||d.item_name,code:d.name||""}));y.value=F(L.suppliers),E.value=F(L.customers),x.value=F(L.items),n.query.invoice_name&&(yield Zo(n.query.invoice_name))}catch(S){console.error("Error loading supplier/customer data:",S)}})),(S,L)=>{const F=Ro("Textarea"),z=Ro("FloatLabel");return J(),ao("div",yu,[H(M(vn),{group:"compact",position:"top-center",class:"compact-toast"}),C("form",{onSubmit:pn(fe,["prevent"])},[H(vd,{supplier:m.supplier,"onUpdate:supplier":L[0]||(L[0]=d=>m.supplier=d),customer:m.customer,"onUpdate:customer":L[1]||(L[1]=d=>m.customer=d),"invoice-name":p.value,"all-suppliers":y.value,"all-customers":E.value,"validation-errors":b,onClearSupplier:ce,onClearCustomer:le,disabled:j.value},null,8,["supplier","customer","invoice-name","all-suppliers","all-customers","validation-errors","disabled"]),W.value?(J(),ao("div",Cu,[H(z,{variant:"on",class:"w-full"},{default:go(()=>[H(F,{modelValue:m.invoice_remark,"onUpdate:modelValue":L[2]||(L[2]=d=>m.invoice_remark=d),inputId:"invoice_remark",rows:"3",class:"w-full",disabled:j.value},null,8,["modelValue","disabled"]),C("label",wu,U(S.$t("invoiceRemark")||"Invoice Remark"),1)]),_:1})])):po("",!0),H($d,{items:m.items,"is-draft":g.value,"can-update-draft":I.value,"can-delete-invoice":D.value,onRowClick:de,onAddItem:se,onDeleteItem:ge},null,8,["items","is-draft","can-update-draft","can-delete-invoice"]),H(Bd,{"is-invoice-new":!p.value,onSave:Ho,onDelete:Qo,onSubmit:me,"can-save":I.value,"can-delete":D.value,"can-submit":N.value},null,8,["is-invoice-new","can-save","can-delete","can-submit"])],32),H(ou,{visible:l.value,"onUpdate:visible":L[3]||(L[3]=d=>l.value=d),itemData:v,"edit-index":s.value,"all-items":x.value,"all-customers":E.value,"validation-errors":b,totalRows:m.items.length,onSaveItem:ue,onDeleteItem:qo,onClearCustomer:L[4]||(L[4]=d=>h.value=!1),onNavigateRow:no,onClearItem:L[5]||(L[5]=d=>h.value=!1),"is-draft":g.value,"can-update-draft":I.value,"can-update-submitted":I.value,"can-delete-invoice":D.value},null,8,["visible","itemData","edit-index","all-items","all-customers","validation-errors","totalRows","is-draft","can-update-draft","can-update-submitted","can-delete-invoice"]),H(ku,{visible:e.value,"onUpdate:visible":L[6]||(L[6]=d=>e.value=d),data:r.value,onClose:Bo},null,8,["visible","data"])])}}},_u=Lo($u,[["__scopeId","data-v-d6a62c9f"]]),xu={class:"max-w-5xl mx-auto p-4 drafts-form"},Bu={class:"card"},Ru={key:0,class:"text-center p-4"},Eu={class:"mt-2"},Iu={key:1,class:"text-center text-gray-500 mt-10"},Su={class:"font-semibold"},Lu={class:"mt-2"},Tu={class:"flex flex-col"},Nu={class:"space-y-1 text-sm sm:text-base"},Du={class:"flex-1 text-sm sm:text-base"},Ou={class:"font-bold text-gray-800 mb-1 text-base sm:text-lg invoice-name"},Au={class:"text-gray-500 mb-0.5"},Pu={class:"text-gray-500 mb-0.5"},Fu={class:"text-gray-400"},zu={class:"flex justify-end items-center"},Mu={class:"sm:text-right w-full sm:w-auto"},Wu={key:3,class:"text-center text-gray-500 mt-10"},Uu={__name:"Drafts",setup(o){const e=lo([]),r=lo(!0),t=Xr(),a=Ne("$permissions"),n=X(()=>(a==null?void 0:a.hasPermission("can_show_drafts"))||!1),i=l=>{t.push(`/invoice?invoice_name=${l.name}`)},c=()=>to(this,null,function*(){var l;r.value=!0;try{if(n.value){const s=yield Z.get("/api/method/invoice_form_vue.api.get_draft_invoice_form");e.value=((l=s.data.message)==null?void 0:l.invoices)||[]}}catch(s){console.error("Error fetching drafts:",s)}finally{r.value=!1}});return De(()=>to(this,null,function*(){yield new Promise(l=>setTimeout(l,100)),c()})),(l,s)=>(J(),ao("div",xu,[C("div",Bu,[r.value?(J(),ao("div",Ru,[s[0]||(s[0]=C("i",{class:"pi pi-spin pi-spinner text-2xl"},null,-1)),C("div",Eu,U(l.$t("loading")||"Loading..."),1)])):n.value?n.value&&e.value.length>0?(J(),Fo(M(kn),{key:2,value:e.value,layout:"list",paginator:!0,rows:5},{list:go(u=>[C("div",Tu,[(J(!0),ao(Yr,null,Ha(u.items,(g,p)=>{var k;return J(),ao("div",{key:g.name,class:"mb-4"},[C("div",{class:$e(["grid grid-cols-[80%_20%] items-center rounded-lg shadow-sm p-4 bg-white mb-4",{"border-t border-surface-200 dark:border-surface-700":p!==0}])},[C("div",Nu,[C("div",Du,[C("div",Ou,[s[2]||(s[2]=C("i",{class:"pi pi-file text-blue-500 mr-1"},null,-1)),Oo(" "+U(g.name),1)]),C("div",Au,[s[3]||(s[3]=C("i",{class:"pi pi-calendar mr-1"},null,-1)),s[4]||(s[4]=Oo()),C("b",null,U(l.$t("date"))+" :",1),Oo(" "+U(g.posting_date||"N/A"),1)]),C("div",Pu,[s[5]||(s[5]=C("i",{class:"pi pi-truck mr-1"},null,-1)),s[6]||(s[6]=Oo()),C("b",null,U(l.$t("supplier"))+" :",1),Oo(" "+U(g.supplier_name||"N/A"),1)]),C("div",Fu,[s[7]||(s[7]=C("i",{class:"pi pi-list mr-1"},null,-1)),s[8]||(s[8]=Oo()),C("b",null,U(l.$t("itemsDraft"))+" :",1),Oo(" "+U(((k=g.items)==null?void 0:k.length)||0),1)])])]),C("div",zu,[C("div",Mu,[H(M(vo),{icon:"pi pi-eye",label:l.$t("view"),class:"flex-auto md:flex-initial whitespace-nowrap",onClick:m=>i(g)},null,8,["label","onClick"])])])],2)])}),128))])]),_:1},8,["value"])):n.value&&!r.value?(J(),ao("div",Wu,U(l.$t("noDraftInvoicesAvailable")),1)):po("",!0):(J(),ao("div",Iu,[s[1]||(s[1]=C("i",{class:"pi pi-lock text-3xl text-gray-400 mb-3"},null,-1)),C("div",Su,U(l.$t("accessRestricted")||"Access Restricted"),1),C("p",Lu,U(l.$t("noPermissionToViewDrafts")||"You do not have permission to view draft invoices."),1)]))])]))}},qu=Lo(Uu,[["__scopeId","data-v-06eb2080"]]),Hu={class:"max-w-2xl mx-auto px-4 py-6 space-y-6 settings-form"},ju={class:"settings-card"},Vu={class:"grid grid-cols-[auto_1fr] gap-x-8 items-center mb-2"},Yu={class:"shrink-0"},Xu=["src"],Gu={key:1,class:"avatar-placeholder"},Ku={class:"flex flex-col"},Ju={class:"text-gray-800 font-semibold text-base leading-snug"},Qu={class:"text-gray-500 text-sm leading-tight"},Zu={class:"settings-card"},of={class:"card-header"},ef={class:"card-body flex gap-3 flex-wrap"},rf={class:"settings-card"},tf={class:"card-header"},nf={class:"card-body"},af={class:"flex flex-wrap items-center justify-center gap-10"},cf={__name:"Settings",setup(o){const{locale:e}=Ko(),r=lo({}),t=lo("en"),a=Ve();Xr();const n=()=>to(this,null,function*(){try{const g=(yield Z.get("/api/method/frappe.auth.get_logged_user")).data.message,p=yield Z.get(`/api/resource/User/${g}`);r.value=p.data.data;const k=r.value.language||"en";t.value=k,e.value=k,document.dir=k==="ar"?"rtl":"ltr"}catch(u){a.add({severity:"error",summary:"Error",detail:"Failed to load user info"})}}),i=u=>to(this,null,function*(){try{t.value=u,localStorage.setItem("preferredLang",u),yield Z.post("/api/method/invoice_form_vue.api.set_user_language",{language:u}),a.add({severity:"success",summary:"Language Changed",detail:u.toUpperCase()}),location.reload()}catch(g){a.add({severity:"error",summary:"Error",detail:"Failed to change language"})}}),c=()=>to(this,null,function*(){try{yield Z.post("/api/method/logout"),a.add({severity:"success",summary:"Logged Out"}),setTimeout(()=>{location.replace("/invoice_form")},1e3)}catch(u){a.add({severity:"error",summary:"Error",detail:`$${u} : Logout failed`})}}),l=()=>to(this,null,function*(){try{setTimeout(()=>{location.replace("/app")},1e3)}catch(u){a.add({severity:"error",summary:"Error",detail:"Logout failed"})}}),s=X(()=>{var u;return(u=r.value)!=null&&u.full_name?r.value.full_name.split(" ").map(g=>g[0]).join("").toUpperCase().slice(0,2):"?"});return De(n),(u,g)=>{var k,m,v;const p=Ro("Button");return J(),ao("div",Hu,[C("div",ju,[C("div",Vu,[C("div",Yu,[(k=r.value)!=null&&k.user_image?(J(),ao("img",{key:0,src:r.value.user_image,alt:"Avatar",class:"w-14 h-14 rounded-full object-cover border border-gray-300"},null,8,Xu)):(J(),ao("div",Gu,U(s.value),1))]),C("div",Ku,[C("div",Ju,U(((m=r.value)==null?void 0:m.full_name)||"Unnamed User"),1),C("div",Qu,U(((v=r.value)==null?void 0:v.email)||"No email"),1)])])]),C("div",Zu,[C("div",of,[g[2]||(g[2]=C("i",{class:"pi pi-globe icon text-green-600"},null,-1)),C("span",null,U(u.$t("language")),1)]),C("div",ef,[H(p,{label:"English",icon:"pi pi-flag",class:$e({"p-button-outlined":t.value!=="en"}),onClick:g[0]||(g[0]=h=>i("en"))},null,8,["class"]),H(p,{label:"العربية",icon:"pi pi-globe",class:$e({"p-button-outlined":t.value!=="ar"}),onClick:g[1]||(g[1]=h=>i("ar"))},null,8,["class"])])]),C("div",rf,[C("div",tf,[g[3]||(g[3]=C("i",{class:"pi pi-sign-out icon text-red-500"},null,-1)),C("span",null,U(u.$t("logoutMain")),1)]),C("div",nf,[C("div",af,[H(p,{label:u.$t("moveToErp"),icon:"pi pi-th-large",severity:"info",class:"w-full my-50px",onClick:l},null,8,["label"]),g[4]||(g[4]=C("div",{class:"h-3"},null,-1)),H(p,{label:u.$t("logout"),icon:"pi pi-power-off",severity:"danger",class:"w-full my-50px",onClick:c},null,8,["label"])])])])])}}},lf=Lo(cf,[["__scopeId","data-v-3fd33b26"]]),sf={components:{LogoComponent:oa},data(){return{email:null,password:null,errorMessage:null,isLoggingIn:!1}},inject:["$auth","$permissions"],setup(){return{toast:Ve()}},mounted(){var o,e;this.adjustHeight(),window.addEventListener("resize",this.adjustHeight),(e=(o=this.$route)==null?void 0:o.query)!=null&&e.route&&(this.redirect_route=this.$route.query.route,this.$router.replace({query:null}))},beforeUnmount(){window.removeEventListener("resize",this.adjustHeight)},methods:{adjustHeight(){const o=window.innerHeight*.01;document.documentElement.style.setProperty("--vh",`${o}px`)},login(){return to(this,null,function*(){if(this.errorMessage=null,this.isLoggingIn=!0,!this.email||!this.password){this.errorMessage=this.$t("enterBothCredentials"),this.isLoggingIn=!1;return}try{if(yield this.$auth.login(this.email,this.password)){if(yield this.$permissions.loadPermissions(this.email),!this.$permissions.hasPermission("can_login")){this.errorMessage=this.$t("noLoginPermission"),this.toast.add({severity:"error",summary:this.$t("accessDenied"),detail:this.$t("noLoginPermission"),life:3e3}),yield this.$auth.logout(),setTimeout(()=>{window.location.href="/invoice_form/login"},500);return}this.toast.add({severity:"success",summary:this.$t("loginSuccessful"),detail:this.$t("welcomeBack"),life:3e3}),setTimeout(()=>{this.$router.push({name:"Home"})},300)}else this.errorMessage=this.$t("invalidCredentials")}catch(o){console.error("Login error:",o),o.exc_type==="AuthenticationError"?this.errorMessage=this.$t("invalidCredentials"):(this.errorMessage=this.$t("loginError"),this.toast.add({severity:"error",summary:this.$t("loginError"),detail:this.$t("tryAgainLater"),life:3e3}))}finally{this.isLoggingIn=!1}})}}},df={class:"login-container"},uf={class:"logo-container"},ff={class:"form-container"},gf={class:"text-xl font-bold text-gray-900 mb-4 text-center"},mf={class:"input-group"},pf={for:"email"},bf={class:"input-group"},hf={for:"password"},vf={key:0,class:"error-message"},kf={class:"footer"},yf={class:"text-sm text-gray-500"};function Cf(o,e,r,t,a,n){const i=Ro("LogoComponent"),c=Ro("InputText"),l=Ro("FloatLabel"),s=Ro("Button"),u=Ro("Toast");return J(),ao("div",df,[C("div",uf,[H(i,{class:"logo-animation"})]),C("div",ff,[C("h1",gf,U(o.$t("signin")),1),C("form",{onSubmit:e[2]||(e[2]=pn((...g)=>n.login&&n.login(...g),["prevent"])),class:"space-y-4"},[C("div",mf,[H(l,null,{default:go(()=>[H(c,{modelValue:a.email,"onUpdate:modelValue":e[0]||(e[0]=g=>a.email=g),id:"email",class:"w-full",placeholder:o.$t("username")},null,8,["modelValue","placeholder"]),C("label",pf,U(o.$t("username")),1)]),_:1})]),C("div",bf,[H(l,null,{default:go(()=>[H(c,{modelValue:a.password,"onUpdate:modelValue":e[1]||(e[1]=g=>a.password=g),id:"password",type:"password",class:"w-full",placeholder:o.$t("password")},null,8,["modelValue","placeholder"]),C("label",hf,U(o.$t("password")),1)]),_:1})]),a.errorMessage?(J(),ao("div",vf,U(a.errorMessage),1)):po("",!0),H(s,{type:"submit",label:a.isLoggingIn?o.$t("signingIn"):o.$t("signin"),icon:"pi pi-sign-in",class:"w-full p-button-md",loading:a.isLoggingIn},null,8,["label","loading"])],32)]),C("div",kf,[C("p",yf,"© "+U(new Date().getFullYear())+" Invoice Form",1)]),H(u,{position:"bottom-right"})])}const xa=Lo(sf,[["render",Cf],["__scopeId","data-v-372df6b1"]]),wf=Object.freeze(Object.defineProperty({__proto__:null,default:xa},Symbol.toStringTag,{value:"Module"})),$f="modulepreload",_f=function(o){return"/assets/invoice_form_vue/frontend/"+o},tn={},xf=function(e,r,t){let a=Promise.resolve();if(r&&r.length>0){document.getElementsByTagName("link");const i=document.querySelector("meta[property=csp-nonce]"),c=(i==null?void 0:i.nonce)||(i==null?void 0:i.getAttribute("nonce"));a=Promise.allSettled(r.map(l=>{if(l=_f(l),l in tn)return;tn[l]=!0;const s=l.endsWith(".css"),u=s?'[rel="stylesheet"]':"";if(document.querySelector(`link[href="${l}"]${u}`))return;const g=document.createElement("link");if(g.rel=s?"stylesheet":$f,s||(g.as="script"),g.crossOrigin="",g.href=l,c&&g.setAttribute("nonce",c),document.head.appendChild(g),s)return new Promise((p,k)=>{g.addEventListener("load",p),g.addEventListener("error",()=>k(new Error(`Unable to preload CSS for ${l}`)))})}))}function n(i){const c=new Event("vite:preloadError",{cancelable:!0});if(c.payload=i,window.dispatchEvent(c),!c.defaultPrevented)throw i}return a.then(i=>{for(const c of i||[])c.status==="rejected"&&n(c.reason);return e().catch(n)})},Bf=[{path:"/login",name:"Login",component:()=>xf(()=>Promise.resolve().then(()=>wf),void 0),meta:{isLoginPage:!0},props:!0}],Rf=[{path:"/",redirect:"/home"},{path:"/home",name:"Home",component:Rl},{path:"/invoice",name:"InvoiceForm",component:_u},{path:"/drafts",name:"Drafts",component:qu},{path:"/settings",name:"Settings",component:lf},{path:"/login",name:"Login",component:xa,meta:{isLoginPage:!0}},...Bf],sr=ja({history:Va("/invoice_form"),routes:Rf}),Ef="Logout",If="Items",Sf="Logout",Lf="Language",Tf="Starts with",Nf="Contains",Df="Not contains",Of="Ends with",Af="Equals",Pf="Not equals",Ff="No Filter",zf="Less than",Mf="Less than or equal to",Wf="Greater than",Uf="Greater than or equal to",qf="Date is",Hf="Date is not",jf="Date is before",Vf="Date is after",Yf="Clear",Xf="Apply",Gf="Match All",Kf="Match Any",Jf="Add Rule",Qf="Remove Rule",Zf="Yes",o0="No",e0="Choose",r0="Upload",t0="Cancel",n0="Remark",a0="Invoice Remark",i0=["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],c0=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],l0=["Su","Mo","Tu","We","Th","Fr","Sa"],s0=["January","February","March","April","May","June","July","August","September","October","November","December"],d0=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],u0="Today",f0="Wk",g0=0,m0="mm/dd/yy",p0="Weak",b0="Medium",h0="Strong",v0="Enter a password",k0="No results found",y0="No available options",C0="Invoice Name",w0="Supplier",$0="Customer",_0="Qty",x0="Item",B0="Items",R0="Rate",E0="Amount",I0="Item Code",S0="Add Item",L0="Save Invoice",T0="Update",N0="Add",D0="Delete Invoice",O0="Submit Invoice",A0="Move to ERPNext",P0="Item Code is required",F0="Qty is required",z0="Rate is required",M0="Customer Is Required",W0="Supplier Is Required",U0="Total Amount",q0="No Draft Invoices Available",H0="Dashboard",j0="Welcome to your invoice management system",V0="Draft Invoices",Y0="Pending Invoices",X0="View Drafts",G0="Submitted Invoices",K0="Completed Invoices",J0="View Submitted",Q0="Quick Actions",Z0="Create New Invoice",og="View Draft Invoices",eg="Recent Activity",rg="Invoice ID",tg="Status",ng="Actions",ag="No Recent Activity Found",ig="View",cg="Date",lg={home:"Home",new_invoice:"New",drafts:"Drafts",settings:"Settings"},sg="Invoice Created",dg="Invoice Updated",ug="The invoice has been created successfully.",fg="The invoice has been updated successfully.",gg="Item Deleted",mg='Item "{itemName}" removed from invoice {invoiceName}',pg="Deleted",bg='Item "{itemName}" removed',hg="Error",vg="Failed to update database after deletion",kg="Failed to delete item",yg="Item Updated",Cg="Item Added",wg='Item "{itemName}" updated{invoiceName ? " in invoice " + invoiceName : ""}',$g='Item "{itemName}" added to invoice {invoiceName}',_g='Item "{itemName}" added',xg="Please select a supplier before adding items",Bg='Invoice created with item "{itemName}"',Rg="Failed to save the invoice. Please try again.",Eg="Failed to update the invoice. Please try again.",Ig="Are you sure you want to delete this item?",Sg="Confirm Delete",Lg="Yes, Delete",Tg="Cancelled",Ng="Delete cancelled",Dg="Invoice Submitted",Og="The invoice has been submitted.",Ag="Failed to submit invoice.",Pg="Sign In",Fg="Signing In...",zg="Username",Mg="Password",Wg="Please enter both username and password.",Ug="Login Successful",qg="Welcome back!",Hg="Login Failed",jg="Please check your credentials.",Vg="Authentication Failed",Yg="Unknown error",Xg="Invalid username or password",Gg="Unable to login at this time",Kg="Please try again later",Jg="Total Amount",Qg="Loading...",Zg="Access Restricted",om="You do not have permission to view draft invoices.",em="Credit Limit Exceeded",rm="I Understand",tm="Action Cancelled",nm="Please adjust the invoice amounts",am="Credit Limit Details",im="The following customers will exceed their credit limits",cm="Current Balance",lm="Available Credit",sm="Excess Amount",dm="Credit Limit",um={logout:Ef,itemsDraft:If,logoutMain:Sf,language:Lf,startsWith:Tf,contains:Nf,notContains:Df,endsWith:Of,equals:Af,notEquals:Pf,noFilter:Ff,lt:zf,lte:Mf,gt:Wf,gte:Uf,dateIs:qf,dateIsNot:Hf,dateBefore:jf,dateAfter:Vf,clear:Yf,apply:Xf,matchAll:Gf,matchAny:Kf,addRule:Jf,removeRule:Qf,accept:Zf,reject:o0,choose:e0,upload:r0,cancel:t0,remark:n0,invoiceRemark:a0,dayNames:i0,dayNamesShort:c0,dayNamesMin:l0,monthNames:s0,monthNamesShort:d0,today:u0,weekHeader:f0,firstDayOfWeek:g0,dateFormat:m0,weak:p0,medium:b0,strong:h0,passwordPrompt:v0,emptyFilterMessage:k0,emptyMessage:y0,invoiceName:C0,supplier:w0,customer:$0,qty:_0,item:x0,items:B0,rate:R0,amount:E0,itemCode:I0,addItem:S0,saveInvoice:L0,update:T0,add:N0,delete:"Delete",deleteInvoice:D0,submitInvoice:O0,moveToErp:A0,itemCodeIsRequired:P0,qtyIsRequired:F0,rateIsRequired:z0,customerIsRequired:M0,supplierIsRequired:W0,totalAmount:U0,noDraftInvoicesAvailable:q0,dashboard:H0,dashboardWellcom:j0,draftInvoices:V0,pendingInvoices:Y0,viewDrafts:X0,submittedInvoices:G0,completedInvoices:K0,viewSubmitted:J0,quickActions:Q0,createNewInvoice:Z0,viewDraftInvoices:og,recentActivity:eg,invoiceID:rg,status:tg,actions:ng,noRecentActivityFound:ag,view:ig,date:cg,menu:lg,invoiceCreated:sg,invoiceUpdated:dg,invoiceCreatedSuccessfully:ug,invoiceUpdatedSuccessfully:fg,itemDeleted:gg,itemDeletedFromInvoice:mg,deleted:pg,itemRemoved:bg,error:hg,failedToUpdateAfterDeletion:vg,failedToDeleteItem:kg,itemUpdated:yg,itemAdded:Cg,itemUpdateSuccess:wg,itemAddSuccess:$g,itemAddSuccessNoInvoice:_g,selectSupplierBeforeAddingItems:xg,invoiceCreatedWithItem:Bg,failedToSaveInvoice:Rg,failedToUpdateInvoice:Eg,confirmDeleteItem:Ig,confirmDelete:Sg,yesDelete:Lg,cancelled:Tg,deleteCancelled:Ng,invoiceSubmitted:Dg,invoiceSubmittedDetail:Og,submitInvoiceFailed:Ag,signin:Pg,signingIn:Fg,username:zg,password:Mg,enterBothCredentials:Wg,loginSuccessful:Ug,welcomeBack:qg,loginFailed:Hg,checkCredentials:jg,authenticationFailed:Vg,unknownError:Yg,invalidCredentials:Xg,loginError:Gg,tryAgainLater:Kg,total:Jg,loading:Qg,accessRestricted:Zg,noPermissionToViewDrafts:om,creditLimitExceeded:em,understand:rm,actionCancelled:tm,pleaseAdjustInvoice:nm,creditLimitDetails:am,creditLimitWarning:im,currentBalance:cm,availableCredit:lm,excessAmount:sm,creditLimit:dm},fm="خروج",gm="قائمة الخروج",mm="البنود",pm="اللغة",bm="يبدأ بـ",hm="يحتوي على",vm="لا يحتوي على",km="ينتهي بـ",ym="يساوي",Cm="لا يساوي",wm="بدون فلتر",$m="أقل من",_m="أقل من أو يساوي",xm="ملاحظة",Bm="ملاحظة الفاتورة",Rm="أكبر من",Em="أكبر من أو يساوي",Im="التاريخ هو",Sm="التاريخ ليس",Lm="التاريخ قبل",Tm="التاريخ بعد",Nm="مسح",Dm="تطبيق",Om="مطابقة الكل",Am="مطابقة أي",Pm="إضافة قاعدة",Fm="إزالة قاعدة",zm="نعم",Mm="لا",Wm="اختر",Um="رفع",qm="إلغاء",Hm=["الأحد","الإثنين","الثلاثاء","الأربعاء","الخميس","الجمعة","السبت"],jm=["أحد","إثن","ثلا","أرب","خمي","جمع","سبت"],Vm=["أح","إث","ثل","أر","خم","جم","سب"],Ym=["يناير","فبراير","مارس","أبريل","مايو","يونيو","يوليو","أغسطس","سبتمبر","أكتوبر","نوفمبر","ديسمبر"],Xm=["ينا","فبر","مار","أبر","ماي","يون","يول","أغس","سبت","أكت","نوف","ديس"],Gm="اليوم",Km="أسبوع",Jm=6,Qm="dd/mm/yy",Zm="ضعيف",op="متوسط",ep="قوي",rp="أدخل كلمة المرور",tp="لا توجد نتائج",np="لا توجد خيارات متاحة",ap="رقم الفاتورة",ip="المورد",cp="العميل",lp="الكمية",sp="الصنف",dp="السعر",up="القيمة",fp="كود الصنف",gp="إضافة صنف",mp="أضف",pp="حفظ الفاتورة",bp="تحديث الفاتورة",hp="حذف الفاتورة",vp="تقديم الفاتورة",kp="الانتقال إلى النظام الرئيسى",yp="كود الصنف مطلوب",Cp="الكمية مطلوبة",wp="السعر مطلوب",$p="العميل مطلوب",_p="المورد مطلوب",xp="الإجمالي",Bp="لا يوجد فواتير مسودة",Rp="عرض",Ep="التاريخ",Ip="الأصناف",Sp="مسودات",Lp="الواجهة الرئيسية",Tp="مرحبًا بك في واجهة الإدخال المخصصة للأجهزة المحمولة",Np="فواتير مسودة",Dp="فواتير معلقة",Op="عرض المسودات",Ap="فواتير مقدمة",Pp="فواتير مكتملة",Fp="عرض الفواتير المقدمة",zp="إجراءات سريعة",Mp="إنشاء فاتورة جديدة",Wp="عرض الفواتير المسودة",Up="آخر النشاطات",qp="معرف الفاتورة",Hp="الحالة",jp="إجراء",Vp="لا يوجد",Yp={home:"الرئيسية",new_invoice:"جديد",drafts:"مسودات",settings:"الإعدادات"},Xp="انشاء الفاتورة",Gp="تحديث الفاتورة",Kp="تم انشاء الفاتورة بنجاح.",Jp="تم تحديث الفاتورة بنجاح.",Qp="حذف الصنف",Zp='تم حذف الصنف"{itemName}"  من الفاتورة {invoiceName}',ob="حذف",eb='تم حذف الصنف "{itemName}"',rb="خطأ",tb="فشل في تحديث قاعدة البيانات بعد الحذف",nb="فشل في حذف الصنف",ab="تم تحديث الصنف",ib="تم إضافة الصنف",cb='تم تحديث الصنف "{itemName}" في الفاتورة "{invoiceName}"',lb='تم تحديث الصنف "{itemName}"',sb='تم إضافة الصنف "{itemName}" في الفاتورة "{invoiceName}"',db='تم إضافة الصنف "{itemName}"',ub="من فضلك اختر المورد قبل إضافة الأصناف",fb='تم انشاء الفاتورة مع الصنف "{itemName}"',gb="فشل في حفظ الفاتورة. الرجاء المحاولة مرة أخرى.",mb="فشل في تحديث الفاتورة. الرجاء المحاولة مرة أخرى.",pb="هل أنت متأكد من أنك تريد حذف هذا الصنف؟",bb="أكد الحذف",hb="نعم، احذف",vb="الإلغاء",kb="تم إلغاء الحذف",yb="هل أنت متأكد أنك تريد حذف هذه الفاتورة؟",Cb="تم حذف الفاتورة",wb="تم حذف الفاتورة بنجاح.",$b="فشل في حذف الفاتورة.",_b="تم إرسال الفاتورة",xb="تم إرسال الفاتورة بنجاح.",Bb="فشل في إرسال الفاتورة.",Rb="تسجيل الدخول",Eb="جاري تسجيل الدخول...",Ib="اسم المستخدم",Sb="كلمة المرور",Lb="الرجاء إدخال اسم المستخدم وكلمة المرور.",Tb="تم تسجيل الدخول بنجاح.",Nb="مرحبًا بعودتك!",Db="فشل في تسجيل الدخول.",Ob="الرجاء التحقق من اسم المستخدم وكلمة المرور.",Ab="فشل في المصادقة.",Pb="خطأ غير معروف.",Fb="اسم المستخدم أو كلمة المرور غير صالح.",zb="حدث خطأ أثناء تسجيل الدخول.",Mb="الرجاء المحاولة مرة أخرى لاحقًا.",Wb="إجمالي القيمة",Ub="جاري التحميل...",qb="ممنوع الوصول",Hb="ليس لديك إذن لعرض الفواتير المسودة.",jb="تم تجاوز حد الائتمان",Vb="أفهم",Yb="تم إلغاء الإجراء",Xb="يرجى تعديل مبالغ الفاتورة",Gb="تفاصيل حد الائتمان",Kb="العملاء التاليين سيتجاوزون حدودهم الائتمانية",Jb="الرصيد الحالي",Qb="الرصيد المتاح",Zb="المبلغ الزائد",oh="حد الائتمان",eh={logout:fm,logoutMain:gm,itemsDraft:mm,language:pm,startsWith:bm,contains:hm,notContains:vm,endsWith:km,equals:ym,notEquals:Cm,noFilter:wm,lt:$m,lte:_m,remark:xm,invoiceRemark:Bm,gt:Rm,gte:Em,dateIs:Im,dateIsNot:Sm,dateBefore:Lm,dateAfter:Tm,clear:Nm,apply:Dm,matchAll:Om,matchAny:Am,addRule:Pm,removeRule:Fm,accept:zm,reject:Mm,choose:Wm,upload:Um,cancel:qm,dayNames:Hm,dayNamesShort:jm,dayNamesMin:Vm,monthNames:Ym,monthNamesShort:Xm,today:Gm,weekHeader:Km,firstDayOfWeek:Jm,dateFormat:Qm,weak:Zm,medium:op,strong:ep,passwordPrompt:rp,emptyFilterMessage:tp,emptyMessage:np,invoiceName:ap,supplier:ip,customer:cp,qty:lp,item:sp,rate:dp,amount:up,itemCode:fp,addItem:gp,add:mp,delete:"حذف",saveInvoice:pp,update:bp,deleteInvoice:hp,submitInvoice:vp,moveToErp:kp,itemCodeIsRequired:yp,qtyIsRequired:Cp,rateIsRequired:wp,customerIsRequired:$p,supplierIsRequired:_p,totalAmount:xp,noDraftInvoicesAvailable:Bp,view:Rp,date:Ep,items:Ip,drafts:Sp,dashboard:Lp,dashboardWellcom:Tp,draftInvoices:Np,pendingInvoices:Dp,viewDrafts:Op,submittedInvoices:Ap,completedInvoices:Pp,viewSubmitted:Fp,quickActions:zp,createNewInvoice:Mp,viewDraftInvoices:Wp,recentActivity:Up,invoiceID:qp,status:Hp,actions:jp,noRecentActivityFound:Vp,menu:Yp,invoiceCreated:Xp,invoiceUpdated:Gp,invoiceCreatedSuccessfully:Kp,invoiceUpdatedSuccessfully:Jp,itemDeleted:Qp,itemDeletedFromInvoice:Zp,deleted:ob,itemRemoved:eb,error:rb,failedToUpdateAfterDeletion:tb,failedToDeleteItem:nb,itemUpdated:ab,itemAdded:ib,itemUpdateSuccess:cb,itemUpdateSuccessNoInvoice:lb,itemAddSuccess:sb,itemAddSuccessNoInvoice:db,selectSupplierBeforeAddingItems:ub,invoiceCreatedWithItem:fb,failedToSaveInvoice:gb,failedToUpdateInvoice:mb,confirmDeleteItem:pb,confirmDelete:bb,yesDelete:hb,cancelled:vb,deleteCancelled:kb,confirmDeleteInvoice:yb,invoiceDeleted:Cb,invoiceDeletedDetail:wb,deleteInvoiceFailed:$b,invoiceSubmitted:_b,invoiceSubmittedDetail:xb,submitInvoiceFailed:Bb,signin:Rb,signingIn:Eb,username:Ib,password:Sb,enterBothCredentials:Lb,loginSuccessful:Tb,welcomeBack:Nb,loginFailed:Db,checkCredentials:Ob,authenticationFailed:Ab,unknownError:Pb,invalidCredentials:Fb,loginError:zb,tryAgainLater:Mb,total:Wb,loading:Ub,accessRestricted:qb,noPermissionToViewDrafts:Hb,creditLimitExceeded:jb,understand:Vb,actionCancelled:Yb,pleaseAdjustInvoice:Xb,creditLimitDetails:Gb,creditLimitWarning:Kb,currentBalance:Jb,availableCredit:Qb,excessAmount:Zb,creditLimit:oh},nn=ol({legacy:!1,locale:"en",fallbackLocale:"en",messages:{en:um,ar:eh}});function jr(o,e){return to(this,null,function*(){e||(e={});let r={Accept:"application/json","Content-Type":"application/json; charset=utf-8","X-Frappe-Site-Name":window.location.hostname};window.csrf_token&&window.csrf_token!=="{{ csrf_token }}"&&(r["X-Frappe-CSRF-Token"]=window.csrf_token),a(this,"RequestStarted",null);const t=yield fetch(`/api/method/${o}`,{method:"POST",headers:r,body:JSON.stringify(e)});if(t.ok){a(this,null,null);const n=yield t.json();return n.docs||o==="login"?n:n.message}else{let n=yield t.text(),i,c;try{i=JSON.parse(n)}catch(u){}let l=[[o,i.exc_type,i._error_message].filter(Boolean).join(" ")];if(i.exc){c=i.exc;try{c=JSON.parse(c)[0]}catch(u){}l.push(c)}let s=new Error(l.join(`
-`));throw s.exc_type=i.exc_type,s.exc=c,s.messages=i._server_messages?JSON.parse(i._server_messages):[],s.messages=s.messages.concat(i.message),s.messages=s.messages.map(u=>{try{return JSON.parse(u).message}catch(g){return u}}),s.messages=s.messages.filter(Boolean),s.messages.length||(s.messages=i._error_message?[i._error_message]:["Internal Server Error"]),a(this,null,s.messages.join(`
-`)),[401,403].includes(t.status)&&sr.currentRoute.name!=="Login"&&sr.push("/login"),s}function a(n,i,c){(n==null?void 0:n.state)!==void 0&&(n.state=i),(n==null?void 0:n.errorMessage)!==void 0&&(n.errorMessage=c)}})}class rh{constructor(){this.isLoggedIn=!1,this.user=null,this.user_image=null,this.cookie=null,this.cookie=Object.fromEntries(document.cookie.split("; ").map(e=>e.split("=")).map(e=>[e[0],decodeURIComponent(e[1])])),this.isLoggedIn=this.cookie.user_id&&this.cookie.user_id!=="Guest"}login(e,r){return to(this,null,function*(){try{const t=yield jr("login",{usr:e,pwd:r});return t?(this.isLoggedIn=!0,this.user=e,t):!1}catch(t){throw console.error("Login error:",t),t}})}logout(){return to(this,null,function*(){yield jr("logout"),this.isLoggedIn=!1,window.location.reload()})}}const th={install:o=>{const e=Se({theme:"Aura",darkTheme:!0});o.config.globalProperties.$appState=e}};var nh=(...o)=>Xa(...o),ah={transitionDuration:"{transition.duration}"},ih={borderWidth:"0 0 1px 0",borderColor:"{content.border.color}"},ch={color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{text.color}",padding:"1.125rem",fontWeight:"600",borderRadius:"0",borderWidth:"0",borderColor:"{content.border.color}",background:"{content.background}",hoverBackground:"{content.background}",activeBackground:"{content.background}",activeHoverBackground:"{content.background}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"},toggleIcon:{color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{text.color}",activeHoverColor:"{text.color}"},first:{topBorderRadius:"{content.border.radius}",borderWidth:"0"},last:{bottomBorderRadius:"{content.border.radius}",activeBottomBorderRadius:"0"}},lh={borderWidth:"0",borderColor:"{content.border.color}",background:"{content.background}",color:"{text.color}",padding:"0 1.125rem 1.125rem 1.125rem"},sh={root:ah,panel:ih,header:ch,content:lh},dh={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}"},uh={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},fh={padding:"{list.padding}",gap:"{list.gap}"},gh={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},mh={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},ph={width:"2.5rem",sm:{width:"2rem"},lg:{width:"3rem"},borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},bh={borderRadius:"{border.radius.sm}"},hh={padding:"{list.option.padding}"},vh={light:{chip:{focusBackground:"{surface.200}",focusColor:"{surface.800}"},dropdown:{background:"{surface.100}",hoverBackground:"{surface.200}",activeBackground:"{surface.300}",color:"{surface.600}",hoverColor:"{surface.700}",activeColor:"{surface.800}"}},dark:{chip:{focusBackground:"{surface.700}",focusColor:"{surface.0}"},dropdown:{background:"{surface.800}",hoverBackground:"{surface.700}",activeBackground:"{surface.600}",color:"{surface.300}",hoverColor:"{surface.200}",activeColor:"{surface.100}"}}},kh={root:dh,overlay:uh,list:fh,option:gh,optionGroup:mh,dropdown:ph,chip:bh,emptyMessage:hh,colorScheme:vh},yh={width:"2rem",height:"2rem",fontSize:"1rem",background:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}"},Ch={size:"1rem"},wh={borderColor:"{content.background}",offset:"-0.75rem"},$h={width:"3rem",height:"3rem",fontSize:"1.5rem",icon:{size:"1.5rem"},group:{offset:"-1rem"}},_h={width:"4rem",height:"4rem",fontSize:"2rem",icon:{size:"2rem"},group:{offset:"-1.5rem"}},xh={root:yh,icon:Ch,group:wh,lg:$h,xl:_h},Bh={borderRadius:"{border.radius.md}",padding:"0 0.5rem",fontSize:"0.75rem",fontWeight:"700",minWidth:"1.5rem",height:"1.5rem"},Rh={size:"0.5rem"},Eh={fontSize:"0.625rem",minWidth:"1.25rem",height:"1.25rem"},Ih={fontSize:"0.875rem",minWidth:"1.75rem",height:"1.75rem"},Sh={fontSize:"1rem",minWidth:"2rem",height:"2rem"},Lh={light:{primary:{background:"{primary.color}",color:"{primary.contrast.color}"},secondary:{background:"{surface.100}",color:"{surface.600}"},success:{background:"{green.500}",color:"{surface.0}"},info:{background:"{sky.500}",color:"{surface.0}"},warn:{background:"{orange.500}",color:"{surface.0}"},danger:{background:"{red.500}",color:"{surface.0}"},contrast:{background:"{surface.950}",color:"{surface.0}"}},dark:{primary:{background:"{primary.color}",color:"{primary.contrast.color}"},secondary:{background:"{surface.800}",color:"{surface.300}"},success:{background:"{green.400}",color:"{green.950}"},info:{background:"{sky.400}",color:"{sky.950}"},warn:{background:"{orange.400}",color:"{orange.950}"},danger:{background:"{red.400}",color:"{red.950}"},contrast:{background:"{surface.0}",color:"{surface.950}"}}},Th={root:Bh,dot:Rh,sm:Eh,lg:Ih,xl:Sh,colorScheme:Lh},Nh={borderRadius:{none:"0",xs:"2px",sm:"4px",md:"6px",lg:"8px",xl:"12px"},emerald:{50:"#ecfdf5",100:"#d1fae5",200:"#a7f3d0",300:"#6ee7b7",400:"#34d399",500:"#10b981",600:"#059669",700:"#047857",800:"#065f46",900:"#064e3b",950:"#022c22"},green:{50:"#f0fdf4",100:"#dcfce7",200:"#bbf7d0",300:"#86efac",400:"#4ade80",500:"#22c55e",600:"#16a34a",700:"#15803d",800:"#166534",900:"#14532d",950:"#052e16"},lime:{50:"#f7fee7",100:"#ecfccb",200:"#d9f99d",300:"#bef264",400:"#a3e635",500:"#84cc16",600:"#65a30d",700:"#4d7c0f",800:"#3f6212",900:"#365314",950:"#1a2e05"},red:{50:"#fef2f2",100:"#fee2e2",200:"#fecaca",300:"#fca5a5",400:"#f87171",500:"#ef4444",600:"#dc2626",700:"#b91c1c",800:"#991b1b",900:"#7f1d1d",950:"#450a0a"},orange:{50:"#fff7ed",100:"#ffedd5",200:"#fed7aa",300:"#fdba74",400:"#fb923c",500:"#f97316",600:"#ea580c",700:"#c2410c",800:"#9a3412",900:"#7c2d12",950:"#431407"},amber:{50:"#fffbeb",100:"#fef3c7",200:"#fde68a",300:"#fcd34d",400:"#fbbf24",500:"#f59e0b",600:"#d97706",700:"#b45309",800:"#92400e",900:"#78350f",950:"#451a03"},yellow:{50:"#fefce8",100:"#fef9c3",200:"#fef08a",300:"#fde047",400:"#facc15",500:"#eab308",600:"#ca8a04",700:"#a16207",800:"#854d0e",900:"#713f12",950:"#422006"},teal:{50:"#f0fdfa",100:"#ccfbf1",200:"#99f6e4",300:"#5eead4",400:"#2dd4bf",500:"#14b8a6",600:"#0d9488",700:"#0f766e",800:"#115e59",900:"#134e4a",950:"#042f2e"},cyan:{50:"#ecfeff",100:"#cffafe",200:"#a5f3fc",300:"#67e8f9",400:"#22d3ee",500:"#06b6d4",600:"#0891b2",700:"#0e7490",800:"#155e75",900:"#164e63",950:"#083344"},sky:{50:"#f0f9ff",100:"#e0f2fe",200:"#bae6fd",300:"#7dd3fc",400:"#38bdf8",500:"#0ea5e9",600:"#0284c7",700:"#0369a1",800:"#075985",900:"#0c4a6e",950:"#082f49"},blue:{50:"#eff6ff",100:"#dbeafe",200:"#bfdbfe",300:"#93c5fd",400:"#60a5fa",500:"#3b82f6",600:"#2563eb",700:"#1d4ed8",800:"#1e40af",900:"#1e3a8a",950:"#172554"},indigo:{50:"#eef2ff",100:"#e0e7ff",200:"#c7d2fe",300:"#a5b4fc",400:"#818cf8",500:"#6366f1",600:"#4f46e5",700:"#4338ca",800:"#3730a3",900:"#312e81",950:"#1e1b4b"},violet:{50:"#f5f3ff",100:"#ede9fe",200:"#ddd6fe",300:"#c4b5fd",400:"#a78bfa",500:"#8b5cf6",600:"#7c3aed",700:"#6d28d9",800:"#5b21b6",900:"#4c1d95",950:"#2e1065"},purple:{50:"#faf5ff",100:"#f3e8ff",200:"#e9d5ff",300:"#d8b4fe",400:"#c084fc",500:"#a855f7",600:"#9333ea",700:"#7e22ce",800:"#6b21a8",900:"#581c87",950:"#3b0764"},fuchsia:{50:"#fdf4ff",100:"#fae8ff",200:"#f5d0fe",300:"#f0abfc",400:"#e879f9",500:"#d946ef",600:"#c026d3",700:"#a21caf",800:"#86198f",900:"#701a75",950:"#4a044e"},pink:{50:"#fdf2f8",100:"#fce7f3",200:"#fbcfe8",300:"#f9a8d4",400:"#f472b6",500:"#ec4899",600:"#db2777",700:"#be185d",800:"#9d174d",900:"#831843",950:"#500724"},rose:{50:"#fff1f2",100:"#ffe4e6",200:"#fecdd3",300:"#fda4af",400:"#fb7185",500:"#f43f5e",600:"#e11d48",700:"#be123c",800:"#9f1239",900:"#881337",950:"#4c0519"},slate:{50:"#f8fafc",100:"#f1f5f9",200:"#e2e8f0",300:"#cbd5e1",400:"#94a3b8",500:"#64748b",600:"#475569",700:"#334155",800:"#1e293b",900:"#0f172a",950:"#020617"},gray:{50:"#f9fafb",100:"#f3f4f6",200:"#e5e7eb",300:"#d1d5db",400:"#9ca3af",500:"#6b7280",600:"#4b5563",700:"#374151",800:"#1f2937",900:"#111827",950:"#030712"},zinc:{50:"#fafafa",100:"#f4f4f5",200:"#e4e4e7",300:"#d4d4d8",400:"#a1a1aa",500:"#71717a",600:"#52525b",700:"#3f3f46",800:"#27272a",900:"#18181b",950:"#09090b"},neutral:{50:"#fafafa",100:"#f5f5f5",200:"#e5e5e5",300:"#d4d4d4",400:"#a3a3a3",500:"#737373",600:"#525252",700:"#404040",800:"#262626",900:"#171717",950:"#0a0a0a"},stone:{50:"#fafaf9",100:"#f5f5f4",200:"#e7e5e4",300:"#d6d3d1",400:"#a8a29e",500:"#78716c",600:"#57534e",700:"#44403c",800:"#292524",900:"#1c1917",950:"#0c0a09"}},Dh={transitionDuration:"0.2s",focusRing:{width:"1px",style:"solid",color:"{primary.color}",offset:"2px",shadow:"none"},disabledOpacity:"0.6",iconSize:"1rem",anchorGutter:"2px",primary:{50:"{emerald.50}",100:"{emerald.100}",200:"{emerald.200}",300:"{emerald.300}",400:"{emerald.400}",500:"{emerald.500}",600:"{emerald.600}",700:"{emerald.700}",800:"{emerald.800}",900:"{emerald.900}",950:"{emerald.950}"},formField:{paddingX:"0.75rem",paddingY:"0.5rem",sm:{fontSize:"0.875rem",paddingX:"0.625rem",paddingY:"0.375rem"},lg:{fontSize:"1.125rem",paddingX:"0.875rem",paddingY:"0.625rem"},borderRadius:"{border.radius.md}",focusRing:{width:"0",style:"none",color:"transparent",offset:"0",shadow:"none"},transitionDuration:"{transition.duration}"},list:{padding:"0.25rem 0.25rem",gap:"2px",header:{padding:"0.5rem 1rem 0.25rem 1rem"},option:{padding:"0.5rem 0.75rem",borderRadius:"{border.radius.sm}"},optionGroup:{padding:"0.5rem 0.75rem",fontWeight:"600"}},content:{borderRadius:"{border.radius.md}"},mask:{transitionDuration:"0.15s"},navigation:{list:{padding:"0.25rem 0.25rem",gap:"2px"},item:{padding:"0.5rem 0.75rem",borderRadius:"{border.radius.sm}",gap:"0.5rem"},submenuLabel:{padding:"0.5rem 0.75rem",fontWeight:"600"},submenuIcon:{size:"0.875rem"}},overlay:{select:{borderRadius:"{border.radius.md}",shadow:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -2px rgba(0, 0, 0, 0.1)"},popover:{borderRadius:"{border.radius.md}",padding:"0.75rem",shadow:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -2px rgba(0, 0, 0, 0.1)"},modal:{borderRadius:"{border.radius.xl}",padding:"1.25rem",shadow:"0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 8px 10px -6px rgba(0, 0, 0, 0.1)"},navigation:{shadow:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -2px rgba(0, 0, 0, 0.1)"}},colorScheme:{light:{surface:{0:"#ffffff",50:"{slate.50}",100:"{slate.100}",200:"{slate.200}",300:"{slate.300}",400:"{slate.400}",500:"{slate.500}",600:"{slate.600}",700:"{slate.700}",800:"{slate.800}",900:"{slate.900}",950:"{slate.950}"},primary:{color:"{primary.500}",contrastColor:"#ffffff",hoverColor:"{primary.600}",activeColor:"{primary.700}"},highlight:{background:"{primary.50}",focusBackground:"{primary.100}",color:"{primary.700}",focusColor:"{primary.800}"},mask:{background:"rgba(0,0,0,0.4)",color:"{surface.200}"},formField:{background:"{surface.0}",disabledBackground:"{surface.200}",filledBackground:"{surface.50}",filledHoverBackground:"{surface.50}",filledFocusBackground:"{surface.50}",borderColor:"{surface.300}",hoverBorderColor:"{surface.400}",focusBorderColor:"{primary.color}",invalidBorderColor:"{red.400}",color:"{surface.700}",disabledColor:"{surface.500}",placeholderColor:"{surface.500}",invalidPlaceholderColor:"{red.600}",floatLabelColor:"{surface.500}",floatLabelFocusColor:"{primary.600}",floatLabelActiveColor:"{surface.500}",floatLabelInvalidColor:"{form.field.invalid.placeholder.color}",iconColor:"{surface.400}",shadow:"0 0 #0000, 0 0 #0000, 0 1px 2px 0 rgba(18, 18, 23, 0.05)"},text:{color:"{surface.700}",hoverColor:"{surface.800}",mutedColor:"{surface.500}",hoverMutedColor:"{surface.600}"},content:{background:"{surface.0}",hoverBackground:"{surface.100}",borderColor:"{surface.200}",color:"{text.color}",hoverColor:"{text.hover.color}"},overlay:{select:{background:"{surface.0}",borderColor:"{surface.200}",color:"{text.color}"},popover:{background:"{surface.0}",borderColor:"{surface.200}",color:"{text.color}"},modal:{background:"{surface.0}",borderColor:"{surface.200}",color:"{text.color}"}},list:{option:{focusBackground:"{surface.100}",selectedBackground:"{highlight.background}",selectedFocusBackground:"{highlight.focus.background}",color:"{text.color}",focusColor:"{text.hover.color}",selectedColor:"{highlight.color}",selectedFocusColor:"{highlight.focus.color}",icon:{color:"{surface.400}",focusColor:"{surface.500}"}},optionGroup:{background:"transparent",color:"{text.muted.color}"}},navigation:{item:{focusBackground:"{surface.100}",activeBackground:"{surface.100}",color:"{text.color}",focusColor:"{text.hover.color}",activeColor:"{text.hover.color}",icon:{color:"{surface.400}",focusColor:"{surface.500}",activeColor:"{surface.500}"}},submenuLabel:{background:"transparent",color:"{text.muted.color}"},submenuIcon:{color:"{surface.400}",focusColor:"{surface.500}",activeColor:"{surface.500}"}}},dark:{surface:{0:"#ffffff",50:"{zinc.50}",100:"{zinc.100}",200:"{zinc.200}",300:"{zinc.300}",400:"{zinc.400}",500:"{zinc.500}",600:"{zinc.600}",700:"{zinc.700}",800:"{zinc.800}",900:"{zinc.900}",950:"{zinc.950}"},primary:{color:"{primary.400}",contrastColor:"{surface.900}",hoverColor:"{primary.300}",activeColor:"{primary.200}"},highlight:{background:"color-mix(in srgb, {primary.400}, transparent 84%)",focusBackground:"color-mix(in srgb, {primary.400}, transparent 76%)",color:"rgba(255,255,255,.87)",focusColor:"rgba(255,255,255,.87)"},mask:{background:"rgba(0,0,0,0.6)",color:"{surface.200}"},formField:{background:"{surface.950}",disabledBackground:"{surface.700}",filledBackground:"{surface.800}",filledHoverBackground:"{surface.800}",filledFocusBackground:"{surface.800}",borderColor:"{surface.600}",hoverBorderColor:"{surface.500}",focusBorderColor:"{primary.color}",invalidBorderColor:"{red.300}",color:"{surface.0}",disabledColor:"{surface.400}",placeholderColor:"{surface.400}",invalidPlaceholderColor:"{red.400}",floatLabelColor:"{surface.400}",floatLabelFocusColor:"{primary.color}",floatLabelActiveColor:"{surface.400}",floatLabelInvalidColor:"{form.field.invalid.placeholder.color}",iconColor:"{surface.400}",shadow:"0 0 #0000, 0 0 #0000, 0 1px 2px 0 rgba(18, 18, 23, 0.05)"},text:{color:"{surface.0}",hoverColor:"{surface.0}",mutedColor:"{surface.400}",hoverMutedColor:"{surface.300}"},content:{background:"{surface.900}",hoverBackground:"{surface.800}",borderColor:"{surface.700}",color:"{text.color}",hoverColor:"{text.hover.color}"},overlay:{select:{background:"{surface.900}",borderColor:"{surface.700}",color:"{text.color}"},popover:{background:"{surface.900}",borderColor:"{surface.700}",color:"{text.color}"},modal:{background:"{surface.900}",borderColor:"{surface.700}",color:"{text.color}"}},list:{option:{focusBackground:"{surface.800}",selectedBackground:"{highlight.background}",selectedFocusBackground:"{highlight.focus.background}",color:"{text.color}",focusColor:"{text.hover.color}",selectedColor:"{highlight.color}",selectedFocusColor:"{highlight.focus.color}",icon:{color:"{surface.500}",focusColor:"{surface.400}"}},optionGroup:{background:"transparent",color:"{text.muted.color}"}},navigation:{item:{focusBackground:"{surface.800}",activeBackground:"{surface.800}",color:"{text.color}",focusColor:"{text.hover.color}",activeColor:"{text.hover.color}",icon:{color:"{surface.500}",focusColor:"{surface.400}",activeColor:"{surface.400}"}},submenuLabel:{background:"transparent",color:"{text.muted.color}"},submenuIcon:{color:"{surface.500}",focusColor:"{surface.400}",activeColor:"{surface.400}"}}}}},Oh={primitive:Nh,semantic:Dh},Ah={borderRadius:"{content.border.radius}"},Ph={root:Ah},Fh={padding:"1rem",background:"{content.background}",gap:"0.5rem",transitionDuration:"{transition.duration}"},zh={color:"{text.muted.color}",hoverColor:"{text.color}",borderRadius:"{content.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",hoverColor:"{navigation.item.icon.focus.color}"},focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Mh={color:"{navigation.item.icon.color}"},Wh={root:Fh,item:zh,separator:Mh},Uh={borderRadius:"{form.field.border.radius}",roundedBorderRadius:"2rem",gap:"0.5rem",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",iconOnlyWidth:"2.5rem",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}",iconOnlyWidth:"2rem"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}",iconOnlyWidth:"3rem"},label:{fontWeight:"500"},raisedShadow:"0 3px 1px -2px rgba(0, 0, 0, 0.2), 0 2px 2px 0 rgba(0, 0, 0, 0.14), 0 1px 5px 0 rgba(0, 0, 0, 0.12)",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",offset:"{focus.ring.offset}"},badgeSize:"1rem",transitionDuration:"{form.field.transition.duration}"},qh={light:{root:{primary:{background:"{primary.color}",hoverBackground:"{primary.hover.color}",activeBackground:"{primary.active.color}",borderColor:"{primary.color}",hoverBorderColor:"{primary.hover.color}",activeBorderColor:"{primary.active.color}",color:"{primary.contrast.color}",hoverColor:"{primary.contrast.color}",activeColor:"{primary.contrast.color}",focusRing:{color:"{primary.color}",shadow:"none"}},secondary:{background:"{surface.100}",hoverBackground:"{surface.200}",activeBackground:"{surface.300}",borderColor:"{surface.100}",hoverBorderColor:"{surface.200}",activeBorderColor:"{surface.300}",color:"{surface.600}",hoverColor:"{surface.700}",activeColor:"{surface.800}",focusRing:{color:"{surface.600}",shadow:"none"}},info:{background:"{sky.500}",hoverBackground:"{sky.600}",activeBackground:"{sky.700}",borderColor:"{sky.500}",hoverBorderColor:"{sky.600}",activeBorderColor:"{sky.700}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{sky.500}",shadow:"none"}},success:{background:"{green.500}",hoverBackground:"{green.600}",activeBackground:"{green.700}",borderColor:"{green.500}",hoverBorderColor:"{green.600}",activeBorderColor:"{green.700}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{green.500}",shadow:"none"}},warn:{background:"{orange.500}",hoverBackground:"{orange.600}",activeBackground:"{orange.700}",borderColor:"{orange.500}",hoverBorderColor:"{orange.600}",activeBorderColor:"{orange.700}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{orange.500}",shadow:"none"}},help:{background:"{purple.500}",hoverBackground:"{purple.600}",activeBackground:"{purple.700}",borderColor:"{purple.500}",hoverBorderColor:"{purple.600}",activeBorderColor:"{purple.700}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{purple.500}",shadow:"none"}},danger:{background:"{red.500}",hoverBackground:"{red.600}",activeBackground:"{red.700}",borderColor:"{red.500}",hoverBorderColor:"{red.600}",activeBorderColor:"{red.700}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{red.500}",shadow:"none"}},contrast:{background:"{surface.950}",hoverBackground:"{surface.900}",activeBackground:"{surface.800}",borderColor:"{surface.950}",hoverBorderColor:"{surface.900}",activeBorderColor:"{surface.800}",color:"{surface.0}",hoverColor:"{surface.0}",activeColor:"{surface.0}",focusRing:{color:"{surface.950}",shadow:"none"}}},outlined:{primary:{hoverBackground:"{primary.50}",activeBackground:"{primary.100}",borderColor:"{primary.200}",color:"{primary.color}"},secondary:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",borderColor:"{surface.200}",color:"{surface.500}"},success:{hoverBackground:"{green.50}",activeBackground:"{green.100}",borderColor:"{green.200}",color:"{green.500}"},info:{hoverBackground:"{sky.50}",activeBackground:"{sky.100}",borderColor:"{sky.200}",color:"{sky.500}"},warn:{hoverBackground:"{orange.50}",activeBackground:"{orange.100}",borderColor:"{orange.200}",color:"{orange.500}"},help:{hoverBackground:"{purple.50}",activeBackground:"{purple.100}",borderColor:"{purple.200}",color:"{purple.500}"},danger:{hoverBackground:"{red.50}",activeBackground:"{red.100}",borderColor:"{red.200}",color:"{red.500}"},contrast:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",borderColor:"{surface.700}",color:"{surface.950}"},plain:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",borderColor:"{surface.200}",color:"{surface.700}"}},text:{primary:{hoverBackground:"{primary.50}",activeBackground:"{primary.100}",color:"{primary.color}"},secondary:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",color:"{surface.500}"},success:{hoverBackground:"{green.50}",activeBackground:"{green.100}",color:"{green.500}"},info:{hoverBackground:"{sky.50}",activeBackground:"{sky.100}",color:"{sky.500}"},warn:{hoverBackground:"{orange.50}",activeBackground:"{orange.100}",color:"{orange.500}"},help:{hoverBackground:"{purple.50}",activeBackground:"{purple.100}",color:"{purple.500}"},danger:{hoverBackground:"{red.50}",activeBackground:"{red.100}",color:"{red.500}"},contrast:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",color:"{surface.950}"},plain:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",color:"{surface.700}"}},link:{color:"{primary.color}",hoverColor:"{primary.color}",activeColor:"{primary.color}"}},dark:{root:{primary:{background:"{primary.color}",hoverBackground:"{primary.hover.color}",activeBackground:"{primary.active.color}",borderColor:"{primary.color}",hoverBorderColor:"{primary.hover.color}",activeBorderColor:"{primary.active.color}",color:"{primary.contrast.color}",hoverColor:"{primary.contrast.color}",activeColor:"{primary.contrast.color}",focusRing:{color:"{primary.color}",shadow:"none"}},secondary:{background:"{surface.800}",hoverBackground:"{surface.700}",activeBackground:"{surface.600}",borderColor:"{surface.800}",hoverBorderColor:"{surface.700}",activeBorderColor:"{surface.600}",color:"{surface.300}",hoverColor:"{surface.200}",activeColor:"{surface.100}",focusRing:{color:"{surface.300}",shadow:"none"}},info:{background:"{sky.400}",hoverBackground:"{sky.300}",activeBackground:"{sky.200}",borderColor:"{sky.400}",hoverBorderColor:"{sky.300}",activeBorderColor:"{sky.200}",color:"{sky.950}",hoverColor:"{sky.950}",activeColor:"{sky.950}",focusRing:{color:"{sky.400}",shadow:"none"}},success:{background:"{green.400}",hoverBackground:"{green.300}",activeBackground:"{green.200}",borderColor:"{green.400}",hoverBorderColor:"{green.300}",activeBorderColor:"{green.200}",color:"{green.950}",hoverColor:"{green.950}",activeColor:"{green.950}",focusRing:{color:"{green.400}",shadow:"none"}},warn:{background:"{orange.400}",hoverBackground:"{orange.300}",activeBackground:"{orange.200}",borderColor:"{orange.400}",hoverBorderColor:"{orange.300}",activeBorderColor:"{orange.200}",color:"{orange.950}",hoverColor:"{orange.950}",activeColor:"{orange.950}",focusRing:{color:"{orange.400}",shadow:"none"}},help:{background:"{purple.400}",hoverBackground:"{purple.300}",activeBackground:"{purple.200}",borderColor:"{purple.400}",hoverBorderColor:"{purple.300}",activeBorderColor:"{purple.200}",color:"{purple.950}",hoverColor:"{purple.950}",activeColor:"{purple.950}",focusRing:{color:"{purple.400}",shadow:"none"}},danger:{background:"{red.400}",hoverBackground:"{red.300}",activeBackground:"{red.200}",borderColor:"{red.400}",hoverBorderColor:"{red.300}",activeBorderColor:"{red.200}",color:"{red.950}",hoverColor:"{red.950}",activeColor:"{red.950}",focusRing:{color:"{red.400}",shadow:"none"}},contrast:{background:"{surface.0}",hoverBackground:"{surface.100}",activeBackground:"{surface.200}",borderColor:"{surface.0}",hoverBorderColor:"{surface.100}",activeBorderColor:"{surface.200}",color:"{surface.950}",hoverColor:"{surface.950}",activeColor:"{surface.950}",focusRing:{color:"{surface.0}",shadow:"none"}}},outlined:{primary:{hoverBackground:"color-mix(in srgb, {primary.color}, transparent 96%)",activeBackground:"color-mix(in srgb, {primary.color}, transparent 84%)",borderColor:"{primary.700}",color:"{primary.color}"},secondary:{hoverBackground:"rgba(255,255,255,0.04)",activeBackground:"rgba(255,255,255,0.16)",borderColor:"{surface.700}",color:"{surface.400}"},success:{hoverBackground:"color-mix(in srgb, {green.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {green.400}, transparent 84%)",borderColor:"{green.700}",color:"{green.400}"},info:{hoverBackground:"color-mix(in srgb, {sky.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {sky.400}, transparent 84%)",borderColor:"{sky.700}",color:"{sky.400}"},warn:{hoverBackground:"color-mix(in srgb, {orange.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {orange.400}, transparent 84%)",borderColor:"{orange.700}",color:"{orange.400}"},help:{hoverBackground:"color-mix(in srgb, {purple.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {purple.400}, transparent 84%)",borderColor:"{purple.700}",color:"{purple.400}"},danger:{hoverBackground:"color-mix(in srgb, {red.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {red.400}, transparent 84%)",borderColor:"{red.700}",color:"{red.400}"},contrast:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",borderColor:"{surface.500}",color:"{surface.0}"},plain:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",borderColor:"{surface.600}",color:"{surface.0}"}},text:{primary:{hoverBackground:"color-mix(in srgb, {primary.color}, transparent 96%)",activeBackground:"color-mix(in srgb, {primary.color}, transparent 84%)",color:"{primary.color}"},secondary:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",color:"{surface.400}"},success:{hoverBackground:"color-mix(in srgb, {green.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {green.400}, transparent 84%)",color:"{green.400}"},info:{hoverBackground:"color-mix(in srgb, {sky.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {sky.400}, transparent 84%)",color:"{sky.400}"},warn:{hoverBackground:"color-mix(in srgb, {orange.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {orange.400}, transparent 84%)",color:"{orange.400}"},help:{hoverBackground:"color-mix(in srgb, {purple.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {purple.400}, transparent 84%)",color:"{purple.400}"},danger:{hoverBackground:"color-mix(in srgb, {red.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {red.400}, transparent 84%)",color:"{red.400}"},contrast:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",color:"{surface.0}"},plain:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",color:"{surface.0}"}},link:{color:"{primary.color}",hoverColor:"{primary.color}",activeColor:"{primary.color}"}}},Hh={root:Uh,colorScheme:qh},jh={background:"{content.background}",borderRadius:"{border.radius.xl}",color:"{content.color}",shadow:"0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px -1px rgba(0, 0, 0, 0.1)"},Vh={padding:"1.25rem",gap:"0.5rem"},Yh={gap:"0.5rem"},Xh={fontSize:"1.25rem",fontWeight:"500"},Gh={color:"{text.muted.color}"},Kh={root:jh,body:Vh,caption:Yh,title:Xh,subtitle:Gh},Jh={transitionDuration:"{transition.duration}"},Qh={gap:"0.25rem"},Zh={padding:"1rem",gap:"0.5rem"},ov={width:"2rem",height:"0.5rem",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},ev={light:{indicator:{background:"{surface.200}",hoverBackground:"{surface.300}",activeBackground:"{primary.color}"}},dark:{indicator:{background:"{surface.700}",hoverBackground:"{surface.600}",activeBackground:"{primary.color}"}}},rv={root:Jh,content:Qh,indicatorList:Zh,indicator:ov,colorScheme:ev},tv={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},nv={width:"2.5rem",color:"{form.field.icon.color}"},av={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},iv={padding:"{list.padding}",gap:"{list.gap}",mobileIndent:"1rem"},cv={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}",icon:{color:"{list.option.icon.color}",focusColor:"{list.option.icon.focus.color}",size:"0.875rem"}},lv={color:"{form.field.icon.color}"},sv={root:tv,dropdown:nv,overlay:av,list:iv,option:cv,clearIcon:lv},dv={borderRadius:"{border.radius.sm}",width:"1.25rem",height:"1.25rem",background:"{form.field.background}",checkedBackground:"{primary.color}",checkedHoverBackground:"{primary.hover.color}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.border.color}",checkedBorderColor:"{primary.color}",checkedHoverBorderColor:"{primary.hover.color}",checkedFocusBorderColor:"{primary.color}",checkedDisabledBorderColor:"{form.field.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",shadow:"{form.field.shadow}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{width:"1rem",height:"1rem"},lg:{width:"1.5rem",height:"1.5rem"}},uv={size:"0.875rem",color:"{form.field.color}",checkedColor:"{primary.contrast.color}",checkedHoverColor:"{primary.contrast.color}",disabledColor:"{form.field.disabled.color}",sm:{size:"0.75rem"},lg:{size:"1rem"}},fv={root:dv,icon:uv},gv={borderRadius:"16px",paddingX:"0.75rem",paddingY:"0.5rem",gap:"0.5rem",transitionDuration:"{transition.duration}"},mv={width:"2rem",height:"2rem"},pv={size:"1rem"},bv={size:"1rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"}},hv={light:{root:{background:"{surface.100}",color:"{surface.800}"},icon:{color:"{surface.800}"},removeIcon:{color:"{surface.800}"}},dark:{root:{background:"{surface.800}",color:"{surface.0}"},icon:{color:"{surface.0}"},removeIcon:{color:"{surface.0}"}}},vv={root:gv,image:mv,icon:pv,removeIcon:bv,colorScheme:hv},kv={transitionDuration:"{transition.duration}"},yv={width:"1.5rem",height:"1.5rem",borderRadius:"{form.field.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Cv={shadow:"{overlay.popover.shadow}",borderRadius:"{overlay.popover.borderRadius}"},wv={light:{panel:{background:"{surface.800}",borderColor:"{surface.900}"},handle:{color:"{surface.0}"}},dark:{panel:{background:"{surface.900}",borderColor:"{surface.700}"},handle:{color:"{surface.0}"}}},$v={root:kv,preview:yv,panel:Cv,colorScheme:wv},_v={size:"2rem",color:"{overlay.modal.color}"},xv={gap:"1rem"},Bv={icon:_v,content:xv},Rv={background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",color:"{overlay.popover.color}",borderRadius:"{overlay.popover.border.radius}",shadow:"{overlay.popover.shadow}",gutter:"10px",arrowOffset:"1.25rem"},Ev={padding:"{overlay.popover.padding}",gap:"1rem"},Iv={size:"1.5rem",color:"{overlay.popover.color}"},Sv={gap:"0.5rem",padding:"0 {overlay.popover.padding} {overlay.popover.padding} {overlay.popover.padding}"},Lv={root:Rv,content:Ev,icon:Iv,footer:Sv},Tv={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",transitionDuration:"{transition.duration}"},Nv={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},Dv={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},Ov={mobileIndent:"1rem"},Av={size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"},Pv={borderColor:"{content.border.color}"},Fv={root:Tv,list:Nv,item:Dv,submenu:Ov,submenuIcon:Av,separator:Pv},zv={transitionDuration:"{transition.duration}"},Mv={background:"{content.background}",borderColor:"{datatable.border.color}",color:"{content.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},Wv={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",borderColor:"{datatable.border.color}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",gap:"0.5rem",padding:"0.75rem 1rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"},sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},Uv={fontWeight:"600"},qv={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},Hv={borderColor:"{datatable.border.color}",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},jv={background:"{content.background}",borderColor:"{datatable.border.color}",color:"{content.color}",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},Vv={fontWeight:"600"},Yv={background:"{content.background}",borderColor:"{datatable.border.color}",color:"{content.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},Xv={color:"{primary.color}"},Gv={width:"0.5rem"},Kv={width:"1px",color:"{primary.color}"},Jv={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",size:"0.875rem"},Qv={size:"2rem"},Zv={hoverBackground:"{content.hover.background}",selectedHoverBackground:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}",selectedHoverColor:"{primary.color}",size:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},o1={inlineGap:"0.5rem",overlaySelect:{background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},overlayPopover:{background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",borderRadius:"{overlay.popover.border.radius}",color:"{overlay.popover.color}",shadow:"{overlay.popover.shadow}",padding:"{overlay.popover.padding}",gap:"0.5rem"},rule:{borderColor:"{content.border.color}"},constraintList:{padding:"{list.padding}",gap:"{list.gap}"},constraint:{focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",separator:{borderColor:"{content.border.color}"},padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"}},e1={borderColor:"{datatable.border.color}",borderWidth:"0 0 1px 0"},r1={borderColor:"{datatable.border.color}",borderWidth:"0 0 1px 0"},t1={light:{root:{borderColor:"{content.border.color}"},row:{stripedBackground:"{surface.50}"},bodyCell:{selectedBorderColor:"{primary.100}"}},dark:{root:{borderColor:"{surface.800}"},row:{stripedBackground:"{surface.950}"},bodyCell:{selectedBorderColor:"{primary.900}"}}},n1={root:zv,header:Mv,headerCell:Wv,columnTitle:Uv,row:qv,bodyCell:Hv,footerCell:jv,columnFooter:Vv,footer:Yv,dropPoint:Xv,columnResizer:Gv,resizeIndicator:Kv,sortIcon:Jv,loadingIcon:Qv,rowToggleButton:Zv,filter:o1,paginatorTop:e1,paginatorBottom:r1,colorScheme:t1},a1={borderColor:"transparent",borderWidth:"0",borderRadius:"0",padding:"0"},i1={background:"{content.background}",color:"{content.color}",borderColor:"{content.border.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem",borderRadius:"0"},c1={background:"{content.background}",color:"{content.color}",borderColor:"transparent",borderWidth:"0",padding:"0",borderRadius:"0"},l1={background:"{content.background}",color:"{content.color}",borderColor:"{content.border.color}",borderWidth:"1px 0 0 0",padding:"0.75rem 1rem",borderRadius:"0"},s1={borderColor:"{content.border.color}",borderWidth:"0 0 1px 0"},d1={borderColor:"{content.border.color}",borderWidth:"1px 0 0 0"},u1={root:a1,header:i1,content:c1,footer:l1,paginatorTop:s1,paginatorBottom:d1},f1={transitionDuration:"{transition.duration}"},g1={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.popover.shadow}",padding:"{overlay.popover.padding}"},m1={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",padding:"0 0 0.5rem 0"},p1={gap:"0.5rem",fontWeight:"500"},b1={width:"2.5rem",sm:{width:"2rem"},lg:{width:"3rem"},borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},h1={color:"{form.field.icon.color}"},v1={hoverBackground:"{content.hover.background}",color:"{content.color}",hoverColor:"{content.hover.color}",padding:"0.25rem 0.5rem",borderRadius:"{content.border.radius}"},k1={hoverBackground:"{content.hover.background}",color:"{content.color}",hoverColor:"{content.hover.color}",padding:"0.25rem 0.5rem",borderRadius:"{content.border.radius}"},y1={borderColor:"{content.border.color}",gap:"{overlay.popover.padding}"},C1={margin:"0.5rem 0 0 0"},w1={padding:"0.25rem",fontWeight:"500",color:"{content.color}"},$1={hoverBackground:"{content.hover.background}",selectedBackground:"{primary.color}",rangeSelectedBackground:"{highlight.background}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{primary.contrast.color}",rangeSelectedColor:"{highlight.color}",width:"2rem",height:"2rem",borderRadius:"50%",padding:"0.25rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},_1={margin:"0.5rem 0 0 0"},x1={padding:"0.375rem",borderRadius:"{content.border.radius}"},B1={margin:"0.5rem 0 0 0"},R1={padding:"0.375rem",borderRadius:"{content.border.radius}"},E1={padding:"0.5rem 0 0 0",borderColor:"{content.border.color}"},I1={padding:"0.5rem 0 0 0",borderColor:"{content.border.color}",gap:"0.5rem",buttonGap:"0.25rem"},S1={light:{dropdown:{background:"{surface.100}",hoverBackground:"{surface.200}",activeBackground:"{surface.300}",color:"{surface.600}",hoverColor:"{surface.700}",activeColor:"{surface.800}"},today:{background:"{surface.200}",color:"{surface.900}"}},dark:{dropdown:{background:"{surface.800}",hoverBackground:"{surface.700}",activeBackground:"{surface.600}",color:"{surface.300}",hoverColor:"{surface.200}",activeColor:"{surface.100}"},today:{background:"{surface.700}",color:"{surface.0}"}}},L1={root:f1,panel:g1,header:m1,title:p1,dropdown:b1,inputIcon:h1,selectMonth:v1,selectYear:k1,group:y1,dayView:C1,weekDay:w1,date:$1,monthView:_1,month:x1,yearView:B1,year:R1,buttonbar:E1,timePicker:I1,colorScheme:S1},T1={background:"{overlay.modal.background}",borderColor:"{overlay.modal.border.color}",color:"{overlay.modal.color}",borderRadius:"{overlay.modal.border.radius}",shadow:"{overlay.modal.shadow}"},N1={padding:"{overlay.modal.padding}",gap:"0.5rem"},D1={fontSize:"1.25rem",fontWeight:"600"},O1={padding:"0 {overlay.modal.padding} {overlay.modal.padding} {overlay.modal.padding}"},A1={padding:"0 {overlay.modal.padding} {overlay.modal.padding} {overlay.modal.padding}",gap:"0.5rem"},P1={root:T1,header:N1,title:D1,content:O1,footer:A1},F1={borderColor:"{content.border.color}"},z1={background:"{content.background}",color:"{text.color}"},M1={margin:"1rem 0",padding:"0 1rem",content:{padding:"0 0.5rem"}},W1={margin:"0 1rem",padding:"0.5rem 0",content:{padding:"0.5rem 0"}},U1={root:F1,content:z1,horizontal:M1,vertical:W1},q1={background:"rgba(255, 255, 255, 0.1)",borderColor:"rgba(255, 255, 255, 0.2)",padding:"0.5rem",borderRadius:"{border.radius.xl}"},H1={borderRadius:"{content.border.radius}",padding:"0.5rem",size:"3rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},j1={root:q1,item:H1},V1={background:"{overlay.modal.background}",borderColor:"{overlay.modal.border.color}",color:"{overlay.modal.color}",shadow:"{overlay.modal.shadow}"},Y1={padding:"{overlay.modal.padding}"},X1={fontSize:"1.5rem",fontWeight:"600"},G1={padding:"0 {overlay.modal.padding} {overlay.modal.padding} {overlay.modal.padding}"},K1={padding:"{overlay.modal.padding}"},J1={root:V1,header:Y1,title:X1,content:G1,footer:K1},Q1={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}"},Z1={color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}"},o5={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}",padding:"{list.padding}"},e5={focusBackground:"{list.option.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},r5={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}"},t5={toolbar:Q1,toolbarItem:Z1,overlay:o5,overlayOption:e5,content:r5},n5={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",padding:"0 1.125rem 1.125rem 1.125rem",transitionDuration:"{transition.duration}"},a5={background:"{content.background}",hoverBackground:"{content.hover.background}",color:"{content.color}",hoverColor:"{content.hover.color}",borderRadius:"{content.border.radius}",borderWidth:"1px",borderColor:"transparent",padding:"0.5rem 0.75rem",gap:"0.5rem",fontWeight:"600",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},i5={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}"},c5={padding:"0"},l5={root:n5,legend:a5,toggleIcon:i5,content:c5},s5={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",transitionDuration:"{transition.duration}"},d5={background:"transparent",color:"{text.color}",padding:"1.125rem",borderColor:"unset",borderWidth:"0",borderRadius:"0",gap:"0.5rem"},u5={highlightBorderColor:"{primary.color}",padding:"0 1.125rem 1.125rem 1.125rem",gap:"1rem"},f5={padding:"1rem",gap:"1rem",borderColor:"{content.border.color}",info:{gap:"0.5rem"}},g5={gap:"0.5rem"},m5={height:"0.25rem"},p5={gap:"0.5rem"},b5={root:s5,header:d5,content:u5,file:f5,fileList:g5,progressbar:m5,basic:p5},h5={color:"{form.field.float.label.color}",focusColor:"{form.field.float.label.focus.color}",activeColor:"{form.field.float.label.active.color}",invalidColor:"{form.field.float.label.invalid.color}",transitionDuration:"0.2s",positionX:"{form.field.padding.x}",positionY:"{form.field.padding.y}",fontWeight:"500",active:{fontSize:"0.75rem",fontWeight:"400"}},v5={active:{top:"-1.25rem"}},k5={input:{paddingTop:"1.5rem",paddingBottom:"{form.field.padding.y}"},active:{top:"{form.field.padding.y}"}},y5={borderRadius:"{border.radius.xs}",active:{background:"{form.field.background}",padding:"0 0.125rem"}},C5={root:h5,over:v5,in:k5,on:y5},w5={borderWidth:"1px",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",transitionDuration:"{transition.duration}"},$5={background:"rgba(255, 255, 255, 0.1)",hoverBackground:"rgba(255, 255, 255, 0.2)",color:"{surface.100}",hoverColor:"{surface.0}",size:"3rem",gutter:"0.5rem",prev:{borderRadius:"50%"},next:{borderRadius:"50%"},focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},_5={size:"1.5rem"},x5={background:"{content.background}",padding:"1rem 0.25rem"},B5={size:"2rem",borderRadius:"{content.border.radius}",gutter:"0.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},R5={size:"1rem"},E5={background:"rgba(0, 0, 0, 0.5)",color:"{surface.100}",padding:"1rem"},I5={gap:"0.5rem",padding:"1rem"},S5={width:"1rem",height:"1rem",activeBackground:"{primary.color}",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},L5={background:"rgba(0, 0, 0, 0.5)"},T5={background:"rgba(255, 255, 255, 0.4)",hoverBackground:"rgba(255, 255, 255, 0.6)",activeBackground:"rgba(255, 255, 255, 0.9)"},N5={size:"3rem",gutter:"0.5rem",background:"rgba(255, 255, 255, 0.1)",hoverBackground:"rgba(255, 255, 255, 0.2)",color:"{surface.50}",hoverColor:"{surface.0}",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},D5={size:"1.5rem"},O5={light:{thumbnailNavButton:{hoverBackground:"{surface.100}",color:"{surface.600}",hoverColor:"{surface.700}"},indicatorButton:{background:"{surface.200}",hoverBackground:"{surface.300}"}},dark:{thumbnailNavButton:{hoverBackground:"{surface.700}",color:"{surface.400}",hoverColor:"{surface.0}"},indicatorButton:{background:"{surface.700}",hoverBackground:"{surface.600}"}}},A5={root:w5,navButton:$5,navIcon:_5,thumbnailsContent:x5,thumbnailNavButton:B5,thumbnailNavButtonIcon:R5,caption:E5,indicatorList:I5,indicatorButton:S5,insetIndicatorList:L5,insetIndicatorButton:T5,closeButton:N5,closeButtonIcon:D5,colorScheme:O5},P5={color:"{form.field.icon.color}"},F5={icon:P5},z5={color:"{form.field.float.label.color}",focusColor:"{form.field.float.label.focus.color}",invalidColor:"{form.field.float.label.invalid.color}",transitionDuration:"0.2s",positionX:"{form.field.padding.x}",top:"{form.field.padding.y}",fontSize:"0.75rem",fontWeight:"400"},M5={paddingTop:"1.5rem",paddingBottom:"{form.field.padding.y}"},W5={root:z5,input:M5},U5={transitionDuration:"{transition.duration}"},q5={icon:{size:"1.5rem"},mask:{background:"{mask.background}",color:"{mask.color}"}},H5={position:{left:"auto",right:"1rem",top:"1rem",bottom:"auto"},blur:"8px",background:"rgba(255,255,255,0.1)",borderColor:"rgba(255,255,255,0.2)",borderWidth:"1px",borderRadius:"30px",padding:".5rem",gap:"0.5rem"},j5={hoverBackground:"rgba(255,255,255,0.1)",color:"{surface.50}",hoverColor:"{surface.0}",size:"3rem",iconSize:"1.5rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},V5={root:U5,preview:q5,toolbar:H5,action:j5},Y5={size:"15px",hoverSize:"30px",background:"rgba(255,255,255,0.3)",hoverBackground:"rgba(255,255,255,0.3)",borderColor:"unset",hoverBorderColor:"unset",borderWidth:"0",borderRadius:"50%",transitionDuration:"{transition.duration}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"rgba(255,255,255,0.3)",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},X5={handle:Y5},G5={padding:"{form.field.padding.y} {form.field.padding.x}",borderRadius:"{content.border.radius}",gap:"0.5rem"},K5={fontWeight:"500"},J5={size:"1rem"},Q5={light:{info:{background:"color-mix(in srgb, {blue.50}, transparent 5%)",borderColor:"{blue.200}",color:"{blue.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {blue.500}, transparent 96%)"},success:{background:"color-mix(in srgb, {green.50}, transparent 5%)",borderColor:"{green.200}",color:"{green.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {green.500}, transparent 96%)"},warn:{background:"color-mix(in srgb,{yellow.50}, transparent 5%)",borderColor:"{yellow.200}",color:"{yellow.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {yellow.500}, transparent 96%)"},error:{background:"color-mix(in srgb, {red.50}, transparent 5%)",borderColor:"{red.200}",color:"{red.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {red.500}, transparent 96%)"},secondary:{background:"{surface.100}",borderColor:"{surface.200}",color:"{surface.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.500}, transparent 96%)"},contrast:{background:"{surface.900}",borderColor:"{surface.950}",color:"{surface.50}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)"}},dark:{info:{background:"color-mix(in srgb, {blue.500}, transparent 84%)",borderColor:"color-mix(in srgb, {blue.700}, transparent 64%)",color:"{blue.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {blue.500}, transparent 96%)"},success:{background:"color-mix(in srgb, {green.500}, transparent 84%)",borderColor:"color-mix(in srgb, {green.700}, transparent 64%)",color:"{green.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {green.500}, transparent 96%)"},warn:{background:"color-mix(in srgb, {yellow.500}, transparent 84%)",borderColor:"color-mix(in srgb, {yellow.700}, transparent 64%)",color:"{yellow.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {yellow.500}, transparent 96%)"},error:{background:"color-mix(in srgb, {red.500}, transparent 84%)",borderColor:"color-mix(in srgb, {red.700}, transparent 64%)",color:"{red.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {red.500}, transparent 96%)"},secondary:{background:"{surface.800}",borderColor:"{surface.700}",color:"{surface.300}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.500}, transparent 96%)"},contrast:{background:"{surface.0}",borderColor:"{surface.100}",color:"{surface.950}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)"}}},Z5={root:G5,text:K5,icon:J5,colorScheme:Q5},ok={padding:"{form.field.padding.y} {form.field.padding.x}",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{transition.duration}"},ek={hoverBackground:"{content.hover.background}",hoverColor:"{content.hover.color}"},rk={root:ok,display:ek},tk={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}"},nk={borderRadius:"{border.radius.sm}"},ak={light:{chip:{focusBackground:"{surface.200}",color:"{surface.800}"}},dark:{chip:{focusBackground:"{surface.700}",color:"{surface.0}"}}},ik={root:tk,chip:nk,colorScheme:ak},ck={background:"{form.field.background}",borderColor:"{form.field.border.color}",color:"{form.field.icon.color}",borderRadius:"{form.field.border.radius}",padding:"0.5rem",minWidth:"2.5rem"},lk={addon:ck},sk={transitionDuration:"{transition.duration}"},dk={width:"2.5rem",borderRadius:"{form.field.border.radius}",verticalPadding:"{form.field.padding.y}"},uk={light:{button:{background:"transparent",hoverBackground:"{surface.100}",activeBackground:"{surface.200}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",color:"{surface.400}",hoverColor:"{surface.500}",activeColor:"{surface.600}"}},dark:{button:{background:"transparent",hoverBackground:"{surface.800}",activeBackground:"{surface.700}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",color:"{surface.400}",hoverColor:"{surface.300}",activeColor:"{surface.200}"}}},fk={root:sk,button:dk,colorScheme:uk},gk={gap:"0.5rem"},mk={width:"2.5rem",sm:{width:"2rem"},lg:{width:"3rem"}},pk={root:gk,input:mk},bk={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},hk={root:bk},vk={transitionDuration:"{transition.duration}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},kk={background:"{primary.color}"},yk={background:"{content.border.color}"},Ck={color:"{text.muted.color}"},wk={root:vk,value:kk,range:yk,text:Ck},$k={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",borderColor:"{form.field.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",shadow:"{form.field.shadow}",borderRadius:"{form.field.border.radius}",transitionDuration:"{form.field.transition.duration}"},_k={padding:"{list.padding}",gap:"{list.gap}",header:{padding:"{list.header.padding}"}},xk={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},Bk={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},Rk={color:"{list.option.color}",gutterStart:"-0.375rem",gutterEnd:"0.375rem"},Ek={padding:"{list.option.padding}"},Ik={light:{option:{stripedBackground:"{surface.50}"}},dark:{option:{stripedBackground:"{surface.900}"}}},Sk={root:$k,list:_k,option:xk,optionGroup:Bk,checkmark:Rk,emptyMessage:Ek,colorScheme:Ik},Lk={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",gap:"0.5rem",verticalOrientation:{padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},horizontalOrientation:{padding:"0.5rem 0.75rem",gap:"0.5rem"},transitionDuration:"{transition.duration}"},Tk={borderRadius:"{content.border.radius}",padding:"{navigation.item.padding}"},Nk={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},Dk={padding:"0",background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",shadow:"{overlay.navigation.shadow}",gap:"0.5rem"},Ok={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},Ak={padding:"{navigation.submenu.label.padding}",fontWeight:"{navigation.submenu.label.font.weight}",background:"{navigation.submenu.label.background.}",color:"{navigation.submenu.label.color}"},Pk={size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"},Fk={borderColor:"{content.border.color}"},zk={borderRadius:"50%",size:"1.75rem",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",hoverBackground:"{content.hover.background}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Mk={root:Lk,baseItem:Tk,item:Nk,overlay:Dk,submenu:Ok,submenuLabel:Ak,submenuIcon:Pk,separator:Fk,mobileButton:zk},Wk={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",transitionDuration:"{transition.duration}"},Uk={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},qk={focusBackground:"{navigation.item.focus.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}"}},Hk={padding:"{navigation.submenu.label.padding}",fontWeight:"{navigation.submenu.label.font.weight}",background:"{navigation.submenu.label.background}",color:"{navigation.submenu.label.color}"},jk={borderColor:"{content.border.color}"},Vk={root:Wk,list:Uk,item:qk,submenuLabel:Hk,separator:jk},Yk={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",gap:"0.5rem",padding:"0.5rem 0.75rem",transitionDuration:"{transition.duration}"},Xk={borderRadius:"{content.border.radius}",padding:"{navigation.item.padding}"},Gk={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},Kk={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}",background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",mobileIndent:"1rem",icon:{size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"}},Jk={borderColor:"{content.border.color}"},Qk={borderRadius:"50%",size:"1.75rem",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",hoverBackground:"{content.hover.background}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Zk={root:Yk,baseItem:Xk,item:Gk,submenu:Kk,separator:Jk,mobileButton:Qk},oy={borderRadius:"{content.border.radius}",borderWidth:"1px",transitionDuration:"{transition.duration}"},ey={padding:"0.5rem 0.75rem",gap:"0.5rem",sm:{padding:"0.375rem 0.625rem"},lg:{padding:"0.625rem 0.875rem"}},ry={fontSize:"1rem",fontWeight:"500",sm:{fontSize:"0.875rem"},lg:{fontSize:"1.125rem"}},ty={size:"1.125rem",sm:{size:"1rem"},lg:{size:"1.25rem"}},ny={width:"1.75rem",height:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",offset:"{focus.ring.offset}"}},ay={size:"1rem",sm:{size:"0.875rem"},lg:{size:"1.125rem"}},iy={root:{borderWidth:"1px"}},cy={content:{padding:"0"}},ly={light:{info:{background:"color-mix(in srgb, {blue.50}, transparent 5%)",borderColor:"{blue.200}",color:"{blue.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {blue.500}, transparent 96%)",closeButton:{hoverBackground:"{blue.100}",focusRing:{color:"{blue.600}",shadow:"none"}},outlined:{color:"{blue.600}",borderColor:"{blue.600}"},simple:{color:"{blue.600}"}},success:{background:"color-mix(in srgb, {green.50}, transparent 5%)",borderColor:"{green.200}",color:"{green.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {green.500}, transparent 96%)",closeButton:{hoverBackground:"{green.100}",focusRing:{color:"{green.600}",shadow:"none"}},outlined:{color:"{green.600}",borderColor:"{green.600}"},simple:{color:"{green.600}"}},warn:{background:"color-mix(in srgb,{yellow.50}, transparent 5%)",borderColor:"{yellow.200}",color:"{yellow.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {yellow.500}, transparent 96%)",closeButton:{hoverBackground:"{yellow.100}",focusRing:{color:"{yellow.600}",shadow:"none"}},outlined:{color:"{yellow.600}",borderColor:"{yellow.600}"},simple:{color:"{yellow.600}"}},error:{background:"color-mix(in srgb, {red.50}, transparent 5%)",borderColor:"{red.200}",color:"{red.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {red.500}, transparent 96%)",closeButton:{hoverBackground:"{red.100}",focusRing:{color:"{red.600}",shadow:"none"}},outlined:{color:"{red.600}",borderColor:"{red.600}"},simple:{color:"{red.600}"}},secondary:{background:"{surface.100}",borderColor:"{surface.200}",color:"{surface.600}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.500}, transparent 96%)",closeButton:{hoverBackground:"{surface.200}",focusRing:{color:"{surface.600}",shadow:"none"}},outlined:{color:"{surface.500}",borderColor:"{surface.500}"},simple:{color:"{surface.500}"}},contrast:{background:"{surface.900}",borderColor:"{surface.950}",color:"{surface.50}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)",closeButton:{hoverBackground:"{surface.800}",focusRing:{color:"{surface.50}",shadow:"none"}},outlined:{color:"{surface.950}",borderColor:"{surface.950}"},simple:{color:"{surface.950}"}}},dark:{info:{background:"color-mix(in srgb, {blue.500}, transparent 84%)",borderColor:"color-mix(in srgb, {blue.700}, transparent 64%)",color:"{blue.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {blue.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{blue.500}",shadow:"none"}},outlined:{color:"{blue.500}",borderColor:"{blue.500}"},simple:{color:"{blue.500}"}},success:{background:"color-mix(in srgb, {green.500}, transparent 84%)",borderColor:"color-mix(in srgb, {green.700}, transparent 64%)",color:"{green.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {green.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{green.500}",shadow:"none"}},outlined:{color:"{green.500}",borderColor:"{green.500}"},simple:{color:"{green.500}"}},warn:{background:"color-mix(in srgb, {yellow.500}, transparent 84%)",borderColor:"color-mix(in srgb, {yellow.700}, transparent 64%)",color:"{yellow.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {yellow.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{yellow.500}",shadow:"none"}},outlined:{color:"{yellow.500}",borderColor:"{yellow.500}"},simple:{color:"{yellow.500}"}},error:{background:"color-mix(in srgb, {red.500}, transparent 84%)",borderColor:"color-mix(in srgb, {red.700}, transparent 64%)",color:"{red.500}",shadow:"0px 4px 8px 0px color-mix(in srgb, {red.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{red.500}",shadow:"none"}},outlined:{color:"{red.500}",borderColor:"{red.500}"},simple:{color:"{red.500}"}},secondary:{background:"{surface.800}",borderColor:"{surface.700}",color:"{surface.300}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.500}, transparent 96%)",closeButton:{hoverBackground:"{surface.700}",focusRing:{color:"{surface.300}",shadow:"none"}},outlined:{color:"{surface.400}",borderColor:"{surface.400}"},simple:{color:"{surface.400}"}},contrast:{background:"{surface.0}",borderColor:"{surface.100}",color:"{surface.950}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)",closeButton:{hoverBackground:"{surface.100}",focusRing:{color:"{surface.950}",shadow:"none"}},outlined:{color:"{surface.0}",borderColor:"{surface.0}"},simple:{color:"{surface.0}"}}}},sy={root:oy,content:ey,text:ry,icon:ty,closeButton:ny,closeIcon:ay,outlined:iy,simple:cy,colorScheme:ly},dy={borderRadius:"{content.border.radius}",gap:"1rem"},uy={background:"{content.border.color}",size:"0.5rem"},fy={gap:"0.5rem"},gy={size:"0.5rem"},my={size:"1rem"},py={verticalGap:"0.5rem",horizontalGap:"1rem"},by={root:dy,meters:uy,label:fy,labelMarker:gy,labelIcon:my,labelList:py},hy={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},vy={width:"2.5rem",color:"{form.field.icon.color}"},ky={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},yy={padding:"{list.padding}",gap:"{list.gap}",header:{padding:"{list.header.padding}"}},Cy={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}",gap:"0.5rem"},wy={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},$y={color:"{form.field.icon.color}"},_y={borderRadius:"{border.radius.sm}"},xy={padding:"{list.option.padding}"},By={root:hy,dropdown:vy,overlay:ky,list:yy,option:Cy,optionGroup:wy,chip:_y,clearIcon:$y,emptyMessage:xy},Ry={gap:"1.125rem"},Ey={gap:"0.5rem"},Iy={root:Ry,controls:Ey},Sy={gutter:"0.75rem",transitionDuration:"{transition.duration}"},Ly={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",borderColor:"{content.border.color}",color:"{content.color}",selectedColor:"{highlight.color}",hoverColor:"{content.hover.color}",padding:"0.75rem 1rem",toggleablePadding:"0.75rem 1rem 1.25rem 1rem",borderRadius:"{content.border.radius}"},Ty={background:"{content.background}",hoverBackground:"{content.hover.background}",borderColor:"{content.border.color}",color:"{text.muted.color}",hoverColor:"{text.color}",size:"1.5rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Ny={color:"{content.border.color}",borderRadius:"{content.border.radius}",height:"24px"},Dy={root:Sy,node:Ly,nodeToggleButton:Ty,connector:Ny},Oy={outline:{width:"2px",color:"{content.background}"}},Ay={root:Oy},Py={padding:"0.5rem 1rem",gap:"0.25rem",borderRadius:"{content.border.radius}",background:"{content.background}",color:"{content.color}",transitionDuration:"{transition.duration}"},Fy={background:"transparent",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",selectedColor:"{highlight.color}",width:"2.5rem",height:"2.5rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},zy={color:"{text.muted.color}"},My={maxWidth:"2.5rem"},Wy={root:Py,navButton:Fy,currentPageReport:zy,jumpToPageInput:My},Uy={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}"},qy={background:"transparent",color:"{text.color}",padding:"1.125rem",borderColor:"{content.border.color}",borderWidth:"0",borderRadius:"0"},Hy={padding:"0.375rem 1.125rem"},jy={fontWeight:"600"},Vy={padding:"0 1.125rem 1.125rem 1.125rem"},Yy={padding:"0 1.125rem 1.125rem 1.125rem"},Xy={root:Uy,header:qy,toggleableHeader:Hy,title:jy,content:Vy,footer:Yy},Gy={gap:"0.5rem",transitionDuration:"{transition.duration}"},Ky={background:"{content.background}",borderColor:"{content.border.color}",borderWidth:"1px",color:"{content.color}",padding:"0.25rem 0.25rem",borderRadius:"{content.border.radius}",first:{borderWidth:"1px",topBorderRadius:"{content.border.radius}"},last:{borderWidth:"1px",bottomBorderRadius:"{content.border.radius}"}},Jy={focusBackground:"{navigation.item.focus.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",gap:"0.5rem",padding:"{navigation.item.padding}",borderRadius:"{content.border.radius}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}"}},Qy={indent:"1rem"},Zy={color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}"},oC={root:Gy,panel:Ky,item:Jy,submenu:Qy,submenuIcon:Zy},eC={background:"{content.border.color}",borderRadius:"{content.border.radius}",height:".75rem"},rC={color:"{form.field.icon.color}"},tC={background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",borderRadius:"{overlay.popover.border.radius}",color:"{overlay.popover.color}",padding:"{overlay.popover.padding}",shadow:"{overlay.popover.shadow}"},nC={gap:"0.5rem"},aC={light:{strength:{weakBackground:"{red.500}",mediumBackground:"{amber.500}",strongBackground:"{green.500}"}},dark:{strength:{weakBackground:"{red.400}",mediumBackground:"{amber.400}",strongBackground:"{green.400}"}}},iC={meter:eC,icon:rC,overlay:tC,content:nC,colorScheme:aC},cC={gap:"1.125rem"},lC={gap:"0.5rem"},sC={root:cC,controls:lC},dC={background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",color:"{overlay.popover.color}",borderRadius:"{overlay.popover.border.radius}",shadow:"{overlay.popover.shadow}",gutter:"10px",arrowOffset:"1.25rem"},uC={padding:"{overlay.popover.padding}"},fC={root:dC,content:uC},gC={background:"{content.border.color}",borderRadius:"{content.border.radius}",height:"1.25rem"},mC={background:"{primary.color}"},pC={color:"{primary.contrast.color}",fontSize:"0.75rem",fontWeight:"600"},bC={root:gC,value:mC,label:pC},hC={light:{root:{colorOne:"{red.500}",colorTwo:"{blue.500}",colorThree:"{green.500}",colorFour:"{yellow.500}"}},dark:{root:{colorOne:"{red.400}",colorTwo:"{blue.400}",colorThree:"{green.400}",colorFour:"{yellow.400}"}}},vC={colorScheme:hC},kC={width:"1.25rem",height:"1.25rem",background:"{form.field.background}",checkedBackground:"{primary.color}",checkedHoverBackground:"{primary.hover.color}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.border.color}",checkedBorderColor:"{primary.color}",checkedHoverBorderColor:"{primary.hover.color}",checkedFocusBorderColor:"{primary.color}",checkedDisabledBorderColor:"{form.field.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",shadow:"{form.field.shadow}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{width:"1rem",height:"1rem"},lg:{width:"1.5rem",height:"1.5rem"}},yC={size:"0.75rem",checkedColor:"{primary.contrast.color}",checkedHoverColor:"{primary.contrast.color}",disabledColor:"{form.field.disabled.color}",sm:{size:"0.5rem"},lg:{size:"1rem"}},CC={root:kC,icon:yC},wC={gap:"0.25rem",transitionDuration:"{transition.duration}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},$C={size:"1rem",color:"{text.muted.color}",hoverColor:"{primary.color}",activeColor:"{primary.color}"},_C={root:wC,icon:$C},xC={light:{root:{background:"rgba(0,0,0,0.1)"}},dark:{root:{background:"rgba(255,255,255,0.3)"}}},BC={colorScheme:xC},RC={transitionDuration:"{transition.duration}"},EC={size:"9px",borderRadius:"{border.radius.sm}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},IC={light:{bar:{background:"{surface.100}"}},dark:{bar:{background:"{surface.800}"}}},SC={root:RC,bar:EC,colorScheme:IC},LC={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},TC={width:"2.5rem",color:"{form.field.icon.color}"},NC={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},DC={padding:"{list.padding}",gap:"{list.gap}",header:{padding:"{list.header.padding}"}},OC={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},AC={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},PC={color:"{form.field.icon.color}"},FC={color:"{list.option.color}",gutterStart:"-0.375rem",gutterEnd:"0.375rem"},zC={padding:"{list.option.padding}"},MC={root:LC,dropdown:TC,overlay:NC,list:DC,option:OC,optionGroup:AC,clearIcon:PC,checkmark:FC,emptyMessage:zC},WC={borderRadius:"{form.field.border.radius}"},UC={light:{root:{invalidBorderColor:"{form.field.invalid.border.color}"}},dark:{root:{invalidBorderColor:"{form.field.invalid.border.color}"}}},qC={root:WC,colorScheme:UC},HC={borderRadius:"{content.border.radius}"},jC={light:{root:{background:"{surface.200}",animationBackground:"rgba(255,255,255,0.4)"}},dark:{root:{background:"rgba(255, 255, 255, 0.06)",animationBackground:"rgba(255, 255, 255, 0.04)"}}},VC={root:HC,colorScheme:jC},YC={transitionDuration:"{transition.duration}"},XC={background:"{content.border.color}",borderRadius:"{content.border.radius}",size:"3px"},GC={background:"{primary.color}"},KC={width:"20px",height:"20px",borderRadius:"50%",background:"{content.border.color}",hoverBackground:"{content.border.color}",content:{borderRadius:"50%",hoverBackground:"{content.background}",width:"16px",height:"16px",shadow:"0px 0.5px 0px 0px rgba(0, 0, 0, 0.08), 0px 1px 1px 0px rgba(0, 0, 0, 0.14)"},focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},JC={light:{handle:{content:{background:"{surface.0}"}}},dark:{handle:{content:{background:"{surface.950}"}}}},QC={root:YC,track:XC,range:GC,handle:KC,colorScheme:JC},ZC={gap:"0.5rem",transitionDuration:"{transition.duration}"},o2={root:ZC},e2={borderRadius:"{form.field.border.radius}",roundedBorderRadius:"2rem",raisedShadow:"0 3px 1px -2px rgba(0, 0, 0, 0.2), 0 2px 2px 0 rgba(0, 0, 0, 0.14), 0 1px 5px 0 rgba(0, 0, 0, 0.12)"},r2={root:e2},t2={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",transitionDuration:"{transition.duration}"},n2={background:"{content.border.color}"},a2={size:"24px",background:"transparent",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},i2={root:t2,gutter:n2,handle:a2},c2={transitionDuration:"{transition.duration}"},l2={background:"{content.border.color}",activeBackground:"{primary.color}",margin:"0 0 0 1.625rem",size:"2px"},s2={padding:"0.5rem",gap:"1rem"},d2={padding:"0",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},gap:"0.5rem"},u2={color:"{text.muted.color}",activeColor:"{primary.color}",fontWeight:"500"},f2={background:"{content.background}",activeBackground:"{content.background}",borderColor:"{content.border.color}",activeBorderColor:"{content.border.color}",color:"{text.muted.color}",activeColor:"{primary.color}",size:"2rem",fontSize:"1.143rem",fontWeight:"500",borderRadius:"50%",shadow:"0px 0.5px 0px 0px rgba(0, 0, 0, 0.06), 0px 1px 1px 0px rgba(0, 0, 0, 0.12)"},g2={padding:"0.875rem 0.5rem 1.125rem 0.5rem"},m2={background:"{content.background}",color:"{content.color}",padding:"0",indent:"1rem"},p2={root:c2,separator:l2,step:s2,stepHeader:d2,stepTitle:u2,stepNumber:f2,steppanels:g2,steppanel:m2},b2={transitionDuration:"{transition.duration}"},h2={background:"{content.border.color}"},v2={borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},gap:"0.5rem"},k2={color:"{text.muted.color}",activeColor:"{primary.color}",fontWeight:"500"},y2={background:"{content.background}",activeBackground:"{content.background}",borderColor:"{content.border.color}",activeBorderColor:"{content.border.color}",color:"{text.muted.color}",activeColor:"{primary.color}",size:"2rem",fontSize:"1.143rem",fontWeight:"500",borderRadius:"50%",shadow:"0px 0.5px 0px 0px rgba(0, 0, 0, 0.06), 0px 1px 1px 0px rgba(0, 0, 0, 0.12)"},C2={root:b2,separator:h2,itemLink:v2,itemLabel:k2,itemNumber:y2},w2={transitionDuration:"{transition.duration}"},$2={borderWidth:"0 0 1px 0",background:"{content.background}",borderColor:"{content.border.color}"},_2={background:"transparent",hoverBackground:"transparent",activeBackground:"transparent",borderWidth:"0 0 1px 0",borderColor:"{content.border.color}",hoverBorderColor:"{content.border.color}",activeBorderColor:"{primary.color}",color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}",padding:"1rem 1.125rem",fontWeight:"600",margin:"0 0 -1px 0",gap:"0.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},x2={color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}"},B2={height:"1px",bottom:"-1px",background:"{primary.color}"},R2={root:w2,tablist:$2,item:_2,itemIcon:x2,activeBar:B2},E2={transitionDuration:"{transition.duration}"},I2={borderWidth:"0 0 1px 0",background:"{content.background}",borderColor:"{content.border.color}"},S2={background:"transparent",hoverBackground:"transparent",activeBackground:"transparent",borderWidth:"0 0 1px 0",borderColor:"{content.border.color}",hoverBorderColor:"{content.border.color}",activeBorderColor:"{primary.color}",color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}",padding:"1rem 1.125rem",fontWeight:"600",margin:"0 0 -1px 0",gap:"0.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},L2={background:"{content.background}",color:"{content.color}",padding:"0.875rem 1.125rem 1.125rem 1.125rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"inset {focus.ring.shadow}"}},T2={background:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}",width:"2.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},N2={height:"1px",bottom:"-1px",background:"{primary.color}"},D2={light:{navButton:{shadow:"0px 0px 10px 50px rgba(255, 255, 255, 0.6)"}},dark:{navButton:{shadow:"0px 0px 10px 50px color-mix(in srgb, {content.background}, transparent 50%)"}}},O2={root:E2,tablist:I2,tab:S2,tabpanel:L2,navButton:T2,activeBar:N2,colorScheme:D2},A2={transitionDuration:"{transition.duration}"},P2={background:"{content.background}",borderColor:"{content.border.color}"},F2={borderColor:"{content.border.color}",activeBorderColor:"{primary.color}",color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}"},z2={background:"{content.background}",color:"{content.color}"},M2={background:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}"},W2={light:{navButton:{shadow:"0px 0px 10px 50px rgba(255, 255, 255, 0.6)"}},dark:{navButton:{shadow:"0px 0px 10px 50px color-mix(in srgb, {content.background}, transparent 50%)"}}},U2={root:A2,tabList:P2,tab:F2,tabPanel:z2,navButton:M2,colorScheme:W2},q2={fontSize:"0.875rem",fontWeight:"700",padding:"0.25rem 0.5rem",gap:"0.25rem",borderRadius:"{content.border.radius}",roundedBorderRadius:"{border.radius.xl}"},H2={size:"0.75rem"},j2={light:{primary:{background:"{primary.100}",color:"{primary.700}"},secondary:{background:"{surface.100}",color:"{surface.600}"},success:{background:"{green.100}",color:"{green.700}"},info:{background:"{sky.100}",color:"{sky.700}"},warn:{background:"{orange.100}",color:"{orange.700}"},danger:{background:"{red.100}",color:"{red.700}"},contrast:{background:"{surface.950}",color:"{surface.0}"}},dark:{primary:{background:"color-mix(in srgb, {primary.500}, transparent 84%)",color:"{primary.300}"},secondary:{background:"{surface.800}",color:"{surface.300}"},success:{background:"color-mix(in srgb, {green.500}, transparent 84%)",color:"{green.300}"},info:{background:"color-mix(in srgb, {sky.500}, transparent 84%)",color:"{sky.300}"},warn:{background:"color-mix(in srgb, {orange.500}, transparent 84%)",color:"{orange.300}"},danger:{background:"color-mix(in srgb, {red.500}, transparent 84%)",color:"{red.300}"},contrast:{background:"{surface.0}",color:"{surface.950}"}}},V2={root:q2,icon:H2,colorScheme:j2},Y2={background:"{form.field.background}",borderColor:"{form.field.border.color}",color:"{form.field.color}",height:"18rem",padding:"{form.field.padding.y} {form.field.padding.x}",borderRadius:"{form.field.border.radius}"},X2={gap:"0.25rem"},G2={margin:"2px 0"},K2={root:Y2,prompt:X2,commandResponse:G2},J2={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},Q2={root:J2},Z2={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",transitionDuration:"{transition.duration}"},ow={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},ew={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},rw={mobileIndent:"1rem"},tw={size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"},nw={borderColor:"{content.border.color}"},aw={root:Z2,list:ow,item:ew,submenu:rw,submenuIcon:tw,separator:nw},iw={minHeight:"5rem"},cw={eventContent:{padding:"1rem 0"}},lw={eventContent:{padding:"0 1rem"}},sw={size:"1.125rem",borderRadius:"50%",borderWidth:"2px",background:"{content.background}",borderColor:"{content.border.color}",content:{borderRadius:"50%",size:"0.375rem",background:"{primary.color}",insetShadow:"0px 0.5px 0px 0px rgba(0, 0, 0, 0.06), 0px 1px 1px 0px rgba(0, 0, 0, 0.12)"}},dw={color:"{content.border.color}",size:"2px"},uw={event:iw,horizontal:cw,vertical:lw,eventMarker:sw,eventConnector:dw},fw={width:"25rem",borderRadius:"{content.border.radius}",borderWidth:"1px",transitionDuration:"{transition.duration}"},gw={size:"1.125rem"},mw={padding:"{overlay.popover.padding}",gap:"0.5rem"},pw={gap:"0.5rem"},bw={fontWeight:"500",fontSize:"1rem"},hw={fontWeight:"500",fontSize:"0.875rem"},vw={width:"1.75rem",height:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",offset:"{focus.ring.offset}"}},kw={size:"1rem"},yw={light:{blur:"1.5px",info:{background:"color-mix(in srgb, {blue.50}, transparent 5%)",borderColor:"{blue.200}",color:"{blue.600}",detailColor:"{surface.700}",shadow:"0px 4px 8px 0px color-mix(in srgb, {blue.500}, transparent 96%)",closeButton:{hoverBackground:"{blue.100}",focusRing:{color:"{blue.600}",shadow:"none"}}},success:{background:"color-mix(in srgb, {green.50}, transparent 5%)",borderColor:"{green.200}",color:"{green.600}",detailColor:"{surface.700}",shadow:"0px 4px 8px 0px color-mix(in srgb, {green.500}, transparent 96%)",closeButton:{hoverBackground:"{green.100}",focusRing:{color:"{green.600}",shadow:"none"}}},warn:{background:"color-mix(in srgb,{yellow.50}, transparent 5%)",borderColor:"{yellow.200}",color:"{yellow.600}",detailColor:"{surface.700}",shadow:"0px 4px 8px 0px color-mix(in srgb, {yellow.500}, transparent 96%)",closeButton:{hoverBackground:"{yellow.100}",focusRing:{color:"{yellow.600}",shadow:"none"}}},error:{background:"color-mix(in srgb, {red.50}, transparent 5%)",borderColor:"{red.200}",color:"{red.600}",detailColor:"{surface.700}",shadow:"0px 4px 8px 0px color-mix(in srgb, {red.500}, transparent 96%)",closeButton:{hoverBackground:"{red.100}",focusRing:{color:"{red.600}",shadow:"none"}}},secondary:{background:"{surface.100}",borderColor:"{surface.200}",color:"{surface.600}",detailColor:"{surface.700}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.500}, transparent 96%)",closeButton:{hoverBackground:"{surface.200}",focusRing:{color:"{surface.600}",shadow:"none"}}},contrast:{background:"{surface.900}",borderColor:"{surface.950}",color:"{surface.50}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)",closeButton:{hoverBackground:"{surface.800}",focusRing:{color:"{surface.50}",shadow:"none"}}}},dark:{blur:"10px",info:{background:"color-mix(in srgb, {blue.500}, transparent 84%)",borderColor:"color-mix(in srgb, {blue.700}, transparent 64%)",color:"{blue.500}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {blue.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{blue.500}",shadow:"none"}}},success:{background:"color-mix(in srgb, {green.500}, transparent 84%)",borderColor:"color-mix(in srgb, {green.700}, transparent 64%)",color:"{green.500}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {green.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{green.500}",shadow:"none"}}},warn:{background:"color-mix(in srgb, {yellow.500}, transparent 84%)",borderColor:"color-mix(in srgb, {yellow.700}, transparent 64%)",color:"{yellow.500}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {yellow.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{yellow.500}",shadow:"none"}}},error:{background:"color-mix(in srgb, {red.500}, transparent 84%)",borderColor:"color-mix(in srgb, {red.700}, transparent 64%)",color:"{red.500}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {red.500}, transparent 96%)",closeButton:{hoverBackground:"rgba(255, 255, 255, 0.05)",focusRing:{color:"{red.500}",shadow:"none"}}},secondary:{background:"{surface.800}",borderColor:"{surface.700}",color:"{surface.300}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.500}, transparent 96%)",closeButton:{hoverBackground:"{surface.700}",focusRing:{color:"{surface.300}",shadow:"none"}}},contrast:{background:"{surface.0}",borderColor:"{surface.100}",color:"{surface.950}",detailColor:"{surface.950}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)",closeButton:{hoverBackground:"{surface.100}",focusRing:{color:"{surface.950}",shadow:"none"}}}}},Cw={root:fw,icon:gw,content:mw,text:pw,summary:bw,detail:hw,closeButton:vw,closeIcon:kw,colorScheme:yw},ww={padding:"0.25rem",borderRadius:"{content.border.radius}",gap:"0.5rem",fontWeight:"500",disabledBackground:"{form.field.disabled.background}",disabledBorderColor:"{form.field.disabled.background}",disabledColor:"{form.field.disabled.color}",invalidBorderColor:"{form.field.invalid.border.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",padding:"0.25rem"},lg:{fontSize:"{form.field.lg.font.size}",padding:"0.25rem"}},$w={disabledColor:"{form.field.disabled.color}"},_w={padding:"0.25rem 0.75rem",borderRadius:"{content.border.radius}",checkedShadow:"0px 1px 2px 0px rgba(0, 0, 0, 0.02), 0px 1px 2px 0px rgba(0, 0, 0, 0.04)",sm:{padding:"0.25rem 0.75rem"},lg:{padding:"0.25rem 0.75rem"}},xw={light:{root:{background:"{surface.100}",checkedBackground:"{surface.100}",hoverBackground:"{surface.100}",borderColor:"{surface.100}",color:"{surface.500}",hoverColor:"{surface.700}",checkedColor:"{surface.900}",checkedBorderColor:"{surface.100}"},content:{checkedBackground:"{surface.0}"},icon:{color:"{surface.500}",hoverColor:"{surface.700}",checkedColor:"{surface.900}"}},dark:{root:{background:"{surface.950}",checkedBackground:"{surface.950}",hoverBackground:"{surface.950}",borderColor:"{surface.950}",color:"{surface.400}",hoverColor:"{surface.300}",checkedColor:"{surface.0}",checkedBorderColor:"{surface.950}"},content:{checkedBackground:"{surface.800}"},icon:{color:"{surface.400}",hoverColor:"{surface.300}",checkedColor:"{surface.0}"}}},Bw={root:ww,icon:$w,content:_w,colorScheme:xw},Rw={width:"2.5rem",height:"1.5rem",borderRadius:"30px",gap:"0.25rem",shadow:"{form.field.shadow}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},borderWidth:"1px",borderColor:"transparent",hoverBorderColor:"transparent",checkedBorderColor:"transparent",checkedHoverBorderColor:"transparent",invalidBorderColor:"{form.field.invalid.border.color}",transitionDuration:"{form.field.transition.duration}",slideDuration:"0.2s"},Ew={borderRadius:"50%",size:"1rem"},Iw={light:{root:{background:"{surface.300}",disabledBackground:"{form.field.disabled.background}",hoverBackground:"{surface.400}",checkedBackground:"{primary.color}",checkedHoverBackground:"{primary.hover.color}"},handle:{background:"{surface.0}",disabledBackground:"{form.field.disabled.color}",hoverBackground:"{surface.0}",checkedBackground:"{surface.0}",checkedHoverBackground:"{surface.0}",color:"{text.muted.color}",hoverColor:"{text.color}",checkedColor:"{primary.color}",checkedHoverColor:"{primary.hover.color}"}},dark:{root:{background:"{surface.700}",disabledBackground:"{surface.600}",hoverBackground:"{surface.600}",checkedBackground:"{primary.color}",checkedHoverBackground:"{primary.hover.color}"},handle:{background:"{surface.400}",disabledBackground:"{surface.900}",hoverBackground:"{surface.300}",checkedBackground:"{surface.900}",checkedHoverBackground:"{surface.900}",color:"{surface.900}",hoverColor:"{surface.800}",checkedColor:"{primary.color}",checkedHoverColor:"{primary.hover.color}"}}},Sw={root:Rw,handle:Ew,colorScheme:Iw},Lw={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",gap:"0.5rem",padding:"0.75rem"},Tw={root:Lw},Nw={maxWidth:"12.5rem",gutter:"0.25rem",shadow:"{overlay.popover.shadow}",padding:"0.5rem 0.75rem",borderRadius:"{overlay.popover.border.radius}"},Dw={light:{root:{background:"{surface.700}",color:"{surface.0}"}},dark:{root:{background:"{surface.700}",color:"{surface.0}"}}},Ow={root:Nw,colorScheme:Dw},Aw={background:"{content.background}",color:"{content.color}",padding:"1rem",gap:"2px",indent:"1rem",transitionDuration:"{transition.duration}"},Pw={padding:"0.25rem 0.5rem",borderRadius:"{content.border.radius}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{text.color}",hoverColor:"{text.hover.color}",selectedColor:"{highlight.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"},gap:"0.25rem"},Fw={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",selectedColor:"{highlight.color}"},zw={borderRadius:"50%",size:"1.75rem",hoverBackground:"{content.hover.background}",selectedHoverBackground:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",selectedHoverColor:"{primary.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Mw={size:"2rem"},Ww={margin:"0 0 0.5rem 0"},Uw={root:Aw,node:Pw,nodeIcon:Fw,nodeToggleButton:zw,loadingIcon:Mw,filter:Ww},qw={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},Hw={width:"2.5rem",color:"{form.field.icon.color}"},jw={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},Vw={padding:"{list.padding}"},Yw={padding:"{list.option.padding}"},Xw={borderRadius:"{border.radius.sm}"},Gw={color:"{form.field.icon.color}"},Kw={root:qw,dropdown:Hw,overlay:jw,tree:Vw,emptyMessage:Yw,chip:Xw,clearIcon:Gw},Jw={transitionDuration:"{transition.duration}"},Qw={background:"{content.background}",borderColor:"{treetable.border.color}",color:"{content.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem"},Zw={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",borderColor:"{treetable.border.color}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",gap:"0.5rem",padding:"0.75rem 1rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},o$={fontWeight:"600"},e$={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},r$={borderColor:"{treetable.border.color}",padding:"0.75rem 1rem",gap:"0.5rem"},t$={background:"{content.background}",borderColor:"{treetable.border.color}",color:"{content.color}",padding:"0.75rem 1rem"},n$={fontWeight:"600"},a$={background:"{content.background}",borderColor:"{treetable.border.color}",color:"{content.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem"},i$={width:"0.5rem"},c$={width:"1px",color:"{primary.color}"},l$={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",size:"0.875rem"},s$={size:"2rem"},d$={hoverBackground:"{content.hover.background}",selectedHoverBackground:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}",selectedHoverColor:"{primary.color}",size:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},u$={borderColor:"{content.border.color}",borderWidth:"0 0 1px 0"},f$={borderColor:"{content.border.color}",borderWidth:"0 0 1px 0"},g$={light:{root:{borderColor:"{content.border.color}"},bodyCell:{selectedBorderColor:"{primary.100}"}},dark:{root:{borderColor:"{surface.800}"},bodyCell:{selectedBorderColor:"{primary.900}"}}},m$={root:Jw,header:Qw,headerCell:Zw,columnTitle:o$,row:e$,bodyCell:r$,footerCell:t$,columnFooter:n$,footer:a$,columnResizer:i$,resizeIndicator:c$,sortIcon:l$,loadingIcon:s$,nodeToggleButton:d$,paginatorTop:u$,paginatorBottom:f$,colorScheme:g$},p$={mask:{background:"{content.background}",color:"{text.muted.color}"},icon:{size:"2rem"}},b$={loader:p$},h$=Object.defineProperty,v$=Object.defineProperties,k$=Object.getOwnPropertyDescriptors,an=Object.getOwnPropertySymbols,y$=Object.prototype.hasOwnProperty,C$=Object.prototype.propertyIsEnumerable,cn=(o,e,r)=>e in o?h$(o,e,{enumerable:!0,configurable:!0,writable:!0,value:r}):o[e]=r,ln,w$=(ln=((o,e)=>{for(var r in e||(e={}))y$.call(e,r)&&cn(o,r,e[r]);if(an)for(var r of an(e))C$.call(e,r)&&cn(o,r,e[r]);return o})({},Oh),v$(ln,k$({components:{accordion:sh,autocomplete:kh,avatar:xh,badge:Th,blockui:Ph,breadcrumb:Wh,button:Hh,card:Kh,carousel:rv,cascadeselect:sv,checkbox:fv,chip:vv,colorpicker:$v,confirmdialog:Bv,confirmpopup:Lv,contextmenu:Fv,datatable:n1,dataview:u1,datepicker:L1,dialog:P1,divider:U1,dock:j1,drawer:J1,editor:t5,fieldset:l5,fileupload:b5,floatlabel:C5,galleria:A5,iconfield:F5,iftalabel:W5,image:V5,imagecompare:X5,inlinemessage:Z5,inplace:rk,inputchips:ik,inputgroup:lk,inputnumber:fk,inputotp:pk,inputtext:hk,knob:wk,listbox:Sk,megamenu:Mk,menu:Vk,menubar:Zk,message:sy,metergroup:by,multiselect:By,orderlist:Iy,organizationchart:Dy,overlaybadge:Ay,paginator:Wy,panel:Xy,panelmenu:oC,password:iC,picklist:sC,popover:fC,progressbar:bC,progressspinner:vC,radiobutton:CC,rating:_C,ripple:BC,scrollpanel:SC,select:MC,selectbutton:qC,skeleton:VC,slider:QC,speeddial:o2,splitbutton:r2,splitter:i2,stepper:p2,steps:C2,tabmenu:R2,tabs:O2,tabview:U2,tag:V2,terminal:K2,textarea:Q2,tieredmenu:aw,timeline:uw,toast:Cw,togglebutton:Bw,toggleswitch:Sw,toolbar:Tw,tooltip:Ow,tree:Uw,treeselect:Kw,treetable:m$,virtualscroller:b$}})));const $$=nh(w$,{semantic:{primary:{50:"{surface.50}",100:"{surface.100}",200:"{surface.200}",300:"{surface.300}",400:"{surface.400}",500:"{surface.500}",600:"{surface.600}",700:"{surface.700}",800:"{surface.800}",900:"{surface.900}",950:"{surface.950}"},colorScheme:{light:{primary:{color:"{primary.950}",contrastColor:"#ffffff",hoverColor:"{primary.900}",activeColor:"{primary.800}"},highlight:{background:"{primary.950}",focusBackground:"{primary.700}",color:"#ffffff",focusColor:"#ffffff"}},dark:{primary:{color:"{primary.50}",contrastColor:"{primary.950}",hoverColor:"{primary.100}",activeColor:"{primary.200}"},highlight:{background:"{primary.50}",focusBackground:"{primary.300}",color:"{primary.950}",focusColor:"{primary.950}"}}}}});class _${constructor(){this.permissions={can_login:!1,can_delete_invoice:!1,can_submit_invoice:!1,can_update_draft:!1,can_update_submitted:!1,can_show_drafts:!1,can_show_submitted:!1,repeat_item:!1},this.loaded=!1}loadPermissions(e){return to(this,null,function*(){try{if(!e)return;console.log("Loading permissions for user:",e);const r=yield Z.get("/api/method/invoice_form_vue.api.check_user_permission",{params:{user:e}});r&&r.data&&r.data.message&&(this.permissions=r.data.message,this.loaded=!0,console.log("Permissions loaded:",this.permissions))}catch(r){console.error("Error loading permissions:",r)}})}hasPermission(e){return console.log(`Checking permission ${e}:`,this.permissions[e]),this.permissions[e]===!0}}var x$={transitionDuration:"{transition.duration}"},B$={borderWidth:"0",borderColor:"{content.border.color}"},R$={background:"{content.background}",hoverBackground:"{content.hover.background}",activeBackground:"{content.background}",activeHoverBackground:"{content.hover.background}",color:"{text.color}",hoverColor:"{text.color}",activeColor:"{text.color}",padding:"1.125rem",fontWeight:"700",borderRadius:"0",borderWidth:"0 1px 1px 1px",borderColor:"{content.border.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-2px",shadow:"{focus.ring.shadow}"},toggleIcon:{color:"{text.color}",hoverColor:"{text.color}",activeColor:"{text.color}",activeHoverColor:"{text.color}"},first:{topBorderRadius:"{content.border.radius}",borderWidth:"1px"},last:{bottomBorderRadius:"{content.border.radius}",activeBottomBorderRadius:"0"}},E$={borderWidth:"0 1px 1px 1px",borderColor:"{content.border.color}",background:"{content.background}",color:"{text.color}",padding:"1.125rem"},I$={root:x$,panel:B$,header:R$,content:E$},S$={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}"},L$={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},T$={padding:"{list.padding}",gap:"{list.gap}"},N$={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},D$={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},O$={width:"2.5rem",sm:{width:"2rem"},lg:{width:"3rem"},background:"{form.field.background}",color:"{form.field.icon.color}",hoverColor:"{form.field.icon.color}",activeColor:"{form.field.icon.color}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},A$={borderRadius:"{border.radius.xs}"},P$={padding:"{list.option.padding}"},F$={light:{chip:{focusBackground:"{surface.300}",focusColor:"{surface.900}"},dropdown:{hoverBackground:"{surface.200}",activeBackground:"{surface.300}"}},dark:{chip:{focusBackground:"{surface.600}",focusColor:"{surface.0}"},dropdown:{hoverBackground:"{surface.700}",activeBackground:"{surface.600}"}}},z$={root:S$,overlay:L$,list:T$,option:N$,optionGroup:D$,dropdown:O$,chip:A$,emptyMessage:P$,colorScheme:F$},M$={width:"2rem",height:"2rem",fontSize:"1rem",background:"{content.hover.background}",color:"{content.color}",borderRadius:"{content.border.radius}"},W$={size:"1rem"},U$={borderColor:"{content.background}",offset:"-0.75rem"},q$={width:"3rem",height:"3rem",fontSize:"1.5rem",icon:{size:"1.5rem"},group:{offset:"-1rem"}},H$={width:"4rem",height:"4rem",fontSize:"2rem",icon:{size:"2rem"},group:{offset:"-1.5rem"}},j$={root:M$,icon:W$,group:U$,lg:q$,xl:H$},V$={borderRadius:"{border.radius.md}",padding:"0 0.5rem",fontSize:"0.75rem",fontWeight:"700",minWidth:"1.5rem",height:"1.5rem"},Y$={size:"0.5rem"},X$={fontSize:"0.625rem",minWidth:"1.25rem",height:"1.25rem"},G$={fontSize:"0.875rem",minWidth:"1.75rem",height:"1.75rem"},K$={fontSize:"1rem",minWidth:"2rem",height:"2rem"},J$={light:{primary:{background:"{primary.color}",color:"{primary.contrast.color}"},secondary:{background:"{surface.200}",color:"{surface.700}"},success:{background:"{green.600}",color:"{surface.0}"},info:{background:"{sky.600}",color:"{surface.0}"},warn:{background:"{orange.600}",color:"{surface.0}"},danger:{background:"{red.600}",color:"{surface.0}"},contrast:{background:"{surface.950}",color:"{surface.0}"}},dark:{primary:{background:"{primary.color}",color:"{primary.contrast.color}"},secondary:{background:"{surface.700}",color:"{surface.200}"},success:{background:"{green.500}",color:"{green.950}"},info:{background:"{sky.500}",color:"{sky.950}"},warn:{background:"{orange.500}",color:"{orange.950}"},danger:{background:"{red.500}",color:"{red.950}"},contrast:{background:"{surface.0}",color:"{surface.950}"}}},Q$={root:V$,dot:Y$,sm:X$,lg:G$,xl:K$,colorScheme:J$},Z$={borderRadius:{none:"0",xs:"2px",sm:"4px",md:"6px",lg:"8px",xl:"12px"},emerald:{50:"#ecfdf5",100:"#d1fae5",200:"#a7f3d0",300:"#6ee7b7",400:"#34d399",500:"#10b981",600:"#059669",700:"#047857",800:"#065f46",900:"#064e3b",950:"#022c22"},green:{50:"#f0fdf4",100:"#dcfce7",200:"#bbf7d0",300:"#86efac",400:"#4ade80",500:"#22c55e",600:"#16a34a",700:"#15803d",800:"#166534",900:"#14532d",950:"#052e16"},lime:{50:"#f7fee7",100:"#ecfccb",200:"#d9f99d",300:"#bef264",400:"#a3e635",500:"#84cc16",600:"#65a30d",700:"#4d7c0f",800:"#3f6212",900:"#365314",950:"#1a2e05"},red:{50:"#fef2f2",100:"#fee2e2",200:"#fecaca",300:"#fca5a5",400:"#f87171",500:"#ef4444",600:"#dc2626",700:"#b91c1c",800:"#991b1b",900:"#7f1d1d",950:"#450a0a"},orange:{50:"#fff7ed",100:"#ffedd5",200:"#fed7aa",300:"#fdba74",400:"#fb923c",500:"#f97316",600:"#ea580c",700:"#c2410c",800:"#9a3412",900:"#7c2d12",950:"#431407"},amber:{50:"#fffbeb",100:"#fef3c7",200:"#fde68a",300:"#fcd34d",400:"#fbbf24",500:"#f59e0b",600:"#d97706",700:"#b45309",800:"#92400e",900:"#78350f",950:"#451a03"},yellow:{50:"#fefce8",100:"#fef9c3",200:"#fef08a",300:"#fde047",400:"#facc15",500:"#eab308",600:"#ca8a04",700:"#a16207",800:"#854d0e",900:"#713f12",950:"#422006"},teal:{50:"#f0fdfa",100:"#ccfbf1",200:"#99f6e4",300:"#5eead4",400:"#2dd4bf",500:"#14b8a6",600:"#0d9488",700:"#0f766e",800:"#115e59",900:"#134e4a",950:"#042f2e"},cyan:{50:"#ecfeff",100:"#cffafe",200:"#a5f3fc",300:"#67e8f9",400:"#22d3ee",500:"#06b6d4",600:"#0891b2",700:"#0e7490",800:"#155e75",900:"#164e63",950:"#083344"},sky:{50:"#f0f9ff",100:"#e0f2fe",200:"#bae6fd",300:"#7dd3fc",400:"#38bdf8",500:"#0ea5e9",600:"#0284c7",700:"#0369a1",800:"#075985",900:"#0c4a6e",950:"#082f49"},blue:{50:"#eff6ff",100:"#dbeafe",200:"#bfdbfe",300:"#93c5fd",400:"#60a5fa",500:"#3b82f6",600:"#2563eb",700:"#1d4ed8",800:"#1e40af",900:"#1e3a8a",950:"#172554"},indigo:{50:"#eef2ff",100:"#e0e7ff",200:"#c7d2fe",300:"#a5b4fc",400:"#818cf8",500:"#6366f1",600:"#4f46e5",700:"#4338ca",800:"#3730a3",900:"#312e81",950:"#1e1b4b"},violet:{50:"#f5f3ff",100:"#ede9fe",200:"#ddd6fe",300:"#c4b5fd",400:"#a78bfa",500:"#8b5cf6",600:"#7c3aed",700:"#6d28d9",800:"#5b21b6",900:"#4c1d95",950:"#2e1065"},purple:{50:"#faf5ff",100:"#f3e8ff",200:"#e9d5ff",300:"#d8b4fe",400:"#c084fc",500:"#a855f7",600:"#9333ea",700:"#7e22ce",800:"#6b21a8",900:"#581c87",950:"#3b0764"},fuchsia:{50:"#fdf4ff",100:"#fae8ff",200:"#f5d0fe",300:"#f0abfc",400:"#e879f9",500:"#d946ef",600:"#c026d3",700:"#a21caf",800:"#86198f",900:"#701a75",950:"#4a044e"},pink:{50:"#fdf2f8",100:"#fce7f3",200:"#fbcfe8",300:"#f9a8d4",400:"#f472b6",500:"#ec4899",600:"#db2777",700:"#be185d",800:"#9d174d",900:"#831843",950:"#500724"},rose:{50:"#fff1f2",100:"#ffe4e6",200:"#fecdd3",300:"#fda4af",400:"#fb7185",500:"#f43f5e",600:"#e11d48",700:"#be123c",800:"#9f1239",900:"#881337",950:"#4c0519"},slate:{50:"#f8fafc",100:"#f1f5f9",200:"#e2e8f0",300:"#cbd5e1",400:"#94a3b8",500:"#64748b",600:"#475569",700:"#334155",800:"#1e293b",900:"#0f172a",950:"#020617"},gray:{50:"#f9fafb",100:"#f3f4f6",200:"#e5e7eb",300:"#d1d5db",400:"#9ca3af",500:"#6b7280",600:"#4b5563",700:"#374151",800:"#1f2937",900:"#111827",950:"#030712"},zinc:{50:"#fafafa",100:"#f4f4f5",200:"#e4e4e7",300:"#d4d4d8",400:"#a1a1aa",500:"#71717a",600:"#52525b",700:"#3f3f46",800:"#27272a",900:"#18181b",950:"#09090b"},neutral:{50:"#fafafa",100:"#f5f5f5",200:"#e5e5e5",300:"#d4d4d4",400:"#a3a3a3",500:"#737373",600:"#525252",700:"#404040",800:"#262626",900:"#171717",950:"#0a0a0a"},stone:{50:"#fafaf9",100:"#f5f5f4",200:"#e7e5e4",300:"#d6d3d1",400:"#a8a29e",500:"#78716c",600:"#57534e",700:"#44403c",800:"#292524",900:"#1c1917",950:"#0c0a09"}},o_={transitionDuration:"0s",focusRing:{width:"2px",style:"solid",color:"{primary.color}",offset:"2px",shadow:"none"},disabledOpacity:"0.6",iconSize:"1rem",anchorGutter:"0",primary:{50:"{emerald.50}",100:"{emerald.100}",200:"{emerald.200}",300:"{emerald.300}",400:"{emerald.400}",500:"{emerald.500}",600:"{emerald.600}",700:"{emerald.700}",800:"{emerald.800}",900:"{emerald.900}",950:"{emerald.950}"},formField:{paddingX:"0.75rem",paddingY:"0.5rem",sm:{fontSize:"0.875rem",paddingX:"0.625rem",paddingY:"0.375rem"},lg:{fontSize:"1.125rem",paddingX:"0.875rem",paddingY:"0.625rem"},borderRadius:"{border.radius.xs}",focusRing:{width:"2px",style:"solid",color:"{primary.color}",offset:"-1px",shadow:"none"},transitionDuration:"{transition.duration}"},list:{padding:"0.125rem 0",gap:"0",header:{padding:"0.5rem 0.75rem 0.375rem 0.75rem"},option:{padding:"0.5rem 0.75rem",borderRadius:"0"},optionGroup:{padding:"0.5rem 0.75rem",fontWeight:"700"}},content:{borderRadius:"{border.radius.xs}"},mask:{transitionDuration:"0.15s"},navigation:{list:{padding:"0.125rem 0",gap:"0"},item:{padding:"0.5rem 0.75rem",borderRadius:"0",gap:"0.5rem"},submenuLabel:{padding:"0.5rem 0.75rem",fontWeight:"700"},submenuIcon:{size:"0.875rem"}},overlay:{select:{borderRadius:"{border.radius.xs}",shadow:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -2px rgba(0, 0, 0, 0.1)"},popover:{borderRadius:"{border.radius.xs}",padding:"0.75rem",shadow:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -2px rgba(0, 0, 0, 0.1)"},modal:{borderRadius:"{border.radius.xs}",padding:"1.25rem",shadow:"0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 8px 10px -6px rgba(0, 0, 0, 0.1)"},navigation:{shadow:"0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -2px rgba(0, 0, 0, 0.1)"}},colorScheme:{light:{surface:{0:"#ffffff",50:"{slate.50}",100:"{slate.100}",200:"{slate.200}",300:"{slate.300}",400:"{slate.400}",500:"{slate.500}",600:"{slate.600}",700:"{slate.700}",800:"{slate.800}",900:"{slate.900}",950:"{slate.950}"},primary:{color:"{primary.600}",contrastColor:"#ffffff",hoverColor:"{primary.700}",activeColor:"{primary.800}"},highlight:{background:"{primary.600}",focusBackground:"{primary.700}",color:"#ffffff",focusColor:"#ffffff"},mask:{background:"rgba(0,0,0,0.4)",color:"{surface.200}"},formField:{background:"{surface.0}",disabledBackground:"{surface.300}",filledBackground:"{surface.100}",filledHoverBackground:"{surface.100}",filledFocusBackground:"{surface.100}",borderColor:"{surface.500}",hoverBorderColor:"{surface.500}",focusBorderColor:"{surface.500}",invalidBorderColor:"{red.500}",color:"{surface.900}",disabledColor:"{surface.600}",placeholderColor:"{surface.600}",invalidPlaceholderColor:"{red.600}",floatLabelColor:"{surface.600}",floatLabelFocusColor:"{primary.color}",floatLabelActiveColor:"{surface.600}",floatLabelInvalidColor:"{form.field.invalid.placeholder.color}",iconColor:"{surface.900}",shadow:"none"},text:{color:"{surface.900}",hoverColor:"{surface.950}",mutedColor:"{surface.600}",hoverMutedColor:"{surface.700}"},content:{background:"{surface.0}",hoverBackground:"{surface.200}",borderColor:"{surface.400}",color:"{text.color}",hoverColor:"{text.hover.color}"},overlay:{select:{background:"{surface.0}",borderColor:"transparent",color:"{text.color}"},popover:{background:"{surface.0}",borderColor:"transparent",color:"{text.color}"},modal:{background:"{surface.0}",borderColor:"transparent",color:"{text.color}"}},list:{option:{focusBackground:"{surface.200}",selectedBackground:"{highlight.background}",selectedFocusBackground:"{highlight.focus.background}",color:"{text.color}",focusColor:"{text.hover.color}",selectedColor:"{highlight.color}",selectedFocusColor:"{highlight.focus.color}",icon:{color:"{text.muted.color}",focusColor:"{text.hover.muted.color}"}},optionGroup:{background:"transparent",color:"{text.color}"}},navigation:{item:{focusBackground:"{primary.color}",activeBackground:"{surface.200}",color:"{text.color}",focusColor:"{primary.contrast.color}",activeColor:"{text.hover.color}",icon:{color:"{text.muted.color}",focusColor:"{primary.contrast.color}",activeColor:"{text.hover.muted.color}"}},submenuLabel:{background:"transparent",color:"{text.color}"},submenuIcon:{color:"{text.muted.color}",focusColor:"{primary.contrast.color}",activeColor:"{text.hover.muted.color}"}}},dark:{surface:{0:"#ffffff",50:"{zinc.50}",100:"{zinc.100}",200:"{zinc.200}",300:"{zinc.300}",400:"{zinc.400}",500:"{zinc.500}",600:"{zinc.600}",700:"{zinc.700}",800:"{zinc.800}",900:"{zinc.900}",950:"{zinc.950}"},primary:{color:"{primary.500}",contrastColor:"{surface.950}",hoverColor:"{primary.400}",activeColor:"{primary.300}"},highlight:{background:"{primary.500}",focusBackground:"{primary.400}",color:"{surface.950}",focusColor:"{surface.950}"},mask:{background:"rgba(0,0,0,0.6)",color:"{surface.200}"},formField:{background:"{surface.950}",disabledBackground:"{surface.700}",filledBackground:"{surface.800}",filledHoverBackground:"{surface.800}",filledFocusBackground:"{surface.800}",borderColor:"{surface.500}",hoverBorderColor:"{surface.500}",focusBorderColor:"{surface.500}",invalidBorderColor:"{red.400}",color:"{surface.0}",disabledColor:"{surface.400}",placeholderColor:"{surface.400}",invalidPlaceholderColor:"{red.400}",floatLabelColor:"{surface.400}",floatLabelFocusColor:"{primary.color}",floatLabelActiveColor:"{surface.400}",floatLabelInvalidColor:"{form.field.invalid.placeholder.color}",iconColor:"{surface.0}",shadow:"none"},text:{color:"{surface.0}",hoverColor:"{surface.0}",mutedColor:"{surface.400}",hoverMutedColor:"{surface.300}"},content:{background:"{surface.900}",hoverBackground:"{surface.700}",borderColor:"{surface.500}",color:"{text.color}",hoverColor:"{text.hover.color}"},overlay:{select:{background:"{surface.900}",borderColor:"{surface.700}",color:"{text.color}"},popover:{background:"{surface.900}",borderColor:"{surface.700}",color:"{text.color}"},modal:{background:"{surface.900}",borderColor:"{surface.700}",color:"{text.color}"}},list:{option:{focusBackground:"{surface.700}",selectedBackground:"{highlight.background}",selectedFocusBackground:"{highlight.focus.background}",color:"{text.color}",focusColor:"{text.hover.color}",selectedColor:"{highlight.color}",selectedFocusColor:"{highlight.focus.color}",icon:{color:"{text.muted.color}",focusColor:"{text.hover.muted.color}"}},optionGroup:{background:"transparent",color:"{text.color}"}},navigation:{item:{focusBackground:"{primary.color}",activeBackground:"{surface.700}",color:"{text.color}",focusColor:"{primary.contrast.color}",activeColor:"{text.color}",icon:{color:"{text.muted.color}",focusColor:"{primary.contrast.color}",activeColor:"{text.hover.muted.color}"}},submenuLabel:{background:"transparent",color:"{text.color}"},submenuIcon:{color:"{text.muted.color}",focusColor:"{primary.contrast.color}",activeColor:"{text.hover.muted.color}"}}}}},e_={primitive:Z$,semantic:o_},r_={borderRadius:"{content.border.radius}"},t_={root:r_},n_={padding:"1rem",background:"{content.background}",gap:"0.5rem",transitionDuration:"{transition.duration}"},a_={color:"{text.muted.color}",hoverColor:"{text.color}",borderRadius:"{content.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{text.muted.color}",hoverColor:"{text.color}"},focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},i_={color:"{navigation.item.icon.color}"},c_={root:n_,item:a_,separator:i_},l_={borderRadius:"{form.field.border.radius}",roundedBorderRadius:"2rem",gap:"0.5rem",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",iconOnlyWidth:"2.5rem",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}",iconOnlyWidth:"2rem"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}",iconOnlyWidth:"3rem"},label:{fontWeight:"700"},raisedShadow:"0 3px 1px -2px rgba(0, 0, 0, 0.2), 0 2px 2px 0 rgba(0, 0, 0, 0.14), 0 1px 5px 0 rgba(0, 0, 0, 0.12)",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",offset:"{focus.ring.offset}"},badgeSize:"1rem",transitionDuration:"{form.field.transition.duration}"},s_={light:{root:{primary:{background:"{primary.color}",hoverBackground:"{primary.hover.color}",activeBackground:"{primary.active.color}",borderColor:"{primary.color}",hoverBorderColor:"{primary.hover.color}",activeBorderColor:"{primary.active.color}",color:"{primary.contrast.color}",hoverColor:"{primary.contrast.color}",activeColor:"{primary.contrast.color}",focusRing:{color:"{primary.color}",shadow:"none"}},secondary:{background:"{surface.200}",hoverBackground:"{surface.300}",activeBackground:"{surface.400}",borderColor:"{surface.200}",hoverBorderColor:"{surface.300}",activeBorderColor:"{surface.400}",color:"{surface.700}",hoverColor:"{surface.800}",activeColor:"{surface.900}",focusRing:{color:"{surface.700}",shadow:"none"}},info:{background:"{sky.600}",hoverBackground:"{sky.700}",activeBackground:"{sky.800}",borderColor:"{sky.600}",hoverBorderColor:"{sky.700}",activeBorderColor:"{sky.800}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{sky.600}",shadow:"none"}},success:{background:"{green.600}",hoverBackground:"{green.700}",activeBackground:"{green.800}",borderColor:"{green.600}",hoverBorderColor:"{green.700}",activeBorderColor:"{green.800}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{green.600}",shadow:"none"}},warn:{background:"{orange.600}",hoverBackground:"{orange.700}",activeBackground:"{orange.800}",borderColor:"{orange.600}",hoverBorderColor:"{orange.700}",activeBorderColor:"{orange.800}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{orange.600}",shadow:"none"}},help:{background:"{purple.600}",hoverBackground:"{purple.700}",activeBackground:"{purple.800}",borderColor:"{purple.600}",hoverBorderColor:"{purple.700}",activeBorderColor:"{purple.800}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{purple.600}",shadow:"none"}},danger:{background:"{red.600}",hoverBackground:"{red.700}",activeBackground:"{red.800}",borderColor:"{red.600}",hoverBorderColor:"{red.700}",activeBorderColor:"{red.800}",color:"#ffffff",hoverColor:"#ffffff",activeColor:"#ffffff",focusRing:{color:"{red.600}",shadow:"none"}},contrast:{background:"{surface.950}",hoverBackground:"{surface.900}",activeBackground:"{surface.800}",borderColor:"{surface.950}",hoverBorderColor:"{surface.900}",activeBorderColor:"{surface.800}",color:"{surface.0}",hoverColor:"{surface.0}",activeColor:"{surface.0}",focusRing:{color:"{surface.950}",shadow:"none"}}},outlined:{primary:{hoverBackground:"{primary.50}",activeBackground:"{primary.100}",borderColor:"{primary.color}",color:"{primary.color}"},secondary:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",borderColor:"{surface.600}",color:"{surface.600}"},success:{hoverBackground:"{green.50}",activeBackground:"{green.100}",borderColor:"{green.600}",color:"{green.600}"},info:{hoverBackground:"{sky.50}",activeBackground:"{sky.100}",borderColor:"{sky.600}",color:"{sky.600}"},warn:{hoverBackground:"{orange.50}",activeBackground:"{orange.100}",borderColor:"{orange.600}",color:"{orange.600}"},help:{hoverBackground:"{purple.50}",activeBackground:"{purple.100}",borderColor:"{purple.600}",color:"{purple.600}"},danger:{hoverBackground:"{red.50}",activeBackground:"{red.100}",borderColor:"{red.600}",color:"{red.600}"},contrast:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",borderColor:"{surface.950}",color:"{surface.950}"},plain:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",borderColor:"{surface.900}",color:"{surface.900}"}},text:{primary:{hoverBackground:"{primary.50}",activeBackground:"{primary.100}",color:"{primary.color}"},secondary:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",color:"{surface.600}"},success:{hoverBackground:"{green.50}",activeBackground:"{green.100}",color:"{green.600}"},info:{hoverBackground:"{sky.50}",activeBackground:"{sky.100}",color:"{sky.600}"},warn:{hoverBackground:"{orange.50}",activeBackground:"{orange.100}",color:"{orange.600}"},help:{hoverBackground:"{purple.50}",activeBackground:"{purple.100}",color:"{purple.600}"},danger:{hoverBackground:"{red.50}",activeBackground:"{red.100}",color:"{red.600}"},contrast:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",color:"{surface.950}"},plain:{hoverBackground:"{surface.50}",activeBackground:"{surface.100}",color:"{surface.900}"}},link:{color:"{primary.color}",hoverColor:"{primary.color}",activeColor:"{primary.color}"}},dark:{root:{primary:{background:"{primary.color}",hoverBackground:"{primary.hover.color}",activeBackground:"{primary.active.color}",borderColor:"{primary.color}",hoverBorderColor:"{primary.hover.color}",activeBorderColor:"{primary.active.color}",color:"{primary.contrast.color}",hoverColor:"{primary.contrast.color}",activeColor:"{primary.contrast.color}",focusRing:{color:"{primary.color}",shadow:"none"}},secondary:{background:"{surface.700}",hoverBackground:"{surface.600}",activeBackground:"{surface.500}",borderColor:"{surface.700}",hoverBorderColor:"{surface.600}",activeBorderColor:"{surface.500}",color:"{surface.200}",hoverColor:"{surface.100}",activeColor:"{surface.0}",focusRing:{color:"{surface.200}",shadow:"none"}},info:{background:"{sky.500}",hoverBackground:"{sky.400}",activeBackground:"{sky.300}",borderColor:"{sky.500}",hoverBorderColor:"{sky.400}",activeBorderColor:"{sky.300}",color:"{sky.950}",hoverColor:"{sky.950}",activeColor:"{sky.950}",focusRing:{color:"{sky.500}",shadow:"none"}},success:{background:"{green.500}",hoverBackground:"{green.400}",activeBackground:"{green.300}",borderColor:"{green.500}",hoverBorderColor:"{green.400}",activeBorderColor:"{green.300}",color:"{green.950}",hoverColor:"{green.950}",activeColor:"{green.950}",focusRing:{color:"{green.500}",shadow:"none"}},warn:{background:"{orange.500}",hoverBackground:"{orange.400}",activeBackground:"{orange.300}",borderColor:"{orange.500}",hoverBorderColor:"{orange.400}",activeBorderColor:"{orange.300}",color:"{orange.950}",hoverColor:"{orange.950}",activeColor:"{orange.950}",focusRing:{color:"{orange.500}",shadow:"none"}},help:{background:"{purple.500}",hoverBackground:"{purple.400}",activeBackground:"{purple.300}",borderColor:"{purple.500}",hoverBorderColor:"{purple.400}",activeBorderColor:"{purple.300}",color:"{purple.950}",hoverColor:"{purple.950}",activeColor:"{purple.950}",focusRing:{color:"{purple.500}",shadow:"none"}},danger:{background:"{red.500}",hoverBackground:"{red.400}",activeBackground:"{red.300}",borderColor:"{red.500}",hoverBorderColor:"{red.400}",activeBorderColor:"{red.300}",color:"{red.950}",hoverColor:"{red.950}",activeColor:"{red.950}",focusRing:{color:"{red.500}",shadow:"none"}},contrast:{background:"{surface.0}",hoverBackground:"{surface.100}",activeBackground:"{surface.200}",borderColor:"{surface.0}",hoverBorderColor:"{surface.100}",activeBorderColor:"{surface.200}",color:"{surface.950}",hoverColor:"{surface.950}",activeColor:"{surface.950}",focusRing:{color:"{surface.0}",shadow:"none"}}},outlined:{primary:{hoverBackground:"color-mix(in srgb, {primary.color}, transparent 96%)",activeBackground:"color-mix(in srgb, {primary.color}, transparent 84%)",borderColor:"{primary.color}",color:"{primary.color}"},secondary:{hoverBackground:"rgba(255,255,255,0.04)",activeBackground:"rgba(255,255,255,0.16)",borderColor:"{surface.400}",color:"{surface.400}"},success:{hoverBackground:"{green.950}",activeBackground:"{green.900}",borderColor:"{green.500}",color:"{green.500}"},info:{hoverBackground:"{sky.950}",activeBackground:"{sky.900}",borderColor:"{sky.500}",color:"{sky.500}"},warn:{hoverBackground:"{orange.950}",activeBackground:"{orange.900}",borderColor:"{orange.500}",color:"{orange.500}"},help:{hoverBackground:"{purple.950}",activeBackground:"{purple.900}",borderColor:"{purple.500}",color:"{purple.500}"},danger:{hoverBackground:"{red.950}",activeBackground:"{red.900}",borderColor:"{red.500}",color:"{red.500}"},contrast:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",borderColor:"{surface.0}",color:"{surface.0}"},plain:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",borderColor:"{surface.0}",color:"{surface.0}"}},text:{primary:{hoverBackground:"color-mix(in srgb, {primary.color}, transparent 96%)",activeBackground:"color-mix(in srgb, {primary.color}, transparent 84%)",color:"{primary.color}"},secondary:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",color:"{surface.400}"},success:{hoverBackground:"color-mix(in srgb, {green.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {green.400}, transparent 84%)",color:"{green.500}"},info:{hoverBackground:"color-mix(in srgb, {sky.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {sky.400}, transparent 84%)",color:"{sky.500}"},warn:{hoverBackground:"color-mix(in srgb, {orange.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {orange.400}, transparent 84%)",color:"{orange.500}"},help:{hoverBackground:"color-mix(in srgb, {purple.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {purple.400}, transparent 84%)",color:"{purple.500}"},danger:{hoverBackground:"color-mix(in srgb, {red.400}, transparent 96%)",activeBackground:"color-mix(in srgb, {red.400}, transparent 84%)",color:"{red.500}"},contrast:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",color:"{surface.0}"},plain:{hoverBackground:"{surface.800}",activeBackground:"{surface.700}",color:"{surface.0}"}},link:{color:"{primary.color}",hoverColor:"{primary.color}",activeColor:"{primary.color}"}}},d_={root:l_,colorScheme:s_},u_={background:"{content.background}",borderRadius:"{border.radius.sm}",color:"{content.color}",shadow:"0 1px 4px 0 rgba(0, 0, 0, 0.1)"},f_={padding:"1.25rem",gap:"0.5rem"},g_={gap:"0.5rem"},m_={fontSize:"1.25rem",fontWeight:"500"},p_={color:"{text.muted.color}"},b_={root:u_,body:f_,caption:g_,title:m_,subtitle:p_},h_={transitionDuration:"{transition.duration}"},v_={gap:"0.25rem"},k_={padding:"1rem",gap:"0.5rem"},y_={width:"2rem",height:"0.5rem",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},C_={light:{indicator:{background:"{surface.300}",hoverBackground:"{surface.400}",activeBackground:"{primary.color}"}},dark:{indicator:{background:"{surface.600}",hoverBackground:"{surface.500}",activeBackground:"{primary.color}"}}},w_={root:h_,content:v_,indicatorList:k_,indicator:y_,colorScheme:C_},$_={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},__={width:"2.5rem",color:"{form.field.icon.color}"},x_={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},B_={padding:"{list.padding}",gap:"{list.gap}",mobileIndent:"1rem"},R_={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}",icon:{color:"{list.option.icon.color}",focusColor:"{list.option.icon.focus.color}",size:"0.875rem"}},E_={color:"{form.field.icon.color}"},I_={root:$_,dropdown:__,overlay:x_,list:B_,option:R_,clearIcon:E_},S_={borderRadius:"{border.radius.xs}",width:"1.25rem",height:"1.25rem",background:"{form.field.background}",checkedBackground:"{primary.color}",checkedHoverBackground:"{primary.hover.color}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.border.color}",checkedBorderColor:"{primary.color}",checkedHoverBorderColor:"{primary.hover.color}",checkedFocusBorderColor:"{primary.color}",checkedDisabledBorderColor:"{form.field.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",shadow:"{form.field.shadow}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{width:"1rem",height:"1rem"},lg:{width:"1.5rem",height:"1.5rem"}},L_={size:"0.875rem",color:"{form.field.color}",checkedColor:"{primary.contrast.color}",checkedHoverColor:"{primary.contrast.color}",disabledColor:"{form.field.disabled.color}",sm:{size:"0.75rem"},lg:{size:"1rem"}},T_={root:S_,icon:L_},N_={borderRadius:"16px",paddingX:"0.75rem",paddingY:"0.5rem",gap:"0.5rem",transitionDuration:"{transition.duration}"},D_={width:"2rem",height:"2rem"},O_={size:"1rem"},A_={size:"1rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"}},P_={light:{root:{background:"{surface.200}",color:"{surface.900}"},icon:{color:"{surface.900}"},removeIcon:{color:"{surface.900}"}},dark:{root:{background:"{surface.700}",color:"{surface.0}"},icon:{color:"{surface.0}"},removeIcon:{color:"{surface.0}"}}},F_={root:N_,image:D_,icon:O_,removeIcon:A_,colorScheme:P_},z_={transitionDuration:"{transition.duration}"},M_={width:"1.5rem",height:"1.5rem",borderRadius:"{form.field.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},W_={shadow:"{overlay.popover.shadow}",borderRadius:"{overlay.popover.borderRadius}"},U_={light:{panel:{background:"{surface.800}",borderColor:"{surface.900}"},handle:{color:"{surface.0}"}},dark:{panel:{background:"{surface.900}",borderColor:"{surface.700}"},handle:{color:"{surface.0}"}}},q_={root:z_,preview:M_,panel:W_,colorScheme:U_},H_={size:"2rem",color:"{overlay.modal.color}"},j_={gap:"1rem"},V_={icon:H_,content:j_},Y_={background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",color:"{overlay.popover.color}",borderRadius:"{overlay.popover.border.radius}",shadow:"{overlay.popover.shadow}",gutter:"10px",arrowOffset:"1.25rem"},X_={padding:"{overlay.popover.padding}",gap:"1rem"},G_={size:"1.5rem",color:"{overlay.popover.color}"},K_={gap:"0.5rem",padding:"0 {overlay.popover.padding} {overlay.popover.padding} {overlay.popover.padding}"},J_={root:Y_,content:X_,icon:G_,footer:K_},Q_={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",transitionDuration:"{transition.duration}"},Z_={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},ox={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},ex={mobileIndent:"1rem"},rx={size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"},tx={borderColor:"{content.border.color}"},nx={root:Q_,list:Z_,item:ox,submenu:ex,submenuIcon:rx,separator:tx},ax={transitionDuration:"{transition.duration}"},ix={background:"{content.background}",borderColor:"{datatable.border.color}",color:"{content.color}",borderWidth:"1px 0 1px 0",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},cx={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",borderColor:"{datatable.border.color}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",gap:"0.5rem",padding:"0.75rem 1rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"},sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},lx={fontWeight:"700"},sx={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},dx={borderColor:"{datatable.border.color}",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},ux={background:"{content.background}",borderColor:"{datatable.border.color}",color:"{content.color}",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},fx={fontWeight:"700"},gx={background:"{content.background}",borderColor:"{datatable.border.color}",color:"{content.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem",sm:{padding:"0.375rem 0.5rem"},lg:{padding:"1rem 1.25rem"}},mx={color:"{primary.color}"},px={width:"0.5rem"},bx={width:"1px",color:"{primary.color}"},hx={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",size:"0.875rem"},vx={size:"2rem"},kx={hoverBackground:"{content.hover.background}",selectedHoverBackground:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}",selectedHoverColor:"{primary.color}",size:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},yx={inlineGap:"0.5rem",overlaySelect:{background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},overlayPopover:{background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",borderRadius:"{overlay.popover.border.radius}",color:"{overlay.popover.color}",shadow:"{overlay.popover.shadow}",padding:"{overlay.popover.padding}",gap:"0.5rem"},rule:{borderColor:"{content.border.color}"},constraintList:{padding:"{list.padding}",gap:"{list.gap}"},constraint:{focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",separator:{borderColor:"{content.border.color}"},padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"}},Cx={borderColor:"{datatable.border.color}",borderWidth:"0 0 1px 0"},wx={borderColor:"{datatable.border.color}",borderWidth:"0 0 1px 0"},$x={light:{root:{borderColor:"{surface.300}"},row:{stripedBackground:"{surface.50}"},bodyCell:{selectedBorderColor:"{primary.100}"}},dark:{root:{borderColor:"{surface.600}"},row:{stripedBackground:"{surface.950}"},bodyCell:{selectedBorderColor:"{primary.900}"}}},_x={root:ax,header:ix,headerCell:cx,columnTitle:lx,row:sx,bodyCell:dx,footerCell:ux,columnFooter:fx,footer:gx,dropPoint:mx,columnResizer:px,resizeIndicator:bx,sortIcon:hx,loadingIcon:vx,rowToggleButton:kx,filter:yx,paginatorTop:Cx,paginatorBottom:wx,colorScheme:$x},xx={borderColor:"transparent",borderWidth:"0",borderRadius:"0",padding:"0"},Bx={background:"{content.background}",color:"{content.color}",borderColor:"{content.border.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem",borderRadius:"0"},Rx={background:"{content.background}",color:"{content.color}",borderColor:"transparent",borderWidth:"0",padding:"0",borderRadius:"0"},Ex={background:"{content.background}",color:"{content.color}",borderColor:"{content.border.color}",borderWidth:"1px 0 0 0",padding:"0.75rem 1rem",borderRadius:"0"},Ix={borderColor:"{content.border.color}",borderWidth:"0 0 1px 0"},Sx={borderColor:"{content.border.color}",borderWidth:"1px 0 0 0"},Lx={root:xx,header:Bx,content:Rx,footer:Ex,paginatorTop:Ix,paginatorBottom:Sx},Tx={transitionDuration:"{transition.duration}"},Nx={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.popover.shadow}",padding:"{overlay.popover.padding}"},Dx={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",padding:"0 0 0.5rem 0"},Ox={gap:"0.5rem",fontWeight:"500"},Ax={width:"2.5rem",sm:{width:"2rem"},lg:{width:"3rem"},background:"{form.field.background}",color:"{form.field.icon.color}",hoverColor:"{form.field.icon.color}",activeColor:"{form.field.icon.color}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Px={color:"{form.field.icon.color}"},Fx={hoverBackground:"{content.hover.background}",color:"{content.color}",hoverColor:"{content.hover.color}",padding:"0.25rem 0.5rem"},zx={hoverBackground:"{content.hover.background}",color:"{content.color}",hoverColor:"{content.hover.color}",padding:"0.25rem 0.5rem"},Mx={borderColor:"{content.border.color}",gap:"{overlay.popover.padding}"},Wx={margin:"0.5rem 0 0 0"},Ux={padding:"0.25rem",fontWeight:"500",color:"{content.color}"},qx={hoverBackground:"{content.hover.background}",selectedBackground:"{primary.color}",rangeSelectedBackground:"{highlight.background}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{primary.contrast.color}",rangeSelectedColor:"{highlight.color}",width:"2rem",height:"2rem",borderRadius:"50%",padding:"0.25rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Hx={margin:"0.5rem 0 0 0"},jx={padding:"0.375rem",borderRadius:"{content.border.radius}"},Vx={margin:"0.5rem 0 0 0"},Yx={padding:"0.375rem",borderRadius:"{content.border.radius}"},Xx={padding:"0.5rem 0 0 0",borderColor:"{content.border.color}"},Gx={padding:"0.5rem 0 0 0",borderColor:"{content.border.color}",gap:"0.5rem",buttonGap:"0.25rem"},Kx={light:{dropdown:{hoverBackground:"{surface.200}",activeBackground:"{surface.300}"},today:{background:"{surface.200}",color:"{surface.900}"}},dark:{dropdown:{hoverBackground:"{surface.700}",activeBackground:"{surface.600}"},today:{background:"{surface.700}",color:"{surface.0}"}}},Jx={root:Tx,panel:Nx,header:Dx,title:Ox,dropdown:Ax,inputIcon:Px,selectMonth:Fx,selectYear:zx,group:Mx,dayView:Wx,weekDay:Ux,date:qx,monthView:Hx,month:jx,yearView:Vx,year:Yx,buttonbar:Xx,timePicker:Gx,colorScheme:Kx},Qx={background:"{overlay.modal.background}",borderColor:"{overlay.modal.border.color}",color:"{overlay.modal.color}",borderRadius:"{overlay.modal.border.radius}",shadow:"{overlay.modal.shadow}"},Zx={padding:"{overlay.modal.padding}",gap:"0.5rem"},o4={fontSize:"1.25rem",fontWeight:"700"},e4={padding:"0 {overlay.modal.padding} {overlay.modal.padding} {overlay.modal.padding}"},r4={padding:"0 {overlay.modal.padding} {overlay.modal.padding} {overlay.modal.padding}",gap:"0.5rem"},t4={root:Qx,header:Zx,title:o4,content:e4,footer:r4},n4={borderColor:"{content.border.color}"},a4={background:"{content.background}",color:"{text.color}"},i4={margin:"1rem 0",padding:"0 1rem",content:{padding:"0 0.5rem"}},c4={margin:"0 1rem",padding:"0.5rem 0",content:{padding:"0.5rem 0"}},l4={root:n4,content:a4,horizontal:i4,vertical:c4},s4={background:"rgba(255, 255, 255, 0.1)",borderColor:"rgba(255, 255, 255, 0.2)",padding:"0.5rem",borderRadius:"{border.radius.xl}"},d4={borderRadius:"{content.border.radius}",padding:"0.5rem",size:"3rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},u4={root:s4,item:d4},f4={background:"{overlay.modal.background}",borderColor:"{overlay.modal.border.color}",color:"{overlay.modal.color}",shadow:"{overlay.modal.shadow}"},g4={padding:"{overlay.modal.padding}"},m4={fontSize:"1.5rem",fontWeight:"700"},p4={padding:"0 {overlay.modal.padding} {overlay.modal.padding} {overlay.modal.padding}"},b4={padding:"{overlay.modal.padding}"},h4={root:f4,header:g4,title:m4,content:p4,footer:b4},v4={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}"},k4={color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}"},y4={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}",padding:"{list.padding}"},C4={focusBackground:"{list.option.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},w4={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}"},$4={toolbar:v4,toolbarItem:k4,overlay:y4,overlayOption:C4,content:w4},_4={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",padding:"0.75rem 1.125rem 1.125rem 1.125rem",transitionDuration:"{transition.duration}"},x4={background:"{content.background}",hoverBackground:"{content.hover.background}",color:"{content.color}",hoverColor:"{content.hover.color}",borderRadius:"{content.border.radius}",borderWidth:"1px",borderColor:"{content.border.color}",padding:"0.5rem 0.75rem",gap:"0.5rem",fontWeight:"700",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},B4={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}"},R4={padding:"0"},E4={root:_4,legend:x4,toggleIcon:B4,content:R4},I4={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",transitionDuration:"{transition.duration}"},S4={background:"transparent",color:"{text.color}",padding:"1.125rem",borderColor:"unset",borderWidth:"0",borderRadius:"0",gap:"0.5rem"},L4={highlightBorderColor:"{primary.color}",padding:"0 1.125rem 1.125rem 1.125rem",gap:"1rem"},T4={padding:"1rem",gap:"1rem",borderColor:"{content.border.color}",info:{gap:"0.5rem"}},N4={gap:"0.5rem"},D4={height:"0.25rem"},O4={gap:"0.5rem"},A4={root:I4,header:S4,content:L4,file:T4,fileList:N4,progressbar:D4,basic:O4},P4={color:"{form.field.float.label.color}",focusColor:"{form.field.float.label.focus.color}",activeColor:"{form.field.float.label.active.color}",invalidColor:"{form.field.float.label.invalid.color}",transitionDuration:"0.2s",positionX:"{form.field.padding.x}",positionY:"{form.field.padding.y}",fontWeight:"500",active:{fontSize:"0.75rem",fontWeight:"400"}},F4={active:{top:"-1.25rem"}},z4={input:{paddingTop:"1.5rem",paddingBottom:"{form.field.padding.y}"},active:{top:"{form.field.padding.y}"}},M4={borderRadius:"{border.radius.xs}",active:{background:"{form.field.background}",padding:"0 0.125rem"}},W4={root:P4,over:F4,in:z4,on:M4},U4={borderWidth:"1px",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",transitionDuration:"{transition.duration}"},q4={background:"rgba(255, 255, 255, 0.1)",hoverBackground:"rgba(255, 255, 255, 0.2)",color:"{surface.100}",hoverColor:"{surface.0}",size:"3rem",gutter:"0.5rem",prev:{borderRadius:"50%"},next:{borderRadius:"50%"},focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},H4={size:"1.5rem"},j4={background:"{content.background}",padding:"1rem 0.25rem"},V4={size:"2rem",borderRadius:"{content.border.radius}",gutter:"0.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Y4={size:"1rem"},X4={background:"rgba(0, 0, 0, 0.5)",color:"{surface.100}",padding:"1rem"},G4={gap:"0.5rem",padding:"1rem"},K4={width:"1rem",height:"1rem",activeBackground:"{primary.color}",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},J4={background:"rgba(0, 0, 0, 0.5)"},Q4={background:"rgba(255, 255, 255, 0.4)",hoverBackground:"rgba(255, 255, 255, 0.6)",activeBackground:"rgba(255, 255, 255, 0.9)"},Z4={size:"3rem",gutter:"0.5rem",background:"rgba(255, 255, 255, 0.1)",hoverBackground:"rgba(255, 255, 255, 0.2)",color:"{surface.50}",hoverColor:"{surface.0}",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},oB={size:"1.5rem"},eB={light:{thumbnailNavButton:{hoverBackground:"{surface.200}",color:"{text.color}",hoverColor:"{text.hover.color}"},indicatorButton:{background:"{surface.300}",hoverBackground:"{surface.400}"}},dark:{thumbnailNavButton:{hoverBackground:"{surface.700}",color:"{surface.0}",hoverColor:"{surface.0}"},indicatorButton:{background:"{surface.600}",hoverBackground:"{surface.500}"}}},rB={root:U4,navButton:q4,navIcon:H4,thumbnailsContent:j4,thumbnailNavButton:V4,thumbnailNavButtonIcon:Y4,caption:X4,indicatorList:G4,indicatorButton:K4,insetIndicatorList:J4,insetIndicatorButton:Q4,closeButton:Z4,closeButtonIcon:oB,colorScheme:eB},tB={color:"{form.field.icon.color}"},nB={icon:tB},aB={color:"{form.field.float.label.color}",focusColor:"{form.field.float.label.focus.color}",invalidColor:"{form.field.float.label.invalid.color}",transitionDuration:"0.2s",positionX:"{form.field.padding.x}",top:"{form.field.padding.y}",fontSize:"0.75rem",fontWeight:"400"},iB={paddingTop:"1.5rem",paddingBottom:"{form.field.padding.y}"},cB={root:aB,input:iB},lB={transitionDuration:"{transition.duration}"},sB={icon:{size:"1.5rem"},mask:{background:"{mask.background}",color:"{mask.color}"}},dB={position:{left:"auto",right:"1rem",top:"1rem",bottom:"auto"},blur:"8px",background:"rgba(255,255,255,0.1)",borderColor:"rgba(255,255,255,0.2)",borderWidth:"1px",borderRadius:"{content.border.radius}",padding:".5rem",gap:"0.5rem"},uB={hoverBackground:"rgba(255,255,255,0.1)",color:"{surface.50}",hoverColor:"{surface.0}",size:"3rem",iconSize:"1.5rem",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},fB={root:lB,preview:sB,toolbar:dB,action:uB},gB={size:"15px",hoverSize:"30px",background:"rgba(255,255,255,0.3)",hoverBackground:"rgba(255,255,255,0.3)",borderColor:"rgba(255,255,255,0.3)",hoverBorderColor:"rgba(255,255,255,0.3)",borderWidth:"3px",borderRadius:"{content.border.radius}",transitionDuration:"0.2s",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"rgba(255,255,255,0.3)",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},mB={handle:gB},pB={padding:"{form.field.padding.y} {form.field.padding.x}",borderRadius:"{content.border.radius}",gap:"0.5rem"},bB={fontWeight:"700"},hB={size:"1rem"},vB={light:{info:{background:"{blue.800}",borderColor:"{blue.800}",color:"{blue.50}",shadow:"none"},success:{background:"{green.800}",borderColor:"{green.800}",color:"{green.50}",shadow:"none"},warn:{background:"{yellow.600}",borderColor:"{yellow.600}",color:"{yellow.50}",shadow:"none"},error:{background:"{red.800}",borderColor:"{red.800}",color:"{red.50}",shadow:"none"},secondary:{background:"{surface.200}",borderColor:"{surface.200}",color:"{surface.700}",shadow:"none"},contrast:{background:"{surface.900}",borderColor:"{surface.900}",color:"{surface.50}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)"}},dark:{info:{background:"{blue.200}",borderColor:"{blue.200}",color:"{blue.950}",shadow:"none"},success:{background:"{green.200}",borderColor:"{green.200}",color:"{green.950}",shadow:"none"},warn:{background:"{yellow.200}",borderColor:"{yellow.200}",color:"{yellow.950}",shadow:"none"},error:{background:"{red.200}",borderColor:"{red.200}",color:"{red.950}",shadow:"none"},secondary:{background:"{surface.700}",borderColor:"{surface.700}",color:"{surface.200}",shadow:"none"},contrast:{background:"{surface.0}",borderColor:"{surface.0}",color:"{surface.950}",shadow:"none"}}},kB={root:pB,text:bB,icon:hB,colorScheme:vB},yB={padding:"{form.field.padding.y} {form.field.padding.x}",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{transition.duration}"},CB={hoverBackground:"{content.hover.background}",hoverColor:"{content.hover.color}"},wB={root:yB,display:CB},$B={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}"},_B={borderRadius:"{border.radius.xs}"},xB={light:{chip:{focusBackground:"{surface.300}",color:"{surface.900}"}},dark:{chip:{focusBackground:"{surface.600}",color:"{surface.0}"}}},BB={root:$B,chip:_B,colorScheme:xB},RB={background:"{form.field.background}",borderColor:"{form.field.border.color}",color:"{form.field.icon.color}",borderRadius:"{form.field.border.radius}",padding:"0.5rem",minWidth:"2.5rem"},EB={addon:RB},IB={transitionDuration:"{transition.duration}"},SB={background:"transparent",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",activeBorderColor:"{form.field.border.color}",color:"{form.field.icon.color}",hoverColor:"{form.field.icon.color}",activeColor:"{form.field.icon.color}",width:"2.5rem",borderRadius:"{form.field.border.radius}",verticalPadding:"{form.field.padding.y}"},LB={light:{button:{hoverBackground:"{surface.200}",activeBackground:"{surface.300}"}},dark:{button:{hoverBackground:"{surface.700}",activeBackground:"{surface.600}"}}},TB={root:IB,button:SB,colorScheme:LB},NB={gap:"0.5rem"},DB={width:"2.5rem",sm:{width:"2rem"},lg:{width:"3rem"}},OB={root:NB,input:DB},AB={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},PB={root:AB},FB={transitionDuration:"{transition.duration}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},zB={background:"{primary.color}"},MB={color:"{text.muted.color}"},WB={light:{range:{background:"{surface.300}"}},dark:{range:{background:"{surface.600}"}}},UB={root:FB,value:zB,text:MB,colorScheme:WB},qB={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",borderColor:"{form.field.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",shadow:"{form.field.shadow}",borderRadius:"{form.field.border.radius}",transitionDuration:"{form.field.transition.duration}"},HB={padding:"{list.padding}",gap:"{list.gap}",header:{padding:"{list.header.padding}"}},jB={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},VB={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},YB={color:"{list.option.color}",gutterStart:"-0.375rem",gutterEnd:"0.375rem"},XB={padding:"{list.option.padding}"},GB={light:{option:{stripedBackground:"{surface.100}"}},dark:{option:{stripedBackground:"{surface.800}"}}},KB={root:qB,list:HB,option:jB,optionGroup:VB,checkmark:YB,emptyMessage:XB,colorScheme:GB},JB={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",gap:"0.5rem",verticalOrientation:{padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},horizontalOrientation:{padding:"0.5rem 0.75rem",gap:"0.5rem"},transitionDuration:"{transition.duration}"},QB={borderRadius:"{content.border.radius}",padding:"{navigation.item.padding}"},ZB={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},oR={padding:"0",background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",shadow:"{overlay.navigation.shadow}",gap:"0.5rem"},eR={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},rR={padding:"{navigation.submenu.label.padding}",fontWeight:"{navigation.submenu.label.font.weight}",background:"{navigation.submenu.label.background.}",color:"{navigation.submenu.label.color}"},tR={size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"},nR={borderColor:"{content.border.color}"},aR={borderRadius:"50%",size:"1.75rem",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",hoverBackground:"{content.hover.background}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},iR={root:JB,baseItem:QB,item:ZB,overlay:oR,submenu:eR,submenuLabel:rR,submenuIcon:tR,separator:nR,mobileButton:aR},cR={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",transitionDuration:"{transition.duration}"},lR={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},sR={focusBackground:"{navigation.item.focus.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}"}},dR={padding:"{navigation.submenu.label.padding}",fontWeight:"{navigation.submenu.label.font.weight}",background:"{navigation.submenu.label.background.}",color:"{navigation.submenu.label.color}"},uR={borderColor:"{content.border.color}"},fR={root:cR,list:lR,item:sR,submenuLabel:dR,separator:uR},gR={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",gap:"0.5rem",padding:"0.5rem 0.75rem",transitionDuration:"{transition.duration}"},mR={borderRadius:"{content.border.radius}",padding:"{navigation.item.padding}"},pR={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},bR={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}",background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",mobileIndent:"1rem",icon:{size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"}},hR={borderColor:"{content.border.color}"},vR={borderRadius:"50%",size:"1.75rem",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",hoverBackground:"{content.hover.background}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},kR={root:gR,baseItem:mR,item:pR,submenu:bR,separator:hR,mobileButton:vR},yR={borderRadius:"{content.border.radius}",borderWidth:"1px",transitionDuration:"{transition.duration}"},CR={padding:"0.5rem 0.75rem",gap:"0.5rem",sm:{padding:"0.375rem 0.625rem"},lg:{padding:"0.625rem 0.875rem"}},wR={fontSize:"1rem",fontWeight:"700",sm:{fontSize:"0.875rem"},lg:{fontSize:"1.125rem"}},$R={size:"1.125rem",sm:{size:"1rem"},lg:{size:"1.25rem"}},_R={width:"1.75rem",height:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",offset:"{focus.ring.offset}"}},xR={size:"1rem",sm:{size:"0.875rem"},lg:{size:"1.125rem"}},BR={root:{borderWidth:"1px"}},RR={content:{padding:"0"}},ER={light:{info:{background:"{blue.800}",borderColor:"{blue.800}",color:"{blue.50}",shadow:"none",closeButton:{hoverBackground:"{blue.600}",focusRing:{color:"{blue.50}",shadow:"none"}},outlined:{color:"{blue.800}",borderColor:"{blue.800}"},simple:{color:"{blue.800}"}},success:{background:"{green.800}",borderColor:"{green.800}",color:"{green.50}",shadow:"none",closeButton:{hoverBackground:"{green.600}",focusRing:{color:"{green.50}",shadow:"none"}},outlined:{color:"{green.800}",borderColor:"{green.800}"},simple:{color:"{green.800}"}},warn:{background:"{yellow.600}",borderColor:"{yellow.600}",color:"{yellow.50}",shadow:"none",closeButton:{hoverBackground:"{yellow.400}",focusRing:{color:"{yellow.50}",shadow:"none"}},outlined:{color:"{yellow.600}",borderColor:"{yellow.600}"},simple:{color:"{yellow.600}"}},error:{background:"{red.800}",borderColor:"{red.800}",color:"{red.50}",shadow:"none",closeButton:{hoverBackground:"{red.600}",focusRing:{color:"{red.50}",shadow:"none"}},outlined:{color:"{red.800}",borderColor:"{red.800}"},simple:{color:"{red.800}"}},secondary:{background:"{surface.200}",borderColor:"{surface.200}",color:"{surface.700}",shadow:"none",closeButton:{hoverBackground:"{surface.50}",focusRing:{color:"{surface.700}",shadow:"none"}},outlined:{color:"{surface.600}",borderColor:"{surface.600}"},simple:{color:"{surface.600}"}},contrast:{background:"{surface.900}",borderColor:"{surface.900}",color:"{surface.50}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)",closeButton:{hoverBackground:"{surface.700}",focusRing:{color:"{surface.50}",shadow:"none"}},outlined:{color:"{surface.900}",borderColor:"{surface.900}"},simple:{color:"{surface.900}"}}},dark:{info:{background:"{blue.200}",borderColor:"{blue.200}",color:"{blue.950}",shadow:"none",closeButton:{hoverBackground:"{blue.50}",focusRing:{color:"{blue.950}",shadow:"none"}},outlined:{color:"{blue.200}",borderColor:"{blue.200}"},simple:{color:"{blue.200}"}},success:{background:"{green.200}",borderColor:"{green.200}",color:"{green.950}",shadow:"none",closeButton:{hoverBackground:"{green.50}",focusRing:{color:"{green.950}",shadow:"none"}},outlined:{color:"{green.200}",borderColor:"{green.200}"},simple:{color:"{green.200}"}},warn:{background:"{yellow.200}",borderColor:"{yellow.200}",color:"{yellow.950}",shadow:"none",closeButton:{hoverBackground:"{yellow.50}",focusRing:{color:"{yellow.950}",shadow:"none"}},outlined:{color:"{yellow.200}",borderColor:"{yellow.200}"},simple:{color:"{yellow.200}"}},error:{background:"{red.200}",borderColor:"{red.200}",color:"{red.950}",shadow:"none",closeButton:{hoverBackground:"{red.50}",focusRing:{color:"{red.950}",shadow:"none"}},outlined:{color:"{red.200}",borderColor:"{red.200}"},simple:{color:"{red.200}"}},secondary:{background:"{surface.700}",borderColor:"{surface.700}",color:"{surface.200}",shadow:"none",closeButton:{hoverBackground:"{surface.500}",focusRing:{color:"{surface.200}",shadow:"none"}},outlined:{color:"{surface.400}",borderColor:"{surface.400}"},simple:{color:"{surface.400}"}},contrast:{background:"{surface.0}",borderColor:"{surface.0}",color:"{surface.950}",shadow:"none",closeButton:{hoverBackground:"{surface.200}",focusRing:{color:"{surface.950}",shadow:"none"}},outlined:{color:"{surface.0}",borderColor:"{surface.0}"},simple:{color:"{surface.0}"}}}},IR={root:yR,content:CR,text:wR,icon:$R,closeButton:_R,closeIcon:xR,outlined:BR,simple:RR,colorScheme:ER},SR={borderRadius:"{content.border.radius}",gap:"1rem"},LR={size:"0.5rem"},TR={gap:"0.5rem"},NR={size:"0.5rem"},DR={size:"1rem"},OR={verticalGap:"0.5rem",horizontalGap:"1rem"},AR={light:{meters:{background:"{surface.300}"}},dark:{meters:{background:"{surface.600}"}}},PR={root:SR,meters:LR,label:TR,labelMarker:NR,labelIcon:DR,labelList:OR,colorScheme:AR},FR={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},zR={width:"2.5rem",color:"{form.field.icon.color}"},MR={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},WR={padding:"{list.padding}",gap:"{list.gap}",header:{padding:"{list.header.padding}"}},UR={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}",gap:"0.5rem"},qR={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},HR={color:"{form.field.icon.color}"},jR={borderRadius:"{border.radius.xs}"},VR={padding:"{list.option.padding}"},YR={root:FR,dropdown:zR,overlay:MR,list:WR,option:UR,optionGroup:qR,chip:jR,clearIcon:HR,emptyMessage:VR},XR={gap:"1.125rem"},GR={gap:"0.5rem"},KR={root:XR,controls:GR},JR={gutter:"0.75rem",transitionDuration:"{transition.duration}"},QR={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",borderColor:"{content.border.color}",color:"{content.color}",selectedColor:"{highlight.color}",hoverColor:"{content.hover.color}",padding:"0.75rem 1rem",toggleablePadding:"0.75rem 1rem 1.25rem 1rem",borderRadius:"{content.border.radius}"},ZR={background:"{content.background}",hoverBackground:"{content.hover.background}",borderColor:"{content.border.color}",color:"{text.muted.color}",hoverColor:"{text.color}",size:"1.5rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},o3={color:"{content.border.color}",borderRadius:"{content.border.radius}",height:"24px"},e3={root:JR,node:QR,nodeToggleButton:ZR,connector:o3},r3={outline:{width:"2px",color:"{content.background}"}},t3={root:r3},n3={padding:"0.5rem 1rem",gap:"0.25rem",borderRadius:"{content.border.radius}",background:"{content.background}",color:"{content.color}",transitionDuration:"{transition.duration}"},a3={background:"transparent",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",selectedColor:"{highlight.color}",width:"2.5rem",height:"2.5rem",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},i3={color:"{text.muted.color}"},c3={maxWidth:"2.5rem"},l3={root:n3,navButton:a3,currentPageReport:i3,jumpToPageInput:c3},s3={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}"},d3={background:"transparent",color:"{text.color}",padding:"1.125rem",borderWidth:"0 0 1px 0",borderColor:"{content.border.color}",borderRadius:"0"},u3={padding:"0.375rem 1.125rem"},f3={fontWeight:"700"},g3={padding:"1.125rem"},m3={padding:"0 1.125rem 1.125rem 1.125rem"},p3={root:s3,header:d3,toggleableHeader:u3,title:f3,content:g3,footer:m3},b3={gap:"0",transitionDuration:"{transition.duration}"},h3={background:"{content.background}",borderColor:"{content.border.color}",borderWidth:"1px",color:"{content.color}",padding:"0.25rem 0.25rem",borderRadius:"0",first:{borderWidth:"1px 1px 0 1px",topBorderRadius:"{content.border.radius}"},last:{borderWidth:"0 1px 1px 1px",bottomBorderRadius:"{content.border.radius}"}},v3={focusBackground:"{navigation.item.focus.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",gap:"0.5rem",padding:"{navigation.item.padding}",borderRadius:"{content.border.radius}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}"}},k3={indent:"1rem"},y3={color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}"},C3={root:b3,panel:h3,item:v3,submenu:k3,submenuIcon:y3},w3={borderRadius:"{content.border.radius}",height:".75rem"},$3={color:"{form.field.icon.color}"},_3={background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",borderRadius:"{overlay.popover.border.radius}",color:"{overlay.popover.color}",padding:"{overlay.popover.padding}",shadow:"{overlay.popover.shadow}"},x3={gap:"0.5rem"},B3={light:{meter:{background:"{surface.300}"},strength:{weakBackground:"{red.600}",mediumBackground:"{yellow.600}",strongBackground:"{green.600}"}},dark:{meter:{background:"{surface.600}"},strength:{weakBackground:"{red.500}",mediumBackground:"{yellow.500}",strongBackground:"{green.500}"}}},R3={meter:w3,icon:$3,overlay:_3,content:x3,colorScheme:B3},E3={gap:"1.125rem"},I3={gap:"0.5rem"},S3={root:E3,controls:I3},L3={background:"{overlay.popover.background}",borderColor:"{overlay.popover.border.color}",color:"{overlay.popover.color}",borderRadius:"{overlay.popover.border.radius}",shadow:"{overlay.popover.shadow}",gutter:"10px",arrowOffset:"1.25rem"},T3={padding:"{overlay.popover.padding}"},N3={root:L3,content:T3},D3={borderRadius:"{content.border.radius}",height:"1.25rem"},O3={background:"{primary.color}"},A3={color:"{primary.contrast.color}",fontSize:"0.75rem",fontWeight:"700"},P3={light:{root:{background:"{surface.300}"}},dark:{root:{background:"{surface.600}"}}},F3={root:D3,value:O3,label:A3,colorScheme:P3},z3={light:{root:{colorOne:"{red.500}",colorTwo:"{blue.500}",colorThree:"{green.500}",colorFour:"{yellow.500}"}},dark:{root:{colorOne:"{red.400}",colorTwo:"{blue.400}",colorThree:"{green.400}",colorFour:"{yellow.400}"}}},M3={colorScheme:z3},W3={width:"1.25rem",height:"1.25rem",background:"{form.field.background}",checkedBackground:"{form.field.background}",checkedHoverBackground:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",checkedBorderColor:"{form.field.border.color}",checkedHoverBorderColor:"{form.field.hover.border.color}",checkedFocusBorderColor:"{form.field.focus.border.color}",checkedDisabledBorderColor:"{form.field.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",shadow:"{form.field.shadow}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{width:"1rem",height:"1rem"},lg:{width:"1.5rem",height:"1.5rem"}},U3={size:"0.75rem",checkedColor:"{primary.color}",checkedHoverColor:"{primary.color}",disabledColor:"{form.field.disabled.color}",sm:{size:"0.5rem"},lg:{size:"1rem"}},q3={root:W3,icon:U3},H3={gap:"0.25rem",transitionDuration:"{transition.duration}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},j3={size:"1rem",color:"{text.muted.color}",hoverColor:"{primary.color}",activeColor:"{primary.color}"},V3={root:H3,icon:j3},Y3={light:{root:{background:"rgba(0,0,0,0.1)"}},dark:{root:{background:"rgba(255,255,255,0.4)"}}},X3={colorScheme:Y3},G3={transitionDuration:"{transition.duration}"},K3={size:"9px",borderRadius:"{border.radius.xs}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},J3={light:{bar:{background:"{surface.200}"}},dark:{bar:{background:"{surface.700}"}}},Q3={root:G3,bar:K3,colorScheme:J3},Z3={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},o6={width:"2.5rem",color:"{form.field.icon.color}"},e6={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},r6={padding:"{list.padding}",gap:"{list.gap}",header:{padding:"{list.header.padding}"}},t6={focusBackground:"{list.option.focus.background}",selectedBackground:"{list.option.selected.background}",selectedFocusBackground:"{list.option.selected.focus.background}",color:"{list.option.color}",focusColor:"{list.option.focus.color}",selectedColor:"{list.option.selected.color}",selectedFocusColor:"{list.option.selected.focus.color}",padding:"{list.option.padding}",borderRadius:"{list.option.border.radius}"},n6={background:"{list.option.group.background}",color:"{list.option.group.color}",fontWeight:"{list.option.group.font.weight}",padding:"{list.option.group.padding}"},a6={color:"{form.field.icon.color}"},i6={color:"{list.option.color}",gutterStart:"-0.375rem",gutterEnd:"0.375rem"},c6={padding:"{list.option.padding}"},l6={root:Z3,dropdown:o6,overlay:e6,list:r6,option:t6,optionGroup:n6,clearIcon:a6,checkmark:i6,emptyMessage:c6},s6={borderRadius:"{form.field.border.radius}"},d6={light:{root:{invalidBorderColor:"{form.field.invalid.border.color}"}},dark:{root:{invalidBorderColor:"{form.field.invalid.border.color}"}}},u6={root:s6,colorScheme:d6},f6={borderRadius:"{content.border.radius}"},g6={light:{root:{background:"{surface.300}",animationBackground:"rgba(255,255,255,0.4)"}},dark:{root:{background:"rgba(255, 255, 255, 0.1)",animationBackground:"rgba(255, 255, 255, 0.04)"}}},m6={root:f6,colorScheme:g6},p6={transitionDuration:"{transition.duration}"},b6={borderRadius:"{content.border.radius}",size:"3px"},h6={background:"{primary.color}"},v6={width:"16px",height:"16px",borderRadius:"50%",background:"{primary.color}",hoverBackground:"{primary.color}",content:{borderRadius:"50%",background:"{primary.color}",hoverBackground:"{primary.color}",width:"12px",height:"12px",shadow:"none"},focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},k6={light:{track:{background:"{surface.300}"}},dark:{track:{background:"{surface.600}"}}},y6={root:p6,track:b6,range:h6,handle:v6,colorScheme:k6},C6={gap:"0.5rem",transitionDuration:"{transition.duration}"},w6={root:C6},$6={borderRadius:"{form.field.border.radius}",roundedBorderRadius:"2rem",raisedShadow:"0 3px 1px -2px rgba(0, 0, 0, 0.2), 0 2px 2px 0 rgba(0, 0, 0, 0.14), 0 1px 5px 0 rgba(0, 0, 0, 0.12)"},_6={root:$6},x6={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",transitionDuration:"{transition.duration}"},B6={background:"{content.border.color}"},R6={size:"24px",background:"transparent",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},E6={root:x6,gutter:B6,handle:R6},I6={transitionDuration:"{transition.duration}"},S6={background:"{content.border.color}",activeBackground:"{primary.color}",margin:"0 0 0 1.625rem",size:"2px"},L6={padding:"0.5rem",gap:"1rem"},T6={padding:"0",borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},gap:"0.5rem"},N6={color:"{text.muted.color}",activeColor:"{primary.color}",fontWeight:"700"},D6={background:"{content.background}",activeBackground:"{primary.color}",borderColor:"{content.border.color}",activeBorderColor:"{primary.color}",color:"{text.muted.color}",activeColor:"{primary.contrast.color}",size:"2rem",fontSize:"1.143rem",fontWeight:"500",borderRadius:"50%",shadow:"none"},O6={padding:"0.875rem 0.5rem 1.125rem 0.5rem"},A6={background:"{content.background}",color:"{content.color}",padding:"0",indent:"1rem"},P6={root:I6,separator:S6,step:L6,stepHeader:T6,stepTitle:N6,stepNumber:D6,steppanels:O6,steppanel:A6},F6={transitionDuration:"{transition.duration}"},z6={background:"{content.border.color}"},M6={borderRadius:"{content.border.radius}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},gap:"0.5rem"},W6={color:"{text.muted.color}",activeColor:"{primary.color}",fontWeight:"700"},U6={background:"{content.background}",activeBackground:"{primary.color}",borderColor:"{content.border.color}",activeBorderColor:"{primary.color}",color:"{text.muted.color}",activeColor:"{primary.contrast.color}",size:"2rem",fontSize:"1.143rem",fontWeight:"500",borderRadius:"50%",shadow:"none"},q6={root:F6,separator:z6,itemLink:M6,itemLabel:W6,itemNumber:U6},H6={transitionDuration:"{transition.duration}"},j6={borderWidth:"0 0 1px 0",background:"{content.background}",borderColor:"{content.border.color}"},V6={background:"{content.background}",hoverBackground:"{content.hover.background}",activeBackground:"{primary.color}",borderWidth:"0",borderColor:"transparent",hoverBorderColor:"transparent",activeBorderColor:"transparent",color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.contrast.color}",padding:"1rem 1.25rem",fontWeight:"700",margin:"0",gap:"0.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},Y6={color:"{text.color}",hoverColor:"{text.color}",activeColor:"{primary.contrast.color}"},X6={height:"0",bottom:"0",background:"transparent"},G6={root:H6,tablist:j6,item:V6,itemIcon:Y6,activeBar:X6},K6={transitionDuration:"{transition.duration}"},J6={borderWidth:"0 0 1px 0",background:"{content.background}",borderColor:"{content.border.color}"},Q6={background:"{content.background}",hoverBackground:"{content.hover.background}",activeBackground:"{primary.color}",borderWidth:"0",borderColor:"transparent",hoverBorderColor:"transparent",activeBorderColor:"transparent",color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.contrast.color}",padding:"1rem 1.25rem",fontWeight:"700",margin:"0",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-2px",shadow:"{focus.ring.shadow}"}},Z6={background:"{content.background}",color:"{content.color}",padding:"0.875rem 1.125rem 1.125rem 1.125rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"inset {focus.ring.shadow}"}},o7={background:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}",width:"2.5rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"inset {focus.ring.shadow}"}},e7={height:"0",bottom:"0",background:"transparent"},r7={light:{navButton:{shadow:"0px 0px 10px 50px rgba(255, 255, 255, 0.6)"}},dark:{navButton:{shadow:"0px 0px 10px 50px color-mix(in srgb, {content.background}, transparent 50%)"}}},t7={root:K6,tablist:J6,tab:Q6,tabpanel:Z6,navButton:o7,activeBar:e7,colorScheme:r7},n7={transitionDuration:"{transition.duration}"},a7={background:"{content.background}",borderColor:"{content.border.color}"},i7={borderColor:"{content.border.color}",activeBorderColor:"{primary.color}",color:"{text.muted.color}",hoverColor:"{text.color}",activeColor:"{primary.color}"},c7={background:"{content.background}",color:"{content.color}"},l7={background:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}"},s7={light:{navButton:{shadow:"0px 0px 10px 50px rgba(255, 255, 255, 0.6)"}},dark:{navButton:{shadow:"0px 0px 10px 50px color-mix(in srgb, {content.background}, transparent 50%)"}}},d7={root:n7,tabList:a7,tab:i7,tabPanel:c7,navButton:l7,colorScheme:s7},u7={fontSize:"0.875rem",fontWeight:"700",padding:"0.25rem 0.5rem",gap:"0.25rem",borderRadius:"{content.border.radius}",roundedBorderRadius:"{border.radius.xl}"},f7={size:"0.75rem"},g7={light:{primary:{background:"{primary.color}",color:"{primary.contrast.color}"},secondary:{background:"{surface.200}",color:"{surface.700}"},success:{background:"{green.600}",color:"{surface.0}"},info:{background:"{sky.600}",color:"{surface.0}"},warn:{background:"{orange.600}",color:"{surface.0}"},danger:{background:"{red.600}",color:"{surface.0}"},contrast:{background:"{surface.950}",color:"{surface.0}"}},dark:{primary:{background:"{primary.color}",color:"{primary.contrast.color}"},secondary:{background:"{surface.700}",color:"{surface.200}"},success:{background:"{green.500}",color:"{green.950}"},info:{background:"{sky.500}",color:"{sky.950}"},warn:{background:"{orange.500}",color:"{orange.950}"},danger:{background:"{red.500}",color:"{red.950}"},contrast:{background:"{surface.0}",color:"{surface.950}"}}},m7={root:u7,icon:f7,colorScheme:g7},p7={background:"{form.field.background}",borderColor:"{form.field.border.color}",color:"{form.field.color}",height:"18rem",padding:"{form.field.padding.y} {form.field.padding.x}",borderRadius:"{form.field.border.radius}"},b7={gap:"0.25rem"},h7={margin:"2px 0"},v7={root:p7,prompt:b7,commandResponse:h7},k7={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},y7={root:k7},C7={background:"{content.background}",borderColor:"{content.border.color}",color:"{content.color}",borderRadius:"{content.border.radius}",shadow:"{overlay.navigation.shadow}",transitionDuration:"{transition.duration}"},w7={padding:"{navigation.list.padding}",gap:"{navigation.list.gap}"},$7={focusBackground:"{navigation.item.focus.background}",activeBackground:"{navigation.item.active.background}",color:"{navigation.item.color}",focusColor:"{navigation.item.focus.color}",activeColor:"{navigation.item.active.color}",padding:"{navigation.item.padding}",borderRadius:"{navigation.item.border.radius}",gap:"{navigation.item.gap}",icon:{color:"{navigation.item.icon.color}",focusColor:"{navigation.item.icon.focus.color}",activeColor:"{navigation.item.icon.active.color}"}},_7={mobileIndent:"1rem"},x7={size:"{navigation.submenu.icon.size}",color:"{navigation.submenu.icon.color}",focusColor:"{navigation.submenu.icon.focus.color}",activeColor:"{navigation.submenu.icon.active.color}"},B7={borderColor:"{content.border.color}"},R7={root:C7,list:w7,item:$7,submenu:_7,submenuIcon:x7,separator:B7},E7={minHeight:"5rem"},I7={eventContent:{padding:"1rem 0"}},S7={eventContent:{padding:"0 1rem"}},L7={size:"1.125rem",borderRadius:"50%",borderWidth:"2px",background:"{primary.color}",borderColor:"{primary.color}",content:{borderRadius:"50%",size:"0.375rem",background:"transparent",insetShadow:"none"}},T7={color:"{content.border.color}",size:"2px"},N7={event:E7,horizontal:I7,vertical:S7,eventMarker:L7,eventConnector:T7},D7={width:"25rem",borderRadius:"{content.border.radius}",borderWidth:"0 0 0 6px",transitionDuration:"{transition.duration}"},O7={size:"1.125rem"},A7={padding:"{overlay.popover.padding}",gap:"0.5rem"},P7={gap:"0.5rem"},F7={fontWeight:"700",fontSize:"1rem"},z7={fontWeight:"500",fontSize:"0.875rem"},M7={width:"1.75rem",height:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",offset:"{focus.ring.offset}"}},W7={size:"1rem"},U7={light:{blur:"0",info:{background:"{blue.800}",borderColor:"{blue.800}",color:"{blue.50}",detailColor:"{blue.50}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{blue.600}",focusRing:{color:"{blue.50}",shadow:"none"}}},success:{background:"{green.800}",borderColor:"{green.800}",color:"{green.50}",detailColor:"{green.50}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{green.600}",focusRing:{color:"{green.50}",shadow:"none"}}},warn:{background:"{yellow.600}",borderColor:"{yellow.600}",color:"{yellow.50}",detailColor:"{yellow.50}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{yellow.400}",focusRing:{color:"{yellow.50}",shadow:"none"}}},error:{background:"{red.800}",borderColor:"{red.800}",color:"{red.50}",detailColor:"{red.50}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{red.600}",focusRing:{color:"{red.50}",shadow:"none"}}},secondary:{background:"{surface.200}",borderColor:"{surface.200}",color:"{surface.700}",detailColor:"{surface.700}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{surface.50}",focusRing:{color:"{surface.700}",shadow:"none"}}},contrast:{background:"{surface.900}",borderColor:"{surface.900}",color:"{surface.50}",detailColor:"{surface.0}",shadow:"0px 4px 8px 0px color-mix(in srgb, {surface.950}, transparent 96%)",closeButton:{hoverBackground:"{surface.700}",focusRing:{color:"{surface.50}",shadow:"none"}}}},dark:{blur:"0",info:{background:"{blue.200}",borderColor:"{blue.200}",color:"{blue.950}",detailColor:"{blue.950}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{blue.50}",focusRing:{color:"{blue.950}",shadow:"none"}}},success:{background:"{green.200}",borderColor:"{green.200}",color:"{green.950}",detailColor:"{green.950}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{green.50}",focusRing:{color:"{green.950}",shadow:"none"}}},warn:{background:"{yellow.200}",borderColor:"{yellow.200}",color:"{yellow.950}",detailColor:"{yellow.950}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{yellow.50}",focusRing:{color:"{yellow.950}",shadow:"none"}}},error:{background:"{red.200}",borderColor:"{red.200}",color:"{red.950}",detailColor:"{red.950}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{red.50}",focusRing:{color:"{red.950}",shadow:"none"}}},secondary:{background:"{surface.700}",borderColor:"{surface.700}",color:"{surface.200}",detailColor:"{surface.200}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{surface.500}",focusRing:{color:"{surface.200}",shadow:"none"}}},contrast:{background:"{surface.0}",borderColor:"{surface.0}",color:"{surface.950}",detailColor:"{surface.950}",shadow:"{overlay.popover.shadow}",closeButton:{hoverBackground:"{surface.200}",focusRing:{color:"{surface.950}",shadow:"none"}}}}},q7={root:D7,icon:O7,content:A7,text:P7,summary:F7,detail:z7,closeButton:M7,closeIcon:W7,colorScheme:U7},H7={padding:"0.5rem 0.75rem",borderRadius:"{content.border.radius}",gap:"0.5rem",fontWeight:"500",background:"{form.field.background}",borderColor:"{form.field.border.color}",color:"{form.field.color}",hoverColor:"{form.field.color}",checkedBackground:"{highlight.background}",checkedColor:"{highlight.color}",checkedBorderColor:"{form.field.border.color}",disabledBackground:"{form.field.disabled.background}",disabledBorderColor:"{form.field.disabled.background}",disabledColor:"{form.field.disabled.color}",invalidBorderColor:"{form.field.invalid.border.color}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",padding:"0.375rem 0.625rem"},lg:{fontSize:"{form.field.lg.font.size}",padding:"0.625rem 0.875rem"}},j7={color:"{text.muted.color}",hoverColor:"{text.muted.color}",checkedColor:"{highlight.color}",disabledColor:"{form.field.disabled.color}"},V7={checkedBackground:"transparent",checkedShadow:"none",padding:"0",borderRadius:"0",sm:{padding:"0"},lg:{padding:"0"}},Y7={light:{root:{hoverBackground:"{surface.200}"}},dark:{root:{hoverBackground:"{surface.700}"}}},X7={root:H7,icon:j7,content:V7,colorScheme:Y7},G7={width:"2.5rem",height:"1.5rem",borderRadius:"30px",gap:"0.25rem",shadow:"{form.field.shadow}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"},borderWidth:"1px",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.border.color}",checkedBorderColor:"{primary.color}",checkedHoverBorderColor:"{primary.color}",invalidBorderColor:"{form.field.invalid.border.color}",background:"{form.field.background}",hoverBackground:"{form.field.background}",checkedBackground:"{primary.color}",checkedHoverBackground:"{primary.color}",transitionDuration:"{form.field.transition.duration}",slideDuration:"0.1s",disabledBackground:"{form.field.disabled.background}"},K7={borderRadius:"50%",size:"1rem",background:"{form.field.border.color}",hoverBackground:"{form.field.border.color}",checkedBackground:"{primary.contrast.color}",checkedHoverBackground:"{primary.contrast.color}",disabledBackground:"{form.field.disabled.color}",color:"{surface.0}",hoverColor:"{surface.0}",checkedColor:"{primary.color}",checkedHoverColor:"{primary.color}"},J7={root:G7,handle:K7},Q7={background:"{content.background}",borderColor:"{content.border.color}",borderRadius:"{content.border.radius}",color:"{content.color}",gap:"0.5rem",padding:"0.75rem"},Z7={root:Q7},o8={maxWidth:"12.5rem",gutter:"0.25rem",shadow:"{overlay.popover.shadow}",padding:"0.5rem 0.75rem",borderRadius:"{overlay.popover.border.radius}"},e8={light:{root:{background:"{surface.900}",color:"{surface.0}"}},dark:{root:{background:"{surface.0}",color:"{surface.900}"}}},r8={root:o8,colorScheme:e8},t8={background:"{content.background}",color:"{content.color}",padding:"1rem",gap:"2px",indent:"1rem",transitionDuration:"{transition.duration}"},n8={padding:"0.25rem 0.5rem",borderRadius:"{content.border.radius}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{text.color}",hoverColor:"{text.hover.color}",selectedColor:"{highlight.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-2px",shadow:"{focus.ring.shadow}"},gap:"0.25rem"},a8={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",selectedColor:"{highlight.color}"},i8={borderRadius:"50%",size:"1.75rem",hoverBackground:"{content.hover.background}",selectedHoverBackground:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",selectedHoverColor:"{primary.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},c8={size:"2rem"},l8={margin:"0 0 0.5rem 0"},s8={root:t8,node:n8,nodeIcon:a8,nodeToggleButton:i8,loadingIcon:c8,filter:l8},d8={background:"{form.field.background}",disabledBackground:"{form.field.disabled.background}",filledBackground:"{form.field.filled.background}",filledHoverBackground:"{form.field.filled.hover.background}",filledFocusBackground:"{form.field.filled.focus.background}",borderColor:"{form.field.border.color}",hoverBorderColor:"{form.field.hover.border.color}",focusBorderColor:"{form.field.focus.border.color}",invalidBorderColor:"{form.field.invalid.border.color}",color:"{form.field.color}",disabledColor:"{form.field.disabled.color}",placeholderColor:"{form.field.placeholder.color}",invalidPlaceholderColor:"{form.field.invalid.placeholder.color}",shadow:"{form.field.shadow}",paddingX:"{form.field.padding.x}",paddingY:"{form.field.padding.y}",borderRadius:"{form.field.border.radius}",focusRing:{width:"{form.field.focus.ring.width}",style:"{form.field.focus.ring.style}",color:"{form.field.focus.ring.color}",offset:"{form.field.focus.ring.offset}",shadow:"{form.field.focus.ring.shadow}"},transitionDuration:"{form.field.transition.duration}",sm:{fontSize:"{form.field.sm.font.size}",paddingX:"{form.field.sm.padding.x}",paddingY:"{form.field.sm.padding.y}"},lg:{fontSize:"{form.field.lg.font.size}",paddingX:"{form.field.lg.padding.x}",paddingY:"{form.field.lg.padding.y}"}},u8={width:"2.5rem",color:"{form.field.icon.color}"},f8={background:"{overlay.select.background}",borderColor:"{overlay.select.border.color}",borderRadius:"{overlay.select.border.radius}",color:"{overlay.select.color}",shadow:"{overlay.select.shadow}"},g8={padding:"{list.padding}"},m8={padding:"{list.option.padding}"},p8={borderRadius:"{border.radius.sm}"},b8={color:"{form.field.icon.color}"},h8={root:d8,dropdown:u8,overlay:f8,tree:g8,emptyMessage:m8,chip:p8,clearIcon:b8},v8={transitionDuration:"{transition.duration}"},k8={background:"{content.background}",borderColor:"{treetable.border.color}",color:"{content.color}",borderWidth:"1px 0 1px 0",padding:"0.75rem 1rem"},y8={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",borderColor:"{treetable.border.color}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",gap:"0.5rem",padding:"0.75rem 1rem",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},C8={fontWeight:"700"},w8={background:"{content.background}",hoverBackground:"{content.hover.background}",selectedBackground:"{highlight.background}",color:"{content.color}",hoverColor:"{content.hover.color}",selectedColor:"{highlight.color}",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"-1px",shadow:"{focus.ring.shadow}"}},$8={borderColor:"{treetable.border.color}",padding:"0.75rem 1rem",gap:"0.5rem"},_8={background:"{content.background}",borderColor:"{treetable.border.color}",color:"{content.color}",padding:"0.75rem 1rem"},x8={fontWeight:"700"},B8={background:"{content.background}",borderColor:"{treetable.border.color}",color:"{content.color}",borderWidth:"0 0 1px 0",padding:"0.75rem 1rem"},R8={width:"0.5rem"},E8={width:"1px",color:"{primary.color}"},I8={color:"{text.muted.color}",hoverColor:"{text.hover.muted.color}",size:"0.875rem"},S8={size:"2rem"},L8={hoverBackground:"{content.hover.background}",selectedHoverBackground:"{content.background}",color:"{text.muted.color}",hoverColor:"{text.color}",selectedHoverColor:"{primary.color}",size:"1.75rem",borderRadius:"50%",focusRing:{width:"{focus.ring.width}",style:"{focus.ring.style}",color:"{focus.ring.color}",offset:"{focus.ring.offset}",shadow:"{focus.ring.shadow}"}},T8={borderColor:"{content.border.color}",borderWidth:"0 0 1px 0"},N8={borderColor:"{content.border.color}",borderWidth:"0 0 1px 0"},D8={light:{root:{borderColor:"{surface.300}"},bodyCell:{selectedBorderColor:"{primary.100}"}},dark:{root:{borderColor:"{surface.600}"},bodyCell:{selectedBorderColor:"{primary.900}"}}},O8={root:v8,header:k8,headerCell:y8,columnTitle:C8,row:w8,bodyCell:$8,footerCell:_8,columnFooter:x8,footer:B8,columnResizer:R8,resizeIndicator:E8,sortIcon:I8,loadingIcon:S8,nodeToggleButton:L8,paginatorTop:T8,paginatorBottom:N8,colorScheme:D8},A8={mask:{background:"{content.background}",color:"{text.muted.color}"},icon:{size:"2rem"}},P8={loader:A8},F8=Object.defineProperty,z8=Object.defineProperties,M8=Object.getOwnPropertyDescriptors,sn=Object.getOwnPropertySymbols,W8=Object.prototype.hasOwnProperty,U8=Object.prototype.propertyIsEnumerable,dn=(o,e,r)=>e in o?F8(o,e,{enumerable:!0,configurable:!0,writable:!0,value:r}):o[e]=r,un;un=((o,e)=>{for(var r in e||(e={}))W8.call(e,r)&&dn(o,r,e[r]);if(sn)for(var r of sn(e))U8.call(e,r)&&dn(o,r,e[r]);return o})({},e_),z8(un,M8({components:{accordion:I$,autocomplete:z$,avatar:j$,badge:Q$,blockui:t_,breadcrumb:c_,button:d_,datepicker:Jx,card:b_,carousel:w_,cascadeselect:I_,checkbox:T_,chip:F_,colorpicker:q_,confirmdialog:V_,confirmpopup:J_,contextmenu:nx,dataview:Lx,datatable:_x,dialog:t4,divider:l4,dock:u4,drawer:h4,editor:$4,fieldset:E4,fileupload:A4,iftalabel:cB,floatlabel:W4,galleria:rB,iconfield:nB,image:fB,imagecompare:mB,inlinemessage:kB,inplace:wB,inputchips:BB,inputgroup:EB,inputnumber:TB,inputotp:OB,inputtext:PB,knob:UB,listbox:KB,megamenu:iR,menu:fR,menubar:kR,message:IR,metergroup:PR,multiselect:YR,orderlist:KR,organizationchart:e3,overlaybadge:t3,popover:N3,paginator:l3,password:R3,panel:p3,panelmenu:C3,picklist:S3,progressbar:F3,progressspinner:M3,radiobutton:q3,rating:V3,ripple:X3,scrollpanel:Q3,select:l6,selectbutton:u6,skeleton:m6,slider:y6,speeddial:w6,splitter:E6,splitbutton:_6,stepper:P6,steps:q6,tabmenu:G6,tabs:t7,tabview:d7,textarea:y7,tieredmenu:R7,tag:m7,terminal:v7,timeline:N7,togglebutton:X7,toggleswitch:J7,tree:s8,treeselect:h8,treetable:O8,toast:q7,toolbar:Z7,tooltip:r8,virtualscroller:P8}}));function q8(){return to(this,null,function*(){let o=localStorage.getItem("preferredLang")||"en";try{const n=(yield Z.get("/api/method/frappe.auth.get_logged_user")).data.message;o=(yield Z.get(`/api/resource/User/${n}`)).data.data.language||"en",localStorage.setItem("preferredLang",o)}catch(a){console.warn('[i18n] Failed to load user language. Defaulting to "en"')}nn.global.locale.value=o,document.documentElement.lang=o,document.documentElement.dir=o==="ar"?"rtl":"ltr";const e=Ya(hl),r=Se(new rh),t=new _$;r.isLoggedIn&&t.loadPermissions(r.cookie.user_id),e.use(sr),e.use(nn),e.provide("$auth",r),e.provide("$permissions",t),e.provide("$call",jr),e.use(Ga,{theme:{preset:$$,options:{prefix:"p",darkModeSelector:".p-dark",cssLayer:!1}}}),e.use(th),e.use(Ka),e.use(Ja),e.component("Button",vo),e.component("InputText",or),e.component("InputNumber",Qa),e.component("AutoComplete",We),e.component("Checkbox",Za),e.component("Dialog",Kr),e.component("DataTable",bn),e.component("Column",ee),e.component("DataView",kn),e.component("Toast",vn),e.component("ConfirmDialog",oi),e.component("FloatLabel",Xo),e.component("Menubar",ei),e.component("Tag",ri),e.component("IftaLabel",ti),e.component("Textarea",hn),sr.beforeEach((a,n,i)=>{console.log(`Navigation from ${n.path} to ${a.path}, isLoggedIn: ${r.isLoggedIn}`);const c=!a.matched.some(l=>l.meta.isLoginPage);c&&!r.isLoggedIn?(console.log("Redirecting to login"),i({name:"Login",query:{route:a.path}})):!c&&r.isLoggedIn?(console.log("Redirecting to home"),i({name:"Home"})):(console.log("Proceeding with navigation"),i())}),e.mount("#app")})}q8()});export default H8();
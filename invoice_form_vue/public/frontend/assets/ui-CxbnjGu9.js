@@ -1,3825 +0,0 @@
-import{r as On,a as Aa,n as ja,w as Ct,g as jo,o as Ka,u as Va,m as f,c as b,b as c,d as R,e as k,f as Ee,t as Y,h as T,i as ke,j as Ie,k as y,l as E,p as C,q as j,s as M,v as ii,T as Na,F as K,x as mt,y as ne,z as Ha,A as ue,B as So,C as zn,D as De,E as wn,G as ai,H as _n,I as Ga,J as Ua,K as _a}from"./vendor-CQUOWwJw.js";function re(...e){if(e){let t=[];for(let n=0;n<e.length;n++){const o=e[n];if(!o)continue;const i=typeof o;if(i==="string"||i==="number")t.push(o);else if(i==="object"){const r=Array.isArray(o)?[re(...o)]:Object.entries(o).map(([a,l])=>l?a:void 0);t=r.length?t.concat(r.filter(a=>!!a)):t}}return t.join(" ").trim()}}function Wa(e,t){return e?e.classList?e.classList.contains(t):new RegExp("(^| )"+t+"( |$)","gi").test(e.className):!1}function We(e,t){if(e&&t){const n=o=>{Wa(e,o)||(e.classList?e.classList.add(o):e.className+=" "+o)};[t].flat().filter(Boolean).forEach(o=>o.split(" ").forEach(n))}}function Za(){return window.innerWidth-document.documentElement.offsetWidth}function qa(e){typeof e=="string"?We(document.body,e||"p-overflow-hidden"):(e!=null&&e.variableName&&document.body.style.setProperty(e.variableName,Za()+"px"),We(document.body,(e==null?void 0:e.className)||"p-overflow-hidden"))}function Ya(e){if(e){const t=document.createElement("a");if(t.download!==void 0){const{name:n,src:o}=e;return t.setAttribute("href",o),t.setAttribute("download",n),t.style.display="none",document.body.appendChild(t),t.click(),document.body.removeChild(t),!0}}return!1}function Ja(e,t){const n=new Blob([e],{type:"application/csv;charset=utf-8;"});window.navigator.msSaveOrOpenBlob?navigator.msSaveOrOpenBlob(n,t+".csv"):Ya({name:t+".csv",src:URL.createObjectURL(n)})||(e="data:text/csv;charset=utf-8,"+e,window.open(encodeURI(e)))}function ze(e,t){if(e&&t){const n=o=>{e.classList?e.classList.remove(o):e.className=e.className.replace(new RegExp("(^|\\b)"+o.split(" ").join("|")+"(\\b|$)","gi")," ")};[t].flat().filter(Boolean).forEach(o=>o.split(" ").forEach(n))}}function Xa(e){typeof e=="string"?ze(document.body,e||"p-overflow-hidden"):(e!=null&&e.variableName&&document.body.style.removeProperty(e.variableName),ze(document.body,(e==null?void 0:e.className)||"p-overflow-hidden"))}function Ln(e){for(const t of document==null?void 0:document.styleSheets)try{for(const n of t==null?void 0:t.cssRules)for(const o of n==null?void 0:n.style)if(e.test(o))return{name:o,value:n.style.getPropertyValue(o).trim()}}catch(n){}return null}function li(e){const t={width:0,height:0};return e&&(e.style.visibility="hidden",e.style.display="block",t.width=e.offsetWidth,t.height=e.offsetHeight,e.style.display="none",e.style.visibility="visible"),t}function $o(){const e=window,t=document,n=t.documentElement,o=t.getElementsByTagName("body")[0],i=e.innerWidth||n.clientWidth||o.clientWidth,r=e.innerHeight||n.clientHeight||o.clientHeight;return{width:i,height:r}}function Jn(e){return e?Math.abs(e.scrollLeft):0}function Qa(){const e=document.documentElement;return(window.pageXOffset||Jn(e))-(e.clientLeft||0)}function el(){const e=document.documentElement;return(window.pageYOffset||e.scrollTop)-(e.clientTop||0)}function si(e){return e?getComputedStyle(e).direction==="rtl":!1}function ko(e,t,n=!0){var o,i,r,a;if(e){const l=e.offsetParent?{width:e.offsetWidth,height:e.offsetHeight}:li(e),s=l.height,u=l.width,d=t.offsetHeight,p=t.offsetWidth,h=t.getBoundingClientRect(),m=el(),w=Qa(),$=$o();let v,I,P="top";h.top+d+s>$.height?(v=h.top+m-s,P="bottom",v<0&&(v=m)):v=d+h.top+m,h.left+u>$.width?I=Math.max(0,h.left+w+p-u):I=h.left+w,si(e)?e.style.insetInlineEnd=I+"px":e.style.insetInlineStart=I+"px",e.style.top=v+"px",e.style.transformOrigin=P,n&&(e.style.marginTop=P==="bottom"?`calc(${(i=(o=Ln(/-anchor-gutter$/))==null?void 0:o.value)!=null?i:"2px"} * -1)`:(a=(r=Ln(/-anchor-gutter$/))==null?void 0:r.value)!=null?a:"")}}function pt(e,t){e&&(typeof t=="string"?e.style.cssText=t:Object.entries(t||{}).forEach(([n,o])=>e.style[n]=o))}function ve(e,t){return e instanceof HTMLElement?e.offsetWidth:0}function ui(e,t,n=!0){var o,i,r,a;if(e){const l=e.offsetParent?{width:e.offsetWidth,height:e.offsetHeight}:li(e),s=t.offsetHeight,u=t.getBoundingClientRect(),d=$o();let p,h,m="top";u.top+s+l.height>d.height?(p=-1*l.height,m="bottom",u.top+p<0&&(p=-1*u.top)):p=s,l.width>d.width?h=u.left*-1:u.left+l.width>d.width?h=(u.left+l.width-d.width)*-1:h=0,e.style.top=p+"px",e.style.insetInlineStart=h+"px",e.style.transformOrigin=m,n&&(e.style.marginTop=m==="bottom"?`calc(${(i=(o=Ln(/-anchor-gutter$/))==null?void 0:o.value)!=null?i:"2px"} * -1)`:(a=(r=Ln(/-anchor-gutter$/))==null?void 0:r.value)!=null?a:"")}}function Io(e){if(e){let t=e.parentNode;return t&&t instanceof ShadowRoot&&t.host&&(t=t.host),t}return null}function tl(e){return!!(e!==null&&typeof e!="undefined"&&e.nodeName&&Io(e))}function rt(e){return typeof Element!="undefined"?e instanceof Element:e!==null&&typeof e=="object"&&e.nodeType===1&&typeof e.nodeName=="string"}function xn(){if(window.getSelection){const e=window.getSelection()||{};e.empty?e.empty():e.removeAllRanges&&e.rangeCount>0&&e.getRangeAt(0).getClientRects().length>0&&e.removeAllRanges()}}function Tn(e,t={}){if(rt(e)){const n=(o,i)=>{var r,a;const l=(r=e==null?void 0:e.$attrs)!=null&&r[o]?[(a=e==null?void 0:e.$attrs)==null?void 0:a[o]]:[];return[i].flat().reduce((s,u)=>{if(u!=null){const d=typeof u;if(d==="string"||d==="number")s.push(u);else if(d==="object"){const p=Array.isArray(u)?n(o,u):Object.entries(u).map(([h,m])=>o==="style"&&(m||m===0)?`${h.replace(/([a-z])([A-Z])/g,"$1-$2").toLowerCase()}:${m}`:m?h:void 0);s=p.length?s.concat(p.filter(h=>!!h)):s}}return s},l)};Object.entries(t).forEach(([o,i])=>{if(i!=null){const r=o.match(/^on(.+)/);r?e.addEventListener(r[1].toLowerCase(),i):o==="p-bind"||o==="pBind"?Tn(e,i):(i=o==="class"?[...new Set(n("class",i))].join(" ").trim():o==="style"?n("style",i).join(";").trim():i,(e.$attrs=e.$attrs||{})&&(e.$attrs[o]=i),e.setAttribute(o,i))}})}}function di(e,t={},...n){{const o=document.createElement(e);return Tn(o,t),o.append(...n),o}}function lt(e,t){return rt(e)?Array.from(e.querySelectorAll(t)):[]}function xe(e,t){return rt(e)?e.matches(t)?e:e.querySelector(t):null}function te(e,t){e&&document.activeElement!==e&&e.focus(t)}function fe(e,t){if(rt(e)){const n=e.getAttribute(t);return isNaN(n)?n==="true"||n==="false"?n==="true":n:+n}}function Po(e,t=""){const n=lt(e,`button:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            [href][clientHeight][clientWidth]:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            input:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            select:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            textarea:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            [tabIndex]:not([tabIndex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            [contenteditable]:not([tabIndex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t}`),o=[];for(const i of n)getComputedStyle(i).display!="none"&&getComputedStyle(i).visibility!="hidden"&&o.push(i);return o}function et(e,t){const n=Po(e,t);return n.length>0?n[0]:null}function tt(e){if(e){let t=e.offsetHeight;const n=getComputedStyle(e);return t-=parseFloat(n.paddingTop)+parseFloat(n.paddingBottom)+parseFloat(n.borderTopWidth)+parseFloat(n.borderBottomWidth),t}return 0}function nl(e){if(e){e.style.visibility="hidden",e.style.display="block";const t=e.offsetHeight;return e.style.display="none",e.style.visibility="visible",t}return 0}function ol(e){if(e){e.style.visibility="hidden",e.style.display="block";const t=e.offsetWidth;return e.style.display="none",e.style.visibility="visible",t}return 0}function Rn(e){var t;if(e){const n=(t=Io(e))==null?void 0:t.childNodes;let o=0;if(n)for(let i=0;i<n.length;i++){if(n[i]===e)return o;n[i].nodeType===1&&o++}}return-1}function ci(e,t){const n=Po(e,t);return n.length>0?n[n.length-1]:null}function An(e,t){let n=e.nextElementSibling;for(;n;){if(n.matches(t))return n;n=n.nextElementSibling}return null}function st(e){if(e){const t=e.getBoundingClientRect();return{top:t.top+(window.pageYOffset||document.documentElement.scrollTop||document.body.scrollTop||0),left:t.left+(window.pageXOffset||Jn(document.documentElement)||Jn(document.body)||0)}}return{top:"auto",left:"auto"}}function Pt(e,t){return e?e.offsetHeight:0}function pi(e,t=[]){const n=Io(e);return n===null?t:pi(n,t.concat([n]))}function jn(e,t){let n=e.previousElementSibling;for(;n;){if(n.matches(t))return n;n=n.previousElementSibling}return null}function rl(e){const t=[];if(e){const n=pi(e),o=/(auto|scroll)/,i=r=>{try{const a=window.getComputedStyle(r,null);return o.test(a.getPropertyValue("overflow"))||o.test(a.getPropertyValue("overflowX"))||o.test(a.getPropertyValue("overflowY"))}catch(a){return!1}};for(const r of n){const a=r.nodeType===1&&r.dataset.scrollselectors;if(a){const l=a.split(",");for(const s of l){const u=xe(r,s);u&&i(u)&&t.push(u)}}r.nodeType!==9&&i(r)&&t.push(r)}}return t}function Ko(){if(window.getSelection)return window.getSelection().toString();if(document.getSelection)return document.getSelection().toString()}function nt(e){if(e){let t=e.offsetWidth;const n=getComputedStyle(e);return t-=parseFloat(n.paddingLeft)+parseFloat(n.paddingRight)+parseFloat(n.borderLeftWidth)+parseFloat(n.borderRightWidth),t}return 0}function Vo(e,t,n){const o=e[t];typeof o=="function"&&o.apply(e,[])}function il(){return/(android)/i.test(navigator.userAgent)}function Wn(e){if(e){const t=e.nodeName,n=e.parentElement&&e.parentElement.nodeName;return t==="INPUT"||t==="TEXTAREA"||t==="BUTTON"||t==="A"||n==="INPUT"||n==="TEXTAREA"||n==="BUTTON"||n==="A"||!!e.closest(".p-button, .p-checkbox, .p-radiobutton")}return!1}function fi(){return!!(typeof window!="undefined"&&window.document&&window.document.createElement)}function No(e,t=""){return rt(e)?e.matches(`button:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            [href][clientHeight][clientWidth]:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            input:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            select:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            textarea:not([tabindex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            [tabIndex]:not([tabIndex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t},
-            [contenteditable]:not([tabIndex = "-1"]):not([disabled]):not([style*="display:none"]):not([hidden])${t}`):!1}function Mn(e){return!!(e&&e.offsetParent!=null)}function Kn(){return"ontouchstart"in window||navigator.maxTouchPoints>0||navigator.msMaxTouchPoints>0}function mn(e,t="",n){rt(e)&&n!==null&&n!==void 0&&e.setAttribute(t,n)}function bn(){const e=new Map;return{on(t,n){let o=e.get(t);return o?o.push(n):o=[n],e.set(t,o),this},off(t,n){const o=e.get(t);return o&&o.splice(o.indexOf(n)>>>0,1),this},emit(t,n){const o=e.get(t);o&&o.forEach(i=>{i(n)})},clear(){e.clear()}}}var al=Object.defineProperty,Ho=Object.getOwnPropertySymbols,ll=Object.prototype.hasOwnProperty,sl=Object.prototype.propertyIsEnumerable,Go=(e,t,n)=>t in e?al(e,t,{enumerable:!0,configurable:!0,writable:!0,value:n}):e[t]=n,ul=(e,t)=>{for(var n in t||(t={}))ll.call(t,n)&&Go(e,n,t[n]);if(Ho)for(var n of Ho(t))sl.call(t,n)&&Go(e,n,t[n]);return e};function he(e){return e==null||e===""||Array.isArray(e)&&e.length===0||!(e instanceof Date)&&typeof e=="object"&&Object.keys(e).length===0}function dl(e,t,n,o=1){let i=-1;const r=he(e),a=he(t);return r&&a?i=0:r?i=o:a?i=-o:typeof e=="string"&&typeof t=="string"?i=n(e,t):i=e<t?-1:e>t?1:0,i}function Xn(e,t,n=new WeakSet){if(e===t)return!0;if(!e||!t||typeof e!="object"||typeof t!="object"||n.has(e)||n.has(t))return!1;n.add(e).add(t);const o=Array.isArray(e),i=Array.isArray(t);let r,a,l;if(o&&i){if(a=e.length,a!=t.length)return!1;for(r=a;r--!==0;)if(!Xn(e[r],t[r],n))return!1;return!0}if(o!=i)return!1;const s=e instanceof Date,u=t instanceof Date;if(s!=u)return!1;if(s&&u)return e.getTime()==t.getTime();const d=e instanceof RegExp,p=t instanceof RegExp;if(d!=p)return!1;if(d&&p)return e.toString()==t.toString();const h=Object.keys(e);if(a=h.length,a!==Object.keys(t).length)return!1;for(r=a;r--!==0;)if(!Object.prototype.hasOwnProperty.call(t,h[r]))return!1;for(r=a;r--!==0;)if(l=h[r],!Xn(e[l],t[l],n))return!1;return!0}function cl(e,t){return Xn(e,t)}function Vn(e){return typeof e=="function"&&"call"in e&&"apply"in e}function A(e){return!he(e)}function H(e,t){if(!e||!t)return null;try{const n=e[t];if(A(n))return n}catch(n){}if(Object.keys(e).length){if(Vn(t))return t(e);if(t.indexOf(".")===-1)return e[t];{const n=t.split(".");let o=e;for(let i=0,r=n.length;i<r;++i){if(o==null)return null;o=o[n[i]]}return o}}return null}function Ye(e,t,n){return n?H(e,n)===H(t,n):cl(e,t)}function pl(e,t){if(e!=null&&t&&t.length){for(const n of t)if(Ye(e,n))return!0}return!1}function Ke(e,t=!0){return e instanceof Object&&e.constructor===Object&&(t||Object.keys(e).length!==0)}function hi(e={},t={}){const n=ul({},e);return Object.keys(t).forEach(o=>{const i=o;Ke(t[i])&&i in e&&Ke(e[i])?n[i]=hi(e[i],t[i]):n[i]=t[i]}),n}function mi(...e){return e.reduce((t,n,o)=>o===0?n:hi(t,n),{})}function Zn(e,t){let n=-1;if(t){for(let o=0;o<t.length;o++)if(t[o]===e){n=o;break}}return n}function ot(e,t){let n=-1;if(A(e))try{n=e.findLastIndex(t)}catch(o){n=e.lastIndexOf([...e].reverse().find(t))}return n}function Ce(e,...t){return Vn(e)?e(...t):e}function Se(e,t=!0){return typeof e=="string"&&(t||e!=="")}function Ae(e){return Se(e)?e.replace(/(-|_)/g,"").toLowerCase():e}function Oo(e,t="",n={}){const o=Ae(t).split("."),i=o.shift();if(i){if(Ke(e)){const r=Object.keys(e).find(a=>Ae(a)===i)||"";return Oo(Ce(e[r],n),o.join("."),n)}return}return Ce(e,n)}function Nn(e,t=!0){return Array.isArray(e)&&(t||e.length!==0)}function fl(e){return A(e)&&!isNaN(e)}function bi(e=""){return A(e)&&e.length===1&&!!e.match(/\S| /)}function Qn(){return new Intl.Collator(void 0,{numeric:!0}).compare}function He(e,t){if(t){const n=t.test(e);return t.lastIndex=0,n}return!1}function hl(...e){return mi(...e)}function kt(e){return e&&e.replace(/\/\*(?:(?!\*\/)[\s\S])*\*\/|[\r\n\t]+/g,"").replace(/ {2,}/g," ").replace(/ ([{:}]) /g,"$1").replace(/([;,]) /g,"$1").replace(/ !/g,"!").replace(/: /g,":")}function Pe(e){if(e&&/[\xC0-\xFF\u0100-\u017E]/.test(e)){const n={A:/[\xC0-\xC5\u0100\u0102\u0104]/g,AE:/[\xC6]/g,C:/[\xC7\u0106\u0108\u010A\u010C]/g,D:/[\xD0\u010E\u0110]/g,E:/[\xC8-\xCB\u0112\u0114\u0116\u0118\u011A]/g,G:/[\u011C\u011E\u0120\u0122]/g,H:/[\u0124\u0126]/g,I:/[\xCC-\xCF\u0128\u012A\u012C\u012E\u0130]/g,IJ:/[\u0132]/g,J:/[\u0134]/g,K:/[\u0136]/g,L:/[\u0139\u013B\u013D\u013F\u0141]/g,N:/[\xD1\u0143\u0145\u0147\u014A]/g,O:/[\xD2-\xD6\xD8\u014C\u014E\u0150]/g,OE:/[\u0152]/g,R:/[\u0154\u0156\u0158]/g,S:/[\u015A\u015C\u015E\u0160]/g,T:/[\u0162\u0164\u0166]/g,U:/[\xD9-\xDC\u0168\u016A\u016C\u016E\u0170\u0172]/g,W:/[\u0174]/g,Y:/[\xDD\u0176\u0178]/g,Z:/[\u0179\u017B\u017D]/g,a:/[\xE0-\xE5\u0101\u0103\u0105]/g,ae:/[\xE6]/g,c:/[\xE7\u0107\u0109\u010B\u010D]/g,d:/[\u010F\u0111]/g,e:/[\xE8-\xEB\u0113\u0115\u0117\u0119\u011B]/g,g:/[\u011D\u011F\u0121\u0123]/g,i:/[\xEC-\xEF\u0129\u012B\u012D\u012F\u0131]/g,ij:/[\u0133]/g,j:/[\u0135]/g,k:/[\u0137,\u0138]/g,l:/[\u013A\u013C\u013E\u0140\u0142]/g,n:/[\xF1\u0144\u0146\u0148\u014B]/g,p:/[\xFE]/g,o:/[\xF2-\xF6\xF8\u014D\u014F\u0151]/g,oe:/[\u0153]/g,r:/[\u0155\u0157\u0159]/g,s:/[\u015B\u015D\u015F\u0161]/g,t:/[\u0163\u0165\u0167]/g,u:/[\xF9-\xFC\u0169\u016B\u016D\u016F\u0171\u0173]/g,w:/[\u0175]/g,y:/[\xFD\xFF\u0177]/g,z:/[\u017A\u017C\u017E]/g};for(const o in n)e=e.replace(n[o],o)}return e}function Uo(e,t,n){e&&t!==n&&(n>=e.length&&(n%=e.length,t%=e.length),e.splice(n,0,e.splice(t,1)[0]))}function eo(e,t,n=1,o,i=1){const r=dl(e,t,o,n);let a=n;return(he(e)||he(t))&&(a=i===1?n:i),a*r}function ml(e){return Se(e,!1)?e[0].toUpperCase()+e.slice(1):e}function gi(e){return Se(e)?e.replace(/(_)/g,"-").replace(/[A-Z]/g,(t,n)=>n===0?t:"-"+t.toLowerCase()).toLowerCase():e}function _o(e){return Se(e)?e.replace(/[A-Z]/g,(t,n)=>n===0?t:"."+t.toLowerCase()).toLowerCase():e}var Cn={};function bl(e="pui_id_"){return Object.hasOwn(Cn,e)||(Cn[e]=0),Cn[e]++,`${e}${Cn[e]}`}function gl(){let e=[];const t=(a,l,s=999)=>{const u=i(a,l,s),d=u.value+(u.key===a?0:s)+1;return e.push({key:a,value:d}),d},n=a=>{e=e.filter(l=>l.value!==a)},o=(a,l)=>i(a).value,i=(a,l,s=0)=>[...e].reverse().find(u=>!0)||{key:a,value:s},r=a=>a&&parseInt(a.style.zIndex,10)||0;return{get:r,set:(a,l,s)=>{l&&(l.style.zIndex=String(t(a,!0,s)))},clear:a=>{a&&(n(r(a)),a.style.zIndex="")},getCurrent:a=>o(a)}}var me=gl(),yl=Object.defineProperty,vl=Object.defineProperties,wl=Object.getOwnPropertyDescriptors,En=Object.getOwnPropertySymbols,yi=Object.prototype.hasOwnProperty,vi=Object.prototype.propertyIsEnumerable,Wo=(e,t,n)=>t in e?yl(e,t,{enumerable:!0,configurable:!0,writable:!0,value:n}):e[t]=n,Me=(e,t)=>{for(var n in t||(t={}))yi.call(t,n)&&Wo(e,n,t[n]);if(En)for(var n of En(t))vi.call(t,n)&&Wo(e,n,t[n]);return e},qn=(e,t)=>vl(e,wl(t)),Ne=(e,t)=>{var n={};for(var o in e)yi.call(e,o)&&t.indexOf(o)<0&&(n[o]=e[o]);if(e!=null&&En)for(var o of En(e))t.indexOf(o)<0&&vi.call(e,o)&&(n[o]=e[o]);return n};function mb(...e){return mi(...e)}var Cl=bn(),ye=Cl;function Zo(e,t){Nn(e)?e.push(...t||[]):Ke(e)&&Object.assign(e,t)}function Sl(e){return Ke(e)&&e.hasOwnProperty("$value")&&e.hasOwnProperty("$type")?e.$value:e}function $l(e){return e.replaceAll(/ /g,"").replace(/[^\w]/g,"-")}function to(e="",t=""){return $l(`${Se(e,!1)&&Se(t,!1)?`${e}-`:e}${t}`)}function wi(e="",t=""){return`--${to(e,t)}`}function kl(e=""){const t=(e.match(/{/g)||[]).length,n=(e.match(/}/g)||[]).length;return(t+n)%2!==0}function Ci(e,t="",n="",o=[],i){if(Se(e)){const r=/{([^}]*)}/g,a=e.trim();if(kl(a))return;if(He(a,r)){const l=a.replaceAll(r,d=>{const h=d.replace(/{|}/g,"").split(".").filter(m=>!o.some(w=>He(m,w)));return`var(${wi(n,gi(h.join("-")))}${A(i)?`, ${i}`:""})`}),s=/(\d+\s+[\+\-\*\/]\s+\d+)/g,u=/var\([^)]+\)/g;return He(l.replace(u,"0"),s)?`calc(${l})`:l}return a}else if(fl(e))return e}function Il(e,t,n){Se(t,!1)&&e.push(`${t}:${n};`)}function ut(e,t){return e?`${e}{${t}}`:""}var Si=e=>{var t;const n=ee.getTheme(),o=no(n,e,void 0,"variable"),i=(t=o==null?void 0:o.match(/--[\w-]+/g))==null?void 0:t[0],r=no(n,e,void 0,"value");return{name:i,variable:o,value:r}},It=(...e)=>no(ee.getTheme(),...e),no=(e={},t,n,o)=>{if(t){const{variable:i,options:r}=ee.defaults||{},{prefix:a,transform:l}=(e==null?void 0:e.options)||r||{},u=He(t,/{([^}]*)}/g)?t:`{${t}}`;return o==="value"||he(o)&&l==="strict"?ee.getTokenValue(t):Ci(u,void 0,a,[i.excludedKeyRegex],n)}return""};function Pl(e,t={}){const n=ee.defaults.variable,{prefix:o=n.prefix,selector:i=n.selector,excludedKeyRegex:r=n.excludedKeyRegex}=t,a=(u,d="")=>Object.entries(u).reduce((p,[h,m])=>{const w=He(h,r)?to(d):to(d,gi(h)),$=Sl(m);if(Ke($)){const{variables:v,tokens:I}=a($,w);Zo(p.tokens,I),Zo(p.variables,v)}else p.tokens.push((o?w.replace(`${o}-`,""):w).replaceAll("-",".")),Il(p.variables,wi(w),Ci($,w,o,[r]));return p},{variables:[],tokens:[]}),{variables:l,tokens:s}=a(e,o);return{value:l,tokens:s,declarations:l.join(""),css:ut(i,l.join(""))}}var Te={regex:{rules:{class:{pattern:/^\.([a-zA-Z][\w-]*)$/,resolve(e){return{type:"class",selector:e,matched:this.pattern.test(e.trim())}}},attr:{pattern:/^\[(.*)\]$/,resolve(e){return{type:"attr",selector:`:root${e}`,matched:this.pattern.test(e.trim())}}},media:{pattern:/^@media (.*)$/,resolve(e){return{type:"media",selector:`${e}{:root{[CSS]}}`,matched:this.pattern.test(e.trim())}}},system:{pattern:/^system$/,resolve(e){return{type:"system",selector:"@media (prefers-color-scheme: dark){:root{[CSS]}}",matched:this.pattern.test(e.trim())}}},custom:{resolve(e){return{type:"custom",selector:e,matched:!0}}}},resolve(e){const t=Object.keys(this.rules).filter(n=>n!=="custom").map(n=>this.rules[n]);return[e].flat().map(n=>{var o;return(o=t.map(i=>i.resolve(n)).find(i=>i.matched))!=null?o:this.rules.custom.resolve(n)})}},_toVariables(e,t){return Pl(e,{prefix:t==null?void 0:t.prefix})},getCommon({name:e="",theme:t={},params:n,set:o,defaults:i}){var r,a,l,s,u,d,p;const{preset:h,options:m}=t;let w,$,v,I,P,L,g;if(A(h)&&m.transform!=="strict"){const{primitive:F,semantic:G,extend:V}=h,W=G||{},{colorScheme:ie}=W,de=Ne(W,["colorScheme"]),X=V||{},{colorScheme:le}=X,be=Ne(X,["colorScheme"]),ge=ie||{},{dark:ae}=ge,x=Ne(ge,["dark"]),S=le||{},{dark:O}=S,D=Ne(S,["dark"]),z=A(F)?this._toVariables({primitive:F},m):{},B=A(de)?this._toVariables({semantic:de},m):{},Q=A(x)?this._toVariables({light:x},m):{},ce=A(ae)?this._toVariables({dark:ae},m):{},se=A(be)?this._toVariables({semantic:be},m):{},Fe=A(D)?this._toVariables({light:D},m):{},Le=A(O)?this._toVariables({dark:O},m):{},[Ve,Ca]=[(r=z.declarations)!=null?r:"",z.tokens],[Sa,$a]=[(a=B.declarations)!=null?a:"",B.tokens||[]],[ka,Ia]=[(l=Q.declarations)!=null?l:"",Q.tokens||[]],[Pa,Oa]=[(s=ce.declarations)!=null?s:"",ce.tokens||[]],[xa,Ra]=[(u=se.declarations)!=null?u:"",se.tokens||[]],[La,Ta]=[(d=Fe.declarations)!=null?d:"",Fe.tokens||[]],[Ma,Ea]=[(p=Le.declarations)!=null?p:"",Le.tokens||[]];w=this.transformCSS(e,Ve,"light","variable",m,o,i),$=Ca;const Da=this.transformCSS(e,`${Sa}${ka}`,"light","variable",m,o,i),Fa=this.transformCSS(e,`${Pa}`,"dark","variable",m,o,i);v=`${Da}${Fa}`,I=[...new Set([...$a,...Ia,...Oa])];const Ba=this.transformCSS(e,`${xa}${La}color-scheme:light`,"light","variable",m,o,i),za=this.transformCSS(e,`${Ma}color-scheme:dark`,"dark","variable",m,o,i);P=`${Ba}${za}`,L=[...new Set([...Ra,...Ta,...Ea])],g=Ce(h.css,{dt:It})}return{primitive:{css:w,tokens:$},semantic:{css:v,tokens:I},global:{css:P,tokens:L},style:g}},getPreset({name:e="",preset:t={},options:n,params:o,set:i,defaults:r,selector:a}){var l,s,u;let d,p,h;if(A(t)&&n.transform!=="strict"){const m=e.replace("-directive",""),w=t,{colorScheme:$,extend:v,css:I}=w,P=Ne(w,["colorScheme","extend","css"]),L=v||{},{colorScheme:g}=L,F=Ne(L,["colorScheme"]),G=$||{},{dark:V}=G,W=Ne(G,["dark"]),ie=g||{},{dark:de}=ie,X=Ne(ie,["dark"]),le=A(P)?this._toVariables({[m]:Me(Me({},P),F)},n):{},be=A(W)?this._toVariables({[m]:Me(Me({},W),X)},n):{},ge=A(V)?this._toVariables({[m]:Me(Me({},V),de)},n):{},[ae,x]=[(l=le.declarations)!=null?l:"",le.tokens||[]],[S,O]=[(s=be.declarations)!=null?s:"",be.tokens||[]],[D,z]=[(u=ge.declarations)!=null?u:"",ge.tokens||[]],B=this.transformCSS(m,`${ae}${S}`,"light","variable",n,i,r,a),Q=this.transformCSS(m,D,"dark","variable",n,i,r,a);d=`${B}${Q}`,p=[...new Set([...x,...O,...z])],h=Ce(I,{dt:It})}return{css:d,tokens:p,style:h}},getPresetC({name:e="",theme:t={},params:n,set:o,defaults:i}){var r;const{preset:a,options:l}=t,s=(r=a==null?void 0:a.components)==null?void 0:r[e];return this.getPreset({name:e,preset:s,options:l,params:n,set:o,defaults:i})},getPresetD({name:e="",theme:t={},params:n,set:o,defaults:i}){var r,a;const l=e.replace("-directive",""),{preset:s,options:u}=t,d=((r=s==null?void 0:s.components)==null?void 0:r[l])||((a=s==null?void 0:s.directives)==null?void 0:a[l]);return this.getPreset({name:l,preset:d,options:u,params:n,set:o,defaults:i})},applyDarkColorScheme(e){return!(e.darkModeSelector==="none"||e.darkModeSelector===!1)},getColorSchemeOption(e,t){var n;return this.applyDarkColorScheme(e)?this.regex.resolve(e.darkModeSelector===!0?t.options.darkModeSelector:(n=e.darkModeSelector)!=null?n:t.options.darkModeSelector):[]},getLayerOrder(e,t={},n,o){const{cssLayer:i}=t;return i?`@layer ${Ce(i.order||"primeui",n)}`:""},getCommonStyleSheet({name:e="",theme:t={},params:n,props:o={},set:i,defaults:r}){const a=this.getCommon({name:e,theme:t,params:n,set:i,defaults:r}),l=Object.entries(o).reduce((s,[u,d])=>s.push(`${u}="${d}"`)&&s,[]).join(" ");return Object.entries(a||{}).reduce((s,[u,d])=>{if(d!=null&&d.css){const p=kt(d==null?void 0:d.css),h=`${u}-variables`;s.push(`<style type="text/css" data-primevue-style-id="${h}" ${l}>${p}</style>`)}return s},[]).join("")},getStyleSheet({name:e="",theme:t={},params:n,props:o={},set:i,defaults:r}){var a;const l={name:e,theme:t,params:n,set:i,defaults:r},s=(a=e.includes("-directive")?this.getPresetD(l):this.getPresetC(l))==null?void 0:a.css,u=Object.entries(o).reduce((d,[p,h])=>d.push(`${p}="${h}"`)&&d,[]).join(" ");return s?`<style type="text/css" data-primevue-style-id="${e}-variables" ${u}>${kt(s)}</style>`:""},createTokens(e={},t,n="",o="",i={}){return Object.entries(e).forEach(([r,a])=>{const l=He(r,t.variable.excludedKeyRegex)?n:n?`${n}.${_o(r)}`:_o(r),s=o?`${o}.${r}`:r;Ke(a)?this.createTokens(a,t,l,s,i):(i[l]||(i[l]={paths:[],computed(u,d={}){var p,h;return this.paths.length===1?(p=this.paths[0])==null?void 0:p.computed(this.paths[0].scheme,d.binding):u&&u!=="none"?(h=this.paths.find(m=>m.scheme===u))==null?void 0:h.computed(u,d.binding):this.paths.map(m=>m.computed(m.scheme,d[m.scheme]))}}),i[l].paths.push({path:s,value:a,scheme:s.includes("colorScheme.light")?"light":s.includes("colorScheme.dark")?"dark":"none",computed(u,d={}){const p=/{([^}]*)}/g;let h=a;if(d.name=this.path,d.binding||(d.binding={}),He(a,p)){const w=a.trim().replaceAll(p,I=>{var P;const L=I.replace(/{|}/g,""),g=(P=i[L])==null?void 0:P.computed(u,d);return Nn(g)&&g.length===2?`light-dark(${g[0].value},${g[1].value})`:g==null?void 0:g.value}),$=/(\d+\w*\s+[\+\-\*\/]\s+\d+\w*)/g,v=/var\([^)]+\)/g;h=He(w.replace(v,"0"),$)?`calc(${w})`:w}return he(d.binding)&&delete d.binding,{colorScheme:u,path:this.path,paths:d,value:h.includes("undefined")?void 0:h}}}))}),i},getTokenValue(e,t,n){var o;const r=(s=>s.split(".").filter(d=>!He(d.toLowerCase(),n.variable.excludedKeyRegex)).join("."))(t),a=t.includes("colorScheme.light")?"light":t.includes("colorScheme.dark")?"dark":void 0,l=[(o=e[r])==null?void 0:o.computed(a)].flat().filter(s=>s);return l.length===1?l[0].value:l.reduce((s={},u)=>{const d=u,{colorScheme:p}=d,h=Ne(d,["colorScheme"]);return s[p]=h,s},void 0)},getSelectorRule(e,t,n,o){return n==="class"||n==="attr"?ut(A(t)?`${e}${t},${e} ${t}`:e,o):ut(e,A(t)?ut(t,o):o)},transformCSS(e,t,n,o,i={},r,a,l){if(A(t)){const{cssLayer:s}=i;if(o!=="style"){const u=this.getColorSchemeOption(i,a);t=n==="dark"?u.reduce((d,{type:p,selector:h})=>(A(h)&&(d+=h.includes("[CSS]")?h.replace("[CSS]",t):this.getSelectorRule(h,l,p,t)),d),""):ut(l!=null?l:":root",t)}if(s){const u={name:"primeui"};Ke(s)&&(u.name=Ce(s.name,{name:e,type:o})),A(u.name)&&(t=ut(`@layer ${u.name}`,t),r==null||r.layerNames(u.name))}return t}return""}},ee={defaults:{variable:{prefix:"p",selector:":root",excludedKeyRegex:/^(primitive|semantic|components|directives|variables|colorscheme|light|dark|common|root|states|extend|css)$/gi},options:{prefix:"p",darkModeSelector:"system",cssLayer:!1}},_theme:void 0,_layerNames:new Set,_loadedStyleNames:new Set,_loadingStyles:new Set,_tokens:{},update(e={}){const{theme:t}=e;t&&(this._theme=qn(Me({},t),{options:Me(Me({},this.defaults.options),t.options)}),this._tokens=Te.createTokens(this.preset,this.defaults),this.clearLoadedStyleNames())},get theme(){return this._theme},get preset(){var e;return((e=this.theme)==null?void 0:e.preset)||{}},get options(){var e;return((e=this.theme)==null?void 0:e.options)||{}},get tokens(){return this._tokens},getTheme(){return this.theme},setTheme(e){this.update({theme:e}),ye.emit("theme:change",e)},getPreset(){return this.preset},setPreset(e){this._theme=qn(Me({},this.theme),{preset:e}),this._tokens=Te.createTokens(e,this.defaults),this.clearLoadedStyleNames(),ye.emit("preset:change",e),ye.emit("theme:change",this.theme)},getOptions(){return this.options},setOptions(e){this._theme=qn(Me({},this.theme),{options:e}),this.clearLoadedStyleNames(),ye.emit("options:change",e),ye.emit("theme:change",this.theme)},getLayerNames(){return[...this._layerNames]},setLayerNames(e){this._layerNames.add(e)},getLoadedStyleNames(){return this._loadedStyleNames},isStyleNameLoaded(e){return this._loadedStyleNames.has(e)},setLoadedStyleName(e){this._loadedStyleNames.add(e)},deleteLoadedStyleName(e){this._loadedStyleNames.delete(e)},clearLoadedStyleNames(){this._loadedStyleNames.clear()},getTokenValue(e){return Te.getTokenValue(this.tokens,e,this.defaults)},getCommon(e="",t){return Te.getCommon({name:e,theme:this.theme,params:t,defaults:this.defaults,set:{layerNames:this.setLayerNames.bind(this)}})},getComponent(e="",t){const n={name:e,theme:this.theme,params:t,defaults:this.defaults,set:{layerNames:this.setLayerNames.bind(this)}};return Te.getPresetC(n)},getDirective(e="",t){const n={name:e,theme:this.theme,params:t,defaults:this.defaults,set:{layerNames:this.setLayerNames.bind(this)}};return Te.getPresetD(n)},getCustomPreset(e="",t,n,o){const i={name:e,preset:t,options:this.options,selector:n,params:o,defaults:this.defaults,set:{layerNames:this.setLayerNames.bind(this)}};return Te.getPreset(i)},getLayerOrderCSS(e=""){return Te.getLayerOrder(e,this.options,{names:this.getLayerNames()},this.defaults)},transformCSS(e="",t,n="style",o){return Te.transformCSS(e,t,o,n,this.options,{layerNames:this.setLayerNames.bind(this)},this.defaults)},getCommonStyleSheet(e="",t,n={}){return Te.getCommonStyleSheet({name:e,theme:this.theme,params:t,props:n,defaults:this.defaults,set:{layerNames:this.setLayerNames.bind(this)}})},getStyleSheet(e,t,n={}){return Te.getStyleSheet({name:e,theme:this.theme,params:t,props:n,defaults:this.defaults,set:{layerNames:this.setLayerNames.bind(this)}})},onStyleMounted(e){this._loadingStyles.add(e)},onStyleUpdated(e){this._loadingStyles.add(e)},onStyleLoaded(e,{name:t}){this._loadingStyles.size&&(this._loadingStyles.delete(t),ye.emit(`theme:${t}:load`,e),!this._loadingStyles.size&&ye.emit("theme:load"))}},_e={_loadedStyleNames:new Set,getLoadedStyleNames:function(){return this._loadedStyleNames},isStyleNameLoaded:function(t){return this._loadedStyleNames.has(t)},setLoadedStyleName:function(t){this._loadedStyleNames.add(t)},deleteLoadedStyleName:function(t){this._loadedStyleNames.delete(t)},clearLoadedStyleNames:function(){this._loadedStyleNames.clear()}},Ol=({dt:e})=>`
-*,
-::before,
-::after {
-    box-sizing: border-box;
-}
-
-/* Non vue overlay animations */
-.p-connected-overlay {
-    opacity: 0;
-    transform: scaleY(0.8);
-    transition: transform 0.12s cubic-bezier(0, 0, 0.2, 1),
-        opacity 0.12s cubic-bezier(0, 0, 0.2, 1);
-}
-
-.p-connected-overlay-visible {
-    opacity: 1;
-    transform: scaleY(1);
-}
-
-.p-connected-overlay-hidden {
-    opacity: 0;
-    transform: scaleY(1);
-    transition: opacity 0.1s linear;
-}
-
-/* Vue based overlay animations */
-.p-connected-overlay-enter-from {
-    opacity: 0;
-    transform: scaleY(0.8);
-}
-
-.p-connected-overlay-leave-to {
-    opacity: 0;
-}
-
-.p-connected-overlay-enter-active {
-    transition: transform 0.12s cubic-bezier(0, 0, 0.2, 1),
-        opacity 0.12s cubic-bezier(0, 0, 0.2, 1);
-}
-
-.p-connected-overlay-leave-active {
-    transition: opacity 0.1s linear;
-}
-
-/* Toggleable Content */
-.p-toggleable-content-enter-from,
-.p-toggleable-content-leave-to {
-    max-height: 0;
-}
-
-.p-toggleable-content-enter-to,
-.p-toggleable-content-leave-from {
-    max-height: 1000px;
-}
-
-.p-toggleable-content-leave-active {
-    overflow: hidden;
-    transition: max-height 0.45s cubic-bezier(0, 1, 0, 1);
-}
-
-.p-toggleable-content-enter-active {
-    overflow: hidden;
-    transition: max-height 1s ease-in-out;
-}
-
-.p-disabled,
-.p-disabled * {
-    cursor: default;
-    pointer-events: none;
-    user-select: none;
-}
-
-.p-disabled,
-.p-component:disabled {
-    opacity: ${e("disabled.opacity")};
-}
-
-.pi {
-    font-size: ${e("icon.size")};
-}
-
-.p-icon {
-    width: ${e("icon.size")};
-    height: ${e("icon.size")};
-}
-
-.p-overlay-mask {
-    background: ${e("mask.background")};
-    color: ${e("mask.color")};
-    position: fixed;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-}
-
-.p-overlay-mask-enter {
-    animation: p-overlay-mask-enter-animation ${e("mask.transition.duration")} forwards;
-}
-
-.p-overlay-mask-leave {
-    animation: p-overlay-mask-leave-animation ${e("mask.transition.duration")} forwards;
-}
-
-@keyframes p-overlay-mask-enter-animation {
-    from {
-        background: transparent;
-    }
-    to {
-        background: ${e("mask.background")};
-    }
-}
-@keyframes p-overlay-mask-leave-animation {
-    from {
-        background: ${e("mask.background")};
-    }
-    to {
-        background: transparent;
-    }
-}
-`;function Ot(e){"@babel/helpers - typeof";return Ot=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ot(e)}function qo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Yo(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?qo(Object(n),!0).forEach(function(o){xl(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):qo(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function xl(e,t,n){return(t=Rl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Rl(e){var t=Ll(e,"string");return Ot(t)=="symbol"?t:t+""}function Ll(e,t){if(Ot(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Ot(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Tl(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!0;jo()&&jo().components?Ka(e):t?e():ja(e)}var Ml=0;function El(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},n=On(!1),o=On(e),i=On(null),r=fi()?window.document:void 0,a=t.document,l=a===void 0?r:a,s=t.immediate,u=s===void 0?!0:s,d=t.manual,p=d===void 0?!1:d,h=t.name,m=h===void 0?"style_".concat(++Ml):h,w=t.id,$=w===void 0?void 0:w,v=t.media,I=v===void 0?void 0:v,P=t.nonce,L=P===void 0?void 0:P,g=t.first,F=g===void 0?!1:g,G=t.onMounted,V=G===void 0?void 0:G,W=t.onUpdated,ie=W===void 0?void 0:W,de=t.onLoad,X=de===void 0?void 0:de,le=t.props,be=le===void 0?{}:le,ge=function(){},ae=function(O){var D=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(l){var z=Yo(Yo({},be),D),B=z.name||m,Q=z.id||$,ce=z.nonce||L;i.value=l.querySelector('style[data-primevue-style-id="'.concat(B,'"]'))||l.getElementById(Q)||l.createElement("style"),i.value.isConnected||(o.value=O||e,Tn(i.value,{type:"text/css",id:Q,media:I,nonce:ce}),F?l.head.prepend(i.value):l.head.appendChild(i.value),mn(i.value,"data-primevue-style-id",B),Tn(i.value,z),i.value.onload=function(se){return X==null?void 0:X(se,{name:B})},V==null||V(B)),!n.value&&(ge=Ct(o,function(se){i.value.textContent=se,ie==null||ie(B)},{immediate:!0}),n.value=!0)}},x=function(){!l||!n.value||(ge(),tl(i.value)&&l.head.removeChild(i.value),n.value=!1,i.value=null)};return u&&!p&&Tl(ae),{id:$,name:m,el:i,css:o,unload:x,load:ae,isLoaded:Aa(n)}}function xt(e){"@babel/helpers - typeof";return xt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},xt(e)}function Jo(e,t){return zl(e)||Bl(e,t)||Fl(e,t)||Dl()}function Dl(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Fl(e,t){if(e){if(typeof e=="string")return Xo(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Xo(e,t):void 0}}function Xo(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function Bl(e,t){var n=e==null?null:typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var o,i,r,a,l=[],s=!0,u=!1;try{if(r=(n=n.call(e)).next,t!==0)for(;!(s=(o=r.call(n)).done)&&(l.push(o.value),l.length!==t);s=!0);}catch(d){u=!0,i=d}finally{try{if(!s&&n.return!=null&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return l}}function zl(e){if(Array.isArray(e))return e}function Qo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Yn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Qo(Object(n),!0).forEach(function(o){Al(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Qo(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Al(e,t,n){return(t=jl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jl(e){var t=Kl(e,"string");return xt(t)=="symbol"?t:t+""}function Kl(e,t){if(xt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(xt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Vl=function(t){var n=t.dt;return`
-.p-hidden-accessible {
-    border: 0;
-    clip: rect(0 0 0 0);
-    height: 1px;
-    margin: -1px;
-    opacity: 0;
-    overflow: hidden;
-    padding: 0;
-    pointer-events: none;
-    position: absolute;
-    white-space: nowrap;
-    width: 1px;
-}
-
-.p-overflow-hidden {
-    overflow: hidden;
-    padding-right: `.concat(n("scrollbar.width"),`;
-}
-`)},Nl={},Hl={},N={name:"base",css:Vl,style:Ol,classes:Nl,inlineStyles:Hl,load:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:function(r){return r},i=o(Ce(t,{dt:It}));return A(i)?El(kt(i),Yn({name:this.name},n)):{}},loadCSS:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{};return this.load(this.css,t)},loadStyle:function(){var t=this,n=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"";return this.load(this.style,n,function(){var i=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"";return ee.transformCSS(n.name||t.name,"".concat(i).concat(o))})},getCommonTheme:function(t){return ee.getCommon(this.name,t)},getComponentTheme:function(t){return ee.getComponent(this.name,t)},getDirectiveTheme:function(t){return ee.getDirective(this.name,t)},getPresetTheme:function(t,n,o){return ee.getCustomPreset(this.name,t,n,o)},getLayerOrderThemeCSS:function(){return ee.getLayerOrderCSS(this.name)},getStyleSheet:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(this.css){var o=Ce(this.css,{dt:It})||"",i=kt("".concat(o).concat(t)),r=Object.entries(n).reduce(function(a,l){var s=Jo(l,2),u=s[0],d=s[1];return a.push("".concat(u,'="').concat(d,'"'))&&a},[]).join(" ");return A(i)?'<style type="text/css" data-primevue-style-id="'.concat(this.name,'" ').concat(r,">").concat(i,"</style>"):""}return""},getCommonThemeStyleSheet:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return ee.getCommonStyleSheet(this.name,t,n)},getThemeStyleSheet:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},o=[ee.getStyleSheet(this.name,t,n)];if(this.style){var i=this.name==="base"?"global-style":"".concat(this.name,"-style"),r=Ce(this.style,{dt:It}),a=kt(ee.transformCSS(i,r)),l=Object.entries(n).reduce(function(s,u){var d=Jo(u,2),p=d[0],h=d[1];return s.push("".concat(p,'="').concat(h,'"'))&&s},[]).join(" ");A(a)&&o.push('<style type="text/css" data-primevue-style-id="'.concat(i,'" ').concat(l,">").concat(a,"</style>"))}return o.join("")},extend:function(t){return Yn(Yn({},this),{},{css:void 0,style:void 0},t)}};function Gl(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"pc",t=Va();return"".concat(e).concat(t.replace("v-","").replaceAll("-","_"))}var er=N.extend({name:"common"});function Rt(e){"@babel/helpers - typeof";return Rt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Rt(e)}function Ul(e){return Ii(e)||_l(e)||ki(e)||$i()}function _l(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function yt(e,t){return Ii(e)||Wl(e,t)||ki(e,t)||$i()}function $i(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function ki(e,t){if(e){if(typeof e=="string")return tr(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?tr(e,t):void 0}}function tr(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function Wl(e,t){var n=e==null?null:typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var o,i,r,a,l=[],s=!0,u=!1;try{if(r=(n=n.call(e)).next,t===0){if(Object(n)!==n)return;s=!1}else for(;!(s=(o=r.call(n)).done)&&(l.push(o.value),l.length!==t);s=!0);}catch(d){u=!0,i=d}finally{try{if(!s&&n.return!=null&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return l}}function Ii(e){if(Array.isArray(e))return e}function nr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Z(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?nr(Object(n),!0).forEach(function(o){St(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):nr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function St(e,t,n){return(t=Zl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Zl(e){var t=ql(e,"string");return Rt(t)=="symbol"?t:t+""}function ql(e,t){if(Rt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Rt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var U={name:"BaseComponent",props:{pt:{type:Object,default:void 0},ptOptions:{type:Object,default:void 0},unstyled:{type:Boolean,default:void 0},dt:{type:Object,default:void 0}},inject:{$parentInstance:{default:void 0}},watch:{isUnstyled:{immediate:!0,handler:function(t){ye.off("theme:change",this._loadCoreStyles),t||(this._loadCoreStyles(),this._themeChangeListener(this._loadCoreStyles))}},dt:{immediate:!0,handler:function(t,n){var o=this;ye.off("theme:change",this._themeScopedListener),t?(this._loadScopedThemeStyles(t),this._themeScopedListener=function(){return o._loadScopedThemeStyles(t)},this._themeChangeListener(this._themeScopedListener)):this._unloadScopedThemeStyles()}}},scopedStyleEl:void 0,rootEl:void 0,uid:void 0,$attrSelector:void 0,beforeCreate:function(){var t,n,o,i,r,a,l,s,u,d,p,h=(t=this.pt)===null||t===void 0?void 0:t._usept,m=h?(n=this.pt)===null||n===void 0||(n=n.originalValue)===null||n===void 0?void 0:n[this.$.type.name]:void 0,w=h?(o=this.pt)===null||o===void 0||(o=o.value)===null||o===void 0?void 0:o[this.$.type.name]:this.pt;(i=w||m)===null||i===void 0||(i=i.hooks)===null||i===void 0||(r=i.onBeforeCreate)===null||r===void 0||r.call(i);var $=(a=this.$primevueConfig)===null||a===void 0||(a=a.pt)===null||a===void 0?void 0:a._usept,v=$?(l=this.$primevue)===null||l===void 0||(l=l.config)===null||l===void 0||(l=l.pt)===null||l===void 0?void 0:l.originalValue:void 0,I=$?(s=this.$primevue)===null||s===void 0||(s=s.config)===null||s===void 0||(s=s.pt)===null||s===void 0?void 0:s.value:(u=this.$primevue)===null||u===void 0||(u=u.config)===null||u===void 0?void 0:u.pt;(d=I||v)===null||d===void 0||(d=d[this.$.type.name])===null||d===void 0||(d=d.hooks)===null||d===void 0||(p=d.onBeforeCreate)===null||p===void 0||p.call(d),this.$attrSelector=Gl(),this.uid=this.$attrs.id||this.$attrSelector.replace("pc","pv_id_")},created:function(){this._hook("onCreated")},beforeMount:function(){var t;this.rootEl=xe(rt(this.$el)?this.$el:(t=this.$el)===null||t===void 0?void 0:t.parentElement,"[".concat(this.$attrSelector,"]")),this.rootEl&&(this.rootEl.$pc=Z({name:this.$.type.name,attrSelector:this.$attrSelector},this.$params)),this._loadStyles(),this._hook("onBeforeMount")},mounted:function(){this._hook("onMounted")},beforeUpdate:function(){this._hook("onBeforeUpdate")},updated:function(){this._hook("onUpdated")},beforeUnmount:function(){this._hook("onBeforeUnmount")},unmounted:function(){this._removeThemeListeners(),this._unloadScopedThemeStyles(),this._hook("onUnmounted")},methods:{_hook:function(t){if(!this.$options.hostName){var n=this._usePT(this._getPT(this.pt,this.$.type.name),this._getOptionValue,"hooks.".concat(t)),o=this._useDefaultPT(this._getOptionValue,"hooks.".concat(t));n==null||n(),o==null||o()}},_mergeProps:function(t){for(var n=arguments.length,o=new Array(n>1?n-1:0),i=1;i<n;i++)o[i-1]=arguments[i];return Vn(t)?t.apply(void 0,o):f.apply(void 0,o)},_load:function(){_e.isStyleNameLoaded("base")||(N.loadCSS(this.$styleOptions),this._loadGlobalStyles(),_e.setLoadedStyleName("base")),this._loadThemeStyles()},_loadStyles:function(){this._load(),this._themeChangeListener(this._load)},_loadCoreStyles:function(){var t,n;!_e.isStyleNameLoaded((t=this.$style)===null||t===void 0?void 0:t.name)&&(n=this.$style)!==null&&n!==void 0&&n.name&&(er.loadCSS(this.$styleOptions),this.$options.style&&this.$style.loadCSS(this.$styleOptions),_e.setLoadedStyleName(this.$style.name))},_loadGlobalStyles:function(){var t=this._useGlobalPT(this._getOptionValue,"global.css",this.$params);A(t)&&N.load(t,Z({name:"global"},this.$styleOptions))},_loadThemeStyles:function(){var t,n;if(!(this.isUnstyled||this.$theme==="none")){if(!ee.isStyleNameLoaded("common")){var o,i,r=((o=this.$style)===null||o===void 0||(i=o.getCommonTheme)===null||i===void 0?void 0:i.call(o))||{},a=r.primitive,l=r.semantic,s=r.global,u=r.style;N.load(a==null?void 0:a.css,Z({name:"primitive-variables"},this.$styleOptions)),N.load(l==null?void 0:l.css,Z({name:"semantic-variables"},this.$styleOptions)),N.load(s==null?void 0:s.css,Z({name:"global-variables"},this.$styleOptions)),N.loadStyle(Z({name:"global-style"},this.$styleOptions),u),ee.setLoadedStyleName("common")}if(!ee.isStyleNameLoaded((t=this.$style)===null||t===void 0?void 0:t.name)&&(n=this.$style)!==null&&n!==void 0&&n.name){var d,p,h,m,w=((d=this.$style)===null||d===void 0||(p=d.getComponentTheme)===null||p===void 0?void 0:p.call(d))||{},$=w.css,v=w.style;(h=this.$style)===null||h===void 0||h.load($,Z({name:"".concat(this.$style.name,"-variables")},this.$styleOptions)),(m=this.$style)===null||m===void 0||m.loadStyle(Z({name:"".concat(this.$style.name,"-style")},this.$styleOptions),v),ee.setLoadedStyleName(this.$style.name)}if(!ee.isStyleNameLoaded("layer-order")){var I,P,L=(I=this.$style)===null||I===void 0||(P=I.getLayerOrderThemeCSS)===null||P===void 0?void 0:P.call(I);N.load(L,Z({name:"layer-order",first:!0},this.$styleOptions)),ee.setLoadedStyleName("layer-order")}}},_loadScopedThemeStyles:function(t){var n,o,i,r=((n=this.$style)===null||n===void 0||(o=n.getPresetTheme)===null||o===void 0?void 0:o.call(n,t,"[".concat(this.$attrSelector,"]")))||{},a=r.css,l=(i=this.$style)===null||i===void 0?void 0:i.load(a,Z({name:"".concat(this.$attrSelector,"-").concat(this.$style.name)},this.$styleOptions));this.scopedStyleEl=l.el},_unloadScopedThemeStyles:function(){var t;(t=this.scopedStyleEl)===null||t===void 0||(t=t.value)===null||t===void 0||t.remove()},_themeChangeListener:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:function(){};_e.clearLoadedStyleNames(),ye.on("theme:change",t)},_removeThemeListeners:function(){ye.off("theme:change",this._loadCoreStyles),ye.off("theme:change",this._load),ye.off("theme:change",this._themeScopedListener)},_getHostInstance:function(t){return t?this.$options.hostName?t.$.type.name===this.$options.hostName?t:this._getHostInstance(t.$parentInstance):t.$parentInstance:void 0},_getPropValue:function(t){var n;return this[t]||((n=this._getHostInstance(this))===null||n===void 0?void 0:n[t])},_getOptionValue:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};return Oo(t,n,o)},_getPTValue:function(){var t,n=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{},r=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!0,a=/./g.test(o)&&!!i[o.split(".")[0]],l=this._getPropValue("ptOptions")||((t=this.$primevueConfig)===null||t===void 0?void 0:t.ptOptions)||{},s=l.mergeSections,u=s===void 0?!0:s,d=l.mergeProps,p=d===void 0?!1:d,h=r?a?this._useGlobalPT(this._getPTClassValue,o,i):this._useDefaultPT(this._getPTClassValue,o,i):void 0,m=a?void 0:this._getPTSelf(n,this._getPTClassValue,o,Z(Z({},i),{},{global:h||{}})),w=this._getPTDatasets(o);return u||!u&&m?p?this._mergeProps(p,h,m,w):Z(Z(Z({},h),m),w):Z(Z({},m),w)},_getPTSelf:function(){for(var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=arguments.length,o=new Array(n>1?n-1:0),i=1;i<n;i++)o[i-1]=arguments[i];return f(this._usePT.apply(this,[this._getPT(t,this.$name)].concat(o)),this._usePT.apply(this,[this.$_attrsPT].concat(o)))},_getPTDatasets:function(){var t,n,o=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",i="data-pc-",r=o==="root"&&A((t=this.pt)===null||t===void 0?void 0:t["data-pc-section"]);return o!=="transition"&&Z(Z({},o==="root"&&Z(Z(St({},"".concat(i,"name"),Ae(r?(n=this.pt)===null||n===void 0?void 0:n["data-pc-section"]:this.$.type.name)),r&&St({},"".concat(i,"extend"),Ae(this.$.type.name))),{},St({},"".concat(this.$attrSelector),""))),{},St({},"".concat(i,"section"),Ae(o)))},_getPTClassValue:function(){var t=this._getOptionValue.apply(this,arguments);return Se(t)||Nn(t)?{class:t}:t},_getPT:function(t){var n=this,o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",i=arguments.length>2?arguments[2]:void 0,r=function(l){var s,u=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1,d=i?i(l):l,p=Ae(o),h=Ae(n.$name);return(s=u?p!==h?d==null?void 0:d[p]:void 0:d==null?void 0:d[p])!==null&&s!==void 0?s:d};return t!=null&&t.hasOwnProperty("_usept")?{_usept:t._usept,originalValue:r(t.originalValue),value:r(t.value)}:r(t,!0)},_usePT:function(t,n,o,i){var r=function($){return n($,o,i)};if(t!=null&&t.hasOwnProperty("_usept")){var a,l=t._usept||((a=this.$primevueConfig)===null||a===void 0?void 0:a.ptOptions)||{},s=l.mergeSections,u=s===void 0?!0:s,d=l.mergeProps,p=d===void 0?!1:d,h=r(t.originalValue),m=r(t.value);return h===void 0&&m===void 0?void 0:Se(m)?m:Se(h)?h:u||!u&&m?p?this._mergeProps(p,h,m):Z(Z({},h),m):m}return r(t)},_useGlobalPT:function(t,n,o){return this._usePT(this.globalPT,t,n,o)},_useDefaultPT:function(t,n,o){return this._usePT(this.defaultPT,t,n,o)},ptm:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return this._getPTValue(this.pt,t,Z(Z({},this.$params),n))},ptmi:function(){var t,n=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},i=f(this.$_attrsWithoutPT,this.ptm(n,o));return i!=null&&i.hasOwnProperty("id")&&((t=i.id)!==null&&t!==void 0||(i.id=this.$id)),i},ptmo:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};return this._getPTValue(t,n,Z({instance:this},o),!1)},cx:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return this.isUnstyled?void 0:this._getOptionValue(this.$style.classes,t,Z(Z({},this.$params),n))},sx:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!0,o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};if(n){var i=this._getOptionValue(this.$style.inlineStyles,t,Z(Z({},this.$params),o)),r=this._getOptionValue(er.inlineStyles,t,Z(Z({},this.$params),o));return[r,i]}}},computed:{globalPT:function(){var t,n=this;return this._getPT((t=this.$primevueConfig)===null||t===void 0?void 0:t.pt,void 0,function(o){return Ce(o,{instance:n})})},defaultPT:function(){var t,n=this;return this._getPT((t=this.$primevueConfig)===null||t===void 0?void 0:t.pt,void 0,function(o){return n._getOptionValue(o,n.$name,Z({},n.$params))||Ce(o,Z({},n.$params))})},isUnstyled:function(){var t;return this.unstyled!==void 0?this.unstyled:(t=this.$primevueConfig)===null||t===void 0?void 0:t.unstyled},$id:function(){return this.$attrs.id||this.uid},$inProps:function(){var t,n=Object.keys(((t=this.$.vnode)===null||t===void 0?void 0:t.props)||{});return Object.fromEntries(Object.entries(this.$props).filter(function(o){var i=yt(o,1),r=i[0];return n==null?void 0:n.includes(r)}))},$theme:function(){var t;return(t=this.$primevueConfig)===null||t===void 0?void 0:t.theme},$style:function(){return Z(Z({classes:void 0,inlineStyles:void 0,load:function(){},loadCSS:function(){},loadStyle:function(){}},(this._getHostInstance(this)||{}).$style),this.$options.style)},$styleOptions:function(){var t;return{nonce:(t=this.$primevueConfig)===null||t===void 0||(t=t.csp)===null||t===void 0?void 0:t.nonce}},$primevueConfig:function(){var t;return(t=this.$primevue)===null||t===void 0?void 0:t.config},$name:function(){return this.$options.hostName||this.$.type.name},$params:function(){var t=this._getHostInstance(this)||this.$parent;return{instance:this,props:this.$props,state:this.$data,attrs:this.$attrs,parent:{instance:t,props:t==null?void 0:t.$props,state:t==null?void 0:t.$data,attrs:t==null?void 0:t.$attrs}}},$_attrsPT:function(){return Object.entries(this.$attrs||{}).filter(function(t){var n=yt(t,1),o=n[0];return o==null?void 0:o.startsWith("pt:")}).reduce(function(t,n){var o=yt(n,2),i=o[0],r=o[1],a=i.split(":"),l=Ul(a),s=l.slice(1);return s==null||s.reduce(function(u,d,p,h){return!u[d]&&(u[d]=p===h.length-1?r:{}),u[d]},t),t},{})},$_attrsWithoutPT:function(){return Object.entries(this.$attrs||{}).filter(function(t){var n=yt(t,1),o=n[0];return!(o!=null&&o.startsWith("pt:"))}).reduce(function(t,n){var o=yt(n,2),i=o[0],r=o[1];return t[i]=r,t},{})}}},Yl=`
-.p-icon {
-    display: inline-block;
-    vertical-align: baseline;
-}
-
-.p-icon-spin {
-    -webkit-animation: p-icon-spin 2s infinite linear;
-    animation: p-icon-spin 2s infinite linear;
-}
-
-@-webkit-keyframes p-icon-spin {
-    0% {
-        -webkit-transform: rotate(0deg);
-        transform: rotate(0deg);
-    }
-    100% {
-        -webkit-transform: rotate(359deg);
-        transform: rotate(359deg);
-    }
-}
-
-@keyframes p-icon-spin {
-    0% {
-        -webkit-transform: rotate(0deg);
-        transform: rotate(0deg);
-    }
-    100% {
-        -webkit-transform: rotate(359deg);
-        transform: rotate(359deg);
-    }
-}
-`,Jl=N.extend({name:"baseicon",css:Yl});function Lt(e){"@babel/helpers - typeof";return Lt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Lt(e)}function or(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function rr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?or(Object(n),!0).forEach(function(o){Xl(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):or(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Xl(e,t,n){return(t=Ql(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ql(e){var t=es(e,"string");return Lt(t)=="symbol"?t:t+""}function es(e,t){if(Lt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Lt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var J={name:"BaseIcon",extends:U,props:{label:{type:String,default:void 0},spin:{type:Boolean,default:!1}},style:Jl,provide:function(){return{$pcIcon:this,$parentInstance:this}},methods:{pti:function(){var t=he(this.label);return rr(rr({},!this.isUnstyled&&{class:["p-icon",{"p-icon-spin":this.spin}]}),{},{role:t?void 0:"img","aria-label":t?void 0:this.label,"aria-hidden":t})}}},bt={name:"SpinnerIcon",extends:J};function ts(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M6.99701 14C5.85441 13.999 4.72939 13.7186 3.72012 13.1832C2.71084 12.6478 1.84795 11.8737 1.20673 10.9284C0.565504 9.98305 0.165424 8.89526 0.041387 7.75989C-0.0826496 6.62453 0.073125 5.47607 0.495122 4.4147C0.917119 3.35333 1.59252 2.4113 2.46241 1.67077C3.33229 0.930247 4.37024 0.413729 5.4857 0.166275C6.60117 -0.0811796 7.76026 -0.0520535 8.86188 0.251112C9.9635 0.554278 10.9742 1.12227 11.8057 1.90555C11.915 2.01493 11.9764 2.16319 11.9764 2.31778C11.9764 2.47236 11.915 2.62062 11.8057 2.73C11.7521 2.78503 11.688 2.82877 11.6171 2.85864C11.5463 2.8885 11.4702 2.90389 11.3933 2.90389C11.3165 2.90389 11.2404 2.8885 11.1695 2.85864C11.0987 2.82877 11.0346 2.78503 10.9809 2.73C9.9998 1.81273 8.73246 1.26138 7.39226 1.16876C6.05206 1.07615 4.72086 1.44794 3.62279 2.22152C2.52471 2.99511 1.72683 4.12325 1.36345 5.41602C1.00008 6.70879 1.09342 8.08723 1.62775 9.31926C2.16209 10.5513 3.10478 11.5617 4.29713 12.1803C5.48947 12.7989 6.85865 12.988 8.17414 12.7157C9.48963 12.4435 10.6711 11.7264 11.5196 10.6854C12.3681 9.64432 12.8319 8.34282 12.8328 7C12.8328 6.84529 12.8943 6.69692 13.0038 6.58752C13.1132 6.47812 13.2616 6.41667 13.4164 6.41667C13.5712 6.41667 13.7196 6.47812 13.8291 6.58752C13.9385 6.69692 14 6.84529 14 7C14 8.85651 13.2622 10.637 11.9489 11.9497C10.6356 13.2625 8.85432 14 6.99701 14Z",fill:"currentColor"},null,-1)]),16)}bt.render=ts;var ns=({dt:e})=>`
-.p-badge {
-    display: inline-flex;
-    border-radius: ${e("badge.border.radius")};
-    align-items: center;
-    justify-content: center;
-    padding: ${e("badge.padding")};
-    background: ${e("badge.primary.background")};
-    color: ${e("badge.primary.color")};
-    font-size: ${e("badge.font.size")};
-    font-weight: ${e("badge.font.weight")};
-    min-width: ${e("badge.min.width")};
-    height: ${e("badge.height")};
-}
-
-.p-badge-dot {
-    width: ${e("badge.dot.size")};
-    min-width: ${e("badge.dot.size")};
-    height: ${e("badge.dot.size")};
-    border-radius: 50%;
-    padding: 0;
-}
-
-.p-badge-circle {
-    padding: 0;
-    border-radius: 50%;
-}
-
-.p-badge-secondary {
-    background: ${e("badge.secondary.background")};
-    color: ${e("badge.secondary.color")};
-}
-
-.p-badge-success {
-    background: ${e("badge.success.background")};
-    color: ${e("badge.success.color")};
-}
-
-.p-badge-info {
-    background: ${e("badge.info.background")};
-    color: ${e("badge.info.color")};
-}
-
-.p-badge-warn {
-    background: ${e("badge.warn.background")};
-    color: ${e("badge.warn.color")};
-}
-
-.p-badge-danger {
-    background: ${e("badge.danger.background")};
-    color: ${e("badge.danger.color")};
-}
-
-.p-badge-contrast {
-    background: ${e("badge.contrast.background")};
-    color: ${e("badge.contrast.color")};
-}
-
-.p-badge-sm {
-    font-size: ${e("badge.sm.font.size")};
-    min-width: ${e("badge.sm.min.width")};
-    height: ${e("badge.sm.height")};
-}
-
-.p-badge-lg {
-    font-size: ${e("badge.lg.font.size")};
-    min-width: ${e("badge.lg.min.width")};
-    height: ${e("badge.lg.height")};
-}
-
-.p-badge-xl {
-    font-size: ${e("badge.xl.font.size")};
-    min-width: ${e("badge.xl.min.width")};
-    height: ${e("badge.xl.height")};
-}
-`,os={root:function(t){var n=t.props,o=t.instance;return["p-badge p-component",{"p-badge-circle":A(n.value)&&String(n.value).length===1,"p-badge-dot":he(n.value)&&!o.$slots.default,"p-badge-sm":n.size==="small","p-badge-lg":n.size==="large","p-badge-xl":n.size==="xlarge","p-badge-info":n.severity==="info","p-badge-success":n.severity==="success","p-badge-warn":n.severity==="warn","p-badge-danger":n.severity==="danger","p-badge-secondary":n.severity==="secondary","p-badge-contrast":n.severity==="contrast"}]}},rs=N.extend({name:"badge",style:ns,classes:os}),is={name:"BaseBadge",extends:U,props:{value:{type:[String,Number],default:null},severity:{type:String,default:null},size:{type:String,default:null}},style:rs,provide:function(){return{$pcBadge:this,$parentInstance:this}}};function Tt(e){"@babel/helpers - typeof";return Tt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Tt(e)}function ir(e,t,n){return(t=as(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function as(e){var t=ls(e,"string");return Tt(t)=="symbol"?t:t+""}function ls(e,t){if(Tt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Tt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var xo={name:"Badge",extends:is,inheritAttrs:!1,computed:{dataP:function(){return re(ir(ir({circle:this.value!=null&&String(this.value).length===1,empty:this.value==null&&!this.$slots.default},this.severity,this.severity),this.size,this.size))}}},ss=["data-p"];function us(e,t,n,o,i,r){return c(),b("span",f({class:e.cx("root"),"data-p":r.dataP},e.ptmi("root")),[k(e.$slots,"default",{},function(){return[Ee(Y(e.value),1)]})],16,ss)}xo.render=us;var Ze=bn();function Mt(e){"@babel/helpers - typeof";return Mt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Mt(e)}function ar(e,t){return fs(e)||ps(e,t)||cs(e,t)||ds()}function ds(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function cs(e,t){if(e){if(typeof e=="string")return lr(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?lr(e,t):void 0}}function lr(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function ps(e,t){var n=e==null?null:typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var o,i,r,a,l=[],s=!0,u=!1;try{if(r=(n=n.call(e)).next,t!==0)for(;!(s=(o=r.call(n)).done)&&(l.push(o.value),l.length!==t);s=!0);}catch(d){u=!0,i=d}finally{try{if(!s&&n.return!=null&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return l}}function fs(e){if(Array.isArray(e))return e}function sr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function q(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?sr(Object(n),!0).forEach(function(o){oo(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):sr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function oo(e,t,n){return(t=hs(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hs(e){var t=ms(e,"string");return Mt(t)=="symbol"?t:t+""}function ms(e,t){if(Mt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Mt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var _={_getMeta:function(){return[Ke(arguments.length<=0?void 0:arguments[0])||arguments.length<=0?void 0:arguments[0],Ce(Ke(arguments.length<=0?void 0:arguments[0])?arguments.length<=0?void 0:arguments[0]:arguments.length<=1?void 0:arguments[1])]},_getConfig:function(t,n){var o,i,r;return(o=(t==null||(i=t.instance)===null||i===void 0?void 0:i.$primevue)||(n==null||(r=n.ctx)===null||r===void 0||(r=r.appContext)===null||r===void 0||(r=r.config)===null||r===void 0||(r=r.globalProperties)===null||r===void 0?void 0:r.$primevue))===null||o===void 0?void 0:o.config},_getOptionValue:Oo,_getPTValue:function(){var t,n,o=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:"",a=arguments.length>3&&arguments[3]!==void 0?arguments[3]:{},l=arguments.length>4&&arguments[4]!==void 0?arguments[4]:!0,s=function(){var P=_._getOptionValue.apply(_,arguments);return Se(P)||Nn(P)?{class:P}:P},u=((t=o.binding)===null||t===void 0||(t=t.value)===null||t===void 0?void 0:t.ptOptions)||((n=o.$primevueConfig)===null||n===void 0?void 0:n.ptOptions)||{},d=u.mergeSections,p=d===void 0?!0:d,h=u.mergeProps,m=h===void 0?!1:h,w=l?_._useDefaultPT(o,o.defaultPT(),s,r,a):void 0,$=_._usePT(o,_._getPT(i,o.$name),s,r,q(q({},a),{},{global:w||{}})),v=_._getPTDatasets(o,r);return p||!p&&$?m?_._mergeProps(o,m,w,$,v):q(q(q({},w),$),v):q(q({},$),v)},_getPTDatasets:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",o="data-pc-";return q(q({},n==="root"&&oo({},"".concat(o,"name"),Ae(t.$name))),{},oo({},"".concat(o,"section"),Ae(n)))},_getPT:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",o=arguments.length>2?arguments[2]:void 0,i=function(a){var l,s=o?o(a):a,u=Ae(n);return(l=s==null?void 0:s[u])!==null&&l!==void 0?l:s};return t&&Object.hasOwn(t,"_usept")?{_usept:t._usept,originalValue:i(t.originalValue),value:i(t.value)}:i(t)},_usePT:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=arguments.length>1?arguments[1]:void 0,o=arguments.length>2?arguments[2]:void 0,i=arguments.length>3?arguments[3]:void 0,r=arguments.length>4?arguments[4]:void 0,a=function(v){return o(v,i,r)};if(n&&Object.hasOwn(n,"_usept")){var l,s=n._usept||((l=t.$primevueConfig)===null||l===void 0?void 0:l.ptOptions)||{},u=s.mergeSections,d=u===void 0?!0:u,p=s.mergeProps,h=p===void 0?!1:p,m=a(n.originalValue),w=a(n.value);return m===void 0&&w===void 0?void 0:Se(w)?w:Se(m)?m:d||!d&&w?h?_._mergeProps(t,h,m,w):q(q({},m),w):w}return a(n)},_useDefaultPT:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},o=arguments.length>2?arguments[2]:void 0,i=arguments.length>3?arguments[3]:void 0,r=arguments.length>4?arguments[4]:void 0;return _._usePT(t,n,o,i,r)},_loadStyles:function(){var t,n=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},o=arguments.length>1?arguments[1]:void 0,i=arguments.length>2?arguments[2]:void 0,r=_._getConfig(o,i),a={nonce:r==null||(t=r.csp)===null||t===void 0?void 0:t.nonce};_._loadCoreStyles(n,a),_._loadThemeStyles(n,a),_._loadScopedThemeStyles(n,a),_._removeThemeListeners(n),n.$loadStyles=function(){return _._loadThemeStyles(n,a)},_._themeChangeListener(n.$loadStyles)},_loadCoreStyles:function(){var t,n,o=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},i=arguments.length>1?arguments[1]:void 0;if(!_e.isStyleNameLoaded((t=o.$style)===null||t===void 0?void 0:t.name)&&(n=o.$style)!==null&&n!==void 0&&n.name){var r;N.loadCSS(i),(r=o.$style)===null||r===void 0||r.loadCSS(i),_e.setLoadedStyleName(o.$style.name)}},_loadThemeStyles:function(){var t,n,o,i=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},r=arguments.length>1?arguments[1]:void 0;if(!(i!=null&&i.isUnstyled()||(i==null||(t=i.theme)===null||t===void 0?void 0:t.call(i))==="none")){if(!ee.isStyleNameLoaded("common")){var a,l,s=((a=i.$style)===null||a===void 0||(l=a.getCommonTheme)===null||l===void 0?void 0:l.call(a))||{},u=s.primitive,d=s.semantic,p=s.global,h=s.style;N.load(u==null?void 0:u.css,q({name:"primitive-variables"},r)),N.load(d==null?void 0:d.css,q({name:"semantic-variables"},r)),N.load(p==null?void 0:p.css,q({name:"global-variables"},r)),N.loadStyle(q({name:"global-style"},r),h),ee.setLoadedStyleName("common")}if(!ee.isStyleNameLoaded((n=i.$style)===null||n===void 0?void 0:n.name)&&(o=i.$style)!==null&&o!==void 0&&o.name){var m,w,$,v,I=((m=i.$style)===null||m===void 0||(w=m.getDirectiveTheme)===null||w===void 0?void 0:w.call(m))||{},P=I.css,L=I.style;($=i.$style)===null||$===void 0||$.load(P,q({name:"".concat(i.$style.name,"-variables")},r)),(v=i.$style)===null||v===void 0||v.loadStyle(q({name:"".concat(i.$style.name,"-style")},r),L),ee.setLoadedStyleName(i.$style.name)}if(!ee.isStyleNameLoaded("layer-order")){var g,F,G=(g=i.$style)===null||g===void 0||(F=g.getLayerOrderThemeCSS)===null||F===void 0?void 0:F.call(g);N.load(G,q({name:"layer-order",first:!0},r)),ee.setLoadedStyleName("layer-order")}}},_loadScopedThemeStyles:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=arguments.length>1?arguments[1]:void 0,o=t.preset();if(o&&t.$attrSelector){var i,r,a,l=((i=t.$style)===null||i===void 0||(r=i.getPresetTheme)===null||r===void 0?void 0:r.call(i,o,"[".concat(t.$attrSelector,"]")))||{},s=l.css,u=(a=t.$style)===null||a===void 0?void 0:a.load(s,q({name:"".concat(t.$attrSelector,"-").concat(t.$style.name)},n));t.scopedStyleEl=u.el}},_themeChangeListener:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:function(){};_e.clearLoadedStyleNames(),ye.on("theme:change",t)},_removeThemeListeners:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{};ye.off("theme:change",t.$loadStyles),t.$loadStyles=void 0},_hook:function(t,n,o,i,r,a){var l,s,u="on".concat(ml(n)),d=_._getConfig(i,r),p=o==null?void 0:o.$instance,h=_._usePT(p,_._getPT(i==null||(l=i.value)===null||l===void 0?void 0:l.pt,t),_._getOptionValue,"hooks.".concat(u)),m=_._useDefaultPT(p,d==null||(s=d.pt)===null||s===void 0||(s=s.directives)===null||s===void 0?void 0:s[t],_._getOptionValue,"hooks.".concat(u)),w={el:o,binding:i,vnode:r,prevVnode:a};h==null||h(p,w),m==null||m(p,w)},_mergeProps:function(){for(var t=arguments.length>1?arguments[1]:void 0,n=arguments.length,o=new Array(n>2?n-2:0),i=2;i<n;i++)o[i-2]=arguments[i];return Vn(t)?t.apply(void 0,o):f.apply(void 0,o)},_extend:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},o=function(l,s,u,d,p){var h,m,w,$;s._$instances=s._$instances||{};var v=_._getConfig(u,d),I=s._$instances[t]||{},P=he(I)?q(q({},n),n==null?void 0:n.methods):{};s._$instances[t]=q(q({},I),{},{$name:t,$host:s,$binding:u,$modifiers:u==null?void 0:u.modifiers,$value:u==null?void 0:u.value,$el:I.$el||s||void 0,$style:q({classes:void 0,inlineStyles:void 0,load:function(){},loadCSS:function(){},loadStyle:function(){}},n==null?void 0:n.style),$primevueConfig:v,$attrSelector:(h=s.$pd)===null||h===void 0||(h=h[t])===null||h===void 0?void 0:h.attrSelector,defaultPT:function(){return _._getPT(v==null?void 0:v.pt,void 0,function(g){var F;return g==null||(F=g.directives)===null||F===void 0?void 0:F[t]})},isUnstyled:function(){var g,F;return((g=s._$instances[t])===null||g===void 0||(g=g.$binding)===null||g===void 0||(g=g.value)===null||g===void 0?void 0:g.unstyled)!==void 0?(F=s._$instances[t])===null||F===void 0||(F=F.$binding)===null||F===void 0||(F=F.value)===null||F===void 0?void 0:F.unstyled:v==null?void 0:v.unstyled},theme:function(){var g;return(g=s._$instances[t])===null||g===void 0||(g=g.$primevueConfig)===null||g===void 0?void 0:g.theme},preset:function(){var g;return(g=s._$instances[t])===null||g===void 0||(g=g.$binding)===null||g===void 0||(g=g.value)===null||g===void 0?void 0:g.dt},ptm:function(){var g,F=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",G=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return _._getPTValue(s._$instances[t],(g=s._$instances[t])===null||g===void 0||(g=g.$binding)===null||g===void 0||(g=g.value)===null||g===void 0?void 0:g.pt,F,q({},G))},ptmo:function(){var g=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},F=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"",G=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};return _._getPTValue(s._$instances[t],g,F,G,!1)},cx:function(){var g,F,G=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",V=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return(g=s._$instances[t])!==null&&g!==void 0&&g.isUnstyled()?void 0:_._getOptionValue((F=s._$instances[t])===null||F===void 0||(F=F.$style)===null||F===void 0?void 0:F.classes,G,q({},V))},sx:function(){var g,F=arguments.length>0&&arguments[0]!==void 0?arguments[0]:"",G=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!0,V=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};return G?_._getOptionValue((g=s._$instances[t])===null||g===void 0||(g=g.$style)===null||g===void 0?void 0:g.inlineStyles,F,q({},V)):void 0}},P),s.$instance=s._$instances[t],(m=(w=s.$instance)[l])===null||m===void 0||m.call(w,s,u,d,p),s["$".concat(t)]=s.$instance,_._hook(t,l,s,u,d,p),s.$pd||(s.$pd={}),s.$pd[t]=q(q({},($=s.$pd)===null||$===void 0?void 0:$[t]),{},{name:t,instance:s._$instances[t]})},i=function(l){var s,u,d,p=l._$instances[t],h=p==null?void 0:p.watch,m=function(v){var I,P=v.newValue,L=v.oldValue;return h==null||(I=h.config)===null||I===void 0?void 0:I.call(p,P,L)},w=function(v){var I,P=v.newValue,L=v.oldValue;return h==null||(I=h["config.ripple"])===null||I===void 0?void 0:I.call(p,P,L)};p.$watchersCallback={config:m,"config.ripple":w},h==null||(s=h.config)===null||s===void 0||s.call(p,p==null?void 0:p.$primevueConfig),Ze.on("config:change",m),h==null||(u=h["config.ripple"])===null||u===void 0||u.call(p,p==null||(d=p.$primevueConfig)===null||d===void 0?void 0:d.ripple),Ze.on("config:ripple:change",w)},r=function(l){var s=l._$instances[t].$watchersCallback;s&&(Ze.off("config:change",s.config),Ze.off("config:ripple:change",s["config.ripple"]),l._$instances[t].$watchersCallback=void 0)};return{created:function(l,s,u,d){l.$pd||(l.$pd={}),l.$pd[t]={name:t,attrSelector:bl("pd")},o("created",l,s,u,d)},beforeMount:function(l,s,u,d){var p;_._loadStyles((p=l.$pd[t])===null||p===void 0?void 0:p.instance,s,u),o("beforeMount",l,s,u,d),i(l)},mounted:function(l,s,u,d){var p;_._loadStyles((p=l.$pd[t])===null||p===void 0?void 0:p.instance,s,u),o("mounted",l,s,u,d)},beforeUpdate:function(l,s,u,d){o("beforeUpdate",l,s,u,d)},updated:function(l,s,u,d){var p;_._loadStyles((p=l.$pd[t])===null||p===void 0?void 0:p.instance,s,u),o("updated",l,s,u,d)},beforeUnmount:function(l,s,u,d){var p;r(l),_._removeThemeListeners((p=l.$pd[t])===null||p===void 0?void 0:p.instance),o("beforeUnmount",l,s,u,d)},unmounted:function(l,s,u,d){var p;(p=l.$pd[t])===null||p===void 0||(p=p.instance)===null||p===void 0||(p=p.scopedStyleEl)===null||p===void 0||(p=p.value)===null||p===void 0||p.remove(),o("unmounted",l,s,u,d)}}},extend:function(){var t=_._getMeta.apply(_,arguments),n=ar(t,2),o=n[0],i=n[1];return q({extend:function(){var a=_._getMeta.apply(_,arguments),l=ar(a,2),s=l[0],u=l[1];return _.extend(s,q(q(q({},i),i==null?void 0:i.methods),u))}},_._extend(o,i))}},bs=({dt:e})=>`
-.p-ink {
-    display: block;
-    position: absolute;
-    background: ${e("ripple.background")};
-    border-radius: 100%;
-    transform: scale(0);
-    pointer-events: none;
-}
-
-.p-ink-active {
-    animation: ripple 0.4s linear;
-}
-
-@keyframes ripple {
-    100% {
-        opacity: 0;
-        transform: scale(2.5);
-    }
-}
-`,gs={root:"p-ink"},ys=N.extend({name:"ripple-directive",style:bs,classes:gs}),vs=_.extend({style:ys});function Et(e){"@babel/helpers - typeof";return Et=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Et(e)}function ws(e){return ks(e)||$s(e)||Ss(e)||Cs()}function Cs(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Ss(e,t){if(e){if(typeof e=="string")return ro(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ro(e,t):void 0}}function $s(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function ks(e){if(Array.isArray(e))return ro(e)}function ro(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function ur(e,t,n){return(t=Is(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Is(e){var t=Ps(e,"string");return Et(t)=="symbol"?t:t+""}function Ps(e,t){if(Et(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Et(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Re=vs.extend("ripple",{watch:{"config.ripple":function(t){t?(this.createRipple(this.$host),this.bindEvents(this.$host),this.$host.setAttribute("data-pd-ripple",!0),this.$host.style.overflow="hidden",this.$host.style.position="relative"):(this.remove(this.$host),this.$host.removeAttribute("data-pd-ripple"))}},unmounted:function(t){this.remove(t)},timeout:void 0,methods:{bindEvents:function(t){t.addEventListener("mousedown",this.onMouseDown.bind(this))},unbindEvents:function(t){t.removeEventListener("mousedown",this.onMouseDown.bind(this))},createRipple:function(t){var n=this.getInk(t);n||(n=di("span",ur(ur({role:"presentation","aria-hidden":!0,"data-p-ink":!0,"data-p-ink-active":!1,class:!this.isUnstyled()&&this.cx("root"),onAnimationEnd:this.onAnimationEnd.bind(this)},this.$attrSelector,""),"p-bind",this.ptm("root"))),t.appendChild(n),this.$el=n)},remove:function(t){var n=this.getInk(t);n&&(this.$host.style.overflow="",this.$host.style.position="",this.unbindEvents(t),n.removeEventListener("animationend",this.onAnimationEnd),n.remove())},onMouseDown:function(t){var n=this,o=t.currentTarget,i=this.getInk(o);if(!(!i||getComputedStyle(i,null).display==="none")){if(!this.isUnstyled()&&ze(i,"p-ink-active"),i.setAttribute("data-p-ink-active","false"),!tt(i)&&!nt(i)){var r=Math.max(ve(o),Pt(o));i.style.height=r+"px",i.style.width=r+"px"}var a=st(o),l=t.pageX-a.left+document.body.scrollTop-nt(i)/2,s=t.pageY-a.top+document.body.scrollLeft-tt(i)/2;i.style.top=s+"px",i.style.left=l+"px",!this.isUnstyled()&&We(i,"p-ink-active"),i.setAttribute("data-p-ink-active","true"),this.timeout=setTimeout(function(){i&&(!n.isUnstyled()&&ze(i,"p-ink-active"),i.setAttribute("data-p-ink-active","false"))},401)}},onAnimationEnd:function(t){this.timeout&&clearTimeout(this.timeout),!this.isUnstyled()&&ze(t.currentTarget,"p-ink-active"),t.currentTarget.setAttribute("data-p-ink-active","false")},getInk:function(t){return t&&t.children?ws(t.children).find(function(n){return fe(n,"data-pc-name")==="ripple"}):void 0}}}),Os=({dt:e})=>`
-.p-button {
-    display: inline-flex;
-    cursor: pointer;
-    user-select: none;
-    align-items: center;
-    justify-content: center;
-    overflow: hidden;
-    position: relative;
-    color: ${e("button.primary.color")};
-    background: ${e("button.primary.background")};
-    border: 1px solid ${e("button.primary.border.color")};
-    padding: ${e("button.padding.y")} ${e("button.padding.x")};
-    font-size: 1rem;
-    font-family: inherit;
-    font-feature-settings: inherit;
-    transition: background ${e("button.transition.duration")}, color ${e("button.transition.duration")}, border-color ${e("button.transition.duration")},
-            outline-color ${e("button.transition.duration")}, box-shadow ${e("button.transition.duration")};
-    border-radius: ${e("button.border.radius")};
-    outline-color: transparent;
-    gap: ${e("button.gap")};
-}
-
-.p-button:disabled {
-    cursor: default;
-}
-
-.p-button-icon-right {
-    order: 1;
-}
-
-.p-button-icon-right:dir(rtl) {
-    order: -1;
-}
-
-.p-button:not(.p-button-vertical) .p-button-icon:not(.p-button-icon-right):dir(rtl) {
-    order: 1;
-}
-
-.p-button-icon-bottom {
-    order: 2;
-}
-
-.p-button-icon-only {
-    width: ${e("button.icon.only.width")};
-    padding-inline-start: 0;
-    padding-inline-end: 0;
-    gap: 0;
-}
-
-.p-button-icon-only.p-button-rounded {
-    border-radius: 50%;
-    height: ${e("button.icon.only.width")};
-}
-
-.p-button-icon-only .p-button-label {
-    visibility: hidden;
-    width: 0;
-}
-
-.p-button-sm {
-    font-size: ${e("button.sm.font.size")};
-    padding: ${e("button.sm.padding.y")} ${e("button.sm.padding.x")};
-}
-
-.p-button-sm .p-button-icon {
-    font-size: ${e("button.sm.font.size")};
-}
-
-.p-button-sm.p-button-icon-only {
-    width: ${e("button.sm.icon.only.width")};
-}
-
-.p-button-sm.p-button-icon-only.p-button-rounded {
-    height: ${e("button.sm.icon.only.width")};
-}
-
-.p-button-lg {
-    font-size: ${e("button.lg.font.size")};
-    padding: ${e("button.lg.padding.y")} ${e("button.lg.padding.x")};
-}
-
-.p-button-lg .p-button-icon {
-    font-size: ${e("button.lg.font.size")};
-}
-
-.p-button-lg.p-button-icon-only {
-    width: ${e("button.lg.icon.only.width")};
-}
-
-.p-button-lg.p-button-icon-only.p-button-rounded {
-    height: ${e("button.lg.icon.only.width")};
-}
-
-.p-button-vertical {
-    flex-direction: column;
-}
-
-.p-button-label {
-    font-weight: ${e("button.label.font.weight")};
-}
-
-.p-button-fluid {
-    width: 100%;
-}
-
-.p-button-fluid.p-button-icon-only {
-    width: ${e("button.icon.only.width")};
-}
-
-.p-button:not(:disabled):hover {
-    background: ${e("button.primary.hover.background")};
-    border: 1px solid ${e("button.primary.hover.border.color")};
-    color: ${e("button.primary.hover.color")};
-}
-
-.p-button:not(:disabled):active {
-    background: ${e("button.primary.active.background")};
-    border: 1px solid ${e("button.primary.active.border.color")};
-    color: ${e("button.primary.active.color")};
-}
-
-.p-button:focus-visible {
-    box-shadow: ${e("button.primary.focus.ring.shadow")};
-    outline: ${e("button.focus.ring.width")} ${e("button.focus.ring.style")} ${e("button.primary.focus.ring.color")};
-    outline-offset: ${e("button.focus.ring.offset")};
-}
-
-.p-button .p-badge {
-    min-width: ${e("button.badge.size")};
-    height: ${e("button.badge.size")};
-    line-height: ${e("button.badge.size")};
-}
-
-.p-button-raised {
-    box-shadow: ${e("button.raised.shadow")};
-}
-
-.p-button-rounded {
-    border-radius: ${e("button.rounded.border.radius")};
-}
-
-.p-button-secondary {
-    background: ${e("button.secondary.background")};
-    border: 1px solid ${e("button.secondary.border.color")};
-    color: ${e("button.secondary.color")};
-}
-
-.p-button-secondary:not(:disabled):hover {
-    background: ${e("button.secondary.hover.background")};
-    border: 1px solid ${e("button.secondary.hover.border.color")};
-    color: ${e("button.secondary.hover.color")};
-}
-
-.p-button-secondary:not(:disabled):active {
-    background: ${e("button.secondary.active.background")};
-    border: 1px solid ${e("button.secondary.active.border.color")};
-    color: ${e("button.secondary.active.color")};
-}
-
-.p-button-secondary:focus-visible {
-    outline-color: ${e("button.secondary.focus.ring.color")};
-    box-shadow: ${e("button.secondary.focus.ring.shadow")};
-}
-
-.p-button-success {
-    background: ${e("button.success.background")};
-    border: 1px solid ${e("button.success.border.color")};
-    color: ${e("button.success.color")};
-}
-
-.p-button-success:not(:disabled):hover {
-    background: ${e("button.success.hover.background")};
-    border: 1px solid ${e("button.success.hover.border.color")};
-    color: ${e("button.success.hover.color")};
-}
-
-.p-button-success:not(:disabled):active {
-    background: ${e("button.success.active.background")};
-    border: 1px solid ${e("button.success.active.border.color")};
-    color: ${e("button.success.active.color")};
-}
-
-.p-button-success:focus-visible {
-    outline-color: ${e("button.success.focus.ring.color")};
-    box-shadow: ${e("button.success.focus.ring.shadow")};
-}
-
-.p-button-info {
-    background: ${e("button.info.background")};
-    border: 1px solid ${e("button.info.border.color")};
-    color: ${e("button.info.color")};
-}
-
-.p-button-info:not(:disabled):hover {
-    background: ${e("button.info.hover.background")};
-    border: 1px solid ${e("button.info.hover.border.color")};
-    color: ${e("button.info.hover.color")};
-}
-
-.p-button-info:not(:disabled):active {
-    background: ${e("button.info.active.background")};
-    border: 1px solid ${e("button.info.active.border.color")};
-    color: ${e("button.info.active.color")};
-}
-
-.p-button-info:focus-visible {
-    outline-color: ${e("button.info.focus.ring.color")};
-    box-shadow: ${e("button.info.focus.ring.shadow")};
-}
-
-.p-button-warn {
-    background: ${e("button.warn.background")};
-    border: 1px solid ${e("button.warn.border.color")};
-    color: ${e("button.warn.color")};
-}
-
-.p-button-warn:not(:disabled):hover {
-    background: ${e("button.warn.hover.background")};
-    border: 1px solid ${e("button.warn.hover.border.color")};
-    color: ${e("button.warn.hover.color")};
-}
-
-.p-button-warn:not(:disabled):active {
-    background: ${e("button.warn.active.background")};
-    border: 1px solid ${e("button.warn.active.border.color")};
-    color: ${e("button.warn.active.color")};
-}
-
-.p-button-warn:focus-visible {
-    outline-color: ${e("button.warn.focus.ring.color")};
-    box-shadow: ${e("button.warn.focus.ring.shadow")};
-}
-
-.p-button-help {
-    background: ${e("button.help.background")};
-    border: 1px solid ${e("button.help.border.color")};
-    color: ${e("button.help.color")};
-}
-
-.p-button-help:not(:disabled):hover {
-    background: ${e("button.help.hover.background")};
-    border: 1px solid ${e("button.help.hover.border.color")};
-    color: ${e("button.help.hover.color")};
-}
-
-.p-button-help:not(:disabled):active {
-    background: ${e("button.help.active.background")};
-    border: 1px solid ${e("button.help.active.border.color")};
-    color: ${e("button.help.active.color")};
-}
-
-.p-button-help:focus-visible {
-    outline-color: ${e("button.help.focus.ring.color")};
-    box-shadow: ${e("button.help.focus.ring.shadow")};
-}
-
-.p-button-danger {
-    background: ${e("button.danger.background")};
-    border: 1px solid ${e("button.danger.border.color")};
-    color: ${e("button.danger.color")};
-}
-
-.p-button-danger:not(:disabled):hover {
-    background: ${e("button.danger.hover.background")};
-    border: 1px solid ${e("button.danger.hover.border.color")};
-    color: ${e("button.danger.hover.color")};
-}
-
-.p-button-danger:not(:disabled):active {
-    background: ${e("button.danger.active.background")};
-    border: 1px solid ${e("button.danger.active.border.color")};
-    color: ${e("button.danger.active.color")};
-}
-
-.p-button-danger:focus-visible {
-    outline-color: ${e("button.danger.focus.ring.color")};
-    box-shadow: ${e("button.danger.focus.ring.shadow")};
-}
-
-.p-button-contrast {
-    background: ${e("button.contrast.background")};
-    border: 1px solid ${e("button.contrast.border.color")};
-    color: ${e("button.contrast.color")};
-}
-
-.p-button-contrast:not(:disabled):hover {
-    background: ${e("button.contrast.hover.background")};
-    border: 1px solid ${e("button.contrast.hover.border.color")};
-    color: ${e("button.contrast.hover.color")};
-}
-
-.p-button-contrast:not(:disabled):active {
-    background: ${e("button.contrast.active.background")};
-    border: 1px solid ${e("button.contrast.active.border.color")};
-    color: ${e("button.contrast.active.color")};
-}
-
-.p-button-contrast:focus-visible {
-    outline-color: ${e("button.contrast.focus.ring.color")};
-    box-shadow: ${e("button.contrast.focus.ring.shadow")};
-}
-
-.p-button-outlined {
-    background: transparent;
-    border-color: ${e("button.outlined.primary.border.color")};
-    color: ${e("button.outlined.primary.color")};
-}
-
-.p-button-outlined:not(:disabled):hover {
-    background: ${e("button.outlined.primary.hover.background")};
-    border-color: ${e("button.outlined.primary.border.color")};
-    color: ${e("button.outlined.primary.color")};
-}
-
-.p-button-outlined:not(:disabled):active {
-    background: ${e("button.outlined.primary.active.background")};
-    border-color: ${e("button.outlined.primary.border.color")};
-    color: ${e("button.outlined.primary.color")};
-}
-
-.p-button-outlined.p-button-secondary {
-    border-color: ${e("button.outlined.secondary.border.color")};
-    color: ${e("button.outlined.secondary.color")};
-}
-
-.p-button-outlined.p-button-secondary:not(:disabled):hover {
-    background: ${e("button.outlined.secondary.hover.background")};
-    border-color: ${e("button.outlined.secondary.border.color")};
-    color: ${e("button.outlined.secondary.color")};
-}
-
-.p-button-outlined.p-button-secondary:not(:disabled):active {
-    background: ${e("button.outlined.secondary.active.background")};
-    border-color: ${e("button.outlined.secondary.border.color")};
-    color: ${e("button.outlined.secondary.color")};
-}
-
-.p-button-outlined.p-button-success {
-    border-color: ${e("button.outlined.success.border.color")};
-    color: ${e("button.outlined.success.color")};
-}
-
-.p-button-outlined.p-button-success:not(:disabled):hover {
-    background: ${e("button.outlined.success.hover.background")};
-    border-color: ${e("button.outlined.success.border.color")};
-    color: ${e("button.outlined.success.color")};
-}
-
-.p-button-outlined.p-button-success:not(:disabled):active {
-    background: ${e("button.outlined.success.active.background")};
-    border-color: ${e("button.outlined.success.border.color")};
-    color: ${e("button.outlined.success.color")};
-}
-
-.p-button-outlined.p-button-info {
-    border-color: ${e("button.outlined.info.border.color")};
-    color: ${e("button.outlined.info.color")};
-}
-
-.p-button-outlined.p-button-info:not(:disabled):hover {
-    background: ${e("button.outlined.info.hover.background")};
-    border-color: ${e("button.outlined.info.border.color")};
-    color: ${e("button.outlined.info.color")};
-}
-
-.p-button-outlined.p-button-info:not(:disabled):active {
-    background: ${e("button.outlined.info.active.background")};
-    border-color: ${e("button.outlined.info.border.color")};
-    color: ${e("button.outlined.info.color")};
-}
-
-.p-button-outlined.p-button-warn {
-    border-color: ${e("button.outlined.warn.border.color")};
-    color: ${e("button.outlined.warn.color")};
-}
-
-.p-button-outlined.p-button-warn:not(:disabled):hover {
-    background: ${e("button.outlined.warn.hover.background")};
-    border-color: ${e("button.outlined.warn.border.color")};
-    color: ${e("button.outlined.warn.color")};
-}
-
-.p-button-outlined.p-button-warn:not(:disabled):active {
-    background: ${e("button.outlined.warn.active.background")};
-    border-color: ${e("button.outlined.warn.border.color")};
-    color: ${e("button.outlined.warn.color")};
-}
-
-.p-button-outlined.p-button-help {
-    border-color: ${e("button.outlined.help.border.color")};
-    color: ${e("button.outlined.help.color")};
-}
-
-.p-button-outlined.p-button-help:not(:disabled):hover {
-    background: ${e("button.outlined.help.hover.background")};
-    border-color: ${e("button.outlined.help.border.color")};
-    color: ${e("button.outlined.help.color")};
-}
-
-.p-button-outlined.p-button-help:not(:disabled):active {
-    background: ${e("button.outlined.help.active.background")};
-    border-color: ${e("button.outlined.help.border.color")};
-    color: ${e("button.outlined.help.color")};
-}
-
-.p-button-outlined.p-button-danger {
-    border-color: ${e("button.outlined.danger.border.color")};
-    color: ${e("button.outlined.danger.color")};
-}
-
-.p-button-outlined.p-button-danger:not(:disabled):hover {
-    background: ${e("button.outlined.danger.hover.background")};
-    border-color: ${e("button.outlined.danger.border.color")};
-    color: ${e("button.outlined.danger.color")};
-}
-
-.p-button-outlined.p-button-danger:not(:disabled):active {
-    background: ${e("button.outlined.danger.active.background")};
-    border-color: ${e("button.outlined.danger.border.color")};
-    color: ${e("button.outlined.danger.color")};
-}
-
-.p-button-outlined.p-button-contrast {
-    border-color: ${e("button.outlined.contrast.border.color")};
-    color: ${e("button.outlined.contrast.color")};
-}
-
-.p-button-outlined.p-button-contrast:not(:disabled):hover {
-    background: ${e("button.outlined.contrast.hover.background")};
-    border-color: ${e("button.outlined.contrast.border.color")};
-    color: ${e("button.outlined.contrast.color")};
-}
-
-.p-button-outlined.p-button-contrast:not(:disabled):active {
-    background: ${e("button.outlined.contrast.active.background")};
-    border-color: ${e("button.outlined.contrast.border.color")};
-    color: ${e("button.outlined.contrast.color")};
-}
-
-.p-button-outlined.p-button-plain {
-    border-color: ${e("button.outlined.plain.border.color")};
-    color: ${e("button.outlined.plain.color")};
-}
-
-.p-button-outlined.p-button-plain:not(:disabled):hover {
-    background: ${e("button.outlined.plain.hover.background")};
-    border-color: ${e("button.outlined.plain.border.color")};
-    color: ${e("button.outlined.plain.color")};
-}
-
-.p-button-outlined.p-button-plain:not(:disabled):active {
-    background: ${e("button.outlined.plain.active.background")};
-    border-color: ${e("button.outlined.plain.border.color")};
-    color: ${e("button.outlined.plain.color")};
-}
-
-.p-button-text {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.primary.color")};
-}
-
-.p-button-text:not(:disabled):hover {
-    background: ${e("button.text.primary.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.primary.color")};
-}
-
-.p-button-text:not(:disabled):active {
-    background: ${e("button.text.primary.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.primary.color")};
-}
-
-.p-button-text.p-button-secondary {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.secondary.color")};
-}
-
-.p-button-text.p-button-secondary:not(:disabled):hover {
-    background: ${e("button.text.secondary.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.secondary.color")};
-}
-
-.p-button-text.p-button-secondary:not(:disabled):active {
-    background: ${e("button.text.secondary.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.secondary.color")};
-}
-
-.p-button-text.p-button-success {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.success.color")};
-}
-
-.p-button-text.p-button-success:not(:disabled):hover {
-    background: ${e("button.text.success.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.success.color")};
-}
-
-.p-button-text.p-button-success:not(:disabled):active {
-    background: ${e("button.text.success.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.success.color")};
-}
-
-.p-button-text.p-button-info {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.info.color")};
-}
-
-.p-button-text.p-button-info:not(:disabled):hover {
-    background: ${e("button.text.info.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.info.color")};
-}
-
-.p-button-text.p-button-info:not(:disabled):active {
-    background: ${e("button.text.info.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.info.color")};
-}
-
-.p-button-text.p-button-warn {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.warn.color")};
-}
-
-.p-button-text.p-button-warn:not(:disabled):hover {
-    background: ${e("button.text.warn.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.warn.color")};
-}
-
-.p-button-text.p-button-warn:not(:disabled):active {
-    background: ${e("button.text.warn.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.warn.color")};
-}
-
-.p-button-text.p-button-help {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.help.color")};
-}
-
-.p-button-text.p-button-help:not(:disabled):hover {
-    background: ${e("button.text.help.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.help.color")};
-}
-
-.p-button-text.p-button-help:not(:disabled):active {
-    background: ${e("button.text.help.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.help.color")};
-}
-
-.p-button-text.p-button-danger {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.danger.color")};
-}
-
-.p-button-text.p-button-danger:not(:disabled):hover {
-    background: ${e("button.text.danger.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.danger.color")};
-}
-
-.p-button-text.p-button-danger:not(:disabled):active {
-    background: ${e("button.text.danger.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.danger.color")};
-}
-
-.p-button-text.p-button-contrast {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.contrast.color")};
-}
-
-.p-button-text.p-button-contrast:not(:disabled):hover {
-    background: ${e("button.text.contrast.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.contrast.color")};
-}
-
-.p-button-text.p-button-contrast:not(:disabled):active {
-    background: ${e("button.text.contrast.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.contrast.color")};
-}
-
-.p-button-text.p-button-plain {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.text.plain.color")};
-}
-
-.p-button-text.p-button-plain:not(:disabled):hover {
-    background: ${e("button.text.plain.hover.background")};
-    border-color: transparent;
-    color: ${e("button.text.plain.color")};
-}
-
-.p-button-text.p-button-plain:not(:disabled):active {
-    background: ${e("button.text.plain.active.background")};
-    border-color: transparent;
-    color: ${e("button.text.plain.color")};
-}
-
-.p-button-link {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.link.color")};
-}
-
-.p-button-link:not(:disabled):hover {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.link.hover.color")};
-}
-
-.p-button-link:not(:disabled):hover .p-button-label {
-    text-decoration: underline;
-}
-
-.p-button-link:not(:disabled):active {
-    background: transparent;
-    border-color: transparent;
-    color: ${e("button.link.active.color")};
-}
-`;function Dt(e){"@babel/helpers - typeof";return Dt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Dt(e)}function Be(e,t,n){return(t=xs(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function xs(e){var t=Rs(e,"string");return Dt(t)=="symbol"?t:t+""}function Rs(e,t){if(Dt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Dt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Ls={root:function(t){var n=t.instance,o=t.props;return["p-button p-component",Be(Be(Be(Be(Be(Be(Be(Be(Be({"p-button-icon-only":n.hasIcon&&!o.label&&!o.badge,"p-button-vertical":(o.iconPos==="top"||o.iconPos==="bottom")&&o.label,"p-button-loading":o.loading,"p-button-link":o.link||o.variant==="link"},"p-button-".concat(o.severity),o.severity),"p-button-raised",o.raised),"p-button-rounded",o.rounded),"p-button-text",o.text||o.variant==="text"),"p-button-outlined",o.outlined||o.variant==="outlined"),"p-button-sm",o.size==="small"),"p-button-lg",o.size==="large"),"p-button-plain",o.plain),"p-button-fluid",n.hasFluid)]},loadingIcon:"p-button-loading-icon",icon:function(t){var n=t.props;return["p-button-icon",Be({},"p-button-icon-".concat(n.iconPos),n.label)]},label:"p-button-label"},Ts=N.extend({name:"button",style:Os,classes:Ls}),Ms={name:"BaseButton",extends:U,props:{label:{type:String,default:null},icon:{type:String,default:null},iconPos:{type:String,default:"left"},iconClass:{type:[String,Object],default:null},badge:{type:String,default:null},badgeClass:{type:[String,Object],default:null},badgeSeverity:{type:String,default:"secondary"},loading:{type:Boolean,default:!1},loadingIcon:{type:String,default:void 0},as:{type:[String,Object],default:"BUTTON"},asChild:{type:Boolean,default:!1},link:{type:Boolean,default:!1},severity:{type:String,default:null},raised:{type:Boolean,default:!1},rounded:{type:Boolean,default:!1},text:{type:Boolean,default:!1},outlined:{type:Boolean,default:!1},size:{type:String,default:null},variant:{type:String,default:null},plain:{type:Boolean,default:!1},fluid:{type:Boolean,default:null}},style:Ts,provide:function(){return{$pcButton:this,$parentInstance:this}}};function Ft(e){"@babel/helpers - typeof";return Ft=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ft(e)}function we(e,t,n){return(t=Es(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Es(e){var t=Ds(e,"string");return Ft(t)=="symbol"?t:t+""}function Ds(e,t){if(Ft(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Ft(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var gn={name:"Button",extends:Ms,inheritAttrs:!1,inject:{$pcFluid:{default:null}},methods:{getPTOptions:function(t){var n=t==="root"?this.ptmi:this.ptm;return n(t,{context:{disabled:this.disabled}})}},computed:{disabled:function(){return this.$attrs.disabled||this.$attrs.disabled===""||this.loading},defaultAriaLabel:function(){return this.label?this.label+(this.badge?" "+this.badge:""):this.$attrs.ariaLabel},hasIcon:function(){return this.icon||this.$slots.icon},attrs:function(){return f(this.asAttrs,this.a11yAttrs,this.getPTOptions("root"))},asAttrs:function(){return this.as==="BUTTON"?{type:"button",disabled:this.disabled}:void 0},a11yAttrs:function(){return{"aria-label":this.defaultAriaLabel,"data-pc-name":"button","data-p-disabled":this.disabled,"data-p-severity":this.severity}},hasFluid:function(){return he(this.fluid)?!!this.$pcFluid:this.fluid},dataP:function(){return re(we(we(we(we(we(we(we(we(we(we({},this.size,this.size),"icon-only",this.hasIcon&&!this.label&&!this.badge),"loading",this.loading),"fluid",this.hasFluid),"rounded",this.rounded),"raised",this.raised),"outlined",this.outlined||this.variant==="outlined"),"text",this.text||this.variant==="text"),"link",this.link||this.variant==="link"),"vertical",(this.iconPos==="top"||this.iconPos==="bottom")&&this.label))},dataIconP:function(){return re(we(we({},this.iconPos,this.iconPos),this.size,this.size))},dataLabelP:function(){return re(we(we({},this.size,this.size),"icon-only",this.hasIcon&&!this.label&&!this.badge))}},components:{SpinnerIcon:bt,Badge:xo},directives:{ripple:Re}},Fs=["data-p"],Bs=["data-p"];function zs(e,t,n,o,i,r){var a=T("SpinnerIcon"),l=T("Badge"),s=ke("ripple");return e.asChild?k(e.$slots,"default",{key:1,class:j(e.cx("root")),a11yAttrs:r.a11yAttrs}):Ie((c(),y(M(e.as),f({key:0,class:e.cx("root"),"data-p":r.dataP},r.attrs),{default:E(function(){return[k(e.$slots,"default",{},function(){return[e.loading?k(e.$slots,"loadingicon",f({key:0,class:[e.cx("loadingIcon"),e.cx("icon")]},e.ptm("loadingIcon")),function(){return[e.loadingIcon?(c(),b("span",f({key:0,class:[e.cx("loadingIcon"),e.cx("icon"),e.loadingIcon]},e.ptm("loadingIcon")),null,16)):(c(),y(a,f({key:1,class:[e.cx("loadingIcon"),e.cx("icon")],spin:""},e.ptm("loadingIcon")),null,16,["class"]))]}):k(e.$slots,"icon",f({key:1,class:[e.cx("icon")]},e.ptm("icon")),function(){return[e.icon?(c(),b("span",f({key:0,class:[e.cx("icon"),e.icon,e.iconClass],"data-p":r.dataIconP},e.ptm("icon")),null,16,Fs)):C("",!0)]}),R("span",f({class:e.cx("label")},e.ptm("label"),{"data-p":r.dataLabelP}),Y(e.label||" "),17,Bs),e.badge?(c(),y(l,{key:2,value:e.badge,class:j(e.badgeClass),severity:e.badgeSeverity,unstyled:e.unstyled,pt:e.ptm("pcBadge")},null,8,["value","class","severity","unstyled","pt"])):C("",!0)]})]}),_:3},16,["class","data-p"])),[[s]])}gn.render=zs;var Pi=Symbol();function bb(){var e=ii(Pi);if(!e)throw new Error("No PrimeVue Toast provided!");return e}var Oi=Symbol();function gb(){var e=ii(Oi);if(!e)throw new Error("No PrimeVue Confirmation provided!");return e}var gt={name:"Portal",props:{appendTo:{type:[String,Object],default:"body"},disabled:{type:Boolean,default:!1}},data:function(){return{mounted:!1}},mounted:function(){this.mounted=fi()},computed:{inline:function(){return this.disabled||this.appendTo==="self"}}};function As(e,t,n,o,i,r){return r.inline?k(e.$slots,"default",{key:0}):i.mounted?(c(),y(Na,{key:1,to:n.appendTo},[k(e.$slots,"default")],8,["to"])):C("",!0)}gt.render=As;var Oe=bn(),js=({dt:e})=>`
-.p-toast {
-    width: ${e("toast.width")};
-    white-space: pre-line;
-    word-break: break-word;
-}
-
-.p-toast-message {
-    margin: 0 0 1rem 0;
-}
-
-.p-toast-message-icon {
-    flex-shrink: 0;
-    font-size: ${e("toast.icon.size")};
-    width: ${e("toast.icon.size")};
-    height: ${e("toast.icon.size")};
-}
-
-.p-toast-message-content {
-    display: flex;
-    align-items: flex-start;
-    padding: ${e("toast.content.padding")};
-    gap: ${e("toast.content.gap")};
-}
-
-.p-toast-message-text {
-    flex: 1 1 auto;
-    display: flex;
-    flex-direction: column;
-    gap: ${e("toast.text.gap")};
-}
-
-.p-toast-summary {
-    font-weight: ${e("toast.summary.font.weight")};
-    font-size: ${e("toast.summary.font.size")};
-}
-
-.p-toast-detail {
-    font-weight: ${e("toast.detail.font.weight")};
-    font-size: ${e("toast.detail.font.size")};
-}
-
-.p-toast-close-button {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    overflow: hidden;
-    position: relative;
-    cursor: pointer;
-    background: transparent;
-    transition: background ${e("toast.transition.duration")}, color ${e("toast.transition.duration")}, outline-color ${e("toast.transition.duration")}, box-shadow ${e("toast.transition.duration")};
-    outline-color: transparent;
-    color: inherit;
-    width: ${e("toast.close.button.width")};
-    height: ${e("toast.close.button.height")};
-    border-radius: ${e("toast.close.button.border.radius")};
-    margin: -25% 0 0 0;
-    right: -25%;
-    padding: 0;
-    border: none;
-    user-select: none;
-}
-
-.p-toast-close-button:dir(rtl) {
-    margin: -25% 0 0 auto;
-    left: -25%;
-    right: auto;
-}
-
-.p-toast-message-info,
-.p-toast-message-success,
-.p-toast-message-warn,
-.p-toast-message-error,
-.p-toast-message-secondary,
-.p-toast-message-contrast {
-    border-width: ${e("toast.border.width")};
-    border-style: solid;
-    backdrop-filter: blur(${e("toast.blur")});
-    border-radius: ${e("toast.border.radius")};
-}
-
-.p-toast-close-icon {
-    font-size: ${e("toast.close.icon.size")};
-    width: ${e("toast.close.icon.size")};
-    height: ${e("toast.close.icon.size")};
-}
-
-.p-toast-close-button:focus-visible {
-    outline-width: ${e("focus.ring.width")};
-    outline-style: ${e("focus.ring.style")};
-    outline-offset: ${e("focus.ring.offset")};
-}
-
-.p-toast-message-info {
-    background: ${e("toast.info.background")};
-    border-color: ${e("toast.info.border.color")};
-    color: ${e("toast.info.color")};
-    box-shadow: ${e("toast.info.shadow")};
-}
-
-.p-toast-message-info .p-toast-detail {
-    color: ${e("toast.info.detail.color")};
-}
-
-.p-toast-message-info .p-toast-close-button:focus-visible {
-    outline-color: ${e("toast.info.close.button.focus.ring.color")};
-    box-shadow: ${e("toast.info.close.button.focus.ring.shadow")};
-}
-
-.p-toast-message-info .p-toast-close-button:hover {
-    background: ${e("toast.info.close.button.hover.background")};
-}
-
-.p-toast-message-success {
-    background: ${e("toast.success.background")};
-    border-color: ${e("toast.success.border.color")};
-    color: ${e("toast.success.color")};
-    box-shadow: ${e("toast.success.shadow")};
-}
-
-.p-toast-message-success .p-toast-detail {
-    color: ${e("toast.success.detail.color")};
-}
-
-.p-toast-message-success .p-toast-close-button:focus-visible {
-    outline-color: ${e("toast.success.close.button.focus.ring.color")};
-    box-shadow: ${e("toast.success.close.button.focus.ring.shadow")};
-}
-
-.p-toast-message-success .p-toast-close-button:hover {
-    background: ${e("toast.success.close.button.hover.background")};
-}
-
-.p-toast-message-warn {
-    background: ${e("toast.warn.background")};
-    border-color: ${e("toast.warn.border.color")};
-    color: ${e("toast.warn.color")};
-    box-shadow: ${e("toast.warn.shadow")};
-}
-
-.p-toast-message-warn .p-toast-detail {
-    color: ${e("toast.warn.detail.color")};
-}
-
-.p-toast-message-warn .p-toast-close-button:focus-visible {
-    outline-color: ${e("toast.warn.close.button.focus.ring.color")};
-    box-shadow: ${e("toast.warn.close.button.focus.ring.shadow")};
-}
-
-.p-toast-message-warn .p-toast-close-button:hover {
-    background: ${e("toast.warn.close.button.hover.background")};
-}
-
-.p-toast-message-error {
-    background: ${e("toast.error.background")};
-    border-color: ${e("toast.error.border.color")};
-    color: ${e("toast.error.color")};
-    box-shadow: ${e("toast.error.shadow")};
-}
-
-.p-toast-message-error .p-toast-detail {
-    color: ${e("toast.error.detail.color")};
-}
-
-.p-toast-message-error .p-toast-close-button:focus-visible {
-    outline-color: ${e("toast.error.close.button.focus.ring.color")};
-    box-shadow: ${e("toast.error.close.button.focus.ring.shadow")};
-}
-
-.p-toast-message-error .p-toast-close-button:hover {
-    background: ${e("toast.error.close.button.hover.background")};
-}
-
-.p-toast-message-secondary {
-    background: ${e("toast.secondary.background")};
-    border-color: ${e("toast.secondary.border.color")};
-    color: ${e("toast.secondary.color")};
-    box-shadow: ${e("toast.secondary.shadow")};
-}
-
-.p-toast-message-secondary .p-toast-detail {
-    color: ${e("toast.secondary.detail.color")};
-}
-
-.p-toast-message-secondary .p-toast-close-button:focus-visible {
-    outline-color: ${e("toast.secondary.close.button.focus.ring.color")};
-    box-shadow: ${e("toast.secondary.close.button.focus.ring.shadow")};
-}
-
-.p-toast-message-secondary .p-toast-close-button:hover {
-    background: ${e("toast.secondary.close.button.hover.background")};
-}
-
-.p-toast-message-contrast {
-    background: ${e("toast.contrast.background")};
-    border-color: ${e("toast.contrast.border.color")};
-    color: ${e("toast.contrast.color")};
-    box-shadow: ${e("toast.contrast.shadow")};
-}
-
-.p-toast-message-contrast .p-toast-detail {
-    color: ${e("toast.contrast.detail.color")};
-}
-
-.p-toast-message-contrast .p-toast-close-button:focus-visible {
-    outline-color: ${e("toast.contrast.close.button.focus.ring.color")};
-    box-shadow: ${e("toast.contrast.close.button.focus.ring.shadow")};
-}
-
-.p-toast-message-contrast .p-toast-close-button:hover {
-    background: ${e("toast.contrast.close.button.hover.background")};
-}
-
-.p-toast-top-center {
-    transform: translateX(-50%);
-}
-
-.p-toast-bottom-center {
-    transform: translateX(-50%);
-}
-
-.p-toast-center {
-    min-width: 20vw;
-    transform: translate(-50%, -50%);
-}
-
-.p-toast-message-enter-from {
-    opacity: 0;
-    transform: translateY(50%);
-}
-
-.p-toast-message-leave-from {
-    max-height: 1000px;
-}
-
-.p-toast .p-toast-message.p-toast-message-leave-to {
-    max-height: 0;
-    opacity: 0;
-    margin-bottom: 0;
-    overflow: hidden;
-}
-
-.p-toast-message-enter-active {
-    transition: transform 0.3s, opacity 0.3s;
-}
-
-.p-toast-message-leave-active {
-    transition: max-height 0.45s cubic-bezier(0, 1, 0, 1), opacity 0.3s, margin-bottom 0.3s;
-}
-`;function Bt(e){"@babel/helpers - typeof";return Bt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Bt(e)}function Sn(e,t,n){return(t=Ks(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ks(e){var t=Vs(e,"string");return Bt(t)=="symbol"?t:t+""}function Vs(e,t){if(Bt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Bt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Ns={root:function(t){var n=t.position;return{position:"fixed",top:n==="top-right"||n==="top-left"||n==="top-center"?"20px":n==="center"?"50%":null,right:(n==="top-right"||n==="bottom-right")&&"20px",bottom:(n==="bottom-left"||n==="bottom-right"||n==="bottom-center")&&"20px",left:n==="top-left"||n==="bottom-left"?"20px":n==="center"||n==="top-center"||n==="bottom-center"?"50%":null}}},Hs={root:function(t){var n=t.props;return["p-toast p-component p-toast-"+n.position]},message:function(t){var n=t.props;return["p-toast-message",{"p-toast-message-info":n.message.severity==="info"||n.message.severity===void 0,"p-toast-message-warn":n.message.severity==="warn","p-toast-message-error":n.message.severity==="error","p-toast-message-success":n.message.severity==="success","p-toast-message-secondary":n.message.severity==="secondary","p-toast-message-contrast":n.message.severity==="contrast"}]},messageContent:"p-toast-message-content",messageIcon:function(t){var n=t.props;return["p-toast-message-icon",Sn(Sn(Sn(Sn({},n.infoIcon,n.message.severity==="info"),n.warnIcon,n.message.severity==="warn"),n.errorIcon,n.message.severity==="error"),n.successIcon,n.message.severity==="success")]},messageText:"p-toast-message-text",summary:"p-toast-summary",detail:"p-toast-detail",closeButton:"p-toast-close-button",closeIcon:"p-toast-close-icon"},Gs=N.extend({name:"toast",style:js,classes:Hs,inlineStyles:Ns}),qe={name:"CheckIcon",extends:J};function Us(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M4.86199 11.5948C4.78717 11.5923 4.71366 11.5745 4.64596 11.5426C4.57826 11.5107 4.51779 11.4652 4.46827 11.4091L0.753985 7.69483C0.683167 7.64891 0.623706 7.58751 0.580092 7.51525C0.536478 7.44299 0.509851 7.36177 0.502221 7.27771C0.49459 7.19366 0.506156 7.10897 0.536046 7.03004C0.565935 6.95111 0.613367 6.88 0.674759 6.82208C0.736151 6.76416 0.8099 6.72095 0.890436 6.69571C0.970973 6.67046 1.05619 6.66385 1.13966 6.67635C1.22313 6.68886 1.30266 6.72017 1.37226 6.76792C1.44186 6.81567 1.4997 6.8786 1.54141 6.95197L4.86199 10.2503L12.6397 2.49483C12.7444 2.42694 12.8689 2.39617 12.9932 2.40745C13.1174 2.41873 13.2343 2.47141 13.3251 2.55705C13.4159 2.64268 13.4753 2.75632 13.4938 2.87973C13.5123 3.00315 13.4888 3.1292 13.4271 3.23768L5.2557 11.4091C5.20618 11.4652 5.14571 11.5107 5.07801 11.5426C5.01031 11.5745 4.9368 11.5923 4.86199 11.5948Z",fill:"currentColor"},null,-1)]),16)}qe.render=Us;var io={name:"ExclamationTriangleIcon",extends:J};function _s(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M13.4018 13.1893H0.598161C0.49329 13.189 0.390283 13.1615 0.299143 13.1097C0.208003 13.0578 0.131826 12.9832 0.0780112 12.8932C0.0268539 12.8015 0 12.6982 0 12.5931C0 12.4881 0.0268539 12.3848 0.0780112 12.293L6.47985 1.08982C6.53679 1.00399 6.61408 0.933574 6.70484 0.884867C6.7956 0.836159 6.897 0.810669 7 0.810669C7.103 0.810669 7.2044 0.836159 7.29516 0.884867C7.38592 0.933574 7.46321 1.00399 7.52015 1.08982L13.922 12.293C13.9731 12.3848 14 12.4881 14 12.5931C14 12.6982 13.9731 12.8015 13.922 12.8932C13.8682 12.9832 13.792 13.0578 13.7009 13.1097C13.6097 13.1615 13.5067 13.189 13.4018 13.1893ZM1.63046 11.989H12.3695L7 2.59425L1.63046 11.989Z",fill:"currentColor"},null,-1),R("path",{d:"M6.99996 8.78801C6.84143 8.78594 6.68997 8.72204 6.57787 8.60993C6.46576 8.49782 6.40186 8.34637 6.39979 8.18784V5.38703C6.39979 5.22786 6.46302 5.0752 6.57557 4.96265C6.68813 4.85009 6.84078 4.78686 6.99996 4.78686C7.15914 4.78686 7.31179 4.85009 7.42435 4.96265C7.5369 5.0752 7.60013 5.22786 7.60013 5.38703V8.18784C7.59806 8.34637 7.53416 8.49782 7.42205 8.60993C7.30995 8.72204 7.15849 8.78594 6.99996 8.78801Z",fill:"currentColor"},null,-1),R("path",{d:"M6.99996 11.1887C6.84143 11.1866 6.68997 11.1227 6.57787 11.0106C6.46576 10.8985 6.40186 10.7471 6.39979 10.5885V10.1884C6.39979 10.0292 6.46302 9.87658 6.57557 9.76403C6.68813 9.65147 6.84078 9.58824 6.99996 9.58824C7.15914 9.58824 7.31179 9.65147 7.42435 9.76403C7.5369 9.87658 7.60013 10.0292 7.60013 10.1884V10.5885C7.59806 10.7471 7.53416 10.8985 7.42205 11.0106C7.30995 11.1227 7.15849 11.1866 6.99996 11.1887Z",fill:"currentColor"},null,-1)]),16)}io.render=_s;var ao={name:"InfoCircleIcon",extends:J};function Ws(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M3.11101 12.8203C4.26215 13.5895 5.61553 14 7 14C8.85652 14 10.637 13.2625 11.9497 11.9497C13.2625 10.637 14 8.85652 14 7C14 5.61553 13.5895 4.26215 12.8203 3.11101C12.0511 1.95987 10.9579 1.06266 9.67879 0.532846C8.3997 0.00303296 6.99224 -0.13559 5.63437 0.134506C4.2765 0.404603 3.02922 1.07129 2.05026 2.05026C1.07129 3.02922 0.404603 4.2765 0.134506 5.63437C-0.13559 6.99224 0.00303296 8.3997 0.532846 9.67879C1.06266 10.9579 1.95987 12.0511 3.11101 12.8203ZM3.75918 2.14976C4.71846 1.50879 5.84628 1.16667 7 1.16667C8.5471 1.16667 10.0308 1.78125 11.1248 2.87521C12.2188 3.96918 12.8333 5.45291 12.8333 7C12.8333 8.15373 12.4912 9.28154 11.8502 10.2408C11.2093 11.2001 10.2982 11.9478 9.23232 12.3893C8.16642 12.8308 6.99353 12.9463 5.86198 12.7212C4.73042 12.4962 3.69102 11.9406 2.87521 11.1248C2.05941 10.309 1.50384 9.26958 1.27876 8.13803C1.05367 7.00647 1.16919 5.83358 1.61071 4.76768C2.05222 3.70178 2.79989 2.79074 3.75918 2.14976ZM7.00002 4.8611C6.84594 4.85908 6.69873 4.79698 6.58977 4.68801C6.48081 4.57905 6.4187 4.43185 6.41669 4.27776V3.88888C6.41669 3.73417 6.47815 3.58579 6.58754 3.4764C6.69694 3.367 6.84531 3.30554 7.00002 3.30554C7.15473 3.30554 7.3031 3.367 7.4125 3.4764C7.52189 3.58579 7.58335 3.73417 7.58335 3.88888V4.27776C7.58134 4.43185 7.51923 4.57905 7.41027 4.68801C7.30131 4.79698 7.1541 4.85908 7.00002 4.8611ZM7.00002 10.6945C6.84594 10.6925 6.69873 10.6304 6.58977 10.5214C6.48081 10.4124 6.4187 10.2652 6.41669 10.1111V6.22225C6.41669 6.06754 6.47815 5.91917 6.58754 5.80977C6.69694 5.70037 6.84531 5.63892 7.00002 5.63892C7.15473 5.63892 7.3031 5.70037 7.4125 5.80977C7.52189 5.91917 7.58335 6.06754 7.58335 6.22225V10.1111C7.58134 10.2652 7.51923 10.4124 7.41027 10.5214C7.30131 10.6304 7.1541 10.6925 7.00002 10.6945Z",fill:"currentColor"},null,-1)]),16)}ao.render=Ws;var yn={name:"TimesIcon",extends:J};function Zs(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M8.01186 7.00933L12.27 2.75116C12.341 2.68501 12.398 2.60524 12.4375 2.51661C12.4769 2.42798 12.4982 2.3323 12.4999 2.23529C12.5016 2.13827 12.4838 2.0419 12.4474 1.95194C12.4111 1.86197 12.357 1.78024 12.2884 1.71163C12.2198 1.64302 12.138 1.58893 12.0481 1.55259C11.9581 1.51625 11.8617 1.4984 11.7647 1.50011C11.6677 1.50182 11.572 1.52306 11.4834 1.56255C11.3948 1.60204 11.315 1.65898 11.2488 1.72997L6.99067 5.98814L2.7325 1.72997C2.59553 1.60234 2.41437 1.53286 2.22718 1.53616C2.03999 1.53946 1.8614 1.61529 1.72901 1.74767C1.59663 1.88006 1.5208 2.05865 1.5175 2.24584C1.5142 2.43303 1.58368 2.61419 1.71131 2.75116L5.96948 7.00933L1.71131 11.2675C1.576 11.403 1.5 11.5866 1.5 11.7781C1.5 11.9696 1.576 12.1532 1.71131 12.2887C1.84679 12.424 2.03043 12.5 2.2219 12.5C2.41338 12.5 2.59702 12.424 2.7325 12.2887L6.99067 8.03052L11.2488 12.2887C11.3843 12.424 11.568 12.5 11.7594 12.5C11.9509 12.5 12.1346 12.424 12.27 12.2887C12.4053 12.1532 12.4813 11.9696 12.4813 11.7781C12.4813 11.5866 12.4053 11.403 12.27 11.2675L8.01186 7.00933Z",fill:"currentColor"},null,-1)]),16)}yn.render=Zs;var Dn={name:"TimesCircleIcon",extends:J};function qs(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M7 14C5.61553 14 4.26215 13.5895 3.11101 12.8203C1.95987 12.0511 1.06266 10.9579 0.532846 9.67879C0.00303296 8.3997 -0.13559 6.99224 0.134506 5.63437C0.404603 4.2765 1.07129 3.02922 2.05026 2.05026C3.02922 1.07129 4.2765 0.404603 5.63437 0.134506C6.99224 -0.13559 8.3997 0.00303296 9.67879 0.532846C10.9579 1.06266 12.0511 1.95987 12.8203 3.11101C13.5895 4.26215 14 5.61553 14 7C14 8.85652 13.2625 10.637 11.9497 11.9497C10.637 13.2625 8.85652 14 7 14ZM7 1.16667C5.84628 1.16667 4.71846 1.50879 3.75918 2.14976C2.79989 2.79074 2.05222 3.70178 1.61071 4.76768C1.16919 5.83358 1.05367 7.00647 1.27876 8.13803C1.50384 9.26958 2.05941 10.309 2.87521 11.1248C3.69102 11.9406 4.73042 12.4962 5.86198 12.7212C6.99353 12.9463 8.16642 12.8308 9.23232 12.3893C10.2982 11.9478 11.2093 11.2001 11.8502 10.2408C12.4912 9.28154 12.8333 8.15373 12.8333 7C12.8333 5.45291 12.2188 3.96918 11.1248 2.87521C10.0308 1.78125 8.5471 1.16667 7 1.16667ZM4.66662 9.91668C4.58998 9.91704 4.51404 9.90209 4.44325 9.87271C4.37246 9.84333 4.30826 9.8001 4.2544 9.74557C4.14516 9.6362 4.0838 9.48793 4.0838 9.33335C4.0838 9.17876 4.14516 9.0305 4.2544 8.92113L6.17553 7L4.25443 5.07891C4.15139 4.96832 4.09529 4.82207 4.09796 4.67094C4.10063 4.51982 4.16185 4.37563 4.26872 4.26876C4.3756 4.16188 4.51979 4.10066 4.67091 4.09799C4.82204 4.09532 4.96829 4.15142 5.07887 4.25446L6.99997 6.17556L8.92106 4.25446C9.03164 4.15142 9.1779 4.09532 9.32903 4.09799C9.48015 4.10066 9.62434 4.16188 9.73121 4.26876C9.83809 4.37563 9.89931 4.51982 9.90198 4.67094C9.90464 4.82207 9.84855 4.96832 9.74551 5.07891L7.82441 7L9.74554 8.92113C9.85478 9.0305 9.91614 9.17876 9.91614 9.33335C9.91614 9.48793 9.85478 9.6362 9.74554 9.74557C9.69168 9.8001 9.62748 9.84333 9.55669 9.87271C9.4859 9.90209 9.40996 9.91704 9.33332 9.91668C9.25668 9.91704 9.18073 9.90209 9.10995 9.87271C9.03916 9.84333 8.97495 9.8001 8.9211 9.74557L6.99997 7.82444L5.07884 9.74557C5.02499 9.8001 4.96078 9.84333 4.88999 9.87271C4.81921 9.90209 4.74326 9.91704 4.66662 9.91668Z",fill:"currentColor"},null,-1)]),16)}Dn.render=qs;var Ys={name:"BaseToast",extends:U,props:{group:{type:String,default:null},position:{type:String,default:"top-right"},autoZIndex:{type:Boolean,default:!0},baseZIndex:{type:Number,default:0},breakpoints:{type:Object,default:null},closeIcon:{type:String,default:void 0},infoIcon:{type:String,default:void 0},warnIcon:{type:String,default:void 0},errorIcon:{type:String,default:void 0},successIcon:{type:String,default:void 0},closeButtonProps:{type:null,default:null},onMouseEnter:{type:Function,default:void 0},onMouseLeave:{type:Function,default:void 0},onClick:{type:Function,default:void 0}},style:Gs,provide:function(){return{$pcToast:this,$parentInstance:this}}};function zt(e){"@babel/helpers - typeof";return zt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},zt(e)}function Js(e,t,n){return(t=Xs(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xs(e){var t=Qs(e,"string");return zt(t)=="symbol"?t:t+""}function Qs(e,t){if(zt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(zt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var xi={name:"ToastMessage",hostName:"Toast",extends:U,emits:["close"],closeTimeout:null,createdAt:null,lifeRemaining:null,props:{message:{type:null,default:null},templates:{type:Object,default:null},closeIcon:{type:String,default:null},infoIcon:{type:String,default:null},warnIcon:{type:String,default:null},errorIcon:{type:String,default:null},successIcon:{type:String,default:null},closeButtonProps:{type:null,default:null}},mounted:function(){this.message.life&&(this.lifeRemaining=this.message.life,this.startTimeout())},beforeUnmount:function(){this.clearCloseTimeout()},methods:{startTimeout:function(){var t=this;this.createdAt=new Date().valueOf(),this.closeTimeout=setTimeout(function(){t.close({message:t.message,type:"life-end"})},this.lifeRemaining)},close:function(t){this.$emit("close",t)},onCloseClick:function(){this.clearCloseTimeout(),this.close({message:this.message,type:"close"})},clearCloseTimeout:function(){this.closeTimeout&&(clearTimeout(this.closeTimeout),this.closeTimeout=null)},onMessageClick:function(t){var n;!((n=this.props)===null||n===void 0)&&n.onClick&&this.props.onClick({originalEvent:t,message:this.message})},onMouseEnter:function(t){var n;if((n=this.props)!==null&&n!==void 0&&n.onMouseEnter){if(this.props.onMouseEnter({originalEvent:t,message:this.message}),t.defaultPrevented)return;this.message.life&&(this.lifeRemaining=this.createdAt+this.lifeRemaining-Date().valueOf(),this.createdAt=null,this.clearCloseTimeout())}},onMouseLeave:function(t){var n;if((n=this.props)!==null&&n!==void 0&&n.onMouseLeave){if(this.props.onMouseLeave({originalEvent:t,message:this.message}),t.defaultPrevented)return;this.message.life&&this.startTimeout()}}},computed:{iconComponent:function(){return{info:!this.infoIcon&&ao,success:!this.successIcon&&qe,warn:!this.warnIcon&&io,error:!this.errorIcon&&Dn}[this.message.severity]},closeAriaLabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.close:void 0},dataP:function(){return re(Js({},this.message.severity,this.message.severity))}},components:{TimesIcon:yn,InfoCircleIcon:ao,CheckIcon:qe,ExclamationTriangleIcon:io,TimesCircleIcon:Dn},directives:{ripple:Re}};function At(e){"@babel/helpers - typeof";return At=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},At(e)}function dr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function cr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?dr(Object(n),!0).forEach(function(o){eu(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function eu(e,t,n){return(t=tu(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function tu(e){var t=nu(e,"string");return At(t)=="symbol"?t:t+""}function nu(e,t){if(At(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(At(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var ou=["data-p"],ru=["data-p"],iu=["data-p"],au=["data-p"],lu=["aria-label","data-p"];function su(e,t,n,o,i,r){var a=ke("ripple");return c(),b("div",f({class:[e.cx("message"),n.message.styleClass],role:"alert","aria-live":"assertive","aria-atomic":"true","data-p":r.dataP},e.ptm("message"),{onClick:t[1]||(t[1]=function(){return r.onMessageClick&&r.onMessageClick.apply(r,arguments)}),onMouseenter:t[2]||(t[2]=function(){return r.onMouseEnter&&r.onMouseEnter.apply(r,arguments)}),onMouseleave:t[3]||(t[3]=function(){return r.onMouseLeave&&r.onMouseLeave.apply(r,arguments)})}),[n.templates.container?(c(),y(M(n.templates.container),{key:0,message:n.message,closeCallback:r.onCloseClick},null,8,["message","closeCallback"])):(c(),b("div",f({key:1,class:[e.cx("messageContent"),n.message.contentStyleClass]},e.ptm("messageContent")),[n.templates.message?(c(),y(M(n.templates.message),{key:1,message:n.message},null,8,["message"])):(c(),b(K,{key:0},[(c(),y(M(n.templates.messageicon?n.templates.messageicon:n.templates.icon?n.templates.icon:r.iconComponent&&r.iconComponent.name?r.iconComponent:"span"),f({class:e.cx("messageIcon")},e.ptm("messageIcon")),null,16,["class"])),R("div",f({class:e.cx("messageText"),"data-p":r.dataP},e.ptm("messageText")),[R("span",f({class:e.cx("summary"),"data-p":r.dataP},e.ptm("summary")),Y(n.message.summary),17,iu),n.message.detail?(c(),b("div",f({key:0,class:e.cx("detail"),"data-p":r.dataP},e.ptm("detail")),Y(n.message.detail),17,au)):C("",!0)],16,ru)],64)),n.message.closable!==!1?(c(),b("div",mt(f({key:2},e.ptm("buttonContainer"))),[Ie((c(),b("button",f({class:e.cx("closeButton"),type:"button","aria-label":r.closeAriaLabel,onClick:t[0]||(t[0]=function(){return r.onCloseClick&&r.onCloseClick.apply(r,arguments)}),autofocus:"","data-p":r.dataP},cr(cr({},n.closeButtonProps),e.ptm("closeButton"))),[(c(),y(M(n.templates.closeicon||"TimesIcon"),f({class:[e.cx("closeIcon"),n.closeIcon]},e.ptm("closeIcon")),null,16,["class"]))],16,lu)),[[a]])],16)):C("",!0)],16))],16,ou)}xi.render=su;function jt(e){"@babel/helpers - typeof";return jt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},jt(e)}function uu(e,t,n){return(t=du(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function du(e){var t=cu(e,"string");return jt(t)=="symbol"?t:t+""}function cu(e,t){if(jt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(jt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function pu(e){return bu(e)||mu(e)||hu(e)||fu()}function fu(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function hu(e,t){if(e){if(typeof e=="string")return lo(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?lo(e,t):void 0}}function mu(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function bu(e){if(Array.isArray(e))return lo(e)}function lo(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var gu=0,yu={name:"Toast",extends:Ys,inheritAttrs:!1,emits:["close","life-end"],data:function(){return{messages:[]}},styleElement:null,mounted:function(){Oe.on("add",this.onAdd),Oe.on("remove",this.onRemove),Oe.on("remove-group",this.onRemoveGroup),Oe.on("remove-all-groups",this.onRemoveAllGroups),this.breakpoints&&this.createStyle()},beforeUnmount:function(){this.destroyStyle(),this.$refs.container&&this.autoZIndex&&me.clear(this.$refs.container),Oe.off("add",this.onAdd),Oe.off("remove",this.onRemove),Oe.off("remove-group",this.onRemoveGroup),Oe.off("remove-all-groups",this.onRemoveAllGroups)},methods:{add:function(t){t.id==null&&(t.id=gu++),this.messages=[].concat(pu(this.messages),[t])},remove:function(t){var n=this.messages.findIndex(function(o){return o.id===t.message.id});n!==-1&&(this.messages.splice(n,1),this.$emit(t.type,{message:t.message}))},onAdd:function(t){this.group==t.group&&this.add(t)},onRemove:function(t){this.remove({message:t,type:"close"})},onRemoveGroup:function(t){this.group===t&&(this.messages=[])},onRemoveAllGroups:function(){var t=this;this.messages.forEach(function(n){return t.$emit("close",{message:n})}),this.messages=[]},onEnter:function(){this.autoZIndex&&me.set("modal",this.$refs.container,this.baseZIndex||this.$primevue.config.zIndex.modal)},onLeave:function(){var t=this;this.$refs.container&&this.autoZIndex&&he(this.messages)&&setTimeout(function(){me.clear(t.$refs.container)},200)},createStyle:function(){if(!this.styleElement&&!this.isUnstyled){var t;this.styleElement=document.createElement("style"),this.styleElement.type="text/css",mn(this.styleElement,"nonce",(t=this.$primevue)===null||t===void 0||(t=t.config)===null||t===void 0||(t=t.csp)===null||t===void 0?void 0:t.nonce),document.head.appendChild(this.styleElement);var n="";for(var o in this.breakpoints){var i="";for(var r in this.breakpoints[o])i+=r+":"+this.breakpoints[o][r]+"!important;";n+=`
-                        @media screen and (max-width: `.concat(o,`) {
-                            .p-toast[`).concat(this.$attrSelector,`] {
-                                `).concat(i,`
-                            }
-                        }
-                    `)}this.styleElement.innerHTML=n}},destroyStyle:function(){this.styleElement&&(document.head.removeChild(this.styleElement),this.styleElement=null)}},computed:{dataP:function(){return re(uu({},this.position,this.position))}},components:{ToastMessage:xi,Portal:gt}};function Kt(e){"@babel/helpers - typeof";return Kt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Kt(e)}function pr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function vu(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?pr(Object(n),!0).forEach(function(o){wu(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function wu(e,t,n){return(t=Cu(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Cu(e){var t=Su(e,"string");return Kt(t)=="symbol"?t:t+""}function Su(e,t){if(Kt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Kt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var $u=["data-p"];function ku(e,t,n,o,i,r){var a=T("ToastMessage"),l=T("Portal");return c(),y(l,null,{default:E(function(){return[R("div",f({ref:"container",class:e.cx("root"),style:e.sx("root",!0,{position:e.position}),"data-p":r.dataP},e.ptmi("root")),[ne(Ha,f({name:"p-toast-message",tag:"div",onEnter:r.onEnter,onLeave:r.onLeave},vu({},e.ptm("transition"))),{default:E(function(){return[(c(!0),b(K,null,ue(i.messages,function(s){return c(),y(a,{key:s.id,message:s,templates:e.$slots,closeIcon:e.closeIcon,infoIcon:e.infoIcon,warnIcon:e.warnIcon,errorIcon:e.errorIcon,successIcon:e.successIcon,closeButtonProps:e.closeButtonProps,unstyled:e.unstyled,onClose:t[0]||(t[0]=function(u){return r.remove(u)}),pt:e.pt},null,8,["message","templates","closeIcon","infoIcon","warnIcon","errorIcon","successIcon","closeButtonProps","unstyled","pt"])}),128))]}),_:1},16,["onEnter","onLeave"])],16,$u)]}),_:1})}yu.render=ku;var Iu=({dt:e})=>`
-.p-floatlabel {
-    display: block;
-    position: relative;
-}
-
-.p-floatlabel label {
-    position: absolute;
-    pointer-events: none;
-    top: 50%;
-    transform: translateY(-50%);
-    transition-property: all;
-    transition-timing-function: ease;
-    line-height: 1;
-    font-weight: ${e("floatlabel.font.weight")};
-    inset-inline-start: ${e("floatlabel.position.x")};
-    color: ${e("floatlabel.color")};
-    transition-duration: ${e("floatlabel.transition.duration")};
-}
-
-.p-floatlabel:has(.p-textarea) label {
-    top: ${e("floatlabel.position.y")};
-    transform: translateY(0);
-}
-
-.p-floatlabel:has(.p-inputicon:first-child) label {
-    inset-inline-start: calc((${e("form.field.padding.x")} * 2) + ${e("icon.size")});
-}
-
-.p-floatlabel:has(.p-invalid) label {
-    color: ${e("floatlabel.invalid.color")};
-}
-
-.p-floatlabel:has(input:focus) label,
-.p-floatlabel:has(input.p-filled) label,
-.p-floatlabel:has(input:-webkit-autofill) label,
-.p-floatlabel:has(textarea:focus) label,
-.p-floatlabel:has(textarea.p-filled) label,
-.p-floatlabel:has(.p-inputwrapper-focus) label,
-.p-floatlabel:has(.p-inputwrapper-filled) label {
-    top: ${e("floatlabel.over.active.top")};
-    transform: translateY(0);
-    font-size: ${e("floatlabel.active.font.size")};
-    font-weight: ${e("floatlabel.active.font.weight")};
-}
-
-.p-floatlabel:has(input.p-filled) label,
-.p-floatlabel:has(textarea.p-filled) label,
-.p-floatlabel:has(.p-inputwrapper-filled) label {
-    color: ${e("floatlabel.active.color")};
-}
-
-.p-floatlabel:has(input:focus) label,
-.p-floatlabel:has(input:-webkit-autofill) label,
-.p-floatlabel:has(textarea:focus) label,
-.p-floatlabel:has(.p-inputwrapper-focus) label {
-    color: ${e("floatlabel.focus.color")};
-}
-
-.p-floatlabel-in .p-inputtext,
-.p-floatlabel-in .p-textarea,
-.p-floatlabel-in .p-select-label,
-.p-floatlabel-in .p-multiselect-label,
-.p-floatlabel-in .p-autocomplete-input-multiple,
-.p-floatlabel-in .p-cascadeselect-label,
-.p-floatlabel-in .p-treeselect-label {
-    padding-block-start: ${e("floatlabel.in.input.padding.top")};
-    padding-block-end: ${e("floatlabel.in.input.padding.bottom")};
-}
-
-.p-floatlabel-in:has(input:focus) label,
-.p-floatlabel-in:has(input.p-filled) label,
-.p-floatlabel-in:has(input:-webkit-autofill) label,
-.p-floatlabel-in:has(textarea:focus) label,
-.p-floatlabel-in:has(textarea.p-filled) label,
-.p-floatlabel-in:has(.p-inputwrapper-focus) label,
-.p-floatlabel-in:has(.p-inputwrapper-filled) label {
-    top: ${e("floatlabel.in.active.top")};
-}
-
-.p-floatlabel-on:has(input:focus) label,
-.p-floatlabel-on:has(input.p-filled) label,
-.p-floatlabel-on:has(input:-webkit-autofill) label,
-.p-floatlabel-on:has(textarea:focus) label,
-.p-floatlabel-on:has(textarea.p-filled) label,
-.p-floatlabel-on:has(.p-inputwrapper-focus) label,
-.p-floatlabel-on:has(.p-inputwrapper-filled) label {
-    top: 0;
-    transform: translateY(-50%);
-    border-radius: ${e("floatlabel.on.border.radius")};
-    background: ${e("floatlabel.on.active.background")};
-    padding: ${e("floatlabel.on.active.padding")};
-}
-`,Pu={root:function(t){var n=t.props;return["p-floatlabel",{"p-floatlabel-over":n.variant==="over","p-floatlabel-on":n.variant==="on","p-floatlabel-in":n.variant==="in"}]}},Ou=N.extend({name:"floatlabel",style:Iu,classes:Pu}),xu={name:"BaseFloatLabel",extends:U,props:{variant:{type:String,default:"over"}},style:Ou,provide:function(){return{$pcFloatLabel:this,$parentInstance:this}}},Ru={name:"FloatLabel",extends:xu,inheritAttrs:!1};function Lu(e,t,n,o,i,r){return c(),b("span",f({class:e.cx("root")},e.ptmi("root")),[k(e.$slots,"default")],16)}Ru.render=Lu;function Vt(e){"@babel/helpers - typeof";return Vt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Vt(e)}function Tu(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Mu(e,t){for(var n=0;n<t.length;n++){var o=t[n];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(e,Du(o.key),o)}}function Eu(e,t,n){return t&&Mu(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function Du(e){var t=Fu(e,"string");return Vt(t)=="symbol"?t:t+""}function Fu(e,t){if(Vt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Vt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var Ro=function(){function e(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:function(){};Tu(this,e),this.element=t,this.listener=n}return Eu(e,[{key:"bindScrollListener",value:function(){this.scrollableParents=rl(this.element);for(var n=0;n<this.scrollableParents.length;n++)this.scrollableParents[n].addEventListener("scroll",this.listener)}},{key:"unbindScrollListener",value:function(){if(this.scrollableParents)for(var n=0;n<this.scrollableParents.length;n++)this.scrollableParents[n].removeEventListener("scroll",this.listener)}},{key:"destroy",value:function(){this.unbindScrollListener(),this.element=null,this.listener=null,this.scrollableParents=null}}])}();function Nt(e){"@babel/helpers - typeof";return Nt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Nt(e)}function Bu(e){return Ku(e)||ju(e)||Au(e)||zu()}function zu(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Au(e,t){if(e){if(typeof e=="string")return so(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?so(e,t):void 0}}function ju(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function Ku(e){if(Array.isArray(e))return so(e)}function so(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function Vu(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Nu(e,t){for(var n=0;n<t.length;n++){var o=t[n];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(e,Ri(o.key),o)}}function Hu(e,t,n){return t&&Nu(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function fr(e,t,n){return(t=Ri(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ri(e){var t=Gu(e,"string");return Nt(t)=="symbol"?t:t+""}function Gu(e,t){if(Nt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Nt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var ft=function(){function e(t){var n=t.init,o=t.type;Vu(this,e),fr(this,"helpers",void 0),fr(this,"type",void 0),this.helpers=new Set(n),this.type=o}return Hu(e,[{key:"add",value:function(n){this.helpers.add(n)}},{key:"update",value:function(){}},{key:"delete",value:function(n){this.helpers.delete(n)}},{key:"clear",value:function(){this.helpers.clear()}},{key:"get",value:function(n,o){var i=this._get(n,o),r=i?this._recursive(Bu(this.helpers),i):null;return A(r)?r:null}},{key:"_isMatched",value:function(n,o){var i,r=n==null?void 0:n.parent;return(r==null||(i=r.vnode)===null||i===void 0?void 0:i.key)===o||r&&this._isMatched(r,o)||!1}},{key:"_get",value:function(n,o){var i,r;return((i=o||(n==null?void 0:n.$slots))===null||i===void 0||(r=i.default)===null||r===void 0?void 0:r.call(i))||null}},{key:"_recursive",value:function(){var n=this,o=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:[],r=[];return i.forEach(function(a){a.children instanceof Array?r=r.concat(n._recursive(r,a.children)):a.type.name===n.type?r.push(a):A(a.key)&&(r=r.concat(o.filter(function(l){return n._isMatched(l,a.key)}).map(function(l){return l.vnode})))}),r}}])}();function Je(e,t){if(e){var n=e.props;if(n){var o=t.replace(/([a-z])([A-Z])/g,"$1-$2").toLowerCase(),i=Object.prototype.hasOwnProperty.call(n,o)?o:t;return e.type.extends.props[t].type===Boolean&&n[i]===""?!0:n[i]}}return null}var vn={name:"ChevronDownIcon",extends:J};function Uu(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M7.01744 10.398C6.91269 10.3985 6.8089 10.378 6.71215 10.3379C6.61541 10.2977 6.52766 10.2386 6.45405 10.1641L1.13907 4.84913C1.03306 4.69404 0.985221 4.5065 1.00399 4.31958C1.02276 4.13266 1.10693 3.95838 1.24166 3.82747C1.37639 3.69655 1.55301 3.61742 1.74039 3.60402C1.92777 3.59062 2.11386 3.64382 2.26584 3.75424L7.01744 8.47394L11.769 3.75424C11.9189 3.65709 12.097 3.61306 12.2748 3.62921C12.4527 3.64535 12.6199 3.72073 12.7498 3.84328C12.8797 3.96582 12.9647 4.12842 12.9912 4.30502C13.0177 4.48162 12.9841 4.662 12.8958 4.81724L7.58083 10.1322C7.50996 10.2125 7.42344 10.2775 7.32656 10.3232C7.22968 10.3689 7.12449 10.3944 7.01744 10.398Z",fill:"currentColor"},null,-1)]),16)}vn.render=Uu;var _u=({dt:e})=>`
-.p-chip {
-    display: inline-flex;
-    align-items: center;
-    background: ${e("chip.background")};
-    color: ${e("chip.color")};
-    border-radius: ${e("chip.border.radius")};
-    padding-block: ${e("chip.padding.y")};
-    padding-inline: ${e("chip.padding.x")};
-    gap: ${e("chip.gap")};
-}
-
-.p-chip-icon {
-    color: ${e("chip.icon.color")};
-    font-size: ${e("chip.icon.font.size")};
-    width: ${e("chip.icon.size")};
-    height: ${e("chip.icon.size")};
-}
-
-.p-chip-image {
-    border-radius: 50%;
-    width: ${e("chip.image.width")};
-    height: ${e("chip.image.height")};
-    margin-inline-start: calc(-1 * ${e("chip.padding.y")});
-}
-
-.p-chip:has(.p-chip-remove-icon) {
-    padding-inline-end: ${e("chip.padding.y")};
-}
-
-.p-chip:has(.p-chip-image) {
-    padding-block-start: calc(${e("chip.padding.y")} / 2);
-    padding-block-end: calc(${e("chip.padding.y")} / 2);
-}
-
-.p-chip-remove-icon {
-    cursor: pointer;
-    font-size: ${e("chip.remove.icon.size")};
-    width: ${e("chip.remove.icon.size")};
-    height: ${e("chip.remove.icon.size")};
-    color: ${e("chip.remove.icon.color")};
-    border-radius: 50%;
-    transition: outline-color ${e("chip.transition.duration")}, box-shadow ${e("chip.transition.duration")};
-    outline-color: transparent;
-}
-
-.p-chip-remove-icon:focus-visible {
-    box-shadow: ${e("chip.remove.icon.focus.ring.shadow")};
-    outline: ${e("chip.remove.icon.focus.ring.width")} ${e("chip.remove.icon.focus.ring.style")} ${e("chip.remove.icon.focus.ring.color")};
-    outline-offset: ${e("chip.remove.icon.focus.ring.offset")};
-}
-`,Wu={root:"p-chip p-component",image:"p-chip-image",icon:"p-chip-icon",label:"p-chip-label",removeIcon:"p-chip-remove-icon"},Zu=N.extend({name:"chip",style:_u,classes:Wu}),qu={name:"BaseChip",extends:U,props:{label:{type:[String,Number],default:null},icon:{type:String,default:null},image:{type:String,default:null},removable:{type:Boolean,default:!1},removeIcon:{type:String,default:void 0}},style:Zu,provide:function(){return{$pcChip:this,$parentInstance:this}}},Li={name:"Chip",extends:qu,inheritAttrs:!1,emits:["remove"],data:function(){return{visible:!0}},methods:{onKeydown:function(t){(t.key==="Enter"||t.key==="Backspace")&&this.close(t)},close:function(t){this.visible=!1,this.$emit("remove",t)}},computed:{dataP:function(){return re({removable:this.removable})}},components:{TimesCircleIcon:Dn}},Yu=["aria-label","data-p"],Ju=["src"];function Xu(e,t,n,o,i,r){return i.visible?(c(),b("div",f({key:0,class:e.cx("root"),"aria-label":e.label},e.ptmi("root"),{"data-p":r.dataP}),[k(e.$slots,"default",{},function(){return[e.image?(c(),b("img",f({key:0,src:e.image},e.ptm("image"),{class:e.cx("image")}),null,16,Ju)):e.$slots.icon?(c(),y(M(e.$slots.icon),f({key:1,class:e.cx("icon")},e.ptm("icon")),null,16,["class"])):e.icon?(c(),b("span",f({key:2,class:[e.cx("icon"),e.icon]},e.ptm("icon")),null,16)):C("",!0),e.label?(c(),b("div",f({key:3,class:e.cx("label")},e.ptm("label")),Y(e.label),17)):C("",!0)]}),e.removable?k(e.$slots,"removeicon",{key:0,removeCallback:r.close,keydownCallback:r.onKeydown},function(){return[(c(),y(M(e.removeIcon?"span":"TimesCircleIcon"),f({class:[e.cx("removeIcon"),e.removeIcon],onClick:r.close,onKeydown:r.onKeydown},e.ptm("removeIcon")),null,16,["class","onClick","onKeydown"]))]}):C("",!0)],16,Yu)):C("",!0)}Li.render=Xu;var Qu={name:"BaseEditableHolder",extends:U,emits:["update:modelValue","value-change"],props:{modelValue:{type:null,default:void 0},defaultValue:{type:null,default:void 0},name:{type:String,default:void 0},invalid:{type:Boolean,default:void 0},disabled:{type:Boolean,default:!1},formControl:{type:Object,default:void 0}},inject:{$parentInstance:{default:void 0},$pcForm:{default:void 0},$pcFormField:{default:void 0}},data:function(){return{d_value:this.defaultValue||this.modelValue}},watch:{modelValue:function(t){this.d_value=t},defaultValue:function(t){this.d_value=t},$formName:{immediate:!0,handler:function(t){var n,o;this.formField=((n=this.$pcForm)===null||n===void 0||(o=n.register)===null||o===void 0?void 0:o.call(n,t,this.$formControl))||{}}},$formControl:{immediate:!0,handler:function(t){var n,o;this.formField=((n=this.$pcForm)===null||n===void 0||(o=n.register)===null||o===void 0?void 0:o.call(n,this.$formName,t))||{}}},$formDefaultValue:{immediate:!0,handler:function(t){this.d_value!==t&&(this.d_value=t)}},$formValue:{immediate:!1,handler:function(t){var n;(n=this.$pcForm)!==null&&n!==void 0&&n.getFieldState(this.$formName)&&t!==this.d_value&&(this.d_value=t)}}},formField:{},methods:{writeValue:function(t,n){var o,i;this.controlled&&(this.d_value=t,this.$emit("update:modelValue",t)),this.$emit("value-change",t),(o=(i=this.formField).onChange)===null||o===void 0||o.call(i,{originalEvent:n,value:t})},findNonEmpty:function(){for(var t=arguments.length,n=new Array(t),o=0;o<t;o++)n[o]=arguments[o];return n.find(A)}},computed:{$filled:function(){return A(this.d_value)},$invalid:function(){var t,n;return!this.$formNovalidate&&this.findNonEmpty(this.invalid,(t=this.$pcFormField)===null||t===void 0||(t=t.$field)===null||t===void 0?void 0:t.invalid,(n=this.$pcForm)===null||n===void 0||(n=n.getFieldState(this.$formName))===null||n===void 0?void 0:n.invalid)},$formName:function(){var t;return this.$formNovalidate?void 0:this.name||((t=this.$formControl)===null||t===void 0?void 0:t.name)},$formControl:function(){var t;return this.formControl||((t=this.$pcFormField)===null||t===void 0?void 0:t.formControl)},$formNovalidate:function(){var t;return(t=this.$formControl)===null||t===void 0?void 0:t.novalidate},$formDefaultValue:function(){var t,n;return this.findNonEmpty(this.d_value,(t=this.$pcFormField)===null||t===void 0?void 0:t.initialValue,(n=this.$pcForm)===null||n===void 0||(n=n.initialValues)===null||n===void 0?void 0:n[this.$formName])},$formValue:function(){var t,n;return this.findNonEmpty((t=this.$pcFormField)===null||t===void 0||(t=t.$field)===null||t===void 0?void 0:t.value,(n=this.$pcForm)===null||n===void 0||(n=n.getFieldState(this.$formName))===null||n===void 0?void 0:n.value)},controlled:function(){return this.$inProps.hasOwnProperty("modelValue")||!this.$inProps.hasOwnProperty("modelValue")&&!this.$inProps.hasOwnProperty("defaultValue")},filled:function(){return this.$filled}}},it={name:"BaseInput",extends:Qu,props:{size:{type:String,default:null},fluid:{type:Boolean,default:null},variant:{type:String,default:null}},inject:{$parentInstance:{default:void 0},$pcFluid:{default:void 0}},computed:{$variant:function(){var t;return(t=this.variant)!==null&&t!==void 0?t:this.$primevue.config.inputStyle||this.$primevue.config.inputVariant},$fluid:function(){var t;return(t=this.fluid)!==null&&t!==void 0?t:!!this.$pcFluid},hasFluid:function(){return this.$fluid}}},ed=({dt:e})=>`
-.p-inputtext {
-    font-family: inherit;
-    font-feature-settings: inherit;
-    font-size: 1rem;
-    color: ${e("inputtext.color")};
-    background: ${e("inputtext.background")};
-    padding-block: ${e("inputtext.padding.y")};
-    padding-inline: ${e("inputtext.padding.x")};
-    border: 1px solid ${e("inputtext.border.color")};
-    transition: background ${e("inputtext.transition.duration")}, color ${e("inputtext.transition.duration")}, border-color ${e("inputtext.transition.duration")}, outline-color ${e("inputtext.transition.duration")}, box-shadow ${e("inputtext.transition.duration")};
-    appearance: none;
-    border-radius: ${e("inputtext.border.radius")};
-    outline-color: transparent;
-    box-shadow: ${e("inputtext.shadow")};
-}
-
-.p-inputtext:enabled:hover {
-    border-color: ${e("inputtext.hover.border.color")};
-}
-
-.p-inputtext:enabled:focus {
-    border-color: ${e("inputtext.focus.border.color")};
-    box-shadow: ${e("inputtext.focus.ring.shadow")};
-    outline: ${e("inputtext.focus.ring.width")} ${e("inputtext.focus.ring.style")} ${e("inputtext.focus.ring.color")};
-    outline-offset: ${e("inputtext.focus.ring.offset")};
-}
-
-.p-inputtext.p-invalid {
-    border-color: ${e("inputtext.invalid.border.color")};
-}
-
-.p-inputtext.p-variant-filled {
-    background: ${e("inputtext.filled.background")};
-}
-
-.p-inputtext.p-variant-filled:enabled:hover {
-    background: ${e("inputtext.filled.hover.background")};
-}
-
-.p-inputtext.p-variant-filled:enabled:focus {
-    background: ${e("inputtext.filled.focus.background")};
-}
-
-.p-inputtext:disabled {
-    opacity: 1;
-    background: ${e("inputtext.disabled.background")};
-    color: ${e("inputtext.disabled.color")};
-}
-
-.p-inputtext::placeholder {
-    color: ${e("inputtext.placeholder.color")};
-}
-
-.p-inputtext.p-invalid::placeholder {
-    color: ${e("inputtext.invalid.placeholder.color")};
-}
-
-.p-inputtext-sm {
-    font-size: ${e("inputtext.sm.font.size")};
-    padding-block: ${e("inputtext.sm.padding.y")};
-    padding-inline: ${e("inputtext.sm.padding.x")};
-}
-
-.p-inputtext-lg {
-    font-size: ${e("inputtext.lg.font.size")};
-    padding-block: ${e("inputtext.lg.padding.y")};
-    padding-inline: ${e("inputtext.lg.padding.x")};
-}
-
-.p-inputtext-fluid {
-    width: 100%;
-}
-`,td={root:function(t){var n=t.instance,o=t.props;return["p-inputtext p-component",{"p-filled":n.$filled,"p-inputtext-sm p-inputfield-sm":o.size==="small","p-inputtext-lg p-inputfield-lg":o.size==="large","p-invalid":n.$invalid,"p-variant-filled":n.$variant==="filled","p-inputtext-fluid":n.$fluid}]}},nd=N.extend({name:"inputtext",style:ed,classes:td}),od={name:"BaseInputText",extends:it,style:nd,provide:function(){return{$pcInputText:this,$parentInstance:this}}};function Ht(e){"@babel/helpers - typeof";return Ht=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ht(e)}function rd(e,t,n){return(t=id(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function id(e){var t=ad(e,"string");return Ht(t)=="symbol"?t:t+""}function ad(e,t){if(Ht(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Ht(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Hn={name:"InputText",extends:od,inheritAttrs:!1,methods:{onInput:function(t){this.writeValue(t.target.value,t)}},computed:{attrs:function(){return f(this.ptmi("root",{context:{filled:this.$filled,disabled:this.disabled}}),this.formField)},dataP:function(){return re(rd({invalid:this.$invalid,fluid:this.$fluid,filled:this.$variant==="filled"},this.size,this.size))}}},ld=["value","name","disabled","aria-invalid","data-p"];function sd(e,t,n,o,i,r){return c(),b("input",f({type:"text",class:e.cx("root"),value:e.d_value,name:e.name,disabled:e.disabled,"aria-invalid":e.$invalid||void 0,"data-p":r.dataP,onInput:t[0]||(t[0]=function(){return r.onInput&&r.onInput.apply(r,arguments)})},r.attrs),null,16,ld)}Hn.render=sd;var Ge=bn(),ud=({dt:e})=>`
-.p-virtualscroller-loader {
-    background: ${e("virtualscroller.loader.mask.background")};
-    color: ${e("virtualscroller.loader.mask.color")};
-}
-
-.p-virtualscroller-loading-icon {
-    font-size: ${e("virtualscroller.loader.icon.size")};
-    width: ${e("virtualscroller.loader.icon.size")};
-    height: ${e("virtualscroller.loader.icon.size")};
-}
-`,dd=`
-.p-virtualscroller {
-    position: relative;
-    overflow: auto;
-    contain: strict;
-    transform: translateZ(0);
-    will-change: scroll-position;
-    outline: 0 none;
-}
-
-.p-virtualscroller-content {
-    position: absolute;
-    top: 0;
-    left: 0;
-    min-height: 100%;
-    min-width: 100%;
-    will-change: transform;
-}
-
-.p-virtualscroller-spacer {
-    position: absolute;
-    top: 0;
-    left: 0;
-    height: 1px;
-    width: 1px;
-    transform-origin: 0 0;
-    pointer-events: none;
-}
-
-.p-virtualscroller-loader {
-    position: sticky;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-}
-
-.p-virtualscroller-loader-mask {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-}
-
-.p-virtualscroller-horizontal > .p-virtualscroller-content {
-    display: flex;
-}
-
-.p-virtualscroller-inline .p-virtualscroller-content {
-    position: static;
-}
-
-.p-virtualscroller .p-virtualscroller-loading {
-    transform: none !important;
-    min-height: 0;
-    position: sticky;
-    inset-block-start: 0;
-    inset-inline-start: 0;
-}
-`,hr=N.extend({name:"virtualscroller",css:dd,style:ud}),cd={name:"BaseVirtualScroller",extends:U,props:{id:{type:String,default:null},style:null,class:null,items:{type:Array,default:null},itemSize:{type:[Number,Array],default:0},scrollHeight:null,scrollWidth:null,orientation:{type:String,default:"vertical"},numToleratedItems:{type:Number,default:null},delay:{type:Number,default:0},resizeDelay:{type:Number,default:10},lazy:{type:Boolean,default:!1},disabled:{type:Boolean,default:!1},loaderDisabled:{type:Boolean,default:!1},columns:{type:Array,default:null},loading:{type:Boolean,default:!1},showSpacer:{type:Boolean,default:!0},showLoader:{type:Boolean,default:!1},tabindex:{type:Number,default:0},inline:{type:Boolean,default:!1},step:{type:Number,default:0},appendOnly:{type:Boolean,default:!1},autoSize:{type:Boolean,default:!1}},style:hr,provide:function(){return{$pcVirtualScroller:this,$parentInstance:this}},beforeMount:function(){var t;hr.loadCSS({nonce:(t=this.$primevueConfig)===null||t===void 0||(t=t.csp)===null||t===void 0?void 0:t.nonce})}};function Gt(e){"@babel/helpers - typeof";return Gt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Gt(e)}function mr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function vt(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?mr(Object(n),!0).forEach(function(o){Ti(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):mr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Ti(e,t,n){return(t=pd(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pd(e){var t=fd(e,"string");return Gt(t)=="symbol"?t:t+""}function fd(e,t){if(Gt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Gt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Gn={name:"VirtualScroller",extends:cd,inheritAttrs:!1,emits:["update:numToleratedItems","scroll","scroll-index-change","lazy-load"],data:function(){var t=this.isBoth();return{first:t?{rows:0,cols:0}:0,last:t?{rows:0,cols:0}:0,page:t?{rows:0,cols:0}:0,numItemsInViewport:t?{rows:0,cols:0}:0,lastScrollPos:t?{top:0,left:0}:0,d_numToleratedItems:this.numToleratedItems,d_loading:this.loading,loaderArr:[],spacerStyle:{},contentStyle:{}}},element:null,content:null,lastScrollPos:null,scrollTimeout:null,resizeTimeout:null,defaultWidth:0,defaultHeight:0,defaultContentWidth:0,defaultContentHeight:0,isRangeChanged:!1,lazyLoadState:{},resizeListener:null,resizeObserver:null,initialized:!1,watch:{numToleratedItems:function(t){this.d_numToleratedItems=t},loading:function(t,n){this.lazy&&t!==n&&t!==this.d_loading&&(this.d_loading=t)},items:{handler:function(t,n){(!n||n.length!==(t||[]).length)&&(this.init(),this.calculateAutoSize())},deep:!0},itemSize:function(){this.init(),this.calculateAutoSize()},orientation:function(){this.lastScrollPos=this.isBoth()?{top:0,left:0}:0},scrollHeight:function(){this.init(),this.calculateAutoSize()},scrollWidth:function(){this.init(),this.calculateAutoSize()}},mounted:function(){this.viewInit(),this.lastScrollPos=this.isBoth()?{top:0,left:0}:0,this.lazyLoadState=this.lazyLoadState||{}},updated:function(){!this.initialized&&this.viewInit()},unmounted:function(){this.unbindResizeListener(),this.initialized=!1},methods:{viewInit:function(){Mn(this.element)&&(this.setContentEl(this.content),this.init(),this.calculateAutoSize(),this.bindResizeListener(),this.defaultWidth=nt(this.element),this.defaultHeight=tt(this.element),this.defaultContentWidth=nt(this.content),this.defaultContentHeight=tt(this.content),this.initialized=!0)},init:function(){this.disabled||(this.setSize(),this.calculateOptions(),this.setSpacerSize())},isVertical:function(){return this.orientation==="vertical"},isHorizontal:function(){return this.orientation==="horizontal"},isBoth:function(){return this.orientation==="both"},scrollTo:function(t){this.element&&this.element.scrollTo(t)},scrollToIndex:function(t){var n=this,o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"auto",i=this.isBoth(),r=this.isHorizontal(),a=i?t.every(function(V){return V>-1}):t>-1;if(a){var l=this.first,s=this.element,u=s.scrollTop,d=u===void 0?0:u,p=s.scrollLeft,h=p===void 0?0:p,m=this.calculateNumItems(),w=m.numToleratedItems,$=this.getContentPosition(),v=this.itemSize,I=function(){var W=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,ie=arguments.length>1?arguments[1]:void 0;return W<=ie?0:W},P=function(W,ie,de){return W*ie+de},L=function(){var W=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,ie=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0;return n.scrollTo({left:W,top:ie,behavior:o})},g=i?{rows:0,cols:0}:0,F=!1,G=!1;i?(g={rows:I(t[0],w[0]),cols:I(t[1],w[1])},L(P(g.cols,v[1],$.left),P(g.rows,v[0],$.top)),G=this.lastScrollPos.top!==d||this.lastScrollPos.left!==h,F=g.rows!==l.rows||g.cols!==l.cols):(g=I(t,w),r?L(P(g,v,$.left),d):L(h,P(g,v,$.top)),G=this.lastScrollPos!==(r?h:d),F=g!==l),this.isRangeChanged=F,G&&(this.first=g)}},scrollInView:function(t,n){var o=this,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:"auto";if(n){var r=this.isBoth(),a=this.isHorizontal(),l=r?t.every(function(v){return v>-1}):t>-1;if(l){var s=this.getRenderedRange(),u=s.first,d=s.viewport,p=function(){var I=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,P=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0;return o.scrollTo({left:I,top:P,behavior:i})},h=n==="to-start",m=n==="to-end";if(h){if(r)d.first.rows-u.rows>t[0]?p(d.first.cols*this.itemSize[1],(d.first.rows-1)*this.itemSize[0]):d.first.cols-u.cols>t[1]&&p((d.first.cols-1)*this.itemSize[1],d.first.rows*this.itemSize[0]);else if(d.first-u>t){var w=(d.first-1)*this.itemSize;a?p(w,0):p(0,w)}}else if(m){if(r)d.last.rows-u.rows<=t[0]+1?p(d.first.cols*this.itemSize[1],(d.first.rows+1)*this.itemSize[0]):d.last.cols-u.cols<=t[1]+1&&p((d.first.cols+1)*this.itemSize[1],d.first.rows*this.itemSize[0]);else if(d.last-u<=t+1){var $=(d.first+1)*this.itemSize;a?p($,0):p(0,$)}}}}else this.scrollToIndex(t,i)},getRenderedRange:function(){var t=function(p,h){return Math.floor(p/(h||p))},n=this.first,o=0;if(this.element){var i=this.isBoth(),r=this.isHorizontal(),a=this.element,l=a.scrollTop,s=a.scrollLeft;if(i)n={rows:t(l,this.itemSize[0]),cols:t(s,this.itemSize[1])},o={rows:n.rows+this.numItemsInViewport.rows,cols:n.cols+this.numItemsInViewport.cols};else{var u=r?s:l;n=t(u,this.itemSize),o=n+this.numItemsInViewport}}return{first:this.first,last:this.last,viewport:{first:n,last:o}}},calculateNumItems:function(){var t=this.isBoth(),n=this.isHorizontal(),o=this.itemSize,i=this.getContentPosition(),r=this.element?this.element.offsetWidth-i.left:0,a=this.element?this.element.offsetHeight-i.top:0,l=function(h,m){return Math.ceil(h/(m||h))},s=function(h){return Math.ceil(h/2)},u=t?{rows:l(a,o[0]),cols:l(r,o[1])}:l(n?r:a,o),d=this.d_numToleratedItems||(t?[s(u.rows),s(u.cols)]:s(u));return{numItemsInViewport:u,numToleratedItems:d}},calculateOptions:function(){var t=this,n=this.isBoth(),o=this.first,i=this.calculateNumItems(),r=i.numItemsInViewport,a=i.numToleratedItems,l=function(d,p,h){var m=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!1;return t.getLast(d+p+(d<h?2:3)*h,m)},s=n?{rows:l(o.rows,r.rows,a[0]),cols:l(o.cols,r.cols,a[1],!0)}:l(o,r,a);this.last=s,this.numItemsInViewport=r,this.d_numToleratedItems=a,this.$emit("update:numToleratedItems",this.d_numToleratedItems),this.showLoader&&(this.loaderArr=n?Array.from({length:r.rows}).map(function(){return Array.from({length:r.cols})}):Array.from({length:r})),this.lazy&&Promise.resolve().then(function(){var u;t.lazyLoadState={first:t.step?n?{rows:0,cols:o.cols}:0:o,last:Math.min(t.step?t.step:s,((u=t.items)===null||u===void 0?void 0:u.length)||0)},t.$emit("lazy-load",t.lazyLoadState)})},calculateAutoSize:function(){var t=this;this.autoSize&&!this.d_loading&&Promise.resolve().then(function(){if(t.content){var n=t.isBoth(),o=t.isHorizontal(),i=t.isVertical();t.content.style.minHeight=t.content.style.minWidth="auto",t.content.style.position="relative",t.element.style.contain="none";var r=[nt(t.element),tt(t.element)],a=r[0],l=r[1];(n||o)&&(t.element.style.width=a<t.defaultWidth?a+"px":t.scrollWidth||t.defaultWidth+"px"),(n||i)&&(t.element.style.height=l<t.defaultHeight?l+"px":t.scrollHeight||t.defaultHeight+"px"),t.content.style.minHeight=t.content.style.minWidth="",t.content.style.position="",t.element.style.contain=""}})},getLast:function(){var t,n,o=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,i=arguments.length>1?arguments[1]:void 0;return this.items?Math.min(i?((t=this.columns||this.items[0])===null||t===void 0?void 0:t.length)||0:((n=this.items)===null||n===void 0?void 0:n.length)||0,o):0},getContentPosition:function(){if(this.content){var t=getComputedStyle(this.content),n=parseFloat(t.paddingLeft)+Math.max(parseFloat(t.left)||0,0),o=parseFloat(t.paddingRight)+Math.max(parseFloat(t.right)||0,0),i=parseFloat(t.paddingTop)+Math.max(parseFloat(t.top)||0,0),r=parseFloat(t.paddingBottom)+Math.max(parseFloat(t.bottom)||0,0);return{left:n,right:o,top:i,bottom:r,x:n+o,y:i+r}}return{left:0,right:0,top:0,bottom:0,x:0,y:0}},setSize:function(){var t=this;if(this.element){var n=this.isBoth(),o=this.isHorizontal(),i=this.element.parentElement,r=this.scrollWidth||"".concat(this.element.offsetWidth||i.offsetWidth,"px"),a=this.scrollHeight||"".concat(this.element.offsetHeight||i.offsetHeight,"px"),l=function(u,d){return t.element.style[u]=d};n||o?(l("height",a),l("width",r)):l("height",a)}},setSpacerSize:function(){var t=this,n=this.items;if(n){var o=this.isBoth(),i=this.isHorizontal(),r=this.getContentPosition(),a=function(s,u,d){var p=arguments.length>3&&arguments[3]!==void 0?arguments[3]:0;return t.spacerStyle=vt(vt({},t.spacerStyle),Ti({},"".concat(s),(u||[]).length*d+p+"px"))};o?(a("height",n,this.itemSize[0],r.y),a("width",this.columns||n[1],this.itemSize[1],r.x)):i?a("width",this.columns||n,this.itemSize,r.x):a("height",n,this.itemSize,r.y)}},setContentPosition:function(t){var n=this;if(this.content&&!this.appendOnly){var o=this.isBoth(),i=this.isHorizontal(),r=t?t.first:this.first,a=function(d,p){return d*p},l=function(){var d=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,p=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0;return n.contentStyle=vt(vt({},n.contentStyle),{transform:"translate3d(".concat(d,"px, ").concat(p,"px, 0)")})};if(o)l(a(r.cols,this.itemSize[1]),a(r.rows,this.itemSize[0]));else{var s=a(r,this.itemSize);i?l(s,0):l(0,s)}}},onScrollPositionChange:function(t){var n=this,o=t.target,i=this.isBoth(),r=this.isHorizontal(),a=this.getContentPosition(),l=function(X,le){return X?X>le?X-le:X:0},s=function(X,le){return Math.floor(X/(le||X))},u=function(X,le,be,ge,ae,x){return X<=ae?ae:x?be-ge-ae:le+ae-1},d=function(X,le,be,ge,ae,x,S,O){if(X<=x)return 0;var D=Math.max(0,S?X<le?be:X-x:X>le?be:X-2*x),z=n.getLast(D,O);return D>z?z-ae:D},p=function(X,le,be,ge,ae,x){var S=le+ge+2*ae;return X>=ae&&(S+=ae+1),n.getLast(S,x)},h=l(o.scrollTop,a.top),m=l(o.scrollLeft,a.left),w=i?{rows:0,cols:0}:0,$=this.last,v=!1,I=this.lastScrollPos;if(i){var P=this.lastScrollPos.top<=h,L=this.lastScrollPos.left<=m;if(!this.appendOnly||this.appendOnly&&(P||L)){var g={rows:s(h,this.itemSize[0]),cols:s(m,this.itemSize[1])},F={rows:u(g.rows,this.first.rows,this.last.rows,this.numItemsInViewport.rows,this.d_numToleratedItems[0],P),cols:u(g.cols,this.first.cols,this.last.cols,this.numItemsInViewport.cols,this.d_numToleratedItems[1],L)};w={rows:d(g.rows,F.rows,this.first.rows,this.last.rows,this.numItemsInViewport.rows,this.d_numToleratedItems[0],P),cols:d(g.cols,F.cols,this.first.cols,this.last.cols,this.numItemsInViewport.cols,this.d_numToleratedItems[1],L,!0)},$={rows:p(g.rows,w.rows,this.last.rows,this.numItemsInViewport.rows,this.d_numToleratedItems[0]),cols:p(g.cols,w.cols,this.last.cols,this.numItemsInViewport.cols,this.d_numToleratedItems[1],!0)},v=w.rows!==this.first.rows||$.rows!==this.last.rows||w.cols!==this.first.cols||$.cols!==this.last.cols||this.isRangeChanged,I={top:h,left:m}}}else{var G=r?m:h,V=this.lastScrollPos<=G;if(!this.appendOnly||this.appendOnly&&V){var W=s(G,this.itemSize),ie=u(W,this.first,this.last,this.numItemsInViewport,this.d_numToleratedItems,V);w=d(W,ie,this.first,this.last,this.numItemsInViewport,this.d_numToleratedItems,V),$=p(W,w,this.last,this.numItemsInViewport,this.d_numToleratedItems),v=w!==this.first||$!==this.last||this.isRangeChanged,I=G}}return{first:w,last:$,isRangeChanged:v,scrollPos:I}},onScrollChange:function(t){var n=this.onScrollPositionChange(t),o=n.first,i=n.last,r=n.isRangeChanged,a=n.scrollPos;if(r){var l={first:o,last:i};if(this.setContentPosition(l),this.first=o,this.last=i,this.lastScrollPos=a,this.$emit("scroll-index-change",l),this.lazy&&this.isPageChanged(o)){var s,u,d={first:this.step?Math.min(this.getPageByFirst(o)*this.step,(((s=this.items)===null||s===void 0?void 0:s.length)||0)-this.step):o,last:Math.min(this.step?(this.getPageByFirst(o)+1)*this.step:i,((u=this.items)===null||u===void 0?void 0:u.length)||0)},p=this.lazyLoadState.first!==d.first||this.lazyLoadState.last!==d.last;p&&this.$emit("lazy-load",d),this.lazyLoadState=d}}},onScroll:function(t){var n=this;if(this.$emit("scroll",t),this.delay){if(this.scrollTimeout&&clearTimeout(this.scrollTimeout),this.isPageChanged()){if(!this.d_loading&&this.showLoader){var o=this.onScrollPositionChange(t),i=o.isRangeChanged,r=i||(this.step?this.isPageChanged():!1);r&&(this.d_loading=!0)}this.scrollTimeout=setTimeout(function(){n.onScrollChange(t),n.d_loading&&n.showLoader&&(!n.lazy||n.loading===void 0)&&(n.d_loading=!1,n.page=n.getPageByFirst())},this.delay)}}else this.onScrollChange(t)},onResize:function(){var t=this;this.resizeTimeout&&clearTimeout(this.resizeTimeout),this.resizeTimeout=setTimeout(function(){if(Mn(t.element)){var n=t.isBoth(),o=t.isVertical(),i=t.isHorizontal(),r=[nt(t.element),tt(t.element)],a=r[0],l=r[1],s=a!==t.defaultWidth,u=l!==t.defaultHeight,d=n?s||u:i?s:o?u:!1;d&&(t.d_numToleratedItems=t.numToleratedItems,t.defaultWidth=a,t.defaultHeight=l,t.defaultContentWidth=nt(t.content),t.defaultContentHeight=tt(t.content),t.init())}},this.resizeDelay)},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=this.onResize.bind(this),window.addEventListener("resize",this.resizeListener),window.addEventListener("orientationchange",this.resizeListener),this.resizeObserver=new ResizeObserver(function(){t.onResize()}),this.resizeObserver.observe(this.element))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),window.removeEventListener("orientationchange",this.resizeListener),this.resizeListener=null),this.resizeObserver&&(this.resizeObserver.disconnect(),this.resizeObserver=null)},getOptions:function(t){var n=(this.items||[]).length,o=this.isBoth()?this.first.rows+t:this.first+t;return{index:o,count:n,first:o===0,last:o===n-1,even:o%2===0,odd:o%2!==0}},getLoaderOptions:function(t,n){var o=this.loaderArr.length;return vt({index:t,count:o,first:t===0,last:t===o-1,even:t%2===0,odd:t%2!==0},n)},getPageByFirst:function(t){return Math.floor(((t!=null?t:this.first)+this.d_numToleratedItems*4)/(this.step||1))},isPageChanged:function(t){return this.step&&!this.lazy?this.page!==this.getPageByFirst(t!=null?t:this.first):!0},setContentEl:function(t){this.content=t||this.content||xe(this.element,'[data-pc-section="content"]')},elementRef:function(t){this.element=t},contentRef:function(t){this.content=t}},computed:{containerClass:function(){return["p-virtualscroller",this.class,{"p-virtualscroller-inline":this.inline,"p-virtualscroller-both p-both-scroll":this.isBoth(),"p-virtualscroller-horizontal p-horizontal-scroll":this.isHorizontal()}]},contentClass:function(){return["p-virtualscroller-content",{"p-virtualscroller-loading":this.d_loading}]},loaderClass:function(){return["p-virtualscroller-loader",{"p-virtualscroller-loader-mask":!this.$slots.loader}]},loadedItems:function(){var t=this;return this.items&&!this.d_loading?this.isBoth()?this.items.slice(this.appendOnly?0:this.first.rows,this.last.rows).map(function(n){return t.columns?n:n.slice(t.appendOnly?0:t.first.cols,t.last.cols)}):this.isHorizontal()&&this.columns?this.items:this.items.slice(this.appendOnly?0:this.first,this.last):[]},loadedRows:function(){return this.d_loading?this.loaderDisabled?this.loaderArr:[]:this.loadedItems},loadedColumns:function(){if(this.columns){var t=this.isBoth(),n=this.isHorizontal();if(t||n)return this.d_loading&&this.loaderDisabled?t?this.loaderArr[0]:this.loaderArr:this.columns.slice(t?this.first.cols:this.first,t?this.last.cols:this.last)}return this.columns}},components:{SpinnerIcon:bt}},hd=["tabindex"];function md(e,t,n,o,i,r){var a=T("SpinnerIcon");return e.disabled?(c(),b(K,{key:1},[k(e.$slots,"default"),k(e.$slots,"content",{items:e.items,rows:e.items,columns:r.loadedColumns})],64)):(c(),b("div",f({key:0,ref:r.elementRef,class:r.containerClass,tabindex:e.tabindex,style:e.style,onScroll:t[0]||(t[0]=function(){return r.onScroll&&r.onScroll.apply(r,arguments)})},e.ptmi("root")),[k(e.$slots,"content",{styleClass:r.contentClass,items:r.loadedItems,getItemOptions:r.getOptions,loading:i.d_loading,getLoaderOptions:r.getLoaderOptions,itemSize:e.itemSize,rows:r.loadedRows,columns:r.loadedColumns,contentRef:r.contentRef,spacerStyle:i.spacerStyle,contentStyle:i.contentStyle,vertical:r.isVertical(),horizontal:r.isHorizontal(),both:r.isBoth()},function(){return[R("div",f({ref:r.contentRef,class:r.contentClass,style:i.contentStyle},e.ptm("content")),[(c(!0),b(K,null,ue(r.loadedItems,function(l,s){return k(e.$slots,"item",{key:s,item:l,options:r.getOptions(s)})}),128))],16)]}),e.showSpacer?(c(),b("div",f({key:0,class:"p-virtualscroller-spacer",style:i.spacerStyle},e.ptm("spacer")),null,16)):C("",!0),!e.loaderDisabled&&e.showLoader&&i.d_loading?(c(),b("div",f({key:1,class:r.loaderClass},e.ptm("loader")),[e.$slots&&e.$slots.loader?(c(!0),b(K,{key:0},ue(i.loaderArr,function(l,s){return k(e.$slots,"loader",{key:s,options:r.getLoaderOptions(s,r.isBoth()&&{numCols:e.d_numItemsInViewport.cols})})}),128)):C("",!0),k(e.$slots,"loadingicon",{},function(){return[ne(a,f({spin:"",class:"p-virtualscroller-loading-icon"},e.ptm("loadingIcon")),null,16)]})],16)):C("",!0)],16,hd))}Gn.render=md;var bd=({dt:e})=>`
-.p-autocomplete {
-    display: inline-flex;
-}
-
-.p-autocomplete-loader {
-    position: absolute;
-    top: 50%;
-    margin-top: -0.5rem;
-    inset-inline-end: ${e("autocomplete.padding.x")};
-}
-
-.p-autocomplete:has(.p-autocomplete-dropdown) .p-autocomplete-loader {
-    inset-inline-end: calc(${e("autocomplete.dropdown.width")} + ${e("autocomplete.padding.x")});
-}
-
-.p-autocomplete:has(.p-autocomplete-dropdown) .p-autocomplete-input {
-    flex: 1 1 auto;
-    width: 1%;
-}
-
-.p-autocomplete:has(.p-autocomplete-dropdown) .p-autocomplete-input,
-.p-autocomplete:has(.p-autocomplete-dropdown) .p-autocomplete-input-multiple {
-    border-start-end-radius: 0;
-    border-end-end-radius: 0;
-}
-
-.p-autocomplete-dropdown {
-    cursor: pointer;
-    display: inline-flex;
-    user-select: none;
-    align-items: center;
-    justify-content: center;
-    overflow: hidden;
-    position: relative;
-    width: ${e("autocomplete.dropdown.width")};
-    border-start-end-radius: ${e("autocomplete.dropdown.border.radius")};
-    border-end-end-radius: ${e("autocomplete.dropdown.border.radius")};
-    background: ${e("autocomplete.dropdown.background")};
-    border: 1px solid ${e("autocomplete.dropdown.border.color")};
-    border-inline-start: 0 none;
-    color: ${e("autocomplete.dropdown.color")};
-    transition: background ${e("autocomplete.transition.duration")}, color ${e("autocomplete.transition.duration")}, border-color ${e("autocomplete.transition.duration")}, outline-color ${e("autocomplete.transition.duration")}, box-shadow ${e("autocomplete.transition.duration")};
-    outline-color: transparent;
-}
-
-.p-autocomplete-dropdown:not(:disabled):hover {
-    background: ${e("autocomplete.dropdown.hover.background")};
-    border-color: ${e("autocomplete.dropdown.hover.border.color")};
-    color: ${e("autocomplete.dropdown.hover.color")};
-}
-
-.p-autocomplete-dropdown:not(:disabled):active {
-    background: ${e("autocomplete.dropdown.active.background")};
-    border-color: ${e("autocomplete.dropdown.active.border.color")};
-    color: ${e("autocomplete.dropdown.active.color")};
-}
-
-.p-autocomplete-dropdown:focus-visible {
-    box-shadow: ${e("autocomplete.dropdown.focus.ring.shadow")};
-    outline: ${e("autocomplete.dropdown.focus.ring.width")} ${e("autocomplete.dropdown.focus.ring.style")} ${e("autocomplete.dropdown.focus.ring.color")};
-    outline-offset: ${e("autocomplete.dropdown.focus.ring.offset")};
-}
-
-.p-autocomplete .p-autocomplete-overlay {
-    min-width: 100%;
-}
-
-.p-autocomplete-overlay {
-    position: absolute;
-    top: 0;
-    left: 0;
-    background: ${e("autocomplete.overlay.background")};
-    color: ${e("autocomplete.overlay.color")};
-    border: 1px solid ${e("autocomplete.overlay.border.color")};
-    border-radius: ${e("autocomplete.overlay.border.radius")};
-    box-shadow: ${e("autocomplete.overlay.shadow")};
-}
-
-.p-autocomplete-list-container {
-    overflow: auto;
-}
-
-.p-autocomplete-list {
-    margin: 0;
-    list-style-type: none;
-    display: flex;
-    flex-direction: column;
-    gap: ${e("autocomplete.list.gap")};
-    padding: ${e("autocomplete.list.padding")};
-}
-
-.p-autocomplete-option {
-    cursor: pointer;
-    white-space: nowrap;
-    position: relative;
-    overflow: hidden;
-    display: flex;
-    align-items: center;
-    padding: ${e("autocomplete.option.padding")};
-    border: 0 none;
-    color: ${e("autocomplete.option.color")};
-    background: transparent;
-    transition: background ${e("autocomplete.transition.duration")}, color ${e("autocomplete.transition.duration")}, border-color ${e("autocomplete.transition.duration")};
-    border-radius: ${e("autocomplete.option.border.radius")};
-}
-
-.p-autocomplete-option:not(.p-autocomplete-option-selected):not(.p-disabled).p-focus {
-    background: ${e("autocomplete.option.focus.background")};
-    color: ${e("autocomplete.option.focus.color")};
-}
-
-.p-autocomplete-option-selected {
-    background: ${e("autocomplete.option.selected.background")};
-    color: ${e("autocomplete.option.selected.color")};
-}
-
-.p-autocomplete-option-selected.p-focus {
-    background: ${e("autocomplete.option.selected.focus.background")};
-    color: ${e("autocomplete.option.selected.focus.color")};
-}
-
-.p-autocomplete-option-group {
-    margin: 0;
-    padding: ${e("autocomplete.option.group.padding")};
-    color: ${e("autocomplete.option.group.color")};
-    background: ${e("autocomplete.option.group.background")};
-    font-weight: ${e("autocomplete.option.group.font.weight")};
-}
-
-.p-autocomplete-input-multiple {
-    margin: 0;
-    list-style-type: none;
-    cursor: text;
-    overflow: hidden;
-    display: flex;
-    align-items: center;
-    flex-wrap: wrap;
-    padding: calc(${e("autocomplete.padding.y")} / 2) ${e("autocomplete.padding.x")};
-    gap: calc(${e("autocomplete.padding.y")} / 2);
-    color: ${e("autocomplete.color")};
-    background: ${e("autocomplete.background")};
-    border: 1px solid ${e("autocomplete.border.color")};
-    border-radius: ${e("autocomplete.border.radius")};
-    width: 100%;
-    transition: background ${e("autocomplete.transition.duration")}, color ${e("autocomplete.transition.duration")}, border-color ${e("autocomplete.transition.duration")}, outline-color ${e("autocomplete.transition.duration")}, box-shadow ${e("autocomplete.transition.duration")};
-    outline-color: transparent;
-    box-shadow: ${e("autocomplete.shadow")};
-}
-
-.p-autocomplete:not(.p-disabled):hover .p-autocomplete-input-multiple {
-    border-color: ${e("autocomplete.hover.border.color")};
-}
-
-.p-autocomplete:not(.p-disabled).p-focus .p-autocomplete-input-multiple {
-    border-color: ${e("autocomplete.focus.border.color")};
-    box-shadow: ${e("autocomplete.focus.ring.shadow")};
-    outline: ${e("autocomplete.focus.ring.width")} ${e("autocomplete.focus.ring.style")} ${e("autocomplete.focus.ring.color")};
-    outline-offset: ${e("autocomplete.focus.ring.offset")};
-}
-
-.p-autocomplete.p-invalid .p-autocomplete-input-multiple {
-    border-color: ${e("autocomplete.invalid.border.color")};
-}
-
-.p-variant-filled.p-autocomplete-input-multiple {
-    background: ${e("autocomplete.filled.background")};
-}
-
-.p-autocomplete:not(.p-disabled):hover .p-variant-filled.p-autocomplete-input-multiple {
-    background: ${e("autocomplete.filled.hover.background")};
-}
-
-.p-autocomplete:not(.p-disabled).p-focus .p-variant-filled.p-autocomplete-input-multiple  {
-    background: ${e("autocomplete.filled.focus.background")};
-}
-
-.p-autocomplete.p-disabled .p-autocomplete-input-multiple {
-    opacity: 1;
-    background: ${e("autocomplete.disabled.background")};
-    color: ${e("autocomplete.disabled.color")};
-}
-
-.p-autocomplete-chip.p-chip {
-    padding-block-start: calc(${e("autocomplete.padding.y")} / 2);
-    padding-block-end: calc(${e("autocomplete.padding.y")} / 2);
-    border-radius: ${e("autocomplete.chip.border.radius")};
-}
-
-.p-autocomplete-input-multiple:has(.p-autocomplete-chip) {
-    padding-inline-start: calc(${e("autocomplete.padding.y")} / 2);
-    padding-inline-end: calc(${e("autocomplete.padding.y")} / 2);
-}
-
-.p-autocomplete-chip-item.p-focus .p-autocomplete-chip {
-    background: ${e("autocomplete.chip.focus.background")};
-    color: ${e("autocomplete.chip.focus.color")};
-}
-
-.p-autocomplete-input-chip {
-    flex: 1 1 auto;
-    display: inline-flex;
-    padding-block-start: calc(${e("autocomplete.padding.y")} / 2);
-    padding-block-end: calc(${e("autocomplete.padding.y")} / 2);
-}
-
-.p-autocomplete-input-chip input {
-    border: 0 none;
-    outline: 0 none;
-    background: transparent;
-    margin: 0;
-    padding: 0;
-    box-shadow: none;
-    border-radius: 0;
-    width: 100%;
-    font-family: inherit;
-    font-feature-settings: inherit;
-    font-size: 1rem;
-    color: inherit;
-}
-
-.p-autocomplete-input-chip input::placeholder {
-    color: ${e("autocomplete.placeholder.color")};
-}
-
-.p-autocomplete.p-invalid .p-autocomplete-input-chip input::placeholder {
-    color: ${e("autocomplete.invalid.placeholder.color")};
-}
-
-.p-autocomplete-empty-message {
-    padding: ${e("autocomplete.empty.message.padding")};
-}
-
-.p-autocomplete-fluid {
-    display: flex;
-}
-
-.p-autocomplete-fluid:has(.p-autocomplete-dropdown) .p-autocomplete-input {
-    width: 1%;
-}
-
-.p-autocomplete:has(.p-inputtext-sm) .p-autocomplete-dropdown {
-    width: ${e("autocomplete.dropdown.sm.width")};
-}
-
-.p-autocomplete:has(.p-inputtext-sm) .p-autocomplete-dropdown .p-icon {
-    font-size: ${e("form.field.sm.font.size")};
-    width: ${e("form.field.sm.font.size")};
-    height: ${e("form.field.sm.font.size")};
-}
-
-.p-autocomplete:has(.p-inputtext-lg) .p-autocomplete-dropdown {
-    width: ${e("autocomplete.dropdown.lg.width")};
-}
-
-.p-autocomplete:has(.p-inputtext-lg) .p-autocomplete-dropdown .p-icon {
-    font-size: ${e("form.field.lg.font.size")};
-    width: ${e("form.field.lg.font.size")};
-    height: ${e("form.field.lg.font.size")};
-}
-`,gd={root:{position:"relative"}},yd={root:function(t){var n=t.instance,o=t.props;return["p-autocomplete p-component p-inputwrapper",{"p-disabled":o.disabled,"p-invalid":n.$invalid,"p-focus":n.focused,"p-inputwrapper-filled":n.$filled||A(n.inputValue),"p-inputwrapper-focus":n.focused,"p-autocomplete-open":n.overlayVisible,"p-autocomplete-fluid":n.$fluid}]},pcInputText:"p-autocomplete-input",inputMultiple:function(t){var n=t.instance;return["p-autocomplete-input-multiple",{"p-variant-filled":n.$variant==="filled"}]},chipItem:function(t){var n=t.instance,o=t.i;return["p-autocomplete-chip-item",{"p-focus":n.focusedMultipleOptionIndex===o}]},pcChip:"p-autocomplete-chip",chipIcon:"p-autocomplete-chip-icon",inputChip:"p-autocomplete-input-chip",loader:"p-autocomplete-loader",dropdown:"p-autocomplete-dropdown",overlay:"p-autocomplete-overlay p-component",listContainer:"p-autocomplete-list-container",list:"p-autocomplete-list",optionGroup:"p-autocomplete-option-group",option:function(t){var n=t.instance,o=t.option,i=t.i,r=t.getItemOptions;return["p-autocomplete-option",{"p-autocomplete-option-selected":n.isSelected(o),"p-focus":n.focusedOptionIndex===n.getOptionIndex(i,r),"p-disabled":n.isOptionDisabled(o)}]},emptyMessage:"p-autocomplete-empty-message"},vd=N.extend({name:"autocomplete",style:bd,classes:yd,inlineStyles:gd}),wd={name:"BaseAutoComplete",extends:it,props:{suggestions:{type:Array,default:null},optionLabel:null,optionDisabled:null,optionGroupLabel:null,optionGroupChildren:null,scrollHeight:{type:String,default:"14rem"},dropdown:{type:Boolean,default:!1},dropdownMode:{type:String,default:"blank"},multiple:{type:Boolean,default:!1},loading:{type:Boolean,default:!1},placeholder:{type:String,default:null},dataKey:{type:String,default:null},minLength:{type:Number,default:1},delay:{type:Number,default:300},appendTo:{type:[String,Object],default:"body"},forceSelection:{type:Boolean,default:!1},completeOnFocus:{type:Boolean,default:!1},inputId:{type:String,default:null},inputStyle:{type:Object,default:null},inputClass:{type:[String,Object],default:null},panelStyle:{type:Object,default:null},panelClass:{type:[String,Object],default:null},overlayStyle:{type:Object,default:null},overlayClass:{type:[String,Object],default:null},dropdownIcon:{type:String,default:null},dropdownClass:{type:[String,Object],default:null},loader:{type:String,default:null},loadingIcon:{type:String,default:null},removeTokenIcon:{type:String,default:null},chipIcon:{type:String,default:null},virtualScrollerOptions:{type:Object,default:null},autoOptionFocus:{type:Boolean,default:!1},selectOnFocus:{type:Boolean,default:!1},focusOnHover:{type:Boolean,default:!0},searchLocale:{type:String,default:void 0},searchMessage:{type:String,default:null},selectionMessage:{type:String,default:null},emptySelectionMessage:{type:String,default:null},emptySearchMessage:{type:String,default:null},showEmptyMessage:{type:Boolean,default:!0},tabindex:{type:Number,default:0},typeahead:{type:Boolean,default:!0},ariaLabel:{type:String,default:null},ariaLabelledby:{type:String,default:null}},style:vd,provide:function(){return{$pcAutoComplete:this,$parentInstance:this}}};function br(e,t,n){return(t=Cd(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Cd(e){var t=Sd(e,"string");return ht(t)=="symbol"?t:t+""}function Sd(e,t){if(ht(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(ht(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function ht(e){"@babel/helpers - typeof";return ht=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ht(e)}function gr(e){return Pd(e)||Id(e)||kd(e)||$d()}function $d(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function kd(e,t){if(e){if(typeof e=="string")return uo(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?uo(e,t):void 0}}function Id(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function Pd(e){if(Array.isArray(e))return uo(e)}function uo(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var Od={name:"AutoComplete",extends:wd,inheritAttrs:!1,emits:["change","focus","blur","item-select","item-unselect","option-select","option-unselect","dropdown-click","clear","complete","before-show","before-hide","show","hide"],inject:{$pcFluid:{default:null}},outsideClickListener:null,resizeListener:null,scrollHandler:null,overlay:null,virtualScroller:null,searchTimeout:null,dirty:!1,startRangeIndex:-1,data:function(){return{clicked:!1,focused:!1,focusedOptionIndex:-1,focusedMultipleOptionIndex:-1,overlayVisible:!1,searching:!1}},watch:{suggestions:function(){this.searching&&(this.show(),this.focusedOptionIndex=this.overlayVisible&&this.autoOptionFocus?this.findFirstFocusedOptionIndex():-1,this.searching=!1,!this.showEmptyMessage&&this.visibleOptions.length===0&&this.hide()),this.autoUpdateModel()}},mounted:function(){this.autoUpdateModel()},updated:function(){this.overlayVisible&&this.alignOverlay()},beforeUnmount:function(){this.unbindOutsideClickListener(),this.unbindResizeListener(),this.scrollHandler&&(this.scrollHandler.destroy(),this.scrollHandler=null),this.overlay&&(me.clear(this.overlay),this.overlay=null)},methods:{getOptionIndex:function(t,n){return this.virtualScrollerDisabled?t:n&&n(t).index},getOptionLabel:function(t){return this.optionLabel?H(t,this.optionLabel):t},getOptionValue:function(t){return t},getOptionRenderKey:function(t,n){return(this.dataKey?H(t,this.dataKey):this.getOptionLabel(t))+"_"+n},getPTOptions:function(t,n,o,i){return this.ptm(i,{context:{option:t,index:o,selected:this.isSelected(t),focused:this.focusedOptionIndex===this.getOptionIndex(o,n),disabled:this.isOptionDisabled(t)}})},isOptionDisabled:function(t){return this.optionDisabled?H(t,this.optionDisabled):!1},isOptionGroup:function(t){return this.optionGroupLabel&&t.optionGroup&&t.group},getOptionGroupLabel:function(t){return H(t,this.optionGroupLabel)},getOptionGroupChildren:function(t){return H(t,this.optionGroupChildren)},getAriaPosInset:function(t){var n=this;return(this.optionGroupLabel?t-this.visibleOptions.slice(0,t).filter(function(o){return n.isOptionGroup(o)}).length:t)+1},show:function(t){this.$emit("before-show"),this.dirty=!0,this.overlayVisible=!0,this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():-1,t&&te(this.multiple?this.$refs.focusInput:this.$refs.focusInput.$el)},hide:function(t){var n=this,o=function(){var r;n.$emit("before-hide"),n.dirty=t,n.overlayVisible=!1,n.clicked=!1,n.focusedOptionIndex=-1,t&&te(n.multiple?n.$refs.focusInput:(r=n.$refs.focusInput)===null||r===void 0?void 0:r.$el)};setTimeout(function(){o()},0)},onFocus:function(t){this.disabled||(!this.dirty&&this.completeOnFocus&&this.search(t,t.target.value,"focus"),this.dirty=!0,this.focused=!0,this.overlayVisible&&(this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.overlayVisible&&this.autoOptionFocus?this.findFirstFocusedOptionIndex():-1,this.scrollInView(this.focusedOptionIndex)),this.$emit("focus",t))},onBlur:function(t){var n,o;this.dirty=!1,this.focused=!1,this.focusedOptionIndex=-1,this.$emit("blur",t),(n=(o=this.formField).onBlur)===null||n===void 0||n.call(o)},onKeyDown:function(t){if(this.disabled){t.preventDefault();return}switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t);break;case"ArrowLeft":this.onArrowLeftKey(t);break;case"ArrowRight":this.onArrowRightKey(t);break;case"Home":this.onHomeKey(t);break;case"End":this.onEndKey(t);break;case"PageDown":this.onPageDownKey(t);break;case"PageUp":this.onPageUpKey(t);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Space":this.onSpaceKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t);break;case"ShiftLeft":case"ShiftRight":this.onShiftKey(t);break;case"Backspace":this.onBackspaceKey(t);break}this.clicked=!1},onInput:function(t){var n=this;if(this.typeahead){this.searchTimeout&&clearTimeout(this.searchTimeout);var o=t.target.value;this.multiple||this.updateModel(t,o),o.length===0?(this.hide(),this.$emit("clear")):o.length>=this.minLength?(this.focusedOptionIndex=-1,this.searchTimeout=setTimeout(function(){n.search(t,o,"input")},this.delay)):this.hide()}},onChange:function(t){var n=this;if(this.forceSelection){var o=!1;if(this.visibleOptions&&!this.multiple){var i,r=this.multiple?this.$refs.focusInput.value:(i=this.$refs.focusInput)===null||i===void 0||(i=i.$el)===null||i===void 0?void 0:i.value,a=this.visibleOptions.find(function(u){return n.isOptionMatched(u,r||"")});a!==void 0&&(o=!0,!this.isSelected(a)&&this.onOptionSelect(t,a))}if(!o){if(this.multiple)this.$refs.focusInput.value="";else{var l,s=(l=this.$refs.focusInput)===null||l===void 0?void 0:l.$el;s&&(s.value="")}this.$emit("clear"),!this.multiple&&this.updateModel(t,null)}}},onMultipleContainerFocus:function(){this.disabled||(this.focused=!0)},onMultipleContainerBlur:function(){this.focusedMultipleOptionIndex=-1,this.focused=!1},onMultipleContainerKeyDown:function(t){if(this.disabled){t.preventDefault();return}switch(t.code){case"ArrowLeft":this.onArrowLeftKeyOnMultiple(t);break;case"ArrowRight":this.onArrowRightKeyOnMultiple(t);break;case"Backspace":this.onBackspaceKeyOnMultiple(t);break}},onContainerClick:function(t){this.clicked=!0,!(this.disabled||this.searching||this.loading||this.isDropdownClicked(t))&&(!this.overlay||!this.overlay.contains(t.target))&&te(this.multiple?this.$refs.focusInput:this.$refs.focusInput.$el)},onDropdownClick:function(t){var n=void 0;if(this.overlayVisible)this.hide(!0);else{var o=this.multiple?this.$refs.focusInput:this.$refs.focusInput.$el;te(o),n=o.value,this.dropdownMode==="blank"?this.search(t,"","dropdown"):this.dropdownMode==="current"&&this.search(t,n,"dropdown")}this.$emit("dropdown-click",{originalEvent:t,query:n})},onOptionSelect:function(t,n){var o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,i=this.getOptionValue(n);this.multiple?(this.$refs.focusInput.value="",this.isSelected(n)||this.updateModel(t,[].concat(gr(this.d_value||[]),[i]))):this.updateModel(t,i),this.$emit("item-select",{originalEvent:t,value:n}),this.$emit("option-select",{originalEvent:t,value:n}),o&&this.hide(!0)},onOptionMouseMove:function(t,n){this.focusOnHover&&this.changeFocusedOptionIndex(t,n)},onOptionSelectRange:function(t){var n=this,o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:-1,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:-1;if(o===-1&&(o=this.findNearestSelectedOptionIndex(i,!0)),i===-1&&(i=this.findNearestSelectedOptionIndex(o)),o!==-1&&i!==-1){var r=Math.min(o,i),a=Math.max(o,i),l=this.visibleOptions.slice(r,a+1).filter(function(s){return n.isValidOption(s)}).map(function(s){return n.getOptionValue(s)});this.updateModel(t,l)}},onOverlayClick:function(t){Ge.emit("overlay-click",{originalEvent:t,target:this.$el})},onOverlayKeyDown:function(t){switch(t.code){case"Escape":this.onEscapeKey(t);break}},onArrowDownKey:function(t){if(this.overlayVisible){var n=this.focusedOptionIndex!==-1?this.findNextOptionIndex(this.focusedOptionIndex):this.clicked?this.findFirstOptionIndex():this.findFirstFocusedOptionIndex();this.multiple&&t.shiftKey&&this.onOptionSelectRange(t,this.startRangeIndex,n),this.changeFocusedOptionIndex(t,n),t.preventDefault()}},onArrowUpKey:function(t){if(this.overlayVisible)if(t.altKey)this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(),t.preventDefault();else{var n=this.focusedOptionIndex!==-1?this.findPrevOptionIndex(this.focusedOptionIndex):this.clicked?this.findLastOptionIndex():this.findLastFocusedOptionIndex();this.multiple&&t.shiftKey&&this.onOptionSelectRange(t,n,this.startRangeIndex),this.changeFocusedOptionIndex(t,n),t.preventDefault()}},onArrowLeftKey:function(t){var n=t.currentTarget;this.focusedOptionIndex=-1,this.multiple&&(he(n.value)&&this.$filled?(te(this.$refs.multiContainer),this.focusedMultipleOptionIndex=this.d_value.length):t.stopPropagation())},onArrowRightKey:function(t){this.focusedOptionIndex=-1,this.multiple&&t.stopPropagation()},onHomeKey:function(t){var n=t.currentTarget,o=n.value.length,i=t.metaKey||t.ctrlKey,r=this.findFirstOptionIndex();this.multiple&&t.shiftKey&&i&&this.onOptionSelectRange(t,r,this.startRangeIndex),n.setSelectionRange(0,t.shiftKey?o:0),this.focusedOptionIndex=-1,t.preventDefault()},onEndKey:function(t){var n=t.currentTarget,o=n.value.length,i=t.metaKey||t.ctrlKey,r=this.findLastOptionIndex();this.multiple&&t.shiftKey&&i&&this.onOptionSelectRange(t,this.startRangeIndex,r),n.setSelectionRange(t.shiftKey?0:o,o),this.focusedOptionIndex=-1,t.preventDefault()},onPageUpKey:function(t){this.scrollInView(0),t.preventDefault()},onPageDownKey:function(t){this.scrollInView(this.visibleOptions.length-1),t.preventDefault()},onEnterKey:function(t){this.typeahead?this.overlayVisible?(this.focusedOptionIndex!==-1&&(this.multiple&&t.shiftKey?(this.onOptionSelectRange(t,this.focusedOptionIndex),t.preventDefault()):this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex])),this.hide()):(this.focusedOptionIndex=-1,this.onArrowDownKey(t)):this.multiple&&t.target.value.trim()&&(this.updateModel(t,[].concat(gr(this.d_value||[]),[t.target.value.trim()])),this.$refs.focusInput.value="")},onSpaceKey:function(t){this.focusedOptionIndex!==-1&&this.onEnterKey(t)},onEscapeKey:function(t){this.overlayVisible&&this.hide(!0),t.preventDefault()},onTabKey:function(t){this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide()},onShiftKey:function(){this.startRangeIndex=this.focusedOptionIndex},onBackspaceKey:function(t){if(this.multiple){if(A(this.d_value)&&!this.$refs.focusInput.value){var n=this.d_value[this.d_value.length-1],o=this.d_value.slice(0,-1);this.writeValue(o,t),this.$emit("item-unselect",{originalEvent:t,value:n}),this.$emit("option-unselect",{originalEvent:t,value:n})}t.stopPropagation()}},onArrowLeftKeyOnMultiple:function(){this.focusedMultipleOptionIndex=this.focusedMultipleOptionIndex<1?0:this.focusedMultipleOptionIndex-1},onArrowRightKeyOnMultiple:function(){this.focusedMultipleOptionIndex++,this.focusedMultipleOptionIndex>this.d_value.length-1&&(this.focusedMultipleOptionIndex=-1,te(this.$refs.focusInput))},onBackspaceKeyOnMultiple:function(t){this.focusedMultipleOptionIndex!==-1&&this.removeOption(t,this.focusedMultipleOptionIndex)},onOverlayEnter:function(t){me.set("overlay",t,this.$primevue.config.zIndex.overlay),pt(t,{position:"absolute",top:"0"}),this.alignOverlay()},onOverlayAfterEnter:function(){this.bindOutsideClickListener(),this.bindScrollListener(),this.bindResizeListener(),this.$emit("show")},onOverlayLeave:function(){this.unbindOutsideClickListener(),this.unbindScrollListener(),this.unbindResizeListener(),this.$emit("hide"),this.overlay=null},onOverlayAfterLeave:function(t){me.clear(t)},alignOverlay:function(){var t=this.multiple?this.$refs.multiContainer:this.$refs.focusInput.$el;this.appendTo==="self"?ui(this.overlay,t):(this.overlay.style.minWidth=ve(t)+"px",ko(this.overlay,t))},bindOutsideClickListener:function(){var t=this;this.outsideClickListener||(this.outsideClickListener=function(n){t.overlayVisible&&t.overlay&&t.isOutsideClicked(n)&&t.hide()},document.addEventListener("click",this.outsideClickListener,!0))},unbindOutsideClickListener:function(){this.outsideClickListener&&(document.removeEventListener("click",this.outsideClickListener,!0),this.outsideClickListener=null)},bindScrollListener:function(){var t=this;this.scrollHandler||(this.scrollHandler=new Ro(this.$refs.container,function(){t.overlayVisible&&t.hide()})),this.scrollHandler.bindScrollListener()},unbindScrollListener:function(){this.scrollHandler&&this.scrollHandler.unbindScrollListener()},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=function(){t.overlayVisible&&!Kn()&&t.hide()},window.addEventListener("resize",this.resizeListener))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),this.resizeListener=null)},isOutsideClicked:function(t){return!this.overlay.contains(t.target)&&!this.isInputClicked(t)&&!this.isDropdownClicked(t)},isInputClicked:function(t){return this.multiple?t.target===this.$refs.multiContainer||this.$refs.multiContainer.contains(t.target):t.target===this.$refs.focusInput.$el},isDropdownClicked:function(t){return this.$refs.dropdownButton?t.target===this.$refs.dropdownButton||this.$refs.dropdownButton.contains(t.target):!1},isOptionMatched:function(t,n){var o;return this.isValidOption(t)&&((o=this.getOptionLabel(t))===null||o===void 0?void 0:o.toLocaleLowerCase(this.searchLocale))===n.toLocaleLowerCase(this.searchLocale)},isValidOption:function(t){return A(t)&&!(this.isOptionDisabled(t)||this.isOptionGroup(t))},isValidSelectedOption:function(t){return this.isValidOption(t)&&this.isSelected(t)},isEquals:function(t,n){return Ye(t,n,this.equalityKey)},isSelected:function(t){var n=this,o=this.getOptionValue(t);return this.multiple?(this.d_value||[]).some(function(i){return n.isEquals(i,o)}):this.isEquals(this.d_value,this.getOptionValue(t))},findFirstOptionIndex:function(){var t=this;return this.visibleOptions.findIndex(function(n){return t.isValidOption(n)})},findLastOptionIndex:function(){var t=this;return ot(this.visibleOptions,function(n){return t.isValidOption(n)})},findNextOptionIndex:function(t){var n=this,o=t<this.visibleOptions.length-1?this.visibleOptions.slice(t+1).findIndex(function(i){return n.isValidOption(i)}):-1;return o>-1?o+t+1:t},findPrevOptionIndex:function(t){var n=this,o=t>0?ot(this.visibleOptions.slice(0,t),function(i){return n.isValidOption(i)}):-1;return o>-1?o:t},findSelectedOptionIndex:function(){var t=this;return this.$filled?this.visibleOptions.findIndex(function(n){return t.isValidSelectedOption(n)}):-1},findFirstFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findFirstOptionIndex():t},findLastFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findLastOptionIndex():t},search:function(t,n,o){n!=null&&(o==="input"&&n.trim().length===0||(this.searching=!0,this.$emit("complete",{originalEvent:t,query:n})))},removeOption:function(t,n){var o=this,i=this.d_value[n],r=this.d_value.filter(function(a,l){return l!==n}).map(function(a){return o.getOptionValue(a)});this.updateModel(t,r),this.$emit("item-unselect",{originalEvent:t,value:i}),this.$emit("option-unselect",{originalEvent:t,value:i}),this.dirty=!0,te(this.multiple?this.$refs.focusInput:this.$refs.focusInput.$el)},changeFocusedOptionIndex:function(t,n){this.focusedOptionIndex!==n&&(this.focusedOptionIndex=n,this.scrollInView(),this.selectOnFocus&&this.onOptionSelect(t,this.visibleOptions[n],!1))},scrollInView:function(){var t=this,n=arguments.length>0&&arguments[0]!==void 0?arguments[0]:-1;this.$nextTick(function(){var o=n!==-1?"".concat(t.$id,"_").concat(n):t.focusedOptionId,i=xe(t.list,'li[id="'.concat(o,'"]'));i?i.scrollIntoView&&i.scrollIntoView({block:"nearest",inline:"start"}):t.virtualScrollerDisabled||t.virtualScroller&&t.virtualScroller.scrollToIndex(n!==-1?n:t.focusedOptionIndex)})},autoUpdateModel:function(){this.selectOnFocus&&this.autoOptionFocus&&!this.$filled&&(this.focusedOptionIndex=this.findFirstFocusedOptionIndex(),this.onOptionSelect(null,this.visibleOptions[this.focusedOptionIndex],!1))},updateModel:function(t,n){this.writeValue(n,t),this.$emit("change",{originalEvent:t,value:n})},flatOptions:function(t){var n=this;return(t||[]).reduce(function(o,i,r){o.push({optionGroup:i,group:!0,index:r});var a=n.getOptionGroupChildren(i);return a&&a.forEach(function(l){return o.push(l)}),o},[])},overlayRef:function(t){this.overlay=t},listRef:function(t,n){this.list=t,n&&n(t)},virtualScrollerRef:function(t){this.virtualScroller=t},findNextSelectedOptionIndex:function(t){var n=this,o=this.$filled&&t<this.visibleOptions.length-1?this.visibleOptions.slice(t+1).findIndex(function(i){return n.isValidSelectedOption(i)}):-1;return o>-1?o+t+1:-1},findPrevSelectedOptionIndex:function(t){var n=this,o=this.$filled&&t>0?ot(this.visibleOptions.slice(0,t),function(i){return n.isValidSelectedOption(i)}):-1;return o>-1?o:-1},findNearestSelectedOptionIndex:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1,o=-1;return this.$filled&&(n?(o=this.findPrevSelectedOptionIndex(t),o=o===-1?this.findNextSelectedOptionIndex(t):o):(o=this.findNextSelectedOptionIndex(t),o=o===-1?this.findPrevSelectedOptionIndex(t):o)),o>-1?o:t}},computed:{visibleOptions:function(){return this.optionGroupLabel?this.flatOptions(this.suggestions):this.suggestions||[]},inputValue:function(){if(this.$filled)if(ht(this.d_value)==="object"){var t=this.getOptionLabel(this.d_value);return t!=null?t:this.d_value}else return this.d_value;else return""},hasSelectedOption:function(){return this.$filled},equalityKey:function(){return this.dataKey},searchResultMessageText:function(){return A(this.visibleOptions)&&this.overlayVisible?this.searchMessageText.replaceAll("{0}",this.visibleOptions.length):this.emptySearchMessageText},searchMessageText:function(){return this.searchMessage||this.$primevue.config.locale.searchMessage||""},emptySearchMessageText:function(){return this.emptySearchMessage||this.$primevue.config.locale.emptySearchMessage||""},selectionMessageText:function(){return this.selectionMessage||this.$primevue.config.locale.selectionMessage||""},emptySelectionMessageText:function(){return this.emptySelectionMessage||this.$primevue.config.locale.emptySelectionMessage||""},selectedMessageText:function(){return this.$filled?this.selectionMessageText.replaceAll("{0}",this.multiple?this.d_value.length:"1"):this.emptySelectionMessageText},listAriaLabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.listLabel:void 0},focusedOptionId:function(){return this.focusedOptionIndex!==-1?"".concat(this.$id,"_").concat(this.focusedOptionIndex):null},focusedMultipleOptionId:function(){return this.focusedMultipleOptionIndex!==-1?"".concat(this.$id,"_multiple_option_").concat(this.focusedMultipleOptionIndex):null},ariaSetSize:function(){var t=this;return this.visibleOptions.filter(function(n){return!t.isOptionGroup(n)}).length},virtualScrollerDisabled:function(){return!this.virtualScrollerOptions},panelId:function(){return this.$id+"_panel"},containerDataP:function(){return re({fluid:this.$fluid})},overlayDataP:function(){return re(br({},"portal-"+this.appendTo,"portal-"+this.appendTo))},inputMultipleDataP:function(){return re(br({invalid:this.$invalid,disabled:this.disabled,focus:this.focused,fluid:this.$fluid,filled:this.$variant==="filled",empty:!this.$filled},this.size,this.size))}},components:{InputText:Hn,VirtualScroller:Gn,Portal:gt,ChevronDownIcon:vn,SpinnerIcon:bt,Chip:Li},directives:{ripple:Re}};function Ut(e){"@babel/helpers - typeof";return Ut=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ut(e)}function yr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function vr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?yr(Object(n),!0).forEach(function(o){xd(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):yr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function xd(e,t,n){return(t=Rd(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Rd(e){var t=Ld(e,"string");return Ut(t)=="symbol"?t:t+""}function Ld(e,t){if(Ut(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Ut(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Td=["data-p"],Md=["aria-activedescendant","data-p-has-dropdown","data-p"],Ed=["id","aria-label","aria-setsize","aria-posinset"],Dd=["id","placeholder","tabindex","disabled","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid"],Fd=["data-p-has-dropdown"],Bd=["disabled","aria-expanded","aria-controls"],zd=["id","data-p"],Ad=["id","aria-label"],jd=["id"],Kd=["id","aria-label","aria-selected","aria-disabled","aria-setsize","aria-posinset","onClick","onMousemove","data-p-selected","data-p-focused","data-p-disabled"];function Vd(e,t,n,o,i,r){var a=T("InputText"),l=T("Chip"),s=T("SpinnerIcon"),u=T("VirtualScroller"),d=T("Portal"),p=ke("ripple");return c(),b("div",f({ref:"container",class:e.cx("root"),style:e.sx("root"),onClick:t[11]||(t[11]=function(){return r.onContainerClick&&r.onContainerClick.apply(r,arguments)}),"data-p":r.containerDataP},e.ptmi("root")),[e.multiple?C("",!0):(c(),y(a,{key:0,ref:"focusInput",id:e.inputId,type:"text",name:e.$formName,class:j([e.cx("pcInputText"),e.inputClass]),style:So(e.inputStyle),value:r.inputValue,placeholder:e.placeholder,tabindex:e.disabled?-1:e.tabindex,fluid:e.$fluid,disabled:e.disabled,size:e.size,invalid:e.invalid,variant:e.variant,autocomplete:"off",role:"combobox","aria-label":e.ariaLabel,"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-autocomplete":"list","aria-expanded":i.overlayVisible,"aria-controls":r.panelId,"aria-activedescendant":i.focused?r.focusedOptionId:void 0,onFocus:r.onFocus,onBlur:r.onBlur,onKeydown:r.onKeyDown,onInput:r.onInput,onChange:r.onChange,unstyled:e.unstyled,"data-p-has-dropdown":e.dropdown,pt:e.ptm("pcInputText")},null,8,["id","name","class","style","value","placeholder","tabindex","fluid","disabled","size","invalid","variant","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","onFocus","onBlur","onKeydown","onInput","onChange","unstyled","data-p-has-dropdown","pt"])),e.multiple?(c(),b("ul",f({key:1,ref:"multiContainer",class:e.cx("inputMultiple"),tabindex:"-1",role:"listbox","aria-orientation":"horizontal","aria-activedescendant":i.focused?r.focusedMultipleOptionId:void 0,onFocus:t[5]||(t[5]=function(){return r.onMultipleContainerFocus&&r.onMultipleContainerFocus.apply(r,arguments)}),onBlur:t[6]||(t[6]=function(){return r.onMultipleContainerBlur&&r.onMultipleContainerBlur.apply(r,arguments)}),onKeydown:t[7]||(t[7]=function(){return r.onMultipleContainerKeyDown&&r.onMultipleContainerKeyDown.apply(r,arguments)}),"data-p-has-dropdown":e.dropdown,"data-p":r.inputMultipleDataP},e.ptm("inputMultiple")),[(c(!0),b(K,null,ue(e.d_value,function(h,m){return c(),b("li",f({key:"".concat(m,"_").concat(r.getOptionLabel(h)),id:e.$id+"_multiple_option_"+m,class:e.cx("chipItem",{i:m}),role:"option","aria-label":r.getOptionLabel(h),"aria-selected":!0,"aria-setsize":e.d_value.length,"aria-posinset":m+1,ref_for:!0},e.ptm("chipItem")),[k(e.$slots,"chip",f({class:e.cx("pcChip"),value:h,index:m,removeCallback:function($){return r.removeOption($,m)},ref_for:!0},e.ptm("pcChip")),function(){return[ne(l,{class:j(e.cx("pcChip")),label:r.getOptionLabel(h),removeIcon:e.chipIcon||e.removeTokenIcon,removable:"",unstyled:e.unstyled,onRemove:function($){return r.removeOption($,m)},"data-p-focused":i.focusedMultipleOptionIndex===m,pt:e.ptm("pcChip")},{removeicon:E(function(){return[k(e.$slots,e.$slots.chipicon?"chipicon":"removetokenicon",{class:j(e.cx("chipIcon")),index:m,removeCallback:function($){return r.removeOption($,m)}})]}),_:2},1032,["class","label","removeIcon","unstyled","onRemove","data-p-focused","pt"])]})],16,Ed)}),128)),R("li",f({class:e.cx("inputChip"),role:"option"},e.ptm("inputChip")),[R("input",f({ref:"focusInput",id:e.inputId,type:"text",style:e.inputStyle,class:e.inputClass,placeholder:e.placeholder,tabindex:e.disabled?-1:e.tabindex,disabled:e.disabled,autocomplete:"off",role:"combobox","aria-label":e.ariaLabel,"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-autocomplete":"list","aria-expanded":i.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":i.focused?r.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,onFocus:t[0]||(t[0]=function(){return r.onFocus&&r.onFocus.apply(r,arguments)}),onBlur:t[1]||(t[1]=function(){return r.onBlur&&r.onBlur.apply(r,arguments)}),onKeydown:t[2]||(t[2]=function(){return r.onKeyDown&&r.onKeyDown.apply(r,arguments)}),onInput:t[3]||(t[3]=function(){return r.onInput&&r.onInput.apply(r,arguments)}),onChange:t[4]||(t[4]=function(){return r.onChange&&r.onChange.apply(r,arguments)})},e.ptm("input")),null,16,Dd)],16)],16,Md)):C("",!0),i.searching||e.loading?k(e.$slots,e.$slots.loader?"loader":"loadingicon",{key:2,class:j(e.cx("loader"))},function(){return[e.loader||e.loadingIcon?(c(),b("i",f({key:0,class:["pi-spin",e.cx("loader"),e.loader,e.loadingIcon],"aria-hidden":"true","data-p-has-dropdown":e.dropdown},e.ptm("loader")),null,16,Fd)):(c(),y(s,f({key:1,class:e.cx("loader"),spin:"","aria-hidden":"true","data-p-has-dropdown":e.dropdown},e.ptm("loader")),null,16,["class","data-p-has-dropdown"]))]}):C("",!0),k(e.$slots,e.$slots.dropdown?"dropdown":"dropdownbutton",{toggleCallback:function(m){return r.onDropdownClick(m)}},function(){return[e.dropdown?(c(),b("button",f({key:0,ref:"dropdownButton",type:"button",class:[e.cx("dropdown"),e.dropdownClass],disabled:e.disabled,"aria-haspopup":"listbox","aria-expanded":i.overlayVisible,"aria-controls":r.panelId,onClick:t[8]||(t[8]=function(){return r.onDropdownClick&&r.onDropdownClick.apply(r,arguments)})},e.ptm("dropdown")),[k(e.$slots,"dropdownicon",{class:j(e.dropdownIcon)},function(){return[(c(),y(M(e.dropdownIcon?"span":"ChevronDownIcon"),f({class:e.dropdownIcon},e.ptm("dropdownIcon")),null,16,["class"]))]})],16,Bd)):C("",!0)]}),e.typeahead?(c(),b("span",f({key:3,role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenSearchResult"),{"data-p-hidden-accessible":!0}),Y(r.searchResultMessageText),17)):C("",!0),ne(d,{appendTo:e.appendTo},{default:E(function(){return[ne(zn,f({name:"p-connected-overlay",onEnter:r.onOverlayEnter,onAfterEnter:r.onOverlayAfterEnter,onLeave:r.onOverlayLeave,onAfterLeave:r.onOverlayAfterLeave},e.ptm("transition")),{default:E(function(){return[i.overlayVisible?(c(),b("div",f({key:0,ref:r.overlayRef,id:r.panelId,class:[e.cx("overlay"),e.panelClass,e.overlayClass],style:vr(vr({},e.panelStyle),e.overlayStyle),onClick:t[9]||(t[9]=function(){return r.onOverlayClick&&r.onOverlayClick.apply(r,arguments)}),onKeydown:t[10]||(t[10]=function(){return r.onOverlayKeyDown&&r.onOverlayKeyDown.apply(r,arguments)}),"data-p":r.overlayDataP},e.ptm("overlay")),[k(e.$slots,"header",{value:e.d_value,suggestions:r.visibleOptions}),R("div",f({class:e.cx("listContainer"),style:{"max-height":r.virtualScrollerDisabled?e.scrollHeight:""}},e.ptm("listContainer")),[ne(u,f({ref:r.virtualScrollerRef},e.virtualScrollerOptions,{style:{height:e.scrollHeight},items:r.visibleOptions,tabindex:-1,disabled:r.virtualScrollerDisabled,pt:e.ptm("virtualScroller")}),De({content:E(function(h){var m=h.styleClass,w=h.contentRef,$=h.items,v=h.getItemOptions,I=h.contentStyle,P=h.itemSize;return[R("ul",f({ref:function(g){return r.listRef(g,w)},id:e.$id+"_list",class:[e.cx("list"),m],style:I,role:"listbox","aria-label":r.listAriaLabel},e.ptm("list")),[(c(!0),b(K,null,ue($,function(L,g){return c(),b(K,{key:r.getOptionRenderKey(L,r.getOptionIndex(g,v))},[r.isOptionGroup(L)?(c(),b("li",f({key:0,id:e.$id+"_"+r.getOptionIndex(g,v),style:{height:P?P+"px":void 0},class:e.cx("optionGroup"),role:"option",ref_for:!0},e.ptm("optionGroup")),[k(e.$slots,"optiongroup",{option:L.optionGroup,index:r.getOptionIndex(g,v)},function(){return[Ee(Y(r.getOptionGroupLabel(L.optionGroup)),1)]})],16,jd)):Ie((c(),b("li",f({key:1,id:e.$id+"_"+r.getOptionIndex(g,v),style:{height:P?P+"px":void 0},class:e.cx("option",{option:L,i:g,getItemOptions:v}),role:"option","aria-label":r.getOptionLabel(L),"aria-selected":r.isSelected(L),"aria-disabled":r.isOptionDisabled(L),"aria-setsize":r.ariaSetSize,"aria-posinset":r.getAriaPosInset(r.getOptionIndex(g,v)),onClick:function(G){return r.onOptionSelect(G,L)},onMousemove:function(G){return r.onOptionMouseMove(G,r.getOptionIndex(g,v))},"data-p-selected":r.isSelected(L),"data-p-focused":i.focusedOptionIndex===r.getOptionIndex(g,v),"data-p-disabled":r.isOptionDisabled(L),ref_for:!0},r.getPTOptions(L,v,g,"option")),[k(e.$slots,"option",{option:L,index:r.getOptionIndex(g,v)},function(){return[Ee(Y(r.getOptionLabel(L)),1)]})],16,Kd)),[[p]])],64)}),128)),e.showEmptyMessage&&(!$||$&&$.length===0)?(c(),b("li",f({key:0,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage")),[k(e.$slots,"empty",{},function(){return[Ee(Y(r.searchResultMessageText),1)]})],16)):C("",!0)],16,Ad)]}),_:2},[e.$slots.loader?{name:"loader",fn:E(function(h){var m=h.options;return[k(e.$slots,"loader",{options:m})]}),key:"0"}:void 0]),1040,["style","items","disabled","pt"])],16),k(e.$slots,"footer",{value:e.d_value,suggestions:r.visibleOptions}),R("span",f({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenSelectedMessage"),{"data-p-hidden-accessible":!0}),Y(r.selectedMessageText),17)],16,zd)):C("",!0)]}),_:3},16,["onEnter","onAfterEnter","onLeave","onAfterLeave"])]}),_:3},8,["appendTo"])],16,Td)}Od.render=Vd;var pe={STARTS_WITH:"startsWith",CONTAINS:"contains",NOT_CONTAINS:"notContains",ENDS_WITH:"endsWith",EQUALS:"equals",NOT_EQUALS:"notEquals",LESS_THAN:"lt",LESS_THAN_OR_EQUAL_TO:"lte",GREATER_THAN:"gt",GREATER_THAN_OR_EQUAL_TO:"gte",DATE_IS:"dateIs",DATE_IS_NOT:"dateIsNot",DATE_BEFORE:"dateBefore",DATE_AFTER:"dateAfter"},Fn={AND:"and",OR:"or"};function wr(e,t){var n=typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(!n){if(Array.isArray(e)||(n=Nd(e))||t){n&&(e=n);var o=0,i=function(){};return{s:i,n:function(){return o>=e.length?{done:!0}:{done:!1,value:e[o++]}},e:function(u){throw u},f:i}}throw new TypeError(`Invalid attempt to iterate non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var r,a=!0,l=!1;return{s:function(){n=n.call(e)},n:function(){var u=n.next();return a=u.done,u},e:function(u){l=!0,r=u},f:function(){try{a||n.return==null||n.return()}finally{if(l)throw r}}}}function Nd(e,t){if(e){if(typeof e=="string")return Cr(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Cr(e,t):void 0}}function Cr(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var co={filter:function(t,n,o,i,r){var a=[];if(!t)return a;var l=wr(t),s;try{for(l.s();!(s=l.n()).done;){var u=s.value;if(typeof u=="string"){if(this.filters[i](u,o,r)){a.push(u);continue}}else{var d=wr(n),p;try{for(d.s();!(p=d.n()).done;){var h=p.value,m=H(u,h);if(this.filters[i](m,o,r)){a.push(u);break}}}catch(w){d.e(w)}finally{d.f()}}}}catch(w){l.e(w)}finally{l.f()}return a},filters:{startsWith:function(t,n,o){if(n==null||n==="")return!0;if(t==null)return!1;var i=Pe(n.toString()).toLocaleLowerCase(o),r=Pe(t.toString()).toLocaleLowerCase(o);return r.slice(0,i.length)===i},contains:function(t,n,o){if(n==null||n==="")return!0;if(t==null)return!1;var i=Pe(n.toString()).toLocaleLowerCase(o),r=Pe(t.toString()).toLocaleLowerCase(o);return r.indexOf(i)!==-1},notContains:function(t,n,o){if(n==null||n==="")return!0;if(t==null)return!1;var i=Pe(n.toString()).toLocaleLowerCase(o),r=Pe(t.toString()).toLocaleLowerCase(o);return r.indexOf(i)===-1},endsWith:function(t,n,o){if(n==null||n==="")return!0;if(t==null)return!1;var i=Pe(n.toString()).toLocaleLowerCase(o),r=Pe(t.toString()).toLocaleLowerCase(o);return r.indexOf(i,r.length-i.length)!==-1},equals:function(t,n,o){return n==null||n===""?!0:t==null?!1:t.getTime&&n.getTime?t.getTime()===n.getTime():Pe(t.toString()).toLocaleLowerCase(o)==Pe(n.toString()).toLocaleLowerCase(o)},notEquals:function(t,n,o){return n==null||n===""?!1:t==null?!0:t.getTime&&n.getTime?t.getTime()!==n.getTime():Pe(t.toString()).toLocaleLowerCase(o)!=Pe(n.toString()).toLocaleLowerCase(o)},in:function(t,n){if(n==null||n.length===0)return!0;for(var o=0;o<n.length;o++)if(Ye(t,n[o]))return!0;return!1},between:function(t,n){return n==null||n[0]==null||n[1]==null?!0:t==null?!1:t.getTime?n[0].getTime()<=t.getTime()&&t.getTime()<=n[1].getTime():n[0]<=t&&t<=n[1]},lt:function(t,n){return n==null?!0:t==null?!1:t.getTime&&n.getTime?t.getTime()<n.getTime():t<n},lte:function(t,n){return n==null?!0:t==null?!1:t.getTime&&n.getTime?t.getTime()<=n.getTime():t<=n},gt:function(t,n){return n==null?!0:t==null?!1:t.getTime&&n.getTime?t.getTime()>n.getTime():t>n},gte:function(t,n){return n==null?!0:t==null?!1:t.getTime&&n.getTime?t.getTime()>=n.getTime():t>=n},dateIs:function(t,n){return n==null?!0:t==null?!1:t.toDateString()===n.toDateString()},dateIsNot:function(t,n){return n==null?!0:t==null?!1:t.toDateString()!==n.toDateString()},dateBefore:function(t,n){return n==null?!0:t==null?!1:t.getTime()<n.getTime()},dateAfter:function(t,n){return n==null?!0:t==null?!1:t.getTime()>n.getTime()}},register:function(t,n){this.filters[t]=n}},Mi={name:"ArrowDownIcon",extends:J};function Hd(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M6.99994 14C6.91097 14.0004 6.82281 13.983 6.74064 13.9489C6.65843 13.9148 6.58387 13.8646 6.52133 13.8013L1.10198 8.38193C0.982318 8.25351 0.917175 8.08367 0.920272 7.90817C0.923368 7.73267 0.994462 7.56523 1.11858 7.44111C1.24269 7.317 1.41014 7.2459 1.58563 7.2428C1.76113 7.23971 1.93098 7.30485 2.0594 7.42451L6.32263 11.6877V0.677419C6.32263 0.497756 6.394 0.325452 6.52104 0.198411C6.64808 0.0713706 6.82039 0 7.00005 0C7.17971 0 7.35202 0.0713706 7.47906 0.198411C7.6061 0.325452 7.67747 0.497756 7.67747 0.677419V11.6877L11.9407 7.42451C12.0691 7.30485 12.2389 7.23971 12.4144 7.2428C12.5899 7.2459 12.7574 7.317 12.8815 7.44111C13.0056 7.56523 13.0767 7.73267 13.0798 7.90817C13.0829 8.08367 13.0178 8.25351 12.8981 8.38193L7.47875 13.8013C7.41621 13.8646 7.34164 13.9148 7.25944 13.9489C7.17727 13.983 7.08912 14.0004 7.00015 14C7.00012 14 7.00009 14 7.00005 14C7.00001 14 6.99998 14 6.99994 14Z",fill:"currentColor"},null,-1)]),16)}Mi.render=Hd;var Ei={name:"ArrowUpIcon",extends:J};function Gd(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M6.51551 13.799C6.64205 13.9255 6.813 13.9977 6.99193 14C7.17087 13.9977 7.34182 13.9255 7.46835 13.799C7.59489 13.6725 7.66701 13.5015 7.66935 13.3226V2.31233L11.9326 6.57554C11.9951 6.63887 12.0697 6.68907 12.1519 6.72319C12.2341 6.75731 12.3223 6.77467 12.4113 6.77425C12.5003 6.77467 12.5885 6.75731 12.6707 6.72319C12.7529 6.68907 12.8274 6.63887 12.89 6.57554C13.0168 6.44853 13.0881 6.27635 13.0881 6.09683C13.0881 5.91732 13.0168 5.74514 12.89 5.61812L7.48846 0.216594C7.48274 0.210436 7.4769 0.204374 7.47094 0.198411C7.3439 0.0713707 7.1716 0 6.99193 0C6.81227 0 6.63997 0.0713707 6.51293 0.198411C6.50704 0.204296 6.50128 0.210278 6.49563 0.216354L1.09386 5.61812C0.974201 5.74654 0.909057 5.91639 0.912154 6.09189C0.91525 6.26738 0.986345 6.43483 1.11046 6.55894C1.23457 6.68306 1.40202 6.75415 1.57752 6.75725C1.75302 6.76035 1.92286 6.6952 2.05128 6.57554L6.31451 2.31231V13.3226C6.31685 13.5015 6.38898 13.6725 6.51551 13.799Z",fill:"currentColor"},null,-1)]),16)}Ei.render=Gd;var Ud=({dt:e})=>`
-.p-paginator {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    flex-wrap: wrap;
-    background: ${e("paginator.background")};
-    color: ${e("paginator.color")};
-    padding: ${e("paginator.padding")};
-    border-radius: ${e("paginator.border.radius")};
-    gap: ${e("paginator.gap")};
-}
-
-.p-paginator-content {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    flex-wrap: wrap;
-    gap: ${e("paginator.gap")};
-}
-
-.p-paginator-content-start {
-    margin-inline-end: auto;
-}
-
-.p-paginator-content-end {
-    margin-inline-start: auto;
-}
-
-.p-paginator-page,
-.p-paginator-next,
-.p-paginator-last,
-.p-paginator-first,
-.p-paginator-prev {
-    cursor: pointer;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    line-height: 1;
-    user-select: none;
-    overflow: hidden;
-    position: relative;
-    background: ${e("paginator.nav.button.background")};
-    border: 0 none;
-    color: ${e("paginator.nav.button.color")};
-    min-width: ${e("paginator.nav.button.width")};
-    height: ${e("paginator.nav.button.height")};
-    transition: background ${e("paginator.transition.duration")}, color ${e("paginator.transition.duration")}, outline-color ${e("paginator.transition.duration")}, box-shadow ${e("paginator.transition.duration")};
-    border-radius: ${e("paginator.nav.button.border.radius")};
-    padding: 0;
-    margin: 0;
-}
-
-.p-paginator-page:focus-visible,
-.p-paginator-next:focus-visible,
-.p-paginator-last:focus-visible,
-.p-paginator-first:focus-visible,
-.p-paginator-prev:focus-visible {
-    box-shadow: ${e("paginator.nav.button.focus.ring.shadow")};
-    outline: ${e("paginator.nav.button.focus.ring.width")} ${e("paginator.nav.button.focus.ring.style")} ${e("paginator.nav.button.focus.ring.color")};
-    outline-offset: ${e("paginator.nav.button.focus.ring.offset")};
-}
-
-.p-paginator-page:not(.p-disabled):not(.p-paginator-page-selected):hover,
-.p-paginator-first:not(.p-disabled):hover,
-.p-paginator-prev:not(.p-disabled):hover,
-.p-paginator-next:not(.p-disabled):hover,
-.p-paginator-last:not(.p-disabled):hover {
-    background: ${e("paginator.nav.button.hover.background")};
-    color: ${e("paginator.nav.button.hover.color")};
-}
-
-.p-paginator-page.p-paginator-page-selected {
-    background: ${e("paginator.nav.button.selected.background")};
-    color: ${e("paginator.nav.button.selected.color")};
-}
-
-.p-paginator-current {
-    color: ${e("paginator.current.page.report.color")};
-}
-
-.p-paginator-pages {
-    display: flex;
-    align-items: center;
-    gap: ${e("paginator.gap")};
-}
-
-.p-paginator-jtp-input .p-inputtext {
-    max-width: ${e("paginator.jump.to.page.input.max.width")};
-}
-
-.p-paginator-first:dir(rtl),
-.p-paginator-prev:dir(rtl),
-.p-paginator-next:dir(rtl),
-.p-paginator-last:dir(rtl) {
-    transform: rotate(180deg);
-}
-`;function _t(e){"@babel/helpers - typeof";return _t=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},_t(e)}function _d(e,t,n){return(t=Wd(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Wd(e){var t=Zd(e,"string");return _t(t)=="symbol"?t:t+""}function Zd(e,t){if(_t(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(_t(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var qd={paginator:function(t){var n=t.instance,o=t.key;return["p-paginator p-component",_d({"p-paginator-default":!n.hasBreakpoints()},"p-paginator-".concat(o),n.hasBreakpoints())]},content:"p-paginator-content",contentStart:"p-paginator-content-start",contentEnd:"p-paginator-content-end",first:function(t){var n=t.instance;return["p-paginator-first",{"p-disabled":n.$attrs.disabled}]},firstIcon:"p-paginator-first-icon",prev:function(t){var n=t.instance;return["p-paginator-prev",{"p-disabled":n.$attrs.disabled}]},prevIcon:"p-paginator-prev-icon",next:function(t){var n=t.instance;return["p-paginator-next",{"p-disabled":n.$attrs.disabled}]},nextIcon:"p-paginator-next-icon",last:function(t){var n=t.instance;return["p-paginator-last",{"p-disabled":n.$attrs.disabled}]},lastIcon:"p-paginator-last-icon",pages:"p-paginator-pages",page:function(t){var n=t.props,o=t.pageLink;return["p-paginator-page",{"p-paginator-page-selected":o-1===n.page}]},current:"p-paginator-current",pcRowPerPageDropdown:"p-paginator-rpp-dropdown",pcJumpToPageDropdown:"p-paginator-jtp-dropdown",pcJumpToPageInputText:"p-paginator-jtp-input"},Yd=N.extend({name:"paginator",style:Ud,classes:qd}),Di={name:"AngleDoubleLeftIcon",extends:J};function Jd(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M5.71602 11.164C5.80782 11.2021 5.9063 11.2215 6.00569 11.221C6.20216 11.2301 6.39427 11.1612 6.54025 11.0294C6.68191 10.8875 6.76148 10.6953 6.76148 10.4948C6.76148 10.2943 6.68191 10.1021 6.54025 9.96024L3.51441 6.9344L6.54025 3.90855C6.624 3.76126 6.65587 3.59011 6.63076 3.42254C6.60564 3.25498 6.525 3.10069 6.40175 2.98442C6.2785 2.86815 6.11978 2.79662 5.95104 2.7813C5.78229 2.76598 5.61329 2.80776 5.47112 2.89994L1.97123 6.39983C1.82957 6.54167 1.75 6.73393 1.75 6.9344C1.75 7.13486 1.82957 7.32712 1.97123 7.46896L5.47112 10.9991C5.54096 11.0698 5.62422 11.1259 5.71602 11.164ZM11.0488 10.9689C11.1775 11.1156 11.3585 11.2061 11.5531 11.221C11.7477 11.2061 11.9288 11.1156 12.0574 10.9689C12.1815 10.8302 12.25 10.6506 12.25 10.4645C12.25 10.2785 12.1815 10.0989 12.0574 9.96024L9.03158 6.93439L12.0574 3.90855C12.1248 3.76739 12.1468 3.60881 12.1204 3.45463C12.0939 3.30045 12.0203 3.15826 11.9097 3.04765C11.7991 2.93703 11.6569 2.86343 11.5027 2.83698C11.3486 2.81053 11.19 2.83252 11.0488 2.89994L7.51865 6.36957C7.37699 6.51141 7.29742 6.70367 7.29742 6.90414C7.29742 7.1046 7.37699 7.29686 7.51865 7.4387L11.0488 10.9689Z",fill:"currentColor"},null,-1)]),16)}Di.render=Jd;var Fi={name:"BlankIcon",extends:J};function Xd(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("rect",{width:"1",height:"1",fill:"currentColor","fill-opacity":"0"},null,-1)]),16)}Fi.render=Xd;var Bi={name:"SearchIcon",extends:J};function Qd(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M2.67602 11.0265C3.6661 11.688 4.83011 12.0411 6.02086 12.0411C6.81149 12.0411 7.59438 11.8854 8.32483 11.5828C8.87005 11.357 9.37808 11.0526 9.83317 10.6803L12.9769 13.8241C13.0323 13.8801 13.0983 13.9245 13.171 13.9548C13.2438 13.985 13.3219 14.0003 13.4007 14C13.4795 14.0003 13.5575 13.985 13.6303 13.9548C13.7031 13.9245 13.7691 13.8801 13.8244 13.8241C13.9367 13.7116 13.9998 13.5592 13.9998 13.4003C13.9998 13.2414 13.9367 13.089 13.8244 12.9765L10.6807 9.8328C11.053 9.37773 11.3573 8.86972 11.5831 8.32452C11.8857 7.59408 12.0414 6.81119 12.0414 6.02056C12.0414 4.8298 11.6883 3.66579 11.0268 2.67572C10.3652 1.68564 9.42494 0.913972 8.32483 0.45829C7.22472 0.00260857 6.01418 -0.116618 4.84631 0.115686C3.67844 0.34799 2.60568 0.921393 1.76369 1.76338C0.921698 2.60537 0.348296 3.67813 0.115991 4.84601C-0.116313 6.01388 0.00291375 7.22441 0.458595 8.32452C0.914277 9.42464 1.68595 10.3649 2.67602 11.0265ZM3.35565 2.0158C4.14456 1.48867 5.07206 1.20731 6.02086 1.20731C7.29317 1.20731 8.51338 1.71274 9.41304 2.6124C10.3127 3.51206 10.8181 4.73226 10.8181 6.00457C10.8181 6.95337 10.5368 7.88088 10.0096 8.66978C9.48251 9.45868 8.73328 10.0736 7.85669 10.4367C6.98011 10.7997 6.01554 10.8947 5.08496 10.7096C4.15439 10.5245 3.2996 10.0676 2.62869 9.39674C1.95778 8.72583 1.50089 7.87104 1.31579 6.94046C1.13068 6.00989 1.22568 5.04532 1.58878 4.16874C1.95187 3.29215 2.56675 2.54292 3.35565 2.0158Z",fill:"currentColor"},null,-1)]),16)}Bi.render=Qd;var ec=({dt:e})=>`
-.p-iconfield {
-    position: relative;
-}
-
-.p-inputicon {
-    position: absolute;
-    top: 50%;
-    margin-top: calc(-1 * (${e("icon.size")} / 2));
-    color: ${e("iconfield.icon.color")};
-    line-height: 1;
-    z-index: 1;
-}
-
-.p-iconfield .p-inputicon:first-child {
-    inset-inline-start: ${e("form.field.padding.x")};
-}
-
-.p-iconfield .p-inputicon:last-child {
-    inset-inline-end: ${e("form.field.padding.x")};
-}
-
-.p-iconfield .p-inputtext:not(:first-child),
-.p-iconfield .p-inputwrapper:not(:first-child) .p-inputtext {
-    padding-inline-start: calc((${e("form.field.padding.x")} * 2) + ${e("icon.size")});
-}
-
-.p-iconfield .p-inputtext:not(:last-child) {
-    padding-inline-end: calc((${e("form.field.padding.x")} * 2) + ${e("icon.size")});
-}
-
-.p-iconfield:has(.p-inputfield-sm) .p-inputicon {
-    font-size: ${e("form.field.sm.font.size")};
-    width: ${e("form.field.sm.font.size")};
-    height: ${e("form.field.sm.font.size")};
-    margin-top: calc(-1 * (${e("form.field.sm.font.size")} / 2));
-}
-
-.p-iconfield:has(.p-inputfield-lg) .p-inputicon {
-    font-size: ${e("form.field.lg.font.size")};
-    width: ${e("form.field.lg.font.size")};
-    height: ${e("form.field.lg.font.size")};
-    margin-top: calc(-1 * (${e("form.field.lg.font.size")} / 2));
-}
-`,tc={root:"p-iconfield"},nc=N.extend({name:"iconfield",style:ec,classes:tc}),oc={name:"BaseIconField",extends:U,style:nc,provide:function(){return{$pcIconField:this,$parentInstance:this}}},zi={name:"IconField",extends:oc,inheritAttrs:!1};function rc(e,t,n,o,i,r){return c(),b("div",f({class:e.cx("root")},e.ptmi("root")),[k(e.$slots,"default")],16)}zi.render=rc;var ic={root:"p-inputicon"},ac=N.extend({name:"inputicon",classes:ic}),lc={name:"BaseInputIcon",extends:U,style:ac,props:{class:null},provide:function(){return{$pcInputIcon:this,$parentInstance:this}}},Ai={name:"InputIcon",extends:lc,inheritAttrs:!1,computed:{containerClass:function(){return[this.cx("root"),this.class]}}};function sc(e,t,n,o,i,r){return c(),b("span",f({class:r.containerClass},e.ptmi("root")),[k(e.$slots,"default")],16)}Ai.render=sc;var uc=({dt:e})=>`
-.p-select {
-    display: inline-flex;
-    cursor: pointer;
-    position: relative;
-    user-select: none;
-    background: ${e("select.background")};
-    border: 1px solid ${e("select.border.color")};
-    transition: background ${e("select.transition.duration")}, color ${e("select.transition.duration")}, border-color ${e("select.transition.duration")},
-        outline-color ${e("select.transition.duration")}, box-shadow ${e("select.transition.duration")};
-    border-radius: ${e("select.border.radius")};
-    outline-color: transparent;
-    box-shadow: ${e("select.shadow")};
-}
-
-.p-select:not(.p-disabled):hover {
-    border-color: ${e("select.hover.border.color")};
-}
-
-.p-select:not(.p-disabled).p-focus {
-    border-color: ${e("select.focus.border.color")};
-    box-shadow: ${e("select.focus.ring.shadow")};
-    outline: ${e("select.focus.ring.width")} ${e("select.focus.ring.style")} ${e("select.focus.ring.color")};
-    outline-offset: ${e("select.focus.ring.offset")};
-}
-
-.p-select.p-variant-filled {
-    background: ${e("select.filled.background")};
-}
-
-.p-select.p-variant-filled:not(.p-disabled):hover {
-    background: ${e("select.filled.hover.background")};
-}
-
-.p-select.p-variant-filled:not(.p-disabled).p-focus {
-    background: ${e("select.filled.focus.background")};
-}
-
-.p-select.p-invalid {
-    border-color: ${e("select.invalid.border.color")};
-}
-
-.p-select.p-disabled {
-    opacity: 1;
-    background: ${e("select.disabled.background")};
-}
-
-.p-select-clear-icon {
-    position: absolute;
-    top: 50%;
-    margin-top: -0.5rem;
-    color: ${e("select.clear.icon.color")};
-    inset-inline-end: ${e("select.dropdown.width")};
-}
-
-.p-select-dropdown {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    flex-shrink: 0;
-    background: transparent;
-    color: ${e("select.dropdown.color")};
-    width: ${e("select.dropdown.width")};
-    border-start-end-radius: ${e("select.border.radius")};
-    border-end-end-radius: ${e("select.border.radius")};
-}
-
-.p-select-label {
-    display: block;
-    white-space: nowrap;
-    overflow: hidden;
-    flex: 1 1 auto;
-    width: 1%;
-    padding: ${e("select.padding.y")} ${e("select.padding.x")};
-    text-overflow: ellipsis;
-    cursor: pointer;
-    color: ${e("select.color")};
-    background: transparent;
-    border: 0 none;
-    outline: 0 none;
-}
-
-.p-select-label.p-placeholder {
-    color: ${e("select.placeholder.color")};
-}
-
-.p-select.p-invalid .p-select-label.p-placeholder {
-    color: ${e("select.invalid.placeholder.color")};
-}
-
-.p-select:has(.p-select-clear-icon) .p-select-label {
-    padding-inline-end: calc(1rem + ${e("select.padding.x")});
-}
-
-.p-select.p-disabled .p-select-label {
-    color: ${e("select.disabled.color")};
-}
-
-.p-select-label-empty {
-    overflow: hidden;
-    opacity: 0;
-}
-
-input.p-select-label {
-    cursor: default;
-}
-
-.p-select .p-select-overlay {
-    min-width: 100%;
-}
-
-.p-select-overlay {
-    position: absolute;
-    top: 0;
-    left: 0;
-    background: ${e("select.overlay.background")};
-    color: ${e("select.overlay.color")};
-    border: 1px solid ${e("select.overlay.border.color")};
-    border-radius: ${e("select.overlay.border.radius")};
-    box-shadow: ${e("select.overlay.shadow")};
-}
-
-.p-select-header {
-    padding: ${e("select.list.header.padding")};
-}
-
-.p-select-filter {
-    width: 100%;
-}
-
-.p-select-list-container {
-    overflow: auto;
-}
-
-.p-select-option-group {
-    cursor: auto;
-    margin: 0;
-    padding: ${e("select.option.group.padding")};
-    background: ${e("select.option.group.background")};
-    color: ${e("select.option.group.color")};
-    font-weight: ${e("select.option.group.font.weight")};
-}
-
-.p-select-list {
-    margin: 0;
-    padding: 0;
-    list-style-type: none;
-    padding: ${e("select.list.padding")};
-    gap: ${e("select.list.gap")};
-    display: flex;
-    flex-direction: column;
-}
-
-.p-select-option {
-    cursor: pointer;
-    font-weight: normal;
-    white-space: nowrap;
-    position: relative;
-    overflow: hidden;
-    display: flex;
-    align-items: center;
-    padding: ${e("select.option.padding")};
-    border: 0 none;
-    color: ${e("select.option.color")};
-    background: transparent;
-    transition: background ${e("select.transition.duration")}, color ${e("select.transition.duration")}, border-color ${e("select.transition.duration")},
-            box-shadow ${e("select.transition.duration")}, outline-color ${e("select.transition.duration")};
-    border-radius: ${e("select.option.border.radius")};
-}
-
-.p-select-option:not(.p-select-option-selected):not(.p-disabled).p-focus {
-    background: ${e("select.option.focus.background")};
-    color: ${e("select.option.focus.color")};
-}
-
-.p-select-option.p-select-option-selected {
-    background: ${e("select.option.selected.background")};
-    color: ${e("select.option.selected.color")};
-}
-
-.p-select-option.p-select-option-selected.p-focus {
-    background: ${e("select.option.selected.focus.background")};
-    color: ${e("select.option.selected.focus.color")};
-}
-
-.p-select-option-blank-icon {
-    flex-shrink: 0;
-}
-
-.p-select-option-check-icon {
-    position: relative;
-    flex-shrink: 0;
-    margin-inline-start: ${e("select.checkmark.gutter.start")};
-    margin-inline-end: ${e("select.checkmark.gutter.end")};
-    color: ${e("select.checkmark.color")};
-}
-
-.p-select-empty-message {
-    padding: ${e("select.empty.message.padding")};
-}
-
-.p-select-fluid {
-    display: flex;
-    width: 100%;
-}
-
-.p-select-sm .p-select-label {
-    font-size: ${e("select.sm.font.size")};
-    padding-block: ${e("select.sm.padding.y")};
-    padding-inline: ${e("select.sm.padding.x")};
-}
-
-.p-select-sm .p-select-dropdown .p-icon {
-    font-size: ${e("select.sm.font.size")};
-    width: ${e("select.sm.font.size")};
-    height: ${e("select.sm.font.size")};
-}
-
-.p-select-lg .p-select-label {
-    font-size: ${e("select.lg.font.size")};
-    padding-block: ${e("select.lg.padding.y")};
-    padding-inline: ${e("select.lg.padding.x")};
-}
-
-.p-select-lg .p-select-dropdown .p-icon {
-    font-size: ${e("select.lg.font.size")};
-    width: ${e("select.lg.font.size")};
-    height: ${e("select.lg.font.size")};
-}
-`,dc={root:function(t){var n=t.instance,o=t.props,i=t.state;return["p-select p-component p-inputwrapper",{"p-disabled":o.disabled,"p-invalid":n.$invalid,"p-variant-filled":n.$variant==="filled","p-focus":i.focused,"p-inputwrapper-filled":n.$filled,"p-inputwrapper-focus":i.focused||i.overlayVisible,"p-select-open":i.overlayVisible,"p-select-fluid":n.$fluid,"p-select-sm p-inputfield-sm":o.size==="small","p-select-lg p-inputfield-lg":o.size==="large"}]},label:function(t){var n=t.instance,o=t.props;return["p-select-label",{"p-placeholder":!o.editable&&n.label===o.placeholder,"p-select-label-empty":!o.editable&&!n.$slots.value&&(n.label==="p-emptylabel"||n.label.length===0)}]},clearIcon:"p-select-clear-icon",dropdown:"p-select-dropdown",loadingicon:"p-select-loading-icon",dropdownIcon:"p-select-dropdown-icon",overlay:"p-select-overlay p-component",header:"p-select-header",pcFilter:"p-select-filter",listContainer:"p-select-list-container",list:"p-select-list",optionGroup:"p-select-option-group",optionGroupLabel:"p-select-option-group-label",option:function(t){var n=t.instance,o=t.props,i=t.state,r=t.option,a=t.focusedOption;return["p-select-option",{"p-select-option-selected":n.isSelected(r)&&o.highlightOnSelect,"p-focus":i.focusedOptionIndex===a,"p-disabled":n.isOptionDisabled(r)}]},optionLabel:"p-select-option-label",optionCheckIcon:"p-select-option-check-icon",optionBlankIcon:"p-select-option-blank-icon",emptyMessage:"p-select-empty-message"},cc=N.extend({name:"select",style:uc,classes:dc}),pc={name:"BaseSelect",extends:it,props:{options:Array,optionLabel:[String,Function],optionValue:[String,Function],optionDisabled:[String,Function],optionGroupLabel:[String,Function],optionGroupChildren:[String,Function],scrollHeight:{type:String,default:"14rem"},filter:Boolean,filterPlaceholder:String,filterLocale:String,filterMatchMode:{type:String,default:"contains"},filterFields:{type:Array,default:null},editable:Boolean,placeholder:{type:String,default:null},dataKey:null,showClear:{type:Boolean,default:!1},inputId:{type:String,default:null},inputClass:{type:[String,Object],default:null},inputStyle:{type:Object,default:null},labelId:{type:String,default:null},labelClass:{type:[String,Object],default:null},labelStyle:{type:Object,default:null},panelClass:{type:[String,Object],default:null},overlayStyle:{type:Object,default:null},overlayClass:{type:[String,Object],default:null},panelStyle:{type:Object,default:null},appendTo:{type:[String,Object],default:"body"},loading:{type:Boolean,default:!1},clearIcon:{type:String,default:void 0},dropdownIcon:{type:String,default:void 0},filterIcon:{type:String,default:void 0},loadingIcon:{type:String,default:void 0},resetFilterOnHide:{type:Boolean,default:!1},resetFilterOnClear:{type:Boolean,default:!1},virtualScrollerOptions:{type:Object,default:null},autoOptionFocus:{type:Boolean,default:!1},autoFilterFocus:{type:Boolean,default:!1},selectOnFocus:{type:Boolean,default:!1},focusOnHover:{type:Boolean,default:!0},highlightOnSelect:{type:Boolean,default:!0},checkmark:{type:Boolean,default:!1},filterMessage:{type:String,default:null},selectionMessage:{type:String,default:null},emptySelectionMessage:{type:String,default:null},emptyFilterMessage:{type:String,default:null},emptyMessage:{type:String,default:null},tabindex:{type:Number,default:0},ariaLabel:{type:String,default:null},ariaLabelledby:{type:String,default:null}},style:cc,provide:function(){return{$pcSelect:this,$parentInstance:this}}};function Wt(e){"@babel/helpers - typeof";return Wt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Wt(e)}function fc(e){return gc(e)||bc(e)||mc(e)||hc()}function hc(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function mc(e,t){if(e){if(typeof e=="string")return po(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?po(e,t):void 0}}function bc(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function gc(e){if(Array.isArray(e))return po(e)}function po(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function Sr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function $r(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Sr(Object(n),!0).forEach(function(o){Qe(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Sr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Qe(e,t,n){return(t=yc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function yc(e){var t=vc(e,"string");return Wt(t)=="symbol"?t:t+""}function vc(e,t){if(Wt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Wt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Un={name:"Select",extends:pc,inheritAttrs:!1,emits:["change","focus","blur","before-show","before-hide","show","hide","filter"],outsideClickListener:null,scrollHandler:null,resizeListener:null,labelClickListener:null,matchMediaOrientationListener:null,overlay:null,list:null,virtualScroller:null,searchTimeout:null,searchValue:null,isModelValueChanged:!1,data:function(){return{clicked:!1,focused:!1,focusedOptionIndex:-1,filterValue:null,overlayVisible:!1,queryOrientation:null}},watch:{modelValue:function(){this.isModelValueChanged=!0},options:function(){this.autoUpdateModel()}},mounted:function(){this.autoUpdateModel(),this.bindLabelClickListener(),this.bindMatchMediaOrientationListener()},updated:function(){this.overlayVisible&&this.isModelValueChanged&&this.scrollInView(this.findSelectedOptionIndex()),this.isModelValueChanged=!1},beforeUnmount:function(){this.unbindOutsideClickListener(),this.unbindResizeListener(),this.unbindLabelClickListener(),this.unbindMatchMediaOrientationListener(),this.scrollHandler&&(this.scrollHandler.destroy(),this.scrollHandler=null),this.overlay&&(me.clear(this.overlay),this.overlay=null)},methods:{getOptionIndex:function(t,n){return this.virtualScrollerDisabled?t:n&&n(t).index},getOptionLabel:function(t){return this.optionLabel?H(t,this.optionLabel):t},getOptionValue:function(t){return this.optionValue?H(t,this.optionValue):t},getOptionRenderKey:function(t,n){return(this.dataKey?H(t,this.dataKey):this.getOptionLabel(t))+"_"+n},getPTItemOptions:function(t,n,o,i){return this.ptm(i,{context:{option:t,index:o,selected:this.isSelected(t),focused:this.focusedOptionIndex===this.getOptionIndex(o,n),disabled:this.isOptionDisabled(t)}})},isOptionDisabled:function(t){return this.optionDisabled?H(t,this.optionDisabled):!1},isOptionGroup:function(t){return this.optionGroupLabel&&t.optionGroup&&t.group},getOptionGroupLabel:function(t){return H(t,this.optionGroupLabel)},getOptionGroupChildren:function(t){return H(t,this.optionGroupChildren)},getAriaPosInset:function(t){var n=this;return(this.optionGroupLabel?t-this.visibleOptions.slice(0,t).filter(function(o){return n.isOptionGroup(o)}).length:t)+1},show:function(t){this.$emit("before-show"),this.overlayVisible=!0,this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():this.editable?-1:this.findSelectedOptionIndex(),t&&te(this.$refs.focusInput)},hide:function(t){var n=this,o=function(){n.$emit("before-hide"),n.overlayVisible=!1,n.clicked=!1,n.focusedOptionIndex=-1,n.searchValue="",n.resetFilterOnHide&&(n.filterValue=null),t&&te(n.$refs.focusInput)};setTimeout(function(){o()},0)},onFocus:function(t){this.disabled||(this.focused=!0,this.overlayVisible&&(this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():this.editable?-1:this.findSelectedOptionIndex(),this.scrollInView(this.focusedOptionIndex)),this.$emit("focus",t))},onBlur:function(t){var n=this;setTimeout(function(){var o,i;n.focused=!1,n.focusedOptionIndex=-1,n.searchValue="",n.$emit("blur",t),(o=(i=n.formField).onBlur)===null||o===void 0||o.call(i,t)},100)},onKeyDown:function(t){if(this.disabled||il()){t.preventDefault();return}var n=t.metaKey||t.ctrlKey;switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t,this.editable);break;case"ArrowLeft":case"ArrowRight":this.onArrowLeftKey(t,this.editable);break;case"Home":this.onHomeKey(t,this.editable);break;case"End":this.onEndKey(t,this.editable);break;case"PageDown":this.onPageDownKey(t);break;case"PageUp":this.onPageUpKey(t);break;case"Space":this.onSpaceKey(t,this.editable);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t);break;case"Backspace":this.onBackspaceKey(t,this.editable);break;case"ShiftLeft":case"ShiftRight":break;default:!n&&bi(t.key)&&(!this.overlayVisible&&this.show(),!this.editable&&this.searchOptions(t,t.key));break}this.clicked=!1},onEditableInput:function(t){var n=t.target.value;this.searchValue="";var o=this.searchOptions(t,n);!o&&(this.focusedOptionIndex=-1),this.updateModel(t,n),!this.overlayVisible&&A(n)&&this.show()},onContainerClick:function(t){this.disabled||this.loading||t.target.tagName==="INPUT"||t.target.getAttribute("data-pc-section")==="clearicon"||t.target.closest('[data-pc-section="clearicon"]')||((!this.overlay||!this.overlay.contains(t.target))&&(this.overlayVisible?this.hide(!0):this.show(!0)),this.clicked=!0)},onClearClick:function(t){this.updateModel(t,null),this.resetFilterOnClear&&(this.filterValue=null)},onFirstHiddenFocus:function(t){var n=t.relatedTarget===this.$refs.focusInput?et(this.overlay,':not([data-p-hidden-focusable="true"])'):this.$refs.focusInput;te(n)},onLastHiddenFocus:function(t){var n=t.relatedTarget===this.$refs.focusInput?ci(this.overlay,':not([data-p-hidden-focusable="true"])'):this.$refs.focusInput;te(n)},onOptionSelect:function(t,n){var o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,i=this.getOptionValue(n);this.updateModel(t,i),o&&this.hide(!0)},onOptionMouseMove:function(t,n){this.focusOnHover&&this.changeFocusedOptionIndex(t,n)},onFilterChange:function(t){var n=t.target.value;this.filterValue=n,this.focusedOptionIndex=-1,this.$emit("filter",{originalEvent:t,value:n}),!this.virtualScrollerDisabled&&this.virtualScroller.scrollToIndex(0)},onFilterKeyDown:function(t){if(!t.isComposing)switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t,!0);break;case"ArrowLeft":case"ArrowRight":this.onArrowLeftKey(t,!0);break;case"Home":this.onHomeKey(t,!0);break;case"End":this.onEndKey(t,!0);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t,!0);break}},onFilterBlur:function(){this.focusedOptionIndex=-1},onFilterUpdated:function(){this.overlayVisible&&this.alignOverlay()},onOverlayClick:function(t){Ge.emit("overlay-click",{originalEvent:t,target:this.$el})},onOverlayKeyDown:function(t){switch(t.code){case"Escape":this.onEscapeKey(t);break}},onArrowDownKey:function(t){if(!this.overlayVisible)this.show(),this.editable&&this.changeFocusedOptionIndex(t,this.findSelectedOptionIndex());else{var n=this.focusedOptionIndex!==-1?this.findNextOptionIndex(this.focusedOptionIndex):this.clicked?this.findFirstOptionIndex():this.findFirstFocusedOptionIndex();this.changeFocusedOptionIndex(t,n)}t.preventDefault()},onArrowUpKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(t.altKey&&!n)this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(),t.preventDefault();else{var o=this.focusedOptionIndex!==-1?this.findPrevOptionIndex(this.focusedOptionIndex):this.clicked?this.findLastOptionIndex():this.findLastFocusedOptionIndex();this.changeFocusedOptionIndex(t,o),!this.overlayVisible&&this.show(),t.preventDefault()}},onArrowLeftKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;n&&(this.focusedOptionIndex=-1)},onHomeKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(n){var o=t.currentTarget;t.shiftKey?o.setSelectionRange(0,t.target.selectionStart):(o.setSelectionRange(0,0),this.focusedOptionIndex=-1)}else this.changeFocusedOptionIndex(t,this.findFirstOptionIndex()),!this.overlayVisible&&this.show();t.preventDefault()},onEndKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(n){var o=t.currentTarget;if(t.shiftKey)o.setSelectionRange(t.target.selectionStart,o.value.length);else{var i=o.value.length;o.setSelectionRange(i,i),this.focusedOptionIndex=-1}}else this.changeFocusedOptionIndex(t,this.findLastOptionIndex()),!this.overlayVisible&&this.show();t.preventDefault()},onPageUpKey:function(t){this.scrollInView(0),t.preventDefault()},onPageDownKey:function(t){this.scrollInView(this.visibleOptions.length-1),t.preventDefault()},onEnterKey:function(t){this.overlayVisible?(this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.hide()):(this.focusedOptionIndex=-1,this.onArrowDownKey(t)),t.preventDefault()},onSpaceKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;!n&&this.onEnterKey(t)},onEscapeKey:function(t){this.overlayVisible&&this.hide(!0),t.preventDefault(),t.stopPropagation()},onTabKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;n||(this.overlayVisible&&this.hasFocusableElements()?(te(this.$refs.firstHiddenFocusableElementOnOverlay),t.preventDefault()):(this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(this.filter)))},onBackspaceKey:function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;n&&!this.overlayVisible&&this.show()},onOverlayEnter:function(t){var n=this;me.set("overlay",t,this.$primevue.config.zIndex.overlay),pt(t,{position:"absolute",top:"0"}),this.alignOverlay(),this.scrollInView(),setTimeout(function(){n.autoFilterFocus&&n.filter&&te(n.$refs.filterInput.$el),n.autoUpdateModel()},1)},onOverlayAfterEnter:function(){this.bindOutsideClickListener(),this.bindScrollListener(),this.bindResizeListener(),this.$emit("show")},onOverlayLeave:function(){var t=this;this.unbindOutsideClickListener(),this.unbindScrollListener(),this.unbindResizeListener(),this.autoFilterFocus&&this.filter&&!this.editable&&this.$nextTick(function(){t.$refs.filterInput&&te(t.$refs.filterInput.$el)}),this.$emit("hide"),this.overlay=null},onOverlayAfterLeave:function(t){me.clear(t)},alignOverlay:function(){this.appendTo==="self"?ui(this.overlay,this.$el):this.overlay&&(this.overlay.style.minWidth=ve(this.$el)+"px",ko(this.overlay,this.$el))},bindOutsideClickListener:function(){var t=this;this.outsideClickListener||(this.outsideClickListener=function(n){var o=n.composedPath();t.overlayVisible&&t.overlay&&!o.includes(t.$el)&&!o.includes(t.overlay)&&t.hide()},document.addEventListener("click",this.outsideClickListener,!0))},unbindOutsideClickListener:function(){this.outsideClickListener&&(document.removeEventListener("click",this.outsideClickListener,!0),this.outsideClickListener=null)},bindScrollListener:function(){var t=this;this.scrollHandler||(this.scrollHandler=new Ro(this.$refs.container,function(){t.overlayVisible&&t.hide()})),this.scrollHandler.bindScrollListener()},unbindScrollListener:function(){this.scrollHandler&&this.scrollHandler.unbindScrollListener()},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=function(){t.overlayVisible&&!Kn()&&t.hide()},window.addEventListener("resize",this.resizeListener))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),this.resizeListener=null)},bindLabelClickListener:function(){var t=this;if(!this.editable&&!this.labelClickListener){var n=document.querySelector('label[for="'.concat(this.labelId,'"]'));n&&Mn(n)&&(this.labelClickListener=function(){te(t.$refs.focusInput)},n.addEventListener("click",this.labelClickListener))}},unbindLabelClickListener:function(){if(this.labelClickListener){var t=document.querySelector('label[for="'.concat(this.labelId,'"]'));t&&Mn(t)&&t.removeEventListener("click",this.labelClickListener)}},bindMatchMediaOrientationListener:function(){var t=this;if(!this.matchMediaOrientationListener){var n=matchMedia("(orientation: portrait)");this.queryOrientation=n,this.matchMediaOrientationListener=function(){t.alignOverlay()},this.queryOrientation.addEventListener("change",this.matchMediaOrientationListener)}},unbindMatchMediaOrientationListener:function(){this.matchMediaOrientationListener&&(this.queryOrientation.removeEventListener("change",this.matchMediaOrientationListener),this.queryOrientation=null,this.matchMediaOrientationListener=null)},hasFocusableElements:function(){return Po(this.overlay,':not([data-p-hidden-focusable="true"])').length>0},isOptionExactMatched:function(t){var n;return this.isValidOption(t)&&typeof this.getOptionLabel(t)=="string"&&((n=this.getOptionLabel(t))===null||n===void 0?void 0:n.toLocaleLowerCase(this.filterLocale))==this.searchValue.toLocaleLowerCase(this.filterLocale)},isOptionStartsWith:function(t){var n;return this.isValidOption(t)&&typeof this.getOptionLabel(t)=="string"&&((n=this.getOptionLabel(t))===null||n===void 0?void 0:n.toLocaleLowerCase(this.filterLocale).startsWith(this.searchValue.toLocaleLowerCase(this.filterLocale)))},isValidOption:function(t){return A(t)&&!(this.isOptionDisabled(t)||this.isOptionGroup(t))},isValidSelectedOption:function(t){return this.isValidOption(t)&&this.isSelected(t)},isSelected:function(t){return Ye(this.d_value,this.getOptionValue(t),this.equalityKey)},findFirstOptionIndex:function(){var t=this;return this.visibleOptions.findIndex(function(n){return t.isValidOption(n)})},findLastOptionIndex:function(){var t=this;return ot(this.visibleOptions,function(n){return t.isValidOption(n)})},findNextOptionIndex:function(t){var n=this,o=t<this.visibleOptions.length-1?this.visibleOptions.slice(t+1).findIndex(function(i){return n.isValidOption(i)}):-1;return o>-1?o+t+1:t},findPrevOptionIndex:function(t){var n=this,o=t>0?ot(this.visibleOptions.slice(0,t),function(i){return n.isValidOption(i)}):-1;return o>-1?o:t},findSelectedOptionIndex:function(){var t=this;return this.$filled?this.visibleOptions.findIndex(function(n){return t.isValidSelectedOption(n)}):-1},findFirstFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findFirstOptionIndex():t},findLastFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findLastOptionIndex():t},searchOptions:function(t,n){var o=this;this.searchValue=(this.searchValue||"")+n;var i=-1,r=!1;return A(this.searchValue)&&(i=this.visibleOptions.findIndex(function(a){return o.isOptionExactMatched(a)}),i===-1&&(i=this.visibleOptions.findIndex(function(a){return o.isOptionStartsWith(a)})),i!==-1&&(r=!0),i===-1&&this.focusedOptionIndex===-1&&(i=this.findFirstFocusedOptionIndex()),i!==-1&&this.changeFocusedOptionIndex(t,i)),this.searchTimeout&&clearTimeout(this.searchTimeout),this.searchTimeout=setTimeout(function(){o.searchValue="",o.searchTimeout=null},500),r},changeFocusedOptionIndex:function(t,n){this.focusedOptionIndex!==n&&(this.focusedOptionIndex=n,this.scrollInView(),this.selectOnFocus&&this.onOptionSelect(t,this.visibleOptions[n],!1))},scrollInView:function(){var t=this,n=arguments.length>0&&arguments[0]!==void 0?arguments[0]:-1;this.$nextTick(function(){var o=n!==-1?"".concat(t.$id,"_").concat(n):t.focusedOptionId,i=xe(t.list,'li[id="'.concat(o,'"]'));i?i.scrollIntoView&&i.scrollIntoView({block:"nearest",inline:"nearest"}):t.virtualScrollerDisabled||t.virtualScroller&&t.virtualScroller.scrollToIndex(n!==-1?n:t.focusedOptionIndex)})},autoUpdateModel:function(){this.autoOptionFocus&&(this.focusedOptionIndex=this.findFirstFocusedOptionIndex()),this.selectOnFocus&&this.autoOptionFocus&&!this.$filled&&this.onOptionSelect(null,this.visibleOptions[this.focusedOptionIndex],!1)},updateModel:function(t,n){this.writeValue(n,t),this.$emit("change",{originalEvent:t,value:n})},flatOptions:function(t){var n=this;return(t||[]).reduce(function(o,i,r){o.push({optionGroup:i,group:!0,index:r});var a=n.getOptionGroupChildren(i);return a&&a.forEach(function(l){return o.push(l)}),o},[])},overlayRef:function(t){this.overlay=t},listRef:function(t,n){this.list=t,n&&n(t)},virtualScrollerRef:function(t){this.virtualScroller=t}},computed:{visibleOptions:function(){var t=this,n=this.optionGroupLabel?this.flatOptions(this.options):this.options||[];if(this.filterValue){var o=co.filter(n,this.searchFields,this.filterValue,this.filterMatchMode,this.filterLocale);if(this.optionGroupLabel){var i=this.options||[],r=[];return i.forEach(function(a){var l=t.getOptionGroupChildren(a),s=l.filter(function(u){return o.includes(u)});s.length>0&&r.push($r($r({},a),{},Qe({},typeof t.optionGroupChildren=="string"?t.optionGroupChildren:"items",fc(s))))}),this.flatOptions(r)}return o}return n},hasSelectedOption:function(){return this.$filled},label:function(){var t=this.findSelectedOptionIndex();return t!==-1?this.getOptionLabel(this.visibleOptions[t]):this.placeholder||"p-emptylabel"},editableInputValue:function(){var t=this.findSelectedOptionIndex();return t!==-1?this.getOptionLabel(this.visibleOptions[t]):this.d_value||""},equalityKey:function(){return this.optionValue?null:this.dataKey},searchFields:function(){return this.filterFields||[this.optionLabel]},filterResultMessageText:function(){return A(this.visibleOptions)?this.filterMessageText.replaceAll("{0}",this.visibleOptions.length):this.emptyFilterMessageText},filterMessageText:function(){return this.filterMessage||this.$primevue.config.locale.searchMessage||""},emptyFilterMessageText:function(){return this.emptyFilterMessage||this.$primevue.config.locale.emptySearchMessage||this.$primevue.config.locale.emptyFilterMessage||""},emptyMessageText:function(){return this.emptyMessage||this.$primevue.config.locale.emptyMessage||""},selectionMessageText:function(){return this.selectionMessage||this.$primevue.config.locale.selectionMessage||""},emptySelectionMessageText:function(){return this.emptySelectionMessage||this.$primevue.config.locale.emptySelectionMessage||""},selectedMessageText:function(){return this.$filled?this.selectionMessageText.replaceAll("{0}","1"):this.emptySelectionMessageText},focusedOptionId:function(){return this.focusedOptionIndex!==-1?"".concat(this.$id,"_").concat(this.focusedOptionIndex):null},ariaSetSize:function(){var t=this;return this.visibleOptions.filter(function(n){return!t.isOptionGroup(n)}).length},isClearIconVisible:function(){return this.showClear&&this.d_value!=null&&A(this.options)},virtualScrollerDisabled:function(){return!this.virtualScrollerOptions},containerDataP:function(){return re(Qe({invalid:this.$invalid,disabled:this.disabled,focus:this.focused,fluid:this.$fluid,filled:this.$variant==="filled"},this.size,this.size))},labelDataP:function(){return re(Qe(Qe({placeholder:!this.editable&&this.label===this.placeholder,clearable:this.showClear,disabled:this.disabled,editable:this.editable},this.size,this.size),"empty",!this.editable&&!this.$slots.value&&(this.label==="p-emptylabel"||this.label.length===0)))},dropdownIconDataP:function(){return re(Qe({},this.size,this.size))},overlayDataP:function(){return re(Qe({},"portal-"+this.appendTo,"portal-"+this.appendTo))}},directives:{ripple:Re},components:{InputText:Hn,VirtualScroller:Gn,Portal:gt,InputIcon:Ai,IconField:zi,TimesIcon:yn,ChevronDownIcon:vn,SpinnerIcon:bt,SearchIcon:Bi,CheckIcon:qe,BlankIcon:Fi}},wc=["id","data-p"],Cc=["name","id","value","placeholder","tabindex","disabled","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid","data-p"],Sc=["name","id","tabindex","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid","aria-disabled","data-p"],$c=["data-p"],kc=["id"],Ic=["id"],Pc=["id","aria-label","aria-selected","aria-disabled","aria-setsize","aria-posinset","onMousedown","onMousemove","data-p-selected","data-p-focused","data-p-disabled"];function Oc(e,t,n,o,i,r){var a=T("SpinnerIcon"),l=T("InputText"),s=T("SearchIcon"),u=T("InputIcon"),d=T("IconField"),p=T("CheckIcon"),h=T("BlankIcon"),m=T("VirtualScroller"),w=T("Portal"),$=ke("ripple");return c(),b("div",f({ref:"container",id:e.$id,class:e.cx("root"),onClick:t[11]||(t[11]=function(){return r.onContainerClick&&r.onContainerClick.apply(r,arguments)}),"data-p":r.containerDataP},e.ptmi("root")),[e.editable?(c(),b("input",f({key:0,ref:"focusInput",name:e.name,id:e.labelId||e.inputId,type:"text",class:[e.cx("label"),e.inputClass,e.labelClass],style:[e.inputStyle,e.labelStyle],value:r.editableInputValue,placeholder:e.placeholder,tabindex:e.disabled?-1:e.tabindex,disabled:e.disabled,autocomplete:"off",role:"combobox","aria-label":e.ariaLabel,"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-expanded":i.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":i.focused?r.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,onFocus:t[0]||(t[0]=function(){return r.onFocus&&r.onFocus.apply(r,arguments)}),onBlur:t[1]||(t[1]=function(){return r.onBlur&&r.onBlur.apply(r,arguments)}),onKeydown:t[2]||(t[2]=function(){return r.onKeyDown&&r.onKeyDown.apply(r,arguments)}),onInput:t[3]||(t[3]=function(){return r.onEditableInput&&r.onEditableInput.apply(r,arguments)}),"data-p":r.labelDataP},e.ptm("label")),null,16,Cc)):(c(),b("span",f({key:1,ref:"focusInput",name:e.name,id:e.labelId||e.inputId,class:[e.cx("label"),e.inputClass,e.labelClass],style:[e.inputStyle,e.labelStyle],tabindex:e.disabled?-1:e.tabindex,role:"combobox","aria-label":e.ariaLabel||(r.label==="p-emptylabel"?void 0:r.label),"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-expanded":i.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":i.focused?r.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,"aria-disabled":e.disabled,onFocus:t[4]||(t[4]=function(){return r.onFocus&&r.onFocus.apply(r,arguments)}),onBlur:t[5]||(t[5]=function(){return r.onBlur&&r.onBlur.apply(r,arguments)}),onKeydown:t[6]||(t[6]=function(){return r.onKeyDown&&r.onKeyDown.apply(r,arguments)}),"data-p":r.labelDataP},e.ptm("label")),[k(e.$slots,"value",{value:e.d_value,placeholder:e.placeholder},function(){var v;return[Ee(Y(r.label==="p-emptylabel"?" ":(v=r.label)!==null&&v!==void 0?v:"empty"),1)]})],16,Sc)),r.isClearIconVisible?k(e.$slots,"clearicon",{key:2,class:j(e.cx("clearIcon")),clearCallback:r.onClearClick},function(){return[(c(),y(M(e.clearIcon?"i":"TimesIcon"),f({ref:"clearIcon",class:[e.cx("clearIcon"),e.clearIcon],onClick:r.onClearClick},e.ptm("clearIcon"),{"data-pc-section":"clearicon"}),null,16,["class","onClick"]))]}):C("",!0),R("div",f({class:e.cx("dropdown")},e.ptm("dropdown")),[e.loading?k(e.$slots,"loadingicon",{key:0,class:j(e.cx("loadingIcon"))},function(){return[e.loadingIcon?(c(),b("span",f({key:0,class:[e.cx("loadingIcon"),"pi-spin",e.loadingIcon],"aria-hidden":"true"},e.ptm("loadingIcon")),null,16)):(c(),y(a,f({key:1,class:e.cx("loadingIcon"),spin:"","aria-hidden":"true"},e.ptm("loadingIcon")),null,16,["class"]))]}):k(e.$slots,"dropdownicon",{key:1,class:j(e.cx("dropdownIcon"))},function(){return[(c(),y(M(e.dropdownIcon?"span":"ChevronDownIcon"),f({class:[e.cx("dropdownIcon"),e.dropdownIcon],"aria-hidden":"true","data-p":r.dropdownIconDataP},e.ptm("dropdownIcon")),null,16,["class","data-p"]))]})],16),ne(w,{appendTo:e.appendTo},{default:E(function(){return[ne(zn,f({name:"p-connected-overlay",onEnter:r.onOverlayEnter,onAfterEnter:r.onOverlayAfterEnter,onLeave:r.onOverlayLeave,onAfterLeave:r.onOverlayAfterLeave},e.ptm("transition")),{default:E(function(){return[i.overlayVisible?(c(),b("div",f({key:0,ref:r.overlayRef,class:[e.cx("overlay"),e.panelClass,e.overlayClass],style:[e.panelStyle,e.overlayStyle],onClick:t[9]||(t[9]=function(){return r.onOverlayClick&&r.onOverlayClick.apply(r,arguments)}),onKeydown:t[10]||(t[10]=function(){return r.onOverlayKeyDown&&r.onOverlayKeyDown.apply(r,arguments)}),"data-p":r.overlayDataP},e.ptm("overlay")),[R("span",f({ref:"firstHiddenFocusableElementOnOverlay",role:"presentation","aria-hidden":"true",class:"p-hidden-accessible p-hidden-focusable",tabindex:0,onFocus:t[7]||(t[7]=function(){return r.onFirstHiddenFocus&&r.onFirstHiddenFocus.apply(r,arguments)})},e.ptm("hiddenFirstFocusableEl"),{"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0}),null,16),k(e.$slots,"header",{value:e.d_value,options:r.visibleOptions}),e.filter?(c(),b("div",f({key:0,class:e.cx("header")},e.ptm("header")),[ne(d,{unstyled:e.unstyled,pt:e.ptm("pcFilterContainer")},{default:E(function(){return[ne(l,{ref:"filterInput",type:"text",value:i.filterValue,onVnodeMounted:r.onFilterUpdated,onVnodeUpdated:r.onFilterUpdated,class:j(e.cx("pcFilter")),placeholder:e.filterPlaceholder,variant:e.variant,unstyled:e.unstyled,role:"searchbox",autocomplete:"off","aria-owns":e.$id+"_list","aria-activedescendant":r.focusedOptionId,onKeydown:r.onFilterKeyDown,onBlur:r.onFilterBlur,onInput:r.onFilterChange,pt:e.ptm("pcFilter"),formControl:{novalidate:!0}},null,8,["value","onVnodeMounted","onVnodeUpdated","class","placeholder","variant","unstyled","aria-owns","aria-activedescendant","onKeydown","onBlur","onInput","pt"]),ne(u,{unstyled:e.unstyled,pt:e.ptm("pcFilterIconContainer")},{default:E(function(){return[k(e.$slots,"filtericon",{},function(){return[e.filterIcon?(c(),b("span",f({key:0,class:e.filterIcon},e.ptm("filterIcon")),null,16)):(c(),y(s,mt(f({key:1},e.ptm("filterIcon"))),null,16))]})]}),_:3},8,["unstyled","pt"])]}),_:3},8,["unstyled","pt"]),R("span",f({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenFilterResult"),{"data-p-hidden-accessible":!0}),Y(r.filterResultMessageText),17)],16)):C("",!0),R("div",f({class:e.cx("listContainer"),style:{"max-height":r.virtualScrollerDisabled?e.scrollHeight:""}},e.ptm("listContainer")),[ne(m,f({ref:r.virtualScrollerRef},e.virtualScrollerOptions,{items:r.visibleOptions,style:{height:e.scrollHeight},tabindex:-1,disabled:r.virtualScrollerDisabled,pt:e.ptm("virtualScroller")}),De({content:E(function(v){var I=v.styleClass,P=v.contentRef,L=v.items,g=v.getItemOptions,F=v.contentStyle,G=v.itemSize;return[R("ul",f({ref:function(W){return r.listRef(W,P)},id:e.$id+"_list",class:[e.cx("list"),I],style:F,role:"listbox"},e.ptm("list")),[(c(!0),b(K,null,ue(L,function(V,W){return c(),b(K,{key:r.getOptionRenderKey(V,r.getOptionIndex(W,g))},[r.isOptionGroup(V)?(c(),b("li",f({key:0,id:e.$id+"_"+r.getOptionIndex(W,g),style:{height:G?G+"px":void 0},class:e.cx("optionGroup"),role:"option",ref_for:!0},e.ptm("optionGroup")),[k(e.$slots,"optiongroup",{option:V.optionGroup,index:r.getOptionIndex(W,g)},function(){return[R("span",f({class:e.cx("optionGroupLabel"),ref_for:!0},e.ptm("optionGroupLabel")),Y(r.getOptionGroupLabel(V.optionGroup)),17)]})],16,Ic)):Ie((c(),b("li",f({key:1,id:e.$id+"_"+r.getOptionIndex(W,g),class:e.cx("option",{option:V,focusedOption:r.getOptionIndex(W,g)}),style:{height:G?G+"px":void 0},role:"option","aria-label":r.getOptionLabel(V),"aria-selected":r.isSelected(V),"aria-disabled":r.isOptionDisabled(V),"aria-setsize":r.ariaSetSize,"aria-posinset":r.getAriaPosInset(r.getOptionIndex(W,g)),onMousedown:function(de){return r.onOptionSelect(de,V)},onMousemove:function(de){return r.onOptionMouseMove(de,r.getOptionIndex(W,g))},"data-p-selected":!e.checkmark&&r.isSelected(V),"data-p-focused":i.focusedOptionIndex===r.getOptionIndex(W,g),"data-p-disabled":r.isOptionDisabled(V),ref_for:!0},r.getPTItemOptions(V,g,W,"option")),[e.checkmark?(c(),b(K,{key:0},[r.isSelected(V)?(c(),y(p,f({key:0,class:e.cx("optionCheckIcon"),ref_for:!0},e.ptm("optionCheckIcon")),null,16,["class"])):(c(),y(h,f({key:1,class:e.cx("optionBlankIcon"),ref_for:!0},e.ptm("optionBlankIcon")),null,16,["class"]))],64)):C("",!0),k(e.$slots,"option",{option:V,selected:r.isSelected(V),index:r.getOptionIndex(W,g)},function(){return[R("span",f({class:e.cx("optionLabel"),ref_for:!0},e.ptm("optionLabel")),Y(r.getOptionLabel(V)),17)]})],16,Pc)),[[$]])],64)}),128)),i.filterValue&&(!L||L&&L.length===0)?(c(),b("li",f({key:0,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage"),{"data-p-hidden-accessible":!0}),[k(e.$slots,"emptyfilter",{},function(){return[Ee(Y(r.emptyFilterMessageText),1)]})],16)):!e.options||e.options&&e.options.length===0?(c(),b("li",f({key:1,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage"),{"data-p-hidden-accessible":!0}),[k(e.$slots,"empty",{},function(){return[Ee(Y(r.emptyMessageText),1)]})],16)):C("",!0)],16,kc)]}),_:2},[e.$slots.loader?{name:"loader",fn:E(function(v){var I=v.options;return[k(e.$slots,"loader",{options:I})]}),key:"0"}:void 0]),1040,["items","style","disabled","pt"])],16),k(e.$slots,"footer",{value:e.d_value,options:r.visibleOptions}),!e.options||e.options&&e.options.length===0?(c(),b("span",f({key:1,role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenEmptyMessage"),{"data-p-hidden-accessible":!0}),Y(r.emptyMessageText),17)):C("",!0),R("span",f({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenSelectedMessage"),{"data-p-hidden-accessible":!0}),Y(r.selectedMessageText),17),R("span",f({ref:"lastHiddenFocusableElementOnOverlay",role:"presentation","aria-hidden":"true",class:"p-hidden-accessible p-hidden-focusable",tabindex:0,onFocus:t[8]||(t[8]=function(){return r.onLastHiddenFocus&&r.onLastHiddenFocus.apply(r,arguments)})},e.ptm("hiddenLastFocusableEl"),{"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0}),null,16)],16,$c)):C("",!0)]}),_:3},16,["onEnter","onAfterEnter","onLeave","onAfterLeave"])]}),_:3},8,["appendTo"])],16,wc)}Un.render=Oc;var Lo={name:"AngleDownIcon",extends:J};function xc(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M3.58659 4.5007C3.68513 4.50023 3.78277 4.51945 3.87379 4.55723C3.9648 4.59501 4.04735 4.65058 4.11659 4.7207L7.11659 7.7207L10.1166 4.7207C10.2619 4.65055 10.4259 4.62911 10.5843 4.65956C10.7427 4.69002 10.8871 4.77074 10.996 4.88976C11.1049 5.00877 11.1726 5.15973 11.1889 5.32022C11.2052 5.48072 11.1693 5.6422 11.0866 5.7807L7.58659 9.2807C7.44597 9.42115 7.25534 9.50004 7.05659 9.50004C6.85784 9.50004 6.66722 9.42115 6.52659 9.2807L3.02659 5.7807C2.88614 5.64007 2.80725 5.44945 2.80725 5.2507C2.80725 5.05195 2.88614 4.86132 3.02659 4.7207C3.09932 4.64685 3.18675 4.58911 3.28322 4.55121C3.37969 4.51331 3.48305 4.4961 3.58659 4.5007Z",fill:"currentColor"},null,-1)]),16)}Lo.render=xc;var ji={name:"AngleUpIcon",extends:J};function Rc(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M10.4134 9.49931C10.3148 9.49977 10.2172 9.48055 10.1262 9.44278C10.0352 9.405 9.95263 9.34942 9.88338 9.27931L6.88338 6.27931L3.88338 9.27931C3.73811 9.34946 3.57409 9.3709 3.41567 9.34044C3.25724 9.30999 3.11286 9.22926 3.00395 9.11025C2.89504 8.99124 2.82741 8.84028 2.8111 8.67978C2.79478 8.51928 2.83065 8.35781 2.91338 8.21931L6.41338 4.71931C6.55401 4.57886 6.74463 4.49997 6.94338 4.49997C7.14213 4.49997 7.33276 4.57886 7.47338 4.71931L10.9734 8.21931C11.1138 8.35994 11.1927 8.55056 11.1927 8.74931C11.1927 8.94806 11.1138 9.13868 10.9734 9.27931C10.9007 9.35315 10.8132 9.41089 10.7168 9.44879C10.6203 9.48669 10.5169 9.5039 10.4134 9.49931Z",fill:"currentColor"},null,-1)]),16)}ji.render=Rc;var Lc=({dt:e})=>`
-.p-inputnumber {
-    display: inline-flex;
-    position: relative;
-}
-
-.p-inputnumber-button {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    flex: 0 0 auto;
-    cursor: pointer;
-    background: ${e("inputnumber.button.background")};
-    color: ${e("inputnumber.button.color")};
-    width: ${e("inputnumber.button.width")};
-    transition: background ${e("inputnumber.transition.duration")}, color ${e("inputnumber.transition.duration")}, border-color ${e("inputnumber.transition.duration")}, outline-color ${e("inputnumber.transition.duration")};
-}
-
-.p-inputnumber-button:disabled {
-    cursor: auto;
-}
-
-.p-inputnumber-button:not(:disabled):hover {
-    background: ${e("inputnumber.button.hover.background")};
-    color: ${e("inputnumber.button.hover.color")};
-}
-
-.p-inputnumber-button:not(:disabled):active {
-    background: ${e("inputnumber.button.active.background")};
-    color: ${e("inputnumber.button.active.color")};
-}
-
-.p-inputnumber-stacked .p-inputnumber-button {
-    position: relative;
-    border: 0 none;
-}
-
-.p-inputnumber-stacked .p-inputnumber-button-group {
-    display: flex;
-    flex-direction: column;
-    position: absolute;
-    inset-block-start: 1px;
-    inset-inline-end: 1px;
-    height: calc(100% - 2px);
-    z-index: 1;
-}
-
-.p-inputnumber-stacked .p-inputnumber-increment-button {
-    padding: 0;
-    border-start-end-radius: calc(${e("inputnumber.button.border.radius")} - 1px);
-}
-
-.p-inputnumber-stacked .p-inputnumber-decrement-button {
-    padding: 0;
-    border-end-end-radius: calc(${e("inputnumber.button.border.radius")} - 1px);
-}
-
-.p-inputnumber-stacked .p-inputnumber-button {
-    flex: 1 1 auto;
-    border: 0 none;
-}
-
-.p-inputnumber-horizontal .p-inputnumber-button {
-    border: 1px solid ${e("inputnumber.button.border.color")};
-}
-
-.p-inputnumber-horizontal .p-inputnumber-button:hover {
-    border-color: ${e("inputnumber.button.hover.border.color")};
-}
-
-.p-inputnumber-horizontal .p-inputnumber-button:active {
-    border-color: ${e("inputnumber.button.active.border.color")};
-}
-
-.p-inputnumber-horizontal .p-inputnumber-increment-button {
-    order: 3;
-    border-start-end-radius: ${e("inputnumber.button.border.radius")};
-    border-end-end-radius: ${e("inputnumber.button.border.radius")};
-    border-inline-start: 0 none;
-}
-
-.p-inputnumber-horizontal .p-inputnumber-input {
-    order: 2;
-    border-radius: 0;
-}
-
-.p-inputnumber-horizontal .p-inputnumber-decrement-button {
-    order: 1;
-    border-start-start-radius: ${e("inputnumber.button.border.radius")};
-    border-end-start-radius: ${e("inputnumber.button.border.radius")};
-    border-inline-end: 0 none;
-}
-
-.p-floatlabel:has(.p-inputnumber-horizontal) label {
-    margin-inline-start: ${e("inputnumber.button.width")};
-}
-
-.p-inputnumber-vertical {
-    flex-direction: column;
-}
-
-.p-inputnumber-vertical .p-inputnumber-button {
-    border: 1px solid ${e("inputnumber.button.border.color")};
-    padding: ${e("inputnumber.button.vertical.padding")};
-}
-
-.p-inputnumber-vertical .p-inputnumber-button:hover {
-    border-color: ${e("inputnumber.button.hover.border.color")};
-}
-
-.p-inputnumber-vertical .p-inputnumber-button:active {
-    border-color: ${e("inputnumber.button.active.border.color")};
-}
-
-.p-inputnumber-vertical .p-inputnumber-increment-button {
-    order: 1;
-    border-start-start-radius: ${e("inputnumber.button.border.radius")};
-    border-start-end-radius: ${e("inputnumber.button.border.radius")};
-    width: 100%;
-    border-block-end: 0 none;
-}
-
-.p-inputnumber-vertical .p-inputnumber-input {
-    order: 2;
-    border-radius: 0;
-    text-align: center;
-}
-
-.p-inputnumber-vertical .p-inputnumber-decrement-button {
-    order: 3;
-    border-end-start-radius: ${e("inputnumber.button.border.radius")};
-    border-end-end-radius: ${e("inputnumber.button.border.radius")};
-    width: 100%;
-    border-block-start: 0 none;
-}
-
-.p-inputnumber-input {
-    flex: 1 1 auto;
-}
-
-.p-inputnumber-fluid {
-    width: 100%;
-}
-
-.p-inputnumber-fluid .p-inputnumber-input {
-    width: 1%;
-}
-
-.p-inputnumber-fluid.p-inputnumber-vertical .p-inputnumber-input {
-    width: 100%;
-}
-
-.p-inputnumber:has(.p-inputtext-sm) .p-inputnumber-button .p-icon {
-    font-size: ${e("form.field.sm.font.size")};
-    width: ${e("form.field.sm.font.size")};
-    height: ${e("form.field.sm.font.size")};
-}
-
-.p-inputnumber:has(.p-inputtext-lg) .p-inputnumber-button .p-icon {
-    font-size: ${e("form.field.lg.font.size")};
-    width: ${e("form.field.lg.font.size")};
-    height: ${e("form.field.lg.font.size")};
-}
-`,Tc={root:function(t){var n=t.instance,o=t.props;return["p-inputnumber p-component p-inputwrapper",{"p-invalid":n.$invalid,"p-inputwrapper-filled":n.$filled||o.allowEmpty===!1,"p-inputwrapper-focus":n.focused,"p-inputnumber-stacked":o.showButtons&&o.buttonLayout==="stacked","p-inputnumber-horizontal":o.showButtons&&o.buttonLayout==="horizontal","p-inputnumber-vertical":o.showButtons&&o.buttonLayout==="vertical","p-inputnumber-fluid":n.$fluid}]},pcInputText:"p-inputnumber-input",buttonGroup:"p-inputnumber-button-group",incrementButton:function(t){var n=t.instance,o=t.props;return["p-inputnumber-button p-inputnumber-increment-button",{"p-disabled":o.showButtons&&o.max!==null&&n.maxBoundry()}]},decrementButton:function(t){var n=t.instance,o=t.props;return["p-inputnumber-button p-inputnumber-decrement-button",{"p-disabled":o.showButtons&&o.min!==null&&n.minBoundry()}]}},Mc=N.extend({name:"inputnumber",style:Lc,classes:Tc}),Ec={name:"BaseInputNumber",extends:it,props:{format:{type:Boolean,default:!0},showButtons:{type:Boolean,default:!1},buttonLayout:{type:String,default:"stacked"},incrementButtonClass:{type:String,default:null},decrementButtonClass:{type:String,default:null},incrementButtonIcon:{type:String,default:void 0},incrementIcon:{type:String,default:void 0},decrementButtonIcon:{type:String,default:void 0},decrementIcon:{type:String,default:void 0},locale:{type:String,default:void 0},localeMatcher:{type:String,default:void 0},mode:{type:String,default:"decimal"},prefix:{type:String,default:null},suffix:{type:String,default:null},currency:{type:String,default:void 0},currencyDisplay:{type:String,default:void 0},useGrouping:{type:Boolean,default:!0},minFractionDigits:{type:Number,default:void 0},maxFractionDigits:{type:Number,default:void 0},roundingMode:{type:String,default:"halfExpand",validator:function(t){return["ceil","floor","expand","trunc","halfCeil","halfFloor","halfExpand","halfTrunc","halfEven"].includes(t)}},min:{type:Number,default:null},max:{type:Number,default:null},step:{type:Number,default:1},allowEmpty:{type:Boolean,default:!0},highlightOnFocus:{type:Boolean,default:!1},readonly:{type:Boolean,default:!1},placeholder:{type:String,default:null},inputId:{type:String,default:null},inputClass:{type:[String,Object],default:null},inputStyle:{type:Object,default:null},ariaLabelledby:{type:String,default:null},ariaLabel:{type:String,default:null},required:{type:Boolean,default:!1}},style:Mc,provide:function(){return{$pcInputNumber:this,$parentInstance:this}}};function Zt(e){"@babel/helpers - typeof";return Zt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Zt(e)}function kr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Ir(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?kr(Object(n),!0).forEach(function(o){fo(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):kr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function fo(e,t,n){return(t=Dc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Dc(e){var t=Fc(e,"string");return Zt(t)=="symbol"?t:t+""}function Fc(e,t){if(Zt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Zt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Bc(e){return Kc(e)||jc(e)||Ac(e)||zc()}function zc(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Ac(e,t){if(e){if(typeof e=="string")return ho(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ho(e,t):void 0}}function jc(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function Kc(e){if(Array.isArray(e))return ho(e)}function ho(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var Ki={name:"InputNumber",extends:Ec,inheritAttrs:!1,emits:["input","focus","blur"],inject:{$pcFluid:{default:null}},numberFormat:null,_numeral:null,_decimal:null,_group:null,_minusSign:null,_currency:null,_suffix:null,_prefix:null,_index:null,groupChar:"",isSpecialChar:null,prefixChar:null,suffixChar:null,timer:null,data:function(){return{d_modelValue:this.d_value,focused:!1}},watch:{d_value:function(t){this.d_modelValue=t},locale:function(t,n){this.updateConstructParser(t,n)},localeMatcher:function(t,n){this.updateConstructParser(t,n)},mode:function(t,n){this.updateConstructParser(t,n)},currency:function(t,n){this.updateConstructParser(t,n)},currencyDisplay:function(t,n){this.updateConstructParser(t,n)},useGrouping:function(t,n){this.updateConstructParser(t,n)},minFractionDigits:function(t,n){this.updateConstructParser(t,n)},maxFractionDigits:function(t,n){this.updateConstructParser(t,n)},suffix:function(t,n){this.updateConstructParser(t,n)},prefix:function(t,n){this.updateConstructParser(t,n)}},created:function(){this.constructParser()},methods:{getOptions:function(){return{localeMatcher:this.localeMatcher,style:this.mode,currency:this.currency,currencyDisplay:this.currencyDisplay,useGrouping:this.useGrouping,minimumFractionDigits:this.minFractionDigits,maximumFractionDigits:this.maxFractionDigits,roundingMode:this.roundingMode}},constructParser:function(){this.numberFormat=new Intl.NumberFormat(this.locale,this.getOptions());var t=Bc(new Intl.NumberFormat(this.locale,{useGrouping:!1}).format(9876543210)).reverse(),n=new Map(t.map(function(o,i){return[o,i]}));this._numeral=new RegExp("[".concat(t.join(""),"]"),"g"),this._group=this.getGroupingExpression(),this._minusSign=this.getMinusSignExpression(),this._currency=this.getCurrencyExpression(),this._decimal=this.getDecimalExpression(),this._suffix=this.getSuffixExpression(),this._prefix=this.getPrefixExpression(),this._index=function(o){return n.get(o)}},updateConstructParser:function(t,n){t!==n&&this.constructParser()},escapeRegExp:function(t){return t.replace(/[-[\]{}()*+?.,\\^$|#\s]/g,"\\$&")},getDecimalExpression:function(){var t=new Intl.NumberFormat(this.locale,Ir(Ir({},this.getOptions()),{},{useGrouping:!1}));return new RegExp("[".concat(t.format(1.1).replace(this._currency,"").trim().replace(this._numeral,""),"]"),"g")},getGroupingExpression:function(){var t=new Intl.NumberFormat(this.locale,{useGrouping:!0});return this.groupChar=t.format(1e6).trim().replace(this._numeral,"").charAt(0),new RegExp("[".concat(this.groupChar,"]"),"g")},getMinusSignExpression:function(){var t=new Intl.NumberFormat(this.locale,{useGrouping:!1});return new RegExp("[".concat(t.format(-1).trim().replace(this._numeral,""),"]"),"g")},getCurrencyExpression:function(){if(this.currency){var t=new Intl.NumberFormat(this.locale,{style:"currency",currency:this.currency,currencyDisplay:this.currencyDisplay,minimumFractionDigits:0,maximumFractionDigits:0,roundingMode:this.roundingMode});return new RegExp("[".concat(t.format(1).replace(/\s/g,"").replace(this._numeral,"").replace(this._group,""),"]"),"g")}return new RegExp("[]","g")},getPrefixExpression:function(){if(this.prefix)this.prefixChar=this.prefix;else{var t=new Intl.NumberFormat(this.locale,{style:this.mode,currency:this.currency,currencyDisplay:this.currencyDisplay});this.prefixChar=t.format(1).split("1")[0]}return new RegExp("".concat(this.escapeRegExp(this.prefixChar||"")),"g")},getSuffixExpression:function(){if(this.suffix)this.suffixChar=this.suffix;else{var t=new Intl.NumberFormat(this.locale,{style:this.mode,currency:this.currency,currencyDisplay:this.currencyDisplay,minimumFractionDigits:0,maximumFractionDigits:0,roundingMode:this.roundingMode});this.suffixChar=t.format(1).split("1")[1]}return new RegExp("".concat(this.escapeRegExp(this.suffixChar||"")),"g")},formatValue:function(t){if(t!=null){if(t==="-")return t;if(this.format){var n=new Intl.NumberFormat(this.locale,this.getOptions()),o=n.format(t);return this.prefix&&(o=this.prefix+o),this.suffix&&(o=o+this.suffix),o}return t.toString()}return""},parseValue:function(t){var n=t.replace(this._suffix,"").replace(this._prefix,"").trim().replace(/\s/g,"").replace(this._currency,"").replace(this._group,"").replace(this._minusSign,"-").replace(this._decimal,".").replace(this._numeral,this._index);if(n){if(n==="-")return n;var o=+n;return isNaN(o)?null:o}return null},repeat:function(t,n,o){var i=this;if(!this.readonly){var r=n||500;this.clearTimer(),this.timer=setTimeout(function(){i.repeat(t,40,o)},r),this.spin(t,o)}},spin:function(t,n){if(this.$refs.input){var o=this.step*n,i=this.parseValue(this.$refs.input.$el.value)||0,r=this.validateValue(i+o);this.updateInput(r,null,"spin"),this.updateModel(t,r),this.handleOnInput(t,i,r)}},onUpButtonMouseDown:function(t){this.disabled||(this.$refs.input.$el.focus(),this.repeat(t,null,1),t.preventDefault())},onUpButtonMouseUp:function(){this.disabled||this.clearTimer()},onUpButtonMouseLeave:function(){this.disabled||this.clearTimer()},onUpButtonKeyUp:function(){this.disabled||this.clearTimer()},onUpButtonKeyDown:function(t){(t.code==="Space"||t.code==="Enter"||t.code==="NumpadEnter")&&this.repeat(t,null,1)},onDownButtonMouseDown:function(t){this.disabled||(this.$refs.input.$el.focus(),this.repeat(t,null,-1),t.preventDefault())},onDownButtonMouseUp:function(){this.disabled||this.clearTimer()},onDownButtonMouseLeave:function(){this.disabled||this.clearTimer()},onDownButtonKeyUp:function(){this.disabled||this.clearTimer()},onDownButtonKeyDown:function(t){(t.code==="Space"||t.code==="Enter"||t.code==="NumpadEnter")&&this.repeat(t,null,-1)},onUserInput:function(){this.isSpecialChar&&(this.$refs.input.$el.value=this.lastValue),this.isSpecialChar=!1},onInputKeyDown:function(t){if(!this.readonly){if(t.altKey||t.ctrlKey||t.metaKey){this.isSpecialChar=!0,this.lastValue=this.$refs.input.$el.value;return}this.lastValue=t.target.value;var n=t.target.selectionStart,o=t.target.selectionEnd,i=o-n,r=t.target.value,a=null,l=t.code||t.key;switch(l){case"ArrowUp":this.spin(t,1),t.preventDefault();break;case"ArrowDown":this.spin(t,-1),t.preventDefault();break;case"ArrowLeft":if(i>1){var s=this.isNumeralChar(r.charAt(n))?n+1:n+2;this.$refs.input.$el.setSelectionRange(s,s)}else this.isNumeralChar(r.charAt(n-1))||t.preventDefault();break;case"ArrowRight":if(i>1){var u=o-1;this.$refs.input.$el.setSelectionRange(u,u)}else this.isNumeralChar(r.charAt(n))||t.preventDefault();break;case"Tab":case"Enter":case"NumpadEnter":a=this.validateValue(this.parseValue(r)),this.$refs.input.$el.value=this.formatValue(a),this.$refs.input.$el.setAttribute("aria-valuenow",a),this.updateModel(t,a);break;case"Backspace":{if(t.preventDefault(),n===o){var d=r.charAt(n-1),p=this.getDecimalCharIndexes(r),h=p.decimalCharIndex,m=p.decimalCharIndexWithoutPrefix;if(this.isNumeralChar(d)){var w=this.getDecimalLength(r);if(this._group.test(d))this._group.lastIndex=0,a=r.slice(0,n-2)+r.slice(n-1);else if(this._decimal.test(d))this._decimal.lastIndex=0,w?this.$refs.input.$el.setSelectionRange(n-1,n-1):a=r.slice(0,n-1)+r.slice(n);else if(h>0&&n>h){var $=this.isDecimalMode()&&(this.minFractionDigits||0)<w?"":"0";a=r.slice(0,n-1)+$+r.slice(n)}else m===1?(a=r.slice(0,n-1)+"0"+r.slice(n),a=this.parseValue(a)>0?a:""):a=r.slice(0,n-1)+r.slice(n)}this.updateValue(t,a,null,"delete-single")}else a=this.deleteRange(r,n,o),this.updateValue(t,a,null,"delete-range");break}case"Delete":if(t.preventDefault(),n===o){var v=r.charAt(n),I=this.getDecimalCharIndexes(r),P=I.decimalCharIndex,L=I.decimalCharIndexWithoutPrefix;if(this.isNumeralChar(v)){var g=this.getDecimalLength(r);if(this._group.test(v))this._group.lastIndex=0,a=r.slice(0,n)+r.slice(n+2);else if(this._decimal.test(v))this._decimal.lastIndex=0,g?this.$refs.input.$el.setSelectionRange(n+1,n+1):a=r.slice(0,n)+r.slice(n+1);else if(P>0&&n>P){var F=this.isDecimalMode()&&(this.minFractionDigits||0)<g?"":"0";a=r.slice(0,n)+F+r.slice(n+1)}else L===1?(a=r.slice(0,n)+"0"+r.slice(n+1),a=this.parseValue(a)>0?a:""):a=r.slice(0,n)+r.slice(n+1)}this.updateValue(t,a,null,"delete-back-single")}else a=this.deleteRange(r,n,o),this.updateValue(t,a,null,"delete-range");break;case"Home":t.preventDefault(),A(this.min)&&this.updateModel(t,this.min);break;case"End":t.preventDefault(),A(this.max)&&this.updateModel(t,this.max);break}}},onInputKeyPress:function(t){if(!this.readonly){var n=t.key,o=this.isDecimalSign(n),i=this.isMinusSign(n);t.code!=="Enter"&&t.preventDefault(),(Number(n)>=0&&Number(n)<=9||i||o)&&this.insert(t,n,{isDecimalSign:o,isMinusSign:i})}},onPaste:function(t){t.preventDefault();var n=(t.clipboardData||window.clipboardData).getData("Text");if(n){var o=this.parseValue(n);o!=null&&this.insert(t,o.toString())}},allowMinusSign:function(){return this.min===null||this.min<0},isMinusSign:function(t){return this._minusSign.test(t)||t==="-"?(this._minusSign.lastIndex=0,!0):!1},isDecimalSign:function(t){var n;return(n=this.locale)!==null&&n!==void 0&&n.includes("fr")&&[".",","].includes(t)||this._decimal.test(t)?(this._decimal.lastIndex=0,!0):!1},isDecimalMode:function(){return this.mode==="decimal"},getDecimalCharIndexes:function(t){var n=t.search(this._decimal);this._decimal.lastIndex=0;var o=t.replace(this._prefix,"").trim().replace(/\s/g,"").replace(this._currency,""),i=o.search(this._decimal);return this._decimal.lastIndex=0,{decimalCharIndex:n,decimalCharIndexWithoutPrefix:i}},getCharIndexes:function(t){var n=t.search(this._decimal);this._decimal.lastIndex=0;var o=t.search(this._minusSign);this._minusSign.lastIndex=0;var i=t.search(this._suffix);this._suffix.lastIndex=0;var r=t.search(this._currency);return this._currency.lastIndex=0,{decimalCharIndex:n,minusCharIndex:o,suffixCharIndex:i,currencyCharIndex:r}},insert:function(t,n){var o=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{isDecimalSign:!1,isMinusSign:!1},i=n.search(this._minusSign);if(this._minusSign.lastIndex=0,!(!this.allowMinusSign()&&i!==-1)){var r=this.$refs.input.$el.selectionStart,a=this.$refs.input.$el.selectionEnd,l=this.$refs.input.$el.value.trim(),s=this.getCharIndexes(l),u=s.decimalCharIndex,d=s.minusCharIndex,p=s.suffixCharIndex,h=s.currencyCharIndex,m;if(o.isMinusSign){var w=d===-1;(r===0||r===h+1)&&(m=l,(w||a!==0)&&(m=this.insertText(l,n,0,a)),this.updateValue(t,m,n,"insert"))}else if(o.isDecimalSign)u>0&&r===u?this.updateValue(t,l,n,"insert"):u>r&&u<a?(m=this.insertText(l,n,r,a),this.updateValue(t,m,n,"insert")):u===-1&&this.maxFractionDigits&&(m=this.insertText(l,n,r,a),this.updateValue(t,m,n,"insert"));else{var $=this.numberFormat.resolvedOptions().maximumFractionDigits,v=r!==a?"range-insert":"insert";if(u>0&&r>u){if(r+n.length-(u+1)<=$){var I=h>=r?h-1:p>=r?p:l.length;m=l.slice(0,r)+n+l.slice(r+n.length,I)+l.slice(I),this.updateValue(t,m,n,v)}}else m=this.insertText(l,n,r,a),this.updateValue(t,m,n,v)}}},insertText:function(t,n,o,i){var r=n==="."?n:n.split(".");if(r.length===2){var a=t.slice(o,i).search(this._decimal);return this._decimal.lastIndex=0,a>0?t.slice(0,o)+this.formatValue(n)+t.slice(i):this.formatValue(n)||t}else return i-o===t.length?this.formatValue(n):o===0?n+t.slice(i):i===t.length?t.slice(0,o)+n:t.slice(0,o)+n+t.slice(i)},deleteRange:function(t,n,o){var i;return o-n===t.length?i="":n===0?i=t.slice(o):o===t.length?i=t.slice(0,n):i=t.slice(0,n)+t.slice(o),i},initCursor:function(){var t=this.$refs.input.$el.selectionStart,n=this.$refs.input.$el.value,o=n.length,i=null,r=(this.prefixChar||"").length;n=n.replace(this._prefix,""),t=t-r;var a=n.charAt(t);if(this.isNumeralChar(a))return t+r;for(var l=t-1;l>=0;)if(a=n.charAt(l),this.isNumeralChar(a)){i=l+r;break}else l--;if(i!==null)this.$refs.input.$el.setSelectionRange(i+1,i+1);else{for(l=t;l<o;)if(a=n.charAt(l),this.isNumeralChar(a)){i=l+r;break}else l++;i!==null&&this.$refs.input.$el.setSelectionRange(i,i)}return i||0},onInputClick:function(){var t=this.$refs.input.$el.value;!this.readonly&&t!==Ko()&&this.initCursor()},isNumeralChar:function(t){return t.length===1&&(this._numeral.test(t)||this._decimal.test(t)||this._group.test(t)||this._minusSign.test(t))?(this.resetRegex(),!0):!1},resetRegex:function(){this._numeral.lastIndex=0,this._decimal.lastIndex=0,this._group.lastIndex=0,this._minusSign.lastIndex=0},updateValue:function(t,n,o,i){var r=this.$refs.input.$el.value,a=null;n!=null&&(a=this.parseValue(n),a=!a&&!this.allowEmpty?this.min||0:a,this.updateInput(a,o,i,n),this.handleOnInput(t,r,a))},handleOnInput:function(t,n,o){if(this.isValueChanged(n,o)){var i,r;this.$emit("input",{originalEvent:t,value:o,formattedValue:n}),(i=(r=this.formField).onInput)===null||i===void 0||i.call(r,{originalEvent:t,value:o})}},isValueChanged:function(t,n){if(n===null&&t!==null)return!0;if(n!=null){var o=typeof t=="string"?this.parseValue(t):t;return n!==o}return!1},validateValue:function(t){return t==="-"||t==null?null:this.min!=null&&t<this.min?this.min:this.max!=null&&t>this.max?this.max:t},updateInput:function(t,n,o,i){n=n||"";var r=this.$refs.input.$el.value,a=this.formatValue(t),l=r.length;if(a!==i&&(a=this.concatValues(a,i)),l===0){this.$refs.input.$el.value=a,this.$refs.input.$el.setSelectionRange(0,0);var s=this.initCursor(),u=s+n.length;this.$refs.input.$el.setSelectionRange(u,u)}else{var d=this.$refs.input.$el.selectionStart,p=this.$refs.input.$el.selectionEnd;this.$refs.input.$el.value=a;var h=a.length;if(o==="range-insert"){var m=this.parseValue((r||"").slice(0,d)),w=m!==null?m.toString():"",$=w.split("").join("(".concat(this.groupChar,")?")),v=new RegExp($,"g");v.test(a);var I=n.split("").join("(".concat(this.groupChar,")?")),P=new RegExp(I,"g");P.test(a.slice(v.lastIndex)),p=v.lastIndex+P.lastIndex,this.$refs.input.$el.setSelectionRange(p,p)}else if(h===l)o==="insert"||o==="delete-back-single"?this.$refs.input.$el.setSelectionRange(p+1,p+1):o==="delete-single"?this.$refs.input.$el.setSelectionRange(p-1,p-1):(o==="delete-range"||o==="spin")&&this.$refs.input.$el.setSelectionRange(p,p);else if(o==="delete-back-single"){var L=r.charAt(p-1),g=r.charAt(p),F=l-h,G=this._group.test(g);G&&F===1?p+=1:!G&&this.isNumeralChar(L)&&(p+=-1*F+1),this._group.lastIndex=0,this.$refs.input.$el.setSelectionRange(p,p)}else if(r==="-"&&o==="insert"){this.$refs.input.$el.setSelectionRange(0,0);var V=this.initCursor(),W=V+n.length+1;this.$refs.input.$el.setSelectionRange(W,W)}else p=p+(h-l),this.$refs.input.$el.setSelectionRange(p,p)}this.$refs.input.$el.setAttribute("aria-valuenow",t)},concatValues:function(t,n){if(t&&n){var o=n.search(this._decimal);return this._decimal.lastIndex=0,this.suffixChar?o!==-1?t.replace(this.suffixChar,"").split(this._decimal)[0]+n.replace(this.suffixChar,"").slice(o)+this.suffixChar:t:o!==-1?t.split(this._decimal)[0]+n.slice(o):t}return t},getDecimalLength:function(t){if(t){var n=t.split(this._decimal);if(n.length===2)return n[1].replace(this._suffix,"").trim().replace(/\s/g,"").replace(this._currency,"").length}return 0},updateModel:function(t,n){this.writeValue(n,t)},onInputFocus:function(t){this.focused=!0,!this.disabled&&!this.readonly&&this.$refs.input.$el.value!==Ko()&&this.highlightOnFocus&&t.target.select(),this.$emit("focus",t)},onInputBlur:function(t){var n,o;this.focused=!1;var i=t.target,r=this.validateValue(this.parseValue(i.value));this.$emit("blur",{originalEvent:t,value:i.value}),(n=(o=this.formField).onBlur)===null||n===void 0||n.call(o,t),i.value=this.formatValue(r),i.setAttribute("aria-valuenow",r),this.updateModel(t,r),!this.disabled&&!this.readonly&&this.highlightOnFocus&&xn()},clearTimer:function(){this.timer&&clearTimeout(this.timer)},maxBoundry:function(){return this.d_value>=this.max},minBoundry:function(){return this.d_value<=this.min}},computed:{upButtonListeners:function(){var t=this;return{mousedown:function(o){return t.onUpButtonMouseDown(o)},mouseup:function(o){return t.onUpButtonMouseUp(o)},mouseleave:function(o){return t.onUpButtonMouseLeave(o)},keydown:function(o){return t.onUpButtonKeyDown(o)},keyup:function(o){return t.onUpButtonKeyUp(o)}}},downButtonListeners:function(){var t=this;return{mousedown:function(o){return t.onDownButtonMouseDown(o)},mouseup:function(o){return t.onDownButtonMouseUp(o)},mouseleave:function(o){return t.onDownButtonMouseLeave(o)},keydown:function(o){return t.onDownButtonKeyDown(o)},keyup:function(o){return t.onDownButtonKeyUp(o)}}},formattedValue:function(){var t=!this.d_value&&!this.allowEmpty?0:this.d_value;return this.formatValue(t)},getFormatter:function(){return this.numberFormat},dataP:function(){return re(fo(fo({invalid:this.$invalid,fluid:this.$fluid,filled:this.$variant==="filled"},this.size,this.size),this.buttonLayout,this.showButtons&&this.buttonLayout))}},components:{InputText:Hn,AngleUpIcon:ji,AngleDownIcon:Lo}},Vc=["data-p"],Nc=["data-p"],Hc=["disabled","data-p"],Gc=["disabled","data-p"],Uc=["disabled","data-p"],_c=["disabled","data-p"];function Wc(e,t,n,o,i,r){var a=T("InputText");return c(),b("span",f({class:e.cx("root")},e.ptmi("root"),{"data-p":r.dataP}),[ne(a,{ref:"input",id:e.inputId,name:e.$formName,role:"spinbutton",class:j([e.cx("pcInputText"),e.inputClass]),style:So(e.inputStyle),value:r.formattedValue,"aria-valuemin":e.min,"aria-valuemax":e.max,"aria-valuenow":e.d_value,inputmode:e.mode==="decimal"&&!e.minFractionDigits?"numeric":"decimal",disabled:e.disabled,readonly:e.readonly,placeholder:e.placeholder,"aria-labelledby":e.ariaLabelledby,"aria-label":e.ariaLabel,required:e.required,size:e.size,invalid:e.invalid,variant:e.variant,onInput:r.onUserInput,onKeydown:r.onInputKeyDown,onKeypress:r.onInputKeyPress,onPaste:r.onPaste,onClick:r.onInputClick,onFocus:r.onInputFocus,onBlur:r.onInputBlur,pt:e.ptm("pcInputText"),unstyled:e.unstyled,"data-p":r.dataP},null,8,["id","name","class","style","value","aria-valuemin","aria-valuemax","aria-valuenow","inputmode","disabled","readonly","placeholder","aria-labelledby","aria-label","required","size","invalid","variant","onInput","onKeydown","onKeypress","onPaste","onClick","onFocus","onBlur","pt","unstyled","data-p"]),e.showButtons&&e.buttonLayout==="stacked"?(c(),b("span",f({key:0,class:e.cx("buttonGroup")},e.ptm("buttonGroup"),{"data-p":r.dataP}),[k(e.$slots,"incrementbutton",{listeners:r.upButtonListeners},function(){return[R("button",f({class:[e.cx("incrementButton"),e.incrementButtonClass]},wn(r.upButtonListeners),{disabled:e.disabled,tabindex:-1,"aria-hidden":"true",type:"button"},e.ptm("incrementButton"),{"data-p":r.dataP}),[k(e.$slots,e.$slots.incrementicon?"incrementicon":"incrementbuttonicon",{},function(){return[(c(),y(M(e.incrementIcon||e.incrementButtonIcon?"span":"AngleUpIcon"),f({class:[e.incrementIcon,e.incrementButtonIcon]},e.ptm("incrementIcon"),{"data-pc-section":"incrementicon"}),null,16,["class"]))]})],16,Hc)]}),k(e.$slots,"decrementbutton",{listeners:r.downButtonListeners},function(){return[R("button",f({class:[e.cx("decrementButton"),e.decrementButtonClass]},wn(r.downButtonListeners),{disabled:e.disabled,tabindex:-1,"aria-hidden":"true",type:"button"},e.ptm("decrementButton"),{"data-p":r.dataP}),[k(e.$slots,e.$slots.decrementicon?"decrementicon":"decrementbuttonicon",{},function(){return[(c(),y(M(e.decrementIcon||e.decrementButtonIcon?"span":"AngleDownIcon"),f({class:[e.decrementIcon,e.decrementButtonIcon]},e.ptm("decrementIcon"),{"data-pc-section":"decrementicon"}),null,16,["class"]))]})],16,Gc)]})],16,Nc)):C("",!0),k(e.$slots,"incrementbutton",{listeners:r.upButtonListeners},function(){return[e.showButtons&&e.buttonLayout!=="stacked"?(c(),b("button",f({key:0,class:[e.cx("incrementButton"),e.incrementButtonClass]},wn(r.upButtonListeners),{disabled:e.disabled,tabindex:-1,"aria-hidden":"true",type:"button"},e.ptm("incrementButton"),{"data-p":r.dataP}),[k(e.$slots,e.$slots.incrementicon?"incrementicon":"incrementbuttonicon",{},function(){return[(c(),y(M(e.incrementIcon||e.incrementButtonIcon?"span":"AngleUpIcon"),f({class:[e.incrementIcon,e.incrementButtonIcon]},e.ptm("incrementIcon"),{"data-pc-section":"incrementicon"}),null,16,["class"]))]})],16,Uc)):C("",!0)]}),k(e.$slots,"decrementbutton",{listeners:r.downButtonListeners},function(){return[e.showButtons&&e.buttonLayout!=="stacked"?(c(),b("button",f({key:0,class:[e.cx("decrementButton"),e.decrementButtonClass]},wn(r.downButtonListeners),{disabled:e.disabled,tabindex:-1,"aria-hidden":"true",type:"button"},e.ptm("decrementButton"),{"data-p":r.dataP}),[k(e.$slots,e.$slots.decrementicon?"decrementicon":"decrementbuttonicon",{},function(){return[(c(),y(M(e.decrementIcon||e.decrementButtonIcon?"span":"AngleDownIcon"),f({class:[e.decrementIcon,e.decrementButtonIcon]},e.ptm("decrementIcon"),{"data-pc-section":"decrementicon"}),null,16,["class"]))]})],16,_c)):C("",!0)]})],16,Vc)}Ki.render=Wc;var Vi={name:"AngleDoubleRightIcon",extends:J};function Zc(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M7.68757 11.1451C7.7791 11.1831 7.8773 11.2024 7.9764 11.2019C8.07769 11.1985 8.17721 11.1745 8.26886 11.1312C8.36052 11.088 8.44238 11.0265 8.50943 10.9505L12.0294 7.49085C12.1707 7.34942 12.25 7.15771 12.25 6.95782C12.25 6.75794 12.1707 6.56622 12.0294 6.42479L8.50943 2.90479C8.37014 2.82159 8.20774 2.78551 8.04633 2.80192C7.88491 2.81833 7.73309 2.88635 7.6134 2.99588C7.4937 3.10541 7.41252 3.25061 7.38189 3.40994C7.35126 3.56927 7.37282 3.73423 7.44337 3.88033L10.4605 6.89748L7.44337 9.91463C7.30212 10.0561 7.22278 10.2478 7.22278 10.4477C7.22278 10.6475 7.30212 10.8393 7.44337 10.9807C7.51301 11.0512 7.59603 11.1071 7.68757 11.1451ZM1.94207 10.9505C2.07037 11.0968 2.25089 11.1871 2.44493 11.2019C2.63898 11.1871 2.81949 11.0968 2.94779 10.9505L6.46779 7.49085C6.60905 7.34942 6.68839 7.15771 6.68839 6.95782C6.68839 6.75793 6.60905 6.56622 6.46779 6.42479L2.94779 2.90479C2.80704 2.83757 2.6489 2.81563 2.49517 2.84201C2.34143 2.86839 2.19965 2.94178 2.08936 3.05207C1.97906 3.16237 1.90567 3.30415 1.8793 3.45788C1.85292 3.61162 1.87485 3.76975 1.94207 3.9105L4.95922 6.92765L1.94207 9.9448C1.81838 10.0831 1.75 10.2621 1.75 10.4477C1.75 10.6332 1.81838 10.8122 1.94207 10.9505Z",fill:"currentColor"},null,-1)]),16)}Vi.render=Zc;var To={name:"AngleRightIcon",extends:J};function qc(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M5.25 11.1728C5.14929 11.1694 5.05033 11.1455 4.9592 11.1025C4.86806 11.0595 4.78666 10.9984 4.72 10.9228C4.57955 10.7822 4.50066 10.5916 4.50066 10.3928C4.50066 10.1941 4.57955 10.0035 4.72 9.86283L7.72 6.86283L4.72 3.86283C4.66067 3.71882 4.64765 3.55991 4.68275 3.40816C4.71785 3.25642 4.79932 3.11936 4.91585 3.01602C5.03238 2.91268 5.17819 2.84819 5.33305 2.83149C5.4879 2.81479 5.64411 2.84671 5.78 2.92283L9.28 6.42283C9.42045 6.56346 9.49934 6.75408 9.49934 6.95283C9.49934 7.15158 9.42045 7.34221 9.28 7.48283L5.78 10.9228C5.71333 10.9984 5.63193 11.0595 5.5408 11.1025C5.44966 11.1455 5.35071 11.1694 5.25 11.1728Z",fill:"currentColor"},null,-1)]),16)}To.render=qc;var Ni={name:"AngleLeftIcon",extends:J};function Yc(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M8.75 11.185C8.65146 11.1854 8.55381 11.1662 8.4628 11.1284C8.37179 11.0906 8.28924 11.0351 8.22 10.965L4.72 7.46496C4.57955 7.32433 4.50066 7.13371 4.50066 6.93496C4.50066 6.73621 4.57955 6.54558 4.72 6.40496L8.22 2.93496C8.36095 2.84357 8.52851 2.80215 8.69582 2.81733C8.86312 2.83252 9.02048 2.90344 9.14268 3.01872C9.26487 3.134 9.34483 3.28696 9.36973 3.4531C9.39463 3.61924 9.36303 3.78892 9.28 3.93496L6.28 6.93496L9.28 9.93496C9.42045 10.0756 9.49934 10.2662 9.49934 10.465C9.49934 10.6637 9.42045 10.8543 9.28 10.995C9.13526 11.1257 8.9448 11.1939 8.75 11.185Z",fill:"currentColor"},null,-1)]),16)}Ni.render=Yc;var Jc={name:"BasePaginator",extends:U,props:{totalRecords:{type:Number,default:0},rows:{type:Number,default:0},first:{type:Number,default:0},pageLinkSize:{type:Number,default:5},rowsPerPageOptions:{type:Array,default:null},template:{type:[Object,String],default:"FirstPageLink PrevPageLink PageLinks NextPageLink LastPageLink RowsPerPageDropdown"},currentPageReportTemplate:{type:null,default:"({currentPage} of {totalPages})"},alwaysShow:{type:Boolean,default:!0}},style:Yd,provide:function(){return{$pcPaginator:this,$parentInstance:this}}},Hi={name:"CurrentPageReport",hostName:"Paginator",extends:U,props:{pageCount:{type:Number,default:0},currentPage:{type:Number,default:0},page:{type:Number,default:0},first:{type:Number,default:0},rows:{type:Number,default:0},totalRecords:{type:Number,default:0},template:{type:String,default:"({currentPage} of {totalPages})"}},computed:{text:function(){var t=this.template.replace("{currentPage}",this.currentPage).replace("{totalPages}",this.pageCount).replace("{first}",this.pageCount>0?this.first+1:0).replace("{last}",Math.min(this.first+this.rows,this.totalRecords)).replace("{rows}",this.rows).replace("{totalRecords}",this.totalRecords);return t}}};function Xc(e,t,n,o,i,r){return c(),b("span",f({class:e.cx("current")},e.ptm("current")),Y(r.text),17)}Hi.render=Xc;var Gi={name:"FirstPageLink",hostName:"Paginator",extends:U,props:{template:{type:Function,default:null}},methods:{getPTOptions:function(t){return this.ptm(t,{context:{disabled:this.$attrs.disabled}})}},components:{AngleDoubleLeftIcon:Di},directives:{ripple:Re}};function Qc(e,t,n,o,i,r){var a=ke("ripple");return Ie((c(),b("button",f({class:e.cx("first"),type:"button"},r.getPTOptions("first"),{"data-pc-group-section":"pagebutton"}),[(c(),y(M(n.template||"AngleDoubleLeftIcon"),f({class:e.cx("firstIcon")},r.getPTOptions("firstIcon")),null,16,["class"]))],16)),[[a]])}Gi.render=Qc;var Ui={name:"JumpToPageDropdown",hostName:"Paginator",extends:U,emits:["page-change"],props:{page:Number,pageCount:Number,disabled:Boolean,templates:null},methods:{onChange:function(t){this.$emit("page-change",t)}},computed:{pageOptions:function(){for(var t=[],n=0;n<this.pageCount;n++)t.push({label:String(n+1),value:n});return t}},components:{JTPSelect:Un}};function ep(e,t,n,o,i,r){var a=T("JTPSelect");return c(),y(a,{modelValue:n.page,options:r.pageOptions,optionLabel:"label",optionValue:"value","onUpdate:modelValue":t[0]||(t[0]=function(l){return r.onChange(l)}),class:j(e.cx("pcJumpToPageDropdown")),disabled:n.disabled,unstyled:e.unstyled,pt:e.ptm("pcJumpToPageDropdown"),"data-pc-group-section":"pagedropdown"},De({_:2},[n.templates.jumptopagedropdownicon?{name:"dropdownicon",fn:E(function(l){return[(c(),y(M(n.templates.jumptopagedropdownicon),{class:j(l.class)},null,8,["class"]))]}),key:"0"}:void 0]),1032,["modelValue","options","class","disabled","unstyled","pt"])}Ui.render=ep;var _i={name:"JumpToPageInput",hostName:"Paginator",extends:U,inheritAttrs:!1,emits:["page-change"],props:{page:Number,pageCount:Number,disabled:Boolean},data:function(){return{d_page:this.page}},watch:{page:function(t){this.d_page=t}},methods:{onChange:function(t){t!==this.page&&(this.d_page=t,this.$emit("page-change",t-1))}},computed:{inputArialabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.jumpToPageInputLabel:void 0}},components:{JTPInput:Ki}};function tp(e,t,n,o,i,r){var a=T("JTPInput");return c(),y(a,{ref:"jtpInput",modelValue:i.d_page,class:j(e.cx("pcJumpToPageInputText")),"aria-label":r.inputArialabel,disabled:n.disabled,"onUpdate:modelValue":r.onChange,unstyled:e.unstyled,pt:e.ptm("pcJumpToPageInputText")},null,8,["modelValue","class","aria-label","disabled","onUpdate:modelValue","unstyled","pt"])}_i.render=tp;var Wi={name:"LastPageLink",hostName:"Paginator",extends:U,props:{template:{type:Function,default:null}},methods:{getPTOptions:function(t){return this.ptm(t,{context:{disabled:this.$attrs.disabled}})}},components:{AngleDoubleRightIcon:Vi},directives:{ripple:Re}};function np(e,t,n,o,i,r){var a=ke("ripple");return Ie((c(),b("button",f({class:e.cx("last"),type:"button"},r.getPTOptions("last"),{"data-pc-group-section":"pagebutton"}),[(c(),y(M(n.template||"AngleDoubleRightIcon"),f({class:e.cx("lastIcon")},r.getPTOptions("lastIcon")),null,16,["class"]))],16)),[[a]])}Wi.render=np;var Zi={name:"NextPageLink",hostName:"Paginator",extends:U,props:{template:{type:Function,default:null}},methods:{getPTOptions:function(t){return this.ptm(t,{context:{disabled:this.$attrs.disabled}})}},components:{AngleRightIcon:To},directives:{ripple:Re}};function op(e,t,n,o,i,r){var a=ke("ripple");return Ie((c(),b("button",f({class:e.cx("next"),type:"button"},r.getPTOptions("next"),{"data-pc-group-section":"pagebutton"}),[(c(),y(M(n.template||"AngleRightIcon"),f({class:e.cx("nextIcon")},r.getPTOptions("nextIcon")),null,16,["class"]))],16)),[[a]])}Zi.render=op;var qi={name:"PageLinks",hostName:"Paginator",extends:U,inheritAttrs:!1,emits:["click"],props:{value:Array,page:Number},methods:{getPTOptions:function(t,n){return this.ptm(n,{context:{active:t===this.page}})},onPageLinkClick:function(t,n){this.$emit("click",{originalEvent:t,value:n})},ariaPageLabel:function(t){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.pageLabel.replace(/{page}/g,t):void 0}},directives:{ripple:Re}},rp=["aria-label","aria-current","onClick","data-p-active"];function ip(e,t,n,o,i,r){var a=ke("ripple");return c(),b("span",f({class:e.cx("pages")},e.ptm("pages")),[(c(!0),b(K,null,ue(n.value,function(l){return Ie((c(),b("button",f({key:l,class:e.cx("page",{pageLink:l}),type:"button","aria-label":r.ariaPageLabel(l),"aria-current":l-1===n.page?"page":void 0,onClick:function(u){return r.onPageLinkClick(u,l)},ref_for:!0},r.getPTOptions(l-1,"page"),{"data-p-active":l-1===n.page}),[Ee(Y(l),1)],16,rp)),[[a]])}),128))],16)}qi.render=ip;var Yi={name:"PrevPageLink",hostName:"Paginator",extends:U,props:{template:{type:Function,default:null}},methods:{getPTOptions:function(t){return this.ptm(t,{context:{disabled:this.$attrs.disabled}})}},components:{AngleLeftIcon:Ni},directives:{ripple:Re}};function ap(e,t,n,o,i,r){var a=ke("ripple");return Ie((c(),b("button",f({class:e.cx("prev"),type:"button"},r.getPTOptions("prev"),{"data-pc-group-section":"pagebutton"}),[(c(),y(M(n.template||"AngleLeftIcon"),f({class:e.cx("prevIcon")},r.getPTOptions("prevIcon")),null,16,["class"]))],16)),[[a]])}Yi.render=ap;var Ji={name:"RowsPerPageDropdown",hostName:"Paginator",extends:U,emits:["rows-change"],props:{options:Array,rows:Number,disabled:Boolean,templates:null},methods:{onChange:function(t){this.$emit("rows-change",t)}},computed:{rowsOptions:function(){var t=[];if(this.options)for(var n=0;n<this.options.length;n++)t.push({label:String(this.options[n]),value:this.options[n]});return t}},components:{RPPSelect:Un}};function lp(e,t,n,o,i,r){var a=T("RPPSelect");return c(),y(a,{modelValue:n.rows,options:r.rowsOptions,optionLabel:"label",optionValue:"value","onUpdate:modelValue":t[0]||(t[0]=function(l){return r.onChange(l)}),class:j(e.cx("pcRowPerPageDropdown")),disabled:n.disabled,unstyled:e.unstyled,pt:e.ptm("pcRowPerPageDropdown"),"data-pc-group-section":"pagedropdown"},De({_:2},[n.templates.rowsperpagedropdownicon?{name:"dropdownicon",fn:E(function(l){return[(c(),y(M(n.templates.rowsperpagedropdownicon),{class:j(l.class)},null,8,["class"]))]}),key:"0"}:void 0]),1032,["modelValue","options","class","disabled","unstyled","pt"])}Ji.render=lp;function mo(e){"@babel/helpers - typeof";return mo=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},mo(e)}function Pr(e,t){return cp(e)||dp(e,t)||up(e,t)||sp()}function sp(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function up(e,t){if(e){if(typeof e=="string")return Or(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Or(e,t):void 0}}function Or(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function dp(e,t){var n=e==null?null:typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var o,i,r,a,l=[],s=!0,u=!1;try{if(r=(n=n.call(e)).next,t===0){if(Object(n)!==n)return;s=!1}else for(;!(s=(o=r.call(n)).done)&&(l.push(o.value),l.length!==t);s=!0);}catch(d){u=!0,i=d}finally{try{if(!s&&n.return!=null&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return l}}function cp(e){if(Array.isArray(e))return e}var Mo={name:"Paginator",extends:Jc,inheritAttrs:!1,emits:["update:first","update:rows","page"],data:function(){return{d_first:this.first,d_rows:this.rows}},watch:{first:function(t){this.d_first=t},rows:function(t){this.d_rows=t},totalRecords:function(t){this.page>0&&t&&this.d_first>=t&&this.changePage(this.pageCount-1)}},mounted:function(){this.createStyle()},methods:{changePage:function(t){var n=this.pageCount;if(t>=0&&t<n){this.d_first=this.d_rows*t;var o={page:t,first:this.d_first,rows:this.d_rows,pageCount:n};this.$emit("update:first",this.d_first),this.$emit("update:rows",this.d_rows),this.$emit("page",o)}},changePageToFirst:function(t){this.isFirstPage||this.changePage(0),t.preventDefault()},changePageToPrev:function(t){this.changePage(this.page-1),t.preventDefault()},changePageLink:function(t){this.changePage(t.value-1),t.originalEvent.preventDefault()},changePageToNext:function(t){this.changePage(this.page+1),t.preventDefault()},changePageToLast:function(t){this.isLastPage||this.changePage(this.pageCount-1),t.preventDefault()},onRowChange:function(t){this.d_rows=t,this.changePage(this.page)},createStyle:function(){var t=this;if(this.hasBreakpoints()&&!this.isUnstyled){var n;this.styleElement=document.createElement("style"),this.styleElement.type="text/css",mn(this.styleElement,"nonce",(n=this.$primevue)===null||n===void 0||(n=n.config)===null||n===void 0||(n=n.csp)===null||n===void 0?void 0:n.nonce),document.body.appendChild(this.styleElement);var o="",i=Object.keys(this.template),r={};i.sort(function(w,$){return parseInt(w)-parseInt($)}).forEach(function(w){r[w]=t.template[w]});for(var a=0,l=Object.entries(Object.entries(r));a<l.length;a++){var s=Pr(l[a],2),u=s[0],d=Pr(s[1],1),p=d[0],h=void 0,m=void 0;p!=="default"&&typeof Object.keys(r)[u-1]=="string"?m=Number(Object.keys(r)[u-1].slice(0,-2))+1+"px":m=Object.keys(r)[u-1],h=Object.entries(r)[u-1]?"and (min-width:".concat(m,")"):"",p==="default"?o+=`
-                            @media screen `.concat(h,` {
-                                .p-paginator[`).concat(this.$attrSelector,`],
-                                    display: flex;
-                                }
-                            }
-                        `):o+=`
-.p-paginator-`.concat(p,` {
-    display: none;
-}
-@media screen `).concat(h," and (max-width: ").concat(p,`) {
-    .p-paginator-`).concat(p,` {
-        display: flex;
-    }
-
-    .p-paginator-default{
-        display: none;
-    }
-}
-                    `)}this.styleElement.innerHTML=o}},hasBreakpoints:function(){return mo(this.template)==="object"},getAriaLabel:function(t){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria[t]:void 0}},computed:{templateItems:function(){var t={};if(this.hasBreakpoints()){t=this.template,t.default||(t.default="FirstPageLink PrevPageLink PageLinks NextPageLink LastPageLink RowsPerPageDropdown");for(var n in t)t[n]=this.template[n].split(" ").map(function(o){return o.trim()});return t}return t.default=this.template.split(" ").map(function(o){return o.trim()}),t},page:function(){return Math.floor(this.d_first/this.d_rows)},pageCount:function(){return Math.ceil(this.totalRecords/this.d_rows)},isFirstPage:function(){return this.page===0},isLastPage:function(){return this.page===this.pageCount-1},calculatePageLinkBoundaries:function(){var t=this.pageCount,n=Math.min(this.pageLinkSize,t),o=Math.max(0,Math.ceil(this.page-n/2)),i=Math.min(t-1,o+n-1),r=this.pageLinkSize-(i-o+1);return o=Math.max(0,o-r),[o,i]},pageLinks:function(){for(var t=[],n=this.calculatePageLinkBoundaries,o=n[0],i=n[1],r=o;r<=i;r++)t.push(r+1);return t},currentState:function(){return{page:this.page,first:this.d_first,rows:this.d_rows}},empty:function(){return this.pageCount===0},currentPage:function(){return this.pageCount>0?this.page+1:0},last:function(){return Math.min(this.d_first+this.rows,this.totalRecords)}},components:{CurrentPageReport:Hi,FirstPageLink:Gi,LastPageLink:Wi,NextPageLink:Zi,PageLinks:qi,PrevPageLink:Yi,RowsPerPageDropdown:Ji,JumpToPageDropdown:Ui,JumpToPageInput:_i}};function pp(e,t,n,o,i,r){var a=T("FirstPageLink"),l=T("PrevPageLink"),s=T("NextPageLink"),u=T("LastPageLink"),d=T("PageLinks"),p=T("CurrentPageReport"),h=T("RowsPerPageDropdown"),m=T("JumpToPageDropdown"),w=T("JumpToPageInput");return e.alwaysShow||r.pageLinks&&r.pageLinks.length>1?(c(),b("nav",mt(f({key:0},e.ptmi("paginatorContainer"))),[(c(!0),b(K,null,ue(r.templateItems,function($,v){return c(),b("div",f({key:v,ref_for:!0,ref:"paginator",class:e.cx("paginator",{key:v})},e.ptm("root")),[e.$slots.container?k(e.$slots,"container",{key:0,first:i.d_first+1,last:r.last,rows:i.d_rows,page:r.page,pageCount:r.pageCount,pageLinks:r.pageLinks,totalRecords:e.totalRecords,firstPageCallback:r.changePageToFirst,lastPageCallback:r.changePageToLast,prevPageCallback:r.changePageToPrev,nextPageCallback:r.changePageToNext,rowChangeCallback:r.onRowChange,changePageCallback:r.changePage}):(c(),b(K,{key:1},[e.$slots.start?(c(),b("div",f({key:0,class:e.cx("contentStart"),ref_for:!0},e.ptm("contentStart")),[k(e.$slots,"start",{state:r.currentState})],16)):C("",!0),R("div",f({class:e.cx("content"),ref_for:!0},e.ptm("content")),[(c(!0),b(K,null,ue($,function(I){return c(),b(K,{key:I},[I==="FirstPageLink"?(c(),y(a,{key:0,"aria-label":r.getAriaLabel("firstPageLabel"),template:e.$slots.firsticon||e.$slots.firstpagelinkicon,onClick:t[0]||(t[0]=function(P){return r.changePageToFirst(P)}),disabled:r.isFirstPage||r.empty,unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","template","disabled","unstyled","pt"])):I==="PrevPageLink"?(c(),y(l,{key:1,"aria-label":r.getAriaLabel("prevPageLabel"),template:e.$slots.previcon||e.$slots.prevpagelinkicon,onClick:t[1]||(t[1]=function(P){return r.changePageToPrev(P)}),disabled:r.isFirstPage||r.empty,unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","template","disabled","unstyled","pt"])):I==="NextPageLink"?(c(),y(s,{key:2,"aria-label":r.getAriaLabel("nextPageLabel"),template:e.$slots.nexticon||e.$slots.nextpagelinkicon,onClick:t[2]||(t[2]=function(P){return r.changePageToNext(P)}),disabled:r.isLastPage||r.empty,unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","template","disabled","unstyled","pt"])):I==="LastPageLink"?(c(),y(u,{key:3,"aria-label":r.getAriaLabel("lastPageLabel"),template:e.$slots.lasticon||e.$slots.lastpagelinkicon,onClick:t[3]||(t[3]=function(P){return r.changePageToLast(P)}),disabled:r.isLastPage||r.empty,unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","template","disabled","unstyled","pt"])):I==="PageLinks"?(c(),y(d,{key:4,"aria-label":r.getAriaLabel("pageLabel"),value:r.pageLinks,page:r.page,onClick:t[4]||(t[4]=function(P){return r.changePageLink(P)}),unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","value","page","unstyled","pt"])):I==="CurrentPageReport"?(c(),y(p,{key:5,"aria-live":"polite",template:e.currentPageReportTemplate,currentPage:r.currentPage,page:r.page,pageCount:r.pageCount,first:i.d_first,rows:i.d_rows,totalRecords:e.totalRecords,unstyled:e.unstyled,pt:e.pt},null,8,["template","currentPage","page","pageCount","first","rows","totalRecords","unstyled","pt"])):I==="RowsPerPageDropdown"&&e.rowsPerPageOptions?(c(),y(h,{key:6,"aria-label":r.getAriaLabel("rowsPerPageLabel"),rows:i.d_rows,options:e.rowsPerPageOptions,onRowsChange:t[5]||(t[5]=function(P){return r.onRowChange(P)}),disabled:r.empty,templates:e.$slots,unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","rows","options","disabled","templates","unstyled","pt"])):I==="JumpToPageDropdown"?(c(),y(m,{key:7,"aria-label":r.getAriaLabel("jumpToPageDropdownLabel"),page:r.page,pageCount:r.pageCount,onPageChange:t[6]||(t[6]=function(P){return r.changePage(P)}),disabled:r.empty,templates:e.$slots,unstyled:e.unstyled,pt:e.pt},null,8,["aria-label","page","pageCount","disabled","templates","unstyled","pt"])):I==="JumpToPageInput"?(c(),y(w,{key:8,page:r.currentPage,onPageChange:t[7]||(t[7]=function(P){return r.changePage(P)}),disabled:r.empty,unstyled:e.unstyled,pt:e.pt},null,8,["page","disabled","unstyled","pt"])):C("",!0)],64)}),128))],16),e.$slots.end?(c(),b("div",f({key:1,class:e.cx("contentEnd"),ref_for:!0},e.ptm("contentEnd")),[k(e.$slots,"end",{state:r.currentState})],16)):C("",!0)],64))],16)}),128))],16)):C("",!0)}Mo.render=pp;var fp=({dt:e})=>`
-.p-datatable {
-    position: relative;
-}
-
-.p-datatable-table {
-    border-spacing: 0;
-    border-collapse: separate;
-    width: 100%;
-}
-
-.p-datatable-scrollable > .p-datatable-table-container {
-    position: relative;
-}
-
-.p-datatable-scrollable-table > .p-datatable-thead {
-    inset-block-start: 0;
-    z-index: 1;
-}
-
-.p-datatable-scrollable-table > .p-datatable-frozen-tbody {
-    position: sticky;
-    z-index: 1;
-}
-
-.p-datatable-scrollable-table > .p-datatable-tfoot {
-    inset-block-end: 0;
-    z-index: 1;
-}
-
-.p-datatable-scrollable .p-datatable-frozen-column {
-    position: sticky;
-    background: ${e("datatable.header.cell.background")};
-}
-
-.p-datatable-scrollable th.p-datatable-frozen-column {
-    z-index: 1;
-}
-
-.p-datatable-scrollable > .p-datatable-table-container > .p-datatable-table > .p-datatable-thead,
-.p-datatable-scrollable > .p-datatable-table-container > .p-virtualscroller > .p-datatable-table > .p-datatable-thead {
-    background: ${e("datatable.header.cell.background")};
-}
-
-.p-datatable-scrollable > .p-datatable-table-container > .p-datatable-table > .p-datatable-tfoot,
-.p-datatable-scrollable > .p-datatable-table-container > .p-virtualscroller > .p-datatable-table > .p-datatable-tfoot {
-    background: ${e("datatable.footer.cell.background")};
-}
-
-.p-datatable-flex-scrollable {
-    display: flex;
-    flex-direction: column;
-    height: 100%;
-}
-
-.p-datatable-flex-scrollable > .p-datatable-table-container {
-    display: flex;
-    flex-direction: column;
-    flex: 1;
-    height: 100%;
-}
-
-.p-datatable-scrollable-table > .p-datatable-tbody > .p-datatable-row-group-header {
-    position: sticky;
-    z-index: 1;
-}
-
-.p-datatable-resizable-table > .p-datatable-thead > tr > th,
-.p-datatable-resizable-table > .p-datatable-tfoot > tr > td,
-.p-datatable-resizable-table > .p-datatable-tbody > tr > td {
-    overflow: hidden;
-    white-space: nowrap;
-}
-
-.p-datatable-resizable-table > .p-datatable-thead > tr > th.p-datatable-resizable-column:not(.p-datatable-frozen-column) {
-    background-clip: padding-box;
-    position: relative;
-}
-
-.p-datatable-resizable-table-fit > .p-datatable-thead > tr > th.p-datatable-resizable-column:last-child .p-datatable-column-resizer {
-    display: none;
-}
-
-.p-datatable-column-resizer {
-    display: block;
-    position: absolute;
-    inset-block-start: 0;
-    inset-inline-end: 0;
-    margin: 0;
-    width: ${e("datatable.column.resizer.width")};
-    height: 100%;
-    padding: 0;
-    cursor: col-resize;
-    border: 1px solid transparent;
-}
-
-.p-datatable-column-header-content {
-    display: flex;
-    align-items: center;
-    gap: ${e("datatable.header.cell.gap")};
-}
-
-.p-datatable-column-resize-indicator {
-    width: ${e("datatable.resize.indicator.width")};
-    position: absolute;
-    z-index: 10;
-    display: none;
-    background: ${e("datatable.resize.indicator.color")};
-}
-
-.p-datatable-row-reorder-indicator-up,
-.p-datatable-row-reorder-indicator-down {
-    position: absolute;
-    display: none;
-}
-
-.p-datatable-reorderable-column,
-.p-datatable-reorderable-row-handle {
-    cursor: move;
-}
-
-.p-datatable-mask {
-    position: absolute;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    z-index: 2;
-}
-
-.p-datatable-inline-filter {
-    display: flex;
-    align-items: center;
-    width: 100%;
-    gap: ${e("datatable.filter.inline.gap")};
-}
-
-.p-datatable-inline-filter .p-datatable-filter-element-container {
-    flex: 1 1 auto;
-    width: 1%;
-}
-
-.p-datatable-filter-overlay {
-    background: ${e("datatable.filter.overlay.select.background")};
-    color: ${e("datatable.filter.overlay.select.color")};
-    border: 1px solid ${e("datatable.filter.overlay.select.border.color")};
-    border-radius: ${e("datatable.filter.overlay.select.border.radius")};
-    box-shadow: ${e("datatable.filter.overlay.select.shadow")};
-    min-width: 12.5rem;
-}
-
-.p-datatable-filter-constraint-list {
-    margin: 0;
-    list-style: none;
-    display: flex;
-    flex-direction: column;
-    padding: ${e("datatable.filter.constraint.list.padding")};
-    gap: ${e("datatable.filter.constraint.list.gap")};
-}
-
-.p-datatable-filter-constraint {
-    padding: ${e("datatable.filter.constraint.padding")};
-    color: ${e("datatable.filter.constraint.color")};
-    border-radius: ${e("datatable.filter.constraint.border.radius")};
-    cursor: pointer;
-    transition: background ${e("datatable.transition.duration")}, color ${e("datatable.transition.duration")}, border-color ${e("datatable.transition.duration")},
-        box-shadow ${e("datatable.transition.duration")};
-}
-
-.p-datatable-filter-constraint-selected {
-    background: ${e("datatable.filter.constraint.selected.background")};
-    color: ${e("datatable.filter.constraint.selected.color")};
-}
-
-.p-datatable-filter-constraint:not(.p-datatable-filter-constraint-selected):not(.p-disabled):hover {
-    background: ${e("datatable.filter.constraint.focus.background")};
-    color: ${e("datatable.filter.constraint.focus.color")};
-}
-
-.p-datatable-filter-constraint:focus-visible {
-    outline: 0 none;
-    background: ${e("datatable.filter.constraint.focus.background")};
-    color: ${e("datatable.filter.constraint.focus.color")};
-}
-
-.p-datatable-filter-constraint-selected:focus-visible {
-    outline: 0 none;
-    background: ${e("datatable.filter.constraint.selected.focus.background")};
-    color: ${e("datatable.filter.constraint.selected.focus.color")};
-}
-
-.p-datatable-filter-constraint-separator {
-    border-block-start: 1px solid ${e("datatable.filter.constraint.separator.border.color")};
-}
-
-.p-datatable-popover-filter {
-    display: inline-flex;
-    margin-inline-start: auto;
-}
-
-.p-datatable-filter-overlay-popover {
-    background: ${e("datatable.filter.overlay.popover.background")};
-    color: ${e("datatable.filter.overlay.popover.color")};
-    border: 1px solid ${e("datatable.filter.overlay.popover.border.color")};
-    border-radius: ${e("datatable.filter.overlay.popover.border.radius")};
-    box-shadow: ${e("datatable.filter.overlay.popover.shadow")};
-    min-width: 12.5rem;
-    padding: ${e("datatable.filter.overlay.popover.padding")};
-    display: flex;
-    flex-direction: column;
-    gap: ${e("datatable.filter.overlay.popover.gap")};
-}
-
-.p-datatable-filter-operator-dropdown {
-    width: 100%;
-}
-
-.p-datatable-filter-rule-list,
-.p-datatable-filter-rule {
-    display: flex;
-    flex-direction: column;
-    gap: ${e("datatable.filter.overlay.popover.gap")};
-}
-
-.p-datatable-filter-rule {
-    border-block-end: 1px solid ${e("datatable.filter.rule.border.color")};
-    padding-bottom: ${e("datatable.filter.overlay.popover.gap")};
-}
-
-.p-datatable-filter-rule:last-child {
-    border-block-end: 0 none;
-    padding-bottom: 0;
-}
-
-.p-datatable-filter-add-rule-button {
-    width: 100%;
-}
-
-.p-datatable-filter-remove-rule-button {
-    width: 100%;
-}
-
-.p-datatable-filter-buttonbar {
-    padding: 0;
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-}
-
-.p-datatable-virtualscroller-spacer {
-    display: flex;
-}
-
-.p-datatable .p-virtualscroller .p-virtualscroller-loading {
-    transform: none !important;
-    min-height: 0;
-    position: sticky;
-    inset-block-start: 0;
-    inset-inline-start: 0;
-}
-
-.p-datatable-paginator-top {
-    border-color: ${e("datatable.paginator.top.border.color")};
-    border-style: solid;
-    border-width: ${e("datatable.paginator.top.border.width")};
-}
-
-.p-datatable-paginator-bottom {
-    border-color: ${e("datatable.paginator.bottom.border.color")};
-    border-style: solid;
-    border-width: ${e("datatable.paginator.bottom.border.width")};
-}
-
-.p-datatable-header {
-    background: ${e("datatable.header.background")};
-    color: ${e("datatable.header.color")};
-    border-color: ${e("datatable.header.border.color")};
-    border-style: solid;
-    border-width: ${e("datatable.header.border.width")};
-    padding: ${e("datatable.header.padding")};
-}
-
-.p-datatable-footer {
-    background: ${e("datatable.footer.background")};
-    color: ${e("datatable.footer.color")};
-    border-color: ${e("datatable.footer.border.color")};
-    border-style: solid;
-    border-width: ${e("datatable.footer.border.width")};
-    padding: ${e("datatable.footer.padding")};
-}
-
-.p-datatable-header-cell {
-    padding: ${e("datatable.header.cell.padding")};
-    background: ${e("datatable.header.cell.background")};
-    border-color: ${e("datatable.header.cell.border.color")};
-    border-style: solid;
-    border-width: 0 0 1px 0;
-    color: ${e("datatable.header.cell.color")};
-    font-weight: normal;
-    text-align: start;
-    transition: background ${e("datatable.transition.duration")}, color ${e("datatable.transition.duration")}, border-color ${e("datatable.transition.duration")},
-            outline-color ${e("datatable.transition.duration")}, box-shadow ${e("datatable.transition.duration")};
-}
-
-.p-datatable-column-title {
-    font-weight: ${e("datatable.column.title.font.weight")};
-}
-
-.p-datatable-tbody > tr {
-    outline-color: transparent;
-    background: ${e("datatable.row.background")};
-    color: ${e("datatable.row.color")};
-    transition: background ${e("datatable.transition.duration")}, color ${e("datatable.transition.duration")}, border-color ${e("datatable.transition.duration")},
-            outline-color ${e("datatable.transition.duration")}, box-shadow ${e("datatable.transition.duration")};
-}
-
-.p-datatable-tbody > tr > td {
-    text-align: start;
-    border-color: ${e("datatable.body.cell.border.color")};
-    border-style: solid;
-    border-width: 0 0 1px 0;
-    padding: ${e("datatable.body.cell.padding")};
-}
-
-.p-datatable-hoverable .p-datatable-tbody > tr:not(.p-datatable-row-selected):hover {
-    background: ${e("datatable.row.hover.background")};
-    color: ${e("datatable.row.hover.color")};
-}
-
-.p-datatable-tbody > tr.p-datatable-row-selected {
-    background: ${e("datatable.row.selected.background")};
-    color: ${e("datatable.row.selected.color")};
-}
-
-.p-datatable-tbody > tr:has(+ .p-datatable-row-selected) > td {
-    border-block-end-color: ${e("datatable.body.cell.selected.border.color")};
-}
-
-.p-datatable-tbody > tr.p-datatable-row-selected > td {
-    border-block-end-color: ${e("datatable.body.cell.selected.border.color")};
-}
-
-.p-datatable-tbody > tr:focus-visible,
-.p-datatable-tbody > tr.p-datatable-contextmenu-row-selected {
-    box-shadow: ${e("datatable.row.focus.ring.shadow")};
-    outline: ${e("datatable.row.focus.ring.width")} ${e("datatable.row.focus.ring.style")} ${e("datatable.row.focus.ring.color")};
-    outline-offset: ${e("datatable.row.focus.ring.offset")};
-}
-
-.p-datatable-tfoot > tr > td {
-    text-align: start;
-    padding: ${e("datatable.footer.cell.padding")};
-    border-color: ${e("datatable.footer.cell.border.color")};
-    border-style: solid;
-    border-width: 0 0 1px 0;
-    color: ${e("datatable.footer.cell.color")};
-    background: ${e("datatable.footer.cell.background")};
-}
-
-.p-datatable-column-footer {
-    font-weight: ${e("datatable.column.footer.font.weight")};
-}
-
-.p-datatable-sortable-column {
-    cursor: pointer;
-    user-select: none;
-    outline-color: transparent;
-}
-
-.p-datatable-column-title,
-.p-datatable-sort-icon,
-.p-datatable-sort-badge {
-    vertical-align: middle;
-}
-
-.p-datatable-sort-icon {
-    color: ${e("datatable.sort.icon.color")};
-    font-size: ${e("datatable.sort.icon.size")};
-    width: ${e("datatable.sort.icon.size")};
-    height: ${e("datatable.sort.icon.size")};
-    transition: color ${e("datatable.transition.duration")};
-}
-
-.p-datatable-sortable-column:not(.p-datatable-column-sorted):hover {
-    background: ${e("datatable.header.cell.hover.background")};
-    color: ${e("datatable.header.cell.hover.color")};
-}
-
-.p-datatable-sortable-column:not(.p-datatable-column-sorted):hover .p-datatable-sort-icon {
-    color: ${e("datatable.sort.icon.hover.color")};
-}
-
-.p-datatable-column-sorted {
-    background: ${e("datatable.header.cell.selected.background")};
-    color: ${e("datatable.header.cell.selected.color")};
-}
-
-.p-datatable-column-sorted .p-datatable-sort-icon {
-    color: ${e("datatable.header.cell.selected.color")};
-}
-
-.p-datatable-sortable-column:focus-visible {
-    box-shadow: ${e("datatable.header.cell.focus.ring.shadow")};
-    outline: ${e("datatable.header.cell.focus.ring.width")} ${e("datatable.header.cell.focus.ring.style")} ${e("datatable.header.cell.focus.ring.color")};
-    outline-offset: ${e("datatable.header.cell.focus.ring.offset")};
-}
-
-.p-datatable-hoverable .p-datatable-selectable-row {
-    cursor: pointer;
-}
-
-.p-datatable-tbody > tr.p-datatable-dragpoint-top > td {
-    box-shadow: inset 0 2px 0 0 ${e("datatable.drop.point.color")};
-}
-
-.p-datatable-tbody > tr.p-datatable-dragpoint-bottom > td {
-    box-shadow: inset 0 -2px 0 0 ${e("datatable.drop.point.color")};
-}
-
-.p-datatable-loading-icon {
-    font-size: ${e("datatable.loading.icon.size")};
-    width: ${e("datatable.loading.icon.size")};
-    height: ${e("datatable.loading.icon.size")};
-}
-
-.p-datatable-gridlines .p-datatable-header {
-    border-width: 1px 1px 0 1px;
-}
-
-.p-datatable-gridlines .p-datatable-footer {
-    border-width: 0 1px 1px 1px;
-}
-
-.p-datatable-gridlines .p-datatable-paginator-top {
-    border-width: 1px 1px 0 1px;
-}
-
-.p-datatable-gridlines .p-datatable-paginator-bottom {
-    border-width: 0 1px 1px 1px;
-}
-
-.p-datatable-gridlines .p-datatable-thead > tr > th {
-    border-width: 1px 0 1px 1px;
-}
-
-.p-datatable-gridlines .p-datatable-thead > tr > th:last-child {
-    border-width: 1px;
-}
-
-.p-datatable-gridlines .p-datatable-tbody > tr > td {
-    border-width: 1px 0 0 1px;
-}
-
-.p-datatable-gridlines .p-datatable-tbody > tr > td:last-child {
-    border-width: 1px 1px 0 1px;
-}
-
-.p-datatable-gridlines .p-datatable-tbody > tr:last-child > td {
-    border-width: 1px 0 1px 1px;
-}
-
-.p-datatable-gridlines .p-datatable-tbody > tr:last-child > td:last-child {
-    border-width: 1px;
-}
-
-.p-datatable-gridlines .p-datatable-tfoot > tr > td {
-    border-width: 1px 0 1px 1px;
-}
-
-.p-datatable-gridlines .p-datatable-tfoot > tr > td:last-child {
-    border-width: 1px 1px 1px 1px;
-}
-
-.p-datatable.p-datatable-gridlines .p-datatable-thead + .p-datatable-tfoot > tr > td {
-    border-width: 0 0 1px 1px;
-}
-
-.p-datatable.p-datatable-gridlines .p-datatable-thead + .p-datatable-tfoot > tr > td:last-child {
-    border-width: 0 1px 1px 1px;
-}
-
-.p-datatable.p-datatable-gridlines:has(.p-datatable-thead):has(.p-datatable-tbody) .p-datatable-tbody > tr > td {
-    border-width: 0 0 1px 1px;
-}
-
-.p-datatable.p-datatable-gridlines:has(.p-datatable-thead):has(.p-datatable-tbody) .p-datatable-tbody > tr > td:last-child {
-    border-width: 0 1px 1px 1px;
-}
-
-.p-datatable.p-datatable-gridlines:has(.p-datatable-tbody):has(.p-datatable-tfoot) .p-datatable-tbody > tr:last-child > td {
-    border-width: 0 0 0 1px;
-}
-
-.p-datatable.p-datatable-gridlines:has(.p-datatable-tbody):has(.p-datatable-tfoot) .p-datatable-tbody > tr:last-child > td:last-child {
-    border-width: 0 1px 0 1px;
-}
-
-.p-datatable.p-datatable-striped .p-datatable-tbody > tr.p-row-odd {
-    background: ${e("datatable.row.striped.background")};
-}
-
-.p-datatable.p-datatable-striped .p-datatable-tbody > tr.p-row-odd.p-datatable-row-selected {
-    background: ${e("datatable.row.selected.background")};
-    color: ${e("datatable.row.selected.color")};
-}
-
-.p-datatable-striped.p-datatable-hoverable .p-datatable-tbody > tr:not(.p-datatable-row-selected):hover {
-    background: ${e("datatable.row.hover.background")};
-    color: ${e("datatable.row.hover.color")};
-}
-
-.p-datatable.p-datatable-sm .p-datatable-header {
-    padding: ${e("datatable.header.sm.padding")};
-}
-
-.p-datatable.p-datatable-sm .p-datatable-thead > tr > th {
-    padding: ${e("datatable.header.cell.sm.padding")};
-}
-
-.p-datatable.p-datatable-sm .p-datatable-tbody > tr > td {
-    padding: ${e("datatable.body.cell.sm.padding")};
-}
-
-.p-datatable.p-datatable-sm .p-datatable-tfoot > tr > td {
-    padding: ${e("datatable.footer.cell.sm.padding")};
-}
-
-.p-datatable.p-datatable-sm .p-datatable-footer {
-    padding: ${e("datatable.footer.sm.padding")};
-}
-
-.p-datatable.p-datatable-lg .p-datatable-header {
-    padding: ${e("datatable.header.lg.padding")};
-}
-
-.p-datatable.p-datatable-lg .p-datatable-thead > tr > th {
-    padding: ${e("datatable.header.cell.lg.padding")};
-}
-
-.p-datatable.p-datatable-lg .p-datatable-tbody > tr > td {
-    padding: ${e("datatable.body.cell.lg.padding")};
-}
-
-.p-datatable.p-datatable-lg .p-datatable-tfoot > tr > td {
-    padding: ${e("datatable.footer.cell.lg.padding")};
-}
-
-.p-datatable.p-datatable-lg .p-datatable-footer {
-    padding: ${e("datatable.footer.lg.padding")};
-}
-
-.p-datatable-row-toggle-button {
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    overflow: hidden;
-    position: relative;
-    width: ${e("datatable.row.toggle.button.size")};
-    height: ${e("datatable.row.toggle.button.size")};
-    color: ${e("datatable.row.toggle.button.color")};
-    border: 0 none;
-    background: transparent;
-    cursor: pointer;
-    border-radius: ${e("datatable.row.toggle.button.border.radius")};
-    transition: background ${e("datatable.transition.duration")}, color ${e("datatable.transition.duration")}, border-color ${e("datatable.transition.duration")},
-            outline-color ${e("datatable.transition.duration")}, box-shadow ${e("datatable.transition.duration")};
-    outline-color: transparent;
-    user-select: none;
-}
-
-.p-datatable-row-toggle-button:enabled:hover {
-    color: ${e("datatable.row.toggle.button.hover.color")};
-    background: ${e("datatable.row.toggle.button.hover.background")};
-}
-
-.p-datatable-tbody > tr.p-datatable-row-selected .p-datatable-row-toggle-button:hover {
-    background: ${e("datatable.row.toggle.button.selected.hover.background")};
-    color: ${e("datatable.row.toggle.button.selected.hover.color")};
-}
-
-.p-datatable-row-toggle-button:focus-visible {
-    box-shadow: ${e("datatable.row.toggle.button.focus.ring.shadow")};
-    outline: ${e("datatable.row.toggle.button.focus.ring.width")} ${e("datatable.row.toggle.button.focus.ring.style")} ${e("datatable.row.toggle.button.focus.ring.color")};
-    outline-offset: ${e("datatable.row.toggle.button.focus.ring.offset")};
-}
-
-.p-datatable-row-toggle-icon:dir(rtl) {
-    transform: rotate(180deg);
-}
-`,hp={root:function(t){var n=t.props;return["p-datatable p-component",{"p-datatable-hoverable":n.rowHover||n.selectionMode,"p-datatable-resizable":n.resizableColumns,"p-datatable-resizable-fit":n.resizableColumns&&n.columnResizeMode==="fit","p-datatable-scrollable":n.scrollable,"p-datatable-flex-scrollable":n.scrollable&&n.scrollHeight==="flex","p-datatable-striped":n.stripedRows,"p-datatable-gridlines":n.showGridlines,"p-datatable-sm":n.size==="small","p-datatable-lg":n.size==="large"}]},mask:"p-datatable-mask p-overlay-mask",loadingIcon:"p-datatable-loading-icon",header:"p-datatable-header",pcPaginator:function(t){var n=t.position;return"p-datatable-paginator-"+n},tableContainer:"p-datatable-table-container",table:function(t){var n=t.props;return["p-datatable-table",{"p-datatable-scrollable-table":n.scrollable,"p-datatable-resizable-table":n.resizableColumns,"p-datatable-resizable-table-fit":n.resizableColumns&&n.columnResizeMode==="fit"}]},thead:"p-datatable-thead",headerCell:function(t){var n=t.instance,o=t.props,i=t.column;return i&&!n.columnProp("hidden")&&(o.rowGroupMode!=="subheader"||o.groupRowsBy!==n.columnProp(i,"field"))?["p-datatable-header-cell",{"p-datatable-frozen-column":n.columnProp("frozen")}]:["p-datatable-header-cell",{"p-datatable-sortable-column":n.columnProp("sortable"),"p-datatable-resizable-column":n.resizableColumns,"p-datatable-column-sorted":n.isColumnSorted(),"p-datatable-frozen-column":n.columnProp("frozen"),"p-datatable-reorderable-column":o.reorderableColumns}]},columnResizer:"p-datatable-column-resizer",columnHeaderContent:"p-datatable-column-header-content",columnTitle:"p-datatable-column-title",columnFooter:"p-datatable-column-footer",sortIcon:"p-datatable-sort-icon",pcSortBadge:"p-datatable-sort-badge",filter:function(t){var n=t.props;return["p-datatable-filter",{"p-datatable-inline-filter":n.display==="row","p-datatable-popover-filter":n.display==="menu"}]},filterElementContainer:"p-datatable-filter-element-container",pcColumnFilterButton:"p-datatable-column-filter-button",pcColumnFilterClearButton:"p-datatable-column-filter-clear-button",filterOverlay:function(t){var n=t.props;return["p-datatable-filter-overlay p-component",{"p-datatable-filter-overlay-popover":n.display==="menu"}]},filterConstraintList:"p-datatable-filter-constraint-list",filterConstraint:function(t){var n=t.instance,o=t.matchMode;return["p-datatable-filter-constraint",{"p-datatable-filter-constraint-selected":o&&n.isRowMatchModeSelected(o.value)}]},filterConstraintSeparator:"p-datatable-filter-constraint-separator",filterOperator:"p-datatable-filter-operator",pcFilterOperatorDropdown:"p-datatable-filter-operator-dropdown",filterRuleList:"p-datatable-filter-rule-list",filterRule:"p-datatable-filter-rule",pcFilterConstraintDropdown:"p-datatable-filter-constraint-dropdown",pcFilterRemoveRuleButton:"p-datatable-filter-remove-rule-button",pcFilterAddRuleButton:"p-datatable-filter-add-rule-button",filterButtonbar:"p-datatable-filter-buttonbar",pcFilterClearButton:"p-datatable-filter-clear-button",pcFilterApplyButton:"p-datatable-filter-apply-button",tbody:function(t){var n=t.props;return n.frozenRow?"p-datatable-tbody p-datatable-frozen-tbody":"p-datatable-tbody"},rowGroupHeader:"p-datatable-row-group-header",rowToggleButton:"p-datatable-row-toggle-button",rowToggleIcon:"p-datatable-row-toggle-icon",row:function(t){var n=t.instance,o=t.props,i=t.index,r=t.columnSelectionMode,a=[];return o.selectionMode&&a.push("p-datatable-selectable-row"),o.selection&&a.push({"p-datatable-row-selected":r?n.isSelected&&n.$parentInstance.$parentInstance.highlightOnSelect:n.isSelected}),o.contextMenuSelection&&a.push({"p-datatable-contextmenu-row-selected":n.isSelectedWithContextMenu}),a.push(i%2===0?"p-row-even":"p-row-odd"),a},rowExpansion:"p-datatable-row-expansion",rowGroupFooter:"p-datatable-row-group-footer",emptyMessage:"p-datatable-empty-message",bodyCell:function(t){var n=t.instance;return[{"p-datatable-frozen-column":n.columnProp("frozen")}]},reorderableRowHandle:"p-datatable-reorderable-row-handle",pcRowEditorInit:"p-datatable-row-editor-init",pcRowEditorSave:"p-datatable-row-editor-save",pcRowEditorCancel:"p-datatable-row-editor-cancel",tfoot:"p-datatable-tfoot",footerCell:function(t){var n=t.instance;return[{"p-datatable-frozen-column":n.columnProp("frozen")}]},virtualScrollerSpacer:"p-datatable-virtualscroller-spacer",footer:"p-datatable-footer",columnResizeIndicator:"p-datatable-column-resize-indicator",rowReorderIndicatorUp:"p-datatable-row-reorder-indicator-up",rowReorderIndicatorDown:"p-datatable-row-reorder-indicator-down"},mp={tableContainer:{overflow:"auto"},thead:{position:"sticky"},tfoot:{position:"sticky"}},bp=N.extend({name:"datatable",style:fp,classes:hp,inlineStyles:mp}),Eo={name:"ChevronRightIcon",extends:J};function gp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M4.38708 13C4.28408 13.0005 4.18203 12.9804 4.08691 12.9409C3.99178 12.9014 3.9055 12.8433 3.83313 12.7701C3.68634 12.6231 3.60388 12.4238 3.60388 12.2161C3.60388 12.0084 3.68634 11.8091 3.83313 11.6622L8.50507 6.99022L3.83313 2.31827C3.69467 2.16968 3.61928 1.97313 3.62287 1.77005C3.62645 1.56698 3.70872 1.37322 3.85234 1.22959C3.99596 1.08597 4.18972 1.00371 4.3928 1.00012C4.59588 0.996539 4.79242 1.07192 4.94102 1.21039L10.1669 6.43628C10.3137 6.58325 10.3962 6.78249 10.3962 6.99022C10.3962 7.19795 10.3137 7.39718 10.1669 7.54416L4.94102 12.7701C4.86865 12.8433 4.78237 12.9014 4.68724 12.9409C4.59212 12.9804 4.49007 13.0005 4.38708 13Z",fill:"currentColor"},null,-1)]),16)}Eo.render=gp;var Do={name:"BarsIcon",extends:J};function yp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M13.3226 3.6129H0.677419C0.497757 3.6129 0.325452 3.54152 0.198411 3.41448C0.0713707 3.28744 0 3.11514 0 2.93548C0 2.75581 0.0713707 2.58351 0.198411 2.45647C0.325452 2.32943 0.497757 2.25806 0.677419 2.25806H13.3226C13.5022 2.25806 13.6745 2.32943 13.8016 2.45647C13.9286 2.58351 14 2.75581 14 2.93548C14 3.11514 13.9286 3.28744 13.8016 3.41448C13.6745 3.54152 13.5022 3.6129 13.3226 3.6129ZM13.3226 7.67741H0.677419C0.497757 7.67741 0.325452 7.60604 0.198411 7.479C0.0713707 7.35196 0 7.17965 0 6.99999C0 6.82033 0.0713707 6.64802 0.198411 6.52098C0.325452 6.39394 0.497757 6.32257 0.677419 6.32257H13.3226C13.5022 6.32257 13.6745 6.39394 13.8016 6.52098C13.9286 6.64802 14 6.82033 14 6.99999C14 7.17965 13.9286 7.35196 13.8016 7.479C13.6745 7.60604 13.5022 7.67741 13.3226 7.67741ZM0.677419 11.7419H13.3226C13.5022 11.7419 13.6745 11.6706 13.8016 11.5435C13.9286 11.4165 14 11.2442 14 11.0645C14 10.8848 13.9286 10.7125 13.8016 10.5855C13.6745 10.4585 13.5022 10.3871 13.3226 10.3871H0.677419C0.497757 10.3871 0.325452 10.4585 0.198411 10.5855C0.0713707 10.7125 0 10.8848 0 11.0645C0 11.2442 0.0713707 11.4165 0.198411 11.5435C0.325452 11.6706 0.497757 11.7419 0.677419 11.7419Z",fill:"currentColor"},null,-1)]),16)}Do.render=yp;var Xi={name:"PencilIcon",extends:J};function vp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M0.609628 13.959C0.530658 13.9599 0.452305 13.9451 0.379077 13.9156C0.305849 13.8861 0.239191 13.8424 0.18294 13.787C0.118447 13.7234 0.0688234 13.6464 0.0376166 13.5614C0.00640987 13.4765 -0.00560954 13.3857 0.00241768 13.2956L0.25679 10.1501C0.267698 10.0041 0.331934 9.86709 0.437312 9.76516L9.51265 0.705715C10.0183 0.233014 10.6911 -0.0203041 11.3835 0.00127367C12.0714 0.00660201 12.7315 0.27311 13.2298 0.746671C13.7076 1.23651 13.9824 1.88848 13.9992 2.57201C14.0159 3.25554 13.7733 3.92015 13.32 4.4327L4.23648 13.5331C4.13482 13.6342 4.0017 13.6978 3.85903 13.7133L0.667067 14L0.609628 13.959ZM1.43018 10.4696L1.25787 12.714L3.50619 12.5092L12.4502 3.56444C12.6246 3.35841 12.7361 3.10674 12.7714 2.83933C12.8067 2.57193 12.7644 2.30002 12.6495 2.05591C12.5346 1.8118 12.3519 1.60575 12.1231 1.46224C11.8943 1.31873 11.6291 1.2438 11.3589 1.24633C11.1813 1.23508 11.0033 1.25975 10.8355 1.31887C10.6677 1.37798 10.5136 1.47033 10.3824 1.59036L1.43018 10.4696Z",fill:"currentColor"},null,-1)]),16)}Xi.render=vp;var Qi={name:"MinusIcon",extends:J};function wp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M13.2222 7.77778H0.777778C0.571498 7.77778 0.373667 7.69584 0.227806 7.54998C0.0819442 7.40412 0 7.20629 0 7.00001C0 6.79373 0.0819442 6.5959 0.227806 6.45003C0.373667 6.30417 0.571498 6.22223 0.777778 6.22223H13.2222C13.4285 6.22223 13.6263 6.30417 13.7722 6.45003C13.9181 6.5959 14 6.79373 14 7.00001C14 7.20629 13.9181 7.40412 13.7722 7.54998C13.6263 7.69584 13.4285 7.77778 13.2222 7.77778Z",fill:"currentColor"},null,-1)]),16)}Qi.render=wp;var Cp=({dt:e})=>`
-.p-checkbox {
-    position: relative;
-    display: inline-flex;
-    user-select: none;
-    vertical-align: bottom;
-    width: ${e("checkbox.width")};
-    height: ${e("checkbox.height")};
-}
-
-.p-checkbox-input {
-    cursor: pointer;
-    appearance: none;
-    position: absolute;
-    inset-block-start: 0;
-    inset-inline-start: 0;
-    width: 100%;
-    height: 100%;
-    padding: 0;
-    margin: 0;
-    opacity: 0;
-    z-index: 1;
-    outline: 0 none;
-    border: 1px solid transparent;
-    border-radius: ${e("checkbox.border.radius")};
-}
-
-.p-checkbox-box {
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    border-radius: ${e("checkbox.border.radius")};
-    border: 1px solid ${e("checkbox.border.color")};
-    background: ${e("checkbox.background")};
-    width: ${e("checkbox.width")};
-    height: ${e("checkbox.height")};
-    transition: background ${e("checkbox.transition.duration")}, color ${e("checkbox.transition.duration")}, border-color ${e("checkbox.transition.duration")}, box-shadow ${e("checkbox.transition.duration")}, outline-color ${e("checkbox.transition.duration")};
-    outline-color: transparent;
-    box-shadow: ${e("checkbox.shadow")};
-}
-
-.p-checkbox-icon {
-    transition-duration: ${e("checkbox.transition.duration")};
-    color: ${e("checkbox.icon.color")};
-    font-size: ${e("checkbox.icon.size")};
-    width: ${e("checkbox.icon.size")};
-    height: ${e("checkbox.icon.size")};
-}
-
-.p-checkbox:not(.p-disabled):has(.p-checkbox-input:hover) .p-checkbox-box {
-    border-color: ${e("checkbox.hover.border.color")};
-}
-
-.p-checkbox-checked .p-checkbox-box {
-    border-color: ${e("checkbox.checked.border.color")};
-    background: ${e("checkbox.checked.background")};
-}
-
-.p-checkbox-checked .p-checkbox-icon {
-    color: ${e("checkbox.icon.checked.color")};
-}
-
-.p-checkbox-checked:not(.p-disabled):has(.p-checkbox-input:hover) .p-checkbox-box {
-    background: ${e("checkbox.checked.hover.background")};
-    border-color: ${e("checkbox.checked.hover.border.color")};
-}
-
-.p-checkbox-checked:not(.p-disabled):has(.p-checkbox-input:hover) .p-checkbox-icon {
-    color: ${e("checkbox.icon.checked.hover.color")};
-}
-
-.p-checkbox:not(.p-disabled):has(.p-checkbox-input:focus-visible) .p-checkbox-box {
-    border-color: ${e("checkbox.focus.border.color")};
-    box-shadow: ${e("checkbox.focus.ring.shadow")};
-    outline: ${e("checkbox.focus.ring.width")} ${e("checkbox.focus.ring.style")} ${e("checkbox.focus.ring.color")};
-    outline-offset: ${e("checkbox.focus.ring.offset")};
-}
-
-.p-checkbox-checked:not(.p-disabled):has(.p-checkbox-input:focus-visible) .p-checkbox-box {
-    border-color: ${e("checkbox.checked.focus.border.color")};
-}
-
-.p-checkbox.p-invalid > .p-checkbox-box {
-    border-color: ${e("checkbox.invalid.border.color")};
-}
-
-.p-checkbox.p-variant-filled .p-checkbox-box {
-    background: ${e("checkbox.filled.background")};
-}
-
-.p-checkbox-checked.p-variant-filled .p-checkbox-box {
-    background: ${e("checkbox.checked.background")};
-}
-
-.p-checkbox-checked.p-variant-filled:not(.p-disabled):has(.p-checkbox-input:hover) .p-checkbox-box {
-    background: ${e("checkbox.checked.hover.background")};
-}
-
-.p-checkbox.p-disabled {
-    opacity: 1;
-}
-
-.p-checkbox.p-disabled .p-checkbox-box {
-    background: ${e("checkbox.disabled.background")};
-    border-color: ${e("checkbox.checked.disabled.border.color")};
-}
-
-.p-checkbox.p-disabled .p-checkbox-box .p-checkbox-icon {
-    color: ${e("checkbox.icon.disabled.color")};
-}
-
-.p-checkbox-sm,
-.p-checkbox-sm .p-checkbox-box {
-    width: ${e("checkbox.sm.width")};
-    height: ${e("checkbox.sm.height")};
-}
-
-.p-checkbox-sm .p-checkbox-icon {
-    font-size: ${e("checkbox.icon.sm.size")};
-    width: ${e("checkbox.icon.sm.size")};
-    height: ${e("checkbox.icon.sm.size")};
-}
-
-.p-checkbox-lg,
-.p-checkbox-lg .p-checkbox-box {
-    width: ${e("checkbox.lg.width")};
-    height: ${e("checkbox.lg.height")};
-}
-
-.p-checkbox-lg .p-checkbox-icon {
-    font-size: ${e("checkbox.icon.lg.size")};
-    width: ${e("checkbox.icon.lg.size")};
-    height: ${e("checkbox.icon.lg.size")};
-}
-`,Sp={root:function(t){var n=t.instance,o=t.props;return["p-checkbox p-component",{"p-checkbox-checked":n.checked,"p-disabled":o.disabled,"p-invalid":n.$pcCheckboxGroup?n.$pcCheckboxGroup.$invalid:n.$invalid,"p-variant-filled":n.$variant==="filled","p-checkbox-sm p-inputfield-sm":o.size==="small","p-checkbox-lg p-inputfield-lg":o.size==="large"}]},box:"p-checkbox-box",input:"p-checkbox-input",icon:"p-checkbox-icon"},$p=N.extend({name:"checkbox",style:Cp,classes:Sp}),kp={name:"BaseCheckbox",extends:it,props:{value:null,binary:Boolean,indeterminate:{type:Boolean,default:!1},trueValue:{type:null,default:!0},falseValue:{type:null,default:!1},readonly:{type:Boolean,default:!1},required:{type:Boolean,default:!1},tabindex:{type:Number,default:null},inputId:{type:String,default:null},inputClass:{type:[String,Object],default:null},inputStyle:{type:Object,default:null},ariaLabelledby:{type:String,default:null},ariaLabel:{type:String,default:null}},style:$p,provide:function(){return{$pcCheckbox:this,$parentInstance:this}}};function qt(e){"@babel/helpers - typeof";return qt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},qt(e)}function Ip(e,t,n){return(t=Pp(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Pp(e){var t=Op(e,"string");return qt(t)=="symbol"?t:t+""}function Op(e,t){if(qt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(qt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function xp(e){return Mp(e)||Tp(e)||Lp(e)||Rp()}function Rp(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Lp(e,t){if(e){if(typeof e=="string")return bo(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?bo(e,t):void 0}}function Tp(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function Mp(e){if(Array.isArray(e))return bo(e)}function bo(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var Fo={name:"Checkbox",extends:kp,inheritAttrs:!1,emits:["change","focus","blur","update:indeterminate"],inject:{$pcCheckboxGroup:{default:void 0}},data:function(){return{d_indeterminate:this.indeterminate}},watch:{indeterminate:function(t){this.d_indeterminate=t}},methods:{getPTOptions:function(t){var n=t==="root"?this.ptmi:this.ptm;return n(t,{context:{checked:this.checked,indeterminate:this.d_indeterminate,disabled:this.disabled}})},onChange:function(t){var n=this;if(!this.disabled&&!this.readonly){var o=this.$pcCheckboxGroup?this.$pcCheckboxGroup.d_value:this.d_value,i;this.binary?i=this.d_indeterminate?this.trueValue:this.checked?this.falseValue:this.trueValue:this.checked||this.d_indeterminate?i=o.filter(function(r){return!Ye(r,n.value)}):i=o?[].concat(xp(o),[this.value]):[this.value],this.d_indeterminate&&(this.d_indeterminate=!1,this.$emit("update:indeterminate",this.d_indeterminate)),this.$pcCheckboxGroup?this.$pcCheckboxGroup.writeValue(i,t):this.writeValue(i,t),this.$emit("change",t)}},onFocus:function(t){this.$emit("focus",t)},onBlur:function(t){var n,o;this.$emit("blur",t),(n=(o=this.formField).onBlur)===null||n===void 0||n.call(o,t)}},computed:{groupName:function(){return this.$pcCheckboxGroup?this.$pcCheckboxGroup.groupName:this.$formName},checked:function(){var t=this.$pcCheckboxGroup?this.$pcCheckboxGroup.d_value:this.d_value;return this.d_indeterminate?!1:this.binary?t===this.trueValue:pl(this.value,t)},dataP:function(){return re(Ip({invalid:this.$invalid,checked:this.checked,disabled:this.disabled,filled:this.$variant==="filled"},this.size,this.size))}},components:{CheckIcon:qe,MinusIcon:Qi}},Ep=["data-p-checked","data-p-indeterminate","data-p-disabled","data-p"],Dp=["id","value","name","checked","tabindex","disabled","readonly","required","aria-labelledby","aria-label","aria-invalid","aria-checked"],Fp=["data-p"];function Bp(e,t,n,o,i,r){var a=T("CheckIcon"),l=T("MinusIcon");return c(),b("div",f({class:e.cx("root")},r.getPTOptions("root"),{"data-p-checked":r.checked,"data-p-indeterminate":i.d_indeterminate||void 0,"data-p-disabled":e.disabled,"data-p":r.dataP}),[R("input",f({id:e.inputId,type:"checkbox",class:[e.cx("input"),e.inputClass],style:e.inputStyle,value:e.value,name:r.groupName,checked:r.checked,tabindex:e.tabindex,disabled:e.disabled,readonly:e.readonly,required:e.required,"aria-labelledby":e.ariaLabelledby,"aria-label":e.ariaLabel,"aria-invalid":e.invalid||void 0,"aria-checked":i.d_indeterminate?"mixed":void 0,onFocus:t[0]||(t[0]=function(){return r.onFocus&&r.onFocus.apply(r,arguments)}),onBlur:t[1]||(t[1]=function(){return r.onBlur&&r.onBlur.apply(r,arguments)}),onChange:t[2]||(t[2]=function(){return r.onChange&&r.onChange.apply(r,arguments)})},r.getPTOptions("input")),null,16,Dp),R("div",f({class:e.cx("box")},r.getPTOptions("box"),{"data-p":r.dataP}),[k(e.$slots,"icon",{checked:r.checked,indeterminate:i.d_indeterminate,class:j(e.cx("icon")),dataP:r.dataP},function(){return[r.checked?(c(),y(a,f({key:0,class:e.cx("icon")},r.getPTOptions("icon"),{"data-p":r.dataP}),null,16,["class","data-p"])):i.d_indeterminate?(c(),y(l,f({key:1,class:e.cx("icon")},r.getPTOptions("icon"),{"data-p":r.dataP}),null,16,["class","data-p"])):C("",!0)]})],16,Fp)],16,Ep)}Fo.render=Bp;var zp=({dt:e})=>`
-.p-radiobutton {
-    position: relative;
-    display: inline-flex;
-    user-select: none;
-    vertical-align: bottom;
-    width: ${e("radiobutton.width")};
-    height: ${e("radiobutton.height")};
-}
-
-.p-radiobutton-input {
-    cursor: pointer;
-    appearance: none;
-    position: absolute;
-    top: 0;
-    inset-inline-start: 0;
-    width: 100%;
-    height: 100%;
-    padding: 0;
-    margin: 0;
-    opacity: 0;
-    z-index: 1;
-    outline: 0 none;
-    border: 1px solid transparent;
-    border-radius: 50%;
-}
-
-.p-radiobutton-box {
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    border-radius: 50%;
-    border: 1px solid ${e("radiobutton.border.color")};
-    background: ${e("radiobutton.background")};
-    width: ${e("radiobutton.width")};
-    height: ${e("radiobutton.height")};
-    transition: background ${e("radiobutton.transition.duration")}, color ${e("radiobutton.transition.duration")}, border-color ${e("radiobutton.transition.duration")}, box-shadow ${e("radiobutton.transition.duration")}, outline-color ${e("radiobutton.transition.duration")};
-    outline-color: transparent;
-    box-shadow: ${e("radiobutton.shadow")};
-}
-
-.p-radiobutton-icon {
-    transition-duration: ${e("radiobutton.transition.duration")};
-    background: transparent;
-    font-size: ${e("radiobutton.icon.size")};
-    width: ${e("radiobutton.icon.size")};
-    height: ${e("radiobutton.icon.size")};
-    border-radius: 50%;
-    backface-visibility: hidden;
-    transform: translateZ(0) scale(0.1);
-}
-
-.p-radiobutton:not(.p-disabled):has(.p-radiobutton-input:hover) .p-radiobutton-box {
-    border-color: ${e("radiobutton.hover.border.color")};
-}
-
-.p-radiobutton-checked .p-radiobutton-box {
-    border-color: ${e("radiobutton.checked.border.color")};
-    background: ${e("radiobutton.checked.background")};
-}
-
-.p-radiobutton-checked .p-radiobutton-box .p-radiobutton-icon {
-    background: ${e("radiobutton.icon.checked.color")};
-    transform: translateZ(0) scale(1, 1);
-    visibility: visible;
-}
-
-.p-radiobutton-checked:not(.p-disabled):has(.p-radiobutton-input:hover) .p-radiobutton-box {
-    border-color: ${e("radiobutton.checked.hover.border.color")};
-    background: ${e("radiobutton.checked.hover.background")};
-}
-
-.p-radiobutton:not(.p-disabled):has(.p-radiobutton-input:hover).p-radiobutton-checked .p-radiobutton-box .p-radiobutton-icon {
-    background: ${e("radiobutton.icon.checked.hover.color")};
-}
-
-.p-radiobutton:not(.p-disabled):has(.p-radiobutton-input:focus-visible) .p-radiobutton-box {
-    border-color: ${e("radiobutton.focus.border.color")};
-    box-shadow: ${e("radiobutton.focus.ring.shadow")};
-    outline: ${e("radiobutton.focus.ring.width")} ${e("radiobutton.focus.ring.style")} ${e("radiobutton.focus.ring.color")};
-    outline-offset: ${e("radiobutton.focus.ring.offset")};
-}
-
-.p-radiobutton-checked:not(.p-disabled):has(.p-radiobutton-input:focus-visible) .p-radiobutton-box {
-    border-color: ${e("radiobutton.checked.focus.border.color")};
-}
-
-.p-radiobutton.p-invalid > .p-radiobutton-box {
-    border-color: ${e("radiobutton.invalid.border.color")};
-}
-
-.p-radiobutton.p-variant-filled .p-radiobutton-box {
-    background: ${e("radiobutton.filled.background")};
-}
-
-.p-radiobutton.p-variant-filled.p-radiobutton-checked .p-radiobutton-box {
-    background: ${e("radiobutton.checked.background")};
-}
-
-.p-radiobutton.p-variant-filled:not(.p-disabled):has(.p-radiobutton-input:hover).p-radiobutton-checked .p-radiobutton-box {
-    background: ${e("radiobutton.checked.hover.background")};
-}
-
-.p-radiobutton.p-disabled {
-    opacity: 1;
-}
-
-.p-radiobutton.p-disabled .p-radiobutton-box {
-    background: ${e("radiobutton.disabled.background")};
-    border-color: ${e("radiobutton.checked.disabled.border.color")};
-}
-
-.p-radiobutton-checked.p-disabled .p-radiobutton-box .p-radiobutton-icon {
-    background: ${e("radiobutton.icon.disabled.color")};
-}
-
-.p-radiobutton-sm,
-.p-radiobutton-sm .p-radiobutton-box {
-    width: ${e("radiobutton.sm.width")};
-    height: ${e("radiobutton.sm.height")};
-}
-
-.p-radiobutton-sm .p-radiobutton-icon {
-    font-size: ${e("radiobutton.icon.sm.size")};
-    width: ${e("radiobutton.icon.sm.size")};
-    height: ${e("radiobutton.icon.sm.size")};
-}
-
-.p-radiobutton-lg,
-.p-radiobutton-lg .p-radiobutton-box {
-    width: ${e("radiobutton.lg.width")};
-    height: ${e("radiobutton.lg.height")};
-}
-
-.p-radiobutton-lg .p-radiobutton-icon {
-    font-size: ${e("radiobutton.icon.lg.size")};
-    width: ${e("radiobutton.icon.lg.size")};
-    height: ${e("radiobutton.icon.lg.size")};
-}
-`,Ap={root:function(t){var n=t.instance,o=t.props;return["p-radiobutton p-component",{"p-radiobutton-checked":n.checked,"p-disabled":o.disabled,"p-invalid":n.$pcRadioButtonGroup?n.$pcRadioButtonGroup.$invalid:n.$invalid,"p-variant-filled":n.$variant==="filled","p-radiobutton-sm p-inputfield-sm":o.size==="small","p-radiobutton-lg p-inputfield-lg":o.size==="large"}]},box:"p-radiobutton-box",input:"p-radiobutton-input",icon:"p-radiobutton-icon"},jp=N.extend({name:"radiobutton",style:zp,classes:Ap}),Kp={name:"BaseRadioButton",extends:it,props:{value:null,binary:Boolean,readonly:{type:Boolean,default:!1},tabindex:{type:Number,default:null},inputId:{type:String,default:null},inputClass:{type:[String,Object],default:null},inputStyle:{type:Object,default:null},ariaLabelledby:{type:String,default:null},ariaLabel:{type:String,default:null}},style:jp,provide:function(){return{$pcRadioButton:this,$parentInstance:this}}};function Yt(e){"@babel/helpers - typeof";return Yt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Yt(e)}function Vp(e,t,n){return(t=Np(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Np(e){var t=Hp(e,"string");return Yt(t)=="symbol"?t:t+""}function Hp(e,t){if(Yt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Yt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var ea={name:"RadioButton",extends:Kp,inheritAttrs:!1,emits:["change","focus","blur"],inject:{$pcRadioButtonGroup:{default:void 0}},methods:{getPTOptions:function(t){var n=t==="root"?this.ptmi:this.ptm;return n(t,{context:{checked:this.checked,disabled:this.disabled}})},onChange:function(t){if(!this.disabled&&!this.readonly){var n=this.binary?!this.checked:this.value;this.$pcRadioButtonGroup?this.$pcRadioButtonGroup.writeValue(n,t):this.writeValue(n,t),this.$emit("change",t)}},onFocus:function(t){this.$emit("focus",t)},onBlur:function(t){var n,o;this.$emit("blur",t),(n=(o=this.formField).onBlur)===null||n===void 0||n.call(o,t)}},computed:{groupName:function(){return this.$pcRadioButtonGroup?this.$pcRadioButtonGroup.groupName:this.$formName},checked:function(){var t=this.$pcRadioButtonGroup?this.$pcRadioButtonGroup.d_value:this.d_value;return t!=null&&(this.binary?!!t:Ye(t,this.value))},dataP:function(){return re(Vp({invalid:this.$invalid,checked:this.checked,disabled:this.disabled,filled:this.$variant==="filled"},this.size,this.size))}}},Gp=["data-p-checked","data-p-disabled","data-p"],Up=["id","value","name","checked","tabindex","disabled","readonly","aria-labelledby","aria-label","aria-invalid"],_p=["data-p"],Wp=["data-p"];function Zp(e,t,n,o,i,r){return c(),b("div",f({class:e.cx("root")},r.getPTOptions("root"),{"data-p-checked":r.checked,"data-p-disabled":e.disabled,"data-p":r.dataP}),[R("input",f({id:e.inputId,type:"radio",class:[e.cx("input"),e.inputClass],style:e.inputStyle,value:e.value,name:r.groupName,checked:r.checked,tabindex:e.tabindex,disabled:e.disabled,readonly:e.readonly,"aria-labelledby":e.ariaLabelledby,"aria-label":e.ariaLabel,"aria-invalid":e.invalid||void 0,onFocus:t[0]||(t[0]=function(){return r.onFocus&&r.onFocus.apply(r,arguments)}),onBlur:t[1]||(t[1]=function(){return r.onBlur&&r.onBlur.apply(r,arguments)}),onChange:t[2]||(t[2]=function(){return r.onChange&&r.onChange.apply(r,arguments)})},r.getPTOptions("input")),null,16,Up),R("div",f({class:e.cx("box")},r.getPTOptions("box"),{"data-p":r.dataP}),[R("div",f({class:e.cx("icon")},r.getPTOptions("icon"),{"data-p":r.dataP}),null,16,Wp)],16,_p)],16,Gp)}ea.render=Zp;var ta={name:"FilterIcon",extends:J};function qp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M8.64708 14H5.35296C5.18981 13.9979 5.03395 13.9321 4.91858 13.8167C4.8032 13.7014 4.73745 13.5455 4.73531 13.3824V7L0.329431 0.98C0.259794 0.889466 0.217389 0.780968 0.20718 0.667208C0.19697 0.553448 0.219379 0.439133 0.271783 0.337647C0.324282 0.236453 0.403423 0.151519 0.500663 0.0920138C0.597903 0.0325088 0.709548 0.000692754 0.823548 0H13.1765C13.2905 0.000692754 13.4021 0.0325088 13.4994 0.0920138C13.5966 0.151519 13.6758 0.236453 13.7283 0.337647C13.7807 0.439133 13.8031 0.553448 13.7929 0.667208C13.7826 0.780968 13.7402 0.889466 13.6706 0.98L9.26472 7V13.3824C9.26259 13.5455 9.19683 13.7014 9.08146 13.8167C8.96609 13.9321 8.81022 13.9979 8.64708 14ZM5.97061 12.7647H8.02943V6.79412C8.02878 6.66289 8.07229 6.53527 8.15296 6.43177L11.9412 1.23529H2.05884L5.86355 6.43177C5.94422 6.53527 5.98773 6.66289 5.98708 6.79412L5.97061 12.7647Z",fill:"currentColor"},null,-1)]),16)}ta.render=qp;var na={name:"FilterFillIcon",extends:J};function Yp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M13.7274 0.33847C13.6228 0.130941 13.4095 0 13.1764 0H0.82351C0.590451 0 0.377157 0.130941 0.272568 0.33847C0.167157 0.545999 0.187746 0.795529 0.325275 0.98247L4.73527 6.99588V13.3824C4.73527 13.7233 5.01198 14 5.35292 14H8.64704C8.98798 14 9.26469 13.7233 9.26469 13.3824V6.99588L13.6747 0.98247C13.8122 0.795529 13.8328 0.545999 13.7274 0.33847Z",fill:"currentColor"},null,-1)]),16)}na.render=Yp;var oa={name:"FilterSlashIcon",extends:J};function Jp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M13.4994 0.0920138C13.5967 0.151519 13.6758 0.236453 13.7283 0.337647C13.7807 0.439133 13.8031 0.553448 13.7929 0.667208C13.7827 0.780968 13.7403 0.889466 13.6707 0.98L11.406 4.06823C11.3099 4.19928 11.1656 4.28679 11.005 4.3115C10.8444 4.33621 10.6805 4.2961 10.5495 4.2C10.4184 4.1039 10.3309 3.95967 10.3062 3.79905C10.2815 3.63843 10.3216 3.47458 10.4177 3.34353L11.9412 1.23529H7.41184C7.24803 1.23529 7.09093 1.17022 6.97509 1.05439C6.85926 0.938558 6.79419 0.781457 6.79419 0.617647C6.79419 0.453837 6.85926 0.296736 6.97509 0.180905C7.09093 0.0650733 7.24803 0 7.41184 0H13.1765C13.2905 0.000692754 13.4022 0.0325088 13.4994 0.0920138ZM4.20008 0.181168H4.24126L13.2013 9.03411C13.3169 9.14992 13.3819 9.3069 13.3819 9.47058C13.3819 9.63426 13.3169 9.79124 13.2013 9.90705C13.1445 9.96517 13.0766 10.0112 13.0016 10.0423C12.9266 10.0735 12.846 10.0891 12.7648 10.0882C12.6836 10.0886 12.6032 10.0728 12.5283 10.0417C12.4533 10.0106 12.3853 9.96479 12.3283 9.90705L9.3142 6.92587L9.26479 6.99999V13.3823C9.26265 13.5455 9.19689 13.7014 9.08152 13.8167C8.96615 13.9321 8.81029 13.9979 8.64714 14H5.35302C5.18987 13.9979 5.03401 13.9321 4.91864 13.8167C4.80327 13.7014 4.73751 13.5455 4.73537 13.3823V6.99999L0.329492 1.02117C0.259855 0.930634 0.21745 0.822137 0.207241 0.708376C0.197031 0.594616 0.21944 0.480301 0.271844 0.378815C0.324343 0.277621 0.403484 0.192687 0.500724 0.133182C0.597964 0.073677 0.709609 0.041861 0.823609 0.0411682H3.86243C3.92448 0.0461551 3.9855 0.060022 4.04361 0.0823446C4.10037 0.10735 4.15311 0.140655 4.20008 0.181168ZM8.02949 6.79411C8.02884 6.66289 8.07235 6.53526 8.15302 6.43176L8.42478 6.05293L3.55773 1.23529H2.0589L5.84714 6.43176C5.92781 6.53526 5.97132 6.66289 5.97067 6.79411V12.7647H8.02949V6.79411Z",fill:"currentColor"},null,-1)]),16)}oa.render=Jp;var ra={name:"PlusIcon",extends:J};function Xp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M7.67742 6.32258V0.677419C7.67742 0.497757 7.60605 0.325452 7.47901 0.198411C7.35197 0.0713707 7.17966 0 7 0C6.82034 0 6.64803 0.0713707 6.52099 0.198411C6.39395 0.325452 6.32258 0.497757 6.32258 0.677419V6.32258H0.677419C0.497757 6.32258 0.325452 6.39395 0.198411 6.52099C0.0713707 6.64803 0 6.82034 0 7C0 7.17966 0.0713707 7.35197 0.198411 7.47901C0.325452 7.60605 0.497757 7.67742 0.677419 7.67742H6.32258V13.3226C6.32492 13.5015 6.39704 13.6725 6.52358 13.799C6.65012 13.9255 6.82106 13.9977 7 14C7.17966 14 7.35197 13.9286 7.47901 13.8016C7.60605 13.6745 7.67742 13.5022 7.67742 13.3226V7.67742H13.3226C13.5022 7.67742 13.6745 7.60605 13.8016 7.47901C13.9286 7.35197 14 7.17966 14 7C13.9977 6.82106 13.9255 6.65012 13.799 6.52358C13.6725 6.39704 13.5015 6.32492 13.3226 6.32258H7.67742Z",fill:"currentColor"},null,-1)]),16)}ra.render=Xp;var ia={name:"TrashIcon",extends:J};function Qp(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M3.44802 13.9955H10.552C10.8056 14.0129 11.06 13.9797 11.3006 13.898C11.5412 13.8163 11.7632 13.6877 11.9537 13.5196C12.1442 13.3515 12.2995 13.1473 12.4104 12.9188C12.5213 12.6903 12.5858 12.442 12.6 12.1884V4.36041H13.4C13.5591 4.36041 13.7117 4.29722 13.8243 4.18476C13.9368 4.07229 14 3.91976 14 3.76071C14 3.60166 13.9368 3.44912 13.8243 3.33666C13.7117 3.22419 13.5591 3.16101 13.4 3.16101H12.0537C12.0203 3.1557 11.9863 3.15299 11.952 3.15299C11.9178 3.15299 11.8838 3.1557 11.8503 3.16101H11.2285C11.2421 3.10893 11.2487 3.05513 11.248 3.00106V1.80966C11.2171 1.30262 10.9871 0.828306 10.608 0.48989C10.229 0.151475 9.73159 -0.0236625 9.22402 0.00257442H4.77602C4.27251 -0.0171866 3.78126 0.160868 3.40746 0.498617C3.03365 0.836366 2.807 1.30697 2.77602 1.80966V3.00106C2.77602 3.0556 2.78346 3.10936 2.79776 3.16101H0.6C0.521207 3.16101 0.443185 3.17652 0.37039 3.20666C0.297595 3.2368 0.231451 3.28097 0.175736 3.33666C0.120021 3.39235 0.0758251 3.45846 0.0456722 3.53121C0.0155194 3.60397 0 3.68196 0 3.76071C0 3.83946 0.0155194 3.91744 0.0456722 3.9902C0.0758251 4.06296 0.120021 4.12907 0.175736 4.18476C0.231451 4.24045 0.297595 4.28462 0.37039 4.31476C0.443185 4.3449 0.521207 4.36041 0.6 4.36041H1.40002V12.1884C1.41426 12.442 1.47871 12.6903 1.58965 12.9188C1.7006 13.1473 1.85582 13.3515 2.04633 13.5196C2.23683 13.6877 2.45882 13.8163 2.69944 13.898C2.94005 13.9797 3.1945 14.0129 3.44802 13.9955ZM2.60002 4.36041H11.304V12.1884C11.304 12.5163 10.952 12.7961 10.504 12.7961H3.40002C2.97602 12.7961 2.60002 12.5163 2.60002 12.1884V4.36041ZM3.95429 3.16101C3.96859 3.10936 3.97602 3.0556 3.97602 3.00106V1.80966C3.97602 1.48183 4.33602 1.20197 4.77602 1.20197H9.24802C9.66403 1.20197 10.048 1.48183 10.048 1.80966V3.00106C10.0473 3.05515 10.054 3.10896 10.0678 3.16101H3.95429ZM5.57571 10.997C5.41731 10.995 5.26597 10.9311 5.15395 10.8191C5.04193 10.7071 4.97808 10.5558 4.97601 10.3973V6.77517C4.97601 6.61612 5.0392 6.46359 5.15166 6.35112C5.26413 6.23866 5.41666 6.17548 5.57571 6.17548C5.73476 6.17548 5.8873 6.23866 5.99976 6.35112C6.11223 6.46359 6.17541 6.61612 6.17541 6.77517V10.3894C6.17647 10.4688 6.16174 10.5476 6.13208 10.6213C6.10241 10.695 6.05841 10.762 6.00261 10.8186C5.94682 10.8751 5.88035 10.92 5.80707 10.9506C5.73378 10.9813 5.65514 10.9971 5.57571 10.997ZM7.99968 10.8214C8.11215 10.9339 8.26468 10.997 8.42373 10.997C8.58351 10.9949 8.73604 10.93 8.84828 10.8163C8.96052 10.7025 9.02345 10.5491 9.02343 10.3894V6.77517C9.02343 6.61612 8.96025 6.46359 8.84778 6.35112C8.73532 6.23866 8.58278 6.17548 8.42373 6.17548C8.26468 6.17548 8.11215 6.23866 7.99968 6.35112C7.88722 6.46359 7.82404 6.61612 7.82404 6.77517V10.3973C7.82404 10.5564 7.88722 10.7089 7.99968 10.8214Z",fill:"currentColor"},null,-1)]),16)}ia.render=Qp;var ef=N.extend({name:"focustrap-directive"}),tf=_.extend({style:ef});function Jt(e){"@babel/helpers - typeof";return Jt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Jt(e)}function xr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Rr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?xr(Object(n),!0).forEach(function(o){nf(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):xr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function nf(e,t,n){return(t=of(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function of(e){var t=rf(e,"string");return Jt(t)=="symbol"?t:t+""}function rf(e,t){if(Jt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Jt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var aa=tf.extend("focustrap",{mounted:function(t,n){var o=n.value||{},i=o.disabled;i||(this.createHiddenFocusableElements(t,n),this.bind(t,n),this.autoElementFocus(t,n)),t.setAttribute("data-pd-focustrap",!0),this.$el=t},updated:function(t,n){var o=n.value||{},i=o.disabled;i&&this.unbind(t)},unmounted:function(t){this.unbind(t)},methods:{getComputedSelector:function(t){return':not(.p-hidden-focusable):not([data-p-hidden-focusable="true"])'.concat(t!=null?t:"")},bind:function(t,n){var o=this,i=n.value||{},r=i.onFocusIn,a=i.onFocusOut;t.$_pfocustrap_mutationobserver=new MutationObserver(function(l){l.forEach(function(s){if(s.type==="childList"&&!t.contains(document.activeElement)){var u=function(p){var h=No(p)?No(p,o.getComputedSelector(t.$_pfocustrap_focusableselector))?p:et(t,o.getComputedSelector(t.$_pfocustrap_focusableselector)):et(p);return A(h)?h:p.nextSibling&&u(p.nextSibling)};te(u(s.nextSibling))}})}),t.$_pfocustrap_mutationobserver.disconnect(),t.$_pfocustrap_mutationobserver.observe(t,{childList:!0}),t.$_pfocustrap_focusinlistener=function(l){return r&&r(l)},t.$_pfocustrap_focusoutlistener=function(l){return a&&a(l)},t.addEventListener("focusin",t.$_pfocustrap_focusinlistener),t.addEventListener("focusout",t.$_pfocustrap_focusoutlistener)},unbind:function(t){t.$_pfocustrap_mutationobserver&&t.$_pfocustrap_mutationobserver.disconnect(),t.$_pfocustrap_focusinlistener&&t.removeEventListener("focusin",t.$_pfocustrap_focusinlistener)&&(t.$_pfocustrap_focusinlistener=null),t.$_pfocustrap_focusoutlistener&&t.removeEventListener("focusout",t.$_pfocustrap_focusoutlistener)&&(t.$_pfocustrap_focusoutlistener=null)},autoFocus:function(t){this.autoElementFocus(this.$el,{value:Rr(Rr({},t),{},{autoFocus:!0})})},autoElementFocus:function(t,n){var o=n.value||{},i=o.autoFocusSelector,r=i===void 0?"":i,a=o.firstFocusableSelector,l=a===void 0?"":a,s=o.autoFocus,u=s===void 0?!1:s,d=et(t,"[autofocus]".concat(this.getComputedSelector(r)));u&&!d&&(d=et(t,this.getComputedSelector(l))),te(d)},onFirstHiddenElementFocus:function(t){var n,o=t.currentTarget,i=t.relatedTarget,r=i===o.$_pfocustrap_lasthiddenfocusableelement||!((n=this.$el)!==null&&n!==void 0&&n.contains(i))?et(o.parentElement,this.getComputedSelector(o.$_pfocustrap_focusableselector)):o.$_pfocustrap_lasthiddenfocusableelement;te(r)},onLastHiddenElementFocus:function(t){var n,o=t.currentTarget,i=t.relatedTarget,r=i===o.$_pfocustrap_firsthiddenfocusableelement||!((n=this.$el)!==null&&n!==void 0&&n.contains(i))?ci(o.parentElement,this.getComputedSelector(o.$_pfocustrap_focusableselector)):o.$_pfocustrap_firsthiddenfocusableelement;te(r)},createHiddenFocusableElements:function(t,n){var o=this,i=n.value||{},r=i.tabIndex,a=r===void 0?0:r,l=i.firstFocusableSelector,s=l===void 0?"":l,u=i.lastFocusableSelector,d=u===void 0?"":u,p=function($){return di("span",{class:"p-hidden-accessible p-hidden-focusable",tabIndex:a,role:"presentation","aria-hidden":!0,"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0,onFocus:$==null?void 0:$.bind(o)})},h=p(this.onFirstHiddenElementFocus),m=p(this.onLastHiddenElementFocus);h.$_pfocustrap_lasthiddenfocusableelement=m,h.$_pfocustrap_focusableselector=s,h.setAttribute("data-pc-section","firstfocusableelement"),m.$_pfocustrap_firsthiddenfocusableelement=h,m.$_pfocustrap_focusableselector=d,m.setAttribute("data-pc-section","lastfocusableelement"),t.prepend(h),t.append(m)}}}),go={name:"SortAltIcon",extends:J};function af(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M5.64515 3.61291C5.47353 3.61291 5.30192 3.54968 5.16644 3.4142L3.38708 1.63484L1.60773 3.4142C1.34579 3.67613 0.912244 3.67613 0.650309 3.4142C0.388374 3.15226 0.388374 2.71871 0.650309 2.45678L2.90837 0.198712C3.17031 -0.0632236 3.60386 -0.0632236 3.86579 0.198712L6.12386 2.45678C6.38579 2.71871 6.38579 3.15226 6.12386 3.4142C5.98837 3.54968 5.81676 3.61291 5.64515 3.61291Z",fill:"currentColor"},null,-1),R("path",{d:"M3.38714 14C3.01681 14 2.70972 13.6929 2.70972 13.3226V0.677419C2.70972 0.307097 3.01681 0 3.38714 0C3.75746 0 4.06456 0.307097 4.06456 0.677419V13.3226C4.06456 13.6929 3.75746 14 3.38714 14Z",fill:"currentColor"},null,-1),R("path",{d:"M10.6129 14C10.4413 14 10.2697 13.9368 10.1342 13.8013L7.87611 11.5432C7.61418 11.2813 7.61418 10.8477 7.87611 10.5858C8.13805 10.3239 8.5716 10.3239 8.83353 10.5858L10.6129 12.3652L12.3922 10.5858C12.6542 10.3239 13.0877 10.3239 13.3497 10.5858C13.6116 10.8477 13.6116 11.2813 13.3497 11.5432L11.0916 13.8013C10.9561 13.9368 10.7845 14 10.6129 14Z",fill:"currentColor"},null,-1),R("path",{d:"M10.6129 14C10.2426 14 9.93552 13.6929 9.93552 13.3226V0.677419C9.93552 0.307097 10.2426 0 10.6129 0C10.9833 0 11.2904 0.307097 11.2904 0.677419V13.3226C11.2904 13.6929 10.9832 14 10.6129 14Z",fill:"currentColor"},null,-1)]),16)}go.render=af;var yo={name:"SortAmountDownIcon",extends:J};function lf(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M4.93953 10.5858L3.83759 11.6877V0.677419C3.83759 0.307097 3.53049 0 3.16017 0C2.78985 0 2.48275 0.307097 2.48275 0.677419V11.6877L1.38082 10.5858C1.11888 10.3239 0.685331 10.3239 0.423396 10.5858C0.16146 10.8477 0.16146 11.2813 0.423396 11.5432L2.68146 13.8013C2.74469 13.8645 2.81694 13.9097 2.89823 13.9458C2.97952 13.9819 3.06985 14 3.16017 14C3.25049 14 3.33178 13.9819 3.42211 13.9458C3.5034 13.9097 3.57565 13.8645 3.63888 13.8013L5.89694 11.5432C6.15888 11.2813 6.15888 10.8477 5.89694 10.5858C5.63501 10.3239 5.20146 10.3239 4.93953 10.5858ZM13.0957 0H7.22468C6.85436 0 6.54726 0.307097 6.54726 0.677419C6.54726 1.04774 6.85436 1.35484 7.22468 1.35484H13.0957C13.466 1.35484 13.7731 1.04774 13.7731 0.677419C13.7731 0.307097 13.466 0 13.0957 0ZM7.22468 5.41935H9.48275C9.85307 5.41935 10.1602 5.72645 10.1602 6.09677C10.1602 6.4671 9.85307 6.77419 9.48275 6.77419H7.22468C6.85436 6.77419 6.54726 6.4671 6.54726 6.09677C6.54726 5.72645 6.85436 5.41935 7.22468 5.41935ZM7.6763 8.12903H7.22468C6.85436 8.12903 6.54726 8.43613 6.54726 8.80645C6.54726 9.17677 6.85436 9.48387 7.22468 9.48387H7.6763C8.04662 9.48387 8.35372 9.17677 8.35372 8.80645C8.35372 8.43613 8.04662 8.12903 7.6763 8.12903ZM7.22468 2.70968H11.2892C11.6595 2.70968 11.9666 3.01677 11.9666 3.3871C11.9666 3.75742 11.6595 4.06452 11.2892 4.06452H7.22468C6.85436 4.06452 6.54726 3.75742 6.54726 3.3871C6.54726 3.01677 6.85436 2.70968 7.22468 2.70968Z",fill:"currentColor"},null,-1)]),16)}yo.render=lf;var vo={name:"SortAmountUpAltIcon",extends:J};function sf(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{d:"M3.63435 0.19871C3.57113 0.135484 3.49887 0.0903226 3.41758 0.0541935C3.255 -0.0180645 3.06532 -0.0180645 2.90274 0.0541935C2.82145 0.0903226 2.74919 0.135484 2.68597 0.19871L0.427901 2.45677C0.165965 2.71871 0.165965 3.15226 0.427901 3.41419C0.689836 3.67613 1.12338 3.67613 1.38532 3.41419L2.48726 2.31226V13.3226C2.48726 13.6929 2.79435 14 3.16467 14C3.535 14 3.84209 13.6929 3.84209 13.3226V2.31226L4.94403 3.41419C5.07951 3.54968 5.25113 3.6129 5.42274 3.6129C5.59435 3.6129 5.76597 3.54968 5.90145 3.41419C6.16338 3.15226 6.16338 2.71871 5.90145 2.45677L3.64338 0.19871H3.63435ZM13.7685 13.3226C13.7685 12.9523 13.4615 12.6452 13.0911 12.6452H7.22016C6.84984 12.6452 6.54274 12.9523 6.54274 13.3226C6.54274 13.6929 6.84984 14 7.22016 14H13.0911C13.4615 14 13.7685 13.6929 13.7685 13.3226ZM7.22016 8.58064C6.84984 8.58064 6.54274 8.27355 6.54274 7.90323C6.54274 7.5329 6.84984 7.22581 7.22016 7.22581H9.47823C9.84855 7.22581 10.1556 7.5329 10.1556 7.90323C10.1556 8.27355 9.84855 8.58064 9.47823 8.58064H7.22016ZM7.22016 5.87097H7.67177C8.0421 5.87097 8.34919 5.56387 8.34919 5.19355C8.34919 4.82323 8.0421 4.51613 7.67177 4.51613H7.22016C6.84984 4.51613 6.54274 4.82323 6.54274 5.19355C6.54274 5.56387 6.84984 5.87097 7.22016 5.87097ZM11.2847 11.2903H7.22016C6.84984 11.2903 6.54274 10.9832 6.54274 10.6129C6.54274 10.2426 6.84984 9.93548 7.22016 9.93548H11.2847C11.655 9.93548 11.9621 10.2426 11.9621 10.6129C11.9621 10.9832 11.655 11.2903 11.2847 11.2903Z",fill:"currentColor"},null,-1)]),16)}vo.render=sf;var uf={name:"BaseDataTable",extends:U,props:{value:{type:Array,default:null},dataKey:{type:[String,Function],default:null},rows:{type:Number,default:0},first:{type:Number,default:0},totalRecords:{type:Number,default:0},paginator:{type:Boolean,default:!1},paginatorPosition:{type:String,default:"bottom"},alwaysShowPaginator:{type:Boolean,default:!0},paginatorTemplate:{type:[Object,String],default:"FirstPageLink PrevPageLink PageLinks NextPageLink LastPageLink RowsPerPageDropdown"},pageLinkSize:{type:Number,default:5},rowsPerPageOptions:{type:Array,default:null},currentPageReportTemplate:{type:String,default:"({currentPage} of {totalPages})"},lazy:{type:Boolean,default:!1},loading:{type:Boolean,default:!1},loadingIcon:{type:String,default:void 0},sortField:{type:[String,Function],default:null},sortOrder:{type:Number,default:null},defaultSortOrder:{type:Number,default:1},nullSortOrder:{type:Number,default:1},multiSortMeta:{type:Array,default:null},sortMode:{type:String,default:"single"},removableSort:{type:Boolean,default:!1},filters:{type:Object,default:null},filterDisplay:{type:String,default:null},globalFilterFields:{type:Array,default:null},filterLocale:{type:String,default:void 0},selection:{type:[Array,Object],default:null},selectionMode:{type:String,default:null},compareSelectionBy:{type:String,default:"deepEquals"},metaKeySelection:{type:Boolean,default:!1},contextMenu:{type:Boolean,default:!1},contextMenuSelection:{type:Object,default:null},selectAll:{type:Boolean,default:null},rowHover:{type:Boolean,default:!1},csvSeparator:{type:String,default:","},exportFilename:{type:String,default:"download"},exportFunction:{type:Function,default:null},resizableColumns:{type:Boolean,default:!1},columnResizeMode:{type:String,default:"fit"},reorderableColumns:{type:Boolean,default:!1},expandedRows:{type:[Array,Object],default:null},expandedRowIcon:{type:String,default:void 0},collapsedRowIcon:{type:String,default:void 0},rowGroupMode:{type:String,default:null},groupRowsBy:{type:[Array,String,Function],default:null},expandableRowGroups:{type:Boolean,default:!1},expandedRowGroups:{type:Array,default:null},stateStorage:{type:String,default:"session"},stateKey:{type:String,default:null},editMode:{type:String,default:null},editingRows:{type:Array,default:null},rowClass:{type:Function,default:null},rowStyle:{type:Function,default:null},scrollable:{type:Boolean,default:!1},virtualScrollerOptions:{type:Object,default:null},scrollHeight:{type:String,default:null},frozenValue:{type:Array,default:null},breakpoint:{type:String,default:"960px"},showHeaders:{type:Boolean,default:!0},showGridlines:{type:Boolean,default:!1},stripedRows:{type:Boolean,default:!1},highlightOnSelect:{type:Boolean,default:!1},size:{type:String,default:null},tableStyle:{type:null,default:null},tableClass:{type:[String,Object],default:null},tableProps:{type:Object,default:null},filterInputProps:{type:null,default:null},filterButtonProps:{type:Object,default:function(){return{filter:{severity:"secondary",text:!0,rounded:!0},inline:{clear:{severity:"secondary",text:!0,rounded:!0}},popover:{addRule:{severity:"info",text:!0,size:"small"},removeRule:{severity:"danger",text:!0,size:"small"},apply:{size:"small"},clear:{outlined:!0,size:"small"}}}}},editButtonProps:{type:Object,default:function(){return{init:{severity:"secondary",text:!0,rounded:!0},save:{severity:"secondary",text:!0,rounded:!0},cancel:{severity:"secondary",text:!0,rounded:!0}}}}},style:bp,provide:function(){return{$pcDataTable:this,$parentInstance:this}}},la={name:"RowCheckbox",hostName:"DataTable",extends:U,emits:["change"],props:{value:null,checked:null,column:null,rowCheckboxIconTemplate:{type:Function,default:null},index:{type:Number,default:null}},methods:{getColumnPT:function(t){var n={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:this.index,checked:this.checked,disabled:this.$attrs.disabled}};return f(this.ptm("column.".concat(t),{column:n}),this.ptm("column.".concat(t),n),this.ptmo(this.getColumnProp(),t,n))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},onChange:function(t){this.$attrs.disabled||this.$emit("change",{originalEvent:t,data:this.value})}},computed:{checkboxAriaLabel:function(){return this.$primevue.config.locale.aria?this.checked?this.$primevue.config.locale.aria.selectRow:this.$primevue.config.locale.aria.unselectRow:void 0}},components:{CheckIcon:qe,Checkbox:Fo}};function df(e,t,n,o,i,r){var a=T("CheckIcon"),l=T("Checkbox");return c(),y(l,{modelValue:n.checked,binary:!0,disabled:e.$attrs.disabled,"aria-label":r.checkboxAriaLabel,onChange:r.onChange,unstyled:e.unstyled,pt:r.getColumnPT("pcRowCheckbox")},{icon:E(function(s){return[n.rowCheckboxIconTemplate?(c(),y(M(n.rowCheckboxIconTemplate),{key:0,checked:s.checked,class:j(s.class)},null,8,["checked","class"])):!n.rowCheckboxIconTemplate&&s.checked?(c(),y(a,f({key:1,class:s.class},r.getColumnPT("pcRowCheckbox.icon")),null,16,["class"])):C("",!0)]}),_:1},8,["modelValue","disabled","aria-label","onChange","unstyled","pt"])}la.render=df;var sa={name:"RowRadioButton",hostName:"DataTable",extends:U,emits:["change"],props:{value:null,checked:null,name:null,column:null,index:{type:Number,default:null}},methods:{getColumnPT:function(t){var n={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:this.index,checked:this.checked,disabled:this.$attrs.disabled}};return f(this.ptm("column.".concat(t),{column:n}),this.ptm("column.".concat(t),n),this.ptmo(this.getColumnProp(),t,n))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},onChange:function(t){this.$attrs.disabled||this.$emit("change",{originalEvent:t,data:this.value})}},components:{RadioButton:ea}};function cf(e,t,n,o,i,r){var a=T("RadioButton");return c(),y(a,{modelValue:n.checked,binary:!0,disabled:e.$attrs.disabled,name:n.name,onChange:r.onChange,unstyled:e.unstyled,pt:r.getColumnPT("pcRowRadiobutton")},null,8,["modelValue","disabled","name","onChange","unstyled","pt"])}sa.render=cf;function Bn(e){"@babel/helpers - typeof";return Bn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Bn(e)}function $t(){/*! regenerator-runtime -- Copyright (c) 2014-present, Facebook, Inc. -- license (MIT): https://github.com/facebook/regenerator/blob/main/LICENSE */$t=function(){return t};var e,t={},n=Object.prototype,o=n.hasOwnProperty,i=Object.defineProperty||function(x,S,O){x[S]=O.value},r=typeof Symbol=="function"?Symbol:{},a=r.iterator||"@@iterator",l=r.asyncIterator||"@@asyncIterator",s=r.toStringTag||"@@toStringTag";function u(x,S,O){return Object.defineProperty(x,S,{value:O,enumerable:!0,configurable:!0,writable:!0}),x[S]}try{u({},"")}catch(x){u=function(O,D,z){return O[D]=z}}function d(x,S,O,D){var z=S&&S.prototype instanceof I?S:I,B=Object.create(z.prototype),Q=new ge(D||[]);return i(B,"_invoke",{value:de(x,O,Q)}),B}function p(x,S,O){try{return{type:"normal",arg:x.call(S,O)}}catch(D){return{type:"throw",arg:D}}}t.wrap=d;var h="suspendedStart",m="suspendedYield",w="executing",$="completed",v={};function I(){}function P(){}function L(){}var g={};u(g,a,function(){return this});var F=Object.getPrototypeOf,G=F&&F(F(ae([])));G&&G!==n&&o.call(G,a)&&(g=G);var V=L.prototype=I.prototype=Object.create(g);function W(x){["next","throw","return"].forEach(function(S){u(x,S,function(O){return this._invoke(S,O)})})}function ie(x,S){function O(z,B,Q,ce){var se=p(x[z],x,B);if(se.type!=="throw"){var Fe=se.arg,Le=Fe.value;return Le&&Bn(Le)=="object"&&o.call(Le,"__await")?S.resolve(Le.__await).then(function(Ve){O("next",Ve,Q,ce)},function(Ve){O("throw",Ve,Q,ce)}):S.resolve(Le).then(function(Ve){Fe.value=Ve,Q(Fe)},function(Ve){return O("throw",Ve,Q,ce)})}ce(se.arg)}var D;i(this,"_invoke",{value:function(B,Q){function ce(){return new S(function(se,Fe){O(B,Q,se,Fe)})}return D=D?D.then(ce,ce):ce()}})}function de(x,S,O){var D=h;return function(z,B){if(D===w)throw Error("Generator is already running");if(D===$){if(z==="throw")throw B;return{value:e,done:!0}}for(O.method=z,O.arg=B;;){var Q=O.delegate;if(Q){var ce=X(Q,O);if(ce){if(ce===v)continue;return ce}}if(O.method==="next")O.sent=O._sent=O.arg;else if(O.method==="throw"){if(D===h)throw D=$,O.arg;O.dispatchException(O.arg)}else O.method==="return"&&O.abrupt("return",O.arg);D=w;var se=p(x,S,O);if(se.type==="normal"){if(D=O.done?$:m,se.arg===v)continue;return{value:se.arg,done:O.done}}se.type==="throw"&&(D=$,O.method="throw",O.arg=se.arg)}}}function X(x,S){var O=S.method,D=x.iterator[O];if(D===e)return S.delegate=null,O==="throw"&&x.iterator.return&&(S.method="return",S.arg=e,X(x,S),S.method==="throw")||O!=="return"&&(S.method="throw",S.arg=new TypeError("The iterator does not provide a '"+O+"' method")),v;var z=p(D,x.iterator,S.arg);if(z.type==="throw")return S.method="throw",S.arg=z.arg,S.delegate=null,v;var B=z.arg;return B?B.done?(S[x.resultName]=B.value,S.next=x.nextLoc,S.method!=="return"&&(S.method="next",S.arg=e),S.delegate=null,v):B:(S.method="throw",S.arg=new TypeError("iterator result is not an object"),S.delegate=null,v)}function le(x){var S={tryLoc:x[0]};1 in x&&(S.catchLoc=x[1]),2 in x&&(S.finallyLoc=x[2],S.afterLoc=x[3]),this.tryEntries.push(S)}function be(x){var S=x.completion||{};S.type="normal",delete S.arg,x.completion=S}function ge(x){this.tryEntries=[{tryLoc:"root"}],x.forEach(le,this),this.reset(!0)}function ae(x){if(x||x===""){var S=x[a];if(S)return S.call(x);if(typeof x.next=="function")return x;if(!isNaN(x.length)){var O=-1,D=function z(){for(;++O<x.length;)if(o.call(x,O))return z.value=x[O],z.done=!1,z;return z.value=e,z.done=!0,z};return D.next=D}}throw new TypeError(Bn(x)+" is not iterable")}return P.prototype=L,i(V,"constructor",{value:L,configurable:!0}),i(L,"constructor",{value:P,configurable:!0}),P.displayName=u(L,s,"GeneratorFunction"),t.isGeneratorFunction=function(x){var S=typeof x=="function"&&x.constructor;return!!S&&(S===P||(S.displayName||S.name)==="GeneratorFunction")},t.mark=function(x){return Object.setPrototypeOf?Object.setPrototypeOf(x,L):(x.__proto__=L,u(x,s,"GeneratorFunction")),x.prototype=Object.create(V),x},t.awrap=function(x){return{__await:x}},W(ie.prototype),u(ie.prototype,l,function(){return this}),t.AsyncIterator=ie,t.async=function(x,S,O,D,z){z===void 0&&(z=Promise);var B=new ie(d(x,S,O,D),z);return t.isGeneratorFunction(S)?B:B.next().then(function(Q){return Q.done?Q.value:B.next()})},W(V),u(V,s,"Generator"),u(V,a,function(){return this}),u(V,"toString",function(){return"[object Generator]"}),t.keys=function(x){var S=Object(x),O=[];for(var D in S)O.push(D);return O.reverse(),function z(){for(;O.length;){var B=O.pop();if(B in S)return z.value=B,z.done=!1,z}return z.done=!0,z}},t.values=ae,ge.prototype={constructor:ge,reset:function(S){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(be),!S)for(var O in this)O.charAt(0)==="t"&&o.call(this,O)&&!isNaN(+O.slice(1))&&(this[O]=e)},stop:function(){this.done=!0;var S=this.tryEntries[0].completion;if(S.type==="throw")throw S.arg;return this.rval},dispatchException:function(S){if(this.done)throw S;var O=this;function D(Fe,Le){return Q.type="throw",Q.arg=S,O.next=Fe,Le&&(O.method="next",O.arg=e),!!Le}for(var z=this.tryEntries.length-1;z>=0;--z){var B=this.tryEntries[z],Q=B.completion;if(B.tryLoc==="root")return D("end");if(B.tryLoc<=this.prev){var ce=o.call(B,"catchLoc"),se=o.call(B,"finallyLoc");if(ce&&se){if(this.prev<B.catchLoc)return D(B.catchLoc,!0);if(this.prev<B.finallyLoc)return D(B.finallyLoc)}else if(ce){if(this.prev<B.catchLoc)return D(B.catchLoc,!0)}else{if(!se)throw Error("try statement without catch or finally");if(this.prev<B.finallyLoc)return D(B.finallyLoc)}}}},abrupt:function(S,O){for(var D=this.tryEntries.length-1;D>=0;--D){var z=this.tryEntries[D];if(z.tryLoc<=this.prev&&o.call(z,"finallyLoc")&&this.prev<z.finallyLoc){var B=z;break}}B&&(S==="break"||S==="continue")&&B.tryLoc<=O&&O<=B.finallyLoc&&(B=null);var Q=B?B.completion:{};return Q.type=S,Q.arg=O,B?(this.method="next",this.next=B.finallyLoc,v):this.complete(Q)},complete:function(S,O){if(S.type==="throw")throw S.arg;return S.type==="break"||S.type==="continue"?this.next=S.arg:S.type==="return"?(this.rval=this.arg=S.arg,this.method="return",this.next="end"):S.type==="normal"&&O&&(this.next=O),v},finish:function(S){for(var O=this.tryEntries.length-1;O>=0;--O){var D=this.tryEntries[O];if(D.finallyLoc===S)return this.complete(D.completion,D.afterLoc),be(D),v}},catch:function(S){for(var O=this.tryEntries.length-1;O>=0;--O){var D=this.tryEntries[O];if(D.tryLoc===S){var z=D.completion;if(z.type==="throw"){var B=z.arg;be(D)}return B}}throw Error("illegal catch attempt")},delegateYield:function(S,O,D){return this.delegate={iterator:ae(S),resultName:O,nextLoc:D},this.method==="next"&&(this.arg=e),v}},t}function Lr(e,t,n,o,i,r,a){try{var l=e[r](a),s=l.value}catch(u){return void n(u)}l.done?t(s):Promise.resolve(s).then(o,i)}function Tr(e){return function(){var t=this,n=arguments;return new Promise(function(o,i){var r=e.apply(t,n);function a(s){Lr(r,o,i,a,l,"next",s)}function l(s){Lr(r,o,i,a,l,"throw",s)}a(void 0)})}}var ua={name:"BodyCell",hostName:"DataTable",extends:U,emits:["cell-edit-init","cell-edit-complete","cell-edit-cancel","row-edit-init","row-edit-save","row-edit-cancel","row-toggle","radio-change","checkbox-change","editing-meta-change"],props:{rowData:{type:Object,default:null},column:{type:Object,default:null},frozenRow:{type:Boolean,default:!1},rowIndex:{type:Number,default:null},index:{type:Number,default:null},isRowExpanded:{type:Boolean,default:!1},selected:{type:Boolean,default:!1},editing:{type:Boolean,default:!1},editingMeta:{type:Object,default:null},editMode:{type:String,default:null},virtualScrollerContentProps:{type:Object,default:null},ariaControls:{type:String,default:null},name:{type:String,default:null},expandedRowIcon:{type:String,default:null},collapsedRowIcon:{type:String,default:null},editButtonProps:{type:Object,default:null}},documentEditListener:null,selfClick:!1,overlayEventListener:null,editCompleteTimeout:null,data:function(){return{d_editing:this.editing,styleObject:{}}},watch:{editing:function(t){this.d_editing=t},"$data.d_editing":function(t){this.$emit("editing-meta-change",{data:this.rowData,field:this.field||"field_".concat(this.index),index:this.rowIndex,editing:t})}},mounted:function(){this.columnProp("frozen")&&this.updateStickyPosition()},updated:function(){var t=this;this.columnProp("frozen")&&this.updateStickyPosition(),this.d_editing&&(this.editMode==="cell"||this.editMode==="row"&&this.columnProp("rowEditor"))&&setTimeout(function(){var n=et(t.$el);n&&n.focus()},1)},beforeUnmount:function(){this.overlayEventListener&&(Ge.off("overlay-click",this.overlayEventListener),this.overlayEventListener=null)},methods:{columnProp:function(t){return Je(this.column,t)},getColumnPT:function(t){var n,o,i={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:this.index,size:(n=this.$parentInstance)===null||n===void 0||(n=n.$parentInstance)===null||n===void 0?void 0:n.size,showGridlines:(o=this.$parentInstance)===null||o===void 0||(o=o.$parentInstance)===null||o===void 0?void 0:o.showGridlines}};return f(this.ptm("column.".concat(t),{column:i}),this.ptm("column.".concat(t),i),this.ptmo(this.getColumnProp(),t,i))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},resolveFieldData:function(){return H(this.rowData,this.field)},toggleRow:function(t){this.$emit("row-toggle",{originalEvent:t,data:this.rowData})},toggleRowWithRadio:function(t,n){this.$emit("radio-change",{originalEvent:t.originalEvent,index:n,data:t.data})},toggleRowWithCheckbox:function(t,n){this.$emit("checkbox-change",{originalEvent:t.originalEvent,index:n,data:t.data})},isEditable:function(){return this.column.children&&this.column.children.editor!=null},bindDocumentEditListener:function(){var t=this;this.documentEditListener||(this.documentEditListener=function(n){t.selfClick=t.$el&&t.$el.contains(n.target),t.editCompleteTimeout&&clearTimeout(t.editCompleteTimeout),t.selfClick||(t.editCompleteTimeout=setTimeout(function(){t.completeEdit(n,"outside")},1))},document.addEventListener("mousedown",this.documentEditListener))},unbindDocumentEditListener:function(){this.documentEditListener&&(document.removeEventListener("mousedown",this.documentEditListener),this.documentEditListener=null,this.selfClick=!1,this.editCompleteTimeout&&(clearTimeout(this.editCompleteTimeout),this.editCompleteTimeout=null))},switchCellToViewMode:function(){this.d_editing=!1,this.unbindDocumentEditListener(),Ge.off("overlay-click",this.overlayEventListener),this.overlayEventListener=null},onClick:function(t){var n=this;this.editMode==="cell"&&this.isEditable()&&(this.d_editing||(this.d_editing=!0,this.bindDocumentEditListener(),this.$emit("cell-edit-init",{originalEvent:t,data:this.rowData,field:this.field,index:this.rowIndex}),this.overlayEventListener=function(o){n.selfClick=n.$el&&n.$el.contains(o.target)},Ge.on("overlay-click",this.overlayEventListener)))},completeEdit:function(t,n){var o={originalEvent:t,data:this.rowData,newData:this.editingRowData,value:this.rowData[this.field],newValue:this.editingRowData[this.field],field:this.field,index:this.rowIndex,type:n,defaultPrevented:!1,preventDefault:function(){this.defaultPrevented=!0}};this.$emit("cell-edit-complete",o),o.defaultPrevented||this.switchCellToViewMode()},onKeyDown:function(t){if(this.editMode==="cell")switch(t.code){case"Enter":case"NumpadEnter":this.completeEdit(t,"enter");break;case"Escape":this.switchCellToViewMode(),this.$emit("cell-edit-cancel",{originalEvent:t,data:this.rowData,field:this.field,index:this.rowIndex});break;case"Tab":this.completeEdit(t,"tab"),t.shiftKey?this.moveToPreviousCell(t):this.moveToNextCell(t);break}},moveToPreviousCell:function(t){var n=this;return Tr($t().mark(function o(){var i,r;return $t().wrap(function(l){for(;;)switch(l.prev=l.next){case 0:if(i=n.findCell(t.target),r=n.findPreviousEditableColumn(i),!r){l.next=7;break}return l.next=5,n.$nextTick();case 5:Vo(r,"click"),t.preventDefault();case 7:case"end":return l.stop()}},o)}))()},moveToNextCell:function(t){var n=this;return Tr($t().mark(function o(){var i,r;return $t().wrap(function(l){for(;;)switch(l.prev=l.next){case 0:if(i=n.findCell(t.target),r=n.findNextEditableColumn(i),!r){l.next=7;break}return l.next=5,n.$nextTick();case 5:Vo(r,"click"),t.preventDefault();case 7:case"end":return l.stop()}},o)}))()},findCell:function(t){if(t){for(var n=t;n&&!fe(n,"data-p-cell-editing");)n=n.parentElement;return n}else return null},findPreviousEditableColumn:function(t){var n=t.previousElementSibling;if(!n){var o=t.parentElement.previousElementSibling;o&&(n=o.lastElementChild)}return n?fe(n,"data-p-editable-column")?n:this.findPreviousEditableColumn(n):null},findNextEditableColumn:function(t){var n=t.nextElementSibling;if(!n){var o=t.parentElement.nextElementSibling;o&&(n=o.firstElementChild)}return n?fe(n,"data-p-editable-column")?n:this.findNextEditableColumn(n):null},onRowEditInit:function(t){this.$emit("row-edit-init",{originalEvent:t,data:this.rowData,newData:this.editingRowData,field:this.field,index:this.rowIndex})},onRowEditSave:function(t){this.$emit("row-edit-save",{originalEvent:t,data:this.rowData,newData:this.editingRowData,field:this.field,index:this.rowIndex})},onRowEditCancel:function(t){this.$emit("row-edit-cancel",{originalEvent:t,data:this.rowData,newData:this.editingRowData,field:this.field,index:this.rowIndex})},editorInitCallback:function(t){this.$emit("row-edit-init",{originalEvent:t,data:this.rowData,newData:this.editingRowData,field:this.field,index:this.rowIndex})},editorSaveCallback:function(t){this.editMode==="row"?this.$emit("row-edit-save",{originalEvent:t,data:this.rowData,newData:this.editingRowData,field:this.field,index:this.rowIndex}):this.completeEdit(t,"enter")},editorCancelCallback:function(t){this.editMode==="row"?this.$emit("row-edit-cancel",{originalEvent:t,data:this.rowData,newData:this.editingRowData,field:this.field,index:this.rowIndex}):(this.switchCellToViewMode(),this.$emit("cell-edit-cancel",{originalEvent:t,data:this.rowData,field:this.field,index:this.rowIndex}))},updateStickyPosition:function(){if(this.columnProp("frozen")){var t=this.columnProp("alignFrozen");if(t==="right"){var n=0,o=An(this.$el,'[data-p-frozen-column="true"]');o&&(n=ve(o)+parseFloat(o.style["inset-inline-end"]||0)),this.styleObject.insetInlineEnd=n+"px"}else{var i=0,r=jn(this.$el,'[data-p-frozen-column="true"]');r&&(i=ve(r)+parseFloat(r.style["inset-inline-start"]||0)),this.styleObject.insetInlineStart=i+"px"}}},getVirtualScrollerProp:function(t){return this.virtualScrollerContentProps?this.virtualScrollerContentProps[t]:null}},computed:{editingRowData:function(){return this.editingMeta[this.rowIndex]?this.editingMeta[this.rowIndex].data:this.rowData},field:function(){return this.columnProp("field")},containerClass:function(){return[this.columnProp("bodyClass"),this.columnProp("class"),this.cx("bodyCell")]},containerStyle:function(){var t=this.columnProp("bodyStyle"),n=this.columnProp("style");return this.columnProp("frozen")?[n,t,this.styleObject]:[n,t]},loading:function(){return this.getVirtualScrollerProp("loading")},loadingOptions:function(){var t=this.getVirtualScrollerProp("getLoaderOptions");return t&&t(this.rowIndex,{cellIndex:this.index,cellFirst:this.index===0,cellLast:this.index===this.getVirtualScrollerProp("columns").length-1,cellEven:this.index%2===0,cellOdd:this.index%2!==0,column:this.column,field:this.field})},expandButtonAriaLabel:function(){return this.$primevue.config.locale.aria?this.isRowExpanded?this.$primevue.config.locale.aria.expandRow:this.$primevue.config.locale.aria.collapseRow:void 0},initButtonAriaLabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.editRow:void 0},saveButtonAriaLabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.saveEdit:void 0},cancelButtonAriaLabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.cancelEdit:void 0}},components:{DTRadioButton:sa,DTCheckbox:la,Button:gn,ChevronDownIcon:vn,ChevronRightIcon:Eo,BarsIcon:Do,PencilIcon:Xi,CheckIcon:qe,TimesIcon:yn},directives:{ripple:Re}};function Xt(e){"@babel/helpers - typeof";return Xt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Xt(e)}function Mr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function $n(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Mr(Object(n),!0).forEach(function(o){pf(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Mr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function pf(e,t,n){return(t=ff(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ff(e){var t=hf(e,"string");return Xt(t)=="symbol"?t:t+""}function hf(e,t){if(Xt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Xt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var mf=["colspan","rowspan","data-p-selection-column","data-p-editable-column","data-p-cell-editing","data-p-frozen-column"],bf=["aria-expanded","aria-controls","aria-label"];function gf(e,t,n,o,i,r){var a=T("DTRadioButton"),l=T("DTCheckbox"),s=T("BarsIcon"),u=T("ChevronDownIcon"),d=T("ChevronRightIcon"),p=T("Button"),h=ke("ripple");return r.loading?(c(),b("td",f({key:0,style:r.containerStyle,class:r.containerClass,role:"cell"},$n($n({},r.getColumnPT("root")),r.getColumnPT("bodyCell"))),[(c(),y(M(n.column.children.loading),{data:n.rowData,column:n.column,field:r.field,index:n.rowIndex,frozenRow:n.frozenRow,loadingOptions:r.loadingOptions},null,8,["data","column","field","index","frozenRow","loadingOptions"]))],16)):(c(),b("td",f({key:1,style:r.containerStyle,class:r.containerClass,colspan:r.columnProp("colspan"),rowspan:r.columnProp("rowspan"),onClick:t[3]||(t[3]=function(){return r.onClick&&r.onClick.apply(r,arguments)}),onKeydown:t[4]||(t[4]=function(){return r.onKeyDown&&r.onKeyDown.apply(r,arguments)}),role:"cell"},$n($n({},r.getColumnPT("root")),r.getColumnPT("bodyCell")),{"data-p-selection-column":r.columnProp("selectionMode")!=null,"data-p-editable-column":r.isEditable(),"data-p-cell-editing":i.d_editing,"data-p-frozen-column":r.columnProp("frozen")}),[n.column.children&&n.column.children.body&&!i.d_editing?(c(),y(M(n.column.children.body),{key:0,data:n.rowData,column:n.column,field:r.field,index:n.rowIndex,frozenRow:n.frozenRow,editorInitCallback:r.editorInitCallback,rowTogglerCallback:r.toggleRow},null,8,["data","column","field","index","frozenRow","editorInitCallback","rowTogglerCallback"])):n.column.children&&n.column.children.editor&&i.d_editing?(c(),y(M(n.column.children.editor),{key:1,data:r.editingRowData,column:n.column,field:r.field,index:n.rowIndex,frozenRow:n.frozenRow,editorSaveCallback:r.editorSaveCallback,editorCancelCallback:r.editorCancelCallback},null,8,["data","column","field","index","frozenRow","editorSaveCallback","editorCancelCallback"])):n.column.children&&n.column.children.body&&!n.column.children.editor&&i.d_editing?(c(),y(M(n.column.children.body),{key:2,data:r.editingRowData,column:n.column,field:r.field,index:n.rowIndex,frozenRow:n.frozenRow},null,8,["data","column","field","index","frozenRow"])):r.columnProp("selectionMode")?(c(),b(K,{key:3},[r.columnProp("selectionMode")==="single"?(c(),y(a,{key:0,value:n.rowData,name:n.name,checked:n.selected,onChange:t[0]||(t[0]=function(m){return r.toggleRowWithRadio(m,n.rowIndex)}),column:n.column,index:n.index,unstyled:e.unstyled,pt:e.pt},null,8,["value","name","checked","column","index","unstyled","pt"])):r.columnProp("selectionMode")==="multiple"?(c(),y(l,{key:1,value:n.rowData,checked:n.selected,rowCheckboxIconTemplate:n.column.children&&n.column.children.rowcheckboxicon,"aria-selected":n.selected?!0:void 0,onChange:t[1]||(t[1]=function(m){return r.toggleRowWithCheckbox(m,n.rowIndex)}),column:n.column,index:n.index,unstyled:e.unstyled,pt:e.pt},null,8,["value","checked","rowCheckboxIconTemplate","aria-selected","column","index","unstyled","pt"])):C("",!0)],64)):r.columnProp("rowReorder")?(c(),b(K,{key:4},[n.column.children&&n.column.children.rowreordericon?(c(),y(M(n.column.children.rowreordericon),{key:0,class:j(e.cx("reorderableRowHandle"))},null,8,["class"])):r.columnProp("rowReorderIcon")?(c(),b("i",f({key:1,class:[e.cx("reorderableRowHandle"),r.columnProp("rowReorderIcon")]},r.getColumnPT("reorderableRowHandle")),null,16)):(c(),y(s,f({key:2,class:e.cx("reorderableRowHandle")},r.getColumnPT("reorderableRowHandle")),null,16,["class"]))],64)):r.columnProp("expander")?Ie((c(),b("button",f({key:5,class:e.cx("rowToggleButton"),type:"button","aria-expanded":n.isRowExpanded,"aria-controls":n.ariaControls,"aria-label":r.expandButtonAriaLabel,onClick:t[2]||(t[2]=function(){return r.toggleRow&&r.toggleRow.apply(r,arguments)}),"data-p-selected":"selected"},r.getColumnPT("rowToggleButton"),{"data-pc-group-section":"rowactionbutton"}),[n.column.children&&n.column.children.rowtoggleicon?(c(),y(M(n.column.children.rowtoggleicon),{key:0,class:j(e.cx("rowToggleIcon")),rowExpanded:n.isRowExpanded},null,8,["class","rowExpanded"])):n.column.children&&n.column.children.rowtogglericon?(c(),y(M(n.column.children.rowtogglericon),{key:1,class:j(e.cx("rowToggleIcon")),rowExpanded:n.isRowExpanded},null,8,["class","rowExpanded"])):(c(),b(K,{key:2},[n.isRowExpanded&&n.expandedRowIcon?(c(),b("span",{key:0,class:j([e.cx("rowToggleIcon"),n.expandedRowIcon])},null,2)):n.isRowExpanded&&!n.expandedRowIcon?(c(),y(u,f({key:1,class:e.cx("rowToggleIcon")},r.getColumnPT("rowToggleIcon")),null,16,["class"])):!n.isRowExpanded&&n.collapsedRowIcon?(c(),b("span",{key:2,class:j([e.cx("rowToggleIcon"),n.collapsedRowIcon])},null,2)):!n.isRowExpanded&&!n.collapsedRowIcon?(c(),y(d,f({key:3,class:e.cx("rowToggleIcon")},r.getColumnPT("rowToggleIcon")),null,16,["class"])):C("",!0)],64))],16,bf)),[[h]]):n.editMode==="row"&&r.columnProp("rowEditor")?(c(),b(K,{key:6},[i.d_editing?C("",!0):(c(),y(p,f({key:0,class:e.cx("pcRowEditorInit"),"aria-label":r.initButtonAriaLabel,unstyled:e.unstyled,onClick:r.onRowEditInit},n.editButtonProps.init,{pt:r.getColumnPT("pcRowEditorInit"),"data-pc-group-section":"rowactionbutton"}),{icon:E(function(m){return[(c(),y(M(n.column.children&&n.column.children.roweditoriniticon||"PencilIcon"),f({class:m.class},r.getColumnPT("pcRowEditorInit").icon),null,16,["class"]))]}),_:1},16,["class","aria-label","unstyled","onClick","pt"])),i.d_editing?(c(),y(p,f({key:1,class:e.cx("pcRowEditorSave"),"aria-label":r.saveButtonAriaLabel,unstyled:e.unstyled,onClick:r.onRowEditSave},n.editButtonProps.save,{pt:r.getColumnPT("pcRowEditorSave"),"data-pc-group-section":"rowactionbutton"}),{icon:E(function(m){return[(c(),y(M(n.column.children&&n.column.children.roweditorsaveicon||"CheckIcon"),f({class:m.class},r.getColumnPT("pcRowEditorSave").icon),null,16,["class"]))]}),_:1},16,["class","aria-label","unstyled","onClick","pt"])):C("",!0),i.d_editing?(c(),y(p,f({key:2,class:e.cx("pcRowEditorCancel"),"aria-label":r.cancelButtonAriaLabel,unstyled:e.unstyled,onClick:r.onRowEditCancel},n.editButtonProps.cancel,{pt:r.getColumnPT("pcRowEditorCancel"),"data-pc-group-section":"rowactionbutton"}),{icon:E(function(m){return[(c(),y(M(n.column.children&&n.column.children.roweditorcancelicon||"TimesIcon"),f({class:m.class},r.getColumnPT("pcRowEditorCancel").icon),null,16,["class"]))]}),_:1},16,["class","aria-label","unstyled","onClick","pt"])):C("",!0)],64)):(c(),b(K,{key:7},[Ee(Y(r.resolveFieldData()),1)],64))],16,mf))}ua.render=gf;function Qt(e){"@babel/helpers - typeof";return Qt=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Qt(e)}function yf(e,t){var n=typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(!n){if(Array.isArray(e)||(n=vf(e))||t){n&&(e=n);var o=0,i=function(){};return{s:i,n:function(){return o>=e.length?{done:!0}:{done:!1,value:e[o++]}},e:function(u){throw u},f:i}}throw new TypeError(`Invalid attempt to iterate non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var r,a=!0,l=!1;return{s:function(){n=n.call(e)},n:function(){var u=n.next();return a=u.done,u},e:function(u){l=!0,r=u},f:function(){try{a||n.return==null||n.return()}finally{if(l)throw r}}}}function vf(e,t){if(e){if(typeof e=="string")return Er(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Er(e,t):void 0}}function Er(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}function Dr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Fr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Dr(Object(n),!0).forEach(function(o){wf(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Dr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function wf(e,t,n){return(t=Cf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Cf(e){var t=Sf(e,"string");return Qt(t)=="symbol"?t:t+""}function Sf(e,t){if(Qt(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(Qt(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var da={name:"BodyRow",hostName:"DataTable",extends:U,emits:["rowgroup-toggle","row-click","row-dblclick","row-rightclick","row-touchend","row-keydown","row-mousedown","row-dragstart","row-dragover","row-dragleave","row-dragend","row-drop","row-toggle","radio-change","checkbox-change","cell-edit-init","cell-edit-complete","cell-edit-cancel","row-edit-init","row-edit-save","row-edit-cancel","editing-meta-change"],props:{rowData:{type:Object,default:null},index:{type:Number,default:0},value:{type:Array,default:null},columns:{type:null,default:null},frozenRow:{type:Boolean,default:!1},empty:{type:Boolean,default:!1},rowGroupMode:{type:String,default:null},groupRowsBy:{type:[Array,String,Function],default:null},expandableRowGroups:{type:Boolean,default:!1},expandedRowGroups:{type:Array,default:null},first:{type:Number,default:0},dataKey:{type:[String,Function],default:null},expandedRowIcon:{type:String,default:null},collapsedRowIcon:{type:String,default:null},expandedRows:{type:[Array,Object],default:null},selection:{type:[Array,Object],default:null},selectionKeys:{type:null,default:null},selectionMode:{type:String,default:null},contextMenu:{type:Boolean,default:!1},contextMenuSelection:{type:Object,default:null},rowClass:{type:null,default:null},rowStyle:{type:null,default:null},rowGroupHeaderStyle:{type:null,default:null},editMode:{type:String,default:null},compareSelectionBy:{type:String,default:"deepEquals"},editingRows:{type:Array,default:null},editingRowKeys:{type:null,default:null},editingMeta:{type:Object,default:null},templates:{type:null,default:null},scrollable:{type:Boolean,default:!1},editButtonProps:{type:Object,default:null},virtualScrollerContentProps:{type:Object,default:null},isVirtualScrollerDisabled:{type:Boolean,default:!1},expandedRowId:{type:String,default:null},nameAttributeSelector:{type:String,default:null}},data:function(){return{d_rowExpanded:!1}},watch:{expandedRows:{deep:!0,immediate:!0,handler:function(t){var n=this;this.d_rowExpanded=this.dataKey?(t==null?void 0:t[H(this.rowData,this.dataKey)])!==void 0:t==null?void 0:t.some(function(o){return n.equals(n.rowData,o)})}}},methods:{columnProp:function(t,n){return Je(t,n)},getColumnPT:function(t){var n={parent:{instance:this,props:this.$props,state:this.$data}};return f(this.ptm("column.".concat(t),{column:n}),this.ptm("column.".concat(t),n),this.ptmo(this.columnProp({},"pt"),t,n))},getBodyRowPTOptions:function(t){var n,o=(n=this.$parentInstance)===null||n===void 0?void 0:n.$parentInstance;return this.ptm(t,{context:{index:this.rowIndex,selectable:(o==null?void 0:o.rowHover)||(o==null?void 0:o.selectionMode),selected:this.isSelected,stripedRows:(o==null?void 0:o.stripedRows)||!1}})},shouldRenderBodyCell:function(t){var n=this.columnProp(t,"hidden");if(this.rowGroupMode&&!n){var o=this.columnProp(t,"field");if(this.rowGroupMode==="subheader")return this.groupRowsBy!==o;if(this.rowGroupMode==="rowspan")if(this.isGrouped(t)){var i=this.value[this.rowIndex-1];if(i){var r=H(this.value[this.rowIndex],o),a=H(i,o);return r!==a}else return!0}else return!0}else return!n},calculateRowGroupSize:function(t){if(this.isGrouped(t)){var n=this.rowIndex,o=this.columnProp(t,"field"),i=H(this.value[n],o),r=i,a=0;for(this.d_rowExpanded&&a++;i===r;){a++;var l=this.value[++n];if(l)r=H(l,o);else break}return a===1?null:a}else return null},isGrouped:function(t){var n=this.columnProp(t,"field");return this.groupRowsBy&&n?Array.isArray(this.groupRowsBy)?this.groupRowsBy.indexOf(n)>-1:this.groupRowsBy===n:!1},findIndexInSelection:function(t){return this.findIndex(t,this.selection)},findIndex:function(t,n){var o=-1;if(n&&n.length){for(var i=0;i<n.length;i++)if(this.equals(t,n[i])){o=i;break}}return o},equals:function(t,n){return this.compareSelectionBy==="equals"?t===n:Ye(t,n,this.dataKey)},onRowGroupToggle:function(t){this.$emit("rowgroup-toggle",{originalEvent:t,data:this.rowData})},onRowClick:function(t){this.$emit("row-click",{originalEvent:t,data:this.rowData,index:this.rowIndex})},onRowDblClick:function(t){this.$emit("row-dblclick",{originalEvent:t,data:this.rowData,index:this.rowIndex})},onRowRightClick:function(t){this.$emit("row-rightclick",{originalEvent:t,data:this.rowData,index:this.rowIndex})},onRowTouchEnd:function(t){this.$emit("row-touchend",t)},onRowKeyDown:function(t){this.$emit("row-keydown",{originalEvent:t,data:this.rowData,index:this.rowIndex})},onRowMouseDown:function(t){this.$emit("row-mousedown",t)},onRowDragStart:function(t){this.$emit("row-dragstart",{originalEvent:t,index:this.rowIndex})},onRowDragOver:function(t){this.$emit("row-dragover",{originalEvent:t,index:this.rowIndex})},onRowDragLeave:function(t){this.$emit("row-dragleave",t)},onRowDragEnd:function(t){this.$emit("row-dragend",t)},onRowDrop:function(t){this.$emit("row-drop",t)},onRowToggle:function(t){this.d_rowExpanded=!this.d_rowExpanded,this.$emit("row-toggle",Fr(Fr({},t),{},{expanded:this.d_rowExpanded}))},onRadioChange:function(t){this.$emit("radio-change",t)},onCheckboxChange:function(t){this.$emit("checkbox-change",t)},onCellEditInit:function(t){this.$emit("cell-edit-init",t)},onCellEditComplete:function(t){this.$emit("cell-edit-complete",t)},onCellEditCancel:function(t){this.$emit("cell-edit-cancel",t)},onRowEditInit:function(t){this.$emit("row-edit-init",t)},onRowEditSave:function(t){this.$emit("row-edit-save",t)},onRowEditCancel:function(t){this.$emit("row-edit-cancel",t)},onEditingMetaChange:function(t){this.$emit("editing-meta-change",t)},getVirtualScrollerProp:function(t,n){return n=n||this.virtualScrollerContentProps,n?n[t]:null}},computed:{rowIndex:function(){var t=this.getVirtualScrollerProp("getItemOptions");return t?t(this.index).index:this.index},rowStyles:function(){var t;return(t=this.rowStyle)===null||t===void 0?void 0:t.call(this,this.rowData)},rowClasses:function(){var t=[],n=null;if(this.rowClass){var o=this.rowClass(this.rowData);o&&t.push(o)}if(this.columns){var i=yf(this.columns),r;try{for(i.s();!(r=i.n()).done;){var a=r.value,l=this.columnProp(a,"selectionMode");if(A(l)){n=l;break}}}catch(s){i.e(s)}finally{i.f()}}return[this.cx("row",{rowData:this.rowData,index:this.rowIndex,columnSelectionMode:n}),t]},rowTabindex:function(){return this.selection===null&&(this.selectionMode==="single"||this.selectionMode==="multiple")&&this.rowIndex===0?0:-1},isRowEditing:function(){return this.rowData&&this.editingRows?this.dataKey?this.editingRowKeys?this.editingRowKeys[H(this.rowData,this.dataKey)]!==void 0:!1:this.findIndex(this.rowData,this.editingRows)>-1:!1},isRowGroupExpanded:function(){if(this.expandableRowGroups&&this.expandedRowGroups){var t=H(this.rowData,this.groupRowsBy);return this.expandedRowGroups.indexOf(t)>-1}return!1},isSelected:function(){return this.rowData&&this.selection?this.dataKey?this.selectionKeys?this.selectionKeys[H(this.rowData,this.dataKey)]!==void 0:!1:this.selection instanceof Array?this.findIndexInSelection(this.rowData)>-1:this.equals(this.rowData,this.selection):!1},isSelectedWithContextMenu:function(){return this.rowData&&this.contextMenuSelection?this.equals(this.rowData,this.contextMenuSelection,this.dataKey):!1},shouldRenderRowGroupHeader:function(){var t=H(this.rowData,this.groupRowsBy),n=this.value[this.rowIndex-1];if(n){var o=H(n,this.groupRowsBy);return t!==o}else return!0},shouldRenderRowGroupFooter:function(){if(this.expandableRowGroups&&!this.isRowGroupExpanded)return!1;var t=H(this.rowData,this.groupRowsBy),n=this.value[this.rowIndex+1];if(n){var o=H(n,this.groupRowsBy);return t!==o}else return!0},columnsLength:function(){var t=this;if(this.columns){var n=0;return this.columns.forEach(function(o){t.columnProp(o,"hidden")&&n++}),this.columns.length-n}return 0}},components:{DTBodyCell:ua,ChevronDownIcon:vn,ChevronRightIcon:Eo}};function en(e){"@babel/helpers - typeof";return en=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},en(e)}function Br(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Ue(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Br(Object(n),!0).forEach(function(o){$f(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Br(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function $f(e,t,n){return(t=kf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function kf(e){var t=If(e,"string");return en(t)=="symbol"?t:t+""}function If(e,t){if(en(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(en(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Pf=["colspan"],Of=["tabindex","aria-selected","data-p-index","data-p-selectable-row","data-p-selected","data-p-selected-contextmenu"],xf=["id"],Rf=["colspan"],Lf=["colspan"],Tf=["colspan"];function Mf(e,t,n,o,i,r){var a=T("ChevronDownIcon"),l=T("ChevronRightIcon"),s=T("DTBodyCell");return n.empty?(c(),b("tr",f({key:1,class:e.cx("emptyMessage"),role:"row"},e.ptm("emptyMessage")),[R("td",f({colspan:r.columnsLength},Ue(Ue({},r.getColumnPT("bodycell")),e.ptm("emptyMessageCell"))),[n.templates.empty?(c(),y(M(n.templates.empty),{key:0})):C("",!0)],16,Tf)],16)):(c(),b(K,{key:0},[n.templates.groupheader&&n.rowGroupMode==="subheader"&&r.shouldRenderRowGroupHeader?(c(),b("tr",f({key:0,class:e.cx("rowGroupHeader"),style:n.rowGroupHeaderStyle,role:"row"},e.ptm("rowGroupHeader")),[R("td",f({colspan:r.columnsLength-1},Ue(Ue({},r.getColumnPT("bodycell")),e.ptm("rowGroupHeaderCell"))),[n.expandableRowGroups?(c(),b("button",f({key:0,class:e.cx("rowToggleButton"),onClick:t[0]||(t[0]=function(){return r.onRowGroupToggle&&r.onRowGroupToggle.apply(r,arguments)}),type:"button"},e.ptm("rowToggleButton")),[n.templates.rowtoggleicon||n.templates.rowgrouptogglericon?(c(),y(M(n.templates.rowtoggleicon||n.templates.rowgrouptogglericon),{key:0,expanded:r.isRowGroupExpanded},null,8,["expanded"])):(c(),b(K,{key:1},[r.isRowGroupExpanded&&n.expandedRowIcon?(c(),b("span",f({key:0,class:[e.cx("rowToggleIcon"),n.expandedRowIcon]},e.ptm("rowToggleIcon")),null,16)):r.isRowGroupExpanded&&!n.expandedRowIcon?(c(),y(a,f({key:1,class:e.cx("rowToggleIcon")},e.ptm("rowToggleIcon")),null,16,["class"])):!r.isRowGroupExpanded&&n.collapsedRowIcon?(c(),b("span",f({key:2,class:[e.cx("rowToggleIcon"),n.collapsedRowIcon]},e.ptm("rowToggleIcon")),null,16)):!r.isRowGroupExpanded&&!n.collapsedRowIcon?(c(),y(l,f({key:3,class:e.cx("rowToggleIcon")},e.ptm("rowToggleIcon")),null,16,["class"])):C("",!0)],64))],16)):C("",!0),(c(),y(M(n.templates.groupheader),{data:n.rowData,index:r.rowIndex},null,8,["data","index"]))],16,Pf)],16)):C("",!0),!n.expandableRowGroups||r.isRowGroupExpanded?(c(),b("tr",f({key:1,class:r.rowClasses,style:r.rowStyles,tabindex:r.rowTabindex,role:"row","aria-selected":n.selectionMode?r.isSelected:null,onClick:t[1]||(t[1]=function(){return r.onRowClick&&r.onRowClick.apply(r,arguments)}),onDblclick:t[2]||(t[2]=function(){return r.onRowDblClick&&r.onRowDblClick.apply(r,arguments)}),onContextmenu:t[3]||(t[3]=function(){return r.onRowRightClick&&r.onRowRightClick.apply(r,arguments)}),onTouchend:t[4]||(t[4]=function(){return r.onRowTouchEnd&&r.onRowTouchEnd.apply(r,arguments)}),onKeydown:t[5]||(t[5]=ai(function(){return r.onRowKeyDown&&r.onRowKeyDown.apply(r,arguments)},["self"])),onMousedown:t[6]||(t[6]=function(){return r.onRowMouseDown&&r.onRowMouseDown.apply(r,arguments)}),onDragstart:t[7]||(t[7]=function(){return r.onRowDragStart&&r.onRowDragStart.apply(r,arguments)}),onDragover:t[8]||(t[8]=function(){return r.onRowDragOver&&r.onRowDragOver.apply(r,arguments)}),onDragleave:t[9]||(t[9]=function(){return r.onRowDragLeave&&r.onRowDragLeave.apply(r,arguments)}),onDragend:t[10]||(t[10]=function(){return r.onRowDragEnd&&r.onRowDragEnd.apply(r,arguments)}),onDrop:t[11]||(t[11]=function(){return r.onRowDrop&&r.onRowDrop.apply(r,arguments)})},r.getBodyRowPTOptions("bodyRow"),{"data-p-index":r.rowIndex,"data-p-selectable-row":!!n.selectionMode,"data-p-selected":n.selection&&r.isSelected,"data-p-selected-contextmenu":n.contextMenuSelection&&r.isSelectedWithContextMenu}),[(c(!0),b(K,null,ue(n.columns,function(u,d){return c(),b(K,null,[r.shouldRenderBodyCell(u)?(c(),y(s,{key:r.columnProp(u,"columnKey")||r.columnProp(u,"field")||d,rowData:n.rowData,column:u,rowIndex:r.rowIndex,index:d,selected:r.isSelected,frozenRow:n.frozenRow,rowspan:n.rowGroupMode==="rowspan"?r.calculateRowGroupSize(u):null,editMode:n.editMode,editing:n.editMode==="row"&&r.isRowEditing,editingMeta:n.editingMeta,virtualScrollerContentProps:n.virtualScrollerContentProps,ariaControls:n.expandedRowId+"_"+r.rowIndex+"_expansion",name:n.nameAttributeSelector,isRowExpanded:i.d_rowExpanded,expandedRowIcon:n.expandedRowIcon,collapsedRowIcon:n.collapsedRowIcon,editButtonProps:n.editButtonProps,onRadioChange:r.onRadioChange,onCheckboxChange:r.onCheckboxChange,onRowToggle:r.onRowToggle,onCellEditInit:r.onCellEditInit,onCellEditComplete:r.onCellEditComplete,onCellEditCancel:r.onCellEditCancel,onRowEditInit:r.onRowEditInit,onRowEditSave:r.onRowEditSave,onRowEditCancel:r.onRowEditCancel,onEditingMetaChange:r.onEditingMetaChange,unstyled:e.unstyled,pt:e.pt},null,8,["rowData","column","rowIndex","index","selected","frozenRow","rowspan","editMode","editing","editingMeta","virtualScrollerContentProps","ariaControls","name","isRowExpanded","expandedRowIcon","collapsedRowIcon","editButtonProps","onRadioChange","onCheckboxChange","onRowToggle","onCellEditInit","onCellEditComplete","onCellEditCancel","onRowEditInit","onRowEditSave","onRowEditCancel","onEditingMetaChange","unstyled","pt"])):C("",!0)],64)}),256))],16,Of)):C("",!0),n.templates.expansion&&n.expandedRows&&i.d_rowExpanded?(c(),b("tr",f({key:2,id:n.expandedRowId+"_"+r.rowIndex+"_expansion",class:e.cx("rowExpansion"),role:"row"},e.ptm("rowExpansion")),[R("td",f({colspan:r.columnsLength},Ue(Ue({},r.getColumnPT("bodycell")),e.ptm("rowExpansionCell"))),[(c(),y(M(n.templates.expansion),{data:n.rowData,index:r.rowIndex},null,8,["data","index"]))],16,Rf)],16,xf)):C("",!0),n.templates.groupfooter&&n.rowGroupMode==="subheader"&&r.shouldRenderRowGroupFooter?(c(),b("tr",f({key:3,class:e.cx("rowGroupFooter"),role:"row"},e.ptm("rowGroupFooter")),[R("td",f({colspan:r.columnsLength-1},Ue(Ue({},r.getColumnPT("bodycell")),e.ptm("rowGroupFooterCell"))),[(c(),y(M(n.templates.groupfooter),{data:n.rowData,index:r.rowIndex},null,8,["data","index"]))],16,Lf)],16)):C("",!0)],64))}da.render=Mf;var ca={name:"TableBody",hostName:"DataTable",extends:U,emits:["rowgroup-toggle","row-click","row-dblclick","row-rightclick","row-touchend","row-keydown","row-mousedown","row-dragstart","row-dragover","row-dragleave","row-dragend","row-drop","row-toggle","radio-change","checkbox-change","cell-edit-init","cell-edit-complete","cell-edit-cancel","row-edit-init","row-edit-save","row-edit-cancel","editing-meta-change"],props:{value:{type:Array,default:null},columns:{type:null,default:null},frozenRow:{type:Boolean,default:!1},empty:{type:Boolean,default:!1},rowGroupMode:{type:String,default:null},groupRowsBy:{type:[Array,String,Function],default:null},expandableRowGroups:{type:Boolean,default:!1},expandedRowGroups:{type:Array,default:null},first:{type:Number,default:0},dataKey:{type:[String,Function],default:null},expandedRowIcon:{type:String,default:null},collapsedRowIcon:{type:String,default:null},expandedRows:{type:[Array,Object],default:null},selection:{type:[Array,Object],default:null},selectionKeys:{type:null,default:null},selectionMode:{type:String,default:null},rowHover:{type:Boolean,default:!1},contextMenu:{type:Boolean,default:!1},contextMenuSelection:{type:Object,default:null},rowClass:{type:null,default:null},rowStyle:{type:null,default:null},editMode:{type:String,default:null},compareSelectionBy:{type:String,default:"deepEquals"},editingRows:{type:Array,default:null},editingRowKeys:{type:null,default:null},editingMeta:{type:Object,default:null},templates:{type:null,default:null},scrollable:{type:Boolean,default:!1},editButtonProps:{type:Object,default:null},virtualScrollerContentProps:{type:Object,default:null},isVirtualScrollerDisabled:{type:Boolean,default:!1}},data:function(){return{rowGroupHeaderStyleObject:{}}},mounted:function(){this.frozenRow&&this.updateFrozenRowStickyPosition(),this.scrollable&&this.rowGroupMode==="subheader"&&this.updateFrozenRowGroupHeaderStickyPosition()},updated:function(){this.frozenRow&&this.updateFrozenRowStickyPosition(),this.scrollable&&this.rowGroupMode==="subheader"&&this.updateFrozenRowGroupHeaderStickyPosition()},methods:{getRowKey:function(t,n){return this.dataKey?H(t,this.dataKey):n},updateFrozenRowStickyPosition:function(){this.$el.style.top=Pt(this.$el.previousElementSibling)+"px"},updateFrozenRowGroupHeaderStickyPosition:function(){var t=Pt(this.$el.previousElementSibling);this.rowGroupHeaderStyleObject.top=t+"px"},getVirtualScrollerProp:function(t,n){return n=n||this.virtualScrollerContentProps,n?n[t]:null},bodyRef:function(t){var n=this.getVirtualScrollerProp("contentRef");n&&n(t)}},computed:{rowGroupHeaderStyle:function(){return this.scrollable?{top:this.rowGroupHeaderStyleObject.top}:null},bodyContentStyle:function(){return this.getVirtualScrollerProp("contentStyle")},ptmTBodyOptions:function(){var t;return{context:{scrollable:(t=this.$parentInstance)===null||t===void 0||(t=t.$parentInstance)===null||t===void 0?void 0:t.scrollable}}},dataP:function(){return re({hoverable:this.rowHover||this.selectionMode,frozen:this.frozenRow})}},components:{DTBodyRow:da}},Ef=["data-p"];function Df(e,t,n,o,i,r){var a=T("DTBodyRow");return c(),b("tbody",f({ref:r.bodyRef,class:e.cx("tbody"),role:"rowgroup",style:r.bodyContentStyle,"data-p":r.dataP},e.ptm("tbody",r.ptmTBodyOptions)),[n.empty?(c(),y(a,{key:1,empty:n.empty,columns:n.columns,templates:n.templates,unstyled:e.unstyled,pt:e.pt},null,8,["empty","columns","templates","unstyled","pt"])):(c(!0),b(K,{key:0},ue(n.value,function(l,s){return c(),y(a,{key:r.getRowKey(l,s),rowData:l,index:s,value:n.value,columns:n.columns,frozenRow:n.frozenRow,empty:n.empty,first:n.first,dataKey:n.dataKey,selection:n.selection,selectionKeys:n.selectionKeys,selectionMode:n.selectionMode,contextMenu:n.contextMenu,contextMenuSelection:n.contextMenuSelection,rowGroupMode:n.rowGroupMode,groupRowsBy:n.groupRowsBy,expandableRowGroups:n.expandableRowGroups,rowClass:n.rowClass,rowStyle:n.rowStyle,editMode:n.editMode,compareSelectionBy:n.compareSelectionBy,scrollable:n.scrollable,expandedRowIcon:n.expandedRowIcon,collapsedRowIcon:n.collapsedRowIcon,expandedRows:n.expandedRows,expandedRowGroups:n.expandedRowGroups,editingRows:n.editingRows,editingRowKeys:n.editingRowKeys,templates:n.templates,editButtonProps:n.editButtonProps,virtualScrollerContentProps:n.virtualScrollerContentProps,isVirtualScrollerDisabled:n.isVirtualScrollerDisabled,editingMeta:n.editingMeta,rowGroupHeaderStyle:r.rowGroupHeaderStyle,expandedRowId:e.$id,nameAttributeSelector:e.$attrSelector,onRowgroupToggle:t[0]||(t[0]=function(u){return e.$emit("rowgroup-toggle",u)}),onRowClick:t[1]||(t[1]=function(u){return e.$emit("row-click",u)}),onRowDblclick:t[2]||(t[2]=function(u){return e.$emit("row-dblclick",u)}),onRowRightclick:t[3]||(t[3]=function(u){return e.$emit("row-rightclick",u)}),onRowTouchend:t[4]||(t[4]=function(u){return e.$emit("row-touchend",u)}),onRowKeydown:t[5]||(t[5]=function(u){return e.$emit("row-keydown",u)}),onRowMousedown:t[6]||(t[6]=function(u){return e.$emit("row-mousedown",u)}),onRowDragstart:t[7]||(t[7]=function(u){return e.$emit("row-dragstart",u)}),onRowDragover:t[8]||(t[8]=function(u){return e.$emit("row-dragover",u)}),onRowDragleave:t[9]||(t[9]=function(u){return e.$emit("row-dragleave",u)}),onRowDragend:t[10]||(t[10]=function(u){return e.$emit("row-dragend",u)}),onRowDrop:t[11]||(t[11]=function(u){return e.$emit("row-drop",u)}),onRowToggle:t[12]||(t[12]=function(u){return e.$emit("row-toggle",u)}),onRadioChange:t[13]||(t[13]=function(u){return e.$emit("radio-change",u)}),onCheckboxChange:t[14]||(t[14]=function(u){return e.$emit("checkbox-change",u)}),onCellEditInit:t[15]||(t[15]=function(u){return e.$emit("cell-edit-init",u)}),onCellEditComplete:t[16]||(t[16]=function(u){return e.$emit("cell-edit-complete",u)}),onCellEditCancel:t[17]||(t[17]=function(u){return e.$emit("cell-edit-cancel",u)}),onRowEditInit:t[18]||(t[18]=function(u){return e.$emit("row-edit-init",u)}),onRowEditSave:t[19]||(t[19]=function(u){return e.$emit("row-edit-save",u)}),onRowEditCancel:t[20]||(t[20]=function(u){return e.$emit("row-edit-cancel",u)}),onEditingMetaChange:t[21]||(t[21]=function(u){return e.$emit("editing-meta-change",u)}),unstyled:e.unstyled,pt:e.pt},null,8,["rowData","index","value","columns","frozenRow","empty","first","dataKey","selection","selectionKeys","selectionMode","contextMenu","contextMenuSelection","rowGroupMode","groupRowsBy","expandableRowGroups","rowClass","rowStyle","editMode","compareSelectionBy","scrollable","expandedRowIcon","collapsedRowIcon","expandedRows","expandedRowGroups","editingRows","editingRowKeys","templates","editButtonProps","virtualScrollerContentProps","isVirtualScrollerDisabled","editingMeta","rowGroupHeaderStyle","expandedRowId","nameAttributeSelector","unstyled","pt"])}),128))],16,Ef)}ca.render=Df;var pa={name:"FooterCell",hostName:"DataTable",extends:U,props:{column:{type:Object,default:null},index:{type:Number,default:null}},data:function(){return{styleObject:{}}},mounted:function(){this.columnProp("frozen")&&this.updateStickyPosition()},updated:function(){this.columnProp("frozen")&&this.updateStickyPosition()},methods:{columnProp:function(t){return Je(this.column,t)},getColumnPT:function(t){var n,o,i={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:this.index,size:(n=this.$parentInstance)===null||n===void 0||(n=n.$parentInstance)===null||n===void 0?void 0:n.size,showGridlines:((o=this.$parentInstance)===null||o===void 0||(o=o.$parentInstance)===null||o===void 0?void 0:o.showGridlines)||!1}};return f(this.ptm("column.".concat(t),{column:i}),this.ptm("column.".concat(t),i),this.ptmo(this.getColumnProp(),t,i))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},updateStickyPosition:function(){if(this.columnProp("frozen")){var t=this.columnProp("alignFrozen");if(t==="right"){var n=0,o=An(this.$el,'[data-p-frozen-column="true"]');o&&(n=ve(o)+parseFloat(o.style["inset-inline-end"]||0)),this.styleObject.insetInlineEnd=n+"px"}else{var i=0,r=jn(this.$el,'[data-p-frozen-column="true"]');r&&(i=ve(r)+parseFloat(r.style["inset-inline-start"]||0)),this.styleObject.insetInlineStart=i+"px"}}}},computed:{containerClass:function(){return[this.columnProp("footerClass"),this.columnProp("class"),this.cx("footerCell")]},containerStyle:function(){var t=this.columnProp("footerStyle"),n=this.columnProp("style");return this.columnProp("frozen")?[n,t,this.styleObject]:[n,t]}}};function tn(e){"@babel/helpers - typeof";return tn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},tn(e)}function zr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Ar(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?zr(Object(n),!0).forEach(function(o){Ff(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Ff(e,t,n){return(t=Bf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Bf(e){var t=zf(e,"string");return tn(t)=="symbol"?t:t+""}function zf(e,t){if(tn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(tn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Af=["colspan","rowspan","data-p-frozen-column"];function jf(e,t,n,o,i,r){return c(),b("td",f({style:r.containerStyle,class:r.containerClass,role:"cell",colspan:r.columnProp("colspan"),rowspan:r.columnProp("rowspan")},Ar(Ar({},r.getColumnPT("root")),r.getColumnPT("footerCell")),{"data-p-frozen-column":r.columnProp("frozen")}),[n.column.children&&n.column.children.footer?(c(),y(M(n.column.children.footer),{key:0,column:n.column},null,8,["column"])):C("",!0),r.columnProp("footer")?(c(),b("span",f({key:1,class:e.cx("columnFooter")},r.getColumnPT("columnFooter")),Y(r.columnProp("footer")),17)):C("",!0)],16,Af)}pa.render=jf;function Kf(e,t){var n=typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(!n){if(Array.isArray(e)||(n=Vf(e))||t){n&&(e=n);var o=0,i=function(){};return{s:i,n:function(){return o>=e.length?{done:!0}:{done:!1,value:e[o++]}},e:function(u){throw u},f:i}}throw new TypeError(`Invalid attempt to iterate non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var r,a=!0,l=!1;return{s:function(){n=n.call(e)},n:function(){var u=n.next();return a=u.done,u},e:function(u){l=!0,r=u},f:function(){try{a||n.return==null||n.return()}finally{if(l)throw r}}}}function Vf(e,t){if(e){if(typeof e=="string")return jr(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?jr(e,t):void 0}}function jr(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var fa={name:"TableFooter",hostName:"DataTable",extends:U,props:{columnGroup:{type:null,default:null},columns:{type:Object,default:null}},provide:function(){return{$rows:this.d_footerRows,$columns:this.d_footerColumns}},data:function(){return{d_footerRows:new ft({type:"Row"}),d_footerColumns:new ft({type:"Column"})}},beforeUnmount:function(){this.d_footerRows.clear(),this.d_footerColumns.clear()},methods:{columnProp:function(t,n){return Je(t,n)},getColumnGroupPT:function(t){var n={props:this.getColumnGroupProps(),parent:{instance:this,props:this.$props,state:this.$data},context:{type:"footer",scrollable:this.ptmTFootOptions.context.scrollable}};return f(this.ptm("columnGroup.".concat(t),{columnGroup:n}),this.ptm("columnGroup.".concat(t),n),this.ptmo(this.getColumnGroupProps(),t,n))},getColumnGroupProps:function(){return this.columnGroup&&this.columnGroup.props&&this.columnGroup.props.pt?this.columnGroup.props.pt:void 0},getRowPT:function(t,n,o){var i={props:t.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:o}};return f(this.ptm("row.".concat(n),{row:i}),this.ptm("row.".concat(n),i),this.ptmo(this.getRowProp(t),n,i))},getRowProp:function(t){return t.props&&t.props.pt?t.props.pt:void 0},getFooterRows:function(){var t;return(t=this.d_footerRows)===null||t===void 0?void 0:t.get(this.columnGroup,this.columnGroup.children)},getFooterColumns:function(t){var n;return(n=this.d_footerColumns)===null||n===void 0?void 0:n.get(t,t.children)}},computed:{hasFooter:function(){var t=!1;if(this.columnGroup)t=!0;else if(this.columns){var n=Kf(this.columns),o;try{for(n.s();!(o=n.n()).done;){var i=o.value;if(this.columnProp(i,"footer")||i.children&&i.children.footer){t=!0;break}}}catch(r){n.e(r)}finally{n.f()}}return t},ptmTFootOptions:function(){var t;return{context:{scrollable:(t=this.$parentInstance)===null||t===void 0||(t=t.$parentInstance)===null||t===void 0?void 0:t.scrollable}}}},components:{DTFooterCell:pa}};function nn(e){"@babel/helpers - typeof";return nn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},nn(e)}function Kr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function kn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Kr(Object(n),!0).forEach(function(o){Nf(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Kr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Nf(e,t,n){return(t=Hf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Hf(e){var t=Gf(e,"string");return nn(t)=="symbol"?t:t+""}function Gf(e,t){if(nn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(nn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Uf=["data-p-scrollable"];function _f(e,t,n,o,i,r){var a,l=T("DTFooterCell");return r.hasFooter?(c(),b("tfoot",f({key:0,class:e.cx("tfoot"),style:e.sx("tfoot"),role:"rowgroup"},n.columnGroup?kn(kn({},e.ptm("tfoot",r.ptmTFootOptions)),r.getColumnGroupPT("root")):e.ptm("tfoot",r.ptmTFootOptions),{"data-p-scrollable":(a=e.$parentInstance)===null||a===void 0||(a=a.$parentInstance)===null||a===void 0?void 0:a.scrollable,"data-pc-section":"tfoot"}),[n.columnGroup?(c(!0),b(K,{key:1},ue(r.getFooterRows(),function(s,u){return c(),b("tr",f({key:u,role:"row",ref_for:!0},kn(kn({},e.ptm("footerRow")),r.getRowPT(s,"root",u))),[(c(!0),b(K,null,ue(r.getFooterColumns(s),function(d,p){return c(),b(K,{key:r.columnProp(d,"columnKey")||r.columnProp(d,"field")||p},[r.columnProp(d,"hidden")?C("",!0):(c(),y(l,{key:0,column:d,index:u,pt:e.pt},null,8,["column","index","pt"]))],64)}),128))],16)}),128)):(c(),b("tr",f({key:0,role:"row"},e.ptm("footerRow")),[(c(!0),b(K,null,ue(n.columns,function(s,u){return c(),b(K,{key:r.columnProp(s,"columnKey")||r.columnProp(s,"field")||u},[r.columnProp(s,"hidden")?C("",!0):(c(),y(l,{key:0,column:s,pt:e.pt},null,8,["column","pt"]))],64)}),128))],16))],16,Uf)):C("",!0)}fa.render=_f;function on(e){"@babel/helpers - typeof";return on=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},on(e)}function Vr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Xe(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Vr(Object(n),!0).forEach(function(o){Wf(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Vr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Wf(e,t,n){return(t=Zf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Zf(e){var t=qf(e,"string");return on(t)=="symbol"?t:t+""}function qf(e,t){if(on(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(on(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Bo={name:"ColumnFilter",hostName:"DataTable",extends:U,emits:["filter-change","filter-apply","operator-change","matchmode-change","constraint-add","constraint-remove","filter-clear","apply-click"],props:{field:{type:String,default:null},type:{type:String,default:"text"},display:{type:String,default:null},showMenu:{type:Boolean,default:!0},matchMode:{type:String,default:null},showOperator:{type:Boolean,default:!0},showClearButton:{type:Boolean,default:!1},showApplyButton:{type:Boolean,default:!0},showMatchModes:{type:Boolean,default:!0},showAddButton:{type:Boolean,default:!0},matchModeOptions:{type:Array,default:null},maxConstraints:{type:Number,default:2},filterElement:{type:Function,default:null},filterHeaderTemplate:{type:Function,default:null},filterFooterTemplate:{type:Function,default:null},filterClearTemplate:{type:Function,default:null},filterApplyTemplate:{type:Function,default:null},filterIconTemplate:{type:Function,default:null},filterAddIconTemplate:{type:Function,default:null},filterRemoveIconTemplate:{type:Function,default:null},filterClearIconTemplate:{type:Function,default:null},filters:{type:Object,default:null},filtersStore:{type:Object,default:null},filterMenuClass:{type:String,default:null},filterMenuStyle:{type:null,default:null},filterInputProps:{type:null,default:null},filterButtonProps:{type:null,default:null},column:null},data:function(){return{overlayVisible:!1,defaultMatchMode:null,defaultOperator:null}},overlay:null,selfClick:!1,overlayEventListener:null,beforeUnmount:function(){this.overlayEventListener&&(Ge.off("overlay-click",this.overlayEventListener),this.overlayEventListener=null),this.overlay&&(me.clear(this.overlay),this.onOverlayHide())},mounted:function(){if(this.filters&&this.filters[this.field]){var t=this.filters[this.field];t.operator?(this.defaultMatchMode=t.constraints[0].matchMode,this.defaultOperator=t.operator):this.defaultMatchMode=this.filters[this.field].matchMode}},methods:{getColumnPT:function(t,n){var o=Xe({props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data}},n);return f(this.ptm("column.".concat(t),{column:o}),this.ptm("column.".concat(t),o),this.ptmo(this.getColumnProp(),t,o))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},ptmFilterConstraintOptions:function(t){return{context:{highlighted:t&&this.isRowMatchModeSelected(t.value)}}},clearFilter:function(){var t=Xe({},this.filters);t[this.field].operator?(t[this.field].constraints.splice(1),t[this.field].operator=this.defaultOperator,t[this.field].constraints[0]={value:null,matchMode:this.defaultMatchMode}):(t[this.field].value=null,t[this.field].matchMode=this.defaultMatchMode),this.$emit("filter-clear"),this.$emit("filter-change",t),this.$emit("filter-apply"),this.hide()},applyFilter:function(){this.$emit("apply-click",{field:this.field,constraints:this.filters[this.field]}),this.$emit("filter-apply"),this.hide()},hasFilter:function(){if(this.filtersStore){var t=this.filtersStore[this.field];if(t)return t.operator?!this.isFilterBlank(t.constraints[0].value):!this.isFilterBlank(t.value)}return!1},hasRowFilter:function(){return this.filters[this.field]&&!this.isFilterBlank(this.filters[this.field].value)},isFilterBlank:function(t){return t!=null?typeof t=="string"&&t.trim().length==0||t instanceof Array&&t.length==0:!0},toggleMenu:function(t){this.overlayVisible=!this.overlayVisible,t.preventDefault()},onToggleButtonKeyDown:function(t){switch(t.code){case"Enter":case"NumpadEnter":case"Space":this.toggleMenu(t);break;case"Escape":this.overlayVisible=!1;break}},onRowMatchModeChange:function(t){var n=Xe({},this.filters);n[this.field].matchMode=t,this.$emit("matchmode-change",{field:this.field,matchMode:t}),this.$emit("filter-change",n),this.$emit("filter-apply"),this.hide()},onRowMatchModeKeyDown:function(t){var n=t.target;switch(t.code){case"ArrowDown":var o=this.findNextItem(n);o&&(n.removeAttribute("tabindex"),o.tabIndex="0",o.focus()),t.preventDefault();break;case"ArrowUp":var i=this.findPrevItem(n);i&&(n.removeAttribute("tabindex"),i.tabIndex="0",i.focus()),t.preventDefault();break}},isRowMatchModeSelected:function(t){return this.filters[this.field].matchMode===t},onOperatorChange:function(t){var n=Xe({},this.filters);n[this.field].operator=t,this.$emit("filter-change",n),this.$emit("operator-change",{field:this.field,operator:t}),this.showApplyButton||this.$emit("filter-apply")},onMenuMatchModeChange:function(t,n){var o=Xe({},this.filters);o[this.field].constraints[n].matchMode=t,this.$emit("matchmode-change",{field:this.field,matchMode:t,index:n}),this.showApplyButton||this.$emit("filter-apply")},addConstraint:function(){var t=Xe({},this.filters),n={value:null,matchMode:this.defaultMatchMode};t[this.field].constraints.push(n),this.$emit("constraint-add",{field:this.field,constraing:n}),this.$emit("filter-change",t),this.showApplyButton||this.$emit("filter-apply")},removeConstraint:function(t){var n=Xe({},this.filters),o=n[this.field].constraints.splice(t,1);this.$emit("constraint-remove",{field:this.field,constraing:o}),this.$emit("filter-change",n),this.showApplyButton||this.$emit("filter-apply")},filterCallback:function(){this.$emit("filter-apply")},findNextItem:function(t){var n=t.nextElementSibling;return n?fe(n,"data-pc-section")==="filterconstraintseparator"?this.findNextItem(n):n:t.parentElement.firstElementChild},findPrevItem:function(t){var n=t.previousElementSibling;return n?fe(n,"data-pc-section")==="filterconstraintseparator"?this.findPrevItem(n):n:t.parentElement.lastElementChild},hide:function(){this.overlayVisible=!1,this.showMenuButton&&te(this.$refs.icon.$el)},onContentClick:function(t){this.selfClick=!0,Ge.emit("overlay-click",{originalEvent:t,target:this.overlay})},onContentMouseDown:function(){this.selfClick=!0},onOverlayEnter:function(t){var n=this;this.filterMenuStyle&&pt(this.overlay,this.filterMenuStyle),me.set("overlay",t,this.$primevue.config.zIndex.overlay),pt(t,{position:"absolute",top:"0"}),ko(this.overlay,this.$refs.icon.$el),this.bindOutsideClickListener(),this.bindScrollListener(),this.bindResizeListener(),this.overlayEventListener=function(o){n.isOutsideClicked(o.target)||(n.selfClick=!0)},Ge.on("overlay-click",this.overlayEventListener)},onOverlayAfterEnter:function(){var t;(t=this.overlay)===null||t===void 0||(t=t.$focustrap)===null||t===void 0||t.autoFocus()},onOverlayLeave:function(){this.onOverlayHide()},onOverlayAfterLeave:function(t){me.clear(t)},onOverlayHide:function(){this.unbindOutsideClickListener(),this.unbindResizeListener(),this.unbindScrollListener(),this.overlay=null,Ge.off("overlay-click",this.overlayEventListener),this.overlayEventListener=null},overlayRef:function(t){this.overlay=t},isOutsideClicked:function(t){return!this.isTargetClicked(t)&&this.overlay&&!(this.overlay.isSameNode(t)||this.overlay.contains(t))},isTargetClicked:function(t){return this.$refs.icon&&(this.$refs.icon.$el.isSameNode(t)||this.$refs.icon.$el.contains(t))},bindOutsideClickListener:function(){var t=this;this.outsideClickListener||(this.outsideClickListener=function(n){t.overlayVisible&&!t.selfClick&&t.isOutsideClicked(n.target)&&(t.overlayVisible=!1),t.selfClick=!1},document.addEventListener("click",this.outsideClickListener,!0))},unbindOutsideClickListener:function(){this.outsideClickListener&&(document.removeEventListener("click",this.outsideClickListener,!0),this.outsideClickListener=null,this.selfClick=!1)},bindScrollListener:function(){var t=this;this.scrollHandler||(this.scrollHandler=new Ro(this.$refs.icon.$el,function(){t.overlayVisible&&t.hide()})),this.scrollHandler.bindScrollListener()},unbindScrollListener:function(){this.scrollHandler&&this.scrollHandler.unbindScrollListener()},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=function(){t.overlayVisible&&!Kn()&&t.hide()},window.addEventListener("resize",this.resizeListener))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),this.resizeListener=null)}},computed:{showMenuButton:function(){return this.showMenu&&(this.display==="row"?this.type!=="boolean":!0)},overlayId:function(){return this.$id+"_overlay"},matchModes:function(){var t=this;return this.matchModeOptions||this.$primevue.config.filterMatchModeOptions[this.type].map(function(n){return{label:t.$primevue.config.locale[n],value:n}})},isShowMatchModes:function(){return this.type!=="boolean"&&this.showMatchModes&&this.matchModes},operatorOptions:function(){return[{label:this.$primevue.config.locale.matchAll,value:Fn.AND},{label:this.$primevue.config.locale.matchAny,value:Fn.OR}]},noFilterLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.noFilter:void 0},isShowOperator:function(){return this.showOperator&&this.filters[this.field].operator},operator:function(){return this.filters[this.field].operator},fieldConstraints:function(){return this.filters[this.field].constraints||[this.filters[this.field]]},showRemoveIcon:function(){return this.fieldConstraints.length>1},removeRuleButtonLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.removeRule:void 0},addRuleButtonLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.addRule:void 0},isShowAddConstraint:function(){return this.showAddButton&&this.filters[this.field].operator&&this.fieldConstraints&&this.fieldConstraints.length<this.maxConstraints},clearButtonLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.clear:void 0},applyButtonLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.apply:void 0},columnFilterButtonAriaLabel:function(){return this.$primevue.config.locale?this.overlayVisible?this.$primevue.config.locale.showFilterMenu:this.$primevue.config.locale.hideFilterMenu:void 0},filterOperatorAriaLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.filterOperator:void 0},filterRuleAriaLabel:function(){return this.$primevue.config.locale?this.$primevue.config.locale.filterConstraint:void 0},ptmHeaderFilterClearParams:function(){return{context:{hidden:this.hasRowFilter()}}},ptmFilterMenuParams:function(){return{context:{overlayVisible:this.overlayVisible,active:this.hasFilter()}}}},components:{Select:Un,Button:gn,Portal:gt,FilterSlashIcon:oa,FilterFillIcon:na,FilterIcon:ta,TrashIcon:ia,PlusIcon:ra},directives:{focustrap:aa}};function rn(e){"@babel/helpers - typeof";return rn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},rn(e)}function Nr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function at(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Nr(Object(n),!0).forEach(function(o){Yf(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Nr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Yf(e,t,n){return(t=Jf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Jf(e){var t=Xf(e,"string");return rn(t)=="symbol"?t:t+""}function Xf(e,t){if(rn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(rn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Qf=["id","aria-modal"],eh=["onClick","onKeydown","tabindex"];function th(e,t,n,o,i,r){var a=T("Button"),l=T("Select"),s=T("Portal"),u=ke("focustrap");return c(),b("div",f({class:e.cx("filter")},r.getColumnPT("filter")),[n.display==="row"?(c(),b("div",f({key:0,class:e.cx("filterElementContainer")},at(at({},n.filterInputProps),r.getColumnPT("filterElementContainer"))),[(c(),y(M(n.filterElement),{field:n.field,filterModel:n.filters[n.field],filterCallback:r.filterCallback},null,8,["field","filterModel","filterCallback"]))],16)):C("",!0),r.showMenuButton?(c(),y(a,f({key:1,ref:"icon","aria-label":r.columnFilterButtonAriaLabel,"aria-haspopup":"true","aria-expanded":i.overlayVisible,"aria-controls":r.overlayId,class:e.cx("pcColumnFilterButton"),unstyled:e.unstyled,onClick:t[0]||(t[0]=function(d){return r.toggleMenu(d)}),onKeydown:t[1]||(t[1]=function(d){return r.onToggleButtonKeyDown(d)})},at(at({},r.getColumnPT("pcColumnFilterButton",r.ptmFilterMenuParams)),n.filterButtonProps.filter)),{icon:E(function(d){return[(c(),y(M(n.filterIconTemplate||(r.hasFilter()?"FilterFillIcon":"FilterIcon")),f({class:d.class},r.getColumnPT("filterMenuIcon")),null,16,["class"]))]}),_:1},16,["aria-label","aria-expanded","aria-controls","class","unstyled"])):C("",!0),n.showClearButton&&n.display==="row"&&r.hasRowFilter()?(c(),y(a,f({key:2,class:e.cx("pcColumnFilterClearButton"),unstyled:e.unstyled,onClick:t[2]||(t[2]=function(d){return r.clearFilter()})},at(at({},r.getColumnPT("pcColumnFilterClearButton",r.ptmHeaderFilterClearParams)),n.filterButtonProps.inline.clear)),{icon:E(function(d){return[(c(),y(M(n.filterClearIconTemplate||"FilterSlashIcon"),f({class:d.class},r.getColumnPT("filterClearIcon")),null,16,["class"]))]}),_:1},16,["class","unstyled"])):C("",!0),ne(s,null,{default:E(function(){return[ne(zn,f({name:"p-connected-overlay",onEnter:r.onOverlayEnter,onAfterEnter:r.onOverlayAfterEnter,onLeave:r.onOverlayLeave,onAfterLeave:r.onOverlayAfterLeave},r.getColumnPT("transition")),{default:E(function(){return[i.overlayVisible?Ie((c(),b("div",f({key:0,ref:r.overlayRef,id:r.overlayId,"aria-modal":i.overlayVisible,role:"dialog",class:[e.cx("filterOverlay"),n.filterMenuClass],onKeydown:t[10]||(t[10]=_n(function(){return r.hide&&r.hide.apply(r,arguments)},["escape"])),onClick:t[11]||(t[11]=function(){return r.onContentClick&&r.onContentClick.apply(r,arguments)}),onMousedown:t[12]||(t[12]=function(){return r.onContentMouseDown&&r.onContentMouseDown.apply(r,arguments)})},r.getColumnPT("filterOverlay")),[(c(),y(M(n.filterHeaderTemplate),{field:n.field,filterModel:n.filters[n.field],filterCallback:r.filterCallback},null,8,["field","filterModel","filterCallback"])),n.display==="row"?(c(),b("ul",f({key:0,class:e.cx("filterConstraintList")},r.getColumnPT("filterConstraintList")),[(c(!0),b(K,null,ue(r.matchModes,function(d,p){return c(),b("li",f({key:d.label,class:e.cx("filterConstraint",{matchMode:d}),onClick:function(m){return r.onRowMatchModeChange(d.value)},onKeydown:[t[3]||(t[3]=function(h){return r.onRowMatchModeKeyDown(h)}),_n(ai(function(h){return r.onRowMatchModeChange(d.value)},["prevent"]),["enter"])],tabindex:p===0?"0":null,ref_for:!0},r.getColumnPT("filterConstraint",r.ptmFilterConstraintOptions(d))),Y(d.label),17,eh)}),128)),R("li",f({class:e.cx("filterConstraintSeparator")},r.getColumnPT("filterConstraintSeparator")),null,16),R("li",f({class:e.cx("filterConstraint"),onClick:t[4]||(t[4]=function(d){return r.clearFilter()}),onKeydown:[t[5]||(t[5]=function(d){return r.onRowMatchModeKeyDown(d)}),t[6]||(t[6]=_n(function(d){return e.onRowClearItemClick()},["enter"]))]},r.getColumnPT("filterConstraint")),Y(r.noFilterLabel),17)],16)):(c(),b(K,{key:1},[r.isShowOperator?(c(),b("div",f({key:0,class:e.cx("filterOperator")},r.getColumnPT("filterOperator")),[ne(l,{options:r.operatorOptions,modelValue:r.operator,"aria-label":r.filterOperatorAriaLabel,class:j(e.cx("pcFilterOperatorDropdown")),optionLabel:"label",optionValue:"value","onUpdate:modelValue":t[7]||(t[7]=function(d){return r.onOperatorChange(d)}),unstyled:e.unstyled,pt:r.getColumnPT("pcFilterOperatorDropdown")},null,8,["options","modelValue","aria-label","class","unstyled","pt"])],16)):C("",!0),R("div",f({class:e.cx("filterRuleList")},r.getColumnPT("filterRuleList")),[(c(!0),b(K,null,ue(r.fieldConstraints,function(d,p){return c(),b("div",f({key:p,class:e.cx("filterRule"),ref_for:!0},r.getColumnPT("filterRule")),[r.isShowMatchModes?(c(),y(l,{key:0,options:r.matchModes,modelValue:d.matchMode,class:j(e.cx("pcFilterConstraintDropdown")),optionLabel:"label",optionValue:"value","aria-label":r.filterRuleAriaLabel,"onUpdate:modelValue":function(m){return r.onMenuMatchModeChange(m,p)},unstyled:e.unstyled,pt:r.getColumnPT("pcFilterConstraintDropdown")},null,8,["options","modelValue","class","aria-label","onUpdate:modelValue","unstyled","pt"])):C("",!0),n.display==="menu"?(c(),y(M(n.filterElement),{key:1,field:n.field,filterModel:d,filterCallback:r.filterCallback,applyFilter:r.applyFilter},null,8,["field","filterModel","filterCallback","applyFilter"])):C("",!0),r.showRemoveIcon?(c(),b("div",f({key:2,ref_for:!0},r.getColumnPT("filterRemove")),[ne(a,f({type:"button",class:e.cx("pcFilterRemoveRuleButton"),onClick:function(m){return r.removeConstraint(p)},label:r.removeRuleButtonLabel,unstyled:e.unstyled,ref_for:!0},n.filterButtonProps.popover.removeRule,{pt:r.getColumnPT("pcFilterRemoveRuleButton")}),{icon:E(function(h){return[(c(),y(M(n.filterRemoveIconTemplate||"TrashIcon"),f({class:h.class,ref_for:!0},r.getColumnPT("pcFilterRemoveRuleButton").icon),null,16,["class"]))]}),_:2},1040,["class","onClick","label","unstyled","pt"])],16)):C("",!0)],16)}),128))],16),r.isShowAddConstraint?(c(),b("div",mt(f({key:1},r.getColumnPT("filterAddButtonContainer"))),[ne(a,f({type:"button",label:r.addRuleButtonLabel,iconPos:"left",class:e.cx("pcFilterAddRuleButton"),onClick:t[8]||(t[8]=function(d){return r.addConstraint()}),unstyled:e.unstyled},n.filterButtonProps.popover.addRule,{pt:r.getColumnPT("pcFilterAddRuleButton")}),{icon:E(function(d){return[(c(),y(M(n.filterAddIconTemplate||"PlusIcon"),f({class:d.class},r.getColumnPT("pcFilterAddRuleButton").icon),null,16,["class"]))]}),_:1},16,["label","class","unstyled","pt"])],16)):C("",!0),R("div",f({class:e.cx("filterButtonbar")},r.getColumnPT("filterButtonbar")),[!n.filterClearTemplate&&n.showClearButton?(c(),y(a,f({key:0,type:"button",class:e.cx("pcFilterClearButton"),label:r.clearButtonLabel,onClick:r.clearFilter,unstyled:e.unstyled},n.filterButtonProps.popover.clear,{pt:r.getColumnPT("pcFilterClearButton")}),null,16,["class","label","onClick","unstyled","pt"])):(c(),y(M(n.filterClearTemplate),{key:1,field:n.field,filterModel:n.filters[n.field],filterCallback:r.clearFilter},null,8,["field","filterModel","filterCallback"])),n.showApplyButton?(c(),b(K,{key:2},[n.filterApplyTemplate?(c(),y(M(n.filterApplyTemplate),{key:1,field:n.field,filterModel:n.filters[n.field],filterCallback:r.applyFilter},null,8,["field","filterModel","filterCallback"])):(c(),y(a,f({key:0,type:"button",class:e.cx("pcFilterApplyButton"),label:r.applyButtonLabel,onClick:t[9]||(t[9]=function(d){return r.applyFilter()}),unstyled:e.unstyled},n.filterButtonProps.popover.apply,{pt:r.getColumnPT("pcFilterApplyButton")}),null,16,["class","label","unstyled","pt"]))],64)):C("",!0)],16)],64)),(c(),y(M(n.filterFooterTemplate),{field:n.field,filterModel:n.filters[n.field],filterCallback:r.filterCallback},null,8,["field","filterModel","filterCallback"]))],16,Qf)),[[u]]):C("",!0)]}),_:1},16,["onEnter","onAfterEnter","onLeave","onAfterLeave"])]}),_:1})],16)}Bo.render=th;var zo={name:"HeaderCheckbox",hostName:"DataTable",extends:U,emits:["change"],props:{checked:null,disabled:null,column:null,headerCheckboxIconTemplate:{type:Function,default:null}},methods:{getColumnPT:function(t){var n={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{checked:this.checked,disabled:this.disabled}};return f(this.ptm("column.".concat(t),{column:n}),this.ptm("column.".concat(t),n),this.ptmo(this.getColumnProp(),t,n))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},onChange:function(t){this.$emit("change",{originalEvent:t,checked:!this.checked})}},computed:{headerCheckboxAriaLabel:function(){return this.$primevue.config.locale.aria?this.checked?this.$primevue.config.locale.aria.selectAll:this.$primevue.config.locale.aria.unselectAll:void 0}},components:{CheckIcon:qe,Checkbox:Fo}};function nh(e,t,n,o,i,r){var a=T("Checkbox");return c(),y(a,{modelValue:n.checked,binary:!0,disabled:n.disabled,"aria-label":r.headerCheckboxAriaLabel,onChange:r.onChange,unstyled:e.unstyled,pt:r.getColumnPT("pcHeaderCheckbox")},null,8,["modelValue","disabled","aria-label","onChange","unstyled","pt"])}zo.render=nh;var ha={name:"FilterHeaderCell",hostName:"DataTable",extends:U,emits:["checkbox-change","filter-change","filter-apply","operator-change","matchmode-change","constraint-add","constraint-remove","apply-click"],props:{column:{type:Object,default:null},index:{type:Number,default:null},allRowsSelected:{type:Boolean,default:!1},empty:{type:Boolean,default:!1},display:{type:String,default:"row"},filters:{type:Object,default:null},filtersStore:{type:Object,default:null},rowGroupMode:{type:String,default:null},groupRowsBy:{type:[Array,String,Function],default:null},filterInputProps:{type:null,default:null},filterButtonProps:{type:null,default:null}},data:function(){return{styleObject:{}}},mounted:function(){this.columnProp("frozen")&&this.updateStickyPosition()},updated:function(){this.columnProp("frozen")&&this.updateStickyPosition()},methods:{columnProp:function(t){return Je(this.column,t)},getColumnPT:function(t){if(!this.column)return null;var n={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:this.index}};return f(this.ptm("column.".concat(t),{column:n}),this.ptm("column.".concat(t),n),this.ptmo(this.getColumnProp(),t,n))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},updateStickyPosition:function(){if(this.columnProp("frozen")){var t=this.columnProp("alignFrozen");if(t==="right"){var n=0,o=An(this.$el,'[data-p-frozen-column="true"]');o&&(n=ve(o)+parseFloat(o.style["inset-inline-end"]||0)),this.styleObject.insetInlineEnd=n+"px"}else{var i=0,r=jn(this.$el,'[data-p-frozen-column="true"]');r&&(i=ve(r)+parseFloat(r.style["inset-inline-start"]||0)),this.styleObject.insetInlineStart=i+"px"}}}},computed:{getFilterColumnHeaderClass:function(){return[this.cx("headerCell",{column:this.column}),this.columnProp("filterHeaderClass"),this.columnProp("class")]},getFilterColumnHeaderStyle:function(){return this.columnProp("frozen")?[this.columnProp("filterHeaderStyle"),this.columnProp("style"),this.styleObject]:[this.columnProp("filterHeaderStyle"),this.columnProp("style")]}},components:{DTHeaderCheckbox:zo,DTColumnFilter:Bo}};function an(e){"@babel/helpers - typeof";return an=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},an(e)}function Hr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Gr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Hr(Object(n),!0).forEach(function(o){oh(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Hr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function oh(e,t,n){return(t=rh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function rh(e){var t=ih(e,"string");return an(t)=="symbol"?t:t+""}function ih(e,t){if(an(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(an(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var ah=["data-p-frozen-column"];function lh(e,t,n,o,i,r){var a=T("DTHeaderCheckbox"),l=T("DTColumnFilter");return!r.columnProp("hidden")&&(n.rowGroupMode!=="subheader"||n.groupRowsBy!==r.columnProp("field"))?(c(),b("th",f({key:0,style:r.getFilterColumnHeaderStyle,class:r.getFilterColumnHeaderClass},Gr(Gr({},r.getColumnPT("root")),r.getColumnPT("headerCell")),{"data-p-frozen-column":r.columnProp("frozen")}),[r.columnProp("selectionMode")==="multiple"?(c(),y(a,{key:0,checked:n.allRowsSelected,disabled:n.empty,onChange:t[0]||(t[0]=function(s){return e.$emit("checkbox-change",s)}),column:n.column,unstyled:e.unstyled,pt:e.pt},null,8,["checked","disabled","column","unstyled","pt"])):C("",!0),n.column.children&&n.column.children.filter?(c(),y(l,{key:1,field:r.columnProp("filterField")||r.columnProp("field"),type:r.columnProp("dataType"),display:"row",showMenu:r.columnProp("showFilterMenu"),filterElement:n.column.children&&n.column.children.filter,filterHeaderTemplate:n.column.children&&n.column.children.filterheader,filterFooterTemplate:n.column.children&&n.column.children.filterfooter,filterClearTemplate:n.column.children&&n.column.children.filterclear,filterApplyTemplate:n.column.children&&n.column.children.filterapply,filterIconTemplate:n.column.children&&n.column.children.filtericon,filterAddIconTemplate:n.column.children&&n.column.children.filteraddicon,filterRemoveIconTemplate:n.column.children&&n.column.children.filterremoveicon,filterClearIconTemplate:n.column.children&&n.column.children.filterclearicon,filters:n.filters,filtersStore:n.filtersStore,filterInputProps:n.filterInputProps,filterButtonProps:n.filterButtonProps,onFilterChange:t[1]||(t[1]=function(s){return e.$emit("filter-change",s)}),onFilterApply:t[2]||(t[2]=function(s){return e.$emit("filter-apply")}),filterMenuStyle:r.columnProp("filterMenuStyle"),filterMenuClass:r.columnProp("filterMenuClass"),showOperator:r.columnProp("showFilterOperator"),showClearButton:r.columnProp("showClearButton"),showApplyButton:r.columnProp("showApplyButton"),showMatchModes:r.columnProp("showFilterMatchModes"),showAddButton:r.columnProp("showAddButton"),matchModeOptions:r.columnProp("filterMatchModeOptions"),maxConstraints:r.columnProp("maxConstraints"),onOperatorChange:t[3]||(t[3]=function(s){return e.$emit("operator-change",s)}),onMatchmodeChange:t[4]||(t[4]=function(s){return e.$emit("matchmode-change",s)}),onConstraintAdd:t[5]||(t[5]=function(s){return e.$emit("constraint-add",s)}),onConstraintRemove:t[6]||(t[6]=function(s){return e.$emit("constraint-remove",s)}),onApplyClick:t[7]||(t[7]=function(s){return e.$emit("apply-click",s)}),column:n.column,unstyled:e.unstyled,pt:e.pt},null,8,["field","type","showMenu","filterElement","filterHeaderTemplate","filterFooterTemplate","filterClearTemplate","filterApplyTemplate","filterIconTemplate","filterAddIconTemplate","filterRemoveIconTemplate","filterClearIconTemplate","filters","filtersStore","filterInputProps","filterButtonProps","filterMenuStyle","filterMenuClass","showOperator","showClearButton","showApplyButton","showMatchModes","showAddButton","matchModeOptions","maxConstraints","column","unstyled","pt"])):C("",!0)],16,ah)):C("",!0)}ha.render=lh;var ma={name:"HeaderCell",hostName:"DataTable",extends:U,emits:["column-click","column-mousedown","column-dragstart","column-dragover","column-dragleave","column-drop","column-resizestart","checkbox-change","filter-change","filter-apply","operator-change","matchmode-change","constraint-add","constraint-remove","filter-clear","apply-click"],props:{column:{type:Object,default:null},index:{type:Number,default:null},resizableColumns:{type:Boolean,default:!1},groupRowsBy:{type:[Array,String,Function],default:null},sortMode:{type:String,default:"single"},groupRowSortField:{type:[String,Function],default:null},sortField:{type:[String,Function],default:null},sortOrder:{type:Number,default:null},multiSortMeta:{type:Array,default:null},allRowsSelected:{type:Boolean,default:!1},empty:{type:Boolean,default:!1},filterDisplay:{type:String,default:null},filters:{type:Object,default:null},filtersStore:{type:Object,default:null},filterColumn:{type:Boolean,default:!1},reorderableColumns:{type:Boolean,default:!1},filterInputProps:{type:null,default:null},filterButtonProps:{type:null,default:null}},data:function(){return{styleObject:{}}},mounted:function(){this.columnProp("frozen")&&this.updateStickyPosition()},updated:function(){this.columnProp("frozen")&&this.updateStickyPosition()},methods:{columnProp:function(t){return Je(this.column,t)},getColumnPT:function(t){var n,o,i={props:this.column.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:this.index,sortable:this.columnProp("sortable")===""||this.columnProp("sortable"),sorted:this.isColumnSorted(),resizable:this.resizableColumns,size:(n=this.$parentInstance)===null||n===void 0||(n=n.$parentInstance)===null||n===void 0?void 0:n.size,showGridlines:((o=this.$parentInstance)===null||o===void 0||(o=o.$parentInstance)===null||o===void 0?void 0:o.showGridlines)||!1}};return f(this.ptm("column.".concat(t),{column:i}),this.ptm("column.".concat(t),i),this.ptmo(this.getColumnProp(),t,i))},getColumnProp:function(){return this.column.props&&this.column.props.pt?this.column.props.pt:void 0},onClick:function(t){this.$emit("column-click",{originalEvent:t,column:this.column})},onKeyDown:function(t){(t.code==="Enter"||t.code==="NumpadEnter"||t.code==="Space")&&t.currentTarget.nodeName==="TH"&&fe(t.currentTarget,"data-p-sortable-column")&&(this.$emit("column-click",{originalEvent:t,column:this.column}),t.preventDefault())},onMouseDown:function(t){this.$emit("column-mousedown",{originalEvent:t,column:this.column})},onDragStart:function(t){this.$emit("column-dragstart",{originalEvent:t,column:this.column})},onDragOver:function(t){this.$emit("column-dragover",{originalEvent:t,column:this.column})},onDragLeave:function(t){this.$emit("column-dragleave",{originalEvent:t,column:this.column})},onDrop:function(t){this.$emit("column-drop",{originalEvent:t,column:this.column})},onResizeStart:function(t){this.$emit("column-resizestart",t)},getMultiSortMetaIndex:function(){var t=this;return this.multiSortMeta.findIndex(function(n){return n.field===t.columnProp("field")||n.field===t.columnProp("sortField")})},getBadgeValue:function(){var t=this.getMultiSortMetaIndex();return this.groupRowsBy&&this.groupRowsBy===this.groupRowSortField&&t>-1?t:t+1},isMultiSorted:function(){return this.sortMode==="multiple"&&this.columnProp("sortable")&&this.getMultiSortMetaIndex()>-1},isColumnSorted:function(){return this.sortMode==="single"?this.sortField&&(this.sortField===this.columnProp("field")||this.sortField===this.columnProp("sortField")):this.isMultiSorted()},updateStickyPosition:function(){if(this.columnProp("frozen")){var t=this.columnProp("alignFrozen");if(t==="right"){var n=0,o=An(this.$el,'[data-p-frozen-column="true"]');o&&(n=ve(o)+parseFloat(o.style["inset-inline-end"]||0)),this.styleObject.insetInlineEnd=n+"px"}else{var i=0,r=jn(this.$el,'[data-p-frozen-column="true"]');r&&(i=ve(r)+parseFloat(r.style["inset-inline-start"]||0)),this.styleObject.insetInlineStart=i+"px"}var a=this.$el.parentElement.nextElementSibling;if(a){var l=Rn(this.$el);a.children[l]&&(a.children[l].style["inset-inline-start"]=this.styleObject["inset-inline-start"],a.children[l].style["inset-inline-end"]=this.styleObject["inset-inline-end"])}}},onHeaderCheckboxChange:function(t){this.$emit("checkbox-change",t)}},computed:{containerClass:function(){return[this.cx("headerCell"),this.filterColumn?this.columnProp("filterHeaderClass"):this.columnProp("headerClass"),this.columnProp("class")]},containerStyle:function(){var t=this.filterColumn?this.columnProp("filterHeaderStyle"):this.columnProp("headerStyle"),n=this.columnProp("style");return this.columnProp("frozen")?[n,t,this.styleObject]:[n,t]},sortState:function(){var t=!1,n=null;if(this.sortMode==="single")t=this.sortField&&(this.sortField===this.columnProp("field")||this.sortField===this.columnProp("sortField")),n=t?this.sortOrder:0;else if(this.sortMode==="multiple"){var o=this.getMultiSortMetaIndex();o>-1&&(t=!0,n=this.multiSortMeta[o].order)}return{sorted:t,sortOrder:n}},sortableColumnIcon:function(){var t=this.sortState,n=t.sorted,o=t.sortOrder;if(n){if(n&&o>0)return vo;if(n&&o<0)return yo}else return go;return null},ariaSort:function(){if(this.columnProp("sortable")){var t=this.sortState,n=t.sorted,o=t.sortOrder;return n&&o<0?"descending":n&&o>0?"ascending":"none"}else return null}},components:{Badge:xo,DTHeaderCheckbox:zo,DTColumnFilter:Bo,SortAltIcon:go,SortAmountUpAltIcon:vo,SortAmountDownIcon:yo}};function ln(e){"@babel/helpers - typeof";return ln=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ln(e)}function Ur(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function _r(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Ur(Object(n),!0).forEach(function(o){sh(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ur(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function sh(e,t,n){return(t=uh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uh(e){var t=dh(e,"string");return ln(t)=="symbol"?t:t+""}function dh(e,t){if(ln(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(ln(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var ch=["tabindex","colspan","rowspan","aria-sort","data-p-sortable-column","data-p-resizable-column","data-p-sorted","data-p-filter-column","data-p-frozen-column","data-p-reorderable-column"];function ph(e,t,n,o,i,r){var a=T("Badge"),l=T("DTHeaderCheckbox"),s=T("DTColumnFilter");return c(),b("th",f({style:r.containerStyle,class:r.containerClass,tabindex:r.columnProp("sortable")?"0":null,role:"columnheader",colspan:r.columnProp("colspan"),rowspan:r.columnProp("rowspan"),"aria-sort":r.ariaSort,onClick:t[8]||(t[8]=function(){return r.onClick&&r.onClick.apply(r,arguments)}),onKeydown:t[9]||(t[9]=function(){return r.onKeyDown&&r.onKeyDown.apply(r,arguments)}),onMousedown:t[10]||(t[10]=function(){return r.onMouseDown&&r.onMouseDown.apply(r,arguments)}),onDragstart:t[11]||(t[11]=function(){return r.onDragStart&&r.onDragStart.apply(r,arguments)}),onDragover:t[12]||(t[12]=function(){return r.onDragOver&&r.onDragOver.apply(r,arguments)}),onDragleave:t[13]||(t[13]=function(){return r.onDragLeave&&r.onDragLeave.apply(r,arguments)}),onDrop:t[14]||(t[14]=function(){return r.onDrop&&r.onDrop.apply(r,arguments)})},_r(_r({},r.getColumnPT("root")),r.getColumnPT("headerCell")),{"data-p-sortable-column":r.columnProp("sortable"),"data-p-resizable-column":n.resizableColumns,"data-p-sorted":r.isColumnSorted(),"data-p-filter-column":n.filterColumn,"data-p-frozen-column":r.columnProp("frozen"),"data-p-reorderable-column":n.reorderableColumns}),[n.resizableColumns&&!r.columnProp("frozen")?(c(),b("span",f({key:0,class:e.cx("columnResizer"),onMousedown:t[0]||(t[0]=function(){return r.onResizeStart&&r.onResizeStart.apply(r,arguments)})},r.getColumnPT("columnResizer")),null,16)):C("",!0),R("div",f({class:e.cx("columnHeaderContent")},r.getColumnPT("columnHeaderContent")),[n.column.children&&n.column.children.header?(c(),y(M(n.column.children.header),{key:0,column:n.column},null,8,["column"])):C("",!0),r.columnProp("header")?(c(),b("span",f({key:1,class:e.cx("columnTitle")},r.getColumnPT("columnTitle")),Y(r.columnProp("header")),17)):C("",!0),r.columnProp("sortable")?(c(),b("span",mt(f({key:2},r.getColumnPT("sort"))),[(c(),y(M(n.column.children&&n.column.children.sorticon||r.sortableColumnIcon),f({sorted:r.sortState.sorted,sortOrder:r.sortState.sortOrder,class:e.cx("sortIcon")},r.getColumnPT("sorticon")),null,16,["sorted","sortOrder","class"]))],16)):C("",!0),r.isMultiSorted()?(c(),y(a,{key:3,class:j(e.cx("pcSortBadge")),pt:r.getColumnPT("pcSortBadge"),value:r.getBadgeValue(),size:"small"},null,8,["class","pt","value"])):C("",!0),r.columnProp("selectionMode")==="multiple"&&n.filterDisplay!=="row"?(c(),y(l,{key:4,checked:n.allRowsSelected,onChange:r.onHeaderCheckboxChange,disabled:n.empty,headerCheckboxIconTemplate:n.column.children&&n.column.children.headercheckboxicon,column:n.column,unstyled:e.unstyled,pt:e.pt},null,8,["checked","onChange","disabled","headerCheckboxIconTemplate","column","unstyled","pt"])):C("",!0),n.filterDisplay==="menu"&&n.column.children&&n.column.children.filter?(c(),y(s,{key:5,field:r.columnProp("filterField")||r.columnProp("field"),type:r.columnProp("dataType"),display:"menu",showMenu:r.columnProp("showFilterMenu"),filterElement:n.column.children&&n.column.children.filter,filterHeaderTemplate:n.column.children&&n.column.children.filterheader,filterFooterTemplate:n.column.children&&n.column.children.filterfooter,filterClearTemplate:n.column.children&&n.column.children.filterclear,filterApplyTemplate:n.column.children&&n.column.children.filterapply,filterIconTemplate:n.column.children&&n.column.children.filtericon,filterAddIconTemplate:n.column.children&&n.column.children.filteraddicon,filterRemoveIconTemplate:n.column.children&&n.column.children.filterremoveicon,filterClearIconTemplate:n.column.children&&n.column.children.filterclearicon,filters:n.filters,filtersStore:n.filtersStore,filterInputProps:n.filterInputProps,filterButtonProps:n.filterButtonProps,onFilterChange:t[1]||(t[1]=function(u){return e.$emit("filter-change",u)}),onFilterApply:t[2]||(t[2]=function(u){return e.$emit("filter-apply")}),filterMenuStyle:r.columnProp("filterMenuStyle"),filterMenuClass:r.columnProp("filterMenuClass"),showOperator:r.columnProp("showFilterOperator"),showClearButton:r.columnProp("showClearButton"),showApplyButton:r.columnProp("showApplyButton"),showMatchModes:r.columnProp("showFilterMatchModes"),showAddButton:r.columnProp("showAddButton"),matchModeOptions:r.columnProp("filterMatchModeOptions"),maxConstraints:r.columnProp("maxConstraints"),onOperatorChange:t[3]||(t[3]=function(u){return e.$emit("operator-change",u)}),onMatchmodeChange:t[4]||(t[4]=function(u){return e.$emit("matchmode-change",u)}),onConstraintAdd:t[5]||(t[5]=function(u){return e.$emit("constraint-add",u)}),onConstraintRemove:t[6]||(t[6]=function(u){return e.$emit("constraint-remove",u)}),onApplyClick:t[7]||(t[7]=function(u){return e.$emit("apply-click",u)}),column:n.column,unstyled:e.unstyled,pt:e.pt},null,8,["field","type","showMenu","filterElement","filterHeaderTemplate","filterFooterTemplate","filterClearTemplate","filterApplyTemplate","filterIconTemplate","filterAddIconTemplate","filterRemoveIconTemplate","filterClearIconTemplate","filters","filtersStore","filterInputProps","filterButtonProps","filterMenuStyle","filterMenuClass","showOperator","showClearButton","showApplyButton","showMatchModes","showAddButton","matchModeOptions","maxConstraints","column","unstyled","pt"])):C("",!0)],16)],16,ch)}ma.render=ph;var ba={name:"TableHeader",hostName:"DataTable",extends:U,emits:["column-click","column-mousedown","column-dragstart","column-dragover","column-dragleave","column-drop","column-resizestart","checkbox-change","filter-change","filter-apply","operator-change","matchmode-change","constraint-add","constraint-remove","filter-clear","apply-click"],props:{columnGroup:{type:null,default:null},columns:{type:null,default:null},rowGroupMode:{type:String,default:null},groupRowsBy:{type:[Array,String,Function],default:null},resizableColumns:{type:Boolean,default:!1},allRowsSelected:{type:Boolean,default:!1},empty:{type:Boolean,default:!1},sortMode:{type:String,default:"single"},groupRowSortField:{type:[String,Function],default:null},sortField:{type:[String,Function],default:null},sortOrder:{type:Number,default:null},multiSortMeta:{type:Array,default:null},filterDisplay:{type:String,default:null},filters:{type:Object,default:null},filtersStore:{type:Object,default:null},reorderableColumns:{type:Boolean,default:!1},first:{type:Number,default:0},filterInputProps:{type:null,default:null},filterButtonProps:{type:null,default:null}},provide:function(){return{$rows:this.d_headerRows,$columns:this.d_headerColumns}},data:function(){return{d_headerRows:new ft({type:"Row"}),d_headerColumns:new ft({type:"Column"})}},beforeUnmount:function(){this.d_headerRows.clear(),this.d_headerColumns.clear()},methods:{columnProp:function(t,n){return Je(t,n)},getColumnGroupPT:function(t){var n,o={props:this.getColumnGroupProps(),parent:{instance:this,props:this.$props,state:this.$data},context:{type:"header",scrollable:(n=this.$parentInstance)===null||n===void 0||(n=n.$parentInstance)===null||n===void 0?void 0:n.scrollable}};return f(this.ptm("columnGroup.".concat(t),{columnGroup:o}),this.ptm("columnGroup.".concat(t),o),this.ptmo(this.getColumnGroupProps(),t,o))},getColumnGroupProps:function(){return this.columnGroup&&this.columnGroup.props&&this.columnGroup.props.pt?this.columnGroup.props.pt:void 0},getRowPT:function(t,n,o){var i={props:t.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:o}};return f(this.ptm("row.".concat(n),{row:i}),this.ptm("row.".concat(n),i),this.ptmo(this.getRowProp(t),n,i))},getRowProp:function(t){return t.props&&t.props.pt?t.props.pt:void 0},getColumnPT:function(t,n,o){var i={props:t.props,parent:{instance:this,props:this.$props,state:this.$data},context:{index:o}};return f(this.ptm("column.".concat(n),{column:i}),this.ptm("column.".concat(n),i),this.ptmo(this.getColumnProp(t),n,i))},getColumnProp:function(t){return t.props&&t.props.pt?t.props.pt:void 0},getFilterColumnHeaderClass:function(t){return[this.cx("headerCell",{column:t}),this.columnProp(t,"filterHeaderClass"),this.columnProp(t,"class")]},getFilterColumnHeaderStyle:function(t){return[this.columnProp(t,"filterHeaderStyle"),this.columnProp(t,"style")]},getHeaderRows:function(){var t;return(t=this.d_headerRows)===null||t===void 0?void 0:t.get(this.columnGroup,this.columnGroup.children)},getHeaderColumns:function(t){var n;return(n=this.d_headerColumns)===null||n===void 0?void 0:n.get(t,t.children)}},computed:{ptmTHeadOptions:function(){var t;return{context:{scrollable:(t=this.$parentInstance)===null||t===void 0||(t=t.$parentInstance)===null||t===void 0?void 0:t.scrollable}}}},components:{DTHeaderCell:ma,DTFilterHeaderCell:ha}};function sn(e){"@babel/helpers - typeof";return sn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},sn(e)}function Wr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function In(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Wr(Object(n),!0).forEach(function(o){fh(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Wr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function fh(e,t,n){return(t=hh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hh(e){var t=mh(e,"string");return sn(t)=="symbol"?t:t+""}function mh(e,t){if(sn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(sn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var bh=["data-p-scrollable"];function gh(e,t,n,o,i,r){var a,l=T("DTHeaderCell"),s=T("DTFilterHeaderCell");return c(),b("thead",f({class:e.cx("thead"),style:e.sx("thead"),role:"rowgroup"},n.columnGroup?In(In({},e.ptm("thead",r.ptmTHeadOptions)),r.getColumnGroupPT("root")):e.ptm("thead",r.ptmTHeadOptions),{"data-p-scrollable":(a=e.$parentInstance)===null||a===void 0||(a=a.$parentInstance)===null||a===void 0?void 0:a.scrollable,"data-pc-section":"thead"}),[n.columnGroup?(c(!0),b(K,{key:1},ue(r.getHeaderRows(),function(u,d){return c(),b("tr",f({key:d,role:"row",ref_for:!0},In(In({},e.ptm("headerRow")),r.getRowPT(u,"root",d))),[(c(!0),b(K,null,ue(r.getHeaderColumns(u),function(p,h){return c(),b(K,{key:r.columnProp(p,"columnKey")||r.columnProp(p,"field")||h},[!r.columnProp(p,"hidden")&&(n.rowGroupMode!=="subheader"||n.groupRowsBy!==r.columnProp(p,"field"))&&typeof p.children!="string"?(c(),y(l,{key:0,column:p,onColumnClick:t[15]||(t[15]=function(m){return e.$emit("column-click",m)}),onColumnMousedown:t[16]||(t[16]=function(m){return e.$emit("column-mousedown",m)}),groupRowsBy:n.groupRowsBy,groupRowSortField:n.groupRowSortField,sortMode:n.sortMode,sortField:n.sortField,sortOrder:n.sortOrder,multiSortMeta:n.multiSortMeta,allRowsSelected:n.allRowsSelected,empty:n.empty,onCheckboxChange:t[17]||(t[17]=function(m){return e.$emit("checkbox-change",m)}),filters:n.filters,filterDisplay:n.filterDisplay,filtersStore:n.filtersStore,onFilterChange:t[18]||(t[18]=function(m){return e.$emit("filter-change",m)}),onFilterApply:t[19]||(t[19]=function(m){return e.$emit("filter-apply")}),onOperatorChange:t[20]||(t[20]=function(m){return e.$emit("operator-change",m)}),onMatchmodeChange:t[21]||(t[21]=function(m){return e.$emit("matchmode-change",m)}),onConstraintAdd:t[22]||(t[22]=function(m){return e.$emit("constraint-add",m)}),onConstraintRemove:t[23]||(t[23]=function(m){return e.$emit("constraint-remove",m)}),onApplyClick:t[24]||(t[24]=function(m){return e.$emit("apply-click",m)}),unstyled:e.unstyled,pt:e.pt},null,8,["column","groupRowsBy","groupRowSortField","sortMode","sortField","sortOrder","multiSortMeta","allRowsSelected","empty","filters","filterDisplay","filtersStore","unstyled","pt"])):C("",!0)],64)}),128))],16)}),128)):(c(),b("tr",f({key:0,role:"row"},e.ptm("headerRow")),[(c(!0),b(K,null,ue(n.columns,function(u,d){return c(),b(K,{key:r.columnProp(u,"columnKey")||r.columnProp(u,"field")||d},[!r.columnProp(u,"hidden")&&(n.rowGroupMode!=="subheader"||n.groupRowsBy!==r.columnProp(u,"field"))?(c(),y(l,{key:0,column:u,index:d,onColumnClick:t[0]||(t[0]=function(p){return e.$emit("column-click",p)}),onColumnMousedown:t[1]||(t[1]=function(p){return e.$emit("column-mousedown",p)}),onColumnDragstart:t[2]||(t[2]=function(p){return e.$emit("column-dragstart",p)}),onColumnDragover:t[3]||(t[3]=function(p){return e.$emit("column-dragover",p)}),onColumnDragleave:t[4]||(t[4]=function(p){return e.$emit("column-dragleave",p)}),onColumnDrop:t[5]||(t[5]=function(p){return e.$emit("column-drop",p)}),groupRowsBy:n.groupRowsBy,groupRowSortField:n.groupRowSortField,reorderableColumns:n.reorderableColumns,resizableColumns:n.resizableColumns,onColumnResizestart:t[6]||(t[6]=function(p){return e.$emit("column-resizestart",p)}),sortMode:n.sortMode,sortField:n.sortField,sortOrder:n.sortOrder,multiSortMeta:n.multiSortMeta,allRowsSelected:n.allRowsSelected,empty:n.empty,onCheckboxChange:t[7]||(t[7]=function(p){return e.$emit("checkbox-change",p)}),filters:n.filters,filterDisplay:n.filterDisplay,filtersStore:n.filtersStore,filterInputProps:n.filterInputProps,filterButtonProps:n.filterButtonProps,first:n.first,onFilterChange:t[8]||(t[8]=function(p){return e.$emit("filter-change",p)}),onFilterApply:t[9]||(t[9]=function(p){return e.$emit("filter-apply")}),onOperatorChange:t[10]||(t[10]=function(p){return e.$emit("operator-change",p)}),onMatchmodeChange:t[11]||(t[11]=function(p){return e.$emit("matchmode-change",p)}),onConstraintAdd:t[12]||(t[12]=function(p){return e.$emit("constraint-add",p)}),onConstraintRemove:t[13]||(t[13]=function(p){return e.$emit("constraint-remove",p)}),onApplyClick:t[14]||(t[14]=function(p){return e.$emit("apply-click",p)}),unstyled:e.unstyled,pt:e.pt},null,8,["column","index","groupRowsBy","groupRowSortField","reorderableColumns","resizableColumns","sortMode","sortField","sortOrder","multiSortMeta","allRowsSelected","empty","filters","filterDisplay","filtersStore","filterInputProps","filterButtonProps","first","unstyled","pt"])):C("",!0)],64)}),128))],16)),n.filterDisplay==="row"?(c(),b("tr",f({key:2,role:"row"},e.ptm("headerRow")),[(c(!0),b(K,null,ue(n.columns,function(u,d){return c(),b(K,{key:r.columnProp(u,"columnKey")||r.columnProp(u,"field")||d},[!r.columnProp(u,"hidden")&&(n.rowGroupMode!=="subheader"||n.groupRowsBy!==r.columnProp(u,"field"))?(c(),y(s,{key:0,column:u,index:d,allRowsSelected:n.allRowsSelected,empty:n.empty,display:"row",filters:n.filters,filtersStore:n.filtersStore,filterInputProps:n.filterInputProps,filterButtonProps:n.filterButtonProps,onFilterChange:t[25]||(t[25]=function(p){return e.$emit("filter-change",p)}),onFilterApply:t[26]||(t[26]=function(p){return e.$emit("filter-apply")}),onOperatorChange:t[27]||(t[27]=function(p){return e.$emit("operator-change",p)}),onMatchmodeChange:t[28]||(t[28]=function(p){return e.$emit("matchmode-change",p)}),onConstraintAdd:t[29]||(t[29]=function(p){return e.$emit("constraint-add",p)}),onConstraintRemove:t[30]||(t[30]=function(p){return e.$emit("constraint-remove",p)}),onApplyClick:t[31]||(t[31]=function(p){return e.$emit("apply-click",p)}),onCheckboxChange:t[32]||(t[32]=function(p){return e.$emit("checkbox-change",p)}),unstyled:e.unstyled,pt:e.pt},null,8,["column","index","allRowsSelected","empty","filters","filtersStore","filterInputProps","filterButtonProps","unstyled","pt"])):C("",!0)],64)}),128))],16)):C("",!0)],16,bh)}ba.render=gh;var yh=["expanded"];function je(e){"@babel/helpers - typeof";return je=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},je(e)}function vh(e,t){if(e==null)return{};var n,o,i=wh(e,t);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);for(o=0;o<r.length;o++)n=r[o],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function wh(e,t){if(e==null)return{};var n={};for(var o in e)if({}.hasOwnProperty.call(e,o)){if(t.indexOf(o)!==-1)continue;n[o]=e[o]}return n}function Zr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function $e(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Zr(Object(n),!0).forEach(function(o){Ch(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Zr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Ch(e,t,n){return(t=Sh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Sh(e){var t=$h(e,"string");return je(t)=="symbol"?t:t+""}function $h(e,t){if(je(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(je(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function qr(e,t){return Ph(e)||Ih(e,t)||Ao(e,t)||kh()}function kh(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Ih(e,t){var n=e==null?null:typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var o,i,r,a,l=[],s=!0,u=!1;try{if(r=(n=n.call(e)).next,t!==0)for(;!(s=(o=r.call(n)).done)&&(l.push(o.value),l.length!==t);s=!0);}catch(d){u=!0,i=d}finally{try{if(!s&&n.return!=null&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return l}}function Ph(e){if(Array.isArray(e))return e}function wt(e,t){var n=typeof Symbol!="undefined"&&e[Symbol.iterator]||e["@@iterator"];if(!n){if(Array.isArray(e)||(n=Ao(e))||t){n&&(e=n);var o=0,i=function(){};return{s:i,n:function(){return o>=e.length?{done:!0}:{done:!1,value:e[o++]}},e:function(u){throw u},f:i}}throw new TypeError(`Invalid attempt to iterate non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var r,a=!0,l=!1;return{s:function(){n=n.call(e)},n:function(){var u=n.next();return a=u.done,u},e:function(u){l=!0,r=u},f:function(){try{a||n.return==null||n.return()}finally{if(l)throw r}}}}function oe(e){return Rh(e)||xh(e)||Ao(e)||Oh()}function Oh(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Ao(e,t){if(e){if(typeof e=="string")return wo(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?wo(e,t):void 0}}function xh(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function Rh(e){if(Array.isArray(e))return wo(e)}function wo(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var Lh={name:"DataTable",extends:uf,inheritAttrs:!1,emits:["value-change","update:first","update:rows","page","update:sortField","update:sortOrder","update:multiSortMeta","sort","filter","row-click","row-dblclick","update:selection","row-select","row-unselect","update:contextMenuSelection","row-contextmenu","row-unselect-all","row-select-all","select-all-change","column-resize-end","column-reorder","row-reorder","update:expandedRows","row-collapse","row-expand","update:expandedRowGroups","rowgroup-collapse","rowgroup-expand","update:filters","state-restore","state-save","cell-edit-init","cell-edit-complete","cell-edit-cancel","update:editingRows","row-edit-init","row-edit-save","row-edit-cancel"],provide:function(){return{$columns:this.d_columns,$columnGroups:this.d_columnGroups}},data:function(){return{d_first:this.first,d_rows:this.rows,d_sortField:this.sortField,d_sortOrder:this.sortOrder,d_nullSortOrder:this.nullSortOrder,d_multiSortMeta:this.multiSortMeta?oe(this.multiSortMeta):[],d_groupRowsSortMeta:null,d_selectionKeys:null,d_columnOrder:null,d_editingRowKeys:null,d_editingMeta:{},d_filters:this.cloneFilters(this.filters),d_columns:new ft({type:"Column"}),d_columnGroups:new ft({type:"ColumnGroup"})}},rowTouched:!1,anchorRowIndex:null,rangeRowIndex:null,documentColumnResizeListener:null,documentColumnResizeEndListener:null,lastResizeHelperX:null,resizeColumnElement:null,columnResizing:!1,colReorderIconWidth:null,colReorderIconHeight:null,draggedColumn:null,draggedColumnElement:null,draggedRowIndex:null,droppedRowIndex:null,rowDragging:null,columnWidthsState:null,tableWidthState:null,columnWidthsRestored:!1,watch:{first:function(t){this.d_first=t},rows:function(t){this.d_rows=t},sortField:function(t){this.d_sortField=t},sortOrder:function(t){this.d_sortOrder=t},nullSortOrder:function(t){this.d_nullSortOrder=t},multiSortMeta:function(t){this.d_multiSortMeta=t},selection:{immediate:!0,handler:function(t){this.dataKey&&this.updateSelectionKeys(t)}},editingRows:{immediate:!0,handler:function(t){this.dataKey&&this.updateEditingRowKeys(t)}},filters:{deep:!0,handler:function(t){this.d_filters=this.cloneFilters(t)}}},mounted:function(){this.isStateful()&&(this.restoreState(),this.resizableColumns&&this.restoreColumnWidths()),this.editMode==="row"&&this.dataKey&&!this.d_editingRowKeys&&this.updateEditingRowKeys(this.editingRows)},beforeUnmount:function(){this.unbindColumnResizeEvents(),this.destroyStyleElement(),this.d_columns.clear(),this.d_columnGroups.clear()},updated:function(){this.isStateful()&&this.saveState(),this.editMode==="row"&&this.dataKey&&!this.d_editingRowKeys&&this.updateEditingRowKeys(this.editingRows)},methods:{columnProp:function(t,n){return Je(t,n)},onPage:function(t){var n=this;this.clearEditingMetaData(),this.d_first=t.first,this.d_rows=t.rows;var o=this.createLazyLoadEvent(t);o.pageCount=t.pageCount,o.page=t.page,this.$emit("update:first",this.d_first),this.$emit("update:rows",this.d_rows),this.$emit("page",o),this.$nextTick(function(){n.$emit("value-change",n.processedData)})},onColumnHeaderClick:function(t){var n=this,o=t.originalEvent,i=t.column;if(this.columnProp(i,"sortable")){var r=o.target,a=this.columnProp(i,"sortField")||this.columnProp(i,"field");if(fe(r,"data-p-sortable-column")===!0||fe(r,"data-pc-section")==="columntitle"||fe(r,"data-pc-section")==="columnheadercontent"||fe(r,"data-pc-section")==="sorticon"||fe(r.parentElement,"data-pc-section")==="sorticon"||fe(r.parentElement.parentElement,"data-pc-section")==="sorticon"||r.closest('[data-p-sortable-column="true"]')&&!r.closest('[data-pc-section="columnfilterbutton"]')&&!Wn(o.target)){if(xn(),this.sortMode==="single")this.d_sortField===a?this.removableSort&&this.d_sortOrder*-1===this.defaultSortOrder?(this.d_sortOrder=null,this.d_sortField=null):this.d_sortOrder=this.d_sortOrder*-1:(this.d_sortOrder=this.defaultSortOrder,this.d_sortField=a),this.$emit("update:sortField",this.d_sortField),this.$emit("update:sortOrder",this.d_sortOrder),this.resetPage();else if(this.sortMode==="multiple"){var l=o.metaKey||o.ctrlKey;l||(this.d_multiSortMeta=this.d_multiSortMeta.filter(function(s){return s.field===a})),this.addMultiSortField(a),this.$emit("update:multiSortMeta",this.d_multiSortMeta)}this.$emit("sort",this.createLazyLoadEvent(o)),this.$nextTick(function(){n.$emit("value-change",n.processedData)})}}},sortSingle:function(t){var n=this;if(this.clearEditingMetaData(),this.groupRowsBy&&this.groupRowsBy===this.sortField)return this.d_multiSortMeta=[{field:this.sortField,order:this.sortOrder||this.defaultSortOrder},{field:this.d_sortField,order:this.d_sortOrder}],this.sortMultiple(t);var o=oe(t),i=new Map,r=wt(o),a;try{for(r.s();!(a=r.n()).done;){var l=a.value;i.set(l,H(l,this.d_sortField))}}catch(u){r.e(u)}finally{r.f()}var s=Qn();return o.sort(function(u,d){var p=i.get(u),h=i.get(d);return eo(p,h,n.d_sortOrder,s,n.d_nullSortOrder)}),o},sortMultiple:function(t){var n=this;if(this.clearEditingMetaData(),this.groupRowsBy&&(this.d_groupRowsSortMeta||this.d_multiSortMeta.length&&this.groupRowsBy===this.d_multiSortMeta[0].field)){var o=this.d_multiSortMeta[0];!this.d_groupRowsSortMeta&&(this.d_groupRowsSortMeta=o),o.field!==this.d_groupRowsSortMeta.field&&(this.d_multiSortMeta=[this.d_groupRowsSortMeta].concat(oe(this.d_multiSortMeta)))}var i=oe(t);return i.sort(function(r,a){return n.multisortField(r,a,0)}),i},multisortField:function(t,n,o){var i=H(t,this.d_multiSortMeta[o].field),r=H(n,this.d_multiSortMeta[o].field),a=Qn();return i===r?this.d_multiSortMeta.length-1>o?this.multisortField(t,n,o+1):0:eo(i,r,this.d_multiSortMeta[o].order,a,this.d_nullSortOrder)},addMultiSortField:function(t){var n=this.d_multiSortMeta.findIndex(function(o){return o.field===t});n>=0?this.removableSort&&this.d_multiSortMeta[n].order*-1===this.defaultSortOrder?this.d_multiSortMeta.splice(n,1):this.d_multiSortMeta[n]={field:t,order:this.d_multiSortMeta[n].order*-1}:this.d_multiSortMeta.push({field:t,order:this.defaultSortOrder}),this.d_multiSortMeta=oe(this.d_multiSortMeta)},getActiveFilters:function(t){var n=function(a){var l=qr(a,2),s=l[0],u=l[1];if(u.constraints){var d=u.constraints.filter(function(p){return p.value!==null});if(d.length>0)return[s,$e($e({},u),{},{constraints:d})]}else if(u.value!==null)return[s,u]},o=function(a){return a!==void 0},i=Object.entries(t).map(n).filter(o);return Object.fromEntries(i)},filter:function(t){var n=this;if(t){this.clearEditingMetaData();var o=this.getActiveFilters(this.filters),i;o.global&&(i=this.globalFilterFields||this.columns.map(function(g){return n.columnProp(g,"filterField")||n.columnProp(g,"field")}));for(var r=[],a=0;a<t.length;a++){var l=!0,s=!1,u=!1;for(var d in o)if(Object.prototype.hasOwnProperty.call(o,d)&&d!=="global"){u=!0;var p=d,h=o[p];if(h.operator){var m=wt(h.constraints),w;try{for(m.s();!(w=m.n()).done;){var $=w.value;if(l=this.executeLocalFilter(p,t[a],$),h.operator===Fn.OR&&l||h.operator===Fn.AND&&!l)break}}catch(g){m.e(g)}finally{m.f()}}else l=this.executeLocalFilter(p,t[a],h);if(!l)break}if(l&&o.global&&!s&&i)for(var v=0;v<i.length;v++){var I=i[v];if(s=co.filters[o.global.matchMode||pe.CONTAINS](H(t[a],I),o.global.value,this.filterLocale),s)break}var P=void 0;o.global?P=u?u&&l&&s:s:P=u&&l,P&&r.push(t[a])}(r.length===this.value.length||Object.keys(o).length==0)&&(r=t);var L=this.createLazyLoadEvent();return L.filteredValue=r,this.$emit("filter",L),this.$emit("value-change",r),r}},executeLocalFilter:function(t,n,o){var i=o.value,r=o.matchMode||pe.STARTS_WITH,a=H(n,t),l=co.filters[r];return l(a,i,this.filterLocale)},onRowClick:function(t){var n=t.originalEvent,o=this.$refs.bodyRef&&this.$refs.bodyRef.$el,i=xe(o,'tr[data-p-selectable-row="true"][tabindex="0"]');if(!Wn(n.target)){if(this.$emit("row-click",t),this.selectionMode){var r=t.data,a=this.d_first+t.index;if(this.isMultipleSelectionMode()&&n.shiftKey&&this.anchorRowIndex!=null)xn(),this.rangeRowIndex=a,this.selectRange(n);else{var l=this.isSelected(r),s=this.rowTouched?!1:this.metaKeySelection;if(this.anchorRowIndex=a,this.rangeRowIndex=a,s){var u=n.metaKey||n.ctrlKey;if(l&&u){if(this.isSingleSelectionMode())this.$emit("update:selection",null);else{var d=this.findIndexInSelection(r),p=this.selection.filter(function(L,g){return g!=d});this.$emit("update:selection",p)}this.$emit("row-unselect",{originalEvent:n,data:r,index:a,type:"row"})}else{if(this.isSingleSelectionMode())this.$emit("update:selection",r);else if(this.isMultipleSelectionMode()){var h=u?this.selection||[]:[];h=[].concat(oe(h),[r]),this.$emit("update:selection",h)}this.$emit("row-select",{originalEvent:n,data:r,index:a,type:"row"})}}else if(this.selectionMode==="single")l?(this.$emit("update:selection",null),this.$emit("row-unselect",{originalEvent:n,data:r,index:a,type:"row"})):(this.$emit("update:selection",r),this.$emit("row-select",{originalEvent:n,data:r,index:a,type:"row"}));else if(this.selectionMode==="multiple")if(l){var m=this.findIndexInSelection(r),w=this.selection.filter(function(L,g){return g!=m});this.$emit("update:selection",w),this.$emit("row-unselect",{originalEvent:n,data:r,index:a,type:"row"})}else{var $=this.selection?[].concat(oe(this.selection),[r]):[r];this.$emit("update:selection",$),this.$emit("row-select",{originalEvent:n,data:r,index:a,type:"row"})}}}if(this.rowTouched=!1,i){var v,I;if(((v=n.target)===null||v===void 0?void 0:v.getAttribute("data-pc-section"))==="rowtoggleicon")return;var P=(I=n.currentTarget)===null||I===void 0?void 0:I.closest('tr[data-p-selectable-row="true"]');i.tabIndex="-1",P&&(P.tabIndex="0")}}},onRowDblClick:function(t){var n=t.originalEvent;Wn(n.target)||this.$emit("row-dblclick",t)},onRowRightClick:function(t){this.contextMenu&&(xn(),t.originalEvent.target.focus()),this.$emit("update:contextMenuSelection",t.data),this.$emit("row-contextmenu",t)},onRowTouchEnd:function(){this.rowTouched=!0},onRowKeyDown:function(t,n){var o=t.originalEvent,i=t.data,r=t.index,a=o.metaKey||o.ctrlKey;if(this.selectionMode){var l=o.target;switch(o.code){case"ArrowDown":this.onArrowDownKey(o,l,r,n);break;case"ArrowUp":this.onArrowUpKey(o,l,r,n);break;case"Home":this.onHomeKey(o,l,r,n);break;case"End":this.onEndKey(o,l,r,n);break;case"Enter":case"NumpadEnter":this.onEnterKey(o,i,r);break;case"Space":this.onSpaceKey(o,i,r,n);break;case"Tab":this.onTabKey(o,r);break;default:if(o.code==="KeyA"&&a&&this.isMultipleSelectionMode()){var s=this.dataToRender(n.rows);this.$emit("update:selection",s)}var u=o.code==="KeyC"&&a;u||o.preventDefault();break}}},onArrowDownKey:function(t,n,o,i){var r=this.findNextSelectableRow(n);if(r&&this.focusRowChange(n,r),t.shiftKey){var a=this.dataToRender(i.rows),l=o+1>=a.length?a.length-1:o+1;this.onRowClick({originalEvent:t,data:a[l],index:l})}t.preventDefault()},onArrowUpKey:function(t,n,o,i){var r=this.findPrevSelectableRow(n);if(r&&this.focusRowChange(n,r),t.shiftKey){var a=this.dataToRender(i.rows),l=o-1<=0?0:o-1;this.onRowClick({originalEvent:t,data:a[l],index:l})}t.preventDefault()},onHomeKey:function(t,n,o,i){var r=this.findFirstSelectableRow();if(r&&this.focusRowChange(n,r),t.ctrlKey&&t.shiftKey){var a=this.dataToRender(i.rows);this.$emit("update:selection",a.slice(0,o+1))}t.preventDefault()},onEndKey:function(t,n,o,i){var r=this.findLastSelectableRow();if(r&&this.focusRowChange(n,r),t.ctrlKey&&t.shiftKey){var a=this.dataToRender(i.rows);this.$emit("update:selection",a.slice(o,a.length))}t.preventDefault()},onEnterKey:function(t,n,o){this.onRowClick({originalEvent:t,data:n,index:o}),t.preventDefault()},onSpaceKey:function(t,n,o,i){if(this.onEnterKey(t,n,o),t.shiftKey&&this.selection!==null){var r=this.dataToRender(i.rows),a;if(this.selection.length>0){var l,s;l=Zn(this.selection[0],r),s=Zn(this.selection[this.selection.length-1],r),a=o<=l?s:l}else a=Zn(this.selection,r);var u=a!==o?r.slice(Math.min(a,o),Math.max(a,o)+1):n;this.$emit("update:selection",u)}},onTabKey:function(t,n){var o=this.$refs.bodyRef&&this.$refs.bodyRef.$el,i=lt(o,'tr[data-p-selectable-row="true"]');if(t.code==="Tab"&&i&&i.length>0){var r=xe(o,'tr[data-p-selected="true"]'),a=xe(o,'tr[data-p-selectable-row="true"][tabindex="0"]');r?(r.tabIndex="0",a&&a!==r&&(a.tabIndex="-1")):(i[0].tabIndex="0",a!==i[0]&&(i[n].tabIndex="-1"))}},findNextSelectableRow:function(t){var n=t.nextElementSibling;return n?fe(n,"data-p-selectable-row")===!0?n:this.findNextSelectableRow(n):null},findPrevSelectableRow:function(t){var n=t.previousElementSibling;return n?fe(n,"data-p-selectable-row")===!0?n:this.findPrevSelectableRow(n):null},findFirstSelectableRow:function(){var t=xe(this.$refs.table,'tr[data-p-selectable-row="true"]');return t},findLastSelectableRow:function(){var t=lt(this.$refs.table,'tr[data-p-selectable-row="true"]');return t?t[t.length-1]:null},focusRowChange:function(t,n){t.tabIndex="-1",n.tabIndex="0",te(n)},toggleRowWithRadio:function(t){var n=t.data;this.isSelected(n)?(this.$emit("update:selection",null),this.$emit("row-unselect",{originalEvent:t.originalEvent,data:n,index:t.index,type:"radiobutton"})):(this.$emit("update:selection",n),this.$emit("row-select",{originalEvent:t.originalEvent,data:n,index:t.index,type:"radiobutton"}))},toggleRowWithCheckbox:function(t){var n=t.data;if(this.isSelected(n)){var o=this.findIndexInSelection(n),i=this.selection.filter(function(a,l){return l!=o});this.$emit("update:selection",i),this.$emit("row-unselect",{originalEvent:t.originalEvent,data:n,index:t.index,type:"checkbox"})}else{var r=this.selection?oe(this.selection):[];r=[].concat(oe(r),[n]),this.$emit("update:selection",r),this.$emit("row-select",{originalEvent:t.originalEvent,data:n,index:t.index,type:"checkbox"})}},toggleRowsWithCheckbox:function(t){if(this.selectAll!==null)this.$emit("select-all-change",t);else{var n=t.originalEvent,o=t.checked,i=[];o?(i=this.frozenValue?[].concat(oe(this.frozenValue),oe(this.processedData)):this.processedData,this.$emit("row-select-all",{originalEvent:n,data:i})):this.$emit("row-unselect-all",{originalEvent:n}),this.$emit("update:selection",i)}},isSingleSelectionMode:function(){return this.selectionMode==="single"},isMultipleSelectionMode:function(){return this.selectionMode==="multiple"},isSelected:function(t){return t&&this.selection?this.dataKey?this.d_selectionKeys?this.d_selectionKeys[H(t,this.dataKey)]!==void 0:!1:this.selection instanceof Array?this.findIndexInSelection(t)>-1:this.equals(t,this.selection):!1},findIndexInSelection:function(t){return this.findIndex(t,this.selection)},findIndex:function(t,n){var o=-1;if(n&&n.length){for(var i=0;i<n.length;i++)if(this.equals(t,n[i])){o=i;break}}return o},updateSelectionKeys:function(t){if(this.d_selectionKeys={},Array.isArray(t)){var n=wt(t),o;try{for(n.s();!(o=n.n()).done;){var i=o.value;this.d_selectionKeys[String(H(i,this.dataKey))]=1}}catch(r){n.e(r)}finally{n.f()}}else this.d_selectionKeys[String(H(t,this.dataKey))]=1},updateEditingRowKeys:function(t){if(t&&t.length){this.d_editingRowKeys={};var n=wt(t),o;try{for(n.s();!(o=n.n()).done;){var i=o.value;this.d_editingRowKeys[String(H(i,this.dataKey))]=1}}catch(r){n.e(r)}finally{n.f()}}else this.d_editingRowKeys=null},equals:function(t,n){return this.compareSelectionBy==="equals"?t===n:Ye(t,n,this.dataKey)},selectRange:function(t){var n,o;this.rangeRowIndex>this.anchorRowIndex?(n=this.anchorRowIndex,o=this.rangeRowIndex):this.rangeRowIndex<this.anchorRowIndex?(n=this.rangeRowIndex,o=this.anchorRowIndex):(n=this.rangeRowIndex,o=this.rangeRowIndex),this.lazy&&this.paginator&&(n-=this.d_first,o-=this.d_first);for(var i=this.processedData,r=[],a=n;a<=o;a++){var l=i[a];r.push(l),this.$emit("row-select",{originalEvent:t,data:l,type:"row"})}this.$emit("update:selection",r)},exportCSV:function(t,n){var o=this,i="\uFEFF";n||(n=this.processedData,t&&t.selectionOnly?n=this.selection||[]:this.frozenValue&&(n=n?[].concat(oe(this.frozenValue),oe(n)):this.frozenValue));for(var r=!1,a=0;a<this.columns.length;a++){var l=this.columns[a];this.columnProp(l,"exportable")!==!1&&this.columnProp(l,"field")&&(r?i+=this.csvSeparator:r=!0,i+='"'+(this.columnProp(l,"exportHeader")||this.columnProp(l,"header")||this.columnProp(l,"field"))+'"')}n&&n.forEach(function(p){i+=`
-`;for(var h=!1,m=0;m<o.columns.length;m++){var w=o.columns[m];if(o.columnProp(w,"exportable")!==!1&&o.columnProp(w,"field")){h?i+=o.csvSeparator:h=!0;var $=H(p,o.columnProp(w,"field"));$!=null?o.exportFunction?$=o.exportFunction({data:$,field:o.columnProp(w,"field")}):$=String($).replace(/"/g,'""'):$="",i+='"'+$+'"'}}});for(var s=!1,u=0;u<this.columns.length;u++){var d=this.columns[u];u===0&&(i+=`
-`),this.columnProp(d,"exportable")!==!1&&this.columnProp(d,"exportFooter")&&(s?i+=this.csvSeparator:s=!0,i+='"'+(this.columnProp(d,"exportFooter")||this.columnProp(d,"footer")||this.columnProp(d,"field"))+'"')}Ja(i,this.exportFilename)},resetPage:function(){this.d_first=0,this.$emit("update:first",this.d_first)},onColumnResizeStart:function(t){var n=st(this.$el).left;this.resizeColumnElement=t.target.parentElement,this.columnResizing=!0,this.lastResizeHelperX=t.pageX-n+this.$el.scrollLeft,this.bindColumnResizeEvents()},onColumnResize:function(t){var n=st(this.$el).left;this.$el.setAttribute("data-p-unselectable-text","true"),!this.isUnstyled&&pt(this.$el,{"user-select":"none"}),this.$refs.resizeHelper.style.height=this.$el.offsetHeight+"px",this.$refs.resizeHelper.style.top="0px",this.$refs.resizeHelper.style.left=t.pageX-n+this.$el.scrollLeft+"px",this.$refs.resizeHelper.style.display="block"},onColumnResizeEnd:function(){var t=si(this.$el)?this.lastResizeHelperX-this.$refs.resizeHelper.offsetLeft:this.$refs.resizeHelper.offsetLeft-this.lastResizeHelperX,n=this.resizeColumnElement.offsetWidth,o=n+t,i=this.resizeColumnElement.style.minWidth||15;if(n+t>parseInt(i,10)){if(this.columnResizeMode==="fit"){var r=this.resizeColumnElement.nextElementSibling,a=r.offsetWidth-t;o>15&&a>15&&this.resizeTableCells(o,a)}else if(this.columnResizeMode==="expand"){var l=this.$refs.table.offsetWidth+t+"px",s=function(h){h&&(h.style.width=h.style.minWidth=l)};if(this.resizeTableCells(o),s(this.$refs.table),!this.virtualScrollerDisabled){var u=this.$refs.bodyRef&&this.$refs.bodyRef.$el,d=this.$refs.frozenBodyRef&&this.$refs.frozenBodyRef.$el;s(u),s(d)}}this.$emit("column-resize-end",{element:this.resizeColumnElement,delta:t})}this.$refs.resizeHelper.style.display="none",this.resizeColumn=null,this.$el.removeAttribute("data-p-unselectable-text"),!this.isUnstyled&&(this.$el.style["user-select"]=""),this.unbindColumnResizeEvents(),this.isStateful()&&this.saveState()},resizeTableCells:function(t,n){var o=Rn(this.resizeColumnElement),i=[],r=lt(this.$refs.table,'thead[data-pc-section="thead"] > tr > th');r.forEach(function(s){return i.push(ve(s))}),this.destroyStyleElement(),this.createStyleElement();var a="",l='[data-pc-name="datatable"]['.concat(this.$attrSelector,'] > [data-pc-section="tablecontainer"] ').concat(this.virtualScrollerDisabled?"":'> [data-pc-name="virtualscroller"]',' > table[data-pc-section="table"]');i.forEach(function(s,u){var d=u===o?t:n&&u===o+1?n:s,p="width: ".concat(d,"px !important; max-width: ").concat(d,"px !important");a+=`
-                    `.concat(l,' > thead[data-pc-section="thead"] > tr > th:nth-child(').concat(u+1,`),
-                    `).concat(l,' > tbody[data-pc-section="tbody"] > tr > td:nth-child(').concat(u+1,`),
-                    `).concat(l,' > tfoot[data-pc-section="tfoot"] > tr > td:nth-child(').concat(u+1,`) {
-                        `).concat(p,`
-                    }
-                `)}),this.styleElement.innerHTML=a},bindColumnResizeEvents:function(){var t=this;this.documentColumnResizeListener||(this.documentColumnResizeListener=function(n){t.columnResizing&&t.onColumnResize(n)},document.addEventListener("mousemove",this.documentColumnResizeListener)),this.documentColumnResizeEndListener||(this.documentColumnResizeEndListener=function(){t.columnResizing&&(t.columnResizing=!1,t.onColumnResizeEnd())},document.addEventListener("mouseup",this.documentColumnResizeEndListener))},unbindColumnResizeEvents:function(){this.documentColumnResizeListener&&(document.removeEventListener("document",this.documentColumnResizeListener),this.documentColumnResizeListener=null),this.documentColumnResizeEndListener&&(document.removeEventListener("document",this.documentColumnResizeEndListener),this.documentColumnResizeEndListener=null)},onColumnHeaderMouseDown:function(t){var n=t.originalEvent,o=t.column;this.reorderableColumns&&this.columnProp(o,"reorderableColumn")!==!1&&(n.target.nodeName==="INPUT"||n.target.nodeName==="TEXTAREA"||fe(n.target,'[data-pc-section="columnresizer"]')?n.currentTarget.draggable=!1:n.currentTarget.draggable=!0)},onColumnHeaderDragStart:function(t){var n=t.originalEvent,o=t.column;if(this.columnResizing){n.preventDefault();return}this.colReorderIconWidth=ol(this.$refs.reorderIndicatorUp),this.colReorderIconHeight=nl(this.$refs.reorderIndicatorUp),this.draggedColumn=o,this.draggedColumnElement=this.findParentHeader(n.target),n.dataTransfer.setData("text","b")},onColumnHeaderDragOver:function(t){var n=t.originalEvent,o=t.column,i=this.findParentHeader(n.target);if(this.reorderableColumns&&this.draggedColumnElement&&i&&!this.columnProp(o,"frozen")){n.preventDefault();var r=st(this.$el),a=st(i);if(this.draggedColumnElement!==i){var l=a.left-r.left,s=a.left+i.offsetWidth/2;this.$refs.reorderIndicatorUp.style.top=a.top-r.top-(this.colReorderIconHeight-1)+"px",this.$refs.reorderIndicatorDown.style.top=a.top-r.top+i.offsetHeight+"px",n.pageX>s?(this.$refs.reorderIndicatorUp.style.left=l+i.offsetWidth-Math.ceil(this.colReorderIconWidth/2)+"px",this.$refs.reorderIndicatorDown.style.left=l+i.offsetWidth-Math.ceil(this.colReorderIconWidth/2)+"px",this.dropPosition=1):(this.$refs.reorderIndicatorUp.style.left=l-Math.ceil(this.colReorderIconWidth/2)+"px",this.$refs.reorderIndicatorDown.style.left=l-Math.ceil(this.colReorderIconWidth/2)+"px",this.dropPosition=-1),this.$refs.reorderIndicatorUp.style.display="block",this.$refs.reorderIndicatorDown.style.display="block"}}},onColumnHeaderDragLeave:function(t){var n=t.originalEvent;this.reorderableColumns&&this.draggedColumnElement&&(n.preventDefault(),this.$refs.reorderIndicatorUp.style.display="none",this.$refs.reorderIndicatorDown.style.display="none")},onColumnHeaderDrop:function(t){var n=this,o=t.originalEvent,i=t.column;if(o.preventDefault(),this.draggedColumnElement){var r=Rn(this.draggedColumnElement),a=Rn(this.findParentHeader(o.target)),l=r!==a;if(l&&(a-r===1&&this.dropPosition===-1||a-r===-1&&this.dropPosition===1)&&(l=!1),l){var s=function(I,P){return n.columnProp(I,"columnKey")||n.columnProp(P,"columnKey")?n.columnProp(I,"columnKey")===n.columnProp(P,"columnKey"):n.columnProp(I,"field")===n.columnProp(P,"field")},u=this.columns.findIndex(function(v){return s(v,n.draggedColumn)}),d=this.columns.findIndex(function(v){return s(v,i)}),p=[],h=lt(this.$el,'thead[data-pc-section="thead"] > tr > th');h.forEach(function(v){return p.push(ve(v))});var m=p.find(function(v,I){return I===u}),w=p.filter(function(v,I){return I!==u}),$=[].concat(oe(w.slice(0,d)),[m],oe(w.slice(d)));this.addColumnWidthStyles($),d<u&&this.dropPosition===1&&d++,d>u&&this.dropPosition===-1&&d--,Uo(this.columns,u,d),this.updateReorderableColumns(),this.$emit("column-reorder",{originalEvent:o,dragIndex:u,dropIndex:d})}this.$refs.reorderIndicatorUp.style.display="none",this.$refs.reorderIndicatorDown.style.display="none",this.draggedColumnElement.draggable=!1,this.draggedColumnElement=null,this.draggedColumn=null,this.dropPosition=null}},findParentHeader:function(t){if(t.nodeName==="TH")return t;for(var n=t.parentElement;n.nodeName!=="TH"&&(n=n.parentElement,!!n););return n},findColumnByKey:function(t,n){if(t&&t.length)for(var o=0;o<t.length;o++){var i=t[o];if(this.columnProp(i,"columnKey")===n||this.columnProp(i,"field")===n)return i}return null},onRowMouseDown:function(t){fe(t.target,"data-pc-section")==="reorderablerowhandle"||fe(t.target.parentElement,"data-pc-section")==="reorderablerowhandle"?t.currentTarget.draggable=!0:t.currentTarget.draggable=!1},onRowDragStart:function(t){var n=t.originalEvent,o=t.index;this.rowDragging=!0,this.draggedRowIndex=o,n.dataTransfer.setData("text","b")},onRowDragOver:function(t){var n=t.originalEvent,o=t.index;if(this.rowDragging&&this.draggedRowIndex!==o){var i=n.currentTarget,r=st(i).top,a=n.pageY,l=r+Pt(i)/2,s=i.previousElementSibling;a<l?(i.setAttribute("data-p-datatable-dragpoint-bottom","false"),!this.isUnstyled&&ze(i,"p-datatable-dragpoint-bottom"),this.droppedRowIndex=o,s?(s.setAttribute("data-p-datatable-dragpoint-bottom","true"),!this.isUnstyled&&We(s,"p-datatable-dragpoint-bottom")):(i.setAttribute("data-p-datatable-dragpoint-top","true"),!this.isUnstyled&&We(i,"p-datatable-dragpoint-top"))):(s?(s.setAttribute("data-p-datatable-dragpoint-bottom","false"),!this.isUnstyled&&ze(s,"p-datatable-dragpoint-bottom")):(i.setAttribute("data-p-datatable-dragpoint-top","true"),!this.isUnstyled&&We(i,"p-datatable-dragpoint-top")),this.droppedRowIndex=o+1,i.setAttribute("data-p-datatable-dragpoint-bottom","true"),!this.isUnstyled&&We(i,"p-datatable-dragpoint-bottom")),n.preventDefault()}},onRowDragLeave:function(t){var n=t.currentTarget,o=n.previousElementSibling;o&&(o.setAttribute("data-p-datatable-dragpoint-bottom","false"),!this.isUnstyled&&ze(o,"p-datatable-dragpoint-bottom")),n.setAttribute("data-p-datatable-dragpoint-bottom","false"),!this.isUnstyled&&ze(n,"p-datatable-dragpoint-bottom"),n.setAttribute("data-p-datatable-dragpoint-top","false"),!this.isUnstyled&&ze(n,"p-datatable-dragpoint-top")},onRowDragEnd:function(t){this.rowDragging=!1,this.draggedRowIndex=null,this.droppedRowIndex=null,t.currentTarget.draggable=!1},onRowDrop:function(t){if(this.droppedRowIndex!=null){var n=this.draggedRowIndex>this.droppedRowIndex?this.droppedRowIndex:this.droppedRowIndex===0?0:this.droppedRowIndex-1,o=oe(this.processedData);Uo(o,this.draggedRowIndex+this.d_first,n+this.d_first),this.$emit("row-reorder",{originalEvent:t,dragIndex:this.draggedRowIndex,dropIndex:n,value:o})}this.onRowDragLeave(t),this.onRowDragEnd(t),t.preventDefault()},toggleRow:function(t){var n=this,o=t.expanded,i=vh(t,yh),r=t.data,a;if(this.dataKey){var l=H(r,this.dataKey);a=this.expandedRows?$e({},this.expandedRows):{},o?a[l]=!0:delete a[l]}else a=this.expandedRows?oe(this.expandedRows):[],o?a.push(r):a=a.filter(function(s){return!n.equals(r,s)});this.$emit("update:expandedRows",a),o?this.$emit("row-expand",i):this.$emit("row-collapse",i)},toggleRowGroup:function(t){var n=t.originalEvent,o=t.data,i=H(o,this.groupRowsBy),r=this.expandedRowGroups?oe(this.expandedRowGroups):[];this.isRowGroupExpanded(o)?(r=r.filter(function(a){return a!==i}),this.$emit("update:expandedRowGroups",r),this.$emit("rowgroup-collapse",{originalEvent:n,data:i})):(r.push(i),this.$emit("update:expandedRowGroups",r),this.$emit("rowgroup-expand",{originalEvent:n,data:i}))},isRowGroupExpanded:function(t){if(this.expandableRowGroups&&this.expandedRowGroups){var n=H(t,this.groupRowsBy);return this.expandedRowGroups.indexOf(n)>-1}return!1},isStateful:function(){return this.stateKey!=null},getStorage:function(){switch(this.stateStorage){case"local":return window.localStorage;case"session":return window.sessionStorage;default:throw new Error(this.stateStorage+' is not a valid value for the state storage, supported values are "local" and "session".')}},saveState:function(){var t=this.getStorage(),n={};this.paginator&&(n.first=this.d_first,n.rows=this.d_rows),this.d_sortField&&(typeof this.d_sortField!="function"&&(n.sortField=this.d_sortField),n.sortOrder=this.d_sortOrder),this.d_multiSortMeta&&(n.multiSortMeta=this.d_multiSortMeta),this.hasFilters&&(n.filters=this.filters),this.resizableColumns&&this.saveColumnWidths(n),this.reorderableColumns&&(n.columnOrder=this.d_columnOrder),this.expandedRows&&(n.expandedRows=this.expandedRows),this.expandedRowGroups&&(n.expandedRowGroups=this.expandedRowGroups),this.selection&&(n.selection=this.selection,n.selectionKeys=this.d_selectionKeys),Object.keys(n).length&&t.setItem(this.stateKey,JSON.stringify(n)),this.$emit("state-save",n)},restoreState:function(){var t=this.getStorage(),n=t.getItem(this.stateKey),o=/\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}Z/,i=function(s,u){return typeof u=="string"&&o.test(u)?new Date(u):u},r;try{r=JSON.parse(n,i)}catch(l){}if(!r||je(r)!=="object"){t.removeItem(this.stateKey);return}var a={};this.paginator&&(typeof r.first=="number"&&(this.d_first=r.first,this.$emit("update:first",this.d_first),a.first=this.d_first),typeof r.rows=="number"&&(this.d_rows=r.rows,this.$emit("update:rows",this.d_rows),a.rows=this.d_rows)),typeof r.sortField=="string"&&(this.d_sortField=r.sortField,this.$emit("update:sortField",this.d_sortField),a.sortField=this.d_sortField),typeof r.sortOrder=="number"&&(this.d_sortOrder=r.sortOrder,this.$emit("update:sortOrder",this.d_sortOrder),a.sortOrder=this.d_sortOrder),Array.isArray(r.multiSortMeta)&&(this.d_multiSortMeta=r.multiSortMeta,this.$emit("update:multiSortMeta",this.d_multiSortMeta),a.multiSortMeta=this.d_multiSortMeta),this.hasFilters&&je(r.filters)==="object"&&r.filters!==null&&(this.d_filters=this.cloneFilters(r.filters),this.$emit("update:filters",this.d_filters),a.filters=this.d_filters),this.resizableColumns&&(typeof r.columnWidths=="string"&&(this.columnWidthsState=r.columnWidths,a.columnWidths=this.columnWidthsState),typeof r.tableWidth=="string"&&(this.tableWidthState=r.tableWidth,a.tableWidth=this.tableWidthState)),this.reorderableColumns&&Array.isArray(r.columnOrder)&&(this.d_columnOrder=r.columnOrder,a.columnOrder=this.d_columnOrder),je(r.expandedRows)==="object"&&r.expandedRows!==null&&(this.$emit("update:expandedRows",r.expandedRows),a.expandedRows=r.expandedRows),Array.isArray(r.expandedRowGroups)&&(this.$emit("update:expandedRowGroups",r.expandedRowGroups),a.expandedRowGroups=r.expandedRowGroups),je(r.selection)==="object"&&r.selection!==null&&(je(r.selectionKeys)==="object"&&r.selectionKeys!==null&&(this.d_selectionKeys=r.selectionKeys,a.selectionKeys=this.d_selectionKeys),this.$emit("update:selection",r.selection),a.selection=r.selection),this.$emit("state-restore",a)},saveColumnWidths:function(t){var n=[],o=lt(this.$el,'thead[data-pc-section="thead"] > tr > th');o.forEach(function(i){return n.push(ve(i))}),t.columnWidths=n.join(","),this.columnResizeMode==="expand"&&(t.tableWidth=ve(this.$refs.table)+"px")},addColumnWidthStyles:function(t){this.createStyleElement();var n="",o='[data-pc-name="datatable"]['.concat(this.$attrSelector,'] > [data-pc-section="tablecontainer"] ').concat(this.virtualScrollerDisabled?"":'> [data-pc-name="virtualscroller"]',' > table[data-pc-section="table"]');t.forEach(function(i,r){var a="width: ".concat(i,"px !important; max-width: ").concat(i,"px !important");n+=`
-        `.concat(o,' > thead[data-pc-section="thead"] > tr > th:nth-child(').concat(r+1,`),
-        `).concat(o,' > tbody[data-pc-section="tbody"] > tr > td:nth-child(').concat(r+1,`),
-        `).concat(o,' > tfoot[data-pc-section="tfoot"] > tr > td:nth-child(').concat(r+1,`) {
-            `).concat(a,`
-        }
-    `)}),this.styleElement.innerHTML=n},restoreColumnWidths:function(){if(this.columnWidthsState){var t=this.columnWidthsState.split(",");this.columnResizeMode==="expand"&&this.tableWidthState&&(this.$refs.table.style.width=this.tableWidthState,this.$refs.table.style.minWidth=this.tableWidthState),A(t)&&this.addColumnWidthStyles(t)}},onCellEditInit:function(t){this.$emit("cell-edit-init",t)},onCellEditComplete:function(t){this.$emit("cell-edit-complete",t)},onCellEditCancel:function(t){this.$emit("cell-edit-cancel",t)},onRowEditInit:function(t){var n=this.editingRows?oe(this.editingRows):[];n.push(t.data),this.$emit("update:editingRows",n),this.$emit("row-edit-init",t)},onRowEditSave:function(t){var n=oe(this.editingRows);n.splice(this.findIndex(t.data,n),1),this.$emit("update:editingRows",n),this.$emit("row-edit-save",t)},onRowEditCancel:function(t){var n=oe(this.editingRows);n.splice(this.findIndex(t.data,n),1),this.$emit("update:editingRows",n),this.$emit("row-edit-cancel",t)},onEditingMetaChange:function(t){var n=t.data,o=t.field,i=t.index,r=t.editing,a=$e({},this.d_editingMeta),l=a[i];if(r)!l&&(l=a[i]={data:$e({},n),fields:[]}),l.fields.push(o);else if(l){var s=l.fields.filter(function(u){return u!==o});s.length?l.fields=s:delete a[i]}this.d_editingMeta=a},clearEditingMetaData:function(){this.editMode&&(this.d_editingMeta={})},createLazyLoadEvent:function(t){return{originalEvent:t,first:this.d_first,rows:this.d_rows,sortField:this.d_sortField,sortOrder:this.d_sortOrder,multiSortMeta:this.d_multiSortMeta,filters:this.d_filters}},hasGlobalFilter:function(){return this.filters&&Object.prototype.hasOwnProperty.call(this.filters,"global")},onFilterChange:function(t){this.d_filters=t},onFilterApply:function(){this.d_first=0,this.$emit("update:first",this.d_first),this.$emit("update:filters",this.d_filters),this.lazy&&this.$emit("filter",this.createLazyLoadEvent())},cloneFilters:function(t){var n={};return t&&Object.entries(t).forEach(function(o){var i=qr(o,2),r=i[0],a=i[1];n[r]=a.operator?{operator:a.operator,constraints:a.constraints.map(function(l){return $e({},l)})}:$e({},a)}),n},updateReorderableColumns:function(){var t=this,n=[];this.columns.forEach(function(o){return n.push(t.columnProp(o,"columnKey")||t.columnProp(o,"field"))}),this.d_columnOrder=n},createStyleElement:function(){var t;this.styleElement=document.createElement("style"),this.styleElement.type="text/css",mn(this.styleElement,"nonce",(t=this.$primevue)===null||t===void 0||(t=t.config)===null||t===void 0||(t=t.csp)===null||t===void 0?void 0:t.nonce),document.head.appendChild(this.styleElement)},destroyStyleElement:function(){this.styleElement&&(document.head.removeChild(this.styleElement),this.styleElement=null)},dataToRender:function(t){var n=t||this.processedData;if(n&&this.paginator){var o=this.lazy?0:this.d_first;return n.slice(o,o+this.d_rows)}return n},getVirtualScrollerRef:function(){return this.$refs.virtualScroller},hasSpacerStyle:function(t){return A(t)}},computed:{columns:function(){var t=this.d_columns.get(this);if(t&&this.reorderableColumns&&this.d_columnOrder){var n=[],o=wt(this.d_columnOrder),i;try{for(o.s();!(i=o.n()).done;){var r=i.value,a=this.findColumnByKey(t,r);a&&!this.columnProp(a,"hidden")&&n.push(a)}}catch(l){o.e(l)}finally{o.f()}return[].concat(n,oe(t.filter(function(l){return n.indexOf(l)<0})))}return t},columnGroups:function(){return this.d_columnGroups.get(this)},headerColumnGroup:function(){var t,n=this;return(t=this.columnGroups)===null||t===void 0?void 0:t.find(function(o){return n.columnProp(o,"type")==="header"})},footerColumnGroup:function(){var t,n=this;return(t=this.columnGroups)===null||t===void 0?void 0:t.find(function(o){return n.columnProp(o,"type")==="footer"})},hasFilters:function(){return this.filters&&Object.keys(this.filters).length>0&&this.filters.constructor===Object},processedData:function(){var t,n=this.value||[];return!this.lazy&&!((t=this.virtualScrollerOptions)!==null&&t!==void 0&&t.lazy)&&n&&n.length&&(this.hasFilters&&(n=this.filter(n)),this.sorted&&(this.sortMode==="single"?n=this.sortSingle(n):this.sortMode==="multiple"&&(n=this.sortMultiple(n)))),n},totalRecordsLength:function(){if(this.lazy)return this.totalRecords;var t=this.processedData;return t?t.length:0},empty:function(){var t=this.processedData;return!t||t.length===0},paginatorTop:function(){return this.paginator&&(this.paginatorPosition!=="bottom"||this.paginatorPosition==="both")},paginatorBottom:function(){return this.paginator&&(this.paginatorPosition!=="top"||this.paginatorPosition==="both")},sorted:function(){return this.d_sortField||this.d_multiSortMeta&&this.d_multiSortMeta.length>0},allRowsSelected:function(){var t=this;if(this.selectAll!==null)return this.selectAll;var n=this.frozenValue?[].concat(oe(this.frozenValue),oe(this.processedData)):this.processedData;return A(n)&&this.selection&&Array.isArray(this.selection)&&n.every(function(o){return t.selection.some(function(i){return t.equals(i,o)})})},groupRowSortField:function(){return this.sortMode==="single"?this.sortField:this.d_groupRowsSortMeta?this.d_groupRowsSortMeta.field:null},headerFilterButtonProps:function(){return $e($e({filter:{severity:"secondary",text:!0,rounded:!0}},this.filterButtonProps),{},{inline:$e({clear:{severity:"secondary",text:!0,rounded:!0}},this.filterButtonProps.inline),popover:$e({addRule:{severity:"info",text:!0,size:"small"},removeRule:{severity:"danger",text:!0,size:"small"},apply:{size:"small"},clear:{outlined:!0,size:"small"}},this.filterButtonProps.popover)})},rowEditButtonProps:function(){return $e($e({},{init:{severity:"secondary",text:!0,rounded:!0},save:{severity:"secondary",text:!0,rounded:!0},cancel:{severity:"secondary",text:!0,rounded:!0}}),this.editButtonProps)},virtualScrollerDisabled:function(){return he(this.virtualScrollerOptions)||!this.scrollable},dataP:function(){return re({scrollable:this.scrollable,"flex-scrollable":this.scrollable&&this.scrollHeight==="flex"})}},components:{DTPaginator:Mo,DTTableHeader:ba,DTTableBody:ca,DTTableFooter:fa,DTVirtualScroller:Gn,ArrowDownIcon:Mi,ArrowUpIcon:Ei,SpinnerIcon:bt}};function un(e){"@babel/helpers - typeof";return un=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},un(e)}function Yr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Jr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Yr(Object(n),!0).forEach(function(o){Th(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Yr(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Th(e,t,n){return(t=Mh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Mh(e){var t=Eh(e,"string");return un(t)=="symbol"?t:t+""}function Eh(e,t){if(un(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(un(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Dh=["data-p"],Fh=["data-p"];function Bh(e,t,n,o,i,r){var a=T("SpinnerIcon"),l=T("DTPaginator"),s=T("DTTableHeader"),u=T("DTTableBody"),d=T("DTTableFooter"),p=T("DTVirtualScroller");return c(),b("div",f({class:e.cx("root"),"data-scrollselectors":".p-datatable-wrapper","data-p":r.dataP},e.ptmi("root")),[k(e.$slots,"default"),e.loading?(c(),b("div",f({key:0,class:e.cx("mask")},e.ptm("mask")),[e.$slots.loading?k(e.$slots,"loading",{key:0}):(c(),b(K,{key:1},[e.$slots.loadingicon?(c(),y(M(e.$slots.loadingicon),{key:0,class:j(e.cx("loadingIcon"))},null,8,["class"])):e.loadingIcon?(c(),b("i",f({key:1,class:[e.cx("loadingIcon"),"pi-spin",e.loadingIcon]},e.ptm("loadingIcon")),null,16)):(c(),y(a,f({key:2,spin:"",class:e.cx("loadingIcon")},e.ptm("loadingIcon")),null,16,["class"]))],64))],16)):C("",!0),e.$slots.header?(c(),b("div",f({key:1,class:e.cx("header")},e.ptm("header")),[k(e.$slots,"header")],16)):C("",!0),r.paginatorTop?(c(),y(l,{key:2,rows:i.d_rows,first:i.d_first,totalRecords:r.totalRecordsLength,pageLinkSize:e.pageLinkSize,template:e.paginatorTemplate,rowsPerPageOptions:e.rowsPerPageOptions,currentPageReportTemplate:e.currentPageReportTemplate,class:j(e.cx("pcPaginator",{position:"top"})),onPage:t[0]||(t[0]=function(h){return r.onPage(h)}),alwaysShow:e.alwaysShowPaginator,unstyled:e.unstyled,"data-p-top":!0,pt:e.ptm("pcPaginator")},De({_:2},[e.$slots.paginatorcontainer?{name:"container",fn:E(function(h){return[k(e.$slots,"paginatorcontainer",{first:h.first,last:h.last,rows:h.rows,page:h.page,pageCount:h.pageCount,pageLinks:h.pageLinks,totalRecords:h.totalRecords,firstPageCallback:h.firstPageCallback,lastPageCallback:h.lastPageCallback,prevPageCallback:h.prevPageCallback,nextPageCallback:h.nextPageCallback,rowChangeCallback:h.rowChangeCallback,changePageCallback:h.changePageCallback})]}),key:"0"}:void 0,e.$slots.paginatorstart?{name:"start",fn:E(function(){return[k(e.$slots,"paginatorstart")]}),key:"1"}:void 0,e.$slots.paginatorend?{name:"end",fn:E(function(){return[k(e.$slots,"paginatorend")]}),key:"2"}:void 0,e.$slots.paginatorfirstpagelinkicon?{name:"firstpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatorfirstpagelinkicon",{class:j(h.class)})]}),key:"3"}:void 0,e.$slots.paginatorprevpagelinkicon?{name:"prevpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatorprevpagelinkicon",{class:j(h.class)})]}),key:"4"}:void 0,e.$slots.paginatornextpagelinkicon?{name:"nextpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatornextpagelinkicon",{class:j(h.class)})]}),key:"5"}:void 0,e.$slots.paginatorlastpagelinkicon?{name:"lastpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatorlastpagelinkicon",{class:j(h.class)})]}),key:"6"}:void 0,e.$slots.paginatorjumptopagedropdownicon?{name:"jumptopagedropdownicon",fn:E(function(h){return[k(e.$slots,"paginatorjumptopagedropdownicon",{class:j(h.class)})]}),key:"7"}:void 0,e.$slots.paginatorrowsperpagedropdownicon?{name:"rowsperpagedropdownicon",fn:E(function(h){return[k(e.$slots,"paginatorrowsperpagedropdownicon",{class:j(h.class)})]}),key:"8"}:void 0]),1032,["rows","first","totalRecords","pageLinkSize","template","rowsPerPageOptions","currentPageReportTemplate","class","alwaysShow","unstyled","pt"])):C("",!0),R("div",f({class:e.cx("tableContainer"),style:[e.sx("tableContainer"),{maxHeight:r.virtualScrollerDisabled?e.scrollHeight:""}],"data-p":r.dataP},e.ptm("tableContainer")),[ne(p,f({ref:"virtualScroller"},e.virtualScrollerOptions,{items:r.processedData,columns:r.columns,style:e.scrollHeight!=="flex"?{height:e.scrollHeight}:void 0,scrollHeight:e.scrollHeight!=="flex"?void 0:"100%",disabled:r.virtualScrollerDisabled,loaderDisabled:"",inline:"",autoSize:"",showSpacer:!1,pt:e.ptm("virtualScroller")}),{content:E(function(h){return[R("table",f({ref:"table",role:"table",class:[e.cx("table"),e.tableClass],style:[e.tableStyle,h.spacerStyle]},Jr(Jr({},e.tableProps),e.ptm("table"))),[e.showHeaders?(c(),y(s,{key:0,columnGroup:r.headerColumnGroup,columns:h.columns,rowGroupMode:e.rowGroupMode,groupRowsBy:e.groupRowsBy,groupRowSortField:r.groupRowSortField,reorderableColumns:e.reorderableColumns,resizableColumns:e.resizableColumns,allRowsSelected:r.allRowsSelected,empty:r.empty,sortMode:e.sortMode,sortField:i.d_sortField,sortOrder:i.d_sortOrder,multiSortMeta:i.d_multiSortMeta,filters:i.d_filters,filtersStore:e.filters,filterDisplay:e.filterDisplay,filterButtonProps:r.headerFilterButtonProps,filterInputProps:e.filterInputProps,first:i.d_first,onColumnClick:t[1]||(t[1]=function(m){return r.onColumnHeaderClick(m)}),onColumnMousedown:t[2]||(t[2]=function(m){return r.onColumnHeaderMouseDown(m)}),onFilterChange:r.onFilterChange,onFilterApply:r.onFilterApply,onColumnDragstart:t[3]||(t[3]=function(m){return r.onColumnHeaderDragStart(m)}),onColumnDragover:t[4]||(t[4]=function(m){return r.onColumnHeaderDragOver(m)}),onColumnDragleave:t[5]||(t[5]=function(m){return r.onColumnHeaderDragLeave(m)}),onColumnDrop:t[6]||(t[6]=function(m){return r.onColumnHeaderDrop(m)}),onColumnResizestart:t[7]||(t[7]=function(m){return r.onColumnResizeStart(m)}),onCheckboxChange:t[8]||(t[8]=function(m){return r.toggleRowsWithCheckbox(m)}),unstyled:e.unstyled,pt:e.pt},null,8,["columnGroup","columns","rowGroupMode","groupRowsBy","groupRowSortField","reorderableColumns","resizableColumns","allRowsSelected","empty","sortMode","sortField","sortOrder","multiSortMeta","filters","filtersStore","filterDisplay","filterButtonProps","filterInputProps","first","onFilterChange","onFilterApply","unstyled","pt"])):C("",!0),e.frozenValue?(c(),y(u,{key:1,ref:"frozenBodyRef",value:e.frozenValue,frozenRow:!0,columns:h.columns,first:i.d_first,dataKey:e.dataKey,selection:e.selection,selectionKeys:i.d_selectionKeys,selectionMode:e.selectionMode,rowHover:e.rowHover,contextMenu:e.contextMenu,contextMenuSelection:e.contextMenuSelection,rowGroupMode:e.rowGroupMode,groupRowsBy:e.groupRowsBy,expandableRowGroups:e.expandableRowGroups,rowClass:e.rowClass,rowStyle:e.rowStyle,editMode:e.editMode,compareSelectionBy:e.compareSelectionBy,scrollable:e.scrollable,expandedRowIcon:e.expandedRowIcon,collapsedRowIcon:e.collapsedRowIcon,expandedRows:e.expandedRows,expandedRowGroups:e.expandedRowGroups,editingRows:e.editingRows,editingRowKeys:i.d_editingRowKeys,templates:e.$slots,editButtonProps:r.rowEditButtonProps,isVirtualScrollerDisabled:!0,onRowgroupToggle:r.toggleRowGroup,onRowClick:t[9]||(t[9]=function(m){return r.onRowClick(m)}),onRowDblclick:t[10]||(t[10]=function(m){return r.onRowDblClick(m)}),onRowRightclick:t[11]||(t[11]=function(m){return r.onRowRightClick(m)}),onRowTouchend:r.onRowTouchEnd,onRowKeydown:r.onRowKeyDown,onRowMousedown:r.onRowMouseDown,onRowDragstart:t[12]||(t[12]=function(m){return r.onRowDragStart(m)}),onRowDragover:t[13]||(t[13]=function(m){return r.onRowDragOver(m)}),onRowDragleave:t[14]||(t[14]=function(m){return r.onRowDragLeave(m)}),onRowDragend:t[15]||(t[15]=function(m){return r.onRowDragEnd(m)}),onRowDrop:t[16]||(t[16]=function(m){return r.onRowDrop(m)}),onRowToggle:t[17]||(t[17]=function(m){return r.toggleRow(m)}),onRadioChange:t[18]||(t[18]=function(m){return r.toggleRowWithRadio(m)}),onCheckboxChange:t[19]||(t[19]=function(m){return r.toggleRowWithCheckbox(m)}),onCellEditInit:t[20]||(t[20]=function(m){return r.onCellEditInit(m)}),onCellEditComplete:t[21]||(t[21]=function(m){return r.onCellEditComplete(m)}),onCellEditCancel:t[22]||(t[22]=function(m){return r.onCellEditCancel(m)}),onRowEditInit:t[23]||(t[23]=function(m){return r.onRowEditInit(m)}),onRowEditSave:t[24]||(t[24]=function(m){return r.onRowEditSave(m)}),onRowEditCancel:t[25]||(t[25]=function(m){return r.onRowEditCancel(m)}),editingMeta:i.d_editingMeta,onEditingMetaChange:r.onEditingMetaChange,unstyled:e.unstyled,pt:e.pt},null,8,["value","columns","first","dataKey","selection","selectionKeys","selectionMode","rowHover","contextMenu","contextMenuSelection","rowGroupMode","groupRowsBy","expandableRowGroups","rowClass","rowStyle","editMode","compareSelectionBy","scrollable","expandedRowIcon","collapsedRowIcon","expandedRows","expandedRowGroups","editingRows","editingRowKeys","templates","editButtonProps","onRowgroupToggle","onRowTouchend","onRowKeydown","onRowMousedown","editingMeta","onEditingMetaChange","unstyled","pt"])):C("",!0),ne(u,{ref:"bodyRef",value:r.dataToRender(h.rows),class:j(h.styleClass),columns:h.columns,empty:r.empty,first:i.d_first,dataKey:e.dataKey,selection:e.selection,selectionKeys:i.d_selectionKeys,selectionMode:e.selectionMode,rowHover:e.rowHover,contextMenu:e.contextMenu,contextMenuSelection:e.contextMenuSelection,rowGroupMode:e.rowGroupMode,groupRowsBy:e.groupRowsBy,expandableRowGroups:e.expandableRowGroups,rowClass:e.rowClass,rowStyle:e.rowStyle,editMode:e.editMode,compareSelectionBy:e.compareSelectionBy,scrollable:e.scrollable,expandedRowIcon:e.expandedRowIcon,collapsedRowIcon:e.collapsedRowIcon,expandedRows:e.expandedRows,expandedRowGroups:e.expandedRowGroups,editingRows:e.editingRows,editingRowKeys:i.d_editingRowKeys,templates:e.$slots,editButtonProps:r.rowEditButtonProps,virtualScrollerContentProps:h,isVirtualScrollerDisabled:r.virtualScrollerDisabled,onRowgroupToggle:r.toggleRowGroup,onRowClick:t[26]||(t[26]=function(m){return r.onRowClick(m)}),onRowDblclick:t[27]||(t[27]=function(m){return r.onRowDblClick(m)}),onRowRightclick:t[28]||(t[28]=function(m){return r.onRowRightClick(m)}),onRowTouchend:r.onRowTouchEnd,onRowKeydown:function(w){return r.onRowKeyDown(w,h)},onRowMousedown:r.onRowMouseDown,onRowDragstart:t[29]||(t[29]=function(m){return r.onRowDragStart(m)}),onRowDragover:t[30]||(t[30]=function(m){return r.onRowDragOver(m)}),onRowDragleave:t[31]||(t[31]=function(m){return r.onRowDragLeave(m)}),onRowDragend:t[32]||(t[32]=function(m){return r.onRowDragEnd(m)}),onRowDrop:t[33]||(t[33]=function(m){return r.onRowDrop(m)}),onRowToggle:t[34]||(t[34]=function(m){return r.toggleRow(m)}),onRadioChange:t[35]||(t[35]=function(m){return r.toggleRowWithRadio(m)}),onCheckboxChange:t[36]||(t[36]=function(m){return r.toggleRowWithCheckbox(m)}),onCellEditInit:t[37]||(t[37]=function(m){return r.onCellEditInit(m)}),onCellEditComplete:t[38]||(t[38]=function(m){return r.onCellEditComplete(m)}),onCellEditCancel:t[39]||(t[39]=function(m){return r.onCellEditCancel(m)}),onRowEditInit:t[40]||(t[40]=function(m){return r.onRowEditInit(m)}),onRowEditSave:t[41]||(t[41]=function(m){return r.onRowEditSave(m)}),onRowEditCancel:t[42]||(t[42]=function(m){return r.onRowEditCancel(m)}),editingMeta:i.d_editingMeta,onEditingMetaChange:r.onEditingMetaChange,unstyled:e.unstyled,pt:e.pt},null,8,["value","class","columns","empty","first","dataKey","selection","selectionKeys","selectionMode","rowHover","contextMenu","contextMenuSelection","rowGroupMode","groupRowsBy","expandableRowGroups","rowClass","rowStyle","editMode","compareSelectionBy","scrollable","expandedRowIcon","collapsedRowIcon","expandedRows","expandedRowGroups","editingRows","editingRowKeys","templates","editButtonProps","virtualScrollerContentProps","isVirtualScrollerDisabled","onRowgroupToggle","onRowTouchend","onRowKeydown","onRowMousedown","editingMeta","onEditingMetaChange","unstyled","pt"]),r.hasSpacerStyle(h.spacerStyle)?(c(),b("tbody",f({key:2,class:e.cx("virtualScrollerSpacer"),style:{height:"calc(".concat(h.spacerStyle.height," - ").concat(h.rows.length*h.itemSize,"px)")}},e.ptm("virtualScrollerSpacer")),null,16)):C("",!0),ne(d,{columnGroup:r.footerColumnGroup,columns:h.columns,pt:e.pt},null,8,["columnGroup","columns","pt"])],16)]}),_:1},16,["items","columns","style","scrollHeight","disabled","pt"])],16,Fh),r.paginatorBottom?(c(),y(l,{key:3,rows:i.d_rows,first:i.d_first,totalRecords:r.totalRecordsLength,pageLinkSize:e.pageLinkSize,template:e.paginatorTemplate,rowsPerPageOptions:e.rowsPerPageOptions,currentPageReportTemplate:e.currentPageReportTemplate,class:j(e.cx("pcPaginator",{position:"bottom"})),onPage:t[43]||(t[43]=function(h){return r.onPage(h)}),alwaysShow:e.alwaysShowPaginator,unstyled:e.unstyled,"data-p-bottom":!0,pt:e.ptm("pcPaginator")},De({_:2},[e.$slots.paginatorcontainer?{name:"container",fn:E(function(h){return[k(e.$slots,"paginatorcontainer",{first:h.first,last:h.last,rows:h.rows,page:h.page,pageCount:h.pageCount,pageLinks:h.pageLinks,totalRecords:h.totalRecords,firstPageCallback:h.firstPageCallback,lastPageCallback:h.lastPageCallback,prevPageCallback:h.prevPageCallback,nextPageCallback:h.nextPageCallback,rowChangeCallback:h.rowChangeCallback,changePageCallback:h.changePageCallback})]}),key:"0"}:void 0,e.$slots.paginatorstart?{name:"start",fn:E(function(){return[k(e.$slots,"paginatorstart")]}),key:"1"}:void 0,e.$slots.paginatorend?{name:"end",fn:E(function(){return[k(e.$slots,"paginatorend")]}),key:"2"}:void 0,e.$slots.paginatorfirstpagelinkicon?{name:"firstpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatorfirstpagelinkicon",{class:j(h.class)})]}),key:"3"}:void 0,e.$slots.paginatorprevpagelinkicon?{name:"prevpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatorprevpagelinkicon",{class:j(h.class)})]}),key:"4"}:void 0,e.$slots.paginatornextpagelinkicon?{name:"nextpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatornextpagelinkicon",{class:j(h.class)})]}),key:"5"}:void 0,e.$slots.paginatorlastpagelinkicon?{name:"lastpagelinkicon",fn:E(function(h){return[k(e.$slots,"paginatorlastpagelinkicon",{class:j(h.class)})]}),key:"6"}:void 0,e.$slots.paginatorjumptopagedropdownicon?{name:"jumptopagedropdownicon",fn:E(function(h){return[k(e.$slots,"paginatorjumptopagedropdownicon",{class:j(h.class)})]}),key:"7"}:void 0,e.$slots.paginatorrowsperpagedropdownicon?{name:"rowsperpagedropdownicon",fn:E(function(h){return[k(e.$slots,"paginatorrowsperpagedropdownicon",{class:j(h.class)})]}),key:"8"}:void 0]),1032,["rows","first","totalRecords","pageLinkSize","template","rowsPerPageOptions","currentPageReportTemplate","class","alwaysShow","unstyled","pt"])):C("",!0),e.$slots.footer?(c(),b("div",f({key:4,class:e.cx("footer")},e.ptm("footer")),[k(e.$slots,"footer")],16)):C("",!0),R("div",f({ref:"resizeHelper",class:e.cx("columnResizeIndicator"),style:{display:"none"}},e.ptm("columnResizeIndicator")),null,16),e.reorderableColumns?(c(),b("span",f({key:5,ref:"reorderIndicatorUp",class:e.cx("rowReorderIndicatorUp"),style:{position:"absolute",display:"none"}},e.ptm("rowReorderIndicatorUp")),[(c(),y(M(e.$slots.rowreorderindicatorupicon||e.$slots.reorderindicatorupicon||"ArrowDownIcon")))],16)):C("",!0),e.reorderableColumns?(c(),b("span",f({key:6,ref:"reorderIndicatorDown",class:e.cx("rowReorderIndicatorDown"),style:{position:"absolute",display:"none"}},e.ptm("rowReorderIndicatorDown")),[(c(),y(M(e.$slots.rowreorderindicatordownicon||e.$slots.reorderindicatordownicon||"ArrowUpIcon")))],16)):C("",!0)],16,Dh)}Lh.render=Bh;var zh=N.extend({name:"column"}),Ah={name:"BaseColumn",extends:U,props:{columnKey:{type:null,default:null},field:{type:[String,Function],default:null},sortField:{type:[String,Function],default:null},filterField:{type:[String,Function],default:null},dataType:{type:String,default:"text"},sortable:{type:Boolean,default:!1},header:{type:null,default:null},footer:{type:null,default:null},style:{type:null,default:null},class:{type:String,default:null},headerStyle:{type:null,default:null},headerClass:{type:String,default:null},bodyStyle:{type:null,default:null},bodyClass:{type:String,default:null},footerStyle:{type:null,default:null},footerClass:{type:String,default:null},showFilterMenu:{type:Boolean,default:!0},showFilterOperator:{type:Boolean,default:!0},showClearButton:{type:Boolean,default:!1},showApplyButton:{type:Boolean,default:!0},showFilterMatchModes:{type:Boolean,default:!0},showAddButton:{type:Boolean,default:!0},filterMatchModeOptions:{type:Array,default:null},maxConstraints:{type:Number,default:2},excludeGlobalFilter:{type:Boolean,default:!1},filterHeaderClass:{type:String,default:null},filterHeaderStyle:{type:null,default:null},filterMenuClass:{type:String,default:null},filterMenuStyle:{type:null,default:null},selectionMode:{type:String,default:null},expander:{type:Boolean,default:!1},colspan:{type:Number,default:null},rowspan:{type:Number,default:null},rowReorder:{type:Boolean,default:!1},rowReorderIcon:{type:String,default:void 0},reorderableColumn:{type:Boolean,default:!0},rowEditor:{type:Boolean,default:!1},frozen:{type:Boolean,default:!1},alignFrozen:{type:String,default:"left"},exportable:{type:Boolean,default:!0},exportHeader:{type:String,default:null},exportFooter:{type:String,default:null},filterMatchMode:{type:String,default:null},hidden:{type:Boolean,default:!1}},style:zh,provide:function(){return{$pcColumn:this,$parentInstance:this}}},yb={name:"Column",extends:Ah,inheritAttrs:!1,inject:["$columns"],mounted:function(){var t;(t=this.$columns)===null||t===void 0||t.add(this.$)},unmounted:function(){var t;(t=this.$columns)===null||t===void 0||t.delete(this.$)},render:function(){return null}},ga={name:"WindowMaximizeIcon",extends:J};function jh(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M7 14H11.8C12.3835 14 12.9431 13.7682 13.3556 13.3556C13.7682 12.9431 14 12.3835 14 11.8V2.2C14 1.61652 13.7682 1.05694 13.3556 0.644365C12.9431 0.231785 12.3835 0 11.8 0H2.2C1.61652 0 1.05694 0.231785 0.644365 0.644365C0.231785 1.05694 0 1.61652 0 2.2V7C0 7.15913 0.063214 7.31174 0.175736 7.42426C0.288258 7.53679 0.44087 7.6 0.6 7.6C0.75913 7.6 0.911742 7.53679 1.02426 7.42426C1.13679 7.31174 1.2 7.15913 1.2 7V2.2C1.2 1.93478 1.30536 1.68043 1.49289 1.49289C1.68043 1.30536 1.93478 1.2 2.2 1.2H11.8C12.0652 1.2 12.3196 1.30536 12.5071 1.49289C12.6946 1.68043 12.8 1.93478 12.8 2.2V11.8C12.8 12.0652 12.6946 12.3196 12.5071 12.5071C12.3196 12.6946 12.0652 12.8 11.8 12.8H7C6.84087 12.8 6.68826 12.8632 6.57574 12.9757C6.46321 13.0883 6.4 13.2409 6.4 13.4C6.4 13.5591 6.46321 13.7117 6.57574 13.8243C6.68826 13.9368 6.84087 14 7 14ZM9.77805 7.42192C9.89013 7.534 10.0415 7.59788 10.2 7.59995C10.3585 7.59788 10.5099 7.534 10.622 7.42192C10.7341 7.30985 10.798 7.15844 10.8 6.99995V3.94242C10.8066 3.90505 10.8096 3.86689 10.8089 3.82843C10.8079 3.77159 10.7988 3.7157 10.7824 3.6623C10.756 3.55552 10.701 3.45698 10.622 3.37798C10.5099 3.2659 10.3585 3.20202 10.2 3.19995H7.00002C6.84089 3.19995 6.68828 3.26317 6.57576 3.37569C6.46324 3.48821 6.40002 3.64082 6.40002 3.79995C6.40002 3.95908 6.46324 4.11169 6.57576 4.22422C6.68828 4.33674 6.84089 4.39995 7.00002 4.39995H8.80006L6.19997 7.00005C6.10158 7.11005 6.04718 7.25246 6.04718 7.40005C6.04718 7.54763 6.10158 7.69004 6.19997 7.80005C6.30202 7.91645 6.44561 7.98824 6.59997 8.00005C6.75432 7.98824 6.89791 7.91645 6.99997 7.80005L9.60002 5.26841V6.99995C9.6021 7.15844 9.66598 7.30985 9.77805 7.42192ZM1.4 14H3.8C4.17066 13.9979 4.52553 13.8498 4.78763 13.5877C5.04973 13.3256 5.1979 12.9707 5.2 12.6V10.2C5.1979 9.82939 5.04973 9.47452 4.78763 9.21242C4.52553 8.95032 4.17066 8.80215 3.8 8.80005H1.4C1.02934 8.80215 0.674468 8.95032 0.412371 9.21242C0.150274 9.47452 0.00210008 9.82939 0 10.2V12.6C0.00210008 12.9707 0.150274 13.3256 0.412371 13.5877C0.674468 13.8498 1.02934 13.9979 1.4 14ZM1.25858 10.0586C1.29609 10.0211 1.34696 10 1.4 10H3.8C3.85304 10 3.90391 10.0211 3.94142 10.0586C3.97893 10.0961 4 10.147 4 10.2V12.6C4 12.6531 3.97893 12.704 3.94142 12.7415C3.90391 12.779 3.85304 12.8 3.8 12.8H1.4C1.34696 12.8 1.29609 12.779 1.25858 12.7415C1.22107 12.704 1.2 12.6531 1.2 12.6V10.2C1.2 10.147 1.22107 10.0961 1.25858 10.0586Z",fill:"currentColor"},null,-1)]),16)}ga.render=jh;var ya={name:"WindowMinimizeIcon",extends:J};function Kh(e,t,n,o,i,r){return c(),b("svg",f({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},e.pti()),t[0]||(t[0]=[R("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M11.8 0H2.2C1.61652 0 1.05694 0.231785 0.644365 0.644365C0.231785 1.05694 0 1.61652 0 2.2V7C0 7.15913 0.063214 7.31174 0.175736 7.42426C0.288258 7.53679 0.44087 7.6 0.6 7.6C0.75913 7.6 0.911742 7.53679 1.02426 7.42426C1.13679 7.31174 1.2 7.15913 1.2 7V2.2C1.2 1.93478 1.30536 1.68043 1.49289 1.49289C1.68043 1.30536 1.93478 1.2 2.2 1.2H11.8C12.0652 1.2 12.3196 1.30536 12.5071 1.49289C12.6946 1.68043 12.8 1.93478 12.8 2.2V11.8C12.8 12.0652 12.6946 12.3196 12.5071 12.5071C12.3196 12.6946 12.0652 12.8 11.8 12.8H7C6.84087 12.8 6.68826 12.8632 6.57574 12.9757C6.46321 13.0883 6.4 13.2409 6.4 13.4C6.4 13.5591 6.46321 13.7117 6.57574 13.8243C6.68826 13.9368 6.84087 14 7 14H11.8C12.3835 14 12.9431 13.7682 13.3556 13.3556C13.7682 12.9431 14 12.3835 14 11.8V2.2C14 1.61652 13.7682 1.05694 13.3556 0.644365C12.9431 0.231785 12.3835 0 11.8 0ZM6.368 7.952C6.44137 7.98326 6.52025 7.99958 6.6 8H9.8C9.95913 8 10.1117 7.93678 10.2243 7.82426C10.3368 7.71174 10.4 7.55913 10.4 7.4C10.4 7.24087 10.3368 7.08826 10.2243 6.97574C10.1117 6.86321 9.95913 6.8 9.8 6.8H8.048L10.624 4.224C10.73 4.11026 10.7877 3.95982 10.7849 3.80438C10.7822 3.64894 10.7192 3.50063 10.6093 3.3907C10.4994 3.28077 10.3511 3.2178 10.1956 3.21506C10.0402 3.21232 9.88974 3.27002 9.776 3.376L7.2 5.952V4.2C7.2 4.04087 7.13679 3.88826 7.02426 3.77574C6.91174 3.66321 6.75913 3.6 6.6 3.6C6.44087 3.6 6.28826 3.66321 6.17574 3.77574C6.06321 3.88826 6 4.04087 6 4.2V7.4C6.00042 7.47975 6.01674 7.55862 6.048 7.632C6.07656 7.70442 6.11971 7.7702 6.17475 7.82524C6.2298 7.88029 6.29558 7.92344 6.368 7.952ZM1.4 8.80005H3.8C4.17066 8.80215 4.52553 8.95032 4.78763 9.21242C5.04973 9.47452 5.1979 9.82939 5.2 10.2V12.6C5.1979 12.9707 5.04973 13.3256 4.78763 13.5877C4.52553 13.8498 4.17066 13.9979 3.8 14H1.4C1.02934 13.9979 0.674468 13.8498 0.412371 13.5877C0.150274 13.3256 0.00210008 12.9707 0 12.6V10.2C0.00210008 9.82939 0.150274 9.47452 0.412371 9.21242C0.674468 8.95032 1.02934 8.80215 1.4 8.80005ZM3.94142 12.7415C3.97893 12.704 4 12.6531 4 12.6V10.2C4 10.147 3.97893 10.0961 3.94142 10.0586C3.90391 10.0211 3.85304 10 3.8 10H1.4C1.34696 10 1.29609 10.0211 1.25858 10.0586C1.22107 10.0961 1.2 10.147 1.2 10.2V12.6C1.2 12.6531 1.22107 12.704 1.25858 12.7415C1.29609 12.779 1.34696 12.8 1.4 12.8H3.8C3.85304 12.8 3.90391 12.779 3.94142 12.7415Z",fill:"currentColor"},null,-1)]),16)}ya.render=Kh;function Xr(){qa({variableName:Si("scrollbar.width").name})}function Qr(){Xa({variableName:Si("scrollbar.width").name})}var Vh=({dt:e})=>`
-.p-dialog {
-    max-height: 90%;
-    transform: scale(1);
-    border-radius: ${e("dialog.border.radius")};
-    box-shadow: ${e("dialog.shadow")};
-    background: ${e("dialog.background")};
-    border: 1px solid ${e("dialog.border.color")};
-    color: ${e("dialog.color")};
-}
-
-.p-dialog-content {
-    overflow-y: auto;
-    padding: ${e("dialog.content.padding")};
-}
-
-.p-dialog-header {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    flex-shrink: 0;
-    padding: ${e("dialog.header.padding")};
-}
-
-.p-dialog-title {
-    font-weight: ${e("dialog.title.font.weight")};
-    font-size: ${e("dialog.title.font.size")};
-}
-
-.p-dialog-footer {
-    flex-shrink: 0;
-    padding: ${e("dialog.footer.padding")};
-    display: flex;
-    justify-content: flex-end;
-    gap: ${e("dialog.footer.gap")};
-}
-
-.p-dialog-header-actions {
-    display: flex;
-    align-items: center;
-    gap: ${e("dialog.header.gap")};
-}
-
-.p-dialog-enter-active {
-    transition: all 150ms cubic-bezier(0, 0, 0.2, 1);
-}
-
-.p-dialog-leave-active {
-    transition: all 150ms cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-.p-dialog-enter-from,
-.p-dialog-leave-to {
-    opacity: 0;
-    transform: scale(0.7);
-}
-
-.p-dialog-top .p-dialog,
-.p-dialog-bottom .p-dialog,
-.p-dialog-left .p-dialog,
-.p-dialog-right .p-dialog,
-.p-dialog-topleft .p-dialog,
-.p-dialog-topright .p-dialog,
-.p-dialog-bottomleft .p-dialog,
-.p-dialog-bottomright .p-dialog {
-    margin: 0.75rem;
-    transform: translate3d(0px, 0px, 0px);
-}
-
-.p-dialog-top .p-dialog-enter-active,
-.p-dialog-top .p-dialog-leave-active,
-.p-dialog-bottom .p-dialog-enter-active,
-.p-dialog-bottom .p-dialog-leave-active,
-.p-dialog-left .p-dialog-enter-active,
-.p-dialog-left .p-dialog-leave-active,
-.p-dialog-right .p-dialog-enter-active,
-.p-dialog-right .p-dialog-leave-active,
-.p-dialog-topleft .p-dialog-enter-active,
-.p-dialog-topleft .p-dialog-leave-active,
-.p-dialog-topright .p-dialog-enter-active,
-.p-dialog-topright .p-dialog-leave-active,
-.p-dialog-bottomleft .p-dialog-enter-active,
-.p-dialog-bottomleft .p-dialog-leave-active,
-.p-dialog-bottomright .p-dialog-enter-active,
-.p-dialog-bottomright .p-dialog-leave-active {
-    transition: all 0.3s ease-out;
-}
-
-.p-dialog-top .p-dialog-enter-from,
-.p-dialog-top .p-dialog-leave-to {
-    transform: translate3d(0px, -100%, 0px);
-}
-
-.p-dialog-bottom .p-dialog-enter-from,
-.p-dialog-bottom .p-dialog-leave-to {
-    transform: translate3d(0px, 100%, 0px);
-}
-
-.p-dialog-left .p-dialog-enter-from,
-.p-dialog-left .p-dialog-leave-to,
-.p-dialog-topleft .p-dialog-enter-from,
-.p-dialog-topleft .p-dialog-leave-to,
-.p-dialog-bottomleft .p-dialog-enter-from,
-.p-dialog-bottomleft .p-dialog-leave-to {
-    transform: translate3d(-100%, 0px, 0px);
-}
-
-.p-dialog-right .p-dialog-enter-from,
-.p-dialog-right .p-dialog-leave-to,
-.p-dialog-topright .p-dialog-enter-from,
-.p-dialog-topright .p-dialog-leave-to,
-.p-dialog-bottomright .p-dialog-enter-from,
-.p-dialog-bottomright .p-dialog-leave-to {
-    transform: translate3d(100%, 0px, 0px);
-}
-
-.p-dialog-left:dir(rtl) .p-dialog-enter-from,
-.p-dialog-left:dir(rtl) .p-dialog-leave-to,
-.p-dialog-topleft:dir(rtl) .p-dialog-enter-from,
-.p-dialog-topleft:dir(rtl) .p-dialog-leave-to,
-.p-dialog-bottomleft:dir(rtl) .p-dialog-enter-from,
-.p-dialog-bottomleft:dir(rtl) .p-dialog-leave-to {
-    transform: translate3d(100%, 0px, 0px);
-}
-
-.p-dialog-right:dir(rtl) .p-dialog-enter-from,
-.p-dialog-right:dir(rtl) .p-dialog-leave-to,
-.p-dialog-topright:dir(rtl) .p-dialog-enter-from,
-.p-dialog-topright:dir(rtl) .p-dialog-leave-to,
-.p-dialog-bottomright:dir(rtl) .p-dialog-enter-from,
-.p-dialog-bottomright:dir(rtl) .p-dialog-leave-to {
-    transform: translate3d(-100%, 0px, 0px);
-}
-
-.p-dialog-maximized {
-    width: 100vw !important;
-    height: 100vh !important;
-    top: 0px !important;
-    left: 0px !important;
-    max-height: 100%;
-    height: 100%;
-    border-radius: 0;
-}
-
-.p-dialog-maximized .p-dialog-content {
-    flex-grow: 1;
-}
-`,Nh={mask:function(t){var n=t.position,o=t.modal;return{position:"fixed",height:"100%",width:"100%",left:0,top:0,display:"flex",justifyContent:n==="left"||n==="topleft"||n==="bottomleft"?"flex-start":n==="right"||n==="topright"||n==="bottomright"?"flex-end":"center",alignItems:n==="top"||n==="topleft"||n==="topright"?"flex-start":n==="bottom"||n==="bottomleft"||n==="bottomright"?"flex-end":"center",pointerEvents:o?"auto":"none"}},root:{display:"flex",flexDirection:"column",pointerEvents:"auto"}},Hh={mask:function(t){var n=t.props,o=["left","right","top","topleft","topright","bottom","bottomleft","bottomright"],i=o.find(function(r){return r===n.position});return["p-dialog-mask",{"p-overlay-mask p-overlay-mask-enter":n.modal},i?"p-dialog-".concat(i):""]},root:function(t){var n=t.props,o=t.instance;return["p-dialog p-component",{"p-dialog-maximized":n.maximizable&&o.maximized}]},header:"p-dialog-header",title:"p-dialog-title",headerActions:"p-dialog-header-actions",pcMaximizeButton:"p-dialog-maximize-button",pcCloseButton:"p-dialog-close-button",content:"p-dialog-content",footer:"p-dialog-footer"},Gh=N.extend({name:"dialog",style:Vh,classes:Hh,inlineStyles:Nh}),Uh={name:"BaseDialog",extends:U,props:{header:{type:null,default:null},footer:{type:null,default:null},visible:{type:Boolean,default:!1},modal:{type:Boolean,default:null},contentStyle:{type:null,default:null},contentClass:{type:String,default:null},contentProps:{type:null,default:null},maximizable:{type:Boolean,default:!1},dismissableMask:{type:Boolean,default:!1},closable:{type:Boolean,default:!0},closeOnEscape:{type:Boolean,default:!0},showHeader:{type:Boolean,default:!0},blockScroll:{type:Boolean,default:!1},baseZIndex:{type:Number,default:0},autoZIndex:{type:Boolean,default:!0},position:{type:String,default:"center"},breakpoints:{type:Object,default:null},draggable:{type:Boolean,default:!0},keepInViewport:{type:Boolean,default:!0},minX:{type:Number,default:0},minY:{type:Number,default:0},appendTo:{type:[String,Object],default:"body"},closeIcon:{type:String,default:void 0},maximizeIcon:{type:String,default:void 0},minimizeIcon:{type:String,default:void 0},closeButtonProps:{type:Object,default:function(){return{severity:"secondary",text:!0,rounded:!0}}},maximizeButtonProps:{type:Object,default:function(){return{severity:"secondary",text:!0,rounded:!0}}},_instance:null},style:Gh,provide:function(){return{$pcDialog:this,$parentInstance:this}}},va={name:"Dialog",extends:Uh,inheritAttrs:!1,emits:["update:visible","show","hide","after-hide","maximize","unmaximize","dragstart","dragend"],provide:function(){var t=this;return{dialogRef:Ga(function(){return t._instance})}},data:function(){return{containerVisible:this.visible,maximized:!1,focusableMax:null,focusableClose:null,target:null}},documentKeydownListener:null,container:null,mask:null,content:null,headerContainer:null,footerContainer:null,maximizableButton:null,closeButton:null,styleElement:null,dragging:null,documentDragListener:null,documentDragEndListener:null,lastPageX:null,lastPageY:null,maskMouseDownTarget:null,updated:function(){this.visible&&(this.containerVisible=this.visible)},beforeUnmount:function(){this.unbindDocumentState(),this.unbindGlobalListeners(),this.destroyStyle(),this.mask&&this.autoZIndex&&me.clear(this.mask),this.container=null,this.mask=null},mounted:function(){this.breakpoints&&this.createStyle()},methods:{close:function(){this.$emit("update:visible",!1)},onEnter:function(){this.$emit("show"),this.target=document.activeElement,this.enableDocumentSettings(),this.bindGlobalListeners(),this.autoZIndex&&me.set("modal",this.mask,this.baseZIndex+this.$primevue.config.zIndex.modal)},onAfterEnter:function(){this.focus()},onBeforeLeave:function(){this.modal&&!this.isUnstyled&&We(this.mask,"p-overlay-mask-leave"),this.dragging&&this.documentDragEndListener&&this.documentDragEndListener()},onLeave:function(){this.$emit("hide"),te(this.target),this.target=null,this.focusableClose=null,this.focusableMax=null},onAfterLeave:function(){this.autoZIndex&&me.clear(this.mask),this.containerVisible=!1,this.unbindDocumentState(),this.unbindGlobalListeners(),this.$emit("after-hide")},onMaskMouseDown:function(t){this.maskMouseDownTarget=t.target},onMaskMouseUp:function(){this.dismissableMask&&this.modal&&this.mask===this.maskMouseDownTarget&&this.close()},focus:function(){var t=function(i){return i&&i.querySelector("[autofocus]")},n=this.$slots.footer&&t(this.footerContainer);n||(n=this.$slots.header&&t(this.headerContainer),n||(n=this.$slots.default&&t(this.content),n||(this.maximizable?(this.focusableMax=!0,n=this.maximizableButton):(this.focusableClose=!0,n=this.closeButton)))),n&&te(n,{focusVisible:!0})},maximize:function(t){this.maximized?(this.maximized=!1,this.$emit("unmaximize",t)):(this.maximized=!0,this.$emit("maximize",t)),this.modal||(this.maximized?Xr():Qr())},enableDocumentSettings:function(){(this.modal||!this.modal&&this.blockScroll||this.maximizable&&this.maximized)&&Xr()},unbindDocumentState:function(){(this.modal||!this.modal&&this.blockScroll||this.maximizable&&this.maximized)&&Qr()},onKeyDown:function(t){t.code==="Escape"&&this.closeOnEscape&&this.close()},bindDocumentKeyDownListener:function(){this.documentKeydownListener||(this.documentKeydownListener=this.onKeyDown.bind(this),window.document.addEventListener("keydown",this.documentKeydownListener))},unbindDocumentKeyDownListener:function(){this.documentKeydownListener&&(window.document.removeEventListener("keydown",this.documentKeydownListener),this.documentKeydownListener=null)},containerRef:function(t){this.container=t},maskRef:function(t){this.mask=t},contentRef:function(t){this.content=t},headerContainerRef:function(t){this.headerContainer=t},footerContainerRef:function(t){this.footerContainer=t},maximizableRef:function(t){this.maximizableButton=t?t.$el:void 0},closeButtonRef:function(t){this.closeButton=t?t.$el:void 0},createStyle:function(){if(!this.styleElement&&!this.isUnstyled){var t;this.styleElement=document.createElement("style"),this.styleElement.type="text/css",mn(this.styleElement,"nonce",(t=this.$primevue)===null||t===void 0||(t=t.config)===null||t===void 0||(t=t.csp)===null||t===void 0?void 0:t.nonce),document.head.appendChild(this.styleElement);var n="";for(var o in this.breakpoints)n+=`
-                        @media screen and (max-width: `.concat(o,`) {
-                            .p-dialog[`).concat(this.$attrSelector,`] {
-                                width: `).concat(this.breakpoints[o],` !important;
-                            }
-                        }
-                    `);this.styleElement.innerHTML=n}},destroyStyle:function(){this.styleElement&&(document.head.removeChild(this.styleElement),this.styleElement=null)},initDrag:function(t){t.target.closest("div").getAttribute("data-pc-section")!=="headeractions"&&this.draggable&&(this.dragging=!0,this.lastPageX=t.pageX,this.lastPageY=t.pageY,this.container.style.margin="0",document.body.setAttribute("data-p-unselectable-text","true"),!this.isUnstyled&&pt(document.body,{"user-select":"none"}),this.$emit("dragstart",t))},bindGlobalListeners:function(){this.draggable&&(this.bindDocumentDragListener(),this.bindDocumentDragEndListener()),this.closeOnEscape&&this.closable&&this.bindDocumentKeyDownListener()},unbindGlobalListeners:function(){this.unbindDocumentDragListener(),this.unbindDocumentDragEndListener(),this.unbindDocumentKeyDownListener()},bindDocumentDragListener:function(){var t=this;this.documentDragListener=function(n){if(t.dragging){var o=ve(t.container),i=Pt(t.container),r=n.pageX-t.lastPageX,a=n.pageY-t.lastPageY,l=t.container.getBoundingClientRect(),s=l.left+r,u=l.top+a,d=$o(),p=getComputedStyle(t.container),h=parseFloat(p.marginLeft),m=parseFloat(p.marginTop);t.container.style.position="fixed",t.keepInViewport?(s>=t.minX&&s+o<d.width&&(t.lastPageX=n.pageX,t.container.style.left=s-h+"px"),u>=t.minY&&u+i<d.height&&(t.lastPageY=n.pageY,t.container.style.top=u-m+"px")):(t.lastPageX=n.pageX,t.container.style.left=s-h+"px",t.lastPageY=n.pageY,t.container.style.top=u-m+"px")}},window.document.addEventListener("mousemove",this.documentDragListener)},unbindDocumentDragListener:function(){this.documentDragListener&&(window.document.removeEventListener("mousemove",this.documentDragListener),this.documentDragListener=null)},bindDocumentDragEndListener:function(){var t=this;this.documentDragEndListener=function(n){t.dragging&&(t.dragging=!1,document.body.removeAttribute("data-p-unselectable-text"),!t.isUnstyled&&(document.body.style["user-select"]=""),t.$emit("dragend",n))},window.document.addEventListener("mouseup",this.documentDragEndListener)},unbindDocumentDragEndListener:function(){this.documentDragEndListener&&(window.document.removeEventListener("mouseup",this.documentDragEndListener),this.documentDragEndListener=null)}},computed:{maximizeIconComponent:function(){return this.maximized?this.minimizeIcon?"span":"WindowMinimizeIcon":this.maximizeIcon?"span":"WindowMaximizeIcon"},ariaLabelledById:function(){return this.header!=null||this.$attrs["aria-labelledby"]!==null?this.$id+"_header":null},closeAriaLabel:function(){return this.$primevue.config.locale.aria?this.$primevue.config.locale.aria.close:void 0},dataP:function(){return re({maximized:this.maximized,modal:this.modal})}},directives:{ripple:Re,focustrap:aa},components:{Button:gn,Portal:gt,WindowMinimizeIcon:ya,WindowMaximizeIcon:ga,TimesIcon:yn}};function dn(e){"@babel/helpers - typeof";return dn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},dn(e)}function ei(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function ti(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?ei(Object(n),!0).forEach(function(o){_h(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ei(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function _h(e,t,n){return(t=Wh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Wh(e){var t=Zh(e,"string");return dn(t)=="symbol"?t:t+""}function Zh(e,t){if(dn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(dn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var qh=["data-p"],Yh=["aria-labelledby","aria-modal","data-p"],Jh=["id"],Xh=["data-p"];function Qh(e,t,n,o,i,r){var a=T("Button"),l=T("Portal"),s=ke("focustrap");return c(),y(l,{appendTo:e.appendTo},{default:E(function(){return[i.containerVisible?(c(),b("div",f({key:0,ref:r.maskRef,class:e.cx("mask"),style:e.sx("mask",!0,{position:e.position,modal:e.modal}),onMousedown:t[1]||(t[1]=function(){return r.onMaskMouseDown&&r.onMaskMouseDown.apply(r,arguments)}),onMouseup:t[2]||(t[2]=function(){return r.onMaskMouseUp&&r.onMaskMouseUp.apply(r,arguments)}),"data-p":r.dataP},e.ptm("mask")),[ne(zn,f({name:"p-dialog",onEnter:r.onEnter,onAfterEnter:r.onAfterEnter,onBeforeLeave:r.onBeforeLeave,onLeave:r.onLeave,onAfterLeave:r.onAfterLeave,appear:""},e.ptm("transition")),{default:E(function(){return[e.visible?Ie((c(),b("div",f({key:0,ref:r.containerRef,class:e.cx("root"),style:e.sx("root"),role:"dialog","aria-labelledby":r.ariaLabelledById,"aria-modal":e.modal,"data-p":r.dataP},e.ptmi("root")),[e.$slots.container?k(e.$slots,"container",{key:0,closeCallback:r.close,maximizeCallback:function(d){return r.maximize(d)}}):(c(),b(K,{key:1},[e.showHeader?(c(),b("div",f({key:0,ref:r.headerContainerRef,class:e.cx("header"),onMousedown:t[0]||(t[0]=function(){return r.initDrag&&r.initDrag.apply(r,arguments)})},e.ptm("header")),[k(e.$slots,"header",{class:j(e.cx("title"))},function(){return[e.header?(c(),b("span",f({key:0,id:r.ariaLabelledById,class:e.cx("title")},e.ptm("title")),Y(e.header),17,Jh)):C("",!0)]}),R("div",f({class:e.cx("headerActions")},e.ptm("headerActions")),[e.maximizable?k(e.$slots,"maximizebutton",{key:0,maximized:i.maximized,maximizeCallback:function(d){return r.maximize(d)}},function(){return[ne(a,f({ref:r.maximizableRef,autofocus:i.focusableMax,class:e.cx("pcMaximizeButton"),onClick:r.maximize,tabindex:e.maximizable?"0":"-1",unstyled:e.unstyled},e.maximizeButtonProps,{pt:e.ptm("pcMaximizeButton"),"data-pc-group-section":"headericon"}),{icon:E(function(u){return[k(e.$slots,"maximizeicon",{maximized:i.maximized},function(){return[(c(),y(M(r.maximizeIconComponent),f({class:[u.class,i.maximized?e.minimizeIcon:e.maximizeIcon]},e.ptm("pcMaximizeButton").icon),null,16,["class"]))]})]}),_:3},16,["autofocus","class","onClick","tabindex","unstyled","pt"])]}):C("",!0),e.closable?k(e.$slots,"closebutton",{key:1,closeCallback:r.close},function(){return[ne(a,f({ref:r.closeButtonRef,autofocus:i.focusableClose,class:e.cx("pcCloseButton"),onClick:r.close,"aria-label":r.closeAriaLabel,unstyled:e.unstyled},e.closeButtonProps,{pt:e.ptm("pcCloseButton"),"data-pc-group-section":"headericon"}),{icon:E(function(u){return[k(e.$slots,"closeicon",{},function(){return[(c(),y(M(e.closeIcon?"span":"TimesIcon"),f({class:[e.closeIcon,u.class]},e.ptm("pcCloseButton").icon),null,16,["class"]))]})]}),_:3},16,["autofocus","class","onClick","aria-label","unstyled","pt"])]}):C("",!0)],16)],16)):C("",!0),R("div",f({ref:r.contentRef,class:[e.cx("content"),e.contentClass],style:e.contentStyle,"data-p":r.dataP},ti(ti({},e.contentProps),e.ptm("content"))),[k(e.$slots,"default")],16,Xh),e.footer||e.$slots.footer?(c(),b("div",f({key:1,ref:r.footerContainerRef,class:e.cx("footer")},e.ptm("footer")),[k(e.$slots,"footer",{},function(){return[Ee(Y(e.footer),1)]})],16)):C("",!0)],64))],16,Yh)),[[s,{disabled:!e.modal}]]):C("",!0)]}),_:3},16,["onEnter","onAfterEnter","onBeforeLeave","onLeave","onAfterLeave"])],16,qh)):C("",!0)]}),_:3},8,["appendTo"])}va.render=Qh;var em=({dt:e})=>`
-.p-textarea {
-    font-family: inherit;
-    font-feature-settings: inherit;
-    font-size: 1rem;
-    color: ${e("textarea.color")};
-    background: ${e("textarea.background")};
-    padding-block: ${e("textarea.padding.y")};
-    padding-inline: ${e("textarea.padding.x")};
-    border: 1px solid ${e("textarea.border.color")};
-    transition: background ${e("textarea.transition.duration")}, color ${e("textarea.transition.duration")}, border-color ${e("textarea.transition.duration")}, outline-color ${e("textarea.transition.duration")}, box-shadow ${e("textarea.transition.duration")};
-    appearance: none;
-    border-radius: ${e("textarea.border.radius")};
-    outline-color: transparent;
-    box-shadow: ${e("textarea.shadow")};
-}
-
-.p-textarea:enabled:hover {
-    border-color: ${e("textarea.hover.border.color")};
-}
-
-.p-textarea:enabled:focus {
-    border-color: ${e("textarea.focus.border.color")};
-    box-shadow: ${e("textarea.focus.ring.shadow")};
-    outline: ${e("textarea.focus.ring.width")} ${e("textarea.focus.ring.style")} ${e("textarea.focus.ring.color")};
-    outline-offset: ${e("textarea.focus.ring.offset")};
-}
-
-.p-textarea.p-invalid {
-    border-color: ${e("textarea.invalid.border.color")};
-}
-
-.p-textarea.p-variant-filled {
-    background: ${e("textarea.filled.background")};
-}
-
-.p-textarea.p-variant-filled:enabled:hover {
-    background: ${e("textarea.filled.hover.background")};
-}
-
-.p-textarea.p-variant-filled:enabled:focus {
-    background: ${e("textarea.filled.focus.background")};
-}
-
-.p-textarea:disabled {
-    opacity: 1;
-    background: ${e("textarea.disabled.background")};
-    color: ${e("textarea.disabled.color")};
-}
-
-.p-textarea::placeholder {
-    color: ${e("textarea.placeholder.color")};
-}
-
-.p-textarea.p-invalid::placeholder {
-    color: ${e("textarea.invalid.placeholder.color")};
-}
-
-.p-textarea-fluid {
-    width: 100%;
-}
-
-.p-textarea-resizable {
-    overflow: hidden;
-    resize: none;
-}
-
-.p-textarea-sm {
-    font-size: ${e("textarea.sm.font.size")};
-    padding-block: ${e("textarea.sm.padding.y")};
-    padding-inline: ${e("textarea.sm.padding.x")};
-}
-
-.p-textarea-lg {
-    font-size: ${e("textarea.lg.font.size")};
-    padding-block: ${e("textarea.lg.padding.y")};
-    padding-inline: ${e("textarea.lg.padding.x")};
-}
-`,tm={root:function(t){var n=t.instance,o=t.props;return["p-textarea p-component",{"p-filled":n.$filled,"p-textarea-resizable ":o.autoResize,"p-textarea-sm p-inputfield-sm":o.size==="small","p-textarea-lg p-inputfield-lg":o.size==="large","p-invalid":n.$invalid,"p-variant-filled":n.$variant==="filled","p-textarea-fluid":n.$fluid}]}},nm=N.extend({name:"textarea",style:em,classes:tm}),om={name:"BaseTextarea",extends:it,props:{autoResize:Boolean},style:nm,provide:function(){return{$pcTextarea:this,$parentInstance:this}}};function cn(e){"@babel/helpers - typeof";return cn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},cn(e)}function rm(e,t,n){return(t=im(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function im(e){var t=am(e,"string");return cn(t)=="symbol"?t:t+""}function am(e,t){if(cn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(cn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var lm={name:"Textarea",extends:om,inheritAttrs:!1,observer:null,mounted:function(){var t=this;this.autoResize&&(this.observer=new ResizeObserver(function(){requestAnimationFrame(function(){t.resize()})}),this.observer.observe(this.$el))},updated:function(){this.autoResize&&this.resize()},beforeUnmount:function(){this.observer&&this.observer.disconnect()},methods:{resize:function(){this.$el.offsetParent&&(this.$el.style.height="auto",this.$el.style.height=this.$el.scrollHeight+"px",parseFloat(this.$el.style.height)>=parseFloat(this.$el.style.maxHeight)?(this.$el.style.overflowY="scroll",this.$el.style.height=this.$el.style.maxHeight):this.$el.style.overflow="hidden")},onInput:function(t){this.autoResize&&this.resize(),this.writeValue(t.target.value,t)}},computed:{attrs:function(){return f(this.ptmi("root",{context:{filled:this.$filled,disabled:this.disabled}}),this.formField)},dataP:function(){return re(rm({invalid:this.$invalid,fluid:this.$fluid,filled:this.$variant==="filled"},this.size,this.size))}}},sm=["value","name","disabled","aria-invalid","data-p"];function um(e,t,n,o,i,r){return c(),b("textarea",f({class:e.cx("root"),value:e.d_value,name:e.name,disabled:e.disabled,"aria-invalid":e.invalid||void 0,"data-p":r.dataP,onInput:t[0]||(t[0]=function(){return r.onInput&&r.onInput.apply(r,arguments)})},r.attrs),null,16,sm)}lm.render=um;var dm=({dt:e})=>`
-.p-dataview {
-    border-color: ${e("dataview.border.color")};
-    border-width: ${e("dataview.border.width")};
-    border-style: solid;
-    border-radius: ${e("dataview.border.radius")};
-    padding: ${e("dataview.padding")};
-}
-
-.p-dataview-header {
-    background: ${e("dataview.header.background")};
-    color: ${e("dataview.header.color")};
-    border-color: ${e("dataview.header.border.color")};
-    border-width: ${e("dataview.header.border.width")};
-    border-style: solid;
-    padding: ${e("dataview.header.padding")};
-    border-radius: ${e("dataview.header.border.radius")};
-}
-
-.p-dataview-content {
-    background: ${e("dataview.content.background")};
-    border-color: ${e("dataview.content.border.color")};
-    border-width: ${e("dataview.content.border.width")};
-    border-style: solid;
-    color: ${e("dataview.content.color")};
-    padding: ${e("dataview.content.padding")};
-    border-radius: ${e("dataview.content.border.radius")};
-}
-
-.p-dataview-footer {
-    background: ${e("dataview.footer.background")};
-    color: ${e("dataview.footer.color")};
-    border-color: ${e("dataview.footer.border.color")};
-    border-width: ${e("dataview.footer.border.width")};
-    border-style: solid;
-    padding: ${e("dataview.footer.padding")};
-    border-radius: ${e("dataview.footer.border.radius")};
-}
-
-.p-dataview-paginator-top {
-    border-width: ${e("dataview.paginator.top.border.width")};
-    border-color: ${e("dataview.paginator.top.border.color")};
-    border-style: solid;
-}
-
-.p-dataview-paginator-bottom {
-    border-width: ${e("dataview.paginator.bottom.border.width")};
-    border-color: ${e("dataview.paginator.bottom.border.color")};
-    border-style: solid;
-}
-`,cm={root:function(t){var n=t.props;return["p-dataview p-component",{"p-dataview-list":n.layout==="list","p-dataview-grid":n.layout==="grid"}]},header:"p-dataview-header",pcPaginator:function(t){var n=t.position;return"p-dataview-paginator-"+n},content:"p-dataview-content",emptyMessage:"p-dataview-empty-message",footer:"p-dataview-footer"},pm=N.extend({name:"dataview",style:dm,classes:cm}),fm={name:"BaseDataView",extends:U,props:{value:{type:Array,default:null},layout:{type:String,default:"list"},rows:{type:Number,default:0},first:{type:Number,default:0},totalRecords:{type:Number,default:0},paginator:{type:Boolean,default:!1},paginatorPosition:{type:String,default:"bottom"},alwaysShowPaginator:{type:Boolean,default:!0},paginatorTemplate:{type:String,default:"FirstPageLink PrevPageLink PageLinks NextPageLink LastPageLink RowsPerPageDropdown"},pageLinkSize:{type:Number,default:5},rowsPerPageOptions:{type:Array,default:null},currentPageReportTemplate:{type:String,default:"({currentPage} of {totalPages})"},sortField:{type:[String,Function],default:null},sortOrder:{type:Number,default:null},lazy:{type:Boolean,default:!1},dataKey:{type:String,default:null}},style:pm,provide:function(){return{$pcDataView:this,$parentInstance:this}}};function hm(e){return ym(e)||gm(e)||bm(e)||mm()}function mm(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function bm(e,t){if(e){if(typeof e=="string")return Co(e,t);var n={}.toString.call(e).slice(8,-1);return n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set"?Array.from(e):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?Co(e,t):void 0}}function gm(e){if(typeof Symbol!="undefined"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function ym(e){if(Array.isArray(e))return Co(e)}function Co(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,o=Array(t);n<t;n++)o[n]=e[n];return o}var vm={name:"DataView",extends:fm,inheritAttrs:!1,emits:["update:first","update:rows","page"],data:function(){return{d_first:this.first,d_rows:this.rows}},watch:{first:function(t){this.d_first=t},rows:function(t){this.d_rows=t},sortField:function(){this.resetPage()},sortOrder:function(){this.resetPage()}},methods:{getKey:function(t,n){return this.dataKey?H(t,this.dataKey):n},onPage:function(t){this.d_first=t.first,this.d_rows=t.rows,this.$emit("update:first",this.d_first),this.$emit("update:rows",this.d_rows),this.$emit("page",t)},sort:function(){var t=this;if(this.value){var n=hm(this.value),o=Qn();return n.sort(function(i,r){var a=H(i,t.sortField),l=H(r,t.sortField);return eo(a,l,t.sortOrder,o)}),n}else return null},resetPage:function(){this.d_first=0,this.$emit("update:first",this.d_first)}},computed:{getTotalRecords:function(){return this.totalRecords?this.totalRecords:this.value?this.value.length:0},empty:function(){return!this.value||this.value.length===0},emptyMessageText:function(){var t;return((t=this.$primevue.config)===null||t===void 0||(t=t.locale)===null||t===void 0?void 0:t.emptyMessage)||""},paginatorTop:function(){return this.paginator&&(this.paginatorPosition!=="bottom"||this.paginatorPosition==="both")},paginatorBottom:function(){return this.paginator&&(this.paginatorPosition!=="top"||this.paginatorPosition==="both")},items:function(){if(this.value&&this.value.length){var t=this.value;if(t&&t.length&&this.sortField&&(t=this.sort()),this.paginator){var n=this.lazy?0:this.d_first;return t.slice(n,n+this.d_rows)}else return t}else return null}},components:{DVPaginator:Mo}};function wm(e,t,n,o,i,r){var a=T("DVPaginator");return c(),b("div",f({class:e.cx("root")},e.ptmi("root")),[e.$slots.header?(c(),b("div",f({key:0,class:e.cx("header")},e.ptm("header")),[k(e.$slots,"header")],16)):C("",!0),r.paginatorTop?(c(),y(a,{key:1,rows:i.d_rows,first:i.d_first,totalRecords:r.getTotalRecords,pageLinkSize:e.pageLinkSize,template:e.paginatorTemplate,rowsPerPageOptions:e.rowsPerPageOptions,currentPageReportTemplate:e.currentPageReportTemplate,class:j(e.cx("pcPaginator",{position:"top"})),alwaysShow:e.alwaysShowPaginator,onPage:t[0]||(t[0]=function(l){return r.onPage(l)}),unstyled:e.unstyled,pt:e.ptm("pcPaginator")},De({_:2},[e.$slots.paginatorcontainer?{name:"container",fn:E(function(l){return[k(e.$slots,"paginatorcontainer",{first:l.first,last:l.last,rows:l.rows,page:l.page,pageCount:l.pageCount,pageLinks:l.pageLinks,totalRecords:l.totalRecords,firstPageCallback:l.firstPageCallback,lastPageCallback:l.lastPageCallback,prevPageCallback:l.prevPageCallback,nextPageCallback:l.nextPageCallback,rowChangeCallback:l.rowChangeCallback,changePageCallback:l.changePageCallback})]}),key:"0"}:void 0,e.$slots.paginatorstart?{name:"start",fn:E(function(){return[k(e.$slots,"paginatorstart")]}),key:"1"}:void 0,e.$slots.paginatorend?{name:"end",fn:E(function(){return[k(e.$slots,"paginatorend")]}),key:"2"}:void 0]),1032,["rows","first","totalRecords","pageLinkSize","template","rowsPerPageOptions","currentPageReportTemplate","class","alwaysShow","unstyled","pt"])):C("",!0),R("div",f({class:e.cx("content")},e.ptm("content")),[r.empty?(c(),b("div",f({key:1,class:e.cx("emptyMessage")},e.ptm("emptyMessage")),[k(e.$slots,"empty",{layout:e.layout},function(){return[Ee(Y(r.emptyMessageText),1)]})],16)):(c(),b(K,{key:0},[e.$slots.list&&e.layout==="list"?k(e.$slots,"list",{key:0,items:r.items}):C("",!0),e.$slots.grid&&e.layout==="grid"?k(e.$slots,"grid",{key:1,items:r.items}):C("",!0)],64))],16),r.paginatorBottom?(c(),y(a,{key:2,rows:i.d_rows,first:i.d_first,totalRecords:r.getTotalRecords,pageLinkSize:e.pageLinkSize,template:e.paginatorTemplate,rowsPerPageOptions:e.rowsPerPageOptions,currentPageReportTemplate:e.currentPageReportTemplate,class:j(e.cx("pcPaginator",{position:"bottom"})),alwaysShow:e.alwaysShowPaginator,onPage:t[1]||(t[1]=function(l){return r.onPage(l)}),unstyled:e.unstyled,pt:e.ptm("pcPaginator")},De({_:2},[e.$slots.paginatorcontainer?{name:"container",fn:E(function(l){return[k(e.$slots,"paginatorcontainer",{first:l.first,last:l.last,rows:l.rows,page:l.page,pageCount:l.pageCount,pageLinks:l.pageLinks,totalRecords:l.totalRecords,firstPageCallback:l.firstPageCallback,lastPageCallback:l.lastPageCallback,prevPageCallback:l.prevPageCallback,nextPageCallback:l.nextPageCallback,rowChangeCallback:l.rowChangeCallback,changePageCallback:l.changePageCallback})]}),key:"0"}:void 0,e.$slots.paginatorstart?{name:"start",fn:E(function(){return[k(e.$slots,"paginatorstart")]}),key:"1"}:void 0,e.$slots.paginatorend?{name:"end",fn:E(function(){return[k(e.$slots,"paginatorend")]}),key:"2"}:void 0]),1032,["rows","first","totalRecords","pageLinkSize","template","rowsPerPageOptions","currentPageReportTemplate","class","alwaysShow","unstyled","pt"])):C("",!0),e.$slots.footer?(c(),b("div",f({key:3,class:e.cx("footer")},e.ptm("footer")),[k(e.$slots,"footer")],16)):C("",!0)],16)}vm.render=wm;function pn(e){"@babel/helpers - typeof";return pn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},pn(e)}function ni(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function Pn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?ni(Object(n),!0).forEach(function(o){Cm(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ni(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Cm(e,t,n){return(t=Sm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Sm(e){var t=$m(e,"string");return pn(t)=="symbol"?t:t+""}function $m(e,t){if(pn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(pn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var km={ripple:!1,inputStyle:null,inputVariant:null,locale:{startsWith:"Starts with",contains:"Contains",notContains:"Not contains",endsWith:"Ends with",equals:"Equals",notEquals:"Not equals",noFilter:"No Filter",lt:"Less than",lte:"Less than or equal to",gt:"Greater than",gte:"Greater than or equal to",dateIs:"Date is",dateIsNot:"Date is not",dateBefore:"Date is before",dateAfter:"Date is after",clear:"Clear",apply:"Apply",matchAll:"Match All",matchAny:"Match Any",addRule:"Add Rule",removeRule:"Remove Rule",accept:"Yes",reject:"No",choose:"Choose",upload:"Upload",cancel:"Cancel",completed:"Completed",pending:"Pending",fileSizeTypes:["B","KB","MB","GB","TB","PB","EB","ZB","YB"],dayNames:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],dayNamesShort:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],dayNamesMin:["Su","Mo","Tu","We","Th","Fr","Sa"],monthNames:["January","February","March","April","May","June","July","August","September","October","November","December"],monthNamesShort:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],chooseYear:"Choose Year",chooseMonth:"Choose Month",chooseDate:"Choose Date",prevDecade:"Previous Decade",nextDecade:"Next Decade",prevYear:"Previous Year",nextYear:"Next Year",prevMonth:"Previous Month",nextMonth:"Next Month",prevHour:"Previous Hour",nextHour:"Next Hour",prevMinute:"Previous Minute",nextMinute:"Next Minute",prevSecond:"Previous Second",nextSecond:"Next Second",am:"am",pm:"pm",today:"Today",weekHeader:"Wk",firstDayOfWeek:0,showMonthAfterYear:!1,dateFormat:"mm/dd/yy",weak:"Weak",medium:"Medium",strong:"Strong",passwordPrompt:"Enter a password",emptyFilterMessage:"No results found",searchMessage:"{0} results are available",selectionMessage:"{0} items selected",emptySelectionMessage:"No selected item",emptySearchMessage:"No results found",fileChosenMessage:"{0} files",noFileChosenMessage:"No file chosen",emptyMessage:"No available options",aria:{trueLabel:"True",falseLabel:"False",nullLabel:"Not Selected",star:"1 star",stars:"{star} stars",selectAll:"All items selected",unselectAll:"All items unselected",close:"Close",previous:"Previous",next:"Next",navigation:"Navigation",scrollTop:"Scroll Top",moveTop:"Move Top",moveUp:"Move Up",moveDown:"Move Down",moveBottom:"Move Bottom",moveToTarget:"Move to Target",moveToSource:"Move to Source",moveAllToTarget:"Move All to Target",moveAllToSource:"Move All to Source",pageLabel:"Page {page}",firstPageLabel:"First Page",lastPageLabel:"Last Page",nextPageLabel:"Next Page",prevPageLabel:"Previous Page",rowsPerPageLabel:"Rows per page",jumpToPageDropdownLabel:"Jump to Page Dropdown",jumpToPageInputLabel:"Jump to Page Input",selectRow:"Row Selected",unselectRow:"Row Unselected",expandRow:"Row Expanded",collapseRow:"Row Collapsed",showFilterMenu:"Show Filter Menu",hideFilterMenu:"Hide Filter Menu",filterOperator:"Filter Operator",filterConstraint:"Filter Constraint",editRow:"Row Edit",saveEdit:"Save Edit",cancelEdit:"Cancel Edit",listView:"List View",gridView:"Grid View",slide:"Slide",slideNumber:"{slideNumber}",zoomImage:"Zoom Image",zoomIn:"Zoom In",zoomOut:"Zoom Out",rotateRight:"Rotate Right",rotateLeft:"Rotate Left",listLabel:"Option List"}},filterMatchModeOptions:{text:[pe.STARTS_WITH,pe.CONTAINS,pe.NOT_CONTAINS,pe.ENDS_WITH,pe.EQUALS,pe.NOT_EQUALS],numeric:[pe.EQUALS,pe.NOT_EQUALS,pe.LESS_THAN,pe.LESS_THAN_OR_EQUAL_TO,pe.GREATER_THAN,pe.GREATER_THAN_OR_EQUAL_TO],date:[pe.DATE_IS,pe.DATE_IS_NOT,pe.DATE_BEFORE,pe.DATE_AFTER]},zIndex:{modal:1100,overlay:1e3,menu:1e3,tooltip:1100},theme:void 0,unstyled:!1,pt:void 0,ptOptions:{mergeSections:!0,mergeProps:!1},csp:{nonce:void 0}},Im=Symbol();function Pm(e,t){var n={config:Ua(t)};return e.config.globalProperties.$primevue=n,e.provide(Im,n),Om(),xm(e,n),n}var dt=[];function Om(){ye.clear(),dt.forEach(function(e){return e==null?void 0:e()}),dt=[]}function xm(e,t){var n=On(!1),o=function(){var u;if(((u=t.config)===null||u===void 0?void 0:u.theme)!=="none"&&!ee.isStyleNameLoaded("common")){var d,p,h=((d=N.getCommonTheme)===null||d===void 0?void 0:d.call(N))||{},m=h.primitive,w=h.semantic,$=h.global,v=h.style,I={nonce:(p=t.config)===null||p===void 0||(p=p.csp)===null||p===void 0?void 0:p.nonce};N.load(m==null?void 0:m.css,Pn({name:"primitive-variables"},I)),N.load(w==null?void 0:w.css,Pn({name:"semantic-variables"},I)),N.load($==null?void 0:$.css,Pn({name:"global-variables"},I)),N.loadStyle(Pn({name:"global-style"},I),v),ee.setLoadedStyleName("common")}};ye.on("theme:change",function(s){n.value||(e.config.globalProperties.$primevue.config.theme=s,n.value=!0)});var i=Ct(t.config,function(s,u){Ze.emit("config:change",{newValue:s,oldValue:u})},{immediate:!0,deep:!0}),r=Ct(function(){return t.config.ripple},function(s,u){Ze.emit("config:ripple:change",{newValue:s,oldValue:u})},{immediate:!0,deep:!0}),a=Ct(function(){return t.config.theme},function(s,u){n.value||ee.setTheme(s),t.config.unstyled||o(),n.value=!1,Ze.emit("config:theme:change",{newValue:s,oldValue:u})},{immediate:!0,deep:!1}),l=Ct(function(){return t.config.unstyled},function(s,u){!s&&t.config.theme&&o(),Ze.emit("config:unstyled:change",{newValue:s,oldValue:u})},{immediate:!0,deep:!0});dt.push(i),dt.push(r),dt.push(a),dt.push(l)}var vb={install:function(t,n){var o=hl(km,n);Pm(t,o)}},wb={install:function(t){var n={add:function(i){Oe.emit("add",i)},remove:function(i){Oe.emit("remove",i)},removeGroup:function(i){Oe.emit("remove-group",i)},removeAllGroups:function(){Oe.emit("remove-all-groups")}};t.config.globalProperties.$toast=n,t.provide(Pi,n)}},ct=bn(),Cb={install:function(t){var n={require:function(i){ct.emit("confirm",i)},close:function(){ct.emit("close")}};t.config.globalProperties.$confirm=n,t.provide(Oi,n)}},Rm=({dt:e})=>`
-.p-confirmdialog .p-dialog-content {
-    display: flex;
-    align-items: center;
-    gap:  ${e("confirmdialog.content.gap")};
-}
-
-.p-confirmdialog-icon {
-    color: ${e("confirmdialog.icon.color")};
-    font-size: ${e("confirmdialog.icon.size")};
-    width: ${e("confirmdialog.icon.size")};
-    height: ${e("confirmdialog.icon.size")};
-}
-`,Lm={root:"p-confirmdialog",icon:"p-confirmdialog-icon",message:"p-confirmdialog-message",pcRejectButton:"p-confirmdialog-reject-button",pcAcceptButton:"p-confirmdialog-accept-button"},Tm=N.extend({name:"confirmdialog",style:Rm,classes:Lm}),Mm={name:"BaseConfirmDialog",extends:U,props:{group:String,breakpoints:{type:Object,default:null},draggable:{type:Boolean,default:!0}},style:Tm,provide:function(){return{$pcConfirmDialog:this,$parentInstance:this}}},Em={name:"ConfirmDialog",extends:Mm,confirmListener:null,closeListener:null,data:function(){return{visible:!1,confirmation:null}},mounted:function(){var t=this;this.confirmListener=function(n){n&&n.group===t.group&&(t.confirmation=n,t.confirmation.onShow&&t.confirmation.onShow(),t.visible=!0)},this.closeListener=function(){t.visible=!1,t.confirmation=null},ct.on("confirm",this.confirmListener),ct.on("close",this.closeListener)},beforeUnmount:function(){ct.off("confirm",this.confirmListener),ct.off("close",this.closeListener)},methods:{accept:function(){this.confirmation.accept&&this.confirmation.accept(),this.visible=!1},reject:function(){this.confirmation.reject&&this.confirmation.reject(),this.visible=!1},onHide:function(){this.confirmation.onHide&&this.confirmation.onHide(),this.visible=!1}},computed:{appendTo:function(){return this.confirmation?this.confirmation.appendTo:"body"},target:function(){return this.confirmation?this.confirmation.target:null},modal:function(){return this.confirmation?this.confirmation.modal==null?!0:this.confirmation.modal:!0},header:function(){return this.confirmation?this.confirmation.header:null},message:function(){return this.confirmation?this.confirmation.message:null},blockScroll:function(){return this.confirmation?this.confirmation.blockScroll:!0},position:function(){return this.confirmation?this.confirmation.position:null},acceptLabel:function(){if(this.confirmation){var t,n=this.confirmation;return n.acceptLabel||((t=n.acceptProps)===null||t===void 0?void 0:t.label)||this.$primevue.config.locale.accept}return this.$primevue.config.locale.accept},rejectLabel:function(){if(this.confirmation){var t,n=this.confirmation;return n.rejectLabel||((t=n.rejectProps)===null||t===void 0?void 0:t.label)||this.$primevue.config.locale.reject}return this.$primevue.config.locale.reject},acceptIcon:function(){var t;return this.confirmation?this.confirmation.acceptIcon:(t=this.confirmation)!==null&&t!==void 0&&t.acceptProps?this.confirmation.acceptProps.icon:null},rejectIcon:function(){var t;return this.confirmation?this.confirmation.rejectIcon:(t=this.confirmation)!==null&&t!==void 0&&t.rejectProps?this.confirmation.rejectProps.icon:null},autoFocusAccept:function(){return this.confirmation.defaultFocus===void 0||this.confirmation.defaultFocus==="accept"},autoFocusReject:function(){return this.confirmation.defaultFocus==="reject"},closeOnEscape:function(){return this.confirmation?this.confirmation.closeOnEscape:!0}},components:{Dialog:va,Button:gn}};function Dm(e,t,n,o,i,r){var a=T("Button"),l=T("Dialog");return c(),y(l,{visible:i.visible,"onUpdate:visible":[t[2]||(t[2]=function(s){return i.visible=s}),r.onHide],role:"alertdialog",class:j(e.cx("root")),modal:r.modal,header:r.header,blockScroll:r.blockScroll,appendTo:r.appendTo,position:r.position,breakpoints:e.breakpoints,closeOnEscape:r.closeOnEscape,draggable:e.draggable,pt:e.pt,unstyled:e.unstyled},De({default:E(function(){return[e.$slots.container?C("",!0):(c(),b(K,{key:0},[e.$slots.message?(c(),y(M(e.$slots.message),{key:1,message:i.confirmation},null,8,["message"])):(c(),b(K,{key:0},[k(e.$slots,"icon",{},function(){return[e.$slots.icon?(c(),y(M(e.$slots.icon),{key:0,class:j(e.cx("icon"))},null,8,["class"])):i.confirmation.icon?(c(),b("span",f({key:1,class:[i.confirmation.icon,e.cx("icon")]},e.ptm("icon")),null,16)):C("",!0)]}),R("span",f({class:e.cx("message")},e.ptm("message")),Y(r.message),17)],64))],64))]}),_:2},[e.$slots.container?{name:"container",fn:E(function(s){return[k(e.$slots,"container",{message:i.confirmation,closeCallback:s.onclose,acceptCallback:r.accept,rejectCallback:r.reject})]}),key:"0"}:void 0,e.$slots.container?void 0:{name:"footer",fn:E(function(){var s;return[ne(a,f({class:[e.cx("pcRejectButton"),i.confirmation.rejectClass],autofocus:r.autoFocusReject,unstyled:e.unstyled,text:((s=i.confirmation.rejectProps)===null||s===void 0?void 0:s.text)||!1,onClick:t[0]||(t[0]=function(u){return r.reject()})},i.confirmation.rejectProps,{label:r.rejectLabel,pt:e.ptm("pcRejectButton")}),De({_:2},[r.rejectIcon||e.$slots.rejecticon?{name:"icon",fn:E(function(u){return[k(e.$slots,"rejecticon",{},function(){return[R("span",f({class:[r.rejectIcon,u.class]},e.ptm("pcRejectButton").icon,{"data-pc-section":"rejectbuttonicon"}),null,16)]})]}),key:"0"}:void 0]),1040,["class","autofocus","unstyled","text","label","pt"]),ne(a,f({label:r.acceptLabel,class:[e.cx("pcAcceptButton"),i.confirmation.acceptClass],autofocus:r.autoFocusAccept,unstyled:e.unstyled,onClick:t[1]||(t[1]=function(u){return r.accept()})},i.confirmation.acceptProps,{pt:e.ptm("pcAcceptButton")}),De({_:2},[r.acceptIcon||e.$slots.accepticon?{name:"icon",fn:E(function(u){return[k(e.$slots,"accepticon",{},function(){return[R("span",f({class:[r.acceptIcon,u.class]},e.ptm("pcAcceptButton").icon,{"data-pc-section":"acceptbuttonicon"}),null,16)]})]}),key:"0"}:void 0]),1040,["label","class","autofocus","unstyled","pt"])]}),key:"1"}]),1032,["visible","class","modal","header","blockScroll","appendTo","position","breakpoints","closeOnEscape","draggable","onUpdate:visible","pt","unstyled"])}Em.render=Dm;var Fm=({dt:e})=>`
-.p-menubar {
-    display: flex;
-    align-items: center;
-    background: ${e("menubar.background")};
-    border: 1px solid ${e("menubar.border.color")};
-    border-radius: ${e("menubar.border.radius")};
-    color: ${e("menubar.color")};
-    padding: ${e("menubar.padding")};
-    gap: ${e("menubar.gap")};
-}
-
-.p-menubar-start,
-.p-megamenu-end {
-    display: flex;
-    align-items: center;
-}
-
-.p-menubar-root-list,
-.p-menubar-submenu {
-    display: flex;
-    margin: 0;
-    padding: 0;
-    list-style: none;
-    outline: 0 none;
-}
-
-.p-menubar-root-list {
-    align-items: center;
-    flex-wrap: wrap;
-    gap: ${e("menubar.gap")};
-}
-
-.p-menubar-root-list > .p-menubar-item > .p-menubar-item-content {
-    border-radius: ${e("menubar.base.item.border.radius")};
-}
-
-.p-menubar-root-list > .p-menubar-item > .p-menubar-item-content > .p-menubar-item-link {
-    padding: ${e("menubar.base.item.padding")};
-}
-
-.p-menubar-item-content {
-    transition: background ${e("menubar.transition.duration")}, color ${e("menubar.transition.duration")};
-    border-radius: ${e("menubar.item.border.radius")};
-    color: ${e("menubar.item.color")};
-}
-
-.p-menubar-item-link {
-    cursor: pointer;
-    display: flex;
-    align-items: center;
-    text-decoration: none;
-    overflow: hidden;
-    position: relative;
-    color: inherit;
-    padding: ${e("menubar.item.padding")};
-    gap: ${e("menubar.item.gap")};
-    user-select: none;
-    outline: 0 none;
-}
-
-.p-menubar-item-label {
-    line-height: 1;
-}
-
-.p-menubar-item-icon {
-    color: ${e("menubar.item.icon.color")};
-}
-
-.p-menubar-submenu-icon {
-    color: ${e("menubar.submenu.icon.color")};
-    margin-left: auto;
-    font-size: ${e("menubar.submenu.icon.size")};
-    width: ${e("menubar.submenu.icon.size")};
-    height: ${e("menubar.submenu.icon.size")};
-}
-
-.p-menubar-submenu .p-menubar-submenu-icon:dir(rtl) {
-    margin-left: 0;
-    margin-right: auto;
-}
-
-.p-menubar-item.p-focus > .p-menubar-item-content {
-    color: ${e("menubar.item.focus.color")};
-    background: ${e("menubar.item.focus.background")};
-}
-
-.p-menubar-item.p-focus > .p-menubar-item-content .p-menubar-item-icon {
-    color: ${e("menubar.item.icon.focus.color")};
-}
-
-.p-menubar-item.p-focus > .p-menubar-item-content .p-menubar-submenu-icon {
-    color: ${e("menubar.submenu.icon.focus.color")};
-}
-
-.p-menubar-item:not(.p-disabled) > .p-menubar-item-content:hover {
-    color: ${e("menubar.item.focus.color")};
-    background: ${e("menubar.item.focus.background")};
-}
-
-.p-menubar-item:not(.p-disabled) > .p-menubar-item-content:hover .p-menubar-item-icon {
-    color: ${e("menubar.item.icon.focus.color")};
-}
-
-.p-menubar-item:not(.p-disabled) > .p-menubar-item-content:hover .p-menubar-submenu-icon {
-    color: ${e("menubar.submenu.icon.focus.color")};
-}
-
-.p-menubar-item-active > .p-menubar-item-content {
-    color: ${e("menubar.item.active.color")};
-    background: ${e("menubar.item.active.background")};
-}
-
-.p-menubar-item-active > .p-menubar-item-content .p-menubar-item-icon {
-    color: ${e("menubar.item.icon.active.color")};
-}
-
-.p-menubar-item-active > .p-menubar-item-content .p-menubar-submenu-icon {
-    color: ${e("menubar.submenu.icon.active.color")};
-}
-
-.p-menubar-submenu {
-    display: none;
-    position: absolute;
-    min-width: 12.5rem;
-    z-index: 1;
-    background: ${e("menubar.submenu.background")};
-    border: 1px solid ${e("menubar.submenu.border.color")};
-    border-radius: ${e("menubar.submenu.border.radius")};
-    box-shadow: ${e("menubar.submenu.shadow")};
-    color: ${e("menubar.submenu.color")};
-    flex-direction: column;
-    padding: ${e("menubar.submenu.padding")};
-    gap: ${e("menubar.submenu.gap")};
-}
-
-.p-menubar-submenu .p-menubar-separator {
-    border-block-start: 1px solid ${e("menubar.separator.border.color")};
-}
-
-.p-menubar-submenu .p-menubar-item {
-    position: relative;
-}
-
-.p-menubar-submenu > .p-menubar-item-active > .p-menubar-submenu {
-    display: block;
-    left: 100%;
-    top: 0;
-}
-
-.p-menubar-end {
-    margin-left: auto;
-    align-self: center;
-}
-
-.p-menubar-end:dir(rtl) {
-    margin-left: 0;
-    margin-right: auto;
-}
-
-.p-menubar-button {
-    display: none;
-    justify-content: center;
-    align-items: center;
-    cursor: pointer;
-    width: ${e("menubar.mobile.button.size")};
-    height: ${e("menubar.mobile.button.size")};
-    position: relative;
-    color: ${e("menubar.mobile.button.color")};
-    border: 0 none;
-    background: transparent;
-    border-radius: ${e("menubar.mobile.button.border.radius")};
-    transition: background ${e("menubar.transition.duration")}, color ${e("menubar.transition.duration")}, outline-color ${e("menubar.transition.duration")};
-    outline-color: transparent;
-}
-
-.p-menubar-button:hover {
-    color: ${e("menubar.mobile.button.hover.color")};
-    background: ${e("menubar.mobile.button.hover.background")};
-}
-
-.p-menubar-button:focus-visible {
-    box-shadow: ${e("menubar.mobile.button.focus.ring.shadow")};
-    outline: ${e("menubar.mobile.button.focus.ring.width")} ${e("menubar.mobile.button.focus.ring.style")} ${e("menubar.mobile.button.focus.ring.color")};
-    outline-offset: ${e("menubar.mobile.button.focus.ring.offset")};
-}
-
-.p-menubar-mobile {
-    position: relative;
-}
-
-.p-menubar-mobile .p-menubar-button {
-    display: flex;
-}
-
-.p-menubar-mobile .p-menubar-root-list {
-    position: absolute;
-    display: none;
-    width: 100%;
-    flex-direction: column;
-    top: 100%;
-    left: 0;
-    z-index: 1;
-    padding: ${e("menubar.submenu.padding")};
-    background: ${e("menubar.submenu.background")};
-    border: 1px solid ${e("menubar.submenu.border.color")};
-    box-shadow: ${e("menubar.submenu.shadow")};
-    border-radius: ${e("menubar.submenu.border.radius")};
-    gap: ${e("menubar.submenu.gap")};
-}
-
-.p-menubar-mobile .p-menubar-root-list:dir(rtl) {
-    left: auto;
-    right: 0;
-}
-
-.p-menubar-mobile .p-menubar-root-list > .p-menubar-item > .p-menubar-item-content > .p-menubar-item-link {
-    padding: ${e("menubar.item.padding")};
-}
-
-.p-menubar-mobile-active .p-menubar-root-list {
-    display: flex;
-}
-
-.p-menubar-mobile .p-menubar-root-list .p-menubar-item {
-    width: 100%;
-    position: static;
-}
-
-.p-menubar-mobile .p-menubar-root-list .p-menubar-separator {
-    border-block-start: 1px solid ${e("menubar.separator.border.color")};
-}
-
-.p-menubar-mobile .p-menubar-root-list > .p-menubar-item > .p-menubar-item-content .p-menubar-submenu-icon {
-    margin-left: auto;
-    transition: transform 0.2s;
-}
-
-.p-menubar-mobile .p-menubar-root-list > .p-menubar-item > .p-menubar-item-content .p-menubar-submenu-icon:dir(rtl),
-.p-menubar-mobile .p-menubar-submenu-icon:dir(rtl) {
-    margin-left: 0;
-    margin-right: auto;
-}
-
-.p-menubar-mobile .p-menubar-root-list > .p-menubar-item-active > .p-menubar-item-content .p-menubar-submenu-icon {
-    transform: rotate(-180deg);
-}
-
-.p-menubar-mobile .p-menubar-submenu .p-menubar-submenu-icon {
-    transition: transform 0.2s;
-    transform: rotate(90deg);
-}
-
-.p-menubar-mobile .p-menubar-item-active > .p-menubar-item-content .p-menubar-submenu-icon {
-    transform: rotate(-90deg);
-}
-
-.p-menubar-mobile .p-menubar-submenu {
-    width: 100%;
-    position: static;
-    box-shadow: none;
-    border: 0 none;
-    padding-inline-start: ${e("menubar.submenu.mobile.indent")};
-    padding-inline-end: 0;
-}
-`,Bm={submenu:function(t){var n=t.instance,o=t.processedItem;return{display:n.isItemActive(o)?"flex":"none"}}},zm={root:function(t){var n=t.instance;return["p-menubar p-component",{"p-menubar-mobile":n.queryMatches,"p-menubar-mobile-active":n.mobileActive}]},start:"p-menubar-start",button:"p-menubar-button",rootList:"p-menubar-root-list",item:function(t){var n=t.instance,o=t.processedItem;return["p-menubar-item",{"p-menubar-item-active":n.isItemActive(o),"p-focus":n.isItemFocused(o),"p-disabled":n.isItemDisabled(o)}]},itemContent:"p-menubar-item-content",itemLink:"p-menubar-item-link",itemIcon:"p-menubar-item-icon",itemLabel:"p-menubar-item-label",submenuIcon:"p-menubar-submenu-icon",submenu:"p-menubar-submenu",separator:"p-menubar-separator",end:"p-menubar-end"},Am=N.extend({name:"menubar",style:Fm,classes:zm,inlineStyles:Bm}),jm={name:"BaseMenubar",extends:U,props:{model:{type:Array,default:null},buttonProps:{type:null,default:null},breakpoint:{type:String,default:"960px"},ariaLabelledby:{type:String,default:null},ariaLabel:{type:String,default:null}},style:Am,provide:function(){return{$pcMenubar:this,$parentInstance:this}}},wa={name:"MenubarSub",hostName:"Menubar",extends:U,emits:["item-mouseenter","item-click","item-mousemove"],props:{items:{type:Array,default:null},root:{type:Boolean,default:!1},popup:{type:Boolean,default:!1},mobileActive:{type:Boolean,default:!1},templates:{type:Object,default:null},level:{type:Number,default:0},menuId:{type:String,default:null},focusedItemId:{type:String,default:null},activeItemPath:{type:Object,default:null}},list:null,methods:{getItemId:function(t){return"".concat(this.menuId,"_").concat(t.key)},getItemKey:function(t){return this.getItemId(t)},getItemProp:function(t,n,o){return t&&t.item?Ce(t.item[n],o):void 0},getItemLabel:function(t){return this.getItemProp(t,"label")},getItemLabelId:function(t){return"".concat(this.menuId,"_").concat(t.key,"_label")},getPTOptions:function(t,n,o){return this.ptm(o,{context:{item:t.item,index:n,active:this.isItemActive(t),focused:this.isItemFocused(t),disabled:this.isItemDisabled(t),level:this.level}})},isItemActive:function(t){return this.activeItemPath.some(function(n){return n.key===t.key})},isItemVisible:function(t){return this.getItemProp(t,"visible")!==!1},isItemDisabled:function(t){return this.getItemProp(t,"disabled")},isItemFocused:function(t){return this.focusedItemId===this.getItemId(t)},isItemGroup:function(t){return A(t.items)},onItemClick:function(t,n){this.getItemProp(n,"command",{originalEvent:t,item:n.item}),this.$emit("item-click",{originalEvent:t,processedItem:n,isFocus:!0})},onItemMouseEnter:function(t,n){this.$emit("item-mouseenter",{originalEvent:t,processedItem:n})},onItemMouseMove:function(t,n){this.$emit("item-mousemove",{originalEvent:t,processedItem:n})},getAriaPosInset:function(t){return t-this.calculateAriaSetSize.slice(0,t).length+1},getMenuItemProps:function(t,n){return{action:f({class:this.cx("itemLink"),tabindex:-1},this.getPTOptions(t,n,"itemLink")),icon:f({class:[this.cx("itemIcon"),this.getItemProp(t,"icon")]},this.getPTOptions(t,n,"itemIcon")),label:f({class:this.cx("itemLabel")},this.getPTOptions(t,n,"itemLabel")),submenuicon:f({class:this.cx("submenuIcon")},this.getPTOptions(t,n,"submenuIcon"))}}},computed:{calculateAriaSetSize:function(){var t=this;return this.items.filter(function(n){return t.isItemVisible(n)&&t.getItemProp(n,"separator")})},getAriaSetSize:function(){var t=this;return this.items.filter(function(n){return t.isItemVisible(n)&&!t.getItemProp(n,"separator")}).length}},components:{AngleRightIcon:To,AngleDownIcon:Lo},directives:{ripple:Re}},Km=["id","aria-label","aria-disabled","aria-expanded","aria-haspopup","aria-level","aria-setsize","aria-posinset","data-p-active","data-p-focused","data-p-disabled"],Vm=["onClick","onMouseenter","onMousemove"],Nm=["href","target"],Hm=["id"],Gm=["id"];function Um(e,t,n,o,i,r){var a=T("MenubarSub",!0),l=ke("ripple");return c(),b("ul",f({class:n.level===0?e.cx("rootList"):e.cx("submenu")},n.level===0?e.ptm("rootList"):e.ptm("submenu")),[(c(!0),b(K,null,ue(n.items,function(s,u){return c(),b(K,{key:r.getItemKey(s)},[r.isItemVisible(s)&&!r.getItemProp(s,"separator")?(c(),b("li",f({key:0,id:r.getItemId(s),style:r.getItemProp(s,"style"),class:[e.cx("item",{processedItem:s}),r.getItemProp(s,"class")],role:"menuitem","aria-label":r.getItemLabel(s),"aria-disabled":r.isItemDisabled(s)||void 0,"aria-expanded":r.isItemGroup(s)?r.isItemActive(s):void 0,"aria-haspopup":r.isItemGroup(s)&&!r.getItemProp(s,"to")?"menu":void 0,"aria-level":n.level+1,"aria-setsize":r.getAriaSetSize,"aria-posinset":r.getAriaPosInset(u),ref_for:!0},r.getPTOptions(s,u,"item"),{"data-p-active":r.isItemActive(s),"data-p-focused":r.isItemFocused(s),"data-p-disabled":r.isItemDisabled(s)}),[R("div",f({class:e.cx("itemContent"),onClick:function(p){return r.onItemClick(p,s)},onMouseenter:function(p){return r.onItemMouseEnter(p,s)},onMousemove:function(p){return r.onItemMouseMove(p,s)},ref_for:!0},r.getPTOptions(s,u,"itemContent")),[n.templates.item?(c(),y(M(n.templates.item),{key:1,item:s.item,root:n.root,hasSubmenu:r.getItemProp(s,"items"),label:r.getItemLabel(s),props:r.getMenuItemProps(s,u)},null,8,["item","root","hasSubmenu","label","props"])):Ie((c(),b("a",f({key:0,href:r.getItemProp(s,"url"),class:e.cx("itemLink"),target:r.getItemProp(s,"target"),tabindex:"-1",ref_for:!0},r.getPTOptions(s,u,"itemLink")),[n.templates.itemicon?(c(),y(M(n.templates.itemicon),{key:0,item:s.item,class:j(e.cx("itemIcon"))},null,8,["item","class"])):r.getItemProp(s,"icon")?(c(),b("span",f({key:1,class:[e.cx("itemIcon"),r.getItemProp(s,"icon")],ref_for:!0},r.getPTOptions(s,u,"itemIcon")),null,16)):C("",!0),R("span",f({id:r.getItemLabelId(s),class:e.cx("itemLabel"),ref_for:!0},r.getPTOptions(s,u,"itemLabel")),Y(r.getItemLabel(s)),17,Hm),r.getItemProp(s,"items")?(c(),b(K,{key:2},[n.templates.submenuicon?(c(),y(M(n.templates.submenuicon),{key:0,root:n.root,active:r.isItemActive(s),class:j(e.cx("submenuIcon"))},null,8,["root","active","class"])):(c(),y(M(n.root?"AngleDownIcon":"AngleRightIcon"),f({key:1,class:e.cx("submenuIcon"),ref_for:!0},r.getPTOptions(s,u,"submenuIcon")),null,16,["class"]))],64)):C("",!0)],16,Nm)),[[l]])],16,Vm),r.isItemVisible(s)&&r.isItemGroup(s)?(c(),y(a,{key:0,id:r.getItemId(s)+"_list",menuId:n.menuId,role:"menu",style:So(e.sx("submenu",!0,{processedItem:s})),focusedItemId:n.focusedItemId,items:s.items,mobileActive:n.mobileActive,activeItemPath:n.activeItemPath,templates:n.templates,level:n.level+1,"aria-labelledby":r.getItemLabelId(s),pt:e.pt,unstyled:e.unstyled,onItemClick:t[0]||(t[0]=function(d){return e.$emit("item-click",d)}),onItemMouseenter:t[1]||(t[1]=function(d){return e.$emit("item-mouseenter",d)}),onItemMousemove:t[2]||(t[2]=function(d){return e.$emit("item-mousemove",d)})},null,8,["id","menuId","style","focusedItemId","items","mobileActive","activeItemPath","templates","level","aria-labelledby","pt","unstyled"])):C("",!0)],16,Km)):C("",!0),r.isItemVisible(s)&&r.getItemProp(s,"separator")?(c(),b("li",f({key:1,id:r.getItemId(s),class:[e.cx("separator"),r.getItemProp(s,"class")],style:r.getItemProp(s,"style"),role:"separator",ref_for:!0},e.ptm("separator")),null,16,Gm)):C("",!0)],64)}),128))],16)}wa.render=Um;var _m={name:"Menubar",extends:jm,inheritAttrs:!1,emits:["focus","blur"],matchMediaListener:null,data:function(){return{mobileActive:!1,focused:!1,focusedItemInfo:{index:-1,level:0,parentKey:""},activeItemPath:[],dirty:!1,query:null,queryMatches:!1}},watch:{activeItemPath:function(t){A(t)?(this.bindOutsideClickListener(),this.bindResizeListener()):(this.unbindOutsideClickListener(),this.unbindResizeListener())}},outsideClickListener:null,container:null,menubar:null,mounted:function(){this.bindMatchMediaListener()},beforeUnmount:function(){this.mobileActive=!1,this.unbindOutsideClickListener(),this.unbindResizeListener(),this.unbindMatchMediaListener(),this.container&&me.clear(this.container),this.container=null},methods:{getItemProp:function(t,n){return t?Ce(t[n]):void 0},getItemLabel:function(t){return this.getItemProp(t,"label")},isItemDisabled:function(t){return this.getItemProp(t,"disabled")},isItemVisible:function(t){return this.getItemProp(t,"visible")!==!1},isItemGroup:function(t){return A(this.getItemProp(t,"items"))},isItemSeparator:function(t){return this.getItemProp(t,"separator")},getProccessedItemLabel:function(t){return t?this.getItemLabel(t.item):void 0},isProccessedItemGroup:function(t){return t&&A(t.items)},toggle:function(t){var n=this;this.mobileActive?(this.mobileActive=!1,me.clear(this.menubar),this.hide()):(this.mobileActive=!0,me.set("menu",this.menubar,this.$primevue.config.zIndex.menu),setTimeout(function(){n.show()},1)),this.bindOutsideClickListener(),t.preventDefault()},show:function(){te(this.menubar)},hide:function(t,n){var o=this;this.mobileActive&&(this.mobileActive=!1,setTimeout(function(){te(o.$refs.menubutton)},0)),this.activeItemPath=[],this.focusedItemInfo={index:-1,level:0,parentKey:""},n&&te(this.menubar),this.dirty=!1},onFocus:function(t){this.focused=!0,this.focusedItemInfo=this.focusedItemInfo.index!==-1?this.focusedItemInfo:{index:this.findFirstFocusedItemIndex(),level:0,parentKey:""},this.$emit("focus",t)},onBlur:function(t){this.focused=!1,this.focusedItemInfo={index:-1,level:0,parentKey:""},this.searchValue="",this.dirty=!1,this.$emit("blur",t)},onKeyDown:function(t){var n=t.metaKey||t.ctrlKey;switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t);break;case"ArrowLeft":this.onArrowLeftKey(t);break;case"ArrowRight":this.onArrowRightKey(t);break;case"Home":this.onHomeKey(t);break;case"End":this.onEndKey(t);break;case"Space":this.onSpaceKey(t);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t);break;case"PageDown":case"PageUp":case"Backspace":case"ShiftLeft":case"ShiftRight":break;default:!n&&bi(t.key)&&this.searchItems(t,t.key);break}},onItemChange:function(t,n){var o=t.processedItem,i=t.isFocus;if(!he(o)){var r=o.index,a=o.key,l=o.level,s=o.parentKey,u=o.items,d=A(u),p=this.activeItemPath.filter(function(h){return h.parentKey!==s&&h.parentKey!==a});d&&p.push(o),this.focusedItemInfo={index:r,level:l,parentKey:s},d&&(this.dirty=!0),i&&te(this.menubar),!(n==="hover"&&this.queryMatches)&&(this.activeItemPath=p)}},onItemClick:function(t){var n=t.originalEvent,o=t.processedItem,i=this.isProccessedItemGroup(o),r=he(o.parent),a=this.isSelected(o);if(a){var l=o.index,s=o.key,u=o.level,d=o.parentKey;this.activeItemPath=this.activeItemPath.filter(function(h){return s!==h.key&&s.startsWith(h.key)}),this.focusedItemInfo={index:l,level:u,parentKey:d},this.dirty=!r,te(this.menubar)}else if(i)this.onItemChange(t);else{var p=r?o:this.activeItemPath.find(function(h){return h.parentKey===""});this.hide(n),this.changeFocusedItemIndex(n,p?p.index:-1),this.mobileActive=!1,te(this.menubar)}},onItemMouseEnter:function(t){this.dirty&&this.onItemChange(t,"hover")},onItemMouseMove:function(t){this.focused&&this.changeFocusedItemIndex(t,t.processedItem.index)},menuButtonClick:function(t){this.toggle(t)},menuButtonKeydown:function(t){(t.code==="Enter"||t.code==="NumpadEnter"||t.code==="Space")&&this.menuButtonClick(t)},onArrowDownKey:function(t){var n=this.visibleItems[this.focusedItemInfo.index],o=n?he(n.parent):null;if(o){var i=this.isProccessedItemGroup(n);i&&(this.onItemChange({originalEvent:t,processedItem:n}),this.focusedItemInfo={index:-1,parentKey:n.key},this.onArrowRightKey(t))}else{var r=this.focusedItemInfo.index!==-1?this.findNextItemIndex(this.focusedItemInfo.index):this.findFirstFocusedItemIndex();this.changeFocusedItemIndex(t,r)}t.preventDefault()},onArrowUpKey:function(t){var n=this,o=this.visibleItems[this.focusedItemInfo.index],i=he(o.parent);if(i){var r=this.isProccessedItemGroup(o);if(r){this.onItemChange({originalEvent:t,processedItem:o}),this.focusedItemInfo={index:-1,parentKey:o.key};var a=this.findLastItemIndex();this.changeFocusedItemIndex(t,a)}}else{var l=this.activeItemPath.find(function(u){return u.key===o.parentKey});if(this.focusedItemInfo.index===0)this.focusedItemInfo={index:-1,parentKey:l?l.parentKey:""},this.searchValue="",this.onArrowLeftKey(t),this.activeItemPath=this.activeItemPath.filter(function(u){return u.parentKey!==n.focusedItemInfo.parentKey});else{var s=this.focusedItemInfo.index!==-1?this.findPrevItemIndex(this.focusedItemInfo.index):this.findLastFocusedItemIndex();this.changeFocusedItemIndex(t,s)}}t.preventDefault()},onArrowLeftKey:function(t){var n=this,o=this.visibleItems[this.focusedItemInfo.index],i=o?this.activeItemPath.find(function(a){return a.key===o.parentKey}):null;if(i)this.onItemChange({originalEvent:t,processedItem:i}),this.activeItemPath=this.activeItemPath.filter(function(a){return a.parentKey!==n.focusedItemInfo.parentKey}),t.preventDefault();else{var r=this.focusedItemInfo.index!==-1?this.findPrevItemIndex(this.focusedItemInfo.index):this.findLastFocusedItemIndex();this.changeFocusedItemIndex(t,r),t.preventDefault()}},onArrowRightKey:function(t){var n=this.visibleItems[this.focusedItemInfo.index],o=n?this.activeItemPath.find(function(a){return a.key===n.parentKey}):null;if(o){var i=this.isProccessedItemGroup(n);i&&(this.onItemChange({originalEvent:t,processedItem:n}),this.focusedItemInfo={index:-1,parentKey:n.key},this.onArrowDownKey(t))}else{var r=this.focusedItemInfo.index!==-1?this.findNextItemIndex(this.focusedItemInfo.index):this.findFirstFocusedItemIndex();this.changeFocusedItemIndex(t,r),t.preventDefault()}},onHomeKey:function(t){this.changeFocusedItemIndex(t,this.findFirstItemIndex()),t.preventDefault()},onEndKey:function(t){this.changeFocusedItemIndex(t,this.findLastItemIndex()),t.preventDefault()},onEnterKey:function(t){if(this.focusedItemInfo.index!==-1){var n=xe(this.menubar,'li[id="'.concat("".concat(this.focusedItemId),'"]')),o=n&&xe(n,'a[data-pc-section="itemlink"]');o?o.click():n&&n.click();var i=this.visibleItems[this.focusedItemInfo.index],r=this.isProccessedItemGroup(i);!r&&(this.focusedItemInfo.index=this.findFirstFocusedItemIndex())}t.preventDefault()},onSpaceKey:function(t){this.onEnterKey(t)},onEscapeKey:function(t){if(this.focusedItemInfo.level!==0){var n=this.focusedItemInfo;this.hide(t,!1),this.focusedItemInfo={index:Number(n.parentKey.split("_")[0]),level:0,parentKey:""}}t.preventDefault()},onTabKey:function(t){if(this.focusedItemInfo.index!==-1){var n=this.visibleItems[this.focusedItemInfo.index],o=this.isProccessedItemGroup(n);!o&&this.onItemChange({originalEvent:t,processedItem:n})}this.hide()},bindOutsideClickListener:function(){var t=this;this.outsideClickListener||(this.outsideClickListener=function(n){var o=t.container&&!t.container.contains(n.target),i=!(t.target&&(t.target===n.target||t.target.contains(n.target)));o&&i&&t.hide()},document.addEventListener("click",this.outsideClickListener,!0))},unbindOutsideClickListener:function(){this.outsideClickListener&&(document.removeEventListener("click",this.outsideClickListener,!0),this.outsideClickListener=null)},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=function(n){Kn()||t.hide(n,!0),t.mobileActive=!1},window.addEventListener("resize",this.resizeListener))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),this.resizeListener=null)},bindMatchMediaListener:function(){var t=this;if(!this.matchMediaListener){var n=matchMedia("(max-width: ".concat(this.breakpoint,")"));this.query=n,this.queryMatches=n.matches,this.matchMediaListener=function(){t.queryMatches=n.matches,t.mobileActive=!1},this.query.addEventListener("change",this.matchMediaListener)}},unbindMatchMediaListener:function(){this.matchMediaListener&&(this.query.removeEventListener("change",this.matchMediaListener),this.matchMediaListener=null)},isItemMatched:function(t){var n;return this.isValidItem(t)&&((n=this.getProccessedItemLabel(t))===null||n===void 0?void 0:n.toLocaleLowerCase().startsWith(this.searchValue.toLocaleLowerCase()))},isValidItem:function(t){return!!t&&!this.isItemDisabled(t.item)&&!this.isItemSeparator(t.item)&&this.isItemVisible(t.item)},isValidSelectedItem:function(t){return this.isValidItem(t)&&this.isSelected(t)},isSelected:function(t){return this.activeItemPath.some(function(n){return n.key===t.key})},findFirstItemIndex:function(){var t=this;return this.visibleItems.findIndex(function(n){return t.isValidItem(n)})},findLastItemIndex:function(){var t=this;return ot(this.visibleItems,function(n){return t.isValidItem(n)})},findNextItemIndex:function(t){var n=this,o=t<this.visibleItems.length-1?this.visibleItems.slice(t+1).findIndex(function(i){return n.isValidItem(i)}):-1;return o>-1?o+t+1:t},findPrevItemIndex:function(t){var n=this,o=t>0?ot(this.visibleItems.slice(0,t),function(i){return n.isValidItem(i)}):-1;return o>-1?o:t},findSelectedItemIndex:function(){var t=this;return this.visibleItems.findIndex(function(n){return t.isValidSelectedItem(n)})},findFirstFocusedItemIndex:function(){var t=this.findSelectedItemIndex();return t<0?this.findFirstItemIndex():t},findLastFocusedItemIndex:function(){var t=this.findSelectedItemIndex();return t<0?this.findLastItemIndex():t},searchItems:function(t,n){var o=this;this.searchValue=(this.searchValue||"")+n;var i=-1,r=!1;return this.focusedItemInfo.index!==-1?(i=this.visibleItems.slice(this.focusedItemInfo.index).findIndex(function(a){return o.isItemMatched(a)}),i=i===-1?this.visibleItems.slice(0,this.focusedItemInfo.index).findIndex(function(a){return o.isItemMatched(a)}):i+this.focusedItemInfo.index):i=this.visibleItems.findIndex(function(a){return o.isItemMatched(a)}),i!==-1&&(r=!0),i===-1&&this.focusedItemInfo.index===-1&&(i=this.findFirstFocusedItemIndex()),i!==-1&&this.changeFocusedItemIndex(t,i),this.searchTimeout&&clearTimeout(this.searchTimeout),this.searchTimeout=setTimeout(function(){o.searchValue="",o.searchTimeout=null},500),r},changeFocusedItemIndex:function(t,n){this.focusedItemInfo.index!==n&&(this.focusedItemInfo.index=n,this.scrollInView())},scrollInView:function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:-1,n=t!==-1?"".concat(this.$id,"_").concat(t):this.focusedItemId,o=xe(this.menubar,'li[id="'.concat(n,'"]'));o&&o.scrollIntoView&&o.scrollIntoView({block:"nearest",inline:"start"})},createProcessedItems:function(t){var n=this,o=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{},r=arguments.length>3&&arguments[3]!==void 0?arguments[3]:"",a=[];return t&&t.forEach(function(l,s){var u=(r!==""?r+"_":"")+s,d={item:l,index:s,level:o,key:u,parent:i,parentKey:r};d.items=n.createProcessedItems(l.items,o+1,d,u),a.push(d)}),a},containerRef:function(t){this.container=t},menubarRef:function(t){this.menubar=t?t.$el:void 0}},computed:{processedItems:function(){return this.createProcessedItems(this.model||[])},visibleItems:function(){var t=this,n=this.activeItemPath.find(function(o){return o.key===t.focusedItemInfo.parentKey});return n?n.items:this.processedItems},focusedItemId:function(){return this.focusedItemInfo.index!==-1?"".concat(this.$id).concat(A(this.focusedItemInfo.parentKey)?"_"+this.focusedItemInfo.parentKey:"","_").concat(this.focusedItemInfo.index):null}},components:{MenubarSub:wa,BarsIcon:Do}};function fn(e){"@babel/helpers - typeof";return fn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},fn(e)}function oi(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);t&&(o=o.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,o)}return n}function ri(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?oi(Object(n),!0).forEach(function(o){Wm(e,o,n[o])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):oi(Object(n)).forEach(function(o){Object.defineProperty(e,o,Object.getOwnPropertyDescriptor(n,o))})}return e}function Wm(e,t,n){return(t=Zm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Zm(e){var t=qm(e,"string");return fn(t)=="symbol"?t:t+""}function qm(e,t){if(fn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(fn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Ym=["aria-haspopup","aria-expanded","aria-controls","aria-label"];function Jm(e,t,n,o,i,r){var a=T("BarsIcon"),l=T("MenubarSub");return c(),b("div",f({ref:r.containerRef,class:e.cx("root")},e.ptmi("root")),[e.$slots.start?(c(),b("div",f({key:0,class:e.cx("start")},e.ptm("start")),[k(e.$slots,"start")],16)):C("",!0),k(e.$slots,e.$slots.button?"button":"menubutton",{id:e.$id,class:j(e.cx("button")),toggleCallback:function(u){return r.menuButtonClick(u)}},function(){var s;return[e.model&&e.model.length>0?(c(),b("a",f({key:0,ref:"menubutton",role:"button",tabindex:"0",class:e.cx("button"),"aria-haspopup":!!(e.model.length&&e.model.length>0),"aria-expanded":i.mobileActive,"aria-controls":e.$id,"aria-label":(s=e.$primevue.config.locale.aria)===null||s===void 0?void 0:s.navigation,onClick:t[0]||(t[0]=function(u){return r.menuButtonClick(u)}),onKeydown:t[1]||(t[1]=function(u){return r.menuButtonKeydown(u)})},ri(ri({},e.buttonProps),e.ptm("button"))),[k(e.$slots,e.$slots.buttonicon?"buttonicon":"menubuttonicon",{},function(){return[ne(a,mt(_a(e.ptm("buttonicon"))),null,16)]})],16,Ym)):C("",!0)]}),ne(l,{ref:r.menubarRef,id:e.$id+"_list",role:"menubar",items:r.processedItems,templates:e.$slots,root:!0,mobileActive:i.mobileActive,tabindex:"0","aria-activedescendant":i.focused?r.focusedItemId:void 0,menuId:e.$id,focusedItemId:i.focused?r.focusedItemId:void 0,activeItemPath:i.activeItemPath,level:0,"aria-labelledby":e.ariaLabelledby,"aria-label":e.ariaLabel,pt:e.pt,unstyled:e.unstyled,onFocus:r.onFocus,onBlur:r.onBlur,onKeydown:r.onKeyDown,onItemClick:r.onItemClick,onItemMouseenter:r.onItemMouseEnter,onItemMousemove:r.onItemMouseMove},null,8,["id","items","templates","mobileActive","aria-activedescendant","menuId","focusedItemId","activeItemPath","aria-labelledby","aria-label","pt","unstyled","onFocus","onBlur","onKeydown","onItemClick","onItemMouseenter","onItemMousemove"]),e.$slots.end?(c(),b("div",f({key:1,class:e.cx("end")},e.ptm("end")),[k(e.$slots,"end")],16)):C("",!0)],16)}_m.render=Jm;var Xm=({dt:e})=>`
-.p-tag {
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    background: ${e("tag.primary.background")};
-    color: ${e("tag.primary.color")};
-    font-size: ${e("tag.font.size")};
-    font-weight: ${e("tag.font.weight")};
-    padding: ${e("tag.padding")};
-    border-radius: ${e("tag.border.radius")};
-    gap: ${e("tag.gap")};
-}
-
-.p-tag-icon {
-    font-size: ${e("tag.icon.size")};
-    width: ${e("tag.icon.size")};
-    height:${e("tag.icon.size")};
-}
-
-.p-tag-rounded {
-    border-radius: ${e("tag.rounded.border.radius")};
-}
-
-.p-tag-success {
-    background: ${e("tag.success.background")};
-    color: ${e("tag.success.color")};
-}
-
-.p-tag-info {
-    background: ${e("tag.info.background")};
-    color: ${e("tag.info.color")};
-}
-
-.p-tag-warn {
-    background: ${e("tag.warn.background")};
-    color: ${e("tag.warn.color")};
-}
-
-.p-tag-danger {
-    background: ${e("tag.danger.background")};
-    color: ${e("tag.danger.color")};
-}
-
-.p-tag-secondary {
-    background: ${e("tag.secondary.background")};
-    color: ${e("tag.secondary.color")};
-}
-
-.p-tag-contrast {
-    background: ${e("tag.contrast.background")};
-    color: ${e("tag.contrast.color")};
-}
-`,Qm={root:function(t){var n=t.props;return["p-tag p-component",{"p-tag-info":n.severity==="info","p-tag-success":n.severity==="success","p-tag-warn":n.severity==="warn","p-tag-danger":n.severity==="danger","p-tag-secondary":n.severity==="secondary","p-tag-contrast":n.severity==="contrast","p-tag-rounded":n.rounded}]},icon:"p-tag-icon",label:"p-tag-label"},eb=N.extend({name:"tag",style:Xm,classes:Qm}),tb={name:"BaseTag",extends:U,props:{value:null,severity:null,rounded:Boolean,icon:String},style:eb,provide:function(){return{$pcTag:this,$parentInstance:this}}};function hn(e){"@babel/helpers - typeof";return hn=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},hn(e)}function nb(e,t,n){return(t=ob(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ob(e){var t=rb(e,"string");return hn(t)=="symbol"?t:t+""}function rb(e,t){if(hn(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var o=n.call(e,t);if(hn(o)!="object")return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var ib={name:"Tag",extends:tb,inheritAttrs:!1,computed:{dataP:function(){return re(nb({rounded:this.rounded},this.severity,this.severity))}}},ab=["data-p"];function lb(e,t,n,o,i,r){return c(),b("span",f({class:e.cx("root"),"data-p":r.dataP},e.ptmi("root")),[e.$slots.icon?(c(),y(M(e.$slots.icon),f({key:0,class:e.cx("icon")},e.ptm("icon")),null,16,["class"])):e.icon?(c(),b("span",f({key:1,class:[e.cx("icon"),e.icon]},e.ptm("icon")),null,16)):C("",!0),e.value!=null||e.$slots.default?k(e.$slots,"default",{key:2},function(){return[R("span",f({class:e.cx("label")},e.ptm("label")),Y(e.value),17)]}):C("",!0)],16,ab)}ib.render=lb;var sb=({dt:e})=>`
-.p-iftalabel {
-    display: block;
-    position: relative;
-}
-
-.p-iftalabel label {
-    position: absolute;
-    pointer-events: none;
-    top: ${e("iftalabel.top")};
-    transition-property: all;
-    transition-timing-function: ease;
-    line-height: 1;
-    font-size: ${e("iftalabel.font.size")};
-    font-weight: ${e("iftalabel.font.weight")};
-    inset-inline-start: ${e("iftalabel.position.x")};
-    color: ${e("iftalabel.color")};
-    transition-duration: ${e("iftalabel.transition.duration")};
-}
-
-.p-iftalabel .p-inputtext,
-.p-iftalabel .p-textarea,
-.p-iftalabel .p-select-label,
-.p-iftalabel .p-multiselect-label,
-.p-iftalabel .p-autocomplete-input-multiple,
-.p-iftalabel .p-cascadeselect-label,
-.p-iftalabel .p-treeselect-label {
-    padding-block-start: ${e("iftalabel.input.padding.top")};
-    padding-block-end: ${e("iftalabel.input.padding.bottom")};
-}
-
-.p-iftalabel:has(.p-invalid) label {
-    color: ${e("iftalabel.invalid.color")};
-}
-
-.p-iftalabel:has(input:focus) label,
-.p-iftalabel:has(input:-webkit-autofill) label,
-.p-iftalabel:has(textarea:focus) label,
-.p-iftalabel:has(.p-inputwrapper-focus) label {
-    color: ${e("iftalabel.focus.color")};
-}
-
-.p-iftalabel .p-inputicon {
-    top: ${e("iftalabel.input.padding.top")};
-    transform: translateY(25%);
-    margin-top: 0;
-}
-`,ub={root:"p-iftalabel"},db=N.extend({name:"iftalabel",style:sb,classes:ub}),cb={name:"BaseIftaLabel",extends:U,style:db,provide:function(){return{$pcIftaLabel:this,$parentInstance:this}}},pb={name:"IftaLabel",extends:cb,inheritAttrs:!1};function fb(e,t,n,o,i,r){return c(),b("span",f({class:e.cx("root")},e.ptmi("root")),[k(e.$slots,"default")],16)}pb.render=fb;export{Cb as C,vb as P,wb as T,Ru as a,Od as b,bb as c,yb as d,Lh as e,Hn as f,lm as g,va as h,yu as i,vm as j,mb as k,Ki as l,Fo as m,Em as n,_m as o,ib as p,pb as q,gn as s,gb as u};
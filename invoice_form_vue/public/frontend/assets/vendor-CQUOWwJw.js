@@ -1,21 +0,0 @@
-/**
-* @vue/shared v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**//*! #__NO_SIDE_EFFECTS__ */function Cs(e){const t=Object.create(null);for(const n of e.split(","))t[n]=1;return n=>n in t}const se={},At=[],qe=()=>{},Do=()=>!1,Pn=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&(e.charCodeAt(2)>122||e.charCodeAt(2)<97),ws=e=>e.startsWith("onUpdate:"),ue=Object.assign,Rs=(e,t)=>{const n=e.indexOf(t);n>-1&&e.splice(n,1)},Ho=Object.prototype.hasOwnProperty,X=(e,t)=>Ho.call(e,t),j=Array.isArray,Pt=e=>On(e)==="[object Map]",Yr=e=>On(e)==="[object Set]",V=e=>typeof e=="function",ce=e=>typeof e=="string",et=e=>typeof e=="symbol",oe=e=>e!==null&&typeof e=="object",Jr=e=>(oe(e)||V(e))&&V(e.then)&&V(e.catch),Xr=Object.prototype.toString,On=e=>Xr.call(e),jo=e=>On(e).slice(8,-1),Zr=e=>On(e)==="[object Object]",Ts=e=>ce(e)&&e!=="NaN"&&e[0]!=="-"&&""+parseInt(e,10)===e,Kt=Cs(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),Mn=e=>{const t=Object.create(null);return n=>t[n]||(t[n]=e(n))},Bo=/-(\w)/g,Ne=Mn(e=>e.replace(Bo,(t,n)=>n?n.toUpperCase():"")),ko=/\B([A-Z])/g,dt=Mn(e=>e.replace(ko,"-$1").toLowerCase()),In=Mn(e=>e.charAt(0).toUpperCase()+e.slice(1)),gn=Mn(e=>e?`on${In(e)}`:""),ut=(e,t)=>!Object.is(e,t),Gn=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},ei=(e,t,n,s=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:s,value:n})},Vo=e=>{const t=parseFloat(e);return isNaN(t)?e:t},Ko=e=>{const t=ce(e)?Number(e):NaN;return isNaN(t)?e:t};let Qs;const Ln=()=>Qs||(Qs=typeof globalThis!="undefined"?globalThis:typeof self!="undefined"?self:typeof window!="undefined"?window:typeof global!="undefined"?global:{});function Nn(e){if(j(e)){const t={};for(let n=0;n<e.length;n++){const s=e[n],r=ce(s)?qo(s):Nn(s);if(r)for(const i in r)t[i]=r[i]}return t}else if(ce(e)||oe(e))return e}const Uo=/;(?![^(]*\))/g,Wo=/:([^]+)/,Go=/\/\*[^]*?\*\//g;function qo(e){const t={};return e.replace(Go,"").split(Uo).forEach(n=>{if(n){const s=n.split(Wo);s.length>1&&(t[s[0].trim()]=s[1].trim())}}),t}function Fn(e){let t="";if(ce(e))t=e;else if(j(e))for(let n=0;n<e.length;n++){const s=Fn(e[n]);s&&(t+=s+" ")}else if(oe(e))for(const n in e)e[n]&&(t+=n+" ");return t.trim()}function du(e){if(!e)return null;let{class:t,style:n}=e;return t&&!ce(t)&&(e.class=Fn(t)),n&&(e.style=Nn(n)),e}const zo="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",Qo=Cs(zo);function ti(e){return!!e||e===""}const ni=e=>!!(e&&e.__v_isRef===!0),Yo=e=>ce(e)?e:e==null?"":j(e)||oe(e)&&(e.toString===Xr||!V(e.toString))?ni(e)?Yo(e.value):JSON.stringify(e,si,2):String(e),si=(e,t)=>ni(t)?si(e,t.value):Pt(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((n,[s,r],i)=>(n[qn(s,i)+" =>"]=r,n),{})}:Yr(t)?{[`Set(${t.size})`]:[...t.values()].map(n=>qn(n))}:et(t)?qn(t):oe(t)&&!j(t)&&!Zr(t)?String(t):t,qn=(e,t="")=>{var n;return et(e)?`Symbol(${(n=e.description)!=null?n:t})`:e};/**
-* @vue/reactivity v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**/let Ae;class ri{constructor(t=!1){this.detached=t,this._active=!0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=Ae,!t&&Ae&&(this.index=(Ae.scopes||(Ae.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].pause();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].resume();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].resume()}}run(t){if(this._active){const n=Ae;try{return Ae=this,t()}finally{Ae=n}}}on(){Ae=this}off(){Ae=this.parent}stop(t){if(this._active){this._active=!1;let n,s;for(n=0,s=this.effects.length;n<s;n++)this.effects[n].stop();for(this.effects.length=0,n=0,s=this.cleanups.length;n<s;n++)this.cleanups[n]();if(this.cleanups.length=0,this.scopes){for(n=0,s=this.scopes.length;n<s;n++)this.scopes[n].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!t){const r=this.parent.scopes.pop();r&&r!==this&&(this.parent.scopes[this.index]=r,r.index=this.index)}this.parent=void 0}}}function hu(e){return new ri(e)}function Jo(){return Ae}let ie;const zn=new WeakSet;class ii{constructor(t){this.fn=t,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,Ae&&Ae.active&&Ae.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,zn.has(this)&&(zn.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||li(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,Ys(this),ci(this);const t=ie,n=$e;ie=this,$e=!0;try{return this.fn()}finally{fi(this),ie=t,$e=n,this.flags&=-3}}stop(){if(this.flags&1){for(let t=this.deps;t;t=t.nextDep)Os(t);this.deps=this.depsTail=void 0,Ys(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?zn.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){os(this)&&this.run()}get dirty(){return os(this)}}let oi=0,Ut,Wt;function li(e,t=!1){if(e.flags|=8,t){e.next=Wt,Wt=e;return}e.next=Ut,Ut=e}function As(){oi++}function Ps(){if(--oi>0)return;if(Wt){let t=Wt;for(Wt=void 0;t;){const n=t.next;t.next=void 0,t.flags&=-9,t=n}}let e;for(;Ut;){let t=Ut;for(Ut=void 0;t;){const n=t.next;if(t.next=void 0,t.flags&=-9,t.flags&1)try{t.trigger()}catch(s){e||(e=s)}t=n}}if(e)throw e}function ci(e){for(let t=e.deps;t;t=t.nextDep)t.version=-1,t.prevActiveLink=t.dep.activeLink,t.dep.activeLink=t}function fi(e){let t,n=e.depsTail,s=n;for(;s;){const r=s.prevDep;s.version===-1?(s===n&&(n=r),Os(s),Xo(s)):t=s,s.dep.activeLink=s.prevActiveLink,s.prevActiveLink=void 0,s=r}e.deps=t,e.depsTail=n}function os(e){for(let t=e.deps;t;t=t.nextDep)if(t.dep.version!==t.version||t.dep.computed&&(ui(t.dep.computed)||t.dep.version!==t.version))return!0;return!!e._dirty}function ui(e){if(e.flags&4&&!(e.flags&16)||(e.flags&=-17,e.globalVersion===Jt))return;e.globalVersion=Jt;const t=e.dep;if(e.flags|=2,t.version>0&&!e.isSSR&&e.deps&&!os(e)){e.flags&=-3;return}const n=ie,s=$e;ie=e,$e=!0;try{ci(e);const r=e.fn(e._value);(t.version===0||ut(r,e._value))&&(e._value=r,t.version++)}catch(r){throw t.version++,r}finally{ie=n,$e=s,fi(e),e.flags&=-3}}function Os(e,t=!1){const{dep:n,prevSub:s,nextSub:r}=e;if(s&&(s.nextSub=r,e.prevSub=void 0),r&&(r.prevSub=s,e.nextSub=void 0),n.subs===e&&(n.subs=s,!s&&n.computed)){n.computed.flags&=-5;for(let i=n.computed.deps;i;i=i.nextDep)Os(i,!0)}!t&&!--n.sc&&n.map&&n.map.delete(n.key)}function Xo(e){const{prevDep:t,nextDep:n}=e;t&&(t.nextDep=n,e.prevDep=void 0),n&&(n.prevDep=t,e.nextDep=void 0)}let $e=!0;const ai=[];function ht(){ai.push($e),$e=!1}function pt(){const e=ai.pop();$e=e===void 0?!0:e}function Ys(e){const{cleanup:t}=e;if(e.cleanup=void 0,t){const n=ie;ie=void 0;try{t()}finally{ie=n}}}let Jt=0;class Zo{constructor(t,n){this.sub=t,this.dep=n,this.version=n.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class Ms{constructor(t){this.computed=t,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0}track(t){if(!ie||!$e||ie===this.computed)return;let n=this.activeLink;if(n===void 0||n.sub!==ie)n=this.activeLink=new Zo(ie,this),ie.deps?(n.prevDep=ie.depsTail,ie.depsTail.nextDep=n,ie.depsTail=n):ie.deps=ie.depsTail=n,di(n);else if(n.version===-1&&(n.version=this.version,n.nextDep)){const s=n.nextDep;s.prevDep=n.prevDep,n.prevDep&&(n.prevDep.nextDep=s),n.prevDep=ie.depsTail,n.nextDep=void 0,ie.depsTail.nextDep=n,ie.depsTail=n,ie.deps===n&&(ie.deps=s)}return n}trigger(t){this.version++,Jt++,this.notify(t)}notify(t){As();try{for(let n=this.subs;n;n=n.prevSub)n.sub.notify()&&n.sub.dep.notify()}finally{Ps()}}}function di(e){if(e.dep.sc++,e.sub.flags&4){const t=e.dep.computed;if(t&&!e.dep.subs){t.flags|=20;for(let s=t.deps;s;s=s.nextDep)di(s)}const n=e.dep.subs;n!==e&&(e.prevSub=n,n&&(n.nextSub=e)),e.dep.subs=e}}const ls=new WeakMap,bt=Symbol(""),cs=Symbol(""),Xt=Symbol("");function pe(e,t,n){if($e&&ie){let s=ls.get(e);s||ls.set(e,s=new Map);let r=s.get(n);r||(s.set(n,r=new Ms),r.map=s,r.key=n),r.track()}}function Xe(e,t,n,s,r,i){const o=ls.get(e);if(!o){Jt++;return}const l=c=>{c&&c.trigger()};if(As(),t==="clear")o.forEach(l);else{const c=j(e),u=c&&Ts(n);if(c&&n==="length"){const f=Number(s);o.forEach((d,p)=>{(p==="length"||p===Xt||!et(p)&&p>=f)&&l(d)})}else switch((n!==void 0||o.has(void 0))&&l(o.get(n)),u&&l(o.get(Xt)),t){case"add":c?u&&l(o.get("length")):(l(o.get(bt)),Pt(e)&&l(o.get(cs)));break;case"delete":c||(l(o.get(bt)),Pt(e)&&l(o.get(cs)));break;case"set":Pt(e)&&l(o.get(bt));break}}Ps()}function wt(e){const t=z(e);return t===e?t:(pe(t,"iterate",Xt),Ie(e)?t:t.map(ge))}function $n(e){return pe(e=z(e),"iterate",Xt),e}const el={__proto__:null,[Symbol.iterator](){return Qn(this,Symbol.iterator,ge)},concat(...e){return wt(this).concat(...e.map(t=>j(t)?wt(t):t))},entries(){return Qn(this,"entries",e=>(e[1]=ge(e[1]),e))},every(e,t){return Qe(this,"every",e,t,void 0,arguments)},filter(e,t){return Qe(this,"filter",e,t,n=>n.map(ge),arguments)},find(e,t){return Qe(this,"find",e,t,ge,arguments)},findIndex(e,t){return Qe(this,"findIndex",e,t,void 0,arguments)},findLast(e,t){return Qe(this,"findLast",e,t,ge,arguments)},findLastIndex(e,t){return Qe(this,"findLastIndex",e,t,void 0,arguments)},forEach(e,t){return Qe(this,"forEach",e,t,void 0,arguments)},includes(...e){return Yn(this,"includes",e)},indexOf(...e){return Yn(this,"indexOf",e)},join(e){return wt(this).join(e)},lastIndexOf(...e){return Yn(this,"lastIndexOf",e)},map(e,t){return Qe(this,"map",e,t,void 0,arguments)},pop(){return jt(this,"pop")},push(...e){return jt(this,"push",e)},reduce(e,...t){return Js(this,"reduce",e,t)},reduceRight(e,...t){return Js(this,"reduceRight",e,t)},shift(){return jt(this,"shift")},some(e,t){return Qe(this,"some",e,t,void 0,arguments)},splice(...e){return jt(this,"splice",e)},toReversed(){return wt(this).toReversed()},toSorted(e){return wt(this).toSorted(e)},toSpliced(...e){return wt(this).toSpliced(...e)},unshift(...e){return jt(this,"unshift",e)},values(){return Qn(this,"values",ge)}};function Qn(e,t,n){const s=$n(e),r=s[t]();return s!==e&&!Ie(e)&&(r._next=r.next,r.next=()=>{const i=r._next();return i.value&&(i.value=n(i.value)),i}),r}const tl=Array.prototype;function Qe(e,t,n,s,r,i){const o=$n(e),l=o!==e&&!Ie(e),c=o[t];if(c!==tl[t]){const d=c.apply(e,i);return l?ge(d):d}let u=n;o!==e&&(l?u=function(d,p){return n.call(this,ge(d),p,e)}:n.length>2&&(u=function(d,p){return n.call(this,d,p,e)}));const f=c.call(o,u,s);return l&&r?r(f):f}function Js(e,t,n,s){const r=$n(e);let i=n;return r!==e&&(Ie(e)?n.length>3&&(i=function(o,l,c){return n.call(this,o,l,c,e)}):i=function(o,l,c){return n.call(this,o,ge(l),c,e)}),r[t](i,...s)}function Yn(e,t,n){const s=z(e);pe(s,"iterate",Xt);const r=s[t](...n);return(r===-1||r===!1)&&Ns(n[0])?(n[0]=z(n[0]),s[t](...n)):r}function jt(e,t,n=[]){ht(),As();const s=z(e)[t].apply(e,n);return Ps(),pt(),s}const nl=Cs("__proto__,__v_isRef,__isVue"),hi=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>e!=="arguments"&&e!=="caller").map(e=>Symbol[e]).filter(et));function sl(e){et(e)||(e=String(e));const t=z(this);return pe(t,"has",e),t.hasOwnProperty(e)}class pi{constructor(t=!1,n=!1){this._isReadonly=t,this._isShallow=n}get(t,n,s){if(n==="__v_skip")return t.__v_skip;const r=this._isReadonly,i=this._isShallow;if(n==="__v_isReactive")return!r;if(n==="__v_isReadonly")return r;if(n==="__v_isShallow")return i;if(n==="__v_raw")return s===(r?i?hl:vi:i?yi:mi).get(t)||Object.getPrototypeOf(t)===Object.getPrototypeOf(s)?t:void 0;const o=j(t);if(!r){let c;if(o&&(c=el[n]))return c;if(n==="hasOwnProperty")return sl}const l=Reflect.get(t,n,ye(t)?t:s);return(et(n)?hi.has(n):nl(n))||(r||pe(t,"get",n),i)?l:ye(l)?o&&Ts(n)?l:l.value:oe(l)?r?bi(l):Dn(l):l}}class gi extends pi{constructor(t=!1){super(!1,t)}set(t,n,s,r){let i=t[n];if(!this._isShallow){const c=Et(i);if(!Ie(s)&&!Et(s)&&(i=z(i),s=z(s)),!j(t)&&ye(i)&&!ye(s))return c?!1:(i.value=s,!0)}const o=j(t)&&Ts(n)?Number(n)<t.length:X(t,n),l=Reflect.set(t,n,s,ye(t)?t:r);return t===z(r)&&(o?ut(s,i)&&Xe(t,"set",n,s):Xe(t,"add",n,s)),l}deleteProperty(t,n){const s=X(t,n);t[n];const r=Reflect.deleteProperty(t,n);return r&&s&&Xe(t,"delete",n,void 0),r}has(t,n){const s=Reflect.has(t,n);return(!et(n)||!hi.has(n))&&pe(t,"has",n),s}ownKeys(t){return pe(t,"iterate",j(t)?"length":bt),Reflect.ownKeys(t)}}class rl extends pi{constructor(t=!1){super(!0,t)}set(t,n){return!0}deleteProperty(t,n){return!0}}const il=new gi,ol=new rl,ll=new gi(!0);const fs=e=>e,un=e=>Reflect.getPrototypeOf(e);function cl(e,t,n){return function(...s){const r=this.__v_raw,i=z(r),o=Pt(i),l=e==="entries"||e===Symbol.iterator&&o,c=e==="keys"&&o,u=r[e](...s),f=n?fs:t?us:ge;return!t&&pe(i,"iterate",c?cs:bt),{next(){const{value:d,done:p}=u.next();return p?{value:d,done:p}:{value:l?[f(d[0]),f(d[1])]:f(d),done:p}},[Symbol.iterator](){return this}}}}function an(e){return function(...t){return e==="delete"?!1:e==="clear"?void 0:this}}function fl(e,t){const n={get(r){const i=this.__v_raw,o=z(i),l=z(r);e||(ut(r,l)&&pe(o,"get",r),pe(o,"get",l));const{has:c}=un(o),u=t?fs:e?us:ge;if(c.call(o,r))return u(i.get(r));if(c.call(o,l))return u(i.get(l));i!==o&&i.get(r)},get size(){const r=this.__v_raw;return!e&&pe(z(r),"iterate",bt),Reflect.get(r,"size",r)},has(r){const i=this.__v_raw,o=z(i),l=z(r);return e||(ut(r,l)&&pe(o,"has",r),pe(o,"has",l)),r===l?i.has(r):i.has(r)||i.has(l)},forEach(r,i){const o=this,l=o.__v_raw,c=z(l),u=t?fs:e?us:ge;return!e&&pe(c,"iterate",bt),l.forEach((f,d)=>r.call(i,u(f),u(d),o))}};return ue(n,e?{add:an("add"),set:an("set"),delete:an("delete"),clear:an("clear")}:{add(r){!t&&!Ie(r)&&!Et(r)&&(r=z(r));const i=z(this);return un(i).has.call(i,r)||(i.add(r),Xe(i,"add",r,r)),this},set(r,i){!t&&!Ie(i)&&!Et(i)&&(i=z(i));const o=z(this),{has:l,get:c}=un(o);let u=l.call(o,r);u||(r=z(r),u=l.call(o,r));const f=c.call(o,r);return o.set(r,i),u?ut(i,f)&&Xe(o,"set",r,i):Xe(o,"add",r,i),this},delete(r){const i=z(this),{has:o,get:l}=un(i);let c=o.call(i,r);c||(r=z(r),c=o.call(i,r)),l&&l.call(i,r);const u=i.delete(r);return c&&Xe(i,"delete",r,void 0),u},clear(){const r=z(this),i=r.size!==0,o=r.clear();return i&&Xe(r,"clear",void 0,void 0),o}}),["keys","values","entries",Symbol.iterator].forEach(r=>{n[r]=cl(r,e,t)}),n}function Is(e,t){const n=fl(e,t);return(s,r,i)=>r==="__v_isReactive"?!e:r==="__v_isReadonly"?e:r==="__v_raw"?s:Reflect.get(X(n,r)&&r in s?n:s,r,i)}const ul={get:Is(!1,!1)},al={get:Is(!1,!0)},dl={get:Is(!0,!1)};const mi=new WeakMap,yi=new WeakMap,vi=new WeakMap,hl=new WeakMap;function pl(e){switch(e){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function gl(e){return e.__v_skip||!Object.isExtensible(e)?0:pl(jo(e))}function Dn(e){return Et(e)?e:Ls(e,!1,il,ul,mi)}function _i(e){return Ls(e,!1,ll,al,yi)}function bi(e){return Ls(e,!0,ol,dl,vi)}function Ls(e,t,n,s,r){if(!oe(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;const i=r.get(e);if(i)return i;const o=gl(e);if(o===0)return e;const l=new Proxy(e,o===2?s:n);return r.set(e,l),l}function Ot(e){return Et(e)?Ot(e.__v_raw):!!(e&&e.__v_isReactive)}function Et(e){return!!(e&&e.__v_isReadonly)}function Ie(e){return!!(e&&e.__v_isShallow)}function Ns(e){return e?!!e.__v_raw:!1}function z(e){const t=e&&e.__v_raw;return t?z(t):e}function ml(e){return!X(e,"__v_skip")&&Object.isExtensible(e)&&ei(e,"__v_skip",!0),e}const ge=e=>oe(e)?Dn(e):e,us=e=>oe(e)?bi(e):e;function ye(e){return e?e.__v_isRef===!0:!1}function yl(e){return Ei(e,!1)}function vl(e){return Ei(e,!0)}function Ei(e,t){return ye(e)?e:new _l(e,t)}class _l{constructor(t,n){this.dep=new Ms,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=n?t:z(t),this._value=n?t:ge(t),this.__v_isShallow=n}get value(){return this.dep.track(),this._value}set value(t){const n=this._rawValue,s=this.__v_isShallow||Ie(t)||Et(t);t=s?t:z(t),ut(t,n)&&(this._rawValue=t,this._value=s?t:ge(t),this.dep.trigger())}}function Mt(e){return ye(e)?e.value:e}const bl={get:(e,t,n)=>t==="__v_raw"?e:Mt(Reflect.get(e,t,n)),set:(e,t,n,s)=>{const r=e[t];return ye(r)&&!ye(n)?(r.value=n,!0):Reflect.set(e,t,n,s)}};function Si(e){return Ot(e)?e:new Proxy(e,bl)}class El{constructor(t,n,s){this.fn=t,this.setter=n,this._value=void 0,this.dep=new Ms(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=Jt-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!n,this.isSSR=s}notify(){if(this.flags|=16,!(this.flags&8)&&ie!==this)return li(this,!0),!0}get value(){const t=this.dep.track();return ui(this),t&&(t.version=this.dep.version),this._value}set value(t){this.setter&&this.setter(t)}}function Sl(e,t,n=!1){let s,r;return V(e)?s=e:(s=e.get,r=e.set),new El(s,r,n)}const dn={},Sn=new WeakMap;let vt;function xl(e,t=!1,n=vt){if(n){let s=Sn.get(n);s||Sn.set(n,s=[]),s.push(e)}}function Cl(e,t,n=se){const{immediate:s,deep:r,once:i,scheduler:o,augmentJob:l,call:c}=n,u=O=>r?O:Ie(O)||r===!1||r===0?Ze(O,1):Ze(O);let f,d,p,m,S=!1,x=!1;if(ye(e)?(d=()=>e.value,S=Ie(e)):Ot(e)?(d=()=>u(e),S=!0):j(e)?(x=!0,S=e.some(O=>Ot(O)||Ie(O)),d=()=>e.map(O=>{if(ye(O))return O.value;if(Ot(O))return u(O);if(V(O))return c?c(O,2):O()})):V(e)?t?d=c?()=>c(e,2):e:d=()=>{if(p){ht();try{p()}finally{pt()}}const O=vt;vt=f;try{return c?c(e,3,[m]):e(m)}finally{vt=O}}:d=qe,t&&r){const O=d,K=r===!0?1/0:r;d=()=>Ze(O(),K)}const B=Jo(),L=()=>{f.stop(),B&&B.active&&Rs(B.effects,f)};if(i&&t){const O=t;t=(...K)=>{O(...K),L()}}let M=x?new Array(e.length).fill(dn):dn;const N=O=>{if(!(!(f.flags&1)||!f.dirty&&!O))if(t){const K=f.run();if(r||S||(x?K.some((W,G)=>ut(W,M[G])):ut(K,M))){p&&p();const W=vt;vt=f;try{const G=[K,M===dn?void 0:x&&M[0]===dn?[]:M,m];c?c(t,3,G):t(...G),M=K}finally{vt=W}}}else f.run()};return l&&l(N),f=new ii(d),f.scheduler=o?()=>o(N,!1):N,m=O=>xl(O,!1,f),p=f.onStop=()=>{const O=Sn.get(f);if(O){if(c)c(O,4);else for(const K of O)K();Sn.delete(f)}},t?s?N(!0):M=f.run():o?o(N.bind(null,!0),!0):f.run(),L.pause=f.pause.bind(f),L.resume=f.resume.bind(f),L.stop=L,L}function Ze(e,t=1/0,n){if(t<=0||!oe(e)||e.__v_skip||(n=n||new Set,n.has(e)))return e;if(n.add(e),t--,ye(e))Ze(e.value,t,n);else if(j(e))for(let s=0;s<e.length;s++)Ze(e[s],t,n);else if(Yr(e)||Pt(e))e.forEach(s=>{Ze(s,t,n)});else if(Zr(e)){for(const s in e)Ze(e[s],t,n);for(const s of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,s)&&Ze(e[s],t,n)}return e}/**
-* @vue/runtime-core v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**/function ln(e,t,n,s){try{return s?e(...s):e()}catch(r){Hn(r,t,n)}}function De(e,t,n,s){if(V(e)){const r=ln(e,t,n,s);return r&&Jr(r)&&r.catch(i=>{Hn(i,t,n)}),r}if(j(e)){const r=[];for(let i=0;i<e.length;i++)r.push(De(e[i],t,n,s));return r}}function Hn(e,t,n,s=!0){const r=t?t.vnode:null,{errorHandler:i,throwUnhandledErrorInProduction:o}=t&&t.appContext.config||se;if(t){let l=t.parent;const c=t.proxy,u=`https://vuejs.org/error-reference/#runtime-${n}`;for(;l;){const f=l.ec;if(f){for(let d=0;d<f.length;d++)if(f[d](e,c,u)===!1)return}l=l.parent}if(i){ht(),ln(i,null,10,[e,c,u]),pt();return}}wl(e,n,r,s,o)}function wl(e,t,n,s=!0,r=!1){if(r)throw e;console.error(e)}const be=[];let We=-1;const It=[];let ot=null,Rt=0;const xi=Promise.resolve();let xn=null;function Ci(e){const t=xn||xi;return e?t.then(this?e.bind(this):e):t}function Rl(e){let t=We+1,n=be.length;for(;t<n;){const s=t+n>>>1,r=be[s],i=Zt(r);i<e||i===e&&r.flags&2?t=s+1:n=s}return t}function Fs(e){if(!(e.flags&1)){const t=Zt(e),n=be[be.length-1];!n||!(e.flags&2)&&t>=Zt(n)?be.push(e):be.splice(Rl(t),0,e),e.flags|=1,wi()}}function wi(){xn||(xn=xi.then(Ti))}function Tl(e){j(e)?It.push(...e):ot&&e.id===-1?ot.splice(Rt+1,0,e):e.flags&1||(It.push(e),e.flags|=1),wi()}function Xs(e,t,n=We+1){for(;n<be.length;n++){const s=be[n];if(s&&s.flags&2){if(e&&s.id!==e.uid)continue;be.splice(n,1),n--,s.flags&4&&(s.flags&=-2),s(),s.flags&4||(s.flags&=-2)}}}function Ri(e){if(It.length){const t=[...new Set(It)].sort((n,s)=>Zt(n)-Zt(s));if(It.length=0,ot){ot.push(...t);return}for(ot=t,Rt=0;Rt<ot.length;Rt++){const n=ot[Rt];n.flags&4&&(n.flags&=-2),n.flags&8||n(),n.flags&=-2}ot=null,Rt=0}}const Zt=e=>e.id==null?e.flags&2?-1:1/0:e.id;function Ti(e){try{for(We=0;We<be.length;We++){const t=be[We];t&&!(t.flags&8)&&(t.flags&4&&(t.flags&=-2),ln(t,t.i,t.i?15:14),t.flags&4||(t.flags&=-2))}}finally{for(;We<be.length;We++){const t=be[We];t&&(t.flags&=-2)}We=-1,be.length=0,Ri(),xn=null,(be.length||It.length)&&Ti()}}let de=null,Ai=null;function Cn(e){const t=de;return de=e,Ai=e&&e.type.__scopeId||null,t}function Al(e,t=de,n){if(!t||e._n)return e;const s=(...r)=>{s._d&&dr(-1);const i=Cn(t);let o;try{o=e(...r)}finally{Cn(i),s._d&&dr(1)}return o};return s._n=!0,s._c=!0,s._d=!0,s}function pu(e,t){if(de===null)return e;const n=Kn(de),s=e.dirs||(e.dirs=[]);for(let r=0;r<t.length;r++){let[i,o,l,c=se]=t[r];i&&(V(i)&&(i={mounted:i,updated:i}),i.deep&&Ze(o),s.push({dir:i,instance:n,value:o,oldValue:void 0,arg:l,modifiers:c}))}return e}function gt(e,t,n,s){const r=e.dirs,i=t&&t.dirs;for(let o=0;o<r.length;o++){const l=r[o];i&&(l.oldValue=i[o].value);let c=l.dir[s];c&&(ht(),De(c,n,8,[e.el,l,e,t]),pt())}}const Pi=Symbol("_vte"),Oi=e=>e.__isTeleport,Gt=e=>e&&(e.disabled||e.disabled===""),Zs=e=>e&&(e.defer||e.defer===""),er=e=>typeof SVGElement!="undefined"&&e instanceof SVGElement,tr=e=>typeof MathMLElement=="function"&&e instanceof MathMLElement,as=(e,t)=>{const n=e&&e.to;return ce(n)?t?t(n):null:n},Mi={name:"Teleport",__isTeleport:!0,process(e,t,n,s,r,i,o,l,c,u){const{mc:f,pc:d,pbc:p,o:{insert:m,querySelector:S,createText:x,createComment:B}}=u,L=Gt(t.props);let{shapeFlag:M,children:N,dynamicChildren:O}=t;if(e==null){const K=t.el=x(""),W=t.anchor=x("");m(K,n,s),m(W,n,s);const G=($,U)=>{M&16&&(r&&r.isCE&&(r.ce._teleportTarget=$),f(N,$,U,r,i,o,l,c))},le=()=>{const $=t.target=as(t.props,S),U=Ii($,t,x,m);$&&(o!=="svg"&&er($)?o="svg":o!=="mathml"&&tr($)&&(o="mathml"),L||(G($,U),mn(t,!1)))};L&&(G(n,W),mn(t,!0)),Zs(t.props)?_e(()=>{le(),t.el.__isMounted=!0},i):le()}else{if(Zs(t.props)&&!e.el.__isMounted){_e(()=>{Mi.process(e,t,n,s,r,i,o,l,c,u),delete e.el.__isMounted},i);return}t.el=e.el,t.targetStart=e.targetStart;const K=t.anchor=e.anchor,W=t.target=e.target,G=t.targetAnchor=e.targetAnchor,le=Gt(e.props),$=le?n:W,U=le?K:G;if(o==="svg"||er(W)?o="svg":(o==="mathml"||tr(W))&&(o="mathml"),O?(p(e.dynamicChildren,O,$,r,i,o,l),ks(e,t,!0)):c||d(e,t,$,U,r,i,o,l,!1),L)le?t.props&&e.props&&t.props.to!==e.props.to&&(t.props.to=e.props.to):hn(t,n,K,u,1);else if((t.props&&t.props.to)!==(e.props&&e.props.to)){const Z=t.target=as(t.props,S);Z&&hn(t,Z,null,u,0)}else le&&hn(t,W,G,u,1);mn(t,L)}},remove(e,t,n,{um:s,o:{remove:r}},i){const{shapeFlag:o,children:l,anchor:c,targetStart:u,targetAnchor:f,target:d,props:p}=e;if(d&&(r(u),r(f)),i&&r(c),o&16){const m=i||!Gt(p);for(let S=0;S<l.length;S++){const x=l[S];s(x,t,n,m,!!x.dynamicChildren)}}},move:hn,hydrate:Pl};function hn(e,t,n,{o:{insert:s},m:r},i=2){i===0&&s(e.targetAnchor,t,n);const{el:o,anchor:l,shapeFlag:c,children:u,props:f}=e,d=i===2;if(d&&s(o,t,n),(!d||Gt(f))&&c&16)for(let p=0;p<u.length;p++)r(u[p],t,n,2);d&&s(l,t,n)}function Pl(e,t,n,s,r,i,{o:{nextSibling:o,parentNode:l,querySelector:c,insert:u,createText:f}},d){const p=t.target=as(t.props,c);if(p){const m=Gt(t.props),S=p._lpa||p.firstChild;if(t.shapeFlag&16)if(m)t.anchor=d(o(e),t,l(e),n,s,r,i),t.targetStart=S,t.targetAnchor=S&&o(S);else{t.anchor=o(e);let x=S;for(;x;){if(x&&x.nodeType===8){if(x.data==="teleport start anchor")t.targetStart=x;else if(x.data==="teleport anchor"){t.targetAnchor=x,p._lpa=t.targetAnchor&&o(t.targetAnchor);break}}x=o(x)}t.targetAnchor||Ii(p,t,f,u),d(S&&o(S),t,p,n,s,r,i)}mn(t,m)}return t.anchor&&o(t.anchor)}const gu=Mi;function mn(e,t){const n=e.ctx;if(n&&n.ut){let s,r;for(t?(s=e.el,r=e.anchor):(s=e.targetStart,r=e.targetAnchor);s&&s!==r;)s.nodeType===1&&s.setAttribute("data-v-owner",n.uid),s=s.nextSibling;n.ut()}}function Ii(e,t,n,s){const r=t.targetStart=n(""),i=t.targetAnchor=n("");return r[Pi]=i,e&&(s(r,e),s(i,e)),i}const lt=Symbol("_leaveCb"),pn=Symbol("_enterCb");function Li(){const e={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return Ki(()=>{e.isMounted=!0}),Wi(()=>{e.isUnmounting=!0}),e}const Me=[Function,Array],Ni={mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:Me,onEnter:Me,onAfterEnter:Me,onEnterCancelled:Me,onBeforeLeave:Me,onLeave:Me,onAfterLeave:Me,onLeaveCancelled:Me,onBeforeAppear:Me,onAppear:Me,onAfterAppear:Me,onAppearCancelled:Me},Fi=e=>{const t=e.subTree;return t.component?Fi(t.component):t},Ol={name:"BaseTransition",props:Ni,setup(e,{slots:t}){const n=Ks(),s=Li();return()=>{const r=t.default&&$s(t.default(),!0);if(!r||!r.length)return;const i=$i(r),o=z(e),{mode:l}=o;if(s.isLeaving)return Jn(i);const c=nr(i);if(!c)return Jn(i);let u=en(c,o,s,n,d=>u=d);c.type!==Ee&&St(c,u);let f=n.subTree&&nr(n.subTree);if(f&&f.type!==Ee&&!_t(c,f)&&Fi(n).type!==Ee){let d=en(f,o,s,n);if(St(f,d),l==="out-in"&&c.type!==Ee)return s.isLeaving=!0,d.afterLeave=()=>{s.isLeaving=!1,n.job.flags&8||n.update(),delete d.afterLeave,f=void 0},Jn(i);l==="in-out"&&c.type!==Ee?d.delayLeave=(p,m,S)=>{const x=Di(s,f);x[String(f.key)]=f,p[lt]=()=>{m(),p[lt]=void 0,delete u.delayedLeave,f=void 0},u.delayedLeave=()=>{S(),delete u.delayedLeave,f=void 0}}:f=void 0}else f&&(f=void 0);return i}}};function $i(e){let t=e[0];if(e.length>1){for(const n of e)if(n.type!==Ee){t=n;break}}return t}const Ml=Ol;function Di(e,t){const{leavingVNodes:n}=e;let s=n.get(t.type);return s||(s=Object.create(null),n.set(t.type,s)),s}function en(e,t,n,s,r){const{appear:i,mode:o,persisted:l=!1,onBeforeEnter:c,onEnter:u,onAfterEnter:f,onEnterCancelled:d,onBeforeLeave:p,onLeave:m,onAfterLeave:S,onLeaveCancelled:x,onBeforeAppear:B,onAppear:L,onAfterAppear:M,onAppearCancelled:N}=t,O=String(e.key),K=Di(n,e),W=($,U)=>{$&&De($,s,9,U)},G=($,U)=>{const Z=U[1];W($,U),j($)?$.every(I=>I.length<=1)&&Z():$.length<=1&&Z()},le={mode:o,persisted:l,beforeEnter($){let U=c;if(!n.isMounted)if(i)U=B||c;else return;$[lt]&&$[lt](!0);const Z=K[O];Z&&_t(e,Z)&&Z.el[lt]&&Z.el[lt](),W(U,[$])},enter($){let U=u,Z=f,I=d;if(!n.isMounted)if(i)U=L||u,Z=M||f,I=N||d;else return;let Q=!1;const ae=$[pn]=we=>{Q||(Q=!0,we?W(I,[$]):W(Z,[$]),le.delayedLeave&&le.delayedLeave(),$[pn]=void 0)};U?G(U,[$,ae]):ae()},leave($,U){const Z=String(e.key);if($[pn]&&$[pn](!0),n.isUnmounting)return U();W(p,[$]);let I=!1;const Q=$[lt]=ae=>{I||(I=!0,U(),ae?W(x,[$]):W(S,[$]),$[lt]=void 0,K[Z]===e&&delete K[Z])};K[Z]=e,m?G(m,[$,Q]):Q()},clone($){const U=en($,t,n,s,r);return r&&r(U),U}};return le}function Jn(e){if(jn(e))return e=at(e),e.children=null,e}function nr(e){if(!jn(e))return Oi(e.type)&&e.children?$i(e.children):e;const{shapeFlag:t,children:n}=e;if(n){if(t&16)return n[0];if(t&32&&V(n.default))return n.default()}}function St(e,t){e.shapeFlag&6&&e.component?(e.transition=t,St(e.component.subTree,t)):e.shapeFlag&128?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function $s(e,t=!1,n){let s=[],r=0;for(let i=0;i<e.length;i++){let o=e[i];const l=n==null?o.key:String(n)+String(o.key!=null?o.key:i);o.type===Ce?(o.patchFlag&128&&r++,s=s.concat($s(o.children,t,l))):(t||o.type!==Ee)&&s.push(l!=null?at(o,{key:l}):o)}if(r>1)for(let i=0;i<s.length;i++)s[i].patchFlag=-2;return s}/*! #__NO_SIDE_EFFECTS__ */function Hi(e,t){return V(e)?ue({name:e.name},t,{setup:e}):e}function mu(){const e=Ks();return e?(e.appContext.config.idPrefix||"v")+"-"+e.ids[0]+e.ids[1]++:""}function ji(e){e.ids=[e.ids[0]+e.ids[2]+++"-",0,0]}function wn(e,t,n,s,r=!1){if(j(e)){e.forEach((S,x)=>wn(S,t&&(j(t)?t[x]:t),n,s,r));return}if(Lt(s)&&!r){s.shapeFlag&512&&s.type.__asyncResolved&&s.component.subTree.component&&wn(e,t,n,s.component.subTree);return}const i=s.shapeFlag&4?Kn(s.component):s.el,o=r?null:i,{i:l,r:c}=e,u=t&&t.r,f=l.refs===se?l.refs={}:l.refs,d=l.setupState,p=z(d),m=d===se?()=>!1:S=>X(p,S);if(u!=null&&u!==c&&(ce(u)?(f[u]=null,m(u)&&(d[u]=null)):ye(u)&&(u.value=null)),V(c))ln(c,l,12,[o,f]);else{const S=ce(c),x=ye(c);if(S||x){const B=()=>{if(e.f){const L=S?m(c)?d[c]:f[c]:c.value;r?j(L)&&Rs(L,i):j(L)?L.includes(i)||L.push(i):S?(f[c]=[i],m(c)&&(d[c]=f[c])):(c.value=[i],e.k&&(f[e.k]=c.value))}else S?(f[c]=o,m(c)&&(d[c]=o)):x&&(c.value=o,e.k&&(f[e.k]=o))};o?(B.id=-1,_e(B,n)):B()}}}Ln().requestIdleCallback;Ln().cancelIdleCallback;const Lt=e=>!!e.type.__asyncLoader,jn=e=>e.type.__isKeepAlive;function Bi(e,t){Vi(e,"a",t)}function ki(e,t){Vi(e,"da",t)}function Vi(e,t,n=he){const s=e.__wdc||(e.__wdc=()=>{let r=n;for(;r;){if(r.isDeactivated)return;r=r.parent}return e()});if(Bn(t,s,n),n){let r=n.parent;for(;r&&r.parent;)jn(r.parent.vnode)&&Il(s,t,n,r),r=r.parent}}function Il(e,t,n,s){const r=Bn(t,e,s,!0);Ds(()=>{Rs(s[t],r)},n)}function Bn(e,t,n=he,s=!1){if(n){const r=n[e]||(n[e]=[]),i=t.__weh||(t.__weh=(...o)=>{ht();const l=cn(n),c=De(t,n,e,o);return l(),pt(),c});return s?r.unshift(i):r.push(i),i}}const tt=e=>(t,n=he)=>{(!sn||e==="sp")&&Bn(e,(...s)=>t(...s),n)},Ll=tt("bm"),Ki=tt("m"),Nl=tt("bu"),Ui=tt("u"),Wi=tt("bum"),Ds=tt("um"),Fl=tt("sp"),$l=tt("rtg"),Dl=tt("rtc");function Hl(e,t=he){Bn("ec",e,t)}const Hs="components",jl="directives";function yu(e,t){return js(Hs,e,!0,t)||e}const Gi=Symbol.for("v-ndc");function vu(e){return ce(e)?js(Hs,e,!1)||e:e||Gi}function _u(e){return js(jl,e)}function js(e,t,n=!0,s=!1){const r=de||he;if(r){const i=r.type;if(e===Hs){const l=Rc(i,!1);if(l&&(l===t||l===Ne(t)||l===In(Ne(t))))return i}const o=sr(r[e]||i[e],t)||sr(r.appContext[e],t);return!o&&s?i:o}}function sr(e,t){return e&&(e[t]||e[Ne(t)]||e[In(Ne(t))])}function bu(e,t,n,s){let r;const i=n,o=j(e);if(o||ce(e)){const l=o&&Ot(e);let c=!1;l&&(c=!Ie(e),e=$n(e)),r=new Array(e.length);for(let u=0,f=e.length;u<f;u++)r[u]=t(c?ge(e[u]):e[u],u,void 0,i)}else if(typeof e=="number"){r=new Array(e);for(let l=0;l<e;l++)r[l]=t(l+1,l,void 0,i)}else if(oe(e))if(e[Symbol.iterator])r=Array.from(e,(l,c)=>t(l,c,void 0,i));else{const l=Object.keys(e);r=new Array(l.length);for(let c=0,u=l.length;c<u;c++){const f=l[c];r[c]=t(e[f],f,c,i)}}else r=[];return r}function Eu(e,t){for(let n=0;n<t.length;n++){const s=t[n];if(j(s))for(let r=0;r<s.length;r++)e[s[r].name]=s[r].fn;else s&&(e[s.name]=s.key?(...r)=>{const i=s.fn(...r);return i&&(i.key=s.key),i}:s.fn)}return e}function Su(e,t,n={},s,r){if(de.ce||de.parent&&Lt(de.parent)&&de.parent.ce)return t!=="default"&&(n.name=t),ms(),ys(Ce,null,[me("slot",n,s&&s())],64);let i=e[t];i&&i._c&&(i._d=!1),ms();const o=i&&qi(i(n)),l=n.key||o&&o.key,c=ys(Ce,{key:(l&&!et(l)?l:`_${t}`)+(!o&&s?"_fb":"")},o||(s?s():[]),o&&e._===1?64:-2);return c.scopeId&&(c.slotScopeIds=[c.scopeId+"-s"]),i&&i._c&&(i._d=!0),c}function qi(e){return e.some(t=>nn(t)?!(t.type===Ee||t.type===Ce&&!qi(t.children)):!0)?e:null}function xu(e,t){const n={};for(const s in e)n[/[A-Z]/.test(s)?`on:${s}`:gn(s)]=e[s];return n}const ds=e=>e?go(e)?Kn(e):ds(e.parent):null,qt=ue(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>ds(e.parent),$root:e=>ds(e.root),$host:e=>e.ce,$emit:e=>e.emit,$options:e=>Qi(e),$forceUpdate:e=>e.f||(e.f=()=>{Fs(e.update)}),$nextTick:e=>e.n||(e.n=Ci.bind(e.proxy)),$watch:e=>oc.bind(e)}),Xn=(e,t)=>e!==se&&!e.__isScriptSetup&&X(e,t),Bl={get({_:e},t){if(t==="__v_skip")return!0;const{ctx:n,setupState:s,data:r,props:i,accessCache:o,type:l,appContext:c}=e;let u;if(t[0]!=="$"){const m=o[t];if(m!==void 0)switch(m){case 1:return s[t];case 2:return r[t];case 4:return n[t];case 3:return i[t]}else{if(Xn(s,t))return o[t]=1,s[t];if(r!==se&&X(r,t))return o[t]=2,r[t];if((u=e.propsOptions[0])&&X(u,t))return o[t]=3,i[t];if(n!==se&&X(n,t))return o[t]=4,n[t];hs&&(o[t]=0)}}const f=qt[t];let d,p;if(f)return t==="$attrs"&&pe(e.attrs,"get",""),f(e);if((d=l.__cssModules)&&(d=d[t]))return d;if(n!==se&&X(n,t))return o[t]=4,n[t];if(p=c.config.globalProperties,X(p,t))return p[t]},set({_:e},t,n){const{data:s,setupState:r,ctx:i}=e;return Xn(r,t)?(r[t]=n,!0):s!==se&&X(s,t)?(s[t]=n,!0):X(e.props,t)||t[0]==="$"&&t.slice(1)in e?!1:(i[t]=n,!0)},has({_:{data:e,setupState:t,accessCache:n,ctx:s,appContext:r,propsOptions:i}},o){let l;return!!n[o]||e!==se&&X(e,o)||Xn(t,o)||(l=i[0])&&X(l,o)||X(s,o)||X(qt,o)||X(r.config.globalProperties,o)},defineProperty(e,t,n){return n.get!=null?e._.accessCache[t]=0:X(n,"value")&&this.set(e,t,n.value,null),Reflect.defineProperty(e,t,n)}};function rr(e){return j(e)?e.reduce((t,n)=>(t[n]=null,t),{}):e}let hs=!0;function kl(e){const t=Qi(e),n=e.proxy,s=e.ctx;hs=!1,t.beforeCreate&&ir(t.beforeCreate,e,"bc");const{data:r,computed:i,methods:o,watch:l,provide:c,inject:u,created:f,beforeMount:d,mounted:p,beforeUpdate:m,updated:S,activated:x,deactivated:B,beforeDestroy:L,beforeUnmount:M,destroyed:N,unmounted:O,render:K,renderTracked:W,renderTriggered:G,errorCaptured:le,serverPrefetch:$,expose:U,inheritAttrs:Z,components:I,directives:Q,filters:ae}=t;if(u&&Vl(u,s,null),o)for(const te in o){const Y=o[te];V(Y)&&(s[te]=Y.bind(n))}if(r){const te=r.call(n,n);oe(te)&&(e.data=Dn(te))}if(hs=!0,i)for(const te in i){const Y=i[te],ze=V(Y)?Y.bind(n,n):V(Y.get)?Y.get.bind(n,n):qe,nt=!V(Y)&&V(Y.set)?Y.set.bind(n):qe,je=Fe({get:ze,set:nt});Object.defineProperty(s,te,{enumerable:!0,configurable:!0,get:()=>je.value,set:Se=>je.value=Se})}if(l)for(const te in l)zi(l[te],s,n,te);if(c){const te=V(c)?c.call(n):c;Reflect.ownKeys(te).forEach(Y=>{yn(Y,te[Y])})}f&&ir(f,e,"c");function fe(te,Y){j(Y)?Y.forEach(ze=>te(ze.bind(n))):Y&&te(Y.bind(n))}if(fe(Ll,d),fe(Ki,p),fe(Nl,m),fe(Ui,S),fe(Bi,x),fe(ki,B),fe(Hl,le),fe(Dl,W),fe($l,G),fe(Wi,M),fe(Ds,O),fe(Fl,$),j(U))if(U.length){const te=e.exposed||(e.exposed={});U.forEach(Y=>{Object.defineProperty(te,Y,{get:()=>n[Y],set:ze=>n[Y]=ze})})}else e.exposed||(e.exposed={});K&&e.render===qe&&(e.render=K),Z!=null&&(e.inheritAttrs=Z),I&&(e.components=I),Q&&(e.directives=Q),$&&ji(e)}function Vl(e,t,n=qe){j(e)&&(e=ps(e));for(const s in e){const r=e[s];let i;oe(r)?"default"in r?i=Le(r.from||s,r.default,!0):i=Le(r.from||s):i=Le(r),ye(i)?Object.defineProperty(t,s,{enumerable:!0,configurable:!0,get:()=>i.value,set:o=>i.value=o}):t[s]=i}}function ir(e,t,n){De(j(e)?e.map(s=>s.bind(t.proxy)):e.bind(t.proxy),t,n)}function zi(e,t,n,s){let r=s.includes(".")?co(n,s):()=>n[s];if(ce(e)){const i=t[e];V(i)&&vn(r,i)}else if(V(e))vn(r,e.bind(n));else if(oe(e))if(j(e))e.forEach(i=>zi(i,t,n,s));else{const i=V(e.handler)?e.handler.bind(n):t[e.handler];V(i)&&vn(r,i,e)}}function Qi(e){const t=e.type,{mixins:n,extends:s}=t,{mixins:r,optionsCache:i,config:{optionMergeStrategies:o}}=e.appContext,l=i.get(t);let c;return l?c=l:!r.length&&!n&&!s?c=t:(c={},r.length&&r.forEach(u=>Rn(c,u,o,!0)),Rn(c,t,o)),oe(t)&&i.set(t,c),c}function Rn(e,t,n,s=!1){const{mixins:r,extends:i}=t;i&&Rn(e,i,n,!0),r&&r.forEach(o=>Rn(e,o,n,!0));for(const o in t)if(!(s&&o==="expose")){const l=Kl[o]||n&&n[o];e[o]=l?l(e[o],t[o]):t[o]}return e}const Kl={data:or,props:lr,emits:lr,methods:Vt,computed:Vt,beforeCreate:ve,created:ve,beforeMount:ve,mounted:ve,beforeUpdate:ve,updated:ve,beforeDestroy:ve,beforeUnmount:ve,destroyed:ve,unmounted:ve,activated:ve,deactivated:ve,errorCaptured:ve,serverPrefetch:ve,components:Vt,directives:Vt,watch:Wl,provide:or,inject:Ul};function or(e,t){return t?e?function(){return ue(V(e)?e.call(this,this):e,V(t)?t.call(this,this):t)}:t:e}function Ul(e,t){return Vt(ps(e),ps(t))}function ps(e){if(j(e)){const t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function ve(e,t){return e?[...new Set([].concat(e,t))]:t}function Vt(e,t){return e?ue(Object.create(null),e,t):t}function lr(e,t){return e?j(e)&&j(t)?[...new Set([...e,...t])]:ue(Object.create(null),rr(e),rr(t!=null?t:{})):t}function Wl(e,t){if(!e)return t;if(!t)return e;const n=ue(Object.create(null),e);for(const s in t)n[s]=ve(e[s],t[s]);return n}function Yi(){return{app:null,config:{isNativeTag:Do,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let Gl=0;function ql(e,t){return function(s,r=null){V(s)||(s=ue({},s)),r!=null&&!oe(r)&&(r=null);const i=Yi(),o=new WeakSet,l=[];let c=!1;const u=i.app={_uid:Gl++,_component:s,_props:r,_container:null,_context:i,_instance:null,version:Ac,get config(){return i.config},set config(f){},use(f,...d){return o.has(f)||(f&&V(f.install)?(o.add(f),f.install(u,...d)):V(f)&&(o.add(f),f(u,...d))),u},mixin(f){return i.mixins.includes(f)||i.mixins.push(f),u},component(f,d){return d?(i.components[f]=d,u):i.components[f]},directive(f,d){return d?(i.directives[f]=d,u):i.directives[f]},mount(f,d,p){if(!c){const m=u._ceVNode||me(s,r);return m.appContext=i,p===!0?p="svg":p===!1&&(p=void 0),e(m,f,p),c=!0,u._container=f,f.__vue_app__=u,Kn(m.component)}},onUnmount(f){l.push(f)},unmount(){c&&(De(l,u._instance,16),e(null,u._container),delete u._container.__vue_app__)},provide(f,d){return i.provides[f]=d,u},runWithContext(f){const d=Nt;Nt=u;try{return f()}finally{Nt=d}}};return u}}let Nt=null;function yn(e,t){if(he){let n=he.provides;const s=he.parent&&he.parent.provides;s===n&&(n=he.provides=Object.create(s)),n[e]=t}}function Le(e,t,n=!1){const s=he||de;if(s||Nt){const r=Nt?Nt._context.provides:s?s.parent==null?s.vnode.appContext&&s.vnode.appContext.provides:s.parent.provides:void 0;if(r&&e in r)return r[e];if(arguments.length>1)return n&&V(t)?t.call(s&&s.proxy):t}}const Ji={},Xi=()=>Object.create(Ji),Zi=e=>Object.getPrototypeOf(e)===Ji;function zl(e,t,n,s=!1){const r={},i=Xi();e.propsDefaults=Object.create(null),eo(e,t,r,i);for(const o in e.propsOptions[0])o in r||(r[o]=void 0);n?e.props=s?r:_i(r):e.type.props?e.props=r:e.props=i,e.attrs=i}function Ql(e,t,n,s){const{props:r,attrs:i,vnode:{patchFlag:o}}=e,l=z(r),[c]=e.propsOptions;let u=!1;if((s||o>0)&&!(o&16)){if(o&8){const f=e.vnode.dynamicProps;for(let d=0;d<f.length;d++){let p=f[d];if(kn(e.emitsOptions,p))continue;const m=t[p];if(c)if(X(i,p))m!==i[p]&&(i[p]=m,u=!0);else{const S=Ne(p);r[S]=gs(c,l,S,m,e,!1)}else m!==i[p]&&(i[p]=m,u=!0)}}}else{eo(e,t,r,i)&&(u=!0);let f;for(const d in l)(!t||!X(t,d)&&((f=dt(d))===d||!X(t,f)))&&(c?n&&(n[d]!==void 0||n[f]!==void 0)&&(r[d]=gs(c,l,d,void 0,e,!0)):delete r[d]);if(i!==l)for(const d in i)(!t||!X(t,d))&&(delete i[d],u=!0)}u&&Xe(e.attrs,"set","")}function eo(e,t,n,s){const[r,i]=e.propsOptions;let o=!1,l;if(t)for(let c in t){if(Kt(c))continue;const u=t[c];let f;r&&X(r,f=Ne(c))?!i||!i.includes(f)?n[f]=u:(l||(l={}))[f]=u:kn(e.emitsOptions,c)||(!(c in s)||u!==s[c])&&(s[c]=u,o=!0)}if(i){const c=z(n),u=l||se;for(let f=0;f<i.length;f++){const d=i[f];n[d]=gs(r,c,d,u[d],e,!X(u,d))}}return o}function gs(e,t,n,s,r,i){const o=e[n];if(o!=null){const l=X(o,"default");if(l&&s===void 0){const c=o.default;if(o.type!==Function&&!o.skipFactory&&V(c)){const{propsDefaults:u}=r;if(n in u)s=u[n];else{const f=cn(r);s=u[n]=c.call(null,t),f()}}else s=c;r.ce&&r.ce._setProp(n,s)}o[0]&&(i&&!l?s=!1:o[1]&&(s===""||s===dt(n))&&(s=!0))}return s}const Yl=new WeakMap;function to(e,t,n=!1){const s=n?Yl:t.propsCache,r=s.get(e);if(r)return r;const i=e.props,o={},l=[];let c=!1;if(!V(e)){const f=d=>{c=!0;const[p,m]=to(d,t,!0);ue(o,p),m&&l.push(...m)};!n&&t.mixins.length&&t.mixins.forEach(f),e.extends&&f(e.extends),e.mixins&&e.mixins.forEach(f)}if(!i&&!c)return oe(e)&&s.set(e,At),At;if(j(i))for(let f=0;f<i.length;f++){const d=Ne(i[f]);cr(d)&&(o[d]=se)}else if(i)for(const f in i){const d=Ne(f);if(cr(d)){const p=i[f],m=o[d]=j(p)||V(p)?{type:p}:ue({},p),S=m.type;let x=!1,B=!0;if(j(S))for(let L=0;L<S.length;++L){const M=S[L],N=V(M)&&M.name;if(N==="Boolean"){x=!0;break}else N==="String"&&(B=!1)}else x=V(S)&&S.name==="Boolean";m[0]=x,m[1]=B,(x||X(m,"default"))&&l.push(d)}}const u=[o,l];return oe(e)&&s.set(e,u),u}function cr(e){return e[0]!=="$"&&!Kt(e)}const no=e=>e[0]==="_"||e==="$stable",Bs=e=>j(e)?e.map(Ge):[Ge(e)],Jl=(e,t,n)=>{if(t._n)return t;const s=Al((...r)=>Bs(t(...r)),n);return s._c=!1,s},so=(e,t,n)=>{const s=e._ctx;for(const r in e){if(no(r))continue;const i=e[r];if(V(i))t[r]=Jl(r,i,s);else if(i!=null){const o=Bs(i);t[r]=()=>o}}},ro=(e,t)=>{const n=Bs(t);e.slots.default=()=>n},io=(e,t,n)=>{for(const s in t)(n||s!=="_")&&(e[s]=t[s])},Xl=(e,t,n)=>{const s=e.slots=Xi();if(e.vnode.shapeFlag&32){const r=t._;r?(io(s,t,n),n&&ei(s,"_",r,!0)):so(t,s)}else t&&ro(e,t)},Zl=(e,t,n)=>{const{vnode:s,slots:r}=e;let i=!0,o=se;if(s.shapeFlag&32){const l=t._;l?n&&l===1?i=!1:io(r,t,n):(i=!t.$stable,so(t,r)),o=t}else t&&(ro(e,t),o={default:1});if(i)for(const l in r)!no(l)&&o[l]==null&&delete r[l]},_e=hc;function ec(e){return tc(e)}function tc(e,t){const n=Ln();n.__VUE__=!0;const{insert:s,remove:r,patchProp:i,createElement:o,createText:l,createComment:c,setText:u,setElementText:f,parentNode:d,nextSibling:p,setScopeId:m=qe,insertStaticContent:S}=e,x=(a,h,g,y=null,b=null,_=null,R=void 0,w=null,C=!!h.dynamicChildren)=>{if(a===h)return;a&&!_t(a,h)&&(y=v(a),Se(a,b,_,!0),a=null),h.patchFlag===-2&&(C=!1,h.dynamicChildren=null);const{type:E,ref:H,shapeFlag:A}=h;switch(E){case Vn:B(a,h,g,y);break;case Ee:L(a,h,g,y);break;case _n:a==null&&M(h,g,y,R);break;case Ce:I(a,h,g,y,b,_,R,w,C);break;default:A&1?K(a,h,g,y,b,_,R,w,C):A&6?Q(a,h,g,y,b,_,R,w,C):(A&64||A&128)&&E.process(a,h,g,y,b,_,R,w,C,F)}H!=null&&b&&wn(H,a&&a.ref,_,h||a,!h)},B=(a,h,g,y)=>{if(a==null)s(h.el=l(h.children),g,y);else{const b=h.el=a.el;h.children!==a.children&&u(b,h.children)}},L=(a,h,g,y)=>{a==null?s(h.el=c(h.children||""),g,y):h.el=a.el},M=(a,h,g,y)=>{[a.el,a.anchor]=S(a.children,h,g,y,a.el,a.anchor)},N=({el:a,anchor:h},g,y)=>{let b;for(;a&&a!==h;)b=p(a),s(a,g,y),a=b;s(h,g,y)},O=({el:a,anchor:h})=>{let g;for(;a&&a!==h;)g=p(a),r(a),a=g;r(h)},K=(a,h,g,y,b,_,R,w,C)=>{h.type==="svg"?R="svg":h.type==="math"&&(R="mathml"),a==null?W(h,g,y,b,_,R,w,C):$(a,h,b,_,R,w,C)},W=(a,h,g,y,b,_,R,w)=>{let C,E;const{props:H,shapeFlag:A,transition:D,dirs:k}=a;if(C=a.el=o(a.type,_,H&&H.is,H),A&8?f(C,a.children):A&16&&le(a.children,C,null,y,b,Zn(a,_),R,w),k&&gt(a,null,y,"created"),G(C,a,a.scopeId,R,y),H){for(const re in H)re!=="value"&&!Kt(re)&&i(C,re,null,H[re],_,y);"value"in H&&i(C,"value",null,H.value,_),(E=H.onVnodeBeforeMount)&&Ke(E,y,a)}k&&gt(a,null,y,"beforeMount");const q=nc(b,D);q&&D.beforeEnter(C),s(C,h,g),((E=H&&H.onVnodeMounted)||q||k)&&_e(()=>{E&&Ke(E,y,a),q&&D.enter(C),k&&gt(a,null,y,"mounted")},b)},G=(a,h,g,y,b)=>{if(g&&m(a,g),y)for(let _=0;_<y.length;_++)m(a,y[_]);if(b){let _=b.subTree;if(h===_||uo(_.type)&&(_.ssContent===h||_.ssFallback===h)){const R=b.vnode;G(a,R,R.scopeId,R.slotScopeIds,b.parent)}}},le=(a,h,g,y,b,_,R,w,C=0)=>{for(let E=C;E<a.length;E++){const H=a[E]=w?ct(a[E]):Ge(a[E]);x(null,H,h,g,y,b,_,R,w)}},$=(a,h,g,y,b,_,R)=>{const w=h.el=a.el;let{patchFlag:C,dynamicChildren:E,dirs:H}=h;C|=a.patchFlag&16;const A=a.props||se,D=h.props||se;let k;if(g&&mt(g,!1),(k=D.onVnodeBeforeUpdate)&&Ke(k,g,h,a),H&&gt(h,a,g,"beforeUpdate"),g&&mt(g,!0),(A.innerHTML&&D.innerHTML==null||A.textContent&&D.textContent==null)&&f(w,""),E?U(a.dynamicChildren,E,w,g,y,Zn(h,b),_):R||Y(a,h,w,null,g,y,Zn(h,b),_,!1),C>0){if(C&16)Z(w,A,D,g,b);else if(C&2&&A.class!==D.class&&i(w,"class",null,D.class,b),C&4&&i(w,"style",A.style,D.style,b),C&8){const q=h.dynamicProps;for(let re=0;re<q.length;re++){const ee=q[re],Re=A[ee],xe=D[ee];(xe!==Re||ee==="value")&&i(w,ee,Re,xe,b,g)}}C&1&&a.children!==h.children&&f(w,h.children)}else!R&&E==null&&Z(w,A,D,g,b);((k=D.onVnodeUpdated)||H)&&_e(()=>{k&&Ke(k,g,h,a),H&&gt(h,a,g,"updated")},y)},U=(a,h,g,y,b,_,R)=>{for(let w=0;w<h.length;w++){const C=a[w],E=h[w],H=C.el&&(C.type===Ce||!_t(C,E)||C.shapeFlag&70)?d(C.el):g;x(C,E,H,null,y,b,_,R,!0)}},Z=(a,h,g,y,b)=>{if(h!==g){if(h!==se)for(const _ in h)!Kt(_)&&!(_ in g)&&i(a,_,h[_],null,b,y);for(const _ in g){if(Kt(_))continue;const R=g[_],w=h[_];R!==w&&_!=="value"&&i(a,_,w,R,b,y)}"value"in g&&i(a,"value",h.value,g.value,b)}},I=(a,h,g,y,b,_,R,w,C)=>{const E=h.el=a?a.el:l(""),H=h.anchor=a?a.anchor:l("");let{patchFlag:A,dynamicChildren:D,slotScopeIds:k}=h;k&&(w=w?w.concat(k):k),a==null?(s(E,g,y),s(H,g,y),le(h.children||[],g,H,b,_,R,w,C)):A>0&&A&64&&D&&a.dynamicChildren?(U(a.dynamicChildren,D,g,b,_,R,w),(h.key!=null||b&&h===b.subTree)&&ks(a,h,!0)):Y(a,h,g,H,b,_,R,w,C)},Q=(a,h,g,y,b,_,R,w,C)=>{h.slotScopeIds=w,a==null?h.shapeFlag&512?b.ctx.activate(h,g,y,R,C):ae(h,g,y,b,_,R,C):we(a,h,C)},ae=(a,h,g,y,b,_,R)=>{const w=a.component=Ec(a,y,b);if(jn(a)&&(w.ctx.renderer=F),Sc(w,!1,R),w.asyncDep){if(b&&b.registerDep(w,fe,R),!a.el){const C=w.subTree=me(Ee);L(null,C,h,g)}}else fe(w,a,h,g,b,_,R)},we=(a,h,g)=>{const y=h.component=a.component;if(ac(a,h,g))if(y.asyncDep&&!y.asyncResolved){te(y,h,g);return}else y.next=h,y.update();else h.el=a.el,y.vnode=h},fe=(a,h,g,y,b,_,R)=>{const w=()=>{if(a.isMounted){let{next:A,bu:D,u:k,parent:q,vnode:re}=a;{const ke=oo(a);if(ke){A&&(A.el=re.el,te(a,A,R)),ke.asyncDep.then(()=>{a.isUnmounted||w()});return}}let ee=A,Re;mt(a,!1),A?(A.el=re.el,te(a,A,R)):A=re,D&&Gn(D),(Re=A.props&&A.props.onVnodeBeforeUpdate)&&Ke(Re,q,A,re),mt(a,!0);const xe=ur(a),Be=a.subTree;a.subTree=xe,x(Be,xe,d(Be.el),v(Be),a,b,_),A.el=xe.el,ee===null&&dc(a,xe.el),k&&_e(k,b),(Re=A.props&&A.props.onVnodeUpdated)&&_e(()=>Ke(Re,q,A,re),b)}else{let A;const{el:D,props:k}=h,{bm:q,m:re,parent:ee,root:Re,type:xe}=a,Be=Lt(h);mt(a,!1),q&&Gn(q),!Be&&(A=k&&k.onVnodeBeforeMount)&&Ke(A,ee,h),mt(a,!0);{Re.ce&&Re.ce._injectChildStyle(xe);const ke=a.subTree=ur(a);x(null,ke,g,y,a,b,_),h.el=ke.el}if(re&&_e(re,b),!Be&&(A=k&&k.onVnodeMounted)){const ke=h;_e(()=>Ke(A,ee,ke),b)}(h.shapeFlag&256||ee&&Lt(ee.vnode)&&ee.vnode.shapeFlag&256)&&a.a&&_e(a.a,b),a.isMounted=!0,h=g=y=null}};a.scope.on();const C=a.effect=new ii(w);a.scope.off();const E=a.update=C.run.bind(C),H=a.job=C.runIfDirty.bind(C);H.i=a,H.id=a.uid,C.scheduler=()=>Fs(H),mt(a,!0),E()},te=(a,h,g)=>{h.component=a;const y=a.vnode.props;a.vnode=h,a.next=null,Ql(a,h.props,y,g),Zl(a,h.children,g),ht(),Xs(a),pt()},Y=(a,h,g,y,b,_,R,w,C=!1)=>{const E=a&&a.children,H=a?a.shapeFlag:0,A=h.children,{patchFlag:D,shapeFlag:k}=h;if(D>0){if(D&128){nt(E,A,g,y,b,_,R,w,C);return}else if(D&256){ze(E,A,g,y,b,_,R,w,C);return}}k&8?(H&16&&Oe(E,b,_),A!==E&&f(g,A)):H&16?k&16?nt(E,A,g,y,b,_,R,w,C):Oe(E,b,_,!0):(H&8&&f(g,""),k&16&&le(A,g,y,b,_,R,w,C))},ze=(a,h,g,y,b,_,R,w,C)=>{a=a||At,h=h||At;const E=a.length,H=h.length,A=Math.min(E,H);let D;for(D=0;D<A;D++){const k=h[D]=C?ct(h[D]):Ge(h[D]);x(a[D],k,g,null,b,_,R,w,C)}E>H?Oe(a,b,_,!0,!1,A):le(h,g,y,b,_,R,w,C,A)},nt=(a,h,g,y,b,_,R,w,C)=>{let E=0;const H=h.length;let A=a.length-1,D=H-1;for(;E<=A&&E<=D;){const k=a[E],q=h[E]=C?ct(h[E]):Ge(h[E]);if(_t(k,q))x(k,q,g,null,b,_,R,w,C);else break;E++}for(;E<=A&&E<=D;){const k=a[A],q=h[D]=C?ct(h[D]):Ge(h[D]);if(_t(k,q))x(k,q,g,null,b,_,R,w,C);else break;A--,D--}if(E>A){if(E<=D){const k=D+1,q=k<H?h[k].el:y;for(;E<=D;)x(null,h[E]=C?ct(h[E]):Ge(h[E]),g,q,b,_,R,w,C),E++}}else if(E>D)for(;E<=A;)Se(a[E],b,_,!0),E++;else{const k=E,q=E,re=new Map;for(E=q;E<=D;E++){const Te=h[E]=C?ct(h[E]):Ge(h[E]);Te.key!=null&&re.set(Te.key,E)}let ee,Re=0;const xe=D-q+1;let Be=!1,ke=0;const Ht=new Array(xe);for(E=0;E<xe;E++)Ht[E]=0;for(E=k;E<=A;E++){const Te=a[E];if(Re>=xe){Se(Te,b,_,!0);continue}let Ve;if(Te.key!=null)Ve=re.get(Te.key);else for(ee=q;ee<=D;ee++)if(Ht[ee-q]===0&&_t(Te,h[ee])){Ve=ee;break}Ve===void 0?Se(Te,b,_,!0):(Ht[Ve-q]=E+1,Ve>=ke?ke=Ve:Be=!0,x(Te,h[Ve],g,null,b,_,R,w,C),Re++)}const qs=Be?sc(Ht):At;for(ee=qs.length-1,E=xe-1;E>=0;E--){const Te=q+E,Ve=h[Te],zs=Te+1<H?h[Te+1].el:y;Ht[E]===0?x(null,Ve,g,zs,b,_,R,w,C):Be&&(ee<0||E!==qs[ee]?je(Ve,g,zs,2):ee--)}}},je=(a,h,g,y,b=null)=>{const{el:_,type:R,transition:w,children:C,shapeFlag:E}=a;if(E&6){je(a.component.subTree,h,g,y);return}if(E&128){a.suspense.move(h,g,y);return}if(E&64){R.move(a,h,g,F);return}if(R===Ce){s(_,h,g);for(let A=0;A<C.length;A++)je(C[A],h,g,y);s(a.anchor,h,g);return}if(R===_n){N(a,h,g);return}if(y!==2&&E&1&&w)if(y===0)w.beforeEnter(_),s(_,h,g),_e(()=>w.enter(_),b);else{const{leave:A,delayLeave:D,afterLeave:k}=w,q=()=>s(_,h,g),re=()=>{A(_,()=>{q(),k&&k()})};D?D(_,q,re):re()}else s(_,h,g)},Se=(a,h,g,y=!1,b=!1)=>{const{type:_,props:R,ref:w,children:C,dynamicChildren:E,shapeFlag:H,patchFlag:A,dirs:D,cacheIndex:k}=a;if(A===-2&&(b=!1),w!=null&&wn(w,null,g,a,!0),k!=null&&(h.renderCache[k]=void 0),H&256){h.ctx.deactivate(a);return}const q=H&1&&D,re=!Lt(a);let ee;if(re&&(ee=R&&R.onVnodeBeforeUnmount)&&Ke(ee,h,a),H&6)fn(a.component,g,y);else{if(H&128){a.suspense.unmount(g,y);return}q&&gt(a,null,h,"beforeUnmount"),H&64?a.type.remove(a,h,g,F,y):E&&!E.hasOnce&&(_!==Ce||A>0&&A&64)?Oe(E,h,g,!1,!0):(_===Ce&&A&384||!b&&H&16)&&Oe(C,h,g),y&&xt(a)}(re&&(ee=R&&R.onVnodeUnmounted)||q)&&_e(()=>{ee&&Ke(ee,h,a),q&&gt(a,null,h,"unmounted")},g)},xt=a=>{const{type:h,el:g,anchor:y,transition:b}=a;if(h===Ce){Ct(g,y);return}if(h===_n){O(a);return}const _=()=>{r(g),b&&!b.persisted&&b.afterLeave&&b.afterLeave()};if(a.shapeFlag&1&&b&&!b.persisted){const{leave:R,delayLeave:w}=b,C=()=>R(g,_);w?w(a.el,_,C):C()}else _()},Ct=(a,h)=>{let g;for(;a!==h;)g=p(a),r(a),a=g;r(h)},fn=(a,h,g)=>{const{bum:y,scope:b,job:_,subTree:R,um:w,m:C,a:E}=a;fr(C),fr(E),y&&Gn(y),b.stop(),_&&(_.flags|=8,Se(R,a,h,g)),w&&_e(w,h),_e(()=>{a.isUnmounted=!0},h),h&&h.pendingBranch&&!h.isUnmounted&&a.asyncDep&&!a.asyncResolved&&a.suspenseId===h.pendingId&&(h.deps--,h.deps===0&&h.resolve())},Oe=(a,h,g,y=!1,b=!1,_=0)=>{for(let R=_;R<a.length;R++)Se(a[R],h,g,y,b)},v=a=>{if(a.shapeFlag&6)return v(a.component.subTree);if(a.shapeFlag&128)return a.suspense.next();const h=p(a.anchor||a.el),g=h&&h[Pi];return g?p(g):h};let P=!1;const T=(a,h,g)=>{a==null?h._vnode&&Se(h._vnode,null,null,!0):x(h._vnode||null,a,h,null,null,null,g),h._vnode=a,P||(P=!0,Xs(),Ri(),P=!1)},F={p:x,um:Se,m:je,r:xt,mt:ae,mc:le,pc:Y,pbc:U,n:v,o:e};return{render:T,hydrate:void 0,createApp:ql(T)}}function Zn({type:e,props:t},n){return n==="svg"&&e==="foreignObject"||n==="mathml"&&e==="annotation-xml"&&t&&t.encoding&&t.encoding.includes("html")?void 0:n}function mt({effect:e,job:t},n){n?(e.flags|=32,t.flags|=4):(e.flags&=-33,t.flags&=-5)}function nc(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function ks(e,t,n=!1){const s=e.children,r=t.children;if(j(s)&&j(r))for(let i=0;i<s.length;i++){const o=s[i];let l=r[i];l.shapeFlag&1&&!l.dynamicChildren&&((l.patchFlag<=0||l.patchFlag===32)&&(l=r[i]=ct(r[i]),l.el=o.el),!n&&l.patchFlag!==-2&&ks(o,l)),l.type===Vn&&(l.el=o.el)}}function sc(e){const t=e.slice(),n=[0];let s,r,i,o,l;const c=e.length;for(s=0;s<c;s++){const u=e[s];if(u!==0){if(r=n[n.length-1],e[r]<u){t[s]=r,n.push(s);continue}for(i=0,o=n.length-1;i<o;)l=i+o>>1,e[n[l]]<u?i=l+1:o=l;u<e[n[i]]&&(i>0&&(t[s]=n[i-1]),n[i]=s)}}for(i=n.length,o=n[i-1];i-- >0;)n[i]=o,o=t[o];return n}function oo(e){const t=e.subTree.component;if(t)return t.asyncDep&&!t.asyncResolved?t:oo(t)}function fr(e){if(e)for(let t=0;t<e.length;t++)e[t].flags|=8}const rc=Symbol.for("v-scx"),ic=()=>Le(rc);function vn(e,t,n){return lo(e,t,n)}function lo(e,t,n=se){const{immediate:s,deep:r,flush:i,once:o}=n,l=ue({},n),c=t&&s||!t&&i!=="post";let u;if(sn){if(i==="sync"){const m=ic();u=m.__watcherHandles||(m.__watcherHandles=[])}else if(!c){const m=()=>{};return m.stop=qe,m.resume=qe,m.pause=qe,m}}const f=he;l.call=(m,S,x)=>De(m,f,S,x);let d=!1;i==="post"?l.scheduler=m=>{_e(m,f&&f.suspense)}:i!=="sync"&&(d=!0,l.scheduler=(m,S)=>{S?m():Fs(m)}),l.augmentJob=m=>{t&&(m.flags|=4),d&&(m.flags|=2,f&&(m.id=f.uid,m.i=f))};const p=Cl(e,t,l);return sn&&(u?u.push(p):c&&p()),p}function oc(e,t,n){const s=this.proxy,r=ce(e)?e.includes(".")?co(s,e):()=>s[e]:e.bind(s,s);let i;V(t)?i=t:(i=t.handler,n=t);const o=cn(this),l=lo(r,i.bind(s),n);return o(),l}function co(e,t){const n=t.split(".");return()=>{let s=e;for(let r=0;r<n.length&&s;r++)s=s[n[r]];return s}}const lc=(e,t)=>t==="modelValue"||t==="model-value"?e.modelModifiers:e[`${t}Modifiers`]||e[`${Ne(t)}Modifiers`]||e[`${dt(t)}Modifiers`];function cc(e,t,...n){if(e.isUnmounted)return;const s=e.vnode.props||se;let r=n;const i=t.startsWith("update:"),o=i&&lc(s,t.slice(7));o&&(o.trim&&(r=n.map(f=>ce(f)?f.trim():f)),o.number&&(r=n.map(Vo)));let l,c=s[l=gn(t)]||s[l=gn(Ne(t))];!c&&i&&(c=s[l=gn(dt(t))]),c&&De(c,e,6,r);const u=s[l+"Once"];if(u){if(!e.emitted)e.emitted={};else if(e.emitted[l])return;e.emitted[l]=!0,De(u,e,6,r)}}function fo(e,t,n=!1){const s=t.emitsCache,r=s.get(e);if(r!==void 0)return r;const i=e.emits;let o={},l=!1;if(!V(e)){const c=u=>{const f=fo(u,t,!0);f&&(l=!0,ue(o,f))};!n&&t.mixins.length&&t.mixins.forEach(c),e.extends&&c(e.extends),e.mixins&&e.mixins.forEach(c)}return!i&&!l?(oe(e)&&s.set(e,null),null):(j(i)?i.forEach(c=>o[c]=null):ue(o,i),oe(e)&&s.set(e,o),o)}function kn(e,t){return!e||!Pn(t)?!1:(t=t.slice(2).replace(/Once$/,""),X(e,t[0].toLowerCase()+t.slice(1))||X(e,dt(t))||X(e,t))}function ur(e){const{type:t,vnode:n,proxy:s,withProxy:r,propsOptions:[i],slots:o,attrs:l,emit:c,render:u,renderCache:f,props:d,data:p,setupState:m,ctx:S,inheritAttrs:x}=e,B=Cn(e);let L,M;try{if(n.shapeFlag&4){const O=r||s,K=O;L=Ge(u.call(K,O,f,d,m,p,S)),M=l}else{const O=t;L=Ge(O.length>1?O(d,{attrs:l,slots:o,emit:c}):O(d,null)),M=t.props?l:fc(l)}}catch(O){zt.length=0,Hn(O,e,1),L=me(Ee)}let N=L;if(M&&x!==!1){const O=Object.keys(M),{shapeFlag:K}=N;O.length&&K&7&&(i&&O.some(ws)&&(M=uc(M,i)),N=at(N,M,!1,!0))}return n.dirs&&(N=at(N,null,!1,!0),N.dirs=N.dirs?N.dirs.concat(n.dirs):n.dirs),n.transition&&St(N,n.transition),L=N,Cn(B),L}const fc=e=>{let t;for(const n in e)(n==="class"||n==="style"||Pn(n))&&((t||(t={}))[n]=e[n]);return t},uc=(e,t)=>{const n={};for(const s in e)(!ws(s)||!(s.slice(9)in t))&&(n[s]=e[s]);return n};function ac(e,t,n){const{props:s,children:r,component:i}=e,{props:o,children:l,patchFlag:c}=t,u=i.emitsOptions;if(t.dirs||t.transition)return!0;if(n&&c>=0){if(c&1024)return!0;if(c&16)return s?ar(s,o,u):!!o;if(c&8){const f=t.dynamicProps;for(let d=0;d<f.length;d++){const p=f[d];if(o[p]!==s[p]&&!kn(u,p))return!0}}}else return(r||l)&&(!l||!l.$stable)?!0:s===o?!1:s?o?ar(s,o,u):!0:!!o;return!1}function ar(e,t,n){const s=Object.keys(t);if(s.length!==Object.keys(e).length)return!0;for(let r=0;r<s.length;r++){const i=s[r];if(t[i]!==e[i]&&!kn(n,i))return!0}return!1}function dc({vnode:e,parent:t},n){for(;t;){const s=t.subTree;if(s.suspense&&s.suspense.activeBranch===e&&(s.el=e.el),s===e)(e=t.vnode).el=n,t=t.parent;else break}}const uo=e=>e.__isSuspense;function hc(e,t){t&&t.pendingBranch?j(e)?t.effects.push(...e):t.effects.push(e):Tl(e)}const Ce=Symbol.for("v-fgt"),Vn=Symbol.for("v-txt"),Ee=Symbol.for("v-cmt"),_n=Symbol.for("v-stc"),zt=[];let Pe=null;function ms(e=!1){zt.push(Pe=e?null:[])}function pc(){zt.pop(),Pe=zt[zt.length-1]||null}let tn=1;function dr(e,t=!1){tn+=e,e<0&&Pe&&t&&(Pe.hasOnce=!0)}function ao(e){return e.dynamicChildren=tn>0?Pe||At:null,pc(),tn>0&&Pe&&Pe.push(e),e}function Cu(e,t,n,s,r,i){return ao(po(e,t,n,s,r,i,!0))}function ys(e,t,n,s,r){return ao(me(e,t,n,s,r,!0))}function nn(e){return e?e.__v_isVNode===!0:!1}function _t(e,t){return e.type===t.type&&e.key===t.key}const ho=({key:e})=>e!=null?e:null,bn=({ref:e,ref_key:t,ref_for:n})=>(typeof e=="number"&&(e=""+e),e!=null?ce(e)||ye(e)||V(e)?{i:de,r:e,k:t,f:!!n}:e:null);function po(e,t=null,n=null,s=0,r=null,i=e===Ce?0:1,o=!1,l=!1){const c={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&ho(t),ref:t&&bn(t),scopeId:Ai,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:i,patchFlag:s,dynamicProps:r,dynamicChildren:null,appContext:null,ctx:de};return l?(Vs(c,n),i&128&&e.normalize(c)):n&&(c.shapeFlag|=ce(n)?8:16),tn>0&&!o&&Pe&&(c.patchFlag>0||i&6)&&c.patchFlag!==32&&Pe.push(c),c}const me=gc;function gc(e,t=null,n=null,s=0,r=null,i=!1){if((!e||e===Gi)&&(e=Ee),nn(e)){const l=at(e,t,!0);return n&&Vs(l,n),tn>0&&!i&&Pe&&(l.shapeFlag&6?Pe[Pe.indexOf(e)]=l:Pe.push(l)),l.patchFlag=-2,l}if(Tc(e)&&(e=e.__vccOpts),t){t=mc(t);let{class:l,style:c}=t;l&&!ce(l)&&(t.class=Fn(l)),oe(c)&&(Ns(c)&&!j(c)&&(c=ue({},c)),t.style=Nn(c))}const o=ce(e)?1:uo(e)?128:Oi(e)?64:oe(e)?4:V(e)?2:0;return po(e,t,n,s,r,o,i,!0)}function mc(e){return e?Ns(e)||Zi(e)?ue({},e):e:null}function at(e,t,n=!1,s=!1){const{props:r,ref:i,patchFlag:o,children:l,transition:c}=e,u=t?vc(r||{},t):r,f={__v_isVNode:!0,__v_skip:!0,type:e.type,props:u,key:u&&ho(u),ref:t&&t.ref?n&&i?j(i)?i.concat(bn(t)):[i,bn(t)]:bn(t):i,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:l,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==Ce?o===-1?16:o|16:o,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:c,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&at(e.ssContent),ssFallback:e.ssFallback&&at(e.ssFallback),el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return c&&s&&St(f,c.clone(f)),f}function yc(e=" ",t=0){return me(Vn,null,e,t)}function wu(e,t){const n=me(_n,null,e);return n.staticCount=t,n}function Ru(e="",t=!1){return t?(ms(),ys(Ee,null,e)):me(Ee,null,e)}function Ge(e){return e==null||typeof e=="boolean"?me(Ee):j(e)?me(Ce,null,e.slice()):nn(e)?ct(e):me(Vn,null,String(e))}function ct(e){return e.el===null&&e.patchFlag!==-1||e.memo?e:at(e)}function Vs(e,t){let n=0;const{shapeFlag:s}=e;if(t==null)t=null;else if(j(t))n=16;else if(typeof t=="object")if(s&65){const r=t.default;r&&(r._c&&(r._d=!1),Vs(e,r()),r._c&&(r._d=!0));return}else{n=32;const r=t._;!r&&!Zi(t)?t._ctx=de:r===3&&de&&(de.slots._===1?t._=1:(t._=2,e.patchFlag|=1024))}else V(t)?(t={default:t,_ctx:de},n=32):(t=String(t),s&64?(n=16,t=[yc(t)]):n=8);e.children=t,e.shapeFlag|=n}function vc(...e){const t={};for(let n=0;n<e.length;n++){const s=e[n];for(const r in s)if(r==="class")t.class!==s.class&&(t.class=Fn([t.class,s.class]));else if(r==="style")t.style=Nn([t.style,s.style]);else if(Pn(r)){const i=t[r],o=s[r];o&&i!==o&&!(j(i)&&i.includes(o))&&(t[r]=i?[].concat(i,o):o)}else r!==""&&(t[r]=s[r])}return t}function Ke(e,t,n,s=null){De(e,t,7,[n,s])}const _c=Yi();let bc=0;function Ec(e,t,n){const s=e.type,r=(t?t.appContext:e.appContext)||_c,i={uid:bc++,vnode:e,type:s,parent:t,appContext:r,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new ri(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:t?t.provides:Object.create(r.provides),ids:t?t.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:to(s,r),emitsOptions:fo(s,r),emit:null,emitted:null,propsDefaults:se,inheritAttrs:s.inheritAttrs,ctx:se,data:se,props:se,attrs:se,slots:se,refs:se,setupState:se,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return i.ctx={_:i},i.root=t?t.root:i,i.emit=cc.bind(null,i),e.ce&&e.ce(i),i}let he=null;const Ks=()=>he||de;let Tn,vs;{const e=Ln(),t=(n,s)=>{let r;return(r=e[n])||(r=e[n]=[]),r.push(s),i=>{r.length>1?r.forEach(o=>o(i)):r[0](i)}};Tn=t("__VUE_INSTANCE_SETTERS__",n=>he=n),vs=t("__VUE_SSR_SETTERS__",n=>sn=n)}const cn=e=>{const t=he;return Tn(e),e.scope.on(),()=>{e.scope.off(),Tn(t)}},hr=()=>{he&&he.scope.off(),Tn(null)};function go(e){return e.vnode.shapeFlag&4}let sn=!1;function Sc(e,t=!1,n=!1){t&&vs(t);const{props:s,children:r}=e.vnode,i=go(e);zl(e,s,i,t),Xl(e,r,n);const o=i?xc(e,t):void 0;return t&&vs(!1),o}function xc(e,t){const n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,Bl);const{setup:s}=n;if(s){ht();const r=e.setupContext=s.length>1?wc(e):null,i=cn(e),o=ln(s,e,0,[e.props,r]),l=Jr(o);if(pt(),i(),(l||e.sp)&&!Lt(e)&&ji(e),l){if(o.then(hr,hr),t)return o.then(c=>{pr(e,c)}).catch(c=>{Hn(c,e,0)});e.asyncDep=o}else pr(e,o)}else mo(e)}function pr(e,t,n){V(t)?e.type.__ssrInlineRender?e.ssrRender=t:e.render=t:oe(t)&&(e.setupState=Si(t)),mo(e)}function mo(e,t,n){const s=e.type;e.render||(e.render=s.render||qe);{const r=cn(e);ht();try{kl(e)}finally{pt(),r()}}}const Cc={get(e,t){return pe(e,"get",""),e[t]}};function wc(e){const t=n=>{e.exposed=n||{}};return{attrs:new Proxy(e.attrs,Cc),slots:e.slots,emit:e.emit,expose:t}}function Kn(e){return e.exposed?e.exposeProxy||(e.exposeProxy=new Proxy(Si(ml(e.exposed)),{get(t,n){if(n in t)return t[n];if(n in qt)return qt[n](e)},has(t,n){return n in t||n in qt}})):e.proxy}function Rc(e,t=!0){return V(e)?e.displayName||e.name:e.name||t&&e.__name}function Tc(e){return V(e)&&"__vccOpts"in e}const Fe=(e,t)=>Sl(e,t,sn);function Us(e,t,n){const s=arguments.length;return s===2?oe(t)&&!j(t)?nn(t)?me(e,null,[t]):me(e,t):me(e,null,t):(s>3?n=Array.prototype.slice.call(arguments,2):s===3&&nn(n)&&(n=[n]),me(e,t,n))}const Ac="3.5.13";/**
-* @vue/runtime-dom v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**/let _s;const gr=typeof window!="undefined"&&window.trustedTypes;if(gr)try{_s=gr.createPolicy("vue",{createHTML:e=>e})}catch(e){}const yo=_s?e=>_s.createHTML(e):e=>e,Pc="http://www.w3.org/2000/svg",Oc="http://www.w3.org/1998/Math/MathML",Je=typeof document!="undefined"?document:null,mr=Je&&Je.createElement("template"),Mc={insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{const t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,s)=>{const r=t==="svg"?Je.createElementNS(Pc,e):t==="mathml"?Je.createElementNS(Oc,e):n?Je.createElement(e,{is:n}):Je.createElement(e);return e==="select"&&s&&s.multiple!=null&&r.setAttribute("multiple",s.multiple),r},createText:e=>Je.createTextNode(e),createComment:e=>Je.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>Je.querySelector(e),setScopeId(e,t){e.setAttribute(t,"")},insertStaticContent(e,t,n,s,r,i){const o=n?n.previousSibling:t.lastChild;if(r&&(r===i||r.nextSibling))for(;t.insertBefore(r.cloneNode(!0),n),!(r===i||!(r=r.nextSibling)););else{mr.innerHTML=yo(s==="svg"?`<svg>${e}</svg>`:s==="mathml"?`<math>${e}</math>`:e);const l=mr.content;if(s==="svg"||s==="mathml"){const c=l.firstChild;for(;c.firstChild;)l.appendChild(c.firstChild);l.removeChild(c)}t.insertBefore(l,n)}return[o?o.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}},st="transition",Bt="animation",Ft=Symbol("_vtc"),vo={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String},_o=ue({},Ni,vo),Ic=e=>(e.displayName="Transition",e.props=_o,e),Tu=Ic((e,{slots:t})=>Us(Ml,bo(e),t)),yt=(e,t=[])=>{j(e)?e.forEach(n=>n(...t)):e&&e(...t)},yr=e=>e?j(e)?e.some(t=>t.length>1):e.length>1:!1;function bo(e){const t={};for(const I in e)I in vo||(t[I]=e[I]);if(e.css===!1)return t;const{name:n="v",type:s,duration:r,enterFromClass:i=`${n}-enter-from`,enterActiveClass:o=`${n}-enter-active`,enterToClass:l=`${n}-enter-to`,appearFromClass:c=i,appearActiveClass:u=o,appearToClass:f=l,leaveFromClass:d=`${n}-leave-from`,leaveActiveClass:p=`${n}-leave-active`,leaveToClass:m=`${n}-leave-to`}=e,S=Lc(r),x=S&&S[0],B=S&&S[1],{onBeforeEnter:L,onEnter:M,onEnterCancelled:N,onLeave:O,onLeaveCancelled:K,onBeforeAppear:W=L,onAppear:G=M,onAppearCancelled:le=N}=t,$=(I,Q,ae,we)=>{I._enterCancelled=we,it(I,Q?f:l),it(I,Q?u:o),ae&&ae()},U=(I,Q)=>{I._isLeaving=!1,it(I,d),it(I,m),it(I,p),Q&&Q()},Z=I=>(Q,ae)=>{const we=I?G:M,fe=()=>$(Q,I,ae);yt(we,[Q,fe]),vr(()=>{it(Q,I?c:i),Ue(Q,I?f:l),yr(we)||_r(Q,s,x,fe)})};return ue(t,{onBeforeEnter(I){yt(L,[I]),Ue(I,i),Ue(I,o)},onBeforeAppear(I){yt(W,[I]),Ue(I,c),Ue(I,u)},onEnter:Z(!1),onAppear:Z(!0),onLeave(I,Q){I._isLeaving=!0;const ae=()=>U(I,Q);Ue(I,d),I._enterCancelled?(Ue(I,p),bs()):(bs(),Ue(I,p)),vr(()=>{I._isLeaving&&(it(I,d),Ue(I,m),yr(O)||_r(I,s,B,ae))}),yt(O,[I,ae])},onEnterCancelled(I){$(I,!1,void 0,!0),yt(N,[I])},onAppearCancelled(I){$(I,!0,void 0,!0),yt(le,[I])},onLeaveCancelled(I){U(I),yt(K,[I])}})}function Lc(e){if(e==null)return null;if(oe(e))return[es(e.enter),es(e.leave)];{const t=es(e);return[t,t]}}function es(e){return Ko(e)}function Ue(e,t){t.split(/\s+/).forEach(n=>n&&e.classList.add(n)),(e[Ft]||(e[Ft]=new Set)).add(t)}function it(e,t){t.split(/\s+/).forEach(s=>s&&e.classList.remove(s));const n=e[Ft];n&&(n.delete(t),n.size||(e[Ft]=void 0))}function vr(e){requestAnimationFrame(()=>{requestAnimationFrame(e)})}let Nc=0;function _r(e,t,n,s){const r=e._endId=++Nc,i=()=>{r===e._endId&&s()};if(n!=null)return setTimeout(i,n);const{type:o,timeout:l,propCount:c}=Eo(e,t);if(!o)return s();const u=o+"end";let f=0;const d=()=>{e.removeEventListener(u,p),i()},p=m=>{m.target===e&&++f>=c&&d()};setTimeout(()=>{f<c&&d()},l+1),e.addEventListener(u,p)}function Eo(e,t){const n=window.getComputedStyle(e),s=S=>(n[S]||"").split(", "),r=s(`${st}Delay`),i=s(`${st}Duration`),o=br(r,i),l=s(`${Bt}Delay`),c=s(`${Bt}Duration`),u=br(l,c);let f=null,d=0,p=0;t===st?o>0&&(f=st,d=o,p=i.length):t===Bt?u>0&&(f=Bt,d=u,p=c.length):(d=Math.max(o,u),f=d>0?o>u?st:Bt:null,p=f?f===st?i.length:c.length:0);const m=f===st&&/\b(transform|all)(,|$)/.test(s(`${st}Property`).toString());return{type:f,timeout:d,propCount:p,hasTransform:m}}function br(e,t){for(;e.length<t.length;)e=e.concat(e);return Math.max(...t.map((n,s)=>Er(n)+Er(e[s])))}function Er(e){return e==="auto"?0:Number(e.slice(0,-1).replace(",","."))*1e3}function bs(){return document.body.offsetHeight}function Fc(e,t,n){const s=e[Ft];s&&(t=(t?[t,...s]:[...s]).join(" ")),t==null?e.removeAttribute("class"):n?e.setAttribute("class",t):e.className=t}const Sr=Symbol("_vod"),$c=Symbol("_vsh"),Dc=Symbol(""),Hc=/(^|;)\s*display\s*:/;function jc(e,t,n){const s=e.style,r=ce(n);let i=!1;if(n&&!r){if(t)if(ce(t))for(const o of t.split(";")){const l=o.slice(0,o.indexOf(":")).trim();n[l]==null&&En(s,l,"")}else for(const o in t)n[o]==null&&En(s,o,"");for(const o in n)o==="display"&&(i=!0),En(s,o,n[o])}else if(r){if(t!==n){const o=s[Dc];o&&(n+=";"+o),s.cssText=n,i=Hc.test(n)}}else t&&e.removeAttribute("style");Sr in e&&(e[Sr]=i?s.display:"",e[$c]&&(s.display="none"))}const xr=/\s*!important$/;function En(e,t,n){if(j(n))n.forEach(s=>En(e,t,s));else if(n==null&&(n=""),t.startsWith("--"))e.setProperty(t,n);else{const s=Bc(e,t);xr.test(n)?e.setProperty(dt(s),n.replace(xr,""),"important"):e[s]=n}}const Cr=["Webkit","Moz","ms"],ts={};function Bc(e,t){const n=ts[t];if(n)return n;let s=Ne(t);if(s!=="filter"&&s in e)return ts[t]=s;s=In(s);for(let r=0;r<Cr.length;r++){const i=Cr[r]+s;if(i in e)return ts[t]=i}return t}const wr="http://www.w3.org/1999/xlink";function Rr(e,t,n,s,r,i=Qo(t)){s&&t.startsWith("xlink:")?n==null?e.removeAttributeNS(wr,t.slice(6,t.length)):e.setAttributeNS(wr,t,n):n==null||i&&!ti(n)?e.removeAttribute(t):e.setAttribute(t,i?"":et(n)?String(n):n)}function Tr(e,t,n,s,r){if(t==="innerHTML"||t==="textContent"){n!=null&&(e[t]=t==="innerHTML"?yo(n):n);return}const i=e.tagName;if(t==="value"&&i!=="PROGRESS"&&!i.includes("-")){const l=i==="OPTION"?e.getAttribute("value")||"":e.value,c=n==null?e.type==="checkbox"?"on":"":String(n);(l!==c||!("_value"in e))&&(e.value=c),n==null&&e.removeAttribute(t),e._value=n;return}let o=!1;if(n===""||n==null){const l=typeof e[t];l==="boolean"?n=ti(n):n==null&&l==="string"?(n="",o=!0):l==="number"&&(n=0,o=!0)}try{e[t]=n}catch(l){}o&&e.removeAttribute(r||t)}function kc(e,t,n,s){e.addEventListener(t,n,s)}function Vc(e,t,n,s){e.removeEventListener(t,n,s)}const Ar=Symbol("_vei");function Kc(e,t,n,s,r=null){const i=e[Ar]||(e[Ar]={}),o=i[t];if(s&&o)o.value=s;else{const[l,c]=Uc(t);if(s){const u=i[t]=qc(s,r);kc(e,l,u,c)}else o&&(Vc(e,l,o,c),i[t]=void 0)}}const Pr=/(?:Once|Passive|Capture)$/;function Uc(e){let t;if(Pr.test(e)){t={};let s;for(;s=e.match(Pr);)e=e.slice(0,e.length-s[0].length),t[s[0].toLowerCase()]=!0}return[e[2]===":"?e.slice(3):dt(e.slice(2)),t]}let ns=0;const Wc=Promise.resolve(),Gc=()=>ns||(Wc.then(()=>ns=0),ns=Date.now());function qc(e,t){const n=s=>{if(!s._vts)s._vts=Date.now();else if(s._vts<=n.attached)return;De(zc(s,n.value),t,5,[s])};return n.value=e,n.attached=Gc(),n}function zc(e,t){if(j(t)){const n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(s=>r=>!r._stopped&&s&&s(r))}else return t}const Or=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)>96&&e.charCodeAt(2)<123,Qc=(e,t,n,s,r,i)=>{const o=r==="svg";t==="class"?Fc(e,s,o):t==="style"?jc(e,n,s):Pn(t)?ws(t)||Kc(e,t,n,s,i):(t[0]==="."?(t=t.slice(1),!0):t[0]==="^"?(t=t.slice(1),!1):Yc(e,t,s,o))?(Tr(e,t,s),!e.tagName.includes("-")&&(t==="value"||t==="checked"||t==="selected")&&Rr(e,t,s,o,i,t!=="value")):e._isVueCE&&(/[A-Z]/.test(t)||!ce(s))?Tr(e,Ne(t),s,i,t):(t==="true-value"?e._trueValue=s:t==="false-value"&&(e._falseValue=s),Rr(e,t,s,o))};function Yc(e,t,n,s){if(s)return!!(t==="innerHTML"||t==="textContent"||t in e&&Or(t)&&V(n));if(t==="spellcheck"||t==="draggable"||t==="translate"||t==="form"||t==="list"&&e.tagName==="INPUT"||t==="type"&&e.tagName==="TEXTAREA")return!1;if(t==="width"||t==="height"){const r=e.tagName;if(r==="IMG"||r==="VIDEO"||r==="CANVAS"||r==="SOURCE")return!1}return Or(t)&&ce(n)?!1:t in e}const So=new WeakMap,xo=new WeakMap,An=Symbol("_moveCb"),Mr=Symbol("_enterCb"),Jc=e=>(delete e.props.mode,e),Xc=Jc({name:"TransitionGroup",props:ue({},_o,{tag:String,moveClass:String}),setup(e,{slots:t}){const n=Ks(),s=Li();let r,i;return Ui(()=>{if(!r.length)return;const o=e.moveClass||`${e.name||"v"}-move`;if(!nf(r[0].el,n.vnode.el,o))return;r.forEach(Zc),r.forEach(ef);const l=r.filter(tf);bs(),l.forEach(c=>{const u=c.el,f=u.style;Ue(u,o),f.transform=f.webkitTransform=f.transitionDuration="";const d=u[An]=p=>{p&&p.target!==u||(!p||/transform$/.test(p.propertyName))&&(u.removeEventListener("transitionend",d),u[An]=null,it(u,o))};u.addEventListener("transitionend",d)})}),()=>{const o=z(e),l=bo(o);let c=o.tag||Ce;if(r=[],i)for(let u=0;u<i.length;u++){const f=i[u];f.el&&f.el instanceof Element&&(r.push(f),St(f,en(f,l,s,n)),So.set(f,f.el.getBoundingClientRect()))}i=t.default?$s(t.default()):[];for(let u=0;u<i.length;u++){const f=i[u];f.key!=null&&St(f,en(f,l,s,n))}return me(c,null,i)}}}),Au=Xc;function Zc(e){const t=e.el;t[An]&&t[An](),t[Mr]&&t[Mr]()}function ef(e){xo.set(e,e.el.getBoundingClientRect())}function tf(e){const t=So.get(e),n=xo.get(e),s=t.left-n.left,r=t.top-n.top;if(s||r){const i=e.el.style;return i.transform=i.webkitTransform=`translate(${s}px,${r}px)`,i.transitionDuration="0s",e}}function nf(e,t,n){const s=e.cloneNode(),r=e[Ft];r&&r.forEach(l=>{l.split(/\s+/).forEach(c=>c&&s.classList.remove(c))}),n.split(/\s+/).forEach(l=>l&&s.classList.add(l)),s.style.display="none";const i=t.nodeType===1?t:t.parentNode;i.appendChild(s);const{hasTransform:o}=Eo(s);return i.removeChild(s),o}const sf=["ctrl","shift","alt","meta"],rf={stop:e=>e.stopPropagation(),prevent:e=>e.preventDefault(),self:e=>e.target!==e.currentTarget,ctrl:e=>!e.ctrlKey,shift:e=>!e.shiftKey,alt:e=>!e.altKey,meta:e=>!e.metaKey,left:e=>"button"in e&&e.button!==0,middle:e=>"button"in e&&e.button!==1,right:e=>"button"in e&&e.button!==2,exact:(e,t)=>sf.some(n=>e[`${n}Key`]&&!t.includes(n))},Pu=(e,t)=>{const n=e._withMods||(e._withMods={}),s=t.join(".");return n[s]||(n[s]=(r,...i)=>{for(let o=0;o<t.length;o++){const l=rf[t[o]];if(l&&l(r,t))return}return e(r,...i)})},of={esc:"escape",space:" ",up:"arrow-up",left:"arrow-left",right:"arrow-right",down:"arrow-down",delete:"backspace"},Ou=(e,t)=>{const n=e._withKeys||(e._withKeys={}),s=t.join(".");return n[s]||(n[s]=r=>{if(!("key"in r))return;const i=dt(r.key);if(t.some(o=>o===i||of[o]===i))return e(r)})},lf=ue({patchProp:Qc},Mc);let Ir;function cf(){return Ir||(Ir=ec(lf))}const Mu=(...e)=>{const t=cf().createApp(...e),{mount:n}=t;return t.mount=s=>{const r=uf(s);if(!r)return;const i=t._component;!V(i)&&!i.render&&!i.template&&(i.template=r.innerHTML),r.nodeType===1&&(r.textContent="");const o=n(r,!1,ff(r));return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),o},t};function ff(e){if(e instanceof SVGElement)return"svg";if(typeof MathMLElement=="function"&&e instanceof MathMLElement)return"mathml"}function uf(e){return ce(e)?document.querySelector(e):e}/*!
-  * vue-router v4.5.0
-  * (c) 2024 Eduardo San Martin Morote
-  * @license MIT
-  */const Tt=typeof document!="undefined";function Co(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function af(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&Co(e.default)}const J=Object.assign;function ss(e,t){const n={};for(const s in t){const r=t[s];n[s]=He(r)?r.map(e):e(r)}return n}const Qt=()=>{},He=Array.isArray,wo=/#/g,df=/&/g,hf=/\//g,pf=/=/g,gf=/\?/g,Ro=/\+/g,mf=/%5B/g,yf=/%5D/g,To=/%5E/g,vf=/%60/g,Ao=/%7B/g,_f=/%7C/g,Po=/%7D/g,bf=/%20/g;function Ws(e){return encodeURI(""+e).replace(_f,"|").replace(mf,"[").replace(yf,"]")}function Ef(e){return Ws(e).replace(Ao,"{").replace(Po,"}").replace(To,"^")}function Es(e){return Ws(e).replace(Ro,"%2B").replace(bf,"+").replace(wo,"%23").replace(df,"%26").replace(vf,"`").replace(Ao,"{").replace(Po,"}").replace(To,"^")}function Sf(e){return Es(e).replace(pf,"%3D")}function xf(e){return Ws(e).replace(wo,"%23").replace(gf,"%3F")}function Cf(e){return e==null?"":xf(e).replace(hf,"%2F")}function rn(e){try{return decodeURIComponent(""+e)}catch(t){}return""+e}const wf=/\/$/,Rf=e=>e.replace(wf,"");function rs(e,t,n="/"){let s,r={},i="",o="";const l=t.indexOf("#");let c=t.indexOf("?");return l<c&&l>=0&&(c=-1),c>-1&&(s=t.slice(0,c),i=t.slice(c+1,l>-1?l:t.length),r=e(i)),l>-1&&(s=s||t.slice(0,l),o=t.slice(l,t.length)),s=Of(s!=null?s:t,n),{fullPath:s+(i&&"?")+i+o,path:s,query:r,hash:rn(o)}}function Tf(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function Lr(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function Af(e,t,n){const s=t.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&$t(t.matched[s],n.matched[r])&&Oo(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function $t(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function Oo(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!Pf(e[n],t[n]))return!1;return!0}function Pf(e,t){return He(e)?Nr(e,t):He(t)?Nr(t,e):e===t}function Nr(e,t){return He(t)?e.length===t.length&&e.every((n,s)=>n===t[s]):e.length===1&&e[0]===t}function Of(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),s=e.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,l;for(o=0;o<s.length;o++)if(l=s[o],l!==".")if(l==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const rt={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var on;(function(e){e.pop="pop",e.push="push"})(on||(on={}));var Yt;(function(e){e.back="back",e.forward="forward",e.unknown=""})(Yt||(Yt={}));function Mf(e){if(!e)if(Tt){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Rf(e)}const If=/^[^#]+#/;function Lf(e,t){return e.replace(If,"#")+t}function Nf(e,t){const n=document.documentElement.getBoundingClientRect(),s=e.getBoundingClientRect();return{behavior:t.behavior,left:s.left-n.left-(t.left||0),top:s.top-n.top-(t.top||0)}}const Un=()=>({left:window.scrollX,top:window.scrollY});function Ff(e){let t;if("el"in e){const n=e.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;t=Nf(r,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function Fr(e,t){return(history.state?history.state.position-t:-1)+e}const Ss=new Map;function $f(e,t){Ss.set(e,t)}function Df(e){const t=Ss.get(e);return Ss.delete(e),t}let Hf=()=>location.protocol+"//"+location.host;function Mo(e,t){const{pathname:n,search:s,hash:r}=t,i=e.indexOf("#");if(i>-1){let l=r.includes(e.slice(i))?e.slice(i).length:1,c=r.slice(l);return c[0]!=="/"&&(c="/"+c),Lr(c,"")}return Lr(n,e)+s+r}function jf(e,t,n,s){let r=[],i=[],o=null;const l=({state:p})=>{const m=Mo(e,location),S=n.value,x=t.value;let B=0;if(p){if(n.value=m,t.value=p,o&&o===S){o=null;return}B=x?p.position-x.position:0}else s(m);r.forEach(L=>{L(n.value,S,{delta:B,type:on.pop,direction:B?B>0?Yt.forward:Yt.back:Yt.unknown})})};function c(){o=n.value}function u(p){r.push(p);const m=()=>{const S=r.indexOf(p);S>-1&&r.splice(S,1)};return i.push(m),m}function f(){const{history:p}=window;p.state&&p.replaceState(J({},p.state,{scroll:Un()}),"")}function d(){for(const p of i)p();i=[],window.removeEventListener("popstate",l),window.removeEventListener("beforeunload",f)}return window.addEventListener("popstate",l),window.addEventListener("beforeunload",f,{passive:!0}),{pauseListeners:c,listen:u,destroy:d}}function $r(e,t,n,s=!1,r=!1){return{back:e,current:t,forward:n,replaced:s,position:window.history.length,scroll:r?Un():null}}function Bf(e){const{history:t,location:n}=window,s={value:Mo(e,n)},r={value:t.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(c,u,f){const d=e.indexOf("#"),p=d>-1?(n.host&&document.querySelector("base")?e:e.slice(d))+c:Hf()+e+c;try{t[f?"replaceState":"pushState"](u,"",p),r.value=u}catch(m){console.error(m),n[f?"replace":"assign"](p)}}function o(c,u){const f=J({},t.state,$r(r.value.back,c,r.value.forward,!0),u,{position:r.value.position});i(c,f,!0),s.value=c}function l(c,u){const f=J({},r.value,t.state,{forward:c,scroll:Un()});i(f.current,f,!0);const d=J({},$r(s.value,c,null),{position:f.position+1},u);i(c,d,!1),s.value=c}return{location:s,state:r,push:l,replace:o}}function Iu(e){e=Mf(e);const t=Bf(e),n=jf(e,t.state,t.location,t.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=J({location:"",base:e,go:s,createHref:Lf.bind(null,e)},t,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>t.state.value}),r}function kf(e){return typeof e=="string"||e&&typeof e=="object"}function Io(e){return typeof e=="string"||typeof e=="symbol"}const Lo=Symbol("");var Dr;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(Dr||(Dr={}));function Dt(e,t){return J(new Error,{type:e,[Lo]:!0},t)}function Ye(e,t){return e instanceof Error&&Lo in e&&(t==null||!!(e.type&t))}const Hr="[^/]+?",Vf={sensitive:!1,strict:!1,start:!0,end:!0},Kf=/[.+*?^${}()[\]/\\]/g;function Uf(e,t){const n=J({},Vf,t),s=[];let r=n.start?"^":"";const i=[];for(const u of e){const f=u.length?[]:[90];n.strict&&!u.length&&(r+="/");for(let d=0;d<u.length;d++){const p=u[d];let m=40+(n.sensitive?.25:0);if(p.type===0)d||(r+="/"),r+=p.value.replace(Kf,"\\$&"),m+=40;else if(p.type===1){const{value:S,repeatable:x,optional:B,regexp:L}=p;i.push({name:S,repeatable:x,optional:B});const M=L||Hr;if(M!==Hr){m+=10;try{new RegExp(`(${M})`)}catch(O){throw new Error(`Invalid custom RegExp for param "${S}" (${M}): `+O.message)}}let N=x?`((?:${M})(?:/(?:${M}))*)`:`(${M})`;d||(N=B&&u.length<2?`(?:/${N})`:"/"+N),B&&(N+="?"),r+=N,m+=20,B&&(m+=-8),x&&(m+=-20),M===".*"&&(m+=-50)}f.push(m)}s.push(f)}if(n.strict&&n.end){const u=s.length-1;s[u][s[u].length-1]+=.7000000000000001}n.strict||(r+="/?"),n.end?r+="$":n.strict&&!r.endsWith("/")&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function l(u){const f=u.match(o),d={};if(!f)return null;for(let p=1;p<f.length;p++){const m=f[p]||"",S=i[p-1];d[S.name]=m&&S.repeatable?m.split("/"):m}return d}function c(u){let f="",d=!1;for(const p of e){(!d||!f.endsWith("/"))&&(f+="/"),d=!1;for(const m of p)if(m.type===0)f+=m.value;else if(m.type===1){const{value:S,repeatable:x,optional:B}=m,L=S in u?u[S]:"";if(He(L)&&!x)throw new Error(`Provided param "${S}" is an array but it is not repeatable (* or + modifiers)`);const M=He(L)?L.join("/"):L;if(!M)if(B)p.length<2&&(f.endsWith("/")?f=f.slice(0,-1):d=!0);else throw new Error(`Missing required param "${S}"`);f+=M}}return f||"/"}return{re:o,score:s,keys:i,parse:l,stringify:c}}function Wf(e,t){let n=0;for(;n<e.length&&n<t.length;){const s=t[n]-e[n];if(s)return s;n++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function No(e,t){let n=0;const s=e.score,r=t.score;for(;n<s.length&&n<r.length;){const i=Wf(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(jr(s))return 1;if(jr(r))return-1}return r.length-s.length}function jr(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const Gf={type:0,value:""},qf=/[a-zA-Z0-9_]/;function zf(e){if(!e)return[[]];if(e==="/")return[[Gf]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(m){throw new Error(`ERR (${n})/"${u}": ${m}`)}let n=0,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let l=0,c,u="",f="";function d(){u&&(n===0?i.push({type:0,value:u}):n===1||n===2||n===3?(i.length>1&&(c==="*"||c==="+")&&t(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:f,repeatable:c==="*"||c==="+",optional:c==="*"||c==="?"})):t("Invalid state to consume buffer"),u="")}function p(){u+=c}for(;l<e.length;){if(c=e[l++],c==="\\"&&n!==2){s=n,n=4;continue}switch(n){case 0:c==="/"?(u&&d(),o()):c===":"?(d(),n=1):p();break;case 4:p(),n=s;break;case 1:c==="("?n=2:qf.test(c)?p():(d(),n=0,c!=="*"&&c!=="?"&&c!=="+"&&l--);break;case 2:c===")"?f[f.length-1]=="\\"?f=f.slice(0,-1)+c:n=3:f+=c;break;case 3:d(),n=0,c!=="*"&&c!=="?"&&c!=="+"&&l--,f="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${u}"`),d(),o(),r}function Qf(e,t,n){const s=Uf(zf(e.path),n),r=J(s,{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function Yf(e,t){const n=[],s=new Map;t=Kr({strict:!1,end:!0,sensitive:!1},t);function r(d){return s.get(d)}function i(d,p,m){const S=!m,x=kr(d);x.aliasOf=m&&m.record;const B=Kr(t,d),L=[x];if("alias"in d){const O=typeof d.alias=="string"?[d.alias]:d.alias;for(const K of O)L.push(kr(J({},x,{components:m?m.record.components:x.components,path:K,aliasOf:m?m.record:x})))}let M,N;for(const O of L){const{path:K}=O;if(p&&K[0]!=="/"){const W=p.record.path,G=W[W.length-1]==="/"?"":"/";O.path=p.record.path+(K&&G+K)}if(M=Qf(O,p,B),m?m.alias.push(M):(N=N||M,N!==M&&N.alias.push(M),S&&d.name&&!Vr(M)&&o(d.name)),Fo(M)&&c(M),x.children){const W=x.children;for(let G=0;G<W.length;G++)i(W[G],M,m&&m.children[G])}m=m||M}return N?()=>{o(N)}:Qt}function o(d){if(Io(d)){const p=s.get(d);p&&(s.delete(d),n.splice(n.indexOf(p),1),p.children.forEach(o),p.alias.forEach(o))}else{const p=n.indexOf(d);p>-1&&(n.splice(p,1),d.record.name&&s.delete(d.record.name),d.children.forEach(o),d.alias.forEach(o))}}function l(){return n}function c(d){const p=Zf(d,n);n.splice(p,0,d),d.record.name&&!Vr(d)&&s.set(d.record.name,d)}function u(d,p){let m,S={},x,B;if("name"in d&&d.name){if(m=s.get(d.name),!m)throw Dt(1,{location:d});B=m.record.name,S=J(Br(p.params,m.keys.filter(N=>!N.optional).concat(m.parent?m.parent.keys.filter(N=>N.optional):[]).map(N=>N.name)),d.params&&Br(d.params,m.keys.map(N=>N.name))),x=m.stringify(S)}else if(d.path!=null)x=d.path,m=n.find(N=>N.re.test(x)),m&&(S=m.parse(x),B=m.record.name);else{if(m=p.name?s.get(p.name):n.find(N=>N.re.test(p.path)),!m)throw Dt(1,{location:d,currentLocation:p});B=m.record.name,S=J({},p.params,d.params),x=m.stringify(S)}const L=[];let M=m;for(;M;)L.unshift(M.record),M=M.parent;return{name:B,path:x,params:S,matched:L,meta:Xf(L)}}e.forEach(d=>i(d));function f(){n.length=0,s.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:f,getRoutes:l,getRecordMatcher:r}}function Br(e,t){const n={};for(const s of t)s in e&&(n[s]=e[s]);return n}function kr(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Jf(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Jf(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const s in e.components)t[s]=typeof n=="object"?n[s]:n;return t}function Vr(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Xf(e){return e.reduce((t,n)=>J(t,n.meta),{})}function Kr(e,t){const n={};for(const s in e)n[s]=s in t?t[s]:e[s];return n}function Zf(e,t){let n=0,s=t.length;for(;n!==s;){const i=n+s>>1;No(e,t[i])<0?s=i:n=i+1}const r=eu(e);return r&&(s=t.lastIndexOf(r,s-1)),s}function eu(e){let t=e;for(;t=t.parent;)if(Fo(t)&&No(e,t)===0)return t}function Fo({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function tu(e){const t={};if(e===""||e==="?")return t;const s=(e[0]==="?"?e.slice(1):e).split("&");for(let r=0;r<s.length;++r){const i=s[r].replace(Ro," "),o=i.indexOf("="),l=rn(o<0?i:i.slice(0,o)),c=o<0?null:rn(i.slice(o+1));if(l in t){let u=t[l];He(u)||(u=t[l]=[u]),u.push(c)}else t[l]=c}return t}function Ur(e){let t="";for(let n in e){const s=e[n];if(n=Sf(n),s==null){s!==void 0&&(t+=(t.length?"&":"")+n);continue}(He(s)?s.map(i=>i&&Es(i)):[s&&Es(s)]).forEach(i=>{i!==void 0&&(t+=(t.length?"&":"")+n,i!=null&&(t+="="+i))})}return t}function nu(e){const t={};for(const n in e){const s=e[n];s!==void 0&&(t[n]=He(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return t}const $o=Symbol(""),Wr=Symbol(""),Wn=Symbol(""),Gs=Symbol(""),xs=Symbol("");function kt(){let e=[];function t(s){return e.push(s),()=>{const r=e.indexOf(s);r>-1&&e.splice(r,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function su(e,t,n){const s=()=>{e[t].delete(n)};Ds(s),ki(s),Bi(()=>{e[t].add(n)}),e[t].add(n)}function Lu(e){const t=Le($o,{}).value;t&&su(t,"leaveGuards",e)}function ft(e,t,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((l,c)=>{const u=p=>{p===!1?c(Dt(4,{from:n,to:t})):p instanceof Error?c(p):kf(p)?c(Dt(2,{from:t,to:p})):(o&&s.enterCallbacks[r]===o&&typeof p=="function"&&o.push(p),l())},f=i(()=>e.call(s&&s.instances[r],t,n,u));let d=Promise.resolve(f);e.length<3&&(d=d.then(u)),d.catch(p=>c(p))})}function is(e,t,n,s,r=i=>i()){const i=[];for(const o of e)for(const l in o.components){let c=o.components[l];if(!(t!=="beforeRouteEnter"&&!o.instances[l]))if(Co(c)){const f=(c.__vccOpts||c)[t];f&&i.push(ft(f,n,s,o,l,r))}else{let u=c();i.push(()=>u.then(f=>{if(!f)throw new Error(`Couldn't resolve component "${l}" at "${o.path}"`);const d=af(f)?f.default:f;o.mods[l]=f,o.components[l]=d;const m=(d.__vccOpts||d)[t];return m&&ft(m,n,s,o,l,r)()}))}}return i}function Gr(e){const t=Le(Wn),n=Le(Gs),s=Fe(()=>{const c=Mt(e.to);return t.resolve(c)}),r=Fe(()=>{const{matched:c}=s.value,{length:u}=c,f=c[u-1],d=n.matched;if(!f||!d.length)return-1;const p=d.findIndex($t.bind(null,f));if(p>-1)return p;const m=qr(c[u-2]);return u>1&&qr(f)===m&&d[d.length-1].path!==m?d.findIndex($t.bind(null,c[u-2])):p}),i=Fe(()=>r.value>-1&&cu(n.params,s.value.params)),o=Fe(()=>r.value>-1&&r.value===n.matched.length-1&&Oo(n.params,s.value.params));function l(c={}){if(lu(c)){const u=t[Mt(e.replace)?"replace":"push"](Mt(e.to)).catch(Qt);return e.viewTransition&&typeof document!="undefined"&&"startViewTransition"in document&&document.startViewTransition(()=>u),u}return Promise.resolve()}return{route:s,href:Fe(()=>s.value.href),isActive:i,isExactActive:o,navigate:l}}function ru(e){return e.length===1?e[0]:e}const iu=Hi({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:Gr,setup(e,{slots:t}){const n=Dn(Gr(e)),{options:s}=Le(Wn),r=Fe(()=>({[zr(e.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[zr(e.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=t.default&&ru(t.default(n));return e.custom?i:Us("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),ou=iu;function lu(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function cu(e,t){for(const n in t){const s=t[n],r=e[n];if(typeof s=="string"){if(s!==r)return!1}else if(!He(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function qr(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const zr=(e,t,n)=>e!=null?e:t!=null?t:n,fu=Hi({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const s=Le(xs),r=Fe(()=>e.route||s.value),i=Le(Wr,0),o=Fe(()=>{let u=Mt(i);const{matched:f}=r.value;let d;for(;(d=f[u])&&!d.components;)u++;return u}),l=Fe(()=>r.value.matched[o.value]);yn(Wr,Fe(()=>o.value+1)),yn($o,l),yn(xs,r);const c=yl();return vn(()=>[c.value,l.value,e.name],([u,f,d],[p,m,S])=>{f&&(f.instances[d]=u,m&&m!==f&&u&&u===p&&(f.leaveGuards.size||(f.leaveGuards=m.leaveGuards),f.updateGuards.size||(f.updateGuards=m.updateGuards))),u&&f&&(!m||!$t(f,m)||!p)&&(f.enterCallbacks[d]||[]).forEach(x=>x(u))},{flush:"post"}),()=>{const u=r.value,f=e.name,d=l.value,p=d&&d.components[f];if(!p)return Qr(n.default,{Component:p,route:u});const m=d.props[f],S=m?m===!0?u.params:typeof m=="function"?m(u):m:null,B=Us(p,J({},S,t,{onVnodeUnmounted:L=>{L.component.isUnmounted&&(d.instances[f]=null)},ref:c}));return Qr(n.default,{Component:B,route:u})||B}}});function Qr(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const uu=fu;function Nu(e){const t=Yf(e.routes,e),n=e.parseQuery||tu,s=e.stringifyQuery||Ur,r=e.history,i=kt(),o=kt(),l=kt(),c=vl(rt);let u=rt;Tt&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const f=ss.bind(null,v=>""+v),d=ss.bind(null,Cf),p=ss.bind(null,rn);function m(v,P){let T,F;return Io(v)?(T=t.getRecordMatcher(v),F=P):F=v,t.addRoute(F,T)}function S(v){const P=t.getRecordMatcher(v);P&&t.removeRoute(P)}function x(){return t.getRoutes().map(v=>v.record)}function B(v){return!!t.getRecordMatcher(v)}function L(v,P){if(P=J({},P||c.value),typeof v=="string"){const g=rs(n,v,P.path),y=t.resolve({path:g.path},P),b=r.createHref(g.fullPath);return J(g,y,{params:p(y.params),hash:rn(g.hash),redirectedFrom:void 0,href:b})}let T;if(v.path!=null)T=J({},v,{path:rs(n,v.path,P.path).path});else{const g=J({},v.params);for(const y in g)g[y]==null&&delete g[y];T=J({},v,{params:d(g)}),P.params=d(P.params)}const F=t.resolve(T,P),ne=v.hash||"";F.params=f(p(F.params));const a=Tf(s,J({},v,{hash:Ef(ne),path:F.path})),h=r.createHref(a);return J({fullPath:a,hash:ne,query:s===Ur?nu(v.query):v.query||{}},F,{redirectedFrom:void 0,href:h})}function M(v){return typeof v=="string"?rs(n,v,c.value.path):J({},v)}function N(v,P){if(u!==v)return Dt(8,{from:P,to:v})}function O(v){return G(v)}function K(v){return O(J(M(v),{replace:!0}))}function W(v){const P=v.matched[v.matched.length-1];if(P&&P.redirect){const{redirect:T}=P;let F=typeof T=="function"?T(v):T;return typeof F=="string"&&(F=F.includes("?")||F.includes("#")?F=M(F):{path:F},F.params={}),J({query:v.query,hash:v.hash,params:F.path!=null?{}:v.params},F)}}function G(v,P){const T=u=L(v),F=c.value,ne=v.state,a=v.force,h=v.replace===!0,g=W(T);if(g)return G(J(M(g),{state:typeof g=="object"?J({},ne,g.state):ne,force:a,replace:h}),P||T);const y=T;y.redirectedFrom=P;let b;return!a&&Af(s,F,T)&&(b=Dt(16,{to:y,from:F}),je(F,F,!0,!1)),(b?Promise.resolve(b):U(y,F)).catch(_=>Ye(_)?Ye(_,2)?_:nt(_):Y(_,y,F)).then(_=>{if(_){if(Ye(_,2))return G(J({replace:h},M(_.to),{state:typeof _.to=="object"?J({},ne,_.to.state):ne,force:a}),P||y)}else _=I(y,F,!0,h,ne);return Z(y,F,_),_})}function le(v,P){const T=N(v,P);return T?Promise.reject(T):Promise.resolve()}function $(v){const P=Ct.values().next().value;return P&&typeof P.runWithContext=="function"?P.runWithContext(v):v()}function U(v,P){let T;const[F,ne,a]=au(v,P);T=is(F.reverse(),"beforeRouteLeave",v,P);for(const g of F)g.leaveGuards.forEach(y=>{T.push(ft(y,v,P))});const h=le.bind(null,v,P);return T.push(h),Oe(T).then(()=>{T=[];for(const g of i.list())T.push(ft(g,v,P));return T.push(h),Oe(T)}).then(()=>{T=is(ne,"beforeRouteUpdate",v,P);for(const g of ne)g.updateGuards.forEach(y=>{T.push(ft(y,v,P))});return T.push(h),Oe(T)}).then(()=>{T=[];for(const g of a)if(g.beforeEnter)if(He(g.beforeEnter))for(const y of g.beforeEnter)T.push(ft(y,v,P));else T.push(ft(g.beforeEnter,v,P));return T.push(h),Oe(T)}).then(()=>(v.matched.forEach(g=>g.enterCallbacks={}),T=is(a,"beforeRouteEnter",v,P,$),T.push(h),Oe(T))).then(()=>{T=[];for(const g of o.list())T.push(ft(g,v,P));return T.push(h),Oe(T)}).catch(g=>Ye(g,8)?g:Promise.reject(g))}function Z(v,P,T){l.list().forEach(F=>$(()=>F(v,P,T)))}function I(v,P,T,F,ne){const a=N(v,P);if(a)return a;const h=P===rt,g=Tt?history.state:{};T&&(F||h?r.replace(v.fullPath,J({scroll:h&&g&&g.scroll},ne)):r.push(v.fullPath,ne)),c.value=v,je(v,P,T,h),nt()}let Q;function ae(){Q||(Q=r.listen((v,P,T)=>{if(!fn.listening)return;const F=L(v),ne=W(F);if(ne){G(J(ne,{replace:!0,force:!0}),F).catch(Qt);return}u=F;const a=c.value;Tt&&$f(Fr(a.fullPath,T.delta),Un()),U(F,a).catch(h=>Ye(h,12)?h:Ye(h,2)?(G(J(M(h.to),{force:!0}),F).then(g=>{Ye(g,20)&&!T.delta&&T.type===on.pop&&r.go(-1,!1)}).catch(Qt),Promise.reject()):(T.delta&&r.go(-T.delta,!1),Y(h,F,a))).then(h=>{h=h||I(F,a,!1),h&&(T.delta&&!Ye(h,8)?r.go(-T.delta,!1):T.type===on.pop&&Ye(h,20)&&r.go(-1,!1)),Z(F,a,h)}).catch(Qt)}))}let we=kt(),fe=kt(),te;function Y(v,P,T){nt(v);const F=fe.list();return F.length?F.forEach(ne=>ne(v,P,T)):console.error(v),Promise.reject(v)}function ze(){return te&&c.value!==rt?Promise.resolve():new Promise((v,P)=>{we.add([v,P])})}function nt(v){return te||(te=!v,ae(),we.list().forEach(([P,T])=>v?T(v):P()),we.reset()),v}function je(v,P,T,F){const{scrollBehavior:ne}=e;if(!Tt||!ne)return Promise.resolve();const a=!T&&Df(Fr(v.fullPath,0))||(F||!T)&&history.state&&history.state.scroll||null;return Ci().then(()=>ne(v,P,a)).then(h=>h&&Ff(h)).catch(h=>Y(h,v,P))}const Se=v=>r.go(v);let xt;const Ct=new Set,fn={currentRoute:c,listening:!0,addRoute:m,removeRoute:S,clearRoutes:t.clearRoutes,hasRoute:B,getRoutes:x,resolve:L,options:e,push:O,replace:K,go:Se,back:()=>Se(-1),forward:()=>Se(1),beforeEach:i.add,beforeResolve:o.add,afterEach:l.add,onError:fe.add,isReady:ze,install(v){const P=this;v.component("RouterLink",ou),v.component("RouterView",uu),v.config.globalProperties.$router=P,Object.defineProperty(v.config.globalProperties,"$route",{enumerable:!0,get:()=>Mt(c)}),Tt&&!xt&&c.value===rt&&(xt=!0,O(r.location).catch(ne=>{}));const T={};for(const ne in rt)Object.defineProperty(T,ne,{get:()=>c.value[ne],enumerable:!0});v.provide(Wn,P),v.provide(Gs,_i(T)),v.provide(xs,c);const F=v.unmount;Ct.add(v),v.unmount=function(){Ct.delete(v),Ct.size<1&&(u=rt,Q&&Q(),Q=null,c.value=rt,xt=!1,te=!1),F()}}};function Oe(v){return v.reduce((P,T)=>P.then(()=>$(T)),Promise.resolve())}return fn}function au(e,t){const n=[],s=[],r=[],i=Math.max(t.matched.length,e.matched.length);for(let o=0;o<i;o++){const l=t.matched[o];l&&(e.matched.find(u=>$t(u,l))?s.push(l):n.push(l));const c=e.matched[o];c&&(t.matched.find(u=>$t(u,c))||r.push(c))}return[n,s,r]}function Fu(){return Le(Wn)}function $u(e){return Le(Gs)}export{Iu as $,bu as A,Nn as B,Tu as C,Eu as D,xu as E,Ce as F,Pu as G,Ou as H,Fe as I,Dn as J,mc as K,hu as L,vl as M,ye as N,Hi as O,Us as P,Ds as Q,Ll as R,Vn as S,gu as T,$u as U,Fu as V,Mt as W,wu as X,Wi as Y,Lu as Z,Nu as _,bi as a,Mu as a0,ms as b,Cu as c,po as d,Su as e,yc as f,Ks as g,yu as h,_u as i,pu as j,ys as k,Al as l,vc as m,Ci as n,Ki as o,Ru as p,Fn as q,yl as r,vu as s,Yo as t,mu as u,Le as v,vn as w,du as x,me as y,Au as z};
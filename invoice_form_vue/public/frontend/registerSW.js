@@ -1 +0,0 @@
-if('serviceWorker' in navigator) {window.addEventListener('load', () => {navigator.serviceWorker.register('/assets/invoice_form_vue/frontend/sw.js', { scope: '/assets/invoice_form_vue/frontend/' })})}
\ No newline at end of file
@@ -1 +0,0 @@
-if(!self.define){let e,i={};const s=(s,n)=>(s=new URL(s+".js",n).href,i[s]||new Promise((i=>{if("document"in self){const e=document.createElement("script");e.src=s,e.onload=i,document.head.appendChild(e)}else e=s,importScripts(s),i()})).then((()=>{let e=i[s];if(!e)throw new Error(`Module ${s} didn’t register its module`);return e})));self.define=(n,r)=>{const o=e||("document"in self?document.currentScript.src:"")||location.href;if(i[o])return;let t={};const l=e=>s(e,o),c={module:{uri:o},exports:t,require:l};i[o]=Promise.all(n.map((e=>c[e]||l(e)))).then((e=>(r(...e),t)))}}define(["./workbox-1504e367"],(function(e){"use strict";self.skipWaiting(),e.clientsClaim(),e.precacheAndRoute([{url:"assets/index-Cg6FQnJR.css",revision:null},{url:"assets/index-Y1QEjqEa.js",revision:null},{url:"assets/ui-CxbnjGu9.js",revision:null},{url:"assets/vendor-CQUOWwJw.js",revision:null},{url:"index.html",revision:"8d627bad1efec88f0dcc093bc87dfdc9"},{url:"registerSW.js",revision:"b2fafe7bb4248cfb798fcfb55172a743"},{url:"favicon.ico",revision:"afa928c83de61590ceda668aabdfdaf3"},{url:"manifest.webmanifest",revision:"f3a5374cafb1a3022e20e8d0eb1223dd"}],{}),e.cleanupOutdatedCaches(),e.registerRoute(new e.NavigationRoute(e.createHandlerBoundToURL("/invoice_form/index.html"),{denylist:[/^\/_/,/\/[^/?]+\.[^/]+$/,/^\/api/,/^\/app/,/^\/login/,/^\/assets/,/^\/files/,/^\/private/]})),e.registerRoute(/^\/invoice_form\//,new e.NetworkFirst({cacheName:"invoice-app-pages",networkTimeoutSeconds:3,plugins:[]}),"GET")}));
@@ -0,0 +1,70 @@
+import frappe
+
+from invoice_form_vue import permissions
+
+# Realtime events the SPA listens to (see frontend/src/controllers/realtime.js)
+INVOICE_EVENT = "invoice_form_update"
+LOCK_EVENT = "invoice_form_lock"
+BULK_EVENT = "invoice_form_bulk_progress"
+CREDIT_LIMIT_EVENT = "invoice_form_credit_limit_hold"
+
+
+def get_invoice_summary(doc):
+    """Fields of an Invoice Form the SPA needs to patch a row of its lists."""
+    return {
+        "name": doc.name,
+        "supplier": doc.supplier,
+        "supplier_name": doc.get("supplier_name"),
+        "customer": doc.customer,
+        "owner": doc.owner,
+        "posting_date": str(doc.posting_date) if doc.posting_date else None,
+        "is_draft": doc.get("is_draft"),
+        "docstatus": doc.docstatus,
+        "lock_update": doc.get("lock_update"),
+        "item_count": len(doc.items),
+        "modified": str(doc.modified),
+    }
+
+
+def get_recipients(doc):
+    """The owner of the invoice and everyone working on its pamper."""
+    recipients = set(permissions.get_pamper_users(doc.get("pamper")))
+    recipients.add(doc.owner)
+    return recipients
+
+
+def publish_invoice_event(doc, action):
+    """
+    Push an Invoice Form change to its recipients once the transaction commits.
+
+    `action` is "update", "submit", "cancel" or "delete"; deletes carry only the name.
+    """
+    message = {"action": action, "invoice": get_invoice_summary(doc) if action != "delete" else {"name": doc.name}}
+    for user in get_recipients(doc):
+        frappe.publish_realtime(INVOICE_EVENT, message, user=user, after_commit=True)
+
+
+def on_invoice_change(doc, method=None):
+    """doc_events hook for Invoice Form (on_change)."""
+    action = {1: "submit", 2: "cancel"}.get(doc.docstatus, "update")
+    publish_invoice_event(doc, action)
+
+
+def on_invoice_trash(doc, method=None):
+    """doc_events hook for Invoice Form (on_trash)."""
+    publish_invoice_event(doc, "delete")
+
+
+def publish_lock(date, locked_count):
+    """Tell every open session that the day's invoices were locked."""
+    frappe.publish_realtime(LOCK_EVENT, {"date": str(date), "locked": locked_count})
+
+
+def publish_bulk_progress(user, message):
+    """Report a chunk of a bulk action (see bulk.py) to the user who started it."""
+    frappe.publish_realtime(BULK_EVENT, message, user=user)
+
+
+def publish_credit_limit_hold(user, hold):
+    """Tell the user a save was refused by the credit check (see credit.hold_for_review)."""
+    frappe.publish_realtime(CREDIT_LIMIT_EVENT, hold, user=user)
@@ -0,0 +1,157 @@
+"""
+Routing of the read-only invoice endpoints to a read replica.
+
+Endpoints decorated with read_only run through frappe.read_only(), i.e. on the
+replica configured in site_config.json:
+
+    "read_from_replica": 1,
+    "replica_host": "127.0.0.1",
+    "replica_db_port": 3307,
+    "invoice_form_vue_replica_max_lag": 5        # optional, seconds
+
+They stay on the primary when:
+
+- the replica is more than invoice_form_vue_replica_max_lag seconds behind.
+  The lag is read with SHOW SLAVE STATUS, which needs the REPLICATION CLIENT
+  privilege on the replica, and is cached for LAG_CHECK_SECONDS;
+- the user changed an Invoice Form recently enough that the replica may not
+  have it yet, so a save is always followed by reads that include it.
+
+Shared caches (permissions, dashboard counters) are filled and errors logged
+through on_primary, so a lagging replica never ends up cached for everyone.
+
+To try it locally, enable the binlog on the primary (log_bin, server_id=1),
+start a second MariaDB with --server-id=2 --read-only=1 on port 3307, load a
+dump of the site database into it, point it at the primary with CHANGE MASTER
+TO ... and START SLAVE, then run tests/test_replica.py.
+"""
+
+import contextlib
+import functools
+
+import frappe
+from frappe.utils import cint
+
+from invoice_form_vue import profiling
+
+# Redis keys: last measured replica lag, users who wrote recently
+LAG_KEY = "invoice_form_vue:replica_lag"
+RECENT_WRITE_KEY = "invoice_form_vue:replica_recent_write:"
+
+DEFAULT_MAX_LAG = 5
+LAG_CHECK_SECONDS = 5
+
+
+class ReplicaLagging(Exception):
+    pass
+
+
+def read_only(fn):
+    """Run a whitelisted read endpoint on the read replica when it is fresh enough."""
+    on_replica = frappe.read_only()(_check_lag(fn))
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not use_replica():
+            return fn(*args, **kwargs)
+        frappe.local.invoice_form_vue_on_replica = False
+        try:
+            return on_replica(*args, **kwargs)
+        except ReplicaLagging:
+            return fn(*args, **kwargs)
+        except Exception:
+            if frappe.local.invoice_form_vue_on_replica:
+                raise
+            # Could not connect: skip the replica until the next lag check
+            frappe.logger("invoice_form_vue").warning("Read replica unavailable", exc_info=True)
+            frappe.cache().set_value(LAG_KEY, get_max_lag() + 1, expires_in_sec=LAG_CHECK_SECONDS)
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def use_replica():
+    if not frappe.conf.get("read_from_replica"):
+        return False
+    if has_recent_write():
+        return False
+    lag = frappe.cache().get_value(LAG_KEY)
+    return lag is None or lag <= get_max_lag()
+
+
+@contextlib.contextmanager
+def on_primary():
+    """Run the block on the primary connection, also inside a read_only endpoint."""
+    replica_db = getattr(frappe.local, "replica_db", None)
+    if replica_db is None or frappe.local.db is not replica_db:
+        yield
+        return
+    frappe.local.db = frappe.local.primary_db
+    try:
+        yield
+    finally:
+        frappe.local.db = replica_db
+
+
+def get_max_lag():
+    return cint(frappe.conf.get("invoice_form_vue_replica_max_lag")) or DEFAULT_MAX_LAG
+
+
+def get_replica_lag():
+    """Seconds the current (replica) connection is behind the primary; None when unknown."""
+    try:
+        status = frappe.db.sql("SHOW SLAVE STATUS", as_dict=True)
+    except Exception:
+        # Error Log cannot be written from the replica connection
+        frappe.logger("invoice_form_vue").warning("Replica lag check failed", exc_info=True)
+        return None
+    if not status:
+        # Not replicating: the "replica" is the primary itself
+        return 0
+    return status[0].get("Seconds_Behind_Master")
+
+
+def has_recent_write(user=None):
+    return bool(frappe.cache().get(frappe.cache().make_key(RECENT_WRITE_KEY + (user or frappe.session.user))))
+
+
+def on_invoice_change(doc, method=None):
+    """doc_events hook for Invoice Form (on_change, on_trash)."""
+    mark_recent_write()
+
+
+def mark_recent_write(user=None):
+    """Keep `user`'s reads on the primary for a while once the transaction commits."""
+    frappe.db.after_commit.add(functools.partial(_mark_recent_write, user or frappe.session.user))
+
+
+def _mark_recent_write(user):
+    # Covers a replica up to max lag behind, measured up to LAG_CHECK_SECONDS ago
+    cache = frappe.cache()
+    cache.set(cache.make_key(RECENT_WRITE_KEY + user), 1, ex=get_max_lag() + LAG_CHECK_SECONDS)
+
+
+def _check_lag(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if frappe.db is not getattr(frappe.local, "replica_db", None):
+            # frappe.read_only() only swaps connections once per request
+            frappe.local.invoice_form_vue_on_replica = True
+            return fn(*args, **kwargs)
+
+        # Connect before the endpoint runs, so an unreachable replica falls back to the primary
+        frappe.db.connect()
+        frappe.local.invoice_form_vue_on_replica = True
+        profiling.instrument(frappe.db, on_replica=True)
+        cache = frappe.cache()
+        lag = cache.get_value(LAG_KEY)
+        if lag is None:
+            lag = get_replica_lag()
+            # Unknown lag (replication stopped, no privilege) counts as too far behind
+            lag = get_max_lag() + 1 if lag is None else lag
+            cache.set_value(LAG_KEY, lag, expires_in_sec=LAG_CHECK_SECONDS)
+        if lag > get_max_lag():
+            raise ReplicaLagging
+        return fn(*args, **kwargs)
+
+    return wrapper
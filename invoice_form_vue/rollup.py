@@ -0,0 +1,167 @@
+"""
+Daily quantity and value per pamper, supplier and item, kept in Invoice Form
+Daily Rollup.
+
+Every Invoice Form change applies the difference it makes to the affected
+rollup rows in the same transaction, so reports read a handful of
+aggregate rows instead of scanning Invoice Form Item. Cancelled invoices do
+not count. rebuild_rollup recomputes a date range from the item rows.
+"""
+
+import hashlib
+
+import frappe
+from frappe.query_builder.functions import Sum
+from frappe.utils import flt, getdate, now
+
+from invoice_form_vue import permissions
+
+DOCTYPE = "Invoice Form Daily Rollup"
+GROUP_FIELDS = ("posting_date", "pamper", "supplier", "item_code")
+
+
+def get_key(posting_date, pamper, supplier, item_code):
+    """Name of the rollup row; rebuild_rollup computes the same value in SQL."""
+    return hashlib.sha1(f"{posting_date}|{pamper}|{supplier}|{item_code}".encode()).hexdigest()
+
+
+def get_contributions(doc):
+    """{(posting_date, pamper, supplier, item_code): [qty, amount, rows]} of an Invoice Form."""
+    contributions = {}
+    if not doc or doc.docstatus == 2 or not doc.posting_date:
+        return contributions
+
+    posting_date = str(getdate(doc.posting_date))
+    for item in doc.items:
+        key = (posting_date, doc.get("pamper") or "", doc.supplier or "", item.item_code or "")
+        totals = contributions.setdefault(key, [0.0, 0.0, 0])
+        totals[0] += flt(item.qty)
+        totals[1] += flt(item.total)
+        totals[2] += 1
+    return contributions
+
+
+def on_invoice_change(doc, method=None):
+    """doc_events hook for Invoice Form (on_change): save, submit and cancel."""
+    deltas = get_contributions(doc)
+    for key, (qty, amount, rows) in get_contributions(doc.get_doc_before_save()).items():
+        totals = deltas.setdefault(key, [0.0, 0.0, 0])
+        totals[0] -= qty
+        totals[1] -= amount
+        totals[2] -= rows
+    apply_deltas(deltas)
+
+
+def on_invoice_trash(doc, method=None):
+    """doc_events hook for Invoice Form (on_trash)."""
+    apply_deltas({key: [-qty, -amount, -rows] for key, (qty, amount, rows) in get_contributions(doc).items()})
+
+
+def apply_deltas(deltas):
+    """Add the deltas to the rollup rows, creating and removing rows as needed."""
+    deltas = {key: totals for key, totals in deltas.items() if any(totals)}
+    if not deltas:
+        return
+
+    timestamp = now()
+    user = frappe.session.user
+    values = []
+    for (posting_date, pamper, supplier, item_code), (qty, amount, rows) in deltas.items():
+        values.append((
+            get_key(posting_date, pamper, supplier, item_code), timestamp, timestamp, user, user,
+            posting_date, pamper, supplier, item_code, qty, amount, rows,
+        ))
+
+    placeholders = ", ".join(["(%s, %s, %s, %s, %s, 0, %s, %s, %s, %s, %s, %s, %s)"] * len(values))
+    frappe.db.sql(
+        f"""
+        insert into `tab{DOCTYPE}`
+            (name, creation, modified, owner, modified_by, docstatus,
+            posting_date, pamper, supplier, item_code, qty, amount, row_count)
+        values {placeholders}
+        on duplicate key update
+            qty = qty + values(qty),
+            amount = amount + values(amount),
+            row_count = row_count + values(row_count),
+            modified = values(modified),
+            modified_by = values(modified_by)
+        """,
+        [value for row in values for value in row],
+    )
+    frappe.db.delete(DOCTYPE, {"name": ["in", [row[0] for row in values]], "row_count": ["<=", 0]})
+
+
+def rebuild_rollup(from_date=None, to_date=None, commit=True):
+    """
+    Recompute the rollup from Invoice Form Item for a date range (default:
+    everything), replacing the rows in that range.
+    """
+    conditions = ["inv.docstatus < 2"]
+    filters = {"posting_date": ["is", "set"]}
+    values = {}
+    if from_date:
+        conditions.append("inv.posting_date >= %(from_date)s")
+        values["from_date"] = getdate(from_date)
+        filters["posting_date"] = [">=", values["from_date"]]
+    if to_date:
+        conditions.append("inv.posting_date <= %(to_date)s")
+        values["to_date"] = getdate(to_date)
+        filters["posting_date"] = (
+            ["between", [values["from_date"], values["to_date"]]] if from_date else ["<=", values["to_date"]]
+        )
+
+    frappe.db.delete(DOCTYPE, filters)
+    frappe.db.sql(
+        f"""
+        insert into `tab{DOCTYPE}`
+            (name, creation, modified, owner, modified_by, docstatus,
+            posting_date, pamper, supplier, item_code, qty, amount, row_count)
+        select
+            sha1(concat_ws('|', inv.posting_date, ifnull(inv.pamper, ''), ifnull(inv.supplier, ''), ifnull(item.item_code, ''))),
+            now(), now(), 'Administrator', 'Administrator', 0,
+            inv.posting_date, ifnull(inv.pamper, ''), ifnull(inv.supplier, ''), ifnull(item.item_code, ''),
+            sum(item.qty), sum(item.total), count(*)
+        from `tabInvoice Form Item` item
+        join `tabInvoice Form` inv on inv.name = item.parent and item.parenttype = 'Invoice Form'
+        where {" and ".join(conditions)} and inv.posting_date is not null
+        group by inv.posting_date, ifnull(inv.pamper, ''), ifnull(inv.supplier, ''), ifnull(item.item_code, '')
+        """,
+        values,
+    )
+    if commit:
+        frappe.db.commit()
+
+
+def get_rollup(from_date, to_date=None, pamper=None, supplier=None, item_code=None, group_by=("item_code",)):
+    """
+    Sum the rollup over a date range, grouped by any of GROUP_FIELDS.
+
+    Users other than System Managers only see the pamper on their Invoice
+    Form Permission Details row.
+
+    Returns:
+        list: rows with the group_by fields, qty, amount and row_count
+    """
+    if "System Manager" not in frappe.get_roles():
+        pamper = permissions.get_user_permission().pamper
+        if not pamper:
+            return []
+
+    group_by = [field for field in group_by if field in GROUP_FIELDS]
+    Rollup = frappe.qb.DocType(DOCTYPE)
+    query = (
+        frappe.qb.from_(Rollup)
+        .select(
+            *[Rollup[field] for field in group_by],
+            Sum(Rollup.qty).as_("qty"),
+            Sum(Rollup.amount).as_("amount"),
+            Sum(Rollup.row_count).as_("row_count"),
+        )
+        .where(Rollup.posting_date[getdate(from_date):getdate(to_date or from_date)])
+    )
+    for field, value in (("pamper", pamper), ("supplier", supplier), ("item_code", item_code)):
+        if value:
+            query = query.where(Rollup[field] == value)
+    if group_by:
+        query = query.groupby(*[Rollup[field] for field in group_by]).orderby(*[Rollup[field] for field in group_by])
+    return query.run(as_dict=True)
@@ -0,0 +1,152 @@
+import re
+from bisect import bisect_left, insort
+from itertools import islice
+
+import frappe
+
+from invoice_form_vue import master_data
+
+# Arabic diacritics (tashkeel) and tatweel are ignored when matching
+ARABIC_MARKS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u0640]")
+ARABIC_LETTERS = str.maketrans({
+    "\u0622": "\u0627",  # alef with madda -> alef
+    "\u0623": "\u0627",  # alef with hamza above -> alef
+    "\u0625": "\u0627",  # alef with hamza below -> alef
+    "\u0671": "\u0627",  # alef wasla -> alef
+    "\u0649": "\u064a",  # alef maksura -> yeh
+    "\u0629": "\u0647",  # teh marbuta -> heh
+})
+TOKEN_SPLIT = re.compile(r"[\s\-_/.,()]+")
+
+# Upper bound on rows scanned per query so one-letter queries stay cheap
+MAX_CANDIDATES = 500
+
+# site -> {"version": str, "indexes": {list key: PrefixIndex}}
+_site_indexes = {}
+
+
+def normalize(text):
+    """Lower-case `text` and fold Arabic letter variants so users can type either form."""
+    text = ARABIC_MARKS.sub("", str(text or "")).translate(ARABIC_LETTERS)
+    return text.casefold().strip()
+
+
+def tokenize(text):
+    return [token for token in TOKEN_SPLIT.split(normalize(text)) if token]
+
+
+def index_tokens(name, label):
+    # Whole codes are indexed too so "CUST-00012" matches without splitting on "-"
+    return set(tokenize(name) + tokenize(label) + [normalize(name)])
+
+
+class PrefixIndex:
+    """Sorted (token, name) pairs, searched by prefix with bisect."""
+
+    def __init__(self, label_field):
+        self.label_field = label_field
+        self.tokens = []
+        self.rows = {}
+
+    def build(self, rows):
+        tokens = []
+        for row in rows:
+            name = row["name"]
+            label = row.get(self.label_field) or ""
+            self.rows[name] = (row, normalize(label), normalize(name))
+            tokens.extend((token, name) for token in index_tokens(name, label))
+        self.tokens = sorted(tokens)
+        return self
+
+    def add(self, row):
+        name = row["name"]
+        self.remove(name)
+        label = row.get(self.label_field) or ""
+        self.rows[name] = (row, normalize(label), normalize(name))
+        for token in index_tokens(name, label):
+            insort(self.tokens, (token, name))
+
+    def remove(self, name):
+        entry = self.rows.pop(name, None)
+        if not entry:
+            return
+        row = entry[0]
+        for token in index_tokens(name, row.get(self.label_field)):
+            i = bisect_left(self.tokens, (token, name))
+            if i < len(self.tokens) and self.tokens[i] == (token, name):
+                del self.tokens[i]
+
+    def search(self, query, limit, allowed=None):
+        """Best matches for `query`; only names in `allowed` when it is given."""
+        words = tokenize(query)
+        if not words:
+            rows = (entry[0] for name, entry in self.rows.items() if allowed is None or name in allowed)
+            return list(islice(rows, limit))
+
+        # Candidates come from the whole query, then its first word; the other
+        # words must appear somewhere in the label or code
+        candidates = []
+        seen = set()
+        for prefix in dict.fromkeys([normalize(query), words[0]]):
+            i = bisect_left(self.tokens, (prefix, ""))
+            while (
+                i < len(self.tokens)
+                and len(candidates) < MAX_CANDIDATES
+                and self.tokens[i][0].startswith(prefix)
+            ):
+                name = self.tokens[i][1]
+                if name not in seen and (allowed is None or name in allowed):
+                    seen.add(name)
+                    candidates.append(self.rows[name])
+                i += 1
+
+        normalized_query = " ".join(words)
+        matches = [
+            entry for entry in candidates
+            if all(word in entry[1] or word in entry[2] for word in words[1:])
+        ]
+        # Labels and codes that start with the whole query rank first
+        matches.sort(key=lambda entry: (
+            not (entry[1].startswith(normalized_query) or entry[2].startswith(normalized_query)),
+            entry[1],
+        ))
+        return [entry[0] for entry in matches[:limit]]
+
+
+def get_indexes():
+    """
+    Return the prefix indexes for the current site, kept in sync with the
+    master-data version by replaying the change log instead of rebuilding.
+    """
+    version = master_data.get_version()
+    state = _site_indexes.get(frappe.local.site)
+    if state and state["version"] == version:
+        return state["indexes"]
+
+    changes = master_data.get_changes_since(state["version"]) if state else None
+    if changes is not None:
+        for key, bucket in changes.items():
+            index = state["indexes"][key]
+            for name in bucket["remove"]:
+                index.remove(name)
+            for row in bucket["upsert"]:
+                index.add(row)
+    else:
+        data = master_data.get_master_data()
+        state = {"indexes": {}}
+        for key, label_field, _filters in master_data.SOURCES.values():
+            state["indexes"][key] = PrefixIndex(label_field).build(data[key])
+        _site_indexes[frappe.local.site] = state
+
+    state["version"] = version
+    return state["indexes"]
+
+
+def search(kind, query, limit=10):
+    indexes = get_indexes()
+    if kind not in indexes:
+        frappe.throw(frappe._("Unknown search list: {0}").format(kind))
+    # The indexes are shared by every user
+    if kind not in master_data.get_readable_lists():
+        frappe.throw(frappe._("Not permitted"), frappe.PermissionError)
+    return indexes[kind].search(query, limit, allowed=master_data.get_user_names(kind))
@@ -2,7 +2,17 @@ import frappe
 from frappe.utils import get_time, now_datetime
 from datetime import datetime, time, timedelta
 
+from invoice_form_vue import realtime
+
+# Global default holding the date the invoices were last locked on
+LAST_LOCK_DATE_KEY = "invoice_form_vue_last_lock_date"
+
 def check_lock_update_invoice_form():
+    # Invoices are locked once per day, nothing to do after that
+    today = now_datetime().date()
+    if frappe.db.get_global(LAST_LOCK_DATE_KEY) == str(today):
+        return
+
     # Get the reference time from single DocType
     reference_time = frappe.db.get_single_value("Invoice Form Permission", "can_not_edit_after")
     
@@ -40,19 +50,21 @@ def check_lock_update_invoice_form():
     
     # Compare only the time part
     if current_time >= ref_time:
-        # Get all unlocked invoice forms
-        invoices = frappe.get_all("Invoice Form", {"lock_update": 0}, "name")
-        
-        # Format invoice names for logging
-        invoice_names = [inv.name for inv in invoices] if invoices else []
-        invoice_str = ", ".join(invoice_names)
-        
-        frappe.log_error(title="Invoice Form Permission", 
-                         message=f"Invoice Form Permission expired at {ref_time}. Locking invoices: {invoice_str}")
-        
-        # Lock all the invoices
-        for invoice in invoices:
-            frappe.db.set_value("Invoice Form", invoice.name, "lock_update", 1)
-        
+        locked_count = frappe.db.count("Invoice Form", {"lock_update": 0})
+
+        # Lock all the invoices in a single UPDATE
+        if locked_count:
+            frappe.db.set_value("Invoice Form", {"lock_update": 0}, "lock_update", 1)
+
+        frappe.db.set_global(LAST_LOCK_DATE_KEY, str(today))
+
         # Commit the transaction
-        frappe.db.commit()
\ No newline at end of file
+        frappe.db.commit()
+
+        frappe.logger("invoice_form_vue").info(
+            f"lock_update: locked={locked_count} cutoff={ref_time} date={today}"
+        )
+
+        # Open forms switch to read-only without polling
+        if locked_count:
+            realtime.publish_lock(today, locked_count)
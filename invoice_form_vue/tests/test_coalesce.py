@@ -0,0 +1,103 @@
+# Copyright (c) 2025, Amr Basha and Contributors
+# See license.txt
+
+import json
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from invoice_form_vue import coalesce
+
+
+def snapshot(qty):
+	return {"invoice_id": "_Test Coalesce Invoice", "supplier": "_Test Supplier", "items": [{"item": "_Test Item", "qty": qty, "rate": 1}]}
+
+
+def operations(*ops):
+	return {"invoice_id": "_Test Coalesce Invoice", "supplier": "_Test Supplier", "operations": list(ops)}
+
+
+class TestCoalesce(FrappeTestCase):
+	def setUp(self):
+		self.saved = []
+		self.clear_scope()
+
+	def tearDown(self):
+		self.clear_scope()
+
+	def save(self, data):
+		self.saved.append(data)
+		return {"invoice_name": data["invoice_id"], "saves": len(self.saved)}
+
+	def clear_scope(self):
+		cache = frappe.cache()
+		scope = coalesce.get_scope(snapshot(0))
+		for name in ("lock", "queue", "result", "seq"):
+			cache.delete(cache.make_key(f"{coalesce.KEY_PREFIX}:{name}:{scope}"))
+
+	def queue(self, seq, data):
+		cache = frappe.cache()
+		key = cache.make_key(f"{coalesce.KEY_PREFIX}:queue:{coalesce.get_scope(data)}")
+		cache.rpush(key, json.dumps({"seq": seq, "hash": coalesce.get_payload_hash(data), "data": data}))
+
+	def test_identical_save_is_answered_from_the_last_result(self):
+		first = coalesce.coalesce_save(snapshot(1), self.save)
+		again = coalesce.coalesce_save(snapshot(1), self.save)
+
+		self.assertEqual(first, again)
+		self.assertEqual(len(self.saved), 1)
+
+		coalesce.coalesce_save(snapshot(2), self.save)
+		self.assertEqual(len(self.saved), 2)
+
+	def test_queued_snapshots_collapse_into_one_write(self):
+		self.queue(100, snapshot(2))
+		self.queue(101, snapshot(3))
+
+		response = coalesce.coalesce_save(snapshot(1), self.save)
+
+		# The holder's own snapshot is superseded by the newest queued one
+		self.assertEqual(self.saved, [snapshot(3)])
+		self.assertEqual(response["saves"], 1)
+
+	def test_identical_operations_are_each_written(self):
+		add = {"op": "add", "item": {"item": "_Test Item", "qty": 1, "rate": 1}}
+
+		coalesce.coalesce_save(operations(add), self.save)
+		coalesce.coalesce_save(operations(add), self.save)
+
+		# Adding the same row twice is two rows, not a repeated save
+		self.assertEqual(self.saved, [operations(add), operations(add)])
+
+	def test_failed_write_only_fails_the_saves_it_covers(self):
+		add = {"op": "add", "item": {"item": "_Test Item", "qty": 1, "rate": 1}}
+		self.queue(100, operations(add))
+
+		def save(data):
+			if "operations" in data:
+				raise frappe.ValidationError
+			return self.save(data)
+
+		response = coalesce.coalesce_save(snapshot(1), save)
+
+		cache = frappe.cache()
+		result = json.loads(cache.get(cache.make_key(f"{coalesce.KEY_PREFIX}:result:{coalesce.get_scope(snapshot(1))}")))
+		self.assertEqual(result["failed_from"], 100)
+		self.assertEqual(result["response"], response)
+
+	def test_merge_keeps_operations_after_a_snapshot(self):
+		add = {"op": "add", "item": {"item": "_Test Item", "qty": 1, "rate": 1}}
+		delete = {"op": "delete", "name": "row-1"}
+		entries = [
+			{"seq": 1, "data": operations(add)},
+			{"seq": 2, "data": snapshot(5)},
+			{"seq": 3, "data": operations(add)},
+			{"seq": 4, "data": operations(delete)},
+		]
+
+		writes = coalesce.merge_payloads(entries)
+
+		# The snapshot covers the operations queued before it
+		self.assertEqual([(first, last) for first, last, _hash, _data in writes], [(1, 2), (3, 4)])
+		self.assertEqual(writes[0][3], snapshot(5))
+		self.assertEqual(writes[1][3]["operations"], [add, delete])
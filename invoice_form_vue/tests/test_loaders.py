@@ -0,0 +1,79 @@
+# Copyright (c) 2025, Amr Basha and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from invoice_form_vue.loaders import load_invoice
+
+
+class TestInvoiceLoader(FrappeTestCase):
+	def setUp(self):
+		self.supplier = make_party("Supplier", "supplier_name", "_Test Loader Farmer")
+		self.customers = [
+			make_party("Customer", "customer_name", f"_Test Loader Customer {i}") for i in range(5)
+		]
+		self.item_code = frappe.db.get_value("Item", {}, "name")
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_query_count_does_not_grow_with_rows(self):
+		small = self.make_invoice(rows=1)
+		large = self.make_invoice(rows=60)
+
+		# Warm the meta cache so both runs only count data queries
+		load_invoice(small)
+
+		small_count = count_queries(load_invoice, small)
+		large_count = count_queries(load_invoice, large)
+		self.assertEqual(small_count, large_count)
+
+	def test_resolves_party_names(self):
+		invoice = load_invoice(self.make_invoice(rows=3))
+
+		self.assertEqual(invoice["supplier_name"], "_Test Loader Farmer")
+		self.assertEqual(len(invoice["items"]), 3)
+		for item in invoice["items"]:
+			self.assertEqual(
+				item["customer_name"], frappe.db.get_value("Customer", item["customer"], "customer_name")
+			)
+
+	def make_invoice(self, rows):
+		doc = frappe.get_doc({
+			"doctype": "Invoice Form",
+			"supplier": self.supplier,
+			"customer": self.customers[0],
+			"posting_date": frappe.utils.today(),
+			"items": [
+				{
+					"item_code": self.item_code,
+					"qty": 1,
+					"price": 10,
+					"total": 10,
+					"customer": self.customers[i % len(self.customers)],
+				}
+				for i in range(rows)
+			],
+		})
+		doc.flags.ignore_mandatory = True
+		doc.insert(ignore_permissions=True)
+		return doc.name
+
+
+def make_party(doctype, name_field, name):
+	existing = frappe.db.get_value(doctype, {name_field: name})
+	if existing:
+		return existing
+	doc = frappe.get_doc({"doctype": doctype, name_field: name})
+	doc.flags.ignore_mandatory = True
+	doc.insert(ignore_permissions=True)
+	return doc.name
+
+
+def count_queries(fn, *args):
+	with patch.object(frappe.db, "sql", wraps=frappe.db.sql) as sql:
+		fn(*args)
+	return sql.call_count
@@ -0,0 +1,56 @@
+# Copyright (c) 2025, Amr Basha and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from invoice_form_vue.benchmarks import market_day, suite
+
+# Reads whose query count must not depend on how many invoices the day has
+READ_CASES = [
+	"get_suppliers_and_customers:unchanged",
+	"get_invoice",
+	"get_draft_invoice_form",
+	"get_draft_invoice_form:next_page",
+	"get_dashboard_data",
+	"get_bootstrap",
+	"check_user_permission",
+]
+
+
+class TestQueryBudget(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		market_day.generate(
+			farmers=20, customers=20, items=5, invoices=30, min_rows=2, max_rows=5, users=3, pampers=2, commit=False
+		)
+
+	@classmethod
+	def tearDownClass(cls):
+		frappe.db.rollback()
+		market_day._clear_caches()
+		super().tearDownClass()
+
+	def test_every_case_runs(self):
+		results = suite.measure_all(rounds=1)
+		self.assertEqual(set(results), set(suite.CASES))
+
+	def test_within_stored_baselines(self):
+		baselines = suite.load_baselines()
+		missing = sorted(set(suite.CASES) - set(baselines))
+		if missing:
+			# Recorded with suite.run(update_baselines=True) on the market-day dataset
+			self.skipTest(f"No stored baseline for: {', '.join(missing)}")
+
+		results = suite.measure_all(rounds=1)
+		for case, result in results.items():
+			self.assertLessEqual(result["queries"], baselines[case]["queries"], case)
+
+	def test_reads_do_not_grow_with_the_day(self):
+		before = suite.measure_all(rounds=1, cases=READ_CASES)
+		market_day.add_invoices(120, start=30, min_rows=2, max_rows=5, commit=False)
+		after = suite.measure_all(rounds=1, cases=READ_CASES)
+
+		for case in READ_CASES:
+			self.assertEqual(before[case]["queries"], after[case]["queries"], case)
@@ -0,0 +1,70 @@
+# Copyright (c) 2025, Amr Basha and Contributors
+# See license.txt
+
+import unittest
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from invoice_form_vue import api, credit, dashboard, permissions, tasks
+from invoice_form_vue.patches.v1_0.add_invoice_form_indexes import execute as add_indexes
+
+TABLES = {"tabInvoice Form", "tabInvoice Form Item", "tabInvoice Form Permission Details"}
+
+
+class TestQueryPlans(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		if frappe.db.db_type != "mariadb":
+			raise unittest.SkipTest("EXPLAIN output is checked for MariaDB only")
+		add_indexes()
+
+	def setUp(self):
+		frappe.cache().delete_value([permissions.CACHE_KEY, permissions.PAMPER_USERS_KEY, credit.CACHE_KEY])
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_draft_list(self):
+		self.assertIndexed(api.get_draft_invoice_form)
+
+	def test_dashboard(self):
+		self.assertIndexed(api.get_dashboard_data)
+		self.assertIndexed(dashboard.reconcile_dashboard_counts)
+
+	def test_lock_task(self):
+		frappe.db.set_global(tasks.LAST_LOCK_DATE_KEY, None)
+		frappe.db.set_single_value("Invoice Form Permission", "can_not_edit_after", "00:00:00")
+		self.assertIndexed(tasks.check_lock_update_invoice_form)
+
+	def test_permission_lookups(self):
+		self.assertIndexed(permissions.get_user_permission, "Administrator")
+		self.assertIndexed(permissions.get_pamper_users, "_Test Pamper")
+
+	def test_credit_exposure(self):
+		self.assertIndexed(credit._load_exposures, ["_Test Customer"], "_Test Company")
+
+	def assertIndexed(self, fn, *args):
+		"""Fail if a query `fn` runs on the app's tables can only be answered by a full scan."""
+		for query, values in capture_queries(fn, *args):
+			for row in frappe.db.sql(f"EXPLAIN {query}", values, as_dict=True):
+				if row.table in TABLES and row.type == "ALL" and not row.possible_keys:
+					self.fail(f"Full scan of {row.table} in: {query}")
+
+
+def capture_queries(fn, *args):
+	"""Run `fn` (without committing) and return its SELECT/UPDATE/DELETE statements."""
+	queries = []
+	sql = frappe.db.sql
+
+	def capturing_sql(query, values=(), *sql_args, **kwargs):
+		query = str(query)
+		if query.lstrip().split(None, 1)[0].lower() in ("select", "update", "delete"):
+			queries.append((query, values))
+		return sql(query, values, *sql_args, **kwargs)
+
+	with patch.object(frappe.db, "sql", capturing_sql), patch.object(frappe.db, "commit"):
+		fn(*args)
+	return queries
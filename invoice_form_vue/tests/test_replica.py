@@ -0,0 +1,76 @@
+# Copyright (c) 2025, Amr Basha and Contributors
+# See license.txt
+
+import unittest
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from invoice_form_vue import replica
+
+
+@replica.read_only
+def current_db():
+	return frappe.db
+
+
+@replica.read_only
+def primary_db_inside_replica_read():
+	with replica.on_primary():
+		return frappe.db
+
+
+class TestReplicaRouting(FrappeTestCase):
+	"""Runs without a replica: only the cases that must stay on the primary."""
+
+	def setUp(self):
+		self.clear()
+
+	def tearDown(self):
+		self.clear()
+
+	def clear(self):
+		cache = frappe.cache()
+		cache.delete_value(replica.LAG_KEY)
+		cache.delete(cache.make_key(replica.RECENT_WRITE_KEY + frappe.session.user))
+		# frappe.read_only() leaves these behind, which stops it from swapping again
+		for attr in ("replica_db", "primary_db"):
+			if hasattr(frappe.local, attr):
+				delattr(frappe.local, attr)
+
+	def test_primary_without_replica_config(self):
+		with patch.dict(frappe.conf, {"read_from_replica": 0}):
+			self.assertIs(current_db(), frappe.db)
+
+	def test_primary_right_after_a_write(self):
+		replica._mark_recent_write(frappe.session.user)
+		with patch.dict(frappe.conf, {"read_from_replica": 1}):
+			self.assertIs(current_db(), frappe.db)
+
+	def test_primary_while_replica_lags(self):
+		frappe.cache().set_value(replica.LAG_KEY, replica.get_max_lag() + 1, expires_in_sec=60)
+		with patch.dict(frappe.conf, {"read_from_replica": 1}):
+			self.assertIs(current_db(), frappe.db)
+
+
+class TestReplicaReads(TestReplicaRouting):
+	"""Needs a second MariaDB replicating this site, configured as described in replica.py."""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		if not (frappe.conf.get("read_from_replica") and frappe.conf.get("replica_host")):
+			raise unittest.SkipTest("No read replica configured for this site")
+
+	def test_reads_go_to_replica(self):
+		db = current_db()
+		self.assertIsNot(db, frappe.db)
+		self.assertIsNotNone(frappe.cache().get_value(replica.LAG_KEY))
+
+	def test_own_write_is_read_back(self):
+		replica._mark_recent_write(frappe.session.user)
+		self.assertIs(current_db(), frappe.db)
+
+	def test_on_primary_inside_replica_read(self):
+		self.assertIs(primary_db_inside_replica_read(), frappe.db)
@@ -0,0 +1,65 @@
+# Copyright (c) 2025, Amr Basha and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from invoice_form_vue import rollup
+
+DATE = "2001-01-01"
+
+
+def make_invoice(docstatus=0, items=(), before=None, pamper="_Test Pamper", supplier="_Test Supplier"):
+	doc = frappe._dict(
+		name="_Test Rollup Invoice",
+		posting_date=DATE,
+		pamper=pamper,
+		supplier=supplier,
+		docstatus=docstatus,
+		items=[frappe._dict(item_code=item_code, qty=qty, total=total) for item_code, qty, total in items],
+	)
+	doc.get_doc_before_save = lambda: before
+	return doc
+
+
+class TestRollup(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_save_edit_cancel(self):
+		first = make_invoice(items=[("_Test Item", 2, 20), ("_Test Item", 1, 10)])
+		rollup.on_invoice_change(first)
+		self.assertRollup({"_Test Item": (3, 30, 2)})
+
+		edited = make_invoice(items=[("_Test Item", 1, 10), ("_Test Item 2", 4, 8)], before=first)
+		rollup.on_invoice_change(edited)
+		self.assertRollup({"_Test Item": (1, 10, 1), "_Test Item 2": (4, 8, 1)})
+
+		cancelled = make_invoice(docstatus=2, items=[("_Test Item", 1, 10), ("_Test Item 2", 4, 8)], before=edited)
+		rollup.on_invoice_change(cancelled)
+		self.assertRollup({})
+
+	def test_trash(self):
+		doc = make_invoice(items=[("_Test Item", 2, 20)])
+		rollup.on_invoice_change(doc)
+		rollup.on_invoice_trash(doc)
+		self.assertRollup({})
+
+	def test_supplier_change_moves_rows(self):
+		first = make_invoice(items=[("_Test Item", 2, 20)])
+		rollup.on_invoice_change(first)
+		rollup.on_invoice_change(make_invoice(items=[("_Test Item", 2, 20)], supplier="_Test Supplier 1", before=first))
+
+		rows = frappe.get_all(rollup.DOCTYPE, filters={"posting_date": DATE}, pluck="supplier")
+		self.assertEqual(rows, ["_Test Supplier 1"])
+
+	def assertRollup(self, expected):
+		rows = frappe.get_all(
+			rollup.DOCTYPE,
+			filters={"posting_date": DATE},
+			fields=["item_code", "qty", "amount", "row_count"],
+		)
+		self.assertEqual(
+			{row.item_code: (row.qty, row.amount, row.row_count) for row in rows},
+			expected,
+		)